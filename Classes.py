@@ -1,28 +1,849 @@
-import pandas as pd
+import io
+import os
+import hashlib
+import zipfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter, time as wall_time
+import numpy as np
+from Metrics import LOAD_DURATION
+from PyQt5 import QtCore
+from PyQt5.QtGui import QPixmap, QPainter
 from PyQt5.QtWidgets import QFileDialog
 
+STALE_TEMPORARY_SECONDS = 24 * 3600  # a cache entry still unfinished after this was left by a writer that died
+# starting a pool process costs about half a second, smaller batches are parsed faster on the worker thread
+POOL_MIN_BYTES = 32 * 1024 ** 2
+
+loadPool = None
+loadPoolLock = threading.Lock()
+
 class FileBrowser:
     def __init__(self, parent):
         self.parent = parent
+        self.cache = SignalCache()
 
-    def browse_file(self):
+    def get_file_name(self):
         options = QFileDialog.Options()
         options |= QFileDialog.ReadOnly
         fileName, _ = QFileDialog.getOpenFileName(self.parent,"QFileDialog.getOpenFileName()", "","All Files (*);;CSV Files (*.csv);;DAT Files (*.dat);;XLSX Files (*.xlsx);;TXT Files (*.txt)", options=options)
-        if fileName:
-            return self.read_file(fileName)
-        else:
-            return None, None
+        return fileName
+
+    def get_file_names(self):
+        # several recordings can be picked at once to build a multi-lead layout in one go
+        options = QFileDialog.Options()
+        options |= QFileDialog.ReadOnly
+        fileNames, _ = QFileDialog.getOpenFileNames(self.parent,"QFileDialog.getOpenFileNames()", "","All Files (*);;CSV Files (*.csv);;DAT Files (*.dat);;XLSX Files (*.xlsx);;TXT Files (*.txt)", options=options)
+        return fileNames
+
+    def read_file(self, fileName, progress=None):
+        return read_signal_file(fileName, self.cache, progress)
 
-    def read_file(self, fileName):
-        if fileName.endswith('.csv'):
-            df = pd.read_csv(fileName)
+
+def read_signal_file(fileName, cache, progress=None, size=None):
+    # progress, if given, is called with the loaded fraction and may raise LoadCancelled;
+    # size, if given, reads a text file only up to that byte, e.g. where a follower takes over
+    # reopening a recording skips parsing as long as the file is unchanged
+    started = perf_counter()
+    cached = cache.load(fileName, size)
+    if cached is not None:
+        LOAD_DURATION["cached"].observe(perf_counter() - started)
+        return cached
+    entry = None
+    try:
+        if fileName.endswith('.csv') or fileName.endswith('.dat') or fileName.endswith('.txt'):
+            # text is parsed chunk by chunk straight into the memory-mapped cache entry,
+            # so recordings larger than RAM never have to be held in memory; a recording that is
+            # still being written is read up to the size it had when the reader opened it
+            reader = SignalTextReader(fileName, size=size)
+            entry = cache.create(fileName, reader.count_rows(), reader.stat, reader.size)
+            rows = 0
+            for time, amplitude in reader.chunks():
+                # never past the counted rows, even if the file was rewritten meanwhile
+                count = min(len(time), entry.data.shape[1] - rows)
+                entry.data[0, rows:rows + count] = time[:count]
+                entry.data[1, rows:rows + count] = amplitude[:count]
+                rows += count
+                if progress is not None:
+                    progress(reader.position / max(1, reader.size))
         elif fileName.endswith('.xlsx'):
-            df = pd.read_excel(fileName)
-        elif fileName.endswith('.dat') or fileName.endswith('.txt'):
-            df = pd.read_csv(fileName, sep='\t')
-        time = df['Time'].values
-        amplitude = df['Amplitude'].values
-        return time, amplitude
+            stat = os.stat(fileName)
+            time, amplitude = read_spreadsheet(fileName)
+            if progress is not None:
+                progress(1.0)
+            rows = len(time)
+            entry = cache.create(fileName, rows, stat)
+            entry.data[0] = time
+            entry.data[1] = amplitude
+        else:
+            raise ValueError(f"Unsupported signal file: {fileName}")
+    except Exception:
+        if entry is not None:
+            cache.discard(entry)
+        raise
+    data = cache.commit(entry, rows)
+    LOAD_DURATION["parsed"].observe(perf_counter() - started)
+    return data[0], data[1]
+
+
+def read_spreadsheet(fileName):
+    # spreadsheets still need pandas, so it is only imported when one is opened;
+    # what can go wrong with one is reported as a ValueError, as for text files
+    try:
+        import pandas as pd
+        df = pd.read_excel(fileName)
+    except ImportError as error:
+        raise ValueError(f"opening .xlsx files needs pandas and openpyxl ({error})")
+    except zipfile.BadZipFile:
+        raise ValueError(f"{fileName} is not a valid .xlsx file")
+    if 'Time' not in df.columns or 'Amplitude' not in df.columns:
+        raise ValueError(f"{fileName} has no Time and Amplitude columns")
+    try:
+        return df['Time'].to_numpy(np.float64), df['Amplitude'].to_numpy(np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(f"{fileName} has Time or Amplitude values that are not numbers")
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+class SignalLoadWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int)
+    loaded = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, fileBrowser, fileName, source=None):
+        # parses a recording off the GUI thread, so running cine plots keep animating;
+        # with a live source that follows the file, the source catches up with it here instead
+        super().__init__()
+        self.fileBrowser = fileBrowser
+        self.fileName = fileName
+        self.source = source
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            if self.source is not None:
+                time, amplitude = self.source.catch_up(self.fileBrowser.cache, self.report)
+            else:
+                time, amplitude = self.fileBrowser.read_file(self.fileName, self.report)
+            signal = prepare_signal(time, amplitude, self.fileBrowser.cache)
+        except LoadCancelled:
+            return
+        except Exception as error:
+            # anything a broken file makes the readers raise, an exception escaping run() would go unseen
+            self.failed.emit(str(error) or type(error).__name__)
+            return
+        if not self.cancelled:
+            self.loaded.emit(signal)
+
+    def report(self, fraction):
+        if self.cancelled:
+            raise LoadCancelled()
+        self.progress.emit(int(fraction * 100))
+
+
+def load_pool():
+    # started for the first batch large enough to need it and reused by later ones, as the report pool is;
+    # spawned rather than forked, forking a process that runs Qt threads is unsafe
+    global loadPool
+    with loadPoolLock:
+        if loadPool is None:
+            loadPool = ProcessPoolExecutor(os.cpu_count() or 1, mp_context=multiprocessing.get_context('spawn'))
+        return loadPool
+
+
+def cache_signal_file(fileName, directory):
+    # runs in a pool process: parse the recording and build its pyramid into the shared cache directory,
+    # the viewer then maps the finished entries instead of receiving the arrays;
+    # returns how long the parse took, metrics recorded in the pool process would be lost
+    started = perf_counter()
+    cache = SignalCache(directory)
+    time, amplitude = read_signal_file(fileName, cache)
+    elapsed = perf_counter() - started
+    cache.pyramid(time, amplitude)
+    return elapsed
+
+
+class SignalBatchWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int)
+    loaded = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, fileBrowser, fileNames):
+        # parses several recordings in parallel processes, one per core,
+        # and hands them over together once every file is ready
+        super().__init__()
+        self.fileBrowser = fileBrowser
+        self.fileNames = fileNames
+        self.cancelled = False
+        self.percent = 0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def report(self, files):
+        # files: how many of the files are read so far, fractions included; raises once cancelled
+        if self.cancelled:
+            raise LoadCancelled()
+        # the bar never moves back once the pool has already advanced it
+        percent = int(files * 100 / len(self.fileNames))
+        if percent > self.percent:
+            self.percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        cache = self.fileBrowser.cache
+        errors = {}
+        pending = []
+        pendingBytes = 0
+        parsed = set()  # parsed by the pool, its parse time is recorded already
+        for fileName in self.fileNames:
+            try:
+                if cache.load(fileName) is None:
+                    pending.append(fileName)
+                    pendingBytes += os.path.getsize(fileName)
+            except OSError as error:
+                errors[fileName] = str(error)
+        if min(len(pending), os.cpu_count() or 1) > 1 and pendingBytes >= POOL_MIN_BYTES:
+            futures = {load_pool().submit(cache_signal_file, fileName, cache.directory): fileName for fileName in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.cancelled:
+                    # the pool is kept for later batches, files already being parsed still end up in the cache
+                    for future in futures:
+                        future.cancel()
+                    return
+                try:
+                    LOAD_DURATION["parsed"].observe(future.result())
+                    parsed.add(futures[future])
+                except Exception:
+                    pass  # parsed again below, which reports the actual error
+                self.percent = int(done * 100 / (len(pending) + 1))
+                self.progress.emit(self.percent)
+        signals = []
+        for index, fileName in enumerate(self.fileNames):
+            if self.cancelled:
+                return
+            if fileName in errors:
+                continue
+            try:
+                # mapped from the entry the pool wrote, without counting it again as a cache hit;
+                # otherwise (a small batch, or one core) parsed here with progress and cancel
+                # checked chunk by chunk as for a single file
+                signal = cache.load(fileName) if fileName in parsed else None
+                if signal is None:
+                    signal = self.fileBrowser.read_file(fileName, lambda fraction: self.report(index + fraction))
+                time, amplitude = signal
+                signals.append(prepare_signal(time, amplitude, cache))
+            except LoadCancelled:
+                return
+            except Exception as error:
+                # as for a single file, one broken file only drops that file from the batch
+                errors[fileName] = str(error) or type(error).__name__
+                continue
+        if not self.cancelled:
+            self.progress.emit(100)
+            self.loaded.emit(signals)
+            if errors:
+                self.failed.emit("\n".join(f"{os.path.basename(name)}: {error}" for name, error in errors.items()))
+
+
+class SignalCache:
+    def __init__(self, directory=None, maxBytes=1024 ** 3):
+        # parsed recordings kept as memory-mappable .npy files of shape (2, rows), holding the
+        # Time and Amplitude columns and named after a hash of the source's path, mtime and size
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.cache', 'icu_signal_viewer')
+        self.maxBytes = maxBytes
+
+    def path(self, fileName, stat=None, size=None):
+        # stat, when given, is the state of the file the entry was read from,
+        # size how much of it was read when that was not all of it
+        stat = stat or os.stat(fileName)
+        key = f"{os.path.abspath(fileName)}|{stat.st_mtime_ns}|{stat.st_size if size is None else size}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + '.npy')
+
+    def load(self, fileName, size=None):
+        data = self.map(self.path(fileName, size=size))
+        return None if data is None else (data[0], data[1])
+
+    def map(self, path):
+        # the entry is mapped, not read, so only the pages that are displayed or summarized get loaded
+        try:
+            data = np.load(path, mmap_mode='r')
+            os.utime(path)  # the modification time doubles as the last use for eviction
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def create(self, fileName, rows, stat=None, size=None):
+        # the entry's name is worked out once, from the file as it was when reading started,
+        # so a recording that grows while it is parsed is still committed under its own key
+        return CacheEntry(self.directory, self.path(fileName, stat, size), rows)
+
+    def commit(self, entry, rows):
+        # the first rows of the entry, mapped from the cache once it is in place
+        data = entry.data
+        if not isinstance(data, np.memmap):
+            return data[:, :rows]
+        try:
+            if rows < data.shape[1]:
+                # blank lines made the row estimate too large, rewrite the entry at its real length
+                with open(entry.temporary + '.trim', 'wb') as file:
+                    np.save(file, data[:, :rows])
+                os.replace(entry.temporary + '.trim', entry.path)
+                os.remove(entry.temporary)
+            else:
+                data.flush()
+                os.replace(entry.temporary, entry.path)
+            self.evict()
+        except OSError:
+            return data[:, :rows]
+        cached = self.map(entry.path)
+        return cached if cached is not None else data[:, :rows]
+
+    def pyramid(self, time, amplitude):
+        # the decimation pyramid of a cached recording is kept next to its entry and mapped like it,
+        # so a recording larger than RAM needs neither in memory; None for a signal the cache does not hold
+        fileName = getattr(amplitude, 'filename', None)
+        if fileName is None or not fileName.endswith('.npy') or os.path.dirname(fileName) != os.path.abspath(self.directory):
+            return None
+        path = fileName[:-len('.npy')] + '.pyramid.npy'
+        levels = self.map(path)
+        if levels is None:
+            sizes = MinMaxPyramid.level_sizes(len(amplitude))
+            entry = CacheEntry(self.directory, path, sum(sizes))
+            try:
+                MinMaxPyramid.build(amplitude, entry.data)
+            except Exception:
+                self.discard(entry)
+                raise
+            levels = self.commit(entry, sum(sizes))
+        return MinMaxPyramid.stored(time, amplitude, levels)
+
+    def discard(self, entry):
+        # throw away an entry that was never completed
+        if isinstance(entry.data, np.memmap):
+            try:
+                os.remove(entry.temporary)
+            except OSError:
+                pass
+
+    def evict(self):
+        # drop the least recently used entries until the cache fits in maxBytes,
+        # and the temporary files of writers that died before committing
+        entries = []
+        for name in os.listdir(self.directory):
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue  # committed or discarded meanwhile
+            if name.endswith('.npy'):
+                entries.append((stat.st_mtime, stat.st_size, name))
+            elif '.tmp' in name and wall_time() - stat.st_mtime > STALE_TEMPORARY_SECONDS:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.maxBytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue  # still mapped by a viewer on platforms that lock mapped files
+            total -= size
+
+
+class CacheEntry:
+    def __init__(self, directory, path, rows):
+        # a new entry is filled under a temporary name so a crash never leaves a truncated one behind,
+        # unique per writer as batch loads may fill entries from several processes at once
+        self.path = path
+        self.temporary = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            self.data = np.lib.format.open_memmap(self.temporary, mode='w+', dtype=np.float64, shape=(2, rows))
+        except OSError:
+            self.data = np.empty((2, rows))  # the cache is only an accelerator, loading works without it
+
+
+class SignalTextReader:
+    def __init__(self, fileName, dtype=np.float64, chunkBytes=1 << 18, size=None):
+        # two-column Time/Amplitude text file parsed by numpy in chunks of whole lines,
+        # small enough that a background parse never holds the GIL for long
+        self.fileName = fileName
+        self.dtype = dtype
+        self.chunkBytes = chunkBytes
+        # only the bytes the file held when it was opened are read, a recorder may keep appending
+        self.stat = os.stat(fileName)
+        self.size = self.stat.st_size if size is None else min(size, self.stat.st_size)
+        self.position = 0  # bytes consumed by chunks()
+        with open(fileName, 'rb') as file:
+            first_line = file.readline()
+        text = first_line.decode(errors='replace')
+        self.delimiter = '\t' if '\t' in text else ',' if ',' in text else None
+        fields = [field.strip().strip('"').lower() for field in text.split(self.delimiter)]
+        try:
+            [float(field) for field in fields]
+            self.columns = (0, 1)  # no header, the columns are in Time, Amplitude order
+            self.headerBytes = 0
+        except ValueError:
+            if 'time' not in fields or 'amplitude' not in fields:
+                raise ValueError(f"{fileName} has no Time and Amplitude columns")
+            self.columns = (fields.index('time'), fields.index('amplitude'))
+            self.headerBytes = len(first_line)
+
+    def count_rows(self):
+        # upper bound of the data rows, blank lines are counted too
+        rows = 0
+        last = b'\n'
+        for block in self.blocks():
+            rows += block.count(b'\n')
+            last = block[-1:]
+        return rows if last == b'\n' else rows + 1
+
+    def blocks(self):
+        # the file from its first data line up to self.size, in chunks of chunkBytes
+        with open(self.fileName, 'rb') as file:
+            file.seek(self.headerBytes)
+            while file.tell() < self.size:
+                block = file.read(min(self.chunkBytes, self.size - file.tell()))
+                if not block:
+                    break  # truncated meanwhile
+                self.position = file.tell()
+                yield block
+
+    def chunks(self):
+        # yields (time, amplitude) arrays, one per chunk of complete lines
+        rest = b''
+        for block in self.blocks():
+            block = rest + block
+            cut = block.rfind(b'\n') + 1
+            rest = block[cut:]
+            if cut:
+                yield self.parse(block[:cut])
+        # a last line without a newline is complete, unless the recorder is still writing it
+        if rest.strip() and os.path.getsize(self.fileName) == self.size:
+            yield self.parse(rest)
+
+    def parse(self, block):
+        return parse_lines(block, self.delimiter, self.columns, self.dtype)
+
+
+def parse_lines(block, delimiter, columns, dtype=np.float64):
+    # complete text lines to (time, amplitude) arrays, shared by file readers and live sources;
+    # loadtxt rounds every value correctly, which costs about twice pandas' default float parser
+    # (a 60k row file: ~55 ms against ~25 ms) but no more than pandas' round_trip parser
+    if not block.strip():
+        return np.empty(0, dtype), np.empty(0, dtype)
+    values = np.loadtxt(io.BytesIO(block), delimiter=delimiter, usecols=columns, dtype=dtype, ndmin=2)
+    return np.ascontiguousarray(values[:, 0]), np.ascontiguousarray(values[:, 1])
+
+
+class ChannelStore:
+    def __init__(self):
+        # every channel on screen by a stable integer id that is never reused, with each graph's
+        # ids in the order they were added, so lookups, renames and moves never search by name
+        self.channels = {}
+        self.graphs = {}  # widget -> {id: None}, an ordered set of the graph's channel ids
+        self.sources = {}  # live source -> id of the channel it feeds
+        self.nextId = 0
+
+    def add(self, widget, channel):
+        channelId = self.nextId
+        self.nextId += 1
+        channel["id"] = channelId
+        channel["widget"] = widget
+        self.channels[channelId] = channel
+        self.graphs.setdefault(widget, {})[channelId] = None
+        if channel.get("source") is not None:
+            self.sources[channel["source"]] = channelId
+        return channelId
+
+    def get(self, channelId):
+        return self.channels.get(channelId)
 
+    def remove(self, channelId):
+        channel = self.channels.pop(channelId)
+        del self.graphs[channel["widget"]][channelId]
+        self.sources.pop(channel.get("source"), None)
+        return channel
 
+    def move(self, channelId, widget):
+        channel = self.channels[channelId]
+        del self.graphs[channel["widget"]][channelId]
+        self.graphs.setdefault(widget, {})[channelId] = None
+        channel["widget"] = widget
+
+    def of(self, widget):
+        # the graph's channels in the order they were added
+        return [self.channels[channelId] for channelId in self.graphs.get(widget, {})]
+
+    def count(self, widget):
+        return len(self.graphs.get(widget, {}))
+
+    def for_source(self, source):
+        return self.channels.get(self.sources.get(source))
+
+    def values(self):
+        return self.channels.values()
+
+
+class Snapshot:
+    def __init__(self, widget, channels, view, image, imageFormat, traces=None, yRange=None):
+        # a rendered graph kept in memory together with what it showed: the graph, its channels
+        # as (channel, name, samples played) when it was taken, and the visible time range
+        self.widget = widget
+        self.channels = channels
+        self.view = view
+        self.image = image  # encoded image bytes, ready for the report
+        self.imageFormat = imageFormat
+        self.traces = traces  # decimated channel traces for a vector plot, instead of the image
+        self.yRange = yRange
+        self.size = (widget.width(), widget.height())
+        self.background = widget.backgroundBrush().color().name()
+
+    @classmethod
+    def trace(cls, widget, channels, view, yRange, traces):
+        # traces are dicts of name, color and the x, y points already decimated for the page
+        return cls(widget, channels, view, None, None, traces, yRange)
+
+    def figure(self):
+        # what the report draws for this snapshot, plain data so it can be sent to the report processes
+        if self.traces is None:
+            return {"image": self.image}
+        return {"traces": self.traces, "view": self.view, "yRange": self.yRange, "size": self.size,
+                "background": self.background}
+
+    @classmethod
+    def capture(cls, widget, channels, view, imageFormat="PNG", quality=-1):
+        # quality trades size for time, for PNG 0 is the strongest compression and 100 the fastest
+        pixmap = QPixmap(widget.size())
+        painter = QPainter(pixmap)
+        widget.render(painter)
+        painter.end()
+        buffer = QtCore.QBuffer()
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        pixmap.save(buffer, imageFormat, quality)
+        return cls(widget, channels, view, bytes(buffer.data()), imageFormat)
+
+
+def prepare_signal(time, amplitude, cache=None):
+    # the recording plus everything derived from it in a full pass, built before it reaches the GUI thread;
+    # the pyramid of a recording served from the cache is mapped from there, others are built in memory
+    pyramid = cache.pyramid(time, amplitude) if cache is not None else None
+    return {
+        "time": time,
+        "amplitude": amplitude,
+        "sampleRate": estimate_sample_rate(time),
+        "range": RangeCache(),
+        "pyramid": pyramid if pyramid is not None else MinMaxPyramid(time, amplitude)
+    }
+
+
+def estimate_sample_rate(time):
+    # samples per second, derived from the recording's Time column
+    if len(time) < 2 or time[-1] <= time[0]:
+        return 1.0
+    return (len(time) - 1) / (time[-1] - time[0])
+
+
+class CineClock:
+    def __init__(self, interval, on_tick, jitter=None):
+        # a single timer that advances every channel attached to it in one batched tick,
+        # on_tick receives the playback seconds that passed on the wall clock since the last tick;
+        # jitter, a histogram, gets how far each tick's interval was from the nominal one
+        self.rate = 1.0
+        self.lastTick = None
+        self.interval = interval / 1000
+        self.jitter = jitter
+        self.timer = QtCore.QTimer()
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(lambda: on_tick(self.advance()))
+
+    def advance(self):
+        now = perf_counter()
+        elapsed = now - self.lastTick
+        self.lastTick = now
+        if self.jitter is not None:
+            self.jitter.observe(abs(elapsed - self.interval))
+        return elapsed * self.rate
+
+    def start(self):
+        # restarting an active QTimer would postpone its next tick
+        if not self.timer.isActive():
+            self.lastTick = perf_counter()
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def setInterval(self, interval):
+        self.interval = interval / 1000
+        self.timer.setInterval(interval)
+
+    def setRate(self, rate):
+        self.rate = rate
+
+    def isActive(self):
+        return self.timer.isActive()
+
+
+class PerformanceMonitor:
+    def __init__(self, frameInterval):
+        # what one graph managed since the last collect(): display frames, frames that came too late
+        # to be shown on time (dropped), the cost of its cine ticks and the samples they advanced
+        self.frameInterval = frameInterval
+        self.lastFrame = None
+        self.since = perf_counter()
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.dropped = 0
+        self.ticks = 0
+        self.tickTime = 0.0
+        self.tickMax = 0.0
+        self.samples = 0
+
+    def frame(self, now):
+        if self.lastFrame is not None:
+            # every whole frame interval missed between two frames is a frame that was not shown
+            self.dropped += max(0, int((now - self.lastFrame) / self.frameInterval + 0.5) - 1)
+        self.lastFrame = now
+        self.frames += 1
+
+    def tick(self, cost, samples):
+        self.ticks += 1
+        self.tickTime += cost
+        self.tickMax = max(self.tickMax, cost)
+        self.samples += samples
+
+    def idle(self):
+        # paused or stopped, the gap until the next frame is not a drop
+        self.lastFrame = None
+
+    def collect(self):
+        # rates over the time since the previous collect(), then start counting again
+        now = perf_counter()
+        elapsed = max(now - self.since, 1e-9)
+        result = {
+            "fps": self.frames / elapsed,
+            "dropped": self.dropped,
+            "tickMs": 1000 * self.tickTime / self.ticks if self.ticks else 0.0,
+            "tickMaxMs": 1000 * self.tickMax,
+            "samplesPerSec": self.samples / elapsed,
+            "frames": self.frames,
+            "samples": self.samples
+        }
+        self.since = now
+        self.reset()
+        return result
+
+
+class RingBuffer:
+    def __init__(self, capacity):
+        # every sample is written twice so the newest samples are always one contiguous view
+        self.capacity = capacity
+        self.x = np.zeros(2 * capacity)
+        self.y = np.zeros(2 * capacity)
+        self.start = 0
+        self.size = 0
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+    def extend(self, x, y):
+        n = len(x)
+        if n >= self.capacity:
+            # only the newest samples survive anyway
+            self.clear()
+            x = x[-self.capacity:]
+            y = y[-self.capacity:]
+            n = self.capacity
+        write = (self.start + self.size) % self.capacity
+        first = min(n, self.capacity - write)
+        rest = n - first
+        for buffer, values in ((self.x, x), (self.y, y)):
+            buffer[write:write + first] = values[:first]
+            buffer[write + self.capacity:write + self.capacity + first] = values[:first]
+            buffer[:rest] = values[first:]
+            buffer[self.capacity:self.capacity + rest] = values[first:]
+        self.size += n
+        if self.size > self.capacity:
+            self.start = (self.start + self.size - self.capacity) % self.capacity
+            self.size = self.capacity
+
+    def view(self):
+        return self.x[self.start:self.start + self.size], self.y[self.start:self.start + self.size]
+
+
+class GrowableArray:
+    def __init__(self, capacity=1024):
+        # float array that is appended to in place, the capacity doubles so appends cost O(new samples)
+        self.data = np.empty(capacity)
+        self.size = 0
+
+    @classmethod
+    def wrap(cls, values):
+        # an array that is already filled, e.g. mapped from the cache, copied to the heap once it is written to
+        array = cls(0)
+        array.data = values
+        array.size = len(values)
+        return array
+
+    def extend(self, values):
+        end = self.size + len(values)
+        if end > len(self.data) or not self.data.flags.writeable:
+            data = np.empty(max(end, 2 * len(self.data)))
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.data[self.size:end] = values
+        self.size = end
+
+    def truncate(self, size):
+        self.size = min(self.size, size)
+
+    def view(self):
+        return self.data[:self.size]
+
+
+class RangeCache:
+    def __init__(self):
+        # extents of the raw samples played so far, a channel's display offset is applied by the caller
+        self.reset()
+
+    def reset(self):
+        # extents of the samples played so far
+        self.minX = np.inf
+        self.maxX = -np.inf
+        self.minY = np.inf
+        self.maxY = -np.inf
+
+    def extend(self, x, y):
+        # only the newly appended samples are scanned
+        if len(x) == 0:
+            return
+        self.minX = min(self.minX, float(np.min(x)))
+        self.maxX = max(self.maxX, float(np.max(x)))
+        self.minY = min(self.minY, float(np.min(y)))
+        self.maxY = max(self.maxY, float(np.max(y)))
+
+
+class MinMaxPyramid:
+    def __init__(self, x, y, minBlock=8):
+        # min/max of y over blocks of minBlock, 2*minBlock, 4*minBlock... samples, so any range
+        # can be drawn as one (min, max) pair per bin without losing a single spike
+        self.x = x[:0]
+        self.y = y[:0]
+        self.minBlock = minBlock
+        self.levels = {}
+        self.extend(x, y)
+
+    @classmethod
+    def stored(cls, x, y, levels, minBlock=8):
+        # a pyramid built by build() into levels, the levels are used as they are, e.g. mapped from a file
+        pyramid = cls(x[:0], y[:0], minBlock)
+        pyramid.x = x
+        pyramid.y = y
+        offset = 0
+        block = minBlock
+        for size in cls.level_sizes(len(y), minBlock):
+            pyramid.levels[block] = (GrowableArray.wrap(levels[0, offset:offset + size]),
+                                     GrowableArray.wrap(levels[1, offset:offset + size]))
+            offset += size
+            block *= 2
+        return pyramid
+
+    @staticmethod
+    def level_sizes(n, minBlock=8):
+        # bins per level as extend() builds them, up to the level with a single bin
+        sizes = [-(-n // minBlock)]
+        while sizes[-1] > 1:
+            sizes.append(-(-sizes[-1] // 2))
+        return sizes
+
+    @classmethod
+    def build(cls, y, out, minBlock=8, chunk=1 << 16):
+        # fills out, of shape (2, sum(level_sizes(len(y)))), with every level's mins and maxs one after another;
+        # chunk bins are reduced at a time, so a memory-mapped recording is only streamed through memory
+        offset = 0
+        mins = maxs = y
+        block = minBlock
+        for size in cls.level_sizes(len(y), minBlock):
+            for first in range(0, size, chunk):
+                newMins, newMaxs = cls.reduce(mins[first * block:(first + chunk) * block],
+                                              maxs[first * block:(first + chunk) * block], block)
+                out[0, offset + first:offset + first + len(newMins)] = newMins
+                out[1, offset + first:offset + first + len(newMaxs)] = newMaxs
+            mins = out[0, offset:offset + size]
+            maxs = out[1, offset:offset + size]
+            offset += size
+            block = 2
+
+    def extend(self, x, y):
+        # x and y are the grown recording, only the blocks touched by the new samples are reduced,
+        # starting with the last block of each level which may have been partial
+        first = len(self.y) // self.minBlock
+        self.x = x
+        self.y = y
+        values = y[first * self.minBlock:]
+        mins, maxs = self.reduce(values, values, self.minBlock)
+        block = self.minBlock
+        while True:
+            if block not in self.levels:
+                self.levels[block] = (GrowableArray(), GrowableArray())
+            levelMins, levelMaxs = self.levels[block]
+            levelMins.truncate(first)
+            levelMins.extend(mins)
+            levelMaxs.truncate(first)
+            levelMaxs.extend(maxs)
+            if levelMins.size <= 1:
+                break
+            first //= 2
+            mins, maxs = self.reduce(levelMins.view()[first * 2:], levelMaxs.view()[first * 2:], 2)
+            block *= 2
+
+    @staticmethod
+    def reduce(mins, maxs, block):
+        # the last block may be partial, every later level keeps the same block boundaries
+        n = len(mins) // block * block
+        newMins = mins[:n].reshape(-1, block).min(axis=1)
+        newMaxs = maxs[:n].reshape(-1, block).max(axis=1)
+        if n < len(mins):
+            newMins = np.append(newMins, mins[n:].min())
+            newMaxs = np.append(newMaxs, maxs[n:].max())
+        return newMins, newMaxs
+
+    def query(self, start, stop, pixels):
+        # samples [start, stop) decimated to at most ~2 points per pixel
+        n = stop - start
+        if n <= 2 * pixels:
+            return self.x[start:stop], self.y[start:stop]
+        block = 1 << int(np.ceil(np.log2(n / pixels)))
+        first = start // block
+        full = stop // block
+        if block in self.levels:
+            mins = self.levels[block][0].view()[first:full]
+            maxs = self.levels[block][1].view()[first:full]
+        else:
+            # finer than the stored levels, cheap enough to reduce the raw slice directly
+            values = self.y[first * block:full * block]
+            mins, maxs = self.reduce(values, values, block)
+        if full * block < stop:
+            # the bin holding `stop` may reach past it, so it is reduced from the raw samples
+            mins = np.append(mins, self.y[full * block:stop].min())
+            maxs = np.append(maxs, self.y[full * block:stop].max())
+        x = np.repeat(self.x[first * block:stop:block], 2)
+        y = np.empty(len(x))
+        y[0::2] = mins
+        y[1::2] = maxs
+        return x, y
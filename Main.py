@@ -3,18 +3,27 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtWidgets import QColorDialog, QMessageBox
-from PyQt5.QtGui import QPixmap, QPainter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-import statistics
 
 from pyqtgraph.widgets import PlotWidget
 import sys
+import threading
+import importlib
+from time import perf_counter
 import newui
-from Classes import FileBrowser
+from Classes import FileBrowser, SignalLoadWorker, SignalBatchWorker, CineClock, PerformanceMonitor, RingBuffer, ChannelStore, Snapshot, prepare_signal, estimate_sample_rate
+from Sources import TailSource, SocketSource, SignalSimulator
+import Metrics
+
+CINE_WINDOW = 600  # samples visible in the cine sweep window
+CINE_HISTORY_MARGIN = 600  # extra samples kept behind the sweep window while playing
+CINE_TICK_MS = 16  # cine data interval, the samples advanced per tick follow the wall clock
+RENDER_FPS = 30  # display frames per second while playing, independent of how fast data advances
+FOLLOW_POLL_MS = 250  # how often followed recordings are checked for appended samples
+HUD_INTERVAL_MS = 1000  # how often the performance HUD of each graph is refreshed
+WARM_UP_DELAY_MS = 500  # after the window is shown, the modules imported on first use are loaded in the background
+WARM_UP_MODULES = ("Stats", "Report")  # pandas is left out, it is only needed for spreadsheets
+REPORT_VECTOR_PLOTS = True  # reports draw snapshot traces as PDF paths, False embeds screenshots
+REPORT_TRACE_BINS = 540  # min/max bins per snapshot trace, one per point of the 7.5 inch report plot
 
 class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
     def __init__(self):
@@ -23,26 +32,52 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         
         self.actionGraph_1.triggered.connect(lambda: self.plot_data(self.plotWidget_L))
         self.actionGraph_2.triggered.connect(lambda: self.plot_data(self.plotWidget_R))
+
+        # File > Follow... keeps reading a recording that is still being written
+        self.menuFollow = QtWidgets.QMenu("Follow...", self.menuFile)
+        self.actionFollowGraph_1 = self.menuFollow.addAction("Graph 1")
+        self.actionFollowGraph_2 = self.menuFollow.addAction("Graph 2")
+        self.menuFile.insertMenu(self.actionExport, self.menuFollow)
+        self.actionFollowGraph_1.triggered.connect(lambda: self.follow_data(self.plotWidget_L))
+        self.actionFollowGraph_2.triggered.connect(lambda: self.follow_data(self.plotWidget_R))
+
+        # File > Simulate... replays a recording as a live device on a local socket,
+        # File > Connect... reads a device or simulator that is already streaming
+        self.menuSimulate = QtWidgets.QMenu("Simulate...", self.menuFile)
+        self.actionSimulateGraph_1 = self.menuSimulate.addAction("Graph 1")
+        self.actionSimulateGraph_2 = self.menuSimulate.addAction("Graph 2")
+        self.menuFile.insertMenu(self.actionExport, self.menuSimulate)
+        self.actionSimulateGraph_1.triggered.connect(lambda: self.simulate_data(self.plotWidget_L))
+        self.actionSimulateGraph_2.triggered.connect(lambda: self.simulate_data(self.plotWidget_R))
+        self.menuConnect = QtWidgets.QMenu("Connect...", self.menuFile)
+        self.actionConnectGraph_1 = self.menuConnect.addAction("Graph 1")
+        self.actionConnectGraph_2 = self.menuConnect.addAction("Graph 2")
+        self.menuFile.insertMenu(self.actionExport, self.menuConnect)
+        self.actionConnectGraph_1.triggered.connect(lambda: self.connect_data(self.plotWidget_L))
+        self.actionConnectGraph_2.triggered.connect(lambda: self.connect_data(self.plotWidget_R))
+        self.simulators = {}  # simulators started from the menu, by the source reading them
         
         self.fileBrowser = FileBrowser(self)
-        self.snapshot_images_lst = []
+        self.loadWorkers = []  # background loads in progress
+        self.reportWorkers = []  # PDF reports being built
+        self.snapshots = []  # in-memory snapshots waiting for the next report
         self.pdf_count = 0
-        self.plotsL = {}
-        self.plotsR = {}
-        self.plotsDataL = {} # dictionary to store time and amplitude values of each plot
-        self.plotsDataR = {} # dictionary to store time and amplitude values of each plot
-        self.timers_L = {}  # dictionary to store timers of the graph on the left
-        self.timers_R = {}  # dictionary to store timers of the graph on the right
-        self.update_data_dict = {}
+        self.channels = ChannelStore()  # every signal of both graphs, by id
         self.isPlayingL = True
         self.isPlayingR = True
         self.rewindPlotL = False
         self.rewindPlotR = False
-        self.PlotsFinishedL = {} # dictionary to check if all signals are completely plotted
-        self.PlotsFinishedR = {} # dictionary to check if all signals are completely plotted
         
         self.graph1ViewBox = self.plotWidget_L.getViewBox()
         self.graph2ViewBox = self.plotWidget_R.getViewBox()
+
+        # graphs that are not playing redraw through the decimation pyramid whenever their view changes
+        self.cineRunningL = False
+        self.cineRunningR = False
+        self.graph1ViewBox.sigXRangeChanged.connect(lambda: self.refresh_static_channels(self.plotWidget_L))
+        self.graph2ViewBox.sigXRangeChanged.connect(lambda: self.refresh_static_channels(self.plotWidget_R))
+        self.graph1ViewBox.sigResized.connect(lambda: self.refresh_static_channels(self.plotWidget_L))
+        self.graph2ViewBox.sigResized.connect(lambda: self.refresh_static_channels(self.plotWidget_R))
         
         self.horizontalScrollBar_L.valueChanged.connect(self.scroll_plot_x_L)
         self.verticalScrollBar_L.valueChanged.connect(self.scroll_plot_y_L)
@@ -79,6 +114,41 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         self.horizontalSlider_L_speed.valueChanged.connect(self.updateCineSpeedL)
         self.horizontalSlider_R_speed.valueChanged.connect(self.updateCineSpeedR)
 
+        # one master cine clock per graph, and a shared one while the graphs are linked
+        self.cineClockL = CineClock(CINE_TICK_MS, lambda dt: self.update_graph(self.plotWidget_L, dt), Metrics.TICK_JITTER["1"])
+        self.cineClockR = CineClock(CINE_TICK_MS, lambda dt: self.update_graph(self.plotWidget_R, dt), Metrics.TICK_JITTER["2"])
+        self.cineClockLinked = CineClock(CINE_TICK_MS, self.update_linked_graphs, Metrics.TICK_JITTER["linked"])
+        # advancing data does not repaint, the display catches up at most RENDER_FPS times a second
+        self.renderTimer = QtCore.QTimer()
+        self.renderTimer.setInterval(1000 // RENDER_FPS)
+        self.renderTimer.timeout.connect(self.render_frame)
+
+        # performance HUD: the LCD next to each speed slider shows the graph's display frames per second,
+        # an overlay in the plot's corner adds tick cost, samples per second, dropped frames and buffer fill
+        self.monitorL = PerformanceMonitor(1 / RENDER_FPS)
+        self.monitorR = PerformanceMonitor(1 / RENDER_FPS)
+        self.lcdNumber_L = QtWidgets.QLCDNumber(self.groupBox_2)
+        self.lcdNumber_L.setObjectName("lcdNumber_L")
+        self.gridLayout_21.addWidget(self.lcdNumber_L, 0, 2, 1, 1)
+        self.lcdNumber_R = QtWidgets.QLCDNumber(self.groupBox)
+        self.lcdNumber_R.setObjectName("lcdNumber_R")
+        self.gridLayout_64.addWidget(self.lcdNumber_R, 0, 2, 1, 1)
+        self.hudLabelL = QtWidgets.QLabel(self.plotWidget_L)
+        self.hudLabelR = QtWidgets.QLabel(self.plotWidget_R)
+        for lcd, label in ((self.lcdNumber_L, self.hudLabelL), (self.lcdNumber_R, self.hudLabelR)):
+            lcd.setDigitCount(3)
+            lcd.setSegmentStyle(QtWidgets.QLCDNumber.Flat)
+            lcd.setToolTip("Display frames per second")
+            label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+            label.setStyleSheet("color: #c8d6e5; background-color: rgba(4, 20, 35, 170); font: 8pt monospace; padding: 2px;")
+            label.hide()
+        self.hudTimer = QtCore.QTimer()
+        self.hudTimer.setInterval(HUD_INTERVAL_MS)
+        self.hudTimer.timeout.connect(self.update_hud)
+        self.hudTimer.start()
+
+        QtCore.QTimer.singleShot(WARM_UP_DELAY_MS, self.warm_up_imports)
+
         self.pushButton_L_playPause.setText("Play")
         self.pushButton_R_playPause.setText("Play")
         self.pushButton_L_playPause.clicked.connect(self.togglePlayPauseL)
@@ -117,173 +187,397 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         self.max_offset_L = 0
 
     def plot_data(self, widget):
-        time, amplitude = self.fileBrowser.browse_file() 
-        index = 0
-        if time is not None and amplitude is not None:
-            i = 0  # Initialize counter inside a list
-            timer = QtCore.QTimer()
-        
-            if widget is self.plotWidget_L:
-                # Create a new plot on the passed widget
-                plot = widget.plot()
-
-                # Add the plot to the appropriate legend and combo box
-                signal_name = 'Signal {}'.format(len(self.plotsL) + len(self.plotsR) + 1)
-
-                index = len(self.plotsL) + len(self.plotsR)
-
-                self.plotsL[signal_name] = plot
-
-                # store the plots' original data before shifting
-                self.plotsDataL[signal_name] = [time, amplitude]
-
-                # Offset the amplitude of the new signal
-                offset = len(self.plotsL) * 2
-                amplitude = amplitude - offset
+        fileNames = self.fileBrowser.get_file_names()
+        if len(fileNames) == 1:
+            self.load_signal(widget, fileNames[0])
+        elif len(fileNames) > 1:
+            self.load_signals(widget, fileNames)
+
+    def load_signal(self, widget, fileName, source=None):
+        # parse in the background, the channel is added to the graph once its data is ready;
+        # a source following the file reads what it holds so far there and is attached with it
+        worker = SignalLoadWorker(self.fileBrowser, fileName, source)
+        if source is None:
+            on_loaded = lambda signal: self.add_signal(widget, signal)
+        else:
+            on_loaded = lambda signal: self.attach_source(widget, source, signal)
+        self.run_load_worker(worker, f"Loading {os.path.basename(fileName)}...", on_loaded)
+
+    def load_signals(self, widget, fileNames):
+        # parse a batch in parallel and attach all of its channels at once
+        worker = SignalBatchWorker(self.fileBrowser, fileNames)
+        self.run_load_worker(worker, f"Loading {len(fileNames)} files...", lambda signals: self.add_signals(widget, signals))
+
+    def run_load_worker(self, worker, label, on_loaded):
+        # the worker runs with a progress dialog that can cancel it, on_loaded gets what it loaded
+        progress = QtWidgets.QProgressDialog(label, "Cancel", 0, 100, self)
+        progress.setWindowModality(QtCore.Qt.NonModal)
+        progress.setMinimumDuration(300)
+        progress.setValue(0)
+        progress.canceled.connect(worker.cancel)
+        worker.progress.connect(progress.setValue)
+        worker.loaded.connect(on_loaded)
+        worker.failed.connect(self.show_load_error)
+        worker.finished.connect(progress.close)
+        worker.finished.connect(progress.deleteLater)  # close() only hides it
+        worker.finished.connect(lambda: self.loadWorkers.remove(worker))
+        self.loadWorkers.append(worker)
+        worker.start()
+
+    def follow_data(self, widget):
+        fileName = self.fileBrowser.get_file_name()
+        if fileName:
+            self.follow_signal(widget, fileName)
+
+    def follow_signal(self, widget, fileName):
+        # play what the file holds so far, read in the background, then keep appending whatever the recorder writes
+        try:
+            source = TailSource(fileName, FOLLOW_POLL_MS)
+        except (OSError, ValueError) as error:
+            self.show_load_error(str(error))
+            return
+        self.load_signal(widget, fileName, source)
 
-                self.update_data_dict[index] = {
-                    "time": time,
-                    "amplitude": amplitude,
-                    "plot": plot,
-                    "widget": widget,
-                    "signal_name": signal_name,
-                    "indexTrack":i
-                }
+    def simulate_data(self, widget):
+        fileName = self.fileBrowser.get_file_name()
+        if not fileName:
+            return
+        # the recording is read in the background like any other, the device starts once it is ready
+        worker = SignalLoadWorker(self.fileBrowser, fileName)
+        self.run_load_worker(worker, f"Loading {os.path.basename(fileName)}...",
+                             lambda signal: self.start_simulator(widget, signal))
+
+    def start_simulator(self, widget, signal):
+        try:
+            simulator = SignalSimulator(signal["time"], signal["amplitude"])
+        except OSError as error:
+            self.show_load_error(str(error))
+            return
+        simulator.start()
+        try:
+            source = SocketSource(*simulator.address)
+        except OSError as error:
+            simulator.stop()
+            self.show_load_error(str(error))
+            return
+        self.simulators[source] = simulator
+        self.attach_source(widget, source)
 
+    def connect_data(self, widget):
+        address, ok = QtWidgets.QInputDialog.getText(self, "Connect", "Device address (host:port):", text="127.0.0.1:5555")
+        if not ok or not address:
+            return
+        host, _, port = address.rpartition(':')
+        try:
+            source = SocketSource(host or '127.0.0.1', int(port))
+        except (OSError, ValueError) as error:
+            self.show_load_error(str(error))
+            return
+        self.attach_source(widget, source)
+
+    def attach_source(self, widget, source, signal=None):
+        # a live channel: whatever the source delivered so far is played, later samples are appended;
+        # signal holds what a background load already read for the source
+        source.on_data = lambda count: self.append_samples(source, count)
+        if signal is None:
+            source.read_available()
+            signal = prepare_signal(*source.samples())
+        signal["source"] = source
+        self.add_signal(widget, signal)
+        source.start()
+
+    def append_samples(self, source, count):
+        # the pyramid reduces just the blocks the appended samples touch
+        channel = self.channels.for_source(source)
+        time, amplitude = source.samples()
+        channel["pyramid"].extend(time, amplitude)
+        channel["sampleRate"] = estimate_sample_rate(time)
+        channel["time"] = time
+        channel["amplitude"] = amplitude
+
+    def show_load_error(self, message):
+        msg_box = QtWidgets.QMessageBox()
+        msg_box.setIcon(QtWidgets.QMessageBox.Critical)
+        msg_box.setWindowTitle("Error")
+        msg_box.setText(f"Could not open the signal file: {message}")
+        msg_box.exec_()
+
+    def add_signals(self, widget, signals):
+        # the clocks and the static views are refreshed once for the whole batch
+        for signal in signals:
+            self.add_signal(widget, signal, sync=False)
+        if signals:
+            self.syncCineClocks()
+
+    def add_signal(self, widget, signal, sync=True):
+        time = signal["time"]
+        amplitude = signal["amplitude"]
+        if time is not None and amplitude is not None:
+            # Create a new plot on the passed widget
+            plot = widget.plot()
+
+            channelId = self.channels.add(widget, {
+                "time": time,
+                "amplitude": amplitude,
+                "plot": plot,
+                "indexTrack": 0,
+                "ring": RingBuffer(CINE_WINDOW + CINE_HISTORY_MARGIN),
+                "sampleRate": signal["sampleRate"],
+                "range": signal["range"],
+                "pyramid": signal["pyramid"],
+                "samplePhase": 0.0,
+                "source": signal.get("source")
+            })
+            channel = self.channels.get(channelId)
+            # ids are never reused, so neither are the default names
+            signal_name = 'Signal {}'.format(channelId + 1)
+            channel["signal_name"] = signal_name
+            # Offset the amplitude of the new signal, applied when drawing so the data is never copied
+            channel["offset"] = self.channels.count(widget) * 2
+
+            # a live graph never finishes, so while it has a live channel stopping it stays possible,
+            # it is how the sources are closed
+            live = any(value["source"] is not None for value in self.channels.of(widget))
+
+            # Add the plot to the appropriate legend and combo box, the combo box item carries the id
+            if widget is self.plotWidget_L:
                 # unenable rewind and stop buttons
-                self.pushButton_L_stop.setEnabled(False)
+                self.pushButton_L_stop.setEnabled(live)
                 self.pushButton_L_rewind.setEnabled(False)
 
                 self.legend_L.addItem(plot, signal_name)
-                self.comboBox_L_channels.addItem(signal_name)
-                self.timers_L[signal_name] = timer  # Store timer in the dictionary
+                self.comboBox_L_channels.addItem(signal_name, channelId)
                 if self.isPlayingL:
                     self.pushButton_L_playPause.setText("Pause")
-                    speed = self.horizontalSlider_L_speed.value()
-                    timer.start(speed)  # Update every 50 ms by default
-                
-            elif widget is self.plotWidget_R:
-                # Create a new plot on the passed widget
-                plot = widget.plot()
-
-                # Add the plot to the appropriate legend and combo box
-                signal_name = 'Signal {}'.format(len(self.plotsR) + len(self.plotsL) + 1)
-
-                index = len(self.plotsL) + len(self.plotsR)
-                
-                self.plotsR[signal_name] = plot
-
-                # store the plots' original data before shifting
-                self.plotsDataR[signal_name] = [time, amplitude]
-
-                # Offset the amplitude of the new signal
-                offset = len(self.plotsR) * 2  # Adjust the value '10' as needed
-                amplitude = amplitude - offset
-
-                self.update_data_dict[index] = {
-                    "time": time,
-                    "amplitude": amplitude,
-                    "plot": plot,
-                    "widget": widget,
-                    "signal_name": signal_name,
-                    "indexTrack": i
-                }
-
+            else:
                 # unenable rewind and stop buttons
-                self.pushButton_R_stop.setEnabled(False)
+                self.pushButton_R_stop.setEnabled(live)
                 self.pushButton_R_rewind.setEnabled(False)
 
                 self.legend_R.addItem(plot, signal_name)
-                self.comboBox_R_channels.addItem(signal_name)
-                self.timers_R[signal_name] = timer  # Store timer in the dictionary
+                self.comboBox_R_channels.addItem(signal_name, channelId)
                 if self.isPlayingR:
                     self.pushButton_R_playPause.setText("Pause")
-                    speed = self.horizontalSlider_R_speed.value()
-                    timer.start(speed)  # Update every 50 ms by default
 
-            timer.timeout.connect(lambda: self.update_plot_data(index, self.update_data_dict))
+            # the new channel joins its graph's master cine clock
+            if sync:
+                self.syncCineClocks()
             # Enable scrolling in the PlotWidget
             widget.getViewBox().setMouseEnabled(x=True, y=True)
 
+    def update_graph(self, widget, dt):
+        # advance every channel of the graph in a single batched tick
+        start = perf_counter()
+        samples = 0
+        for channel in self.channels.of(widget):
+            samples += self.update_plot_data(channel, dt)
+        self.check_plots_finished(widget)
+        cost = perf_counter() - start
+        self.monitor_of(widget).tick(cost, samples)
+        Metrics.UPDATE_DURATION[self.graph_label(widget)].observe(cost)
+
+    def monitor_of(self, widget):
+        return self.monitorL if widget is self.plotWidget_L else self.monitorR
+
+    def graph_label(self, widget):
+        return "1" if widget is self.plotWidget_L else "2"
+
+    def update_linked_graphs(self, dt):
+        # one shared tick keeps both graphs in step while they are linked
+        if self.isPlayingL and not self.rewindPlotL:
+            self.update_graph(self.plotWidget_L, dt)
+        if self.isPlayingR and not self.rewindPlotR:
+            self.update_graph(self.plotWidget_R, dt)
+
+    def syncCineClocks(self):
+        # run the clock of each playing graph, or the shared one if the graphs are linked
+        runL = self.isPlayingL and not self.rewindPlotL and self.channels.count(self.plotWidget_L) != 0
+        runR = self.isPlayingR and not self.rewindPlotR and self.channels.count(self.plotWidget_R) != 0
+        self.cineRunningL = runL
+        self.cineRunningR = runR
+        if self.checkBox_linkGraphs.isChecked():
+            self.cineClockL.stop()
+            self.cineClockR.stop()
+            if runL or runR:
+                self.cineClockLinked.start()
+            else:
+                self.cineClockLinked.stop()
+        else:
+            self.cineClockLinked.stop()
+            for clock, run in ((self.cineClockL, runL), (self.cineClockR, runR)):
+                if run:
+                    clock.start()
+                else:
+                    clock.stop()
+        if runL or runR:
+            if not self.renderTimer.isActive():
+                self.renderTimer.start()
+        else:
+            self.renderTimer.stop()
+        # apply what advanced since the last frame, then a graph that is not playing
+        # shows everything played so far instead of the sweep window
+        self.render_frame()
+        for widget, run in ((self.plotWidget_L, runL), (self.plotWidget_R, runR)):
+            if not run:
+                self.monitor_of(widget).idle()
+                self.refresh_static_channels(widget)
+
+    def refresh_static_channels(self, widget):
+        running = self.cineRunningL if widget is self.plotWidget_L else self.cineRunningR
+        for channel in self.channels.of(widget):
+            if not running or self.channel_finished(channel):
+                self.render_static(channel)
+
+    def channel_finished(self, channel):
+        # a live channel waits for more samples instead of finishing
+        return channel["source"] is None and channel["indexTrack"] >= len(channel["time"])
+
+    def render_static(self, channel):
+        # draw the played samples in view, decimated to the plot's pixel width
+        view_box = channel["widget"].getViewBox()
+        (min_x, max_x), _ = view_box.viewRange()
+        played = channel["time"][:channel["indexTrack"]]
+        start = max(0, int(np.searchsorted(played, min_x)) - 1)
+        stop = min(len(played), int(np.searchsorted(played, max_x, side='right')) + 1)
+        pixels = max(1, int(view_box.width()))
+        x, y = channel["pyramid"].query(start, stop, pixels)
+        channel["plot"].setData(x, y - channel["offset"])
+
+    def refill_ring(self, channel):
+        # reload the sweep window after the amplitude offset changed
+        i = channel["indexTrack"]
+        start = max(0, i - channel["ring"].capacity)
+        channel["ring"].clear()
+        channel["ring"].extend(channel["time"][start:i], channel["amplitude"][start:i] - channel["offset"])
+        channel["plot"].setData(*channel["ring"].view())
+
+    def update_plot_data(self, channel, dt):
+        time = channel["time"]
+        amplitude = channel["amplitude"]
+        i = channel["indexTrack"]
+
+        if i >= len(time):
+            # finished, or a live channel waiting for its source
+            return 0
+
+        # advance by as many samples as the elapsed playback time covers
+        phase = channel["samplePhase"] + dt * channel["sampleRate"]
+        step = int(phase)
+        channel["samplePhase"] = phase - step
+        if step == 0:
+            return 0
+        new_i = min(i + step, len(time))
+        # push only the new samples, the sweep window is redrawn by the next display frame
+        channel["ring"].extend(time[i:new_i], amplitude[i:new_i] - channel["offset"])
+        channel["range"].extend(time[i:new_i], amplitude[i:new_i])
+        channel["indexTrack"] = new_i
+        channel["dirty"] = True
+        return new_i - i
+
+    def render_frame(self):
+        # one display frame: redraw only the channels that advanced since the last one,
+        # then move each graph's view once, however many of its channels advanced
+        leading = {}
+        for channel in self.channels.values():
+            if channel.get("dirty"):
+                channel["dirty"] = False
+                self.render_channel(channel)
+                newest = channel["time"][channel["indexTrack"] - 1]
+                widget = channel["widget"]
+                if widget not in leading or newest > leading[widget][0]:
+                    leading[widget] = (newest, channel)
+        now = perf_counter()
+        for widget, (_, channel) in leading.items():
+            self.follow_sweep(widget, channel)
+            self.monitor_of(widget).frame(now)
+
+    def render_channel(self, channel):
+        if self.channel_finished(channel):
+            # hand over the whole recording once it is played, so it can be scrolled and rewound
+            self.render_static(channel)
+        else:
+            channel["plot"].setData(*channel["ring"].view())
 
-    def update_plot_data(self,index, dataDict):
-        # calculate the offset considering different cases
-        # if self.movingLtoR:
-        #     self.movingLtoR = False
-        #     offset = len(self.plotsR) * 2
-        # elif self.movingRtoL:
-        #     self.movingRtoL = False
-        #     offset = len(self.plotsL) * 2
-        # else:
-        #     offset = 0
-        # # update the amplitude
-        # amplitude -= offset
-        signal_name = dataDict[index]["signal_name"]
-        widget = dataDict[index]["widget"]
-        plot = dataDict[index]["plot"]
-        time = dataDict[index]["time"]
-        amplitude = dataDict[index]["amplitude"]
-        i = dataDict[index]["indexTrack"]
-
+    def follow_sweep(self, widget, channel):
+        # follow the newest sample with the sweep window, channel is the one furthest ahead
+        time = channel["time"]
+        i = channel["indexTrack"]
         min_y, max_Y = self.get_min_max_y_for_widget(widget)
-        # widget.setYRange(-5, 5)
-        if i < len(time):
-            if widget is self.plotWidget_L:
-                if signal_name in self.plotsDataL:
-                    if i > 600:
-                        self.graph1ViewBox.setXRange(self.plotsDataL[signal_name][0][i-600], time[i])
-                        self.graph1ViewBox.setLimits(xMin=-0.02, xMax=time[i] + 0.2, yMin=min_y - 0.01, yMax=max_Y + 0.01)
-                    else:
-                        self.graph1ViewBox.setXRange(0, self.plotsDataL[signal_name][0][600])
-                        self.graph1ViewBox.setLimits(xMin=-0.02, xMax=(self.plotsDataL[signal_name][0][600]) + 0.2,  yMin=min_y - 0.01, yMax=max_Y + 0.01)
+        last = i - 1
+        window_end = time[min(CINE_WINDOW, len(time) - 1)]
+        if widget is self.plotWidget_L:
+            if last > CINE_WINDOW:
+                self.graph1ViewBox.setXRange(time[last-CINE_WINDOW], time[last])
+                self.graph1ViewBox.setLimits(xMin=-0.02, xMax=time[last] + 0.2, yMin=min_y - 0.01, yMax=max_Y + 0.01)
             else:
-                if signal_name in self.plotsDataR:
-                    if i > 600:
-                        self.graph2ViewBox.setXRange(self.plotsDataR[signal_name][0][i-600], time[i])
-                        self.graph2ViewBox.setLimits(xMin=-0.02, xMax=time[i], yMin=min_y - 0.01, yMax=max_Y + 0.01)
-                    else:
-                        self.graph2ViewBox.setXRange(0, self.plotsDataR[signal_name][0][600])
-                        self.graph2ViewBox.setLimits(xMin=-0.02, xMax=(self.plotsDataR[signal_name][0][600]),  yMin=min_y - 0.01, yMax=max_Y + 0.01)
-
-        # continue plotting
-        if i < len(time):
-            plot.setData(time[:i], amplitude[:i])
-            i += 1
-            dataDict[index]["indexTrack"] = i
+                self.graph1ViewBox.setXRange(0, window_end)
+                self.graph1ViewBox.setLimits(xMin=-0.02, xMax=window_end + 0.2,  yMin=min_y - 0.01, yMax=max_Y + 0.01)
         else:
-            if signal_name in self.timers_L:
-                self.timers_L[signal_name].stop()  # Stop updating after all data is plotted
-            elif signal_name in self.timers_R:
-                self.timers_R[signal_name].stop()  # Stop updating after all data is plotted
-            
-            if widget is self.plotWidget_L:
-                self.PlotsFinishedL[signal_name] = True  # change plotting progress state
+            if last > CINE_WINDOW:
+                self.graph2ViewBox.setXRange(time[last-CINE_WINDOW], time[last])
+                self.graph2ViewBox.setLimits(xMin=-0.02, xMax=time[last], yMin=min_y - 0.01, yMax=max_Y + 0.01)
             else:
-                self.PlotsFinishedR[signal_name] = True  # change plotting progress state
+                self.graph2ViewBox.setXRange(0, window_end)
+                self.graph2ViewBox.setLimits(xMin=-0.02, xMax=window_end,  yMin=min_y - 0.01, yMax=max_Y + 0.01)
+
+    def update_hud(self):
+        for widget, lcd, label, running in ((self.plotWidget_L, self.lcdNumber_L, self.hudLabelL, self.cineRunningL),
+                                            (self.plotWidget_R, self.lcdNumber_R, self.hudLabelR, self.cineRunningR)):
+            stats = self.monitor_of(widget).collect()
+            graph = self.graph_label(widget)
+            Metrics.FRAMES[graph].inc(stats["frames"])
+            Metrics.DROPPED_FRAMES[graph].inc(stats["dropped"])
+            Metrics.SAMPLES[graph].inc(stats["samples"])
+            channels = self.channels.of(widget)
+            if not channels:
+                lcd.display(0)
+                label.hide()
+                continue
+            # buffer: how full the fullest sweep window is, backlog: received samples of live
+            # channels that are not shown yet, growing when the graph cannot keep up with its source
+            fill = max(channel["ring"].size / channel["ring"].capacity for channel in channels)
+            backlog = max([(len(channel["time"]) - channel["indexTrack"]) / channel["sampleRate"]
+                           for channel in channels if channel["source"] is not None] or [0.0])
+            lagging = running and (stats["fps"] < 0.8 * RENDER_FPS or stats["dropped"] > 0)
+            lcd.display(round(stats["fps"]))
+            lcd.setStyleSheet("color: #ff5c5c;" if lagging else "")
+            skipped = sum(channel["source"].skippedLines for channel in channels if channel["source"] is not None)
+            lines = [f"{stats['fps']:5.1f} fps   {stats['dropped']} dropped",
+                     f"tick {stats['tickMs']:.1f} ms (max {stats['tickMaxMs']:.1f})",
+                     f"{stats['samplesPerSec']:,.0f} samples/s",
+                     f"buffer {fill:.0%}" + (f"   backlog {backlog:.1f} s" if backlog else "")]
+            if skipped:
+                lines.append(f"{skipped} unreadable lines skipped")
+            label.setText("\n".join(lines))
+            label.adjustSize()
+            # top right corner, clear of the legend
+            label.move(widget.width() - label.width() - 10, 8)
+            label.show()
+
+    def check_plots_finished(self, widget):
         # check if all signals in one graph finished plotting
-        if all(self.PlotsFinishedL.values()) and len(self.PlotsFinishedL) != 0:
+        channels = self.channels.of(widget)
+        if len(channels) == 0 or not all(self.channel_finished(value) for value in channels):
+            return
+        if widget is self.plotWidget_L:
             self.pushButton_L_stop.setEnabled(True)  # enable stop viewing button
             self.pushButton_L_rewind.setEnabled(True) # enable rewind button
-            # toggle to stop playing
-            # self.togglePlayPauseL()
             self.pushButton_L_playPause.setText("Play")
             self.isPlayingL = False
-        elif all(self.PlotsFinishedR.values()) and len(self.PlotsFinishedR) != 0:
+        else:
             self.pushButton_R_stop.setEnabled(True)  # enable stop viewing button
             self.pushButton_R_rewind.setEnabled(True) # enable rewind button
-            # toggle to stop playing
-            # self.togglePlayPauseR()
             self.pushButton_R_playPause.setText("Play")
             self.isPlayingR = False
+        # stop ticking the graph once everything is plotted
+        self.syncCineClocks()
 
 
     def updateCineSpeedL(self):
         speed = self.horizontalSlider_L_speed.value()
         if not self.checkBox_linkGraphs.isChecked():
             if not self.rewindPlotL:
-                for signal_name in self.timers_L:
-                    timer = self.timers_L[signal_name]
-                    timer.setInterval(speed)
+                self.cineClockL.setRate(self.playbackRate(speed))
             else:
                 self.rewindTimerL.setInterval(speed)
         else:
@@ -294,9 +588,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         speed = self.horizontalSlider_R_speed.value()
         if not self.checkBox_linkGraphs.isChecked():
             if not self.rewindPlotR:
-                for signal_name in self.timers_R:
-                    timer = self.timers_R[signal_name]
-                    timer.setInterval(speed)
+                self.cineClockR.setRate(self.playbackRate(speed))
             else:
                 self.rewindTimerR.setInterval(speed)
         else:
@@ -308,13 +600,15 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         self.horizontalSlider_R_speed.setValue(value)
 
         # Now, update the actual cine speed for both widgets.
-        speed = value
+        rate = self.playbackRate(value)
 
-        for timer in self.timers_L.values():
-            timer.setInterval(speed)
+        self.cineClockL.setRate(rate)
+        self.cineClockR.setRate(rate)
+        self.cineClockLinked.setRate(rate)
 
-        for timer in self.timers_R.values():
-            timer.setInterval(speed)
+    def playbackRate(self, speed):
+        # slider value 10 plays in real time, 5 at double speed and 20 at half speed
+        return 10 / speed
 
     def togglePlayPauseL(self):
         if not self.checkBox_linkGraphs.isChecked():
@@ -322,13 +616,13 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 if self.isPlayingL:
                     self.isPlayingL = False
                     self.pushButton_L_playPause.setText("Play")
-                    # Pause the timer of the left plot
-                    self.pauseTimer(self.timers_L)
+                    # Pause the cine clock of the plot
+                    self.syncCineClocks()
                 else:
                     self.isPlayingL = True
                     self.pushButton_L_playPause.setText("Pause")
-                    # Start the timer of the left plot
-                    self.startTimer(self.timers_L)
+                    # Start the cine clock of the plot
+                    self.syncCineClocks()
             else:
                 if self.isPlayingL:
                     self.isPlayingL = False
@@ -349,13 +643,13 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 if self.isPlayingR:
                     self.isPlayingR = False
                     self.pushButton_R_playPause.setText("Play")
-                    # Pause the timer of the left plot
-                    self.pauseTimer(self.timers_R)
+                    # Pause the cine clock of the plot
+                    self.syncCineClocks()
                 else:
                     self.isPlayingR = True
                     self.pushButton_R_playPause.setText("Pause")
-                    # Start the timer of the left plot
-                    self.startTimer(self.timers_R)
+                    # Start the cine clock of the plot
+                    self.syncCineClocks()
             else:
                 if self.isPlayingR:
                     self.isPlayingR = False
@@ -378,17 +672,15 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.isPlayingR = False
                 self.pushButton_L_playPause.setText("Play")
                 self.pushButton_R_playPause.setText("Play")
-                # Pause the timer of both plot
-                self.pauseTimer(self.timers_L)
-                self.pauseTimer(self.timers_R)
+                # Pause the cine clock of both plots
+                self.syncCineClocks()
             else:
                 self.isPlayingL = True
                 self.isPlayingR = True
                 self.pushButton_L_playPause.setText("Pause")
                 self.pushButton_R_playPause.setText("Pause")
-                # Start the timer of both plot
-                self.startTimer(self.timers_L)
-                self.startTimer(self.timers_R)
+                # Start the cine clock of both plots
+                self.syncCineClocks()
         # both graphs are rewinding
         elif self.rewindPlotL and self.rewindPlotR:
             if self.isPlayingL:
@@ -416,7 +708,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.pushButton_R_playPause.setText("Play")
                 # Pause timers
                 self.rewindTimerL.stop()
-                self.pauseTimer(self.timers_R)
+                self.syncCineClocks()
             else:
                 self.isPlayingL = True
                 self.isPlayingR = True
@@ -424,7 +716,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.pushButton_R_playPause.setText("Pause")
                 # Start timers
                 self.rewindTimerL.start()
-                self.startTimer(self.timers_R)
+                self.syncCineClocks()
         # only left graph is rewinding
         else:
             if self.isPlayingL:
@@ -433,7 +725,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.pushButton_L_playPause.setText("Play")
                 self.pushButton_R_playPause.setText("Play")
                 # Pause timers
-                self.pauseTimer(self.timers_L)
+                self.syncCineClocks()
                 self.rewindTimerR.stop()
             else:
                 self.isPlayingL = True
@@ -441,38 +733,28 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.pushButton_L_playPause.setText("Pause")
                 self.pushButton_R_playPause.setText("Pause")
                 # Start timers
-                self.startTimer(self.timers_L)
+                self.syncCineClocks()
                 self.rewindTimerR.start()
 
-    def startTimer(self, timersDict):
-        for timer in timersDict.values():
-            timer.start()
-
-    def pauseTimer(self, timersDict):
-        for timer in timersDict.values():
-            timer.stop()
-
     def get_min_max_x_for_widget(self, widget):
+        # combine the cached extents of the played samples, no data is scanned here
         min_x = float('inf')
         max_x = float('-inf')
 
-        for plot in widget.getPlotItem().listDataItems():
-            x_data = plot.xData
-            if x_data is not None:
-                min_x = min(min_x, min(x_data))
-                max_x = max(max_x, max(x_data))
+        for channel in self.channels.of(widget):
+            min_x = min(min_x, channel["range"].minX)
+            max_x = max(max_x, channel["range"].maxX)
 
         return min_x, max_x
     
     def get_min_max_y_for_widget(self, widget):
+        # combine the cached extents of the played samples shifted by each offset, no data is scanned here
         min_y = float('inf')
         max_y = float('-inf')
 
-        for plot in widget.getPlotItem().listDataItems():
-            y_data = plot.yData
-            if y_data is not None:
-                min_y = min(min_y, min(y_data))
-                max_y = max(max_y, max(y_data))
+        for channel in self.channels.of(widget):
+            min_y = min(min_y, channel["range"].minY - channel["offset"])
+            max_y = max(max_y, channel["range"].maxY - channel["offset"])
 
         return min_y, max_y
     
@@ -595,8 +877,10 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         # new_max_x = value + self.plotWidget_L.plotItem.viewRange()[1][1]
         # self.graph1ViewBox.setXRange(int(new_min_x), int(new_max_x))
         ###### method 3 ################
-        selectedSignal = self.comboBox_L_channels.currentText()
-        length = len(self.plotsDataL[selectedSignal][1])
+        channel = self.channels.get(self.comboBox_L_channels.currentData())
+        if channel is None:
+            return
+        length = len(channel["amplitude"])
         min_x, max_x = self.get_min_max_x_for_widget(self.plotWidget_L)
 
         # Set the minimum and maximum values for the vertical scroll bar
@@ -635,8 +919,10 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         # new_max_y = value + self.plotWidget_L.plotItem.viewRange()[1][1]
         # self.graph1ViewBox.setYRange(int(new_min_y), int(new_max_y))
         ########### method 4 ##################
-        selectedSignal = self.comboBox_L_channels.currentText()
-        length = len(self.plotsDataL[selectedSignal][1])
+        channel = self.channels.get(self.comboBox_L_channels.currentData())
+        if channel is None:
+            return
+        length = len(channel["amplitude"])
         min_y, max_y = self.get_min_max_y_for_widget(self.plotWidget_L)
 
         # Set the minimum and maximum values for the vertical scroll bar
@@ -676,8 +962,10 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         # new_max_x = value + self.plotWidget_R.plotItem.viewRange()[1][1]
         # self.graph2ViewBox.setXRange(int(new_min_x), int(new_max_x))
         ###### method 3 ################
-        selectedSignal = self.comboBox_L_channels.currentText()
-        length = len(self.plotsDataR[selectedSignal][1])
+        channel = self.channels.get(self.comboBox_R_channels.currentData())
+        if channel is None:
+            return
+        length = len(channel["amplitude"])
         min_x, max_x = self.get_min_max_x_for_widget(self.plotWidget_R)
 
         # Set the minimum and maximum values for the vertical scroll bar
@@ -716,8 +1004,10 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         # new_max_y = value + self.plotWidget_R.plotItem.viewRange()[1][1]
         # self.graph2ViewBox.setYRange(int(new_min_y), int(new_max_y))
         ###### method 4 ################ 
-        selectedSignal = self.comboBox_R_channels.currentText()
-        length = len(self.plotsDataR[selectedSignal][1])
+        channel = self.channels.get(self.comboBox_R_channels.currentData())
+        if channel is None:
+            return
+        length = len(channel["amplitude"])
         min_y, max_y = self.get_min_max_y_for_widget(self.plotWidget_R)
 
         # Set the minimum and maximum values for the vertical scroll bar
@@ -744,46 +1034,37 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         color = QColorDialog.getColor()
         if color.isValid():
             # Apply the color to the signal associated with the current item in comboBox_L_channels
-            signal_name = self.comboBox_L_channels.currentText()
-            # Assuming self.plots is a dictionary that maps signal names to plot objects
-            plot = self.plotsL[signal_name]
-            plot.setPen(color.name())
+            channel = self.channels.get(self.comboBox_L_channels.currentData())
+            if channel is not None:
+                channel["plot"].setPen(color.name())
 
     def showColorDialog_R(self):
         color = QColorDialog.getColor()
         if color.isValid():
             # Apply the color to the signal associated with the current item in comboBox_R_channels
-            signal_name = self.comboBox_R_channels.currentText()
-            # Assuming self.plots is a dictionary that maps signal names to plot objects
-            plot = self.plotsR[signal_name]
-            plot.setPen(color.name())
+            channel = self.channels.get(self.comboBox_R_channels.currentData())
+            if channel is not None:
+                channel["plot"].setPen(color.name())
 
     def update_legend_and_item_L(self):
         # Get the new label from the QLineEdit
         new_label = self.lineEdit_L_editLabel.text()
 
-        # Get the current signal name from the combo box
-        signal_name = self.comboBox_L_channels.currentText()
+        # Get the current channel from the combo box
+        channel = self.channels.get(self.comboBox_L_channels.currentData())
+        if channel is None:
+            return
 
         # Update the legend
-        plot = self.plotsL[signal_name]
-        self.legend_L.removeItem(signal_name)
-        self.legend_L.addItem(plot, new_label)
+        self.legend_L.removeItem(channel["plot"])
+        self.legend_L.addItem(channel["plot"], new_label)
 
         # Update the combo box item
         index = self.comboBox_L_channels.currentIndex()
         self.comboBox_L_channels.setItemText(index, new_label)
 
-        # Update the signal name in self.plots
-        self.plotsL[new_label] = self.plotsL.pop(signal_name)
-
-        # Update the signal name in self.plotsDataL
-        self.plotsDataL[new_label] = self.plotsDataL.pop(signal_name)
-        matching_key = [key for key, value in self.update_data_dict.items() if value["signal_name"] == signal_name]
-        self.update_data_dict[matching_key[0]]["signal_name"] = new_label
-
-        # Update the signal name in self.timers_L
-        self.timers_L[new_label] = self.timers_L.pop(signal_name)
+        # Update the signal name
+        channel["signal_name"] = new_label
 
         # Clear the QLineEdit
         self.lineEdit_L_editLabel.clear()
@@ -792,29 +1073,21 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
         # Get the new label from the QLineEdit
         new_label = self.lineEdit_R_editLabel.text()
 
-        # Get the current signal name from the combo box
-        signal_name = self.comboBox_R_channels.currentText()
+        # Get the current channel from the combo box
+        channel = self.channels.get(self.comboBox_R_channels.currentData())
+        if channel is None:
+            return
 
         # Update the legend
-        plot = self.plotsR[signal_name]
-        self.legend_R.removeItem(signal_name)
-        self.legend_R.addItem(plot, new_label)
+        self.legend_R.removeItem(channel["plot"])
+        self.legend_R.addItem(channel["plot"], new_label)
 
         # Update the combo box item
         index = self.comboBox_R_channels.currentIndex()
         self.comboBox_R_channels.setItemText(index, new_label)
 
-        # Update the signal name in self.plots
-        self.plotsR[new_label] = self.plotsR.pop(signal_name)
-
-        # Update the signal name in self.plotsDataR
-        self.plotsDataR[new_label] = self.plotsDataR.pop(signal_name)
-
-        matching_key = [key for key, value in self.update_data_dict.items() if value["signal_name"] == signal_name]
-        self.update_data_dict[matching_key[0]]["signal_name"] = new_label
-
-        # Update the signal name in self.timers_R
-        self.timers_R[new_label] = self.timers_R.pop(signal_name)
+        # Update the signal name
+        channel["signal_name"] = new_label
 
         # Clear the QLineEdit
         self.lineEdit_R_editLabel.clear()
@@ -852,102 +1125,66 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
 
     def move_plot_L_to_R(self):
         self.movingLtoR = True
-        # Get the current signal name from comboBox_L_channels
-        signal_name = self.comboBox_L_channels.currentText()
-        if signal_name == '':
+        # Get the current channel from comboBox_L_channels
+        channelId = self.comboBox_L_channels.currentData()
+        if channelId is None:
             self.movingLtoR = False
             return
-        
-        time = self.plotsDataL[signal_name][0]
-        amplitude = self.plotsDataL[signal_name][1]
+        channel = self.channels.get(channelId)
+        plot = channel["plot"]
 
         # Remove the signal from the left plot and legend
-        plot = self.plotsL[signal_name]
-        del self.plotsL[signal_name]
-        del self.plotsDataL[signal_name]
         self.plotWidget_L.removeItem(plot)
-        self.legend_L.removeItem(signal_name)
+        self.legend_L.removeItem(plot)
         self.comboBox_L_channels.removeItem(self.comboBox_L_channels.currentIndex())
-        timer = self.timers_L[signal_name]
-        del self.timers_L[signal_name]
 
         # Add the signal to the right plot and legend
-        self.plotsR[signal_name] = plot
-        self.plotsDataR[signal_name] = [time, amplitude]
         self.plotWidget_R.addItem(plot)
-        self.legend_R.addItem(plot, signal_name)
-        self.comboBox_R_channels.addItem(signal_name)
-        self.timers_R[signal_name] = timer
+        self.legend_R.addItem(plot, channel["signal_name"])
+        self.comboBox_R_channels.addItem(channel["signal_name"], channelId)
 
-        offset = max(self.max_offset_R, len(self.plotsR) * 10)
         self.max_offset_R += 10
-        offset = self.max_offset_R
-        new_amplitude = amplitude - offset
-        plot.setData(time, new_amplitude)
-        matching_key = [key for key, value in self.update_data_dict.items() if value["signal_name"] == signal_name]
-        self.update_data_dict[matching_key[0]]["amplitude"] = new_amplitude
-        self.update_data_dict[matching_key[0]]["plot"] = plot
-        self.update_data_dict[matching_key[0]]["widget"] = self.plotWidget_R
-
-        # handle timer state depending on play/pause state of the move to plot
-        speed = self.horizontalSlider_R_speed.value()
-        timer.setInterval(speed * 10)
-        if self.isPlayingR:
-            timer.start() 
-        else:
-            timer.stop()
+        channel["offset"] = self.max_offset_R
+        self.channels.move(channelId, self.plotWidget_R)
+        self.refill_ring(channel)
+
+        # the moved signal now follows the cine clock of the graph it moved to
+        self.syncCineClocks()
 
     def move_plot_R_to_L(self):
         self.movingRtoL = True
-        # Get the current signal name from comboBox_R_channels
-        signal_name = self.comboBox_R_channels.currentText()
-        if signal_name == '':
+        # Get the current channel from comboBox_R_channels
+        channelId = self.comboBox_R_channels.currentData()
+        if channelId is None:
             self.movingRtoL = False
             return
-        
-        time = self.plotsDataR[signal_name][0]
-        amplitude = self.plotsDataR[signal_name][1]
+        channel = self.channels.get(channelId)
+        plot = channel["plot"]
 
         # Remove the signal from the right plot and legend
-        plot = self.plotsR[signal_name]
-        del self.plotsR[signal_name]
-        del self.plotsDataR[signal_name]
         self.plotWidget_R.removeItem(plot)
-        self.legend_R.removeItem(signal_name)
+        self.legend_R.removeItem(plot)
         self.comboBox_R_channels.removeItem(self.comboBox_R_channels.currentIndex())
-        timer = self.timers_R[signal_name]
-        del self.timers_R[signal_name]
 
         # Add the signal to the left plot and legend
-        self.plotsL[signal_name] = plot
-        self.plotsDataL[signal_name] = [time, amplitude]
         self.plotWidget_L.addItem(plot)
-        self.legend_L.addItem(plot, signal_name)
-        self.comboBox_L_channels.addItem(signal_name)
-        self.timers_L[signal_name] = timer
+        self.legend_L.addItem(plot, channel["signal_name"])
+        self.comboBox_L_channels.addItem(channel["signal_name"], channelId)
 
-        offset = max(self.max_offset_L, len(self.plotsL) * 10)
         self.max_offset_L += 10
-        offset = self.max_offset_L
-        new_amplitude = amplitude - offset
-        plot.setData(time, new_amplitude)
-        matching_key = [key for key, value in self.update_data_dict.items() if value["signal_name"] == signal_name]
-        self.update_data_dict[matching_key[0]]["amplitude"] = new_amplitude
-        self.update_data_dict[matching_key[0]]["plot"] = plot
-        self.update_data_dict[matching_key[0]]["widget"] = self.plotWidget_L
-
-        # handle timer state depending on play/pause state of the move to plot
-        speed = self.horizontalSlider_L_speed.value()
-        timer.setInterval(speed * 10)
-        if self.isPlayingL:
-            timer.start() 
-        else:
-            timer.stop()
+        channel["offset"] = self.max_offset_L
+        self.channels.move(channelId, self.plotWidget_L)
+        self.refill_ring(channel)
+
+        # the moved signal now follows the cine clock of the graph it moved to
+        self.syncCineClocks()
 
     def toggleLinkGraphs(self, state):
         if state == QtCore.Qt.Checked:  # Checkbox is checked
             # self.graph1ViewBox.setXLink(self.graph2ViewBox)
             self.graph1ViewBox.setYLink(self.graph2ViewBox)
+            # the shared clock plays both graphs at one speed
+            self.updateCineSpeedBoth(self.horizontalSlider_L_speed.value())
             if self.isPlayingL and not self.isPlayingR:
                 self.togglePlayPauseR()
             elif not self.isPlayingL and self.isPlayingR:
@@ -958,12 +1195,20 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
             self.graph1ViewBox.setYLink(None)
             self.graph2ViewBox.setXLink(None)
             self.graph2ViewBox.setYLink(None)
+        # hand the running channels over between the shared and the per-graph clocks
+        self.syncCineClocks()
 
 
-    def clearTimers(self, timersDict):
-        for timer in timersDict.values():
-            timer.stop()
-            timer = None
+    def clearChannels(self, widget):
+        # drop the graph's channels from the cine clock
+        for channel in self.channels.of(widget):
+            source = channel["source"]
+            if source is not None:
+                source.close()
+                if source in self.simulators:
+                    self.simulators.pop(source).stop()
+            self.channels.remove(channel["id"])
+        self.syncCineClocks()
 
 
     def stopPlotL(self):
@@ -971,7 +1216,6 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
             # self.removeFromHiddenStateDict(self.plotWidget_L)
             self.plotWidget_L.clear()
             self.legend_L.clear()
-            self.plotsL.clear()
             self.comboBox_L_channels.clear()
             self.pushButton_move_plot_L.setEnabled(True)
             self.isPlayingL = True
@@ -979,8 +1223,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
             self.rewindPlotL = False
             self.rewindTimerL.stop()
             # self.rewindTimerL = None
-            self.PlotsFinishedL.clear()
-            self.clearTimers(self.timers_L)
+            self.clearChannels(self.plotWidget_L)
         else:
             self.stopBothPlots()
 
@@ -989,17 +1232,14 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
             # self.removeFromHiddenStateDict(self.plotWidget_R)
             self.plotWidget_R.clear()
             self.legend_R.clear()
-            self.plotsR.clear()
             self.comboBox_R_channels.clear()
-            self.checkBox_R_Hide.setChecked(False)
             self.pushButton_move_plot_R.setEnabled(True)
             self.isPlayingR = True
             self.pushButton_R_playPause.setText("Pause")
             self.rewindPlotR = False
             self.rewindTimerR.stop()
             # self.rewindTimerR = None
-            self.PlotsFinishedR.clear()
-            self.clearTimers(self.timers_R)
+            self.clearChannels(self.plotWidget_R)
         else:
             self.stopBothPlots()
 
@@ -1009,24 +1249,18 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 # stop and reset graph 2
                 self.plotWidget_R.clear()
                 self.legend_R.clear()
-                self.plotsR.clear()
-                self.plotsDataR.clear()
                 self.comboBox_R_channels.clear()
-                self.checkBox_R_Hide.setChecked(False)
                 self.pushButton_move_plot_R.setEnabled(True)
                 self.isPlayingR = True
                 self.pushButton_R_playPause.setText("Pause")
                 self.rewindPlotR = False
                 self.rewindTimerR.stop()
                 # self.rewindTimerR = None
-                self.PlotsFinishedR.clear()
-                self.clearTimers(self.timers_R)
+                self.clearChannels(self.plotWidget_R)
                 self.pushButton_R_stop.setEnabled(False)
                 # stop and reset graph 1
                 self.plotWidget_L.clear()
                 self.legend_L.clear()
-                self.plotsL.clear()
-                self.plotsDataL.clear()
                 self.comboBox_L_channels.clear()
                 self.pushButton_move_plot_L.setEnabled(True)
                 self.isPlayingL = True
@@ -1034,8 +1268,7 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 self.rewindPlotL = False
                 self.rewindTimerL.stop()
                 # self.rewindTimerL = None
-                self.PlotsFinishedL.clear()
-                self.clearTimers(self.timers_L)
+                self.clearChannels(self.plotWidget_L)
                 self.pushButton_L_stop.setEnabled(False)
             else:
                 # Create a QMessageBox and display the critical error dialog
@@ -1046,155 +1279,88 @@ class MainApp(QtWidgets.QMainWindow, newui.Ui_MainWindow):
                 msg_box.exec_()
     
     
+    def warm_up_imports(self):
+        # ReportLab alone takes longer to import than the rest of the window, so reporting is imported
+        # on first use and loaded here in the background once the window is up, ready for the first export
+        threading.Thread(target=lambda: [importlib.import_module(name) for name in WARM_UP_MODULES], daemon=True).start()
+
     def export_to_pdf(self):
+        # the statistics are taken now, the document is laid out and written in the background
+        from Report import ReportWorker
         self.pdf_count += 1
-        doc = SimpleDocTemplate(f"BioSignal Report{self.pdf_count}.pdf",
-                                pagesize=letter,
-                                topMargin=0.5 * inch,
-                                bottomMargin=0.5 * inch,
-                                leftMargin=0.5 * inch,
-                                rightMargin=0.5 * inch
-                                )
-        pdf_elements = []
-        # Add title
-        self.add_title_to_pdf(pdf_elements)
-        for snapshot in self.snapshot_images_lst:
-            pdf_elements.append(Image(snapshot))
-            pdf_elements.append(Spacer(1, 25))
-            self.pdf_table(pdf_elements, snapshot)
-            pdf_elements.append(PageBreak())
-
-        doc.build(pdf_elements)
-        self.snapshot_images_lst = []
+        fileName = f"BioSignal Report{self.pdf_count}.pdf"
+        pages = [(snapshot.figure(), self.calc_statistics(snapshot)) for snapshot in self.snapshots]
+        worker = ReportWorker(fileName, pages)
+        worker.done.connect(lambda name: self.statusbar.showMessage(f"Report saved to {name}", 5000))
+        worker.failed.connect(self.show_report_error)
+        worker.finished.connect(lambda: self.reportWorkers.remove(worker))
+        self.reportWorkers.append(worker)
+        self.statusbar.showMessage(f"Building {fileName}...")
+        worker.start()
+        self.snapshots = []
+
+    def show_report_error(self, message):
+        msg_box = QtWidgets.QMessageBox()
+        msg_box.setIcon(QtWidgets.QMessageBox.Critical)
+        msg_box.setWindowTitle("Error")
+        msg_box.setText(f"Could not write the report: {message}")
+        msg_box.exec_()
 
     def take_snapshot_R(self):
-        # capture the widget as an image
-        pixmap = QPixmap(self.plotWidget_R.size())
-        painter = QPainter(pixmap)
-        self.plotWidget_R.render(painter)
-        painter.end()
-        # Generate a unique filename for the snapshot image
-        img_filename = f"snapshot_R{len(self.snapshot_images_lst)}.png"
-        # Save the pixmap as an image file
-        pixmap.save(img_filename, "PNG")
-        # Add the image path to the list of snapshots
-        self.snapshot_images_lst.append(img_filename)
+        self.take_snapshot(self.plotWidget_R)
 
     def take_snapshot_L(self):
-        # capture the widget as an image
-        pixmap = QPixmap(self.plotWidget_L.size())
-        painter = QPainter(pixmap)
-        self.plotWidget_L.render(painter)
-        painter.end()
-        # Generate a unique filename for the snapshot image
-        img_filename = f"snapshot_L{len(self.snapshot_images_lst)}.png"
-        # Save the pixmap as an image file
-        pixmap.save(img_filename, "PNG")
-        # Add the image path to the list of snapshots
-        self.snapshot_images_lst.append(img_filename)
-
-    def add_title_to_pdf(self, elements):
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Heading1'],
-            fontSize=24,
-            fontName='Helvetica-Bold',
-            alignment=1,
-        )
-        # Add logos and title to the elements
-        logo1 = Image(
-            os.path.abspath(r'Eng logo1.png'),
-            width=1.5 * inch, height=1 * inch)
-        logo2 = Image(
-            os.path.abspath(r'SBME logo.png'),
-            width=1.5 * inch, height=1 * inch)
-        title = Paragraph("Patient Biosignals Analysis and Statistical Summary", title_style)
-
-        table_data = [[logo1, title, logo2]]
-        col_widths = [1.5 * inch, 4.5 * inch, 1.5 * inch]
-        row_heights = [1 * inch]  # Adjust the row height as needed to center vertically
-        table_style = [('VALIGN', (0, 0), (-1, -1), 'MIDDLE')]  # Center all cells vertically
-
-        table = Table(table_data, colWidths=col_widths, rowHeights=row_heights, style=table_style)
-
-        elements.append(table)
-        # elements.append(title)
-        elements.append(Spacer(1, 50))
-
-    def calc_statistics(self, img_filename):
-        heading = ['']
-        means = ["Mean"]
-        stds = ["Standard Deviation"]
-        maxs = ["Max"]
-        mins = ["Min"]
-        durations = ["Duration"]
-
-        if 'R' in img_filename:
-            for key in self.plotsDataR.keys():
-                heading.append(key)
-            for data in self.plotsDataR.values():
-                means.append(round(statistics.mean(data[1]), 3))
-                stds.append(round(statistics.stdev(data[1]), 3))
-                maxs.append(round(max(data[1]), 3))
-                mins.append(round(min(data[1]), 3))
-                durations.append(round(max(data[0]), 3))
-        else:
-            for key in self.plotsDataL.keys():
-                heading.append(key)
-            for data in self.plotsDataL.values():
-                means.append(round(statistics.mean(data[1]), 3))
-                stds.append(round(statistics.stdev(data[1]), 3))
-                maxs.append(round(max(data[1]), 3))
-                mins.append(round(min(data[1]), 3))
-                durations.append(round(max(data[0]), 3))
-
-        table_data = [heading, means, stds, maxs, mins, durations]
-        return table_data
-
-    def pdf_table(self, elements, file_name):
-        table_data = self.calc_statistics(file_name)
-        # Calculate the width of each column based on the page width and the number of columns
-        page_width, _ = letter  # Get the width of the page
-        left_right_margins = 2.5 * inch
-        table_width = page_width - (3 * left_right_margins)
-        num_cols = len(table_data[0])
-        num_rows = len(table_data)
-        # table_width = num_cols
-        # column_width = table_width / num_cols
-        if num_cols <= 6:
-            column_width = [130] + [80] * (num_cols - 1)
-        elif num_cols <= 9:
-            column_width = [130] + [60] * (num_cols - 1)
+        self.take_snapshot(self.plotWidget_L)
+
+    def take_snapshot(self, widget):
+        # keep the graph in memory with the channels and the time range it shows, either as
+        # the traces themselves for a vector plot or as a screenshot of the widget
+        # the names and played samples are kept as they are now, the statistics are taken at export time
+        channels = [(channel, channel["signal_name"], channel["indexTrack"]) for channel in self.channels.of(widget)]
+        view_x, view_y = widget.getViewBox().viewRange()
+        if REPORT_VECTOR_PLOTS:
+            traces = [self.snapshot_trace(channel, view_x) for channel in self.channels.of(widget)]
+            self.snapshots.append(Snapshot.trace(widget, channels, tuple(view_x), tuple(view_y), traces))
         else:
-            table_data[2][0] = 'STD'
-            table_data[0][1:] = [str(sig_count) for sig_count in range(len(table_data[0]))]
-            column_width = [60] + [50] * (num_cols - 1)
-
-        table = Table(table_data, colWidths=column_width, rowHeights=[30] * num_rows)
-        # table = Table(table_data, colWidths=[150] * num_cols, rowHeights=[30] * num_rows)
-
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 14),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold')
-        ]))
-        elements.append(table)
-        # return table
-    
-    
+            self.snapshots.append(Snapshot.capture(widget, channels, tuple(view_x)))
+
+    def snapshot_trace(self, channel, view):
+        # the played samples in view, decimated to the report's resolution as the graph draws them
+        played = channel["time"][:channel["indexTrack"]]
+        start = max(0, int(np.searchsorted(played, view[0])) - 1)
+        stop = min(len(played), int(np.searchsorted(played, view[1], side='right')) + 1)
+        x, y = channel["pyramid"].query(start, stop, REPORT_TRACE_BINS)
+        return {
+            "name": channel["signal_name"],
+            "color": pg.mkPen(channel["plot"].opts["pen"]).color().name(),
+            "x": np.array(x, dtype=np.float64),
+            "y": np.array(y, dtype=np.float64) - channel["offset"]
+        }
+
+    def calc_statistics(self, snapshot):
+        # statistics of the samples the snapshot shows: played when it was taken and inside its
+        # visible time range, under the names the channels had then; closed channels are still summarized
+        from Stats import PrefixSums, channel_statistics, statistics_table
+        min_x, max_x = snapshot.view
+        names = []
+        results = []
+        for channel, name, count in snapshot.channels:
+            if "prefix" not in channel:
+                channel["prefix"] = PrefixSums()
+            # only the played samples can be in a snapshot, so the sums never reach into the rest of a
+            # memory-mapped recording; they grow with playback from where the last export left them
+            channel["prefix"].update(channel["amplitude"][:count])
+            played = channel["time"][:count]
+            start = int(np.searchsorted(played, min_x))
+            stop = int(np.searchsorted(played, max_x, side='right'))
+            names.append(name)
+            results.append(channel_statistics(channel["time"], channel["amplitude"], start, stop, channel["prefix"]))
+        return statistics_table(names, results)
 
 
-
-
-    
-
 if __name__ == "__main__":
+    # ICU_METRICS_PORT / ICU_METRICS_FILE turn on the metrics export, see Metrics.py
+    Metrics.export_from_environment()
     app = QtWidgets.QApplication(sys.argv)
     window = MainApp()
     window.show()
@@ -0,0 +1,199 @@
+import os
+import sys
+import threading
+from bisect import bisect_left
+
+# Prometheus text-format metrics of the viewer, for watching a fleet of workstations.
+# Export is chosen by environment variables when the application starts:
+#   ICU_METRICS_PORT=9464          serve http://127.0.0.1:9464/metrics (ICU_METRICS_ADDRESS to change the address)
+#   ICU_METRICS_FILE=viewer.prom   rewrite the file every ICU_METRICS_INTERVAL seconds (default 15),
+#                                  e.g. for node_exporter's textfile collector
+# Recording only adds to counters that exist from the start, rendering happens on the export thread.
+
+METRICS = []  # every metric, in the order they are rendered
+
+
+class Counter:
+    def __init__(self, name, help, labels=None):
+        self.name = name
+        self.help = help
+        self.labels = labels or {}
+        self.value = 0.0
+        self.lock = threading.Lock()
+        METRICS.append(self)
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+    def samples(self):
+        return [(self.name, self.labels, self.value)]
+
+
+class Gauge:
+    def __init__(self, name, help, read, labels=None):
+        # read() is called when the metrics are rendered, None leaves the gauge out
+        self.name = name
+        self.help = help
+        self.labels = labels or {}
+        self.read = read
+        METRICS.append(self)
+
+    def samples(self):
+        value = self.read()
+        return [] if value is None else [(self.name, self.labels, value)]
+
+
+class Histogram:
+    def __init__(self, name, help, buckets, labels=None):
+        # bucket counts are allocated once, observe() only finds the bucket and adds to it
+        self.name = name
+        self.help = help
+        self.labels = labels or {}
+        self.bounds = list(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.lock = threading.Lock()
+        METRICS.append(self)
+
+    def observe(self, value):
+        i = bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[i] += 1
+            self.sum += value
+
+    def samples(self):
+        with self.lock:
+            counts = list(self.counts)
+            total = self.sum
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + [float("inf")], counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            samples.append((self.name + "_bucket", dict(self.labels, le=le), cumulative))
+        samples.append((self.name + "_sum", self.labels, total))
+        samples.append((self.name + "_count", self.labels, cumulative))
+        return samples
+
+
+def render():
+    # the text exposition format, HELP and TYPE once per metric name
+    lines = []
+    described = set()
+    for metric in METRICS:
+        if metric.name not in described:
+            described.add(metric.name)
+            kind = {Counter: "counter", Gauge: "gauge", Histogram: "histogram"}[type(metric)]
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {kind}")
+        for name, labels, value in metric.samples():
+            if labels:
+                text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+                name = f"{name}{{{text}}}"
+            lines.append(f"{name} {float(value)!r}")
+    return "\n".join(lines) + "\n"
+
+
+def resident_memory_bytes():
+    # from /proc where there is one, otherwise the peak the OS reports
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# what the viewer records, labelled by graph where the two graphs are measured separately
+TICK_JITTER = {
+    graph: Histogram("icu_viewer_tick_jitter_seconds",
+                     "Deviation of the cine clock's tick interval from its nominal interval.",
+                     (0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.032, 0.064, 0.128, 0.256, 0.5, 1.0),
+                     {"graph": graph})
+    for graph in ("1", "2", "linked")
+}
+UPDATE_DURATION = {
+    graph: Histogram("icu_viewer_update_plot_data_seconds",
+                     "Time spent in update_plot_data for all channels of a graph in one cine tick.",
+                     (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+                     {"graph": graph})
+    for graph in ("1", "2")
+}
+FRAMES = {graph: Counter("icu_viewer_frames_total", "Display frames drawn.", {"graph": graph}) for graph in ("1", "2")}
+DROPPED_FRAMES = {graph: Counter("icu_viewer_dropped_frames_total", "Display frames missed while playing.",
+                                 {"graph": graph}) for graph in ("1", "2")}
+SAMPLES = {graph: Counter("icu_viewer_samples_total", "Samples advanced by the cine clock.",
+                          {"graph": graph}) for graph in ("1", "2")}
+LOAD_DURATION = {
+    result: Histogram("icu_viewer_load_seconds",
+                      "Time to read a signal file, from the parsed-signal cache or by parsing it.",
+                      (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+                      {"result": result})
+    for result in ("cached", "parsed")
+}
+REPORT_DURATION = Histogram("icu_viewer_report_build_seconds", "Time to build and write a PDF report.",
+                            (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+REPORT_FAILURES = Counter("icu_viewer_report_failures_total", "PDF reports that could not be written.")
+Gauge("icu_viewer_resident_memory_bytes", "Resident memory of the viewer process.", resident_memory_bytes)
+
+
+def metrics_handler():
+    # http.server pulls in ssl, email and http.client, so it is only imported once serving is asked for
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # scrapes are not worth a line on the console
+
+    return MetricsHandler
+
+
+def serve(port, address="127.0.0.1"):
+    from http.server import ThreadingHTTPServer
+    server = ThreadingHTTPServer((address, port), metrics_handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_periodically(fileName, interval):
+    # written next to the target and renamed over it, so a collector never reads half a file
+    def write():
+        while not stop.is_set():
+            temporary = fileName + ".tmp"
+            try:
+                with open(temporary, "w") as file:
+                    file.write(render())
+                os.replace(temporary, fileName)
+            except OSError:
+                pass  # e.g. the directory is not mounted yet, tried again next time
+            stop.wait(interval)
+    stop = threading.Event()
+    threading.Thread(target=write, daemon=True).start()
+    return stop
+
+
+def export_from_environment():
+    port = os.environ.get("ICU_METRICS_PORT")
+    fileName = os.environ.get("ICU_METRICS_FILE")
+    if port:
+        serve(int(port), os.environ.get("ICU_METRICS_ADDRESS", "127.0.0.1"))
+    if fileName:
+        write_periodically(fileName, float(os.environ.get("ICU_METRICS_INTERVAL", "15")))
@@ -0,0 +1,192 @@
+import io
+import os
+import threading
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from PyQt5 import QtCore
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab import rl_config
+from reportlab.graphics.shapes import Drawing, Rect, Line, PolyLine, String
+from Metrics import REPORT_DURATION, REPORT_FAILURES
+
+
+reportPool = None
+reportPoolLock = threading.Lock()  # report_pool() is called from every ReportWorker's thread
+PLOT_MAX_HEIGHT = 3.5 * inch  # a plot, the spacer and the statistics table fit on a page, even below the title
+
+
+def report_pool():
+    # ReportLab is pure Python, laid out in a thread it would hold the GIL away from the cine clocks,
+    # so documents are built in separate processes, started once and reused for later exports
+    global reportPool
+    with reportPoolLock:
+        if reportPool is None:
+            reportPool = ProcessPoolExecutor(max(1, min(4, os.cpu_count() or 1)), mp_context=multiprocessing.get_context('spawn'))
+        return reportPool
+
+
+class ReportWorker(QtCore.QThread):
+    done = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, fileName, pages):
+        # hands one PDF report to the report processes and waits for it, pages are (snapshot figure,
+        # statistics table) pairs captured when the export was requested, so playback goes on meanwhile
+        super().__init__()
+        self.fileName = fileName
+        self.pages = pages
+
+    def run(self):
+        started = perf_counter()
+        try:
+            report_pool().submit(build_report, self.fileName, self.pages).result()
+        except Exception as error:
+            # ReportLab reports layout problems with its own exception types
+            REPORT_FAILURES.inc()
+            self.failed.emit(f"{self.fileName}: {error}")
+            return
+        REPORT_DURATION.observe(perf_counter() - started)
+        self.done.emit(self.fileName)
+
+
+def build_report(fileName, pages):
+    # the traces are many short path operators, stored deflated but not ASCII85 encoded on top
+    rl_config.useA85 = 0
+    doc = SimpleDocTemplate(fileName,
+                            pagesize=letter,
+                            topMargin=0.5 * inch,
+                            bottomMargin=0.5 * inch,
+                            leftMargin=0.5 * inch,
+                            rightMargin=0.5 * inch,
+                            pageCompression=1
+                            )
+    pdf_elements = []
+    # Add title
+    add_title_to_pdf(pdf_elements)
+    for figure, table_data in pages:
+        if "traces" in figure:
+            pdf_elements.append(plot_drawing(figure))
+        else:
+            image = Image(io.BytesIO(figure["image"]))
+            image._restrictSize(7.5 * inch, PLOT_MAX_HEIGHT)
+            pdf_elements.append(image)
+        pdf_elements.append(Spacer(1, 25))
+        pdf_table(pdf_elements, table_data)
+        pdf_elements.append(PageBreak())
+    doc.build(pdf_elements)
+
+
+def plot_drawing(figure, width=7.5 * inch, ticks=5):
+    # the snapshot's traces as vector paths, scaled to the page width with the graph's aspect ratio,
+    # the points were decimated to about two per point of this width when the snapshot was taken
+    graph_width, graph_height = figure["size"]
+    height = width * graph_height / max(1, graph_width)
+    if height > PLOT_MAX_HEIGHT:
+        # a tall graph is narrowed rather than pushing its table onto the next page
+        width *= PLOT_MAX_HEIGHT / height
+        height = PLOT_MAX_HEIGHT
+    left, bottom = 40, 20  # room for the axis labels
+    plot_width = width - left
+    plot_height = height - bottom
+    (min_x, max_x), (min_y, max_y) = figure["view"], figure["yRange"]
+    scale_x = plot_width / ((max_x - min_x) or 1)
+    scale_y = plot_height / ((max_y - min_y) or 1)
+
+    drawing = Drawing(width, height)
+    drawing.hAlign = 'CENTER'
+    drawing.add(Rect(left, bottom, plot_width, plot_height, fillColor=colors.HexColor(figure["background"]),
+                     strokeColor=colors.black, strokeWidth=0.5))
+    for trace in figure["traces"]:
+        if len(trace["x"]) < 2:
+            continue
+        # PDF paths are not clipped to the frame, so samples outside the view are pinned to its edges
+        x = left + (np.clip(trace["x"], min_x, max_x) - min_x) * scale_x
+        y = bottom + (np.clip(trace["y"], min_y, max_y) - min_y) * scale_y
+        points = np.column_stack((x, y)).ravel().round(1).tolist()
+        drawing.add(PolyLine(points, strokeColor=colors.HexColor(trace["color"]), strokeWidth=0.6))
+
+    for k in range(ticks):
+        # time ticks under the plot, amplitude ticks on its left
+        value = min_x + (max_x - min_x) * k / (ticks - 1)
+        x = left + plot_width * k / (ticks - 1)
+        drawing.add(Line(x, bottom, x, bottom - 3, strokeWidth=0.5))
+        drawing.add(String(x, bottom - 12, f"{value:.2f}", fontName='Helvetica', fontSize=7, textAnchor='middle'))
+        value = min_y + (max_y - min_y) * k / (ticks - 1)
+        y = bottom + plot_height * k / (ticks - 1)
+        drawing.add(Line(left, y, left - 3, y, strokeWidth=0.5))
+        drawing.add(String(left - 5, y - 2, f"{value:.2f}", fontName='Helvetica', fontSize=7, textAnchor='end'))
+
+    # channel names in their trace colors along the top of the plot
+    x = left + 5
+    for trace in figure["traces"]:
+        drawing.add(String(x, height - 10, trace["name"], fontName='Helvetica', fontSize=7,
+                           fillColor=colors.HexColor(trace["color"])))
+        x += 6 + 4 * len(trace["name"])
+    return drawing
+
+
+def add_title_to_pdf(elements):
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'Title',
+        parent=styles['Heading1'],
+        fontSize=24,
+        fontName='Helvetica-Bold',
+        alignment=1,
+    )
+    # Add logos and title to the elements
+    logo1 = Image(
+        os.path.abspath(r'Eng logo1.png'),
+        width=1.5 * inch, height=1 * inch)
+    logo2 = Image(
+        os.path.abspath(r'SBME logo.png'),
+        width=1.5 * inch, height=1 * inch)
+    title = Paragraph("Patient Biosignals Analysis and Statistical Summary", title_style)
+
+    table_data = [[logo1, title, logo2]]
+    col_widths = [1.5 * inch, 4.5 * inch, 1.5 * inch]
+    row_heights = [1 * inch]  # Adjust the row height as needed to center vertically
+    table_style = [('VALIGN', (0, 0), (-1, -1), 'MIDDLE')]  # Center all cells vertically
+
+    table = Table(table_data, colWidths=col_widths, rowHeights=row_heights, style=table_style)
+
+    elements.append(table)
+    elements.append(Spacer(1, 50))
+
+
+def pdf_table(elements, table_data):
+    # work on a copy, the rows belong to the export request
+    table_data = [list(row) for row in table_data]
+    num_cols = len(table_data[0])
+    num_rows = len(table_data)
+    if num_cols <= 6:
+        column_width = [130] + [80] * (num_cols - 1)
+    elif num_cols <= 9:
+        column_width = [130] + [60] * (num_cols - 1)
+    else:
+        table_data[2][0] = 'STD'
+        table_data[0][1:] = [str(sig_count) for sig_count in range(1, num_cols)]
+        column_width = [60] + [50] * (num_cols - 1)
+
+    # the heading row keeps the original size, the figure rows are tighter so ten of them fit under the plot,
+    # and should the table still be split the channel names are repeated on the next page
+    table = Table(table_data, colWidths=column_width, rowHeights=[30] + [20] * (num_rows - 1), repeatRows=1)
+
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold')
+    ]))
+    elements.append(table)
@@ -0,0 +1,245 @@
+import os
+import abc
+import socket
+import threading
+import socketserver
+from io import BytesIO
+from time import perf_counter, sleep
+import numpy as np
+from PyQt5 import QtCore
+from Classes import GrowableArray, SignalCache, SignalTextReader, parse_lines, read_signal_file, estimate_sample_rate
+
+
+class SignalSource(abc.ABC):
+    # anything a live channel can be fed from: read_available() takes in whatever arrived since the last
+    # call and returns how many samples that was, poll() does so on a timer and reports to on_data
+    def __init__(self, interval=250, on_data=None):
+        self.time = GrowableArray()
+        self.amplitude = GrowableArray()
+        self.on_data = on_data
+        self.delimiter = '\t'
+        self.columns = (0, 1)
+        self.rest = b''
+        self.skippedLines = 0  # lines that could not be parsed, e.g. a resent header or an empty field
+        self.timer = QtCore.QTimer()
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.poll)
+
+    @abc.abstractmethod
+    def read_available(self):
+        pass
+
+    def samples(self):
+        return self.time.view(), self.amplitude.view()
+
+    def poll(self):
+        count = self.read_available()
+        if count and self.on_data is not None:
+            self.on_data(count)
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def close(self):
+        self.stop()
+
+    def append_lines(self, block):
+        # a line that is still being written waits for the next block
+        block = self.rest + block
+        cut = block.rfind(b'\n') + 1
+        self.rest = block[cut:]
+        if not cut:
+            return 0
+        try:
+            time, amplitude = parse_lines(block[:cut], self.delimiter, self.columns)
+        except ValueError:
+            time, amplitude = self.parse_each_line(block[:cut])
+        self.time.extend(time)
+        self.amplitude.extend(amplitude)
+        return len(time)
+
+
+    def parse_each_line(self, block):
+        # slow path for a block with a bad line in it: the good lines are kept, the others counted
+        delimiter = self.delimiter.encode() if self.delimiter else None
+        time = []
+        amplitude = []
+        for line in block.splitlines():
+            if not line.strip():
+                continue
+            fields = line.split(delimiter)
+            try:
+                values = float(fields[self.columns[0]]), float(fields[self.columns[1]])
+            except (ValueError, IndexError):
+                self.skippedLines += 1
+                continue
+            time.append(values[0])
+            amplitude.append(values[1])
+        return np.array(time, dtype=np.float64), np.array(amplitude, dtype=np.float64)
+
+
+class TailSource(SignalSource):
+    # a text recording that a monitor keeps appending to, every read takes only the bytes added since
+    def __init__(self, fileName, interval=250, on_data=None):
+        super().__init__(interval, on_data)
+        self.reader = SignalTextReader(fileName)
+        self.fileName = fileName
+        self.delimiter = self.reader.delimiter
+        self.columns = self.reader.columns
+        self.position = self.reader.headerBytes
+
+    def catch_up(self, cache, progress=None):
+        # called once on the loader's thread before the source is started: what the file holds so far
+        # is read through the parsed-signal cache up to its last complete line, polling goes on from there
+        self.position = max(self.reader.headerBytes, self.last_line_end())
+        time, amplitude = read_signal_file(self.fileName, cache, progress, self.position)
+        # the mapped entry is copied to the heap only once samples are appended to it
+        self.time = GrowableArray.wrap(time)
+        self.amplitude = GrowableArray.wrap(amplitude)
+        return time, amplitude
+
+    def last_line_end(self):
+        # the offset just past the file's last newline, searched backwards one chunk at a time
+        with open(self.fileName, 'rb') as file:
+            end = file.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - self.reader.chunkBytes)
+                file.seek(start)
+                newline = file.read(end - start).rfind(b'\n')
+                if newline >= 0:
+                    return start + newline + 1
+                end = start
+        return 0
+
+    def read_available(self):
+        try:
+            size = os.path.getsize(self.fileName)
+        except OSError:
+            size = -1
+        if size < self.position:
+            # removed or truncated, the recorder started over, so what was followed is kept as it is
+            self.stop()
+            return 0
+        count = 0
+        with open(self.fileName, 'rb') as file:
+            file.seek(self.position)
+            while True:
+                block = file.read(self.reader.chunkBytes)
+                if not block:
+                    break
+                self.position += len(block)
+                count += self.append_lines(block)
+        return count
+
+
+class SocketSource(SignalSource):
+    # tab separated "time<TAB>amplitude" lines streamed over TCP, e.g. by SignalSimulator
+    def __init__(self, host, port, interval=50, on_data=None):
+        super().__init__(interval, on_data)
+        self.socket = socket.create_connection((host, port), timeout=2)
+        self.socket.setblocking(False)
+
+    def read_available(self):
+        count = 0
+        while True:
+            try:
+                block = self.socket.recv(1 << 16)
+            except BlockingIOError:
+                break
+            except OSError:
+                block = b''
+            if not block:
+                # the device hung up, keep what was received
+                self.close()
+                break
+            count += self.append_lines(block)
+        return count
+
+    def close(self):
+        self.stop()
+        self.socket.close()
+
+
+class SignalSimulator:
+    def __init__(self, time, amplitude, port=0, speed=1.0, loop=True, interval=0.02):
+        # a local bedside device: replays a recording to every client that connects, at the pace of
+        # its Time column times speed, looping with continuing timestamps so load tests can run for long
+        self.time = np.asarray(time)
+        self.amplitude = np.asarray(amplitude)
+        self.speed = speed
+        self.loop = loop
+        self.interval = interval
+        self.server = socketserver.ThreadingTCPServer(('127.0.0.1', port), SimulatorHandler, bind_and_activate=False)
+        self.server.daemon_threads = True
+        self.server.allow_reuse_address = True
+        self.server.server_bind()
+        self.server.server_activate()
+        self.server.simulator = self
+        self.address = self.server.server_address
+        self.thread = None
+        self.running = True
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        # also ends the streams of clients that are still connected; shutdown() waits for the server's
+        # next poll, up to half a second, so it is left to a thread instead of blocking the caller
+        self.running = False
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stream(self, send):
+        # send() gets blocks of lines, it raises OSError once the client is gone
+        n = len(self.time)
+        if n == 0:
+            return
+        relative = self.time - self.time[0]
+        duration = relative[-1] + 1 / estimate_sample_rate(self.time)
+        start = perf_counter()
+        sent = 0
+        rounds = 0
+        while self.running:
+            elapsed = (perf_counter() - start) * self.speed - rounds * duration
+            due = int(np.searchsorted(relative, elapsed, side='right'))
+            if due > sent:
+                block = BytesIO()
+                lines = np.column_stack((self.time[sent:due] + rounds * duration, self.amplitude[sent:due]))
+                np.savetxt(block, lines, fmt='%.9g', delimiter='\t')
+                send(block.getvalue())
+                sent = due
+            if sent == n:
+                if not self.loop:
+                    return
+                rounds += 1
+                sent = 0
+            sleep(self.interval)
+
+
+class SimulatorHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            self.server.simulator.stream(self.request.sendall)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    # python Sources.py Signals/csv/ecg_normal.csv --port 5555 --speed 4
+    import argparse
+    parser = argparse.ArgumentParser(description="Replay a recording as a simulated live device over TCP.")
+    parser.add_argument("file")
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--once", action="store_true", help="stop after one pass instead of looping")
+    args = parser.parse_args()
+    simulator = SignalSimulator(*read_signal_file(args.file, SignalCache()), args.port, args.speed, not args.once)
+    print(f"Streaming {args.file} on {simulator.address[0]}:{simulator.address[1]}")
+    simulator.server.serve_forever()
@@ -0,0 +1,91 @@
+import numpy as np
+from Classes import GrowableArray
+
+PERCENTILES = (5, 50, 95)
+
+# report rows in order, label and key into the dict returned by channel_statistics
+REPORT_ROWS = [
+    ("Mean", "mean"),
+    ("Standard Deviation", "std"),
+    ("Max", "max"),
+    ("Min", "min"),
+    ("Duration", "duration"),
+    ("RMS", "rms"),
+    ("Peak-to-Peak", "peakToPeak"),
+    ("5th Percentile", "p5"),
+    ("Median", "p50"),
+    ("95th Percentile", "p95"),
+]
+
+
+class PrefixSums:
+    def __init__(self):
+        # running sums of the samples and of their squares, so the mean, std and RMS of any
+        # window [start, stop) are O(1); taken relative to the first sample to limit cancellation
+        self.sums = GrowableArray()
+        self.squares = GrowableArray()
+        self.sums.extend([0.0])
+        self.squares.extend([0.0])
+        self.reference = None
+
+    def update(self, amplitude):
+        # only samples appended since the last update are summed, so live channels stay O(new)
+        known = self.sums.size - 1
+        if len(amplitude) <= known:
+            return
+        if self.reference is None:
+            self.reference = float(amplitude[0])
+        centered = np.asarray(amplitude[known:], dtype=np.float64) - self.reference
+        self.sums.extend(self.sums.data[known] + np.cumsum(centered))
+        self.squares.extend(self.squares.data[known] + np.cumsum(centered * centered))
+
+    def moments(self, start, stop):
+        # mean, sample standard deviation (ddof=1) and RMS of the samples [start, stop)
+        n = stop - start
+        s1 = self.sums.data[stop] - self.sums.data[start]
+        s2 = self.squares.data[stop] - self.squares.data[start]
+        mean = self.reference + s1 / n
+        std = np.sqrt(max(0.0, s2 - s1 * s1 / n) / (n - 1)) if n > 1 else np.nan
+        rms = np.sqrt(max(0.0, s2 + 2 * self.reference * s1 + n * self.reference ** 2) / n)
+        return float(mean), float(std), float(rms)
+
+
+def channel_statistics(time, amplitude, start=0, stop=None, prefix=None):
+    # the report's figures for the samples [start, stop), every one a numpy reduction; with prefix
+    # sums the mean, std and RMS cost O(1), only min, max and percentiles look at the window
+    stop = len(amplitude) if stop is None else stop
+    n = stop - start
+    if n <= 0:
+        return {key: np.nan for _, key in REPORT_ROWS}
+    window = np.asarray(amplitude[start:stop])
+    if prefix is not None:
+        mean, std, rms = prefix.moments(start, stop)
+    else:
+        # the sum of squares is taken around the mean so the std stays accurate for large offsets
+        mean = float(np.mean(window))
+        centered = window - mean
+        std = float(np.sqrt(np.dot(centered, centered) / (n - 1))) if n > 1 else np.nan
+        rms = float(np.sqrt(np.dot(window, window) / n))
+    low = float(np.min(window))
+    high = float(np.max(window))
+    p5, p50, p95 = np.percentile(window, PERCENTILES)
+    return {
+        "mean": mean,
+        "std": std,
+        "max": high,
+        "min": low,
+        "duration": float(time[stop - 1] - time[start]),
+        "rms": rms,
+        "peakToPeak": high - low,
+        "p5": float(p5),
+        "p50": float(p50),
+        "p95": float(p95),
+    }
+
+
+def statistics_table(names, results, digits=3):
+    # the report table: a heading row of channel names, then one row per figure
+    table = [[''] + list(names)]
+    for label, key in REPORT_ROWS:
+        table.append([label] + [round(result[key], digits) for result in results])
+    return table
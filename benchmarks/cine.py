@@ -0,0 +1,232 @@
+import os
+import sys
+import glob
+import json
+import time
+import socket
+import argparse
+import platform
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+START_DIR = os.getcwd()
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # the window loads its logos and icons relative to the repository
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtWidgets, QtCore
+import Main
+from Classes import SignalCache, read_signal_file, prepare_signal
+from Metrics import resident_memory_bytes
+
+SCENARIOS = ("play", "scroll", "zoom", "rewind")
+PERCENTILES = (50, 90, 99)
+
+
+class BenchApp(Main.MainApp):
+    # the viewer with its per-frame work timed, the timers and signals call these overrides
+    log = None
+
+    def __init__(self):
+        super().__init__()
+        self.log = {"render": [], "tick": [], "static": []}
+
+    def render_frame(self):
+        start = time.perf_counter()
+        super().render_frame()
+        if self.log is not None:
+            self.log["render"].append((start, time.perf_counter() - start))
+
+    def update_graph(self, widget, dt):
+        start = time.perf_counter()
+        super().update_graph(widget, dt)
+        if self.log is not None:
+            self.log["tick"].append((start, time.perf_counter() - start))
+
+    def refresh_static_channels(self, widget):
+        start = time.perf_counter()
+        super().refresh_static_channels(widget)
+        if self.log is not None:
+            self.log["static"].append((start, time.perf_counter() - start))
+
+
+def synthetic_signals(count, length, rate=1000.0, seed=0):
+    # ECG-like traces: a few harmonics of a heart rate between 50 and 110 bpm plus noise
+    generator = np.random.default_rng(seed)
+    time_axis = np.arange(int(length * rate)) / rate
+    signals = []
+    for _ in range(count):
+        beat = generator.uniform(50, 110) / 60
+        amplitude = sum(np.sin(2 * np.pi * beat * k * time_axis + generator.uniform(0, 2 * np.pi)) / k
+                        for k in range(1, 6))
+        amplitude += generator.normal(0, 0.05, len(time_axis))
+        signals.append(prepare_signal(time_axis, amplitude))
+    return signals
+
+
+def file_signals(count):
+    # the recordings shipped in Signals/, repeated as needed, spreadsheets are left out as they need pandas
+    files = sorted(path for path in glob.glob(os.path.join("Signals", "*", "*")) if not path.endswith(".xlsx"))
+    cache = SignalCache()
+    return [prepare_signal(*read_signal_file(files[k % len(files)], cache), cache) for k in range(count)]
+
+
+def percentiles(values):
+    if not values:
+        return None
+    values = np.asarray(values) * 1000
+    result = {f"p{p}": round(float(np.percentile(values, p)), 3) for p in PERCENTILES}
+    result["max"] = round(float(values.max()), 3)
+    result["mean"] = round(float(values.mean()), 3)
+    return result
+
+
+def rss_mb():
+    # resident memory now, or the peak where the OS reports no more, as the viewer's metrics export it
+    value = resident_memory_bytes()
+    return None if value is None else round(value / 2 ** 20, 1)
+
+
+def pump(app, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def run_scenario(app, scenario, signals, duration, warmup):
+    window = BenchApp()
+    window.show()
+    window.add_signals(window.plotWidget_L, signals)
+    app.processEvents()
+    if scenario != "play":
+        # everything played and paused, as after a recording finished
+        if window.isPlayingL:
+            window.togglePlayPauseL()
+        for channel in window.channels.values():
+            channel["indexTrack"] = len(channel["time"])
+        window.syncCineClocks()
+        window.graph1ViewBox.setXRange(*window.get_min_max_x_for_widget(window.plotWidget_L))
+        app.processEvents()
+        if scenario == "rewind":
+            window.handleRewindPlot(window.plotWidget_L)
+    pump(app, warmup)
+
+    for key in window.log:
+        window.log[key].clear()
+    steps = []
+    rss_before = rss_mb()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    if scenario in ("play", "rewind"):
+        # driven by the viewer's own timers
+        pump(app, duration)
+    else:
+        # one user action per display frame, timed until it is painted
+        frame = 1 / Main.RENDER_FPS
+        scroll = window.horizontalScrollBar_L
+        window.scroll_plot_x_L(0)  # sets the scroll bar's range
+        k = 0
+        while time.perf_counter() - start < duration:
+            step = time.perf_counter()
+            if scenario == "scroll":
+                # sweep the scroll bar back and forth over its range
+                position = (k * scroll.maximum() // 60) % (2 * scroll.maximum() or 1)
+                scroll.setValue(position if position <= scroll.maximum() else 2 * scroll.maximum() - position)
+            elif k % 2:
+                window.zoomOut(graphNumber=1)
+            else:
+                window.zoomIn(graphNumber=1)
+            app.processEvents()
+            steps.append((step, time.perf_counter() - step))
+            k += 1
+            pump(app, max(0.0, frame - (time.perf_counter() - step)))
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    # frames are the display frames while playing, the redraws of the static traces otherwise
+    frames = {"play": window.log["render"], "rewind": window.log["static"]}.get(scenario, steps)
+    starts = [moment for moment, _ in frames]
+    result = {
+        "scenario": scenario,
+        "channels": len(signals),
+        "samples": int(sum(len(signal["time"]) for signal in signals)),
+        "duration_s": round(elapsed, 3),
+        "frames": len(frames),
+        "frames_per_s": round(len(frames) / elapsed, 2),
+        "frame_interval_ms": percentiles(np.diff(starts).tolist()),
+        "frame_work_ms": percentiles([cost for _, cost in frames]),
+        "ticks_per_s": round(len(window.log["tick"]) / elapsed, 2),
+        "tick_ms": percentiles([cost for _, cost in window.log["tick"]]),
+        "cpu_s": round(cpu, 3),
+        "cpu_fraction": round(cpu / elapsed, 3),
+        "rss_mb": rss_mb(),
+        "rss_growth_mb": None if rss_before is None else round(rss_mb() - rss_before, 1),
+    }
+
+    window.log = None
+    window.clearChannels(window.plotWidget_L)
+    window.rewindTimerL.stop()
+    window.close()
+    window.deleteLater()
+    # deferred deletes are not run by processEvents, free the window before the next scenario
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    app.processEvents()
+    return result
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit or None,
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "qt": QtCore.QT_VERSION_STR,
+        "pyqtgraph": pg.__version__,
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+        "qpa": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+if __name__ == "__main__":
+    # python benchmarks/cine.py --channels 1 4 16 64 --duration 5 --output cine.json
+    parser = argparse.ArgumentParser(description="Headless cine engine benchmarks, results as JSON.")
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--signals", choices=("synthetic", "files"), default="synthetic")
+    parser.add_argument("--length", type=float, default=60.0, help="seconds per synthetic channel")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds measured per scenario")
+    parser.add_argument("--warmup", type=float, default=0.5, help="seconds run before measuring")
+    parser.add_argument("--output", default="cine_benchmark.json")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    results = []
+    for count in args.channels:
+        if args.signals == "files":
+            signals = file_signals(count)
+        else:
+            signals = synthetic_signals(count, args.length)
+        for scenario in args.scenarios:
+            result = run_scenario(app, scenario, signals, args.duration, args.warmup)
+            results.append(result)
+            interval = result["frame_interval_ms"] or {}
+            work = result["frame_work_ms"] or {}
+            print(f"{scenario:>6} {count:>3} ch: {result['frames_per_s']:6.1f} frames/s, "
+                  f"interval p50 {interval.get('p50', 0):6.1f} p99 {interval.get('p99', 0):6.1f} ms, "
+                  f"work p50 {work.get('p50', 0):6.1f} p99 {work.get('p99', 0):6.1f} ms, "
+                  f"{result['ticks_per_s']:6.1f} ticks/s, cpu {result['cpu_fraction']:.2f}, {result['rss_mb']} MB")
+
+    report = {"environment": environment(), "settings": vars(args), "results": results}
+    output = os.path.join(START_DIR, args.output)
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {output}")
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs in a fresh interpreter and prints the wall clock time at which the window was first painted,
+# the "eager" mode imports the report and statistics modules up front as Main used to
+CHILD = '''
+import sys, time
+from PyQt5 import QtWidgets, QtCore
+if {eager}:
+    import Report, Stats
+import Main
+
+class FirstPaint(QtCore.QObject):
+    painted = False
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            FirstPaint.painted = True
+        return False
+
+app = QtWidgets.QApplication(sys.argv)
+window = Main.MainApp()
+watcher = FirstPaint()
+window.installEventFilter(watcher)
+window.show()
+while not FirstPaint.painted:
+    app.processEvents()
+print(time.time())
+'''
+
+
+def time_to_first_window(eager):
+    start = time.time()
+    output = subprocess.run([sys.executable, "-c", CHILD.format(eager=eager)], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output.split()[-1]) - start
+
+
+if __name__ == "__main__":
+    # python benchmarks/startup.py --runs 10
+    parser = argparse.ArgumentParser(description="Time from launching the viewer to its first painted window.")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    for name, eager in (("eager imports", True), ("lazy imports", False)):
+        # one untimed run so both modes start with warm disk caches and compiled bytecode
+        time_to_first_window(eager)
+        times = [time_to_first_window(eager) for _ in range(args.runs)]
+        print(f"{name:>14}: median {statistics.median(times) * 1000:.0f} ms, "
+              f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms over {args.runs} runs")
@@ -1,7327 +1,24 @@
 # -*- coding: utf-8 -*-
 
-# Resource object code
+# Registers the UI icons, imported by newui.py.
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
+# The icons used to be compiled into this module as byte strings (~485 KB of Python to parse
+# before the window could appear). They now live in the binary bundle resources.rcc next to it,
+# which Qt maps from disk and decodes only when an icon is first drawn. Rebuild it with
+# rcc -binary resources.qrc -o resources.rcc
 
+import os
 from PyQt5 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x58\xf2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\x9d\x09\x98\x5c\x45\xd5\xfe\xdd\x15\x50\x54\x5c\xc0\x05\x77\x45\
-\x10\x37\xdc\x50\x5c\x11\x15\x77\x3f\x15\xf5\x53\x71\xd7\x4f\x45\
-\xc5\xf5\x03\x57\x50\xf4\x2f\x28\x8a\xf2\xb9\xc5\x0d\x0d\x66\xfa\
-\x76\x99\x8d\x49\x77\x55\x4f\x12\x18\xc3\x74\x55\x4f\x60\xc4\x80\
-\x01\x45\x90\x7d\x53\x20\xc8\xbe\x86\xfc\xcf\xb9\xdd\x13\x92\xc9\
-\x2c\x3d\x33\xb7\xfb\xad\x7b\xef\xfb\x7b\x9e\xf3\x64\x21\x24\xf7\
-\xbe\x75\xea\xd4\x72\xab\xce\xb9\xdb\xdd\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x48\xbc\x18\xb3\xfe\x3e\x4b\xdc\x9a\x47\x24\x43\x7e\
-\x4f\x63\xc3\xcb\x2a\xae\xf5\x56\x63\xfd\xc7\xaa\xd6\x1f\x92\x38\
-\xff\xed\xc4\x85\x23\xe5\xe7\x47\xc9\x8f\x0b\xda\xe6\x7f\x57\x75\
-\xc1\xa8\xe9\xcf\xc7\x7f\xbf\xf3\x67\x8e\xd4\xff\x47\xff\x5f\xfd\
-\x3b\xda\x7f\x57\x78\x99\xfe\xdd\xfa\x6f\xe8\xbf\x85\x7e\x5f\x42\
-\x08\x21\xa4\x14\x98\x46\xd8\x49\x06\xe6\xbd\xd2\xc1\xd8\xb5\x3e\
-\x9f\x58\xff\x7f\x55\x1b\x56\x24\x36\xac\xaf\x3a\x7f\xad\x0c\xe4\
-\x9b\xfa\x69\xf2\xef\xff\x27\xfd\xb7\xe5\x19\xe4\xdf\x3f\x56\x9f\
-\x49\x9f\x6d\xc0\xfa\x67\x2f\xaa\x8d\x3c\x18\xad\x17\x21\x84\x10\
-\x92\x2b\x16\x8c\x8d\xdd\x7b\xc0\x8d\x3c\x4d\x06\xfb\x03\x64\x60\
-\x3d\xbc\x33\xc8\x5f\xd6\xef\x01\x3e\x03\xdb\x20\xcf\xdf\x94\x67\
-\xff\xb1\xee\x22\x18\xdb\x7a\xf1\xe0\xe0\xd8\xf6\x68\x7d\x09\x21\
-\x84\x10\x38\x87\x1d\xb6\xe9\x1e\x3a\xd8\xa7\x5b\xf5\xce\xff\x3e\
-\x71\xfe\x4c\x19\x30\x6f\x8f\x60\xf0\xee\xd1\xae\x41\xb8\x5d\xdf\
-\x51\xdf\x55\xdf\x59\xdf\x5d\x35\x40\xb7\x03\x21\x84\x10\xd2\x53\
-\x8e\x1b\x1e\xbe\x5f\xc5\xb5\x5e\x2e\xab\xe1\xaf\xca\x80\x58\x97\
-\x55\xfe\x35\xe8\x41\x39\x02\xdb\x20\x13\x83\x9a\x6a\xa2\xe7\x0c\
-\x54\x23\x74\x3b\x11\x42\x08\x21\xf3\x66\x71\x6d\xe4\x09\xed\x15\
-\xbe\x1e\xb6\x0b\xd7\x45\x30\xe0\x46\x6d\x89\xf3\x37\x55\xad\x5f\
-\xd5\x3e\x80\x38\xba\x07\xba\xfd\x08\x21\x84\x90\xae\xb0\xd6\xde\
-\xb7\x52\x6f\xbd\x56\x0f\xc6\x25\xd6\x9f\x83\x1e\x50\xf3\x6e\xa2\
-\xe1\x3f\xd2\x73\x04\x8d\xb0\xbf\x6a\x8b\x6e\x5f\x42\x08\x21\x64\
-\x33\xc6\x98\x7b\xea\x21\x37\x1d\xa8\x64\xe0\xbf\x12\x3d\x68\x16\
-\xd5\xf4\x93\x89\x68\xbc\x50\xec\x8d\xbc\x8a\x48\x08\x21\x04\xc2\
-\x96\x83\xbe\xd8\xbf\xd0\x83\x63\x09\x6d\xc3\xf8\x64\x40\x6f\x4e\
-\xa0\xfd\x81\x10\x42\x48\xc1\x59\xdc\xf0\x4f\xad\xda\x70\xb4\xac\
-\x46\xff\x1d\xc1\x20\x48\x73\xe9\xed\x82\x7f\x25\xd6\x7f\xaf\x52\
-\x5f\xfb\x14\xb4\x7f\x10\x42\x08\x29\x10\xfa\xed\x39\xbd\x97\x6f\
-\xfd\x2a\x19\x68\xee\x44\x0f\x78\xb4\xe9\x26\x03\x7e\x4c\x0f\x5d\
-\x32\xe7\x00\x21\x84\x90\x39\xa3\xab\xfd\xf6\x77\x7d\x4d\x6a\x83\
-\x1f\xdc\x68\xb3\x9a\x08\x5c\x2d\x6d\xf7\x23\xe3\x9a\xbb\xa1\xfd\
-\x88\x10\x42\x48\x4e\xd0\x6f\xfb\xd5\xf6\xb5\xbd\x3b\xd0\x03\x19\
-\x6d\xde\x13\x81\x3b\xdb\x3b\x37\xe1\x8d\x68\xbf\x22\x84\x10\x12\
-\x21\x9a\x91\x4e\x07\x09\x19\x34\x5a\xe8\x41\x8b\xd6\x33\x3b\x2d\
-\xa9\x87\xf7\x0d\x0f\x0f\xdf\x0b\xed\x6f\x84\x10\x42\xc0\x68\xe6\
-\x39\xe3\xfc\xc1\xb2\xda\xbf\x20\x82\x01\x8a\xd6\x0f\xb3\xfe\x7c\
-\x99\xec\x7d\x9a\x79\x05\x08\x21\xa4\x84\xe8\xd5\x31\x3d\x2c\x96\
-\x38\x7f\x09\x7c\x40\xa2\x41\x4c\xda\xfe\x62\x9d\xfc\x71\x22\x40\
-\x08\x21\x25\x40\x07\x7e\x59\xed\x7f\x84\x2b\x7e\xda\x66\xd3\x1d\
-\x81\x86\xff\x20\x3f\x0d\x10\x42\x48\x01\xd1\x6f\xfc\xb2\xda\x3b\
-\x50\x02\xfe\xb9\xf0\x01\x87\x16\xa5\x69\xda\x61\xd3\x08\xef\xde\
-\xb4\x69\xd3\xdd\xd1\xfe\x4a\x08\x21\x24\x03\x24\xb0\x3f\x2f\xb1\
-\x21\xa0\x07\x18\x5a\x3e\x4c\x73\x09\x24\xf5\xb0\x0f\xda\x6f\x09\
-\x21\x84\xcc\x11\xb3\x22\x3c\xaa\x9d\x2e\x96\xc9\x7b\x68\xb3\xb3\
-\x8e\xcf\x98\xc5\x35\xff\x58\xb4\x1f\x13\x42\x08\xe9\x12\xcd\x02\
-\xa7\xe5\x64\x65\xf0\xbf\x1e\x3d\x90\xd0\xf2\x6d\x89\xf3\x37\x26\
-\x2e\x1c\x69\x86\x87\xef\x8f\xf6\x6b\x42\x08\x21\xd3\x50\x69\xf8\
-\x37\xc8\xc0\x7f\x21\x7a\xe0\xa0\x15\xcc\xac\x3f\x5f\x4b\x12\xa3\
-\xfd\x9b\x10\x42\xc8\x04\x96\x0c\xf9\x87\xeb\x76\x3f\x7c\xa0\xa0\
-\x15\xdd\x8c\xb1\x27\x3f\x0c\xed\xef\x84\x10\x42\x84\xb4\x50\x8f\
-\xf3\x57\x46\x30\x38\xd0\xca\x61\x1b\x34\x87\x04\xda\xef\x09\x21\
-\xa4\xb4\x98\xa1\xd1\xc7\x27\xd6\xaf\x8c\x60\x40\xa0\x95\xd0\xc4\
-\xf7\x1c\x0f\x09\x12\x42\x48\x9f\xd1\x9c\xee\xb2\xf2\xbf\x0e\x3d\
-\x08\xd0\xca\x6d\xea\x83\xdc\x0d\x20\x84\x90\x3e\x60\x56\x8d\x3d\
-\x50\x56\x5e\x8b\xd0\x81\x9f\x46\xdb\xca\x6c\x58\x6c\x1a\x61\x27\
-\x74\xff\x20\x84\x90\x42\x62\xea\x7e\x5f\xcd\xdf\x0e\x0f\xf6\x34\
-\xda\x64\x66\xfd\x45\x15\xd7\x7a\x39\xba\x9f\x10\x42\x48\x61\x30\
-\x66\xfd\x7d\x12\x17\xbe\x5f\x75\x7e\x23\x3c\xc8\xd3\x68\xd3\x9a\
-\xdf\x98\xe6\x0d\x10\x9f\x45\xf7\x1b\x42\x08\xc9\x35\x9a\xcd\x4f\
-\x02\x6b\x0b\x1f\xd8\x69\xb4\x59\xd9\xa9\x66\xd5\xc8\x63\xd0\xfd\
-\x87\x10\x42\x72\x49\xc5\x35\x5f\x92\x38\x7f\x79\x04\xc1\x9c\x46\
-\x9b\xb5\x25\x2e\xfc\x5b\x3f\x5b\xa1\xfb\x11\x21\x84\xe4\x0a\x3d\
-\x59\x5d\xb5\xfe\x36\x74\x10\xa7\xd1\xe6\x63\x89\x0d\xb7\x6b\x5a\
-\x6a\x74\x7f\x22\x84\x90\xe8\x59\x38\xb4\x6e\x07\x59\xf5\x27\xe8\
-\xc0\x9d\x5b\xb3\xfe\x0a\x19\x74\xd6\xcb\xcf\xd7\x88\x8e\x4b\xe5\
-\xd7\xbf\x92\x95\xe8\x77\xd3\xda\x08\x2e\xfc\xaf\x4e\xac\xda\x93\
-\xab\xf0\x7e\x4d\xa0\x94\x26\x51\x92\x9f\x8f\xff\xbe\xfe\x99\xce\
-\x9f\xfd\x6e\xfb\xff\xd5\xbf\x23\x9c\x2c\x3f\x9e\xa9\x7f\x37\xfc\
-\xfd\x72\x6a\x7a\x73\x45\x7d\x1b\xdd\xbf\x08\x21\x24\x4a\x2a\x8d\
-\x53\x76\xad\x3a\x7f\x3a\x3a\x58\xc7\x6c\x5a\xa5\x4e\xec\x3c\x19\
-\x94\x97\xeb\xc1\x48\xf9\xf9\x27\x13\xdb\x7c\x9d\xb1\xa3\x7b\x18\
-\x13\xb6\xeb\x75\x1b\xe9\xbf\x91\xfe\x5b\xce\xbf\x5e\xda\xea\xa0\
-\xce\x33\x9c\x90\x3e\x53\x04\xfa\x44\x6d\x36\xac\x5b\x62\x47\x1f\
-\xdd\xeb\x36\x22\x84\x90\x5c\x21\x03\xc9\x5e\x12\x20\x2f\x85\x07\
-\xe9\x88\x4c\x34\xb9\x43\x07\x0d\x19\x5c\x7f\x2e\xbf\xfe\x78\xa5\
-\xe1\x5f\x74\xbc\x1d\xdd\x11\xdd\x56\x53\xa1\xcf\x96\xd4\xc3\x3e\
-\xfa\xac\xe9\x33\xeb\xb3\xeb\x3b\x44\xa0\x65\x2c\x96\x38\x7f\x89\
-\xa9\x35\x9f\x85\x6e\x2b\x42\x08\x89\x02\x5d\x4d\xb2\x74\x6f\xbb\
-\xf4\x6c\xd5\xfa\x55\xb2\xb2\x3e\xbc\x62\x9b\xaf\x5e\xbe\xbc\xf9\
-\x00\x74\xdb\xcc\x97\x74\x52\xe0\xfc\x6b\xc4\xbe\x29\xef\xb8\x3a\
-\x7d\xc7\x08\xb4\xc6\xb6\x73\xb8\xae\x52\x6f\xbd\x16\xdd\x36\x84\
-\x10\x02\x45\x82\xe1\x47\xd2\x83\x52\x11\x04\x66\xd0\x60\xf0\x4f\
-\xb1\x05\xa2\xc1\x1b\x8f\x1b\x1e\xbe\x1f\xba\x3d\x7a\x8d\xbe\xa3\
-\xbc\xef\x7e\x7a\x57\x3e\xb1\x7e\x0c\xad\x3f\xb0\xdd\xef\xd0\x4f\
-\x28\xe8\xf6\x20\x84\x90\xbe\xb3\x69\xd3\xa6\xbb\x57\x6d\x38\x1a\
-\x1d\x88\xfb\x6f\x69\x32\xa3\x35\xa6\x11\x3e\x55\x71\xad\xc7\xa1\
-\xdb\x01\x4d\xbb\xa0\x53\xf8\x74\xe2\xfc\x48\x19\x13\x3d\xe9\x44\
-\x48\xfb\x02\xba\x1d\x08\x21\xa4\x2f\x18\x63\xee\x29\x81\xef\x37\
-\xe8\xe0\xdb\xdf\x40\x9f\x9e\xa2\x3f\x44\x13\x1b\xa1\xf5\x8f\x15\
-\xd5\xc6\x38\x7f\xb0\x4c\x04\x9a\x7a\xd8\x11\xdd\x66\x7d\xf3\x0d\
-\x1b\x16\x0e\x0f\x0f\xdf\x0b\xad\x3f\x21\x84\xf4\x94\x05\x63\x63\
-\xf7\x2e\xcd\x35\x3f\xeb\x2f\xd2\xef\xf9\x2c\x19\x3b\x7b\x54\x33\
-\x3d\x37\x50\x96\xda\x0f\x7a\x4d\x90\x93\x00\x42\x48\x61\x69\xe7\
-\xf4\xf7\x4b\xd1\xc1\xb6\xb7\xe6\x37\xea\x41\x3e\xbd\x5f\xcf\x80\
-\x3e\x7f\x0e\x3b\x6c\xd3\x3d\xf4\xcc\x80\x68\x6b\x0a\x9f\x18\xca\
-\x86\x15\x65\x38\x07\x42\x08\x29\x19\x83\x83\x63\xdb\xcb\x2a\x67\
-\x25\x3c\xc8\xf6\xce\x36\x68\xf2\x1c\x6e\xf1\xf7\x0e\xd5\x36\x3d\
-\x3c\xe8\xc2\x35\x11\xb4\x77\xaf\x26\x01\x0d\xed\x2b\x68\xad\x09\
-\x21\x24\x13\x34\x03\x9a\x66\x93\x83\x07\xd7\x1e\x58\x3b\x01\x8e\
-\xff\x8c\x19\x1e\xbe\x3f\x5a\xe7\xb2\xa0\x5a\xa7\x67\x05\xac\x3f\
-\x1f\xdd\xfe\x3d\xb2\x35\xcc\x1a\x48\x08\xc9\x3d\xba\xa5\x29\x01\
-\x6d\x75\x04\x41\x35\xdb\x81\xdf\xf9\x33\x4d\xbd\xf5\x4e\x3d\xd0\
-\x88\xd6\xb8\xac\xe8\x27\x16\x99\x80\xbd\x4b\x26\x60\x67\xa1\xfd\
-\x21\x73\xb3\x7e\x15\x3f\x07\x10\x42\x72\x8b\x1e\xf8\xd3\xef\x9a\
-\xf0\x60\x9a\x6d\x60\x3e\x3f\xcd\x9b\xcf\x81\x3f\x1a\x3a\xe7\x04\
-\x0e\x90\x89\xc0\xd9\x70\xff\xc8\xd4\xd7\x42\xc3\x5a\x7b\x5f\xb4\
-\xbe\x84\x10\x32\x2b\x3a\x57\xfd\xfe\x08\x0f\xa2\x19\x0e\xfc\x49\
-\xc3\x7f\x90\x07\xfb\xe2\x45\xdb\xc6\xd8\xf0\x61\xf1\xbb\x0b\xe0\
-\xfe\x92\x91\x25\xd6\x57\x39\xd9\x24\x84\xe4\x06\x4d\x6c\x92\x38\
-\xff\x6b\x74\xf0\xcc\x68\xe0\xbf\x41\xaf\xf2\x71\x3b\x36\x3f\xe8\
-\x6d\x93\x4e\x3e\x81\x6b\xe1\xfe\x93\x89\xf9\xdf\xeb\x2e\x07\x5a\
-\x57\x42\x08\x99\x91\xc4\x86\x9f\xe0\x83\xe6\xbc\x83\xee\x46\x59\
-\x7d\x1d\xb7\xc4\xad\x79\x04\x5a\x4f\x32\x37\xd2\x5b\x03\x36\x2c\
-\x2c\x42\x52\x21\x79\x8f\x1f\xa3\xf5\x24\x84\x90\x69\x31\x2e\x7c\
-\x09\x1d\x2c\xe7\x1f\x6c\xfd\xda\x81\x7a\xf3\xb9\x68\x2d\x49\x36\
-\x0c\xd4\x5a\x2f\x28\x42\xdd\x01\xe3\x5a\x9f\x47\x6b\x49\x08\x21\
-\x93\x62\xac\x7f\x7b\x9e\xf3\xb9\x27\xce\xdf\x94\xa6\xeb\xe5\x37\
-\xd7\xc2\x91\x9e\x0f\x70\xfe\xe0\x7c\x57\x9d\xf4\x1b\x2b\xae\xf5\
-\x56\xb4\x96\x84\x10\xb2\x15\xb2\xc2\x7a\x5e\x9e\x4b\xbd\xca\xb3\
-\xff\xa9\x52\x5f\xfb\x14\xb4\x8e\xa4\xb7\x68\xf1\x21\x69\xef\x21\
-\xb4\xbf\xcd\xc3\x4f\x6f\x32\xae\xf9\x42\xb4\x8e\x84\x10\x92\x62\
-\x1a\xe1\x49\xb2\x3a\xb9\x12\x1d\x1c\xe7\x66\xfe\x5a\xe3\x5a\x1f\
-\x40\x6b\x48\xfa\x47\xbb\x12\xa5\xff\x50\xe2\xc2\x75\x78\xff\x9b\
-\xc3\x24\xc0\x86\x7f\xe9\x44\x06\xad\x23\x21\xa4\xe4\xc8\xe0\xbf\
-\x53\x7e\xef\x5f\xfb\x26\x03\x69\x79\x59\x5c\x1b\x79\x82\xf8\x41\
-\x0b\xef\x87\x73\x9a\x04\xfc\x6d\xd9\xb2\xe1\x07\xa1\x35\x24\x84\
-\x94\x14\xbd\x9a\x24\x83\xa8\x45\x07\xc3\x39\x04\xcf\xdb\x35\xa7\
-\xbc\x26\x2a\x42\x6b\x48\xb0\xe8\xd9\x00\x3d\xf7\x91\xc7\x42\x43\
-\x5a\x5b\x83\xe7\x55\x08\x21\x10\x12\xe7\xbf\x8d\x0e\x82\xb3\x36\
-\x4d\xe8\x63\x47\xf6\x46\x6b\x47\xe2\x22\xa9\x87\x7d\x64\x62\x78\
-\x21\xdc\x3f\x67\x6d\xfe\x70\xb4\x76\x84\x90\x92\x61\x5c\xeb\x4d\
-\xb9\xbb\x5f\x6d\xfd\xf0\x92\x21\xff\x70\xb4\x76\x24\x4e\x96\xae\
-\x5a\xfb\x90\xfc\x55\xac\xf4\x1b\x8d\xf3\xaf\x47\x6b\x47\x08\x29\
-\x09\x8b\x57\xb6\x9e\x2c\x81\xf2\x3f\xf8\xe0\xd7\x9d\xe9\x44\x45\
-\xb7\xfc\xb9\x5d\x4a\x66\x42\x7d\x44\x57\xd5\x79\xba\xce\xaa\xe5\
-\x91\xf5\x20\x2e\x5a\x3b\x42\x48\xc1\xd1\x52\xac\x89\x0d\xeb\xd1\
-\x41\x6f\x16\x2b\xa4\x6b\x93\xba\x7f\x0b\x5a\x37\x92\x2f\x92\x46\
-\xf3\x6d\xf9\xba\x25\xe0\x4f\x1f\x1c\x1c\xdb\x1e\xad\x1b\x21\xa4\
-\xc0\x48\x50\x3c\x1e\x1f\xec\xba\x5c\x19\xd9\x70\xa1\xa9\x87\xa7\
-\xa3\x35\x23\xf9\x64\xc0\xb6\x9e\x91\x38\x7f\x31\xda\x8f\xbb\x36\
-\x1b\x7e\x8b\xd6\x8c\x10\x52\x50\xda\x99\xfe\x22\x08\x74\x5d\xae\
-\x88\x96\xd8\xd1\x47\xa3\x35\x23\xf9\x46\x6b\x41\x54\xad\xff\x33\
-\xde\x9f\xbb\x33\x53\x6f\xbd\x13\xad\x19\x21\xa4\x60\xe8\x60\x2a\
-\x01\x66\x03\x3a\xc0\x75\xb9\x12\x6a\x1c\x6f\x47\x77\x44\x6b\x46\
-\x8a\x81\x7e\xf6\x12\x9f\x5a\x01\xf7\xeb\x2e\x2c\x3d\x0f\xb0\x6a\
-\xe4\x31\x68\xcd\x08\x21\x05\xa1\x7d\x30\x2a\xac\x41\x07\xb7\x2e\
-\x03\xe0\x02\x1e\xf6\x23\x59\xa3\xf9\x02\xc4\xb7\x7e\x83\xf6\xef\
-\x2e\xfb\xc0\x89\x2c\x1f\x4c\x08\xc9\x04\x63\x5b\x5f\x45\x07\xb5\
-\xae\x02\x9f\x0d\x3f\xd1\x34\xaf\x68\xbd\x48\x31\x51\xdf\x4a\x9c\
-\xff\x21\xda\xcf\xbb\x9c\x04\xfc\x2f\x5a\x2f\x42\x48\xce\xd1\xb2\
-\xb8\x79\xc8\x92\x26\x83\xff\xb7\xd0\x5a\x91\x72\x90\x87\x04\x58\
-\xf2\x8c\xb7\xca\x24\x60\x2f\xb4\x56\x84\x90\x9c\xd2\xd9\xf6\xfc\
-\x0b\x3a\x98\xcd\x64\xc6\x86\x6f\xa0\xb5\x22\xe5\x22\x4d\x1f\x1c\
-\x81\xef\x4f\x6f\xfe\x74\xa6\xbb\x26\x84\xcc\x09\x09\x20\x5f\xc7\
-\x07\xb1\x19\x56\x3a\x0d\xff\x05\xb4\x4e\xa4\x9c\xc8\x24\xe0\x8b\
-\x68\xff\x9f\xb1\x7f\xb8\xf0\x65\xb4\x4e\x84\x90\x9c\x61\x5c\x73\
-\xb7\xaa\x0d\x37\xa3\x03\xd8\x74\xc6\x95\x3f\x41\x93\x38\xff\x4d\
-\x74\x3f\x98\x61\x02\x70\x4b\xa5\xd6\xda\x1d\xad\x13\x21\x24\x27\
-\xe8\x09\x62\x09\x6c\x23\xe8\xe0\x35\xbd\xf9\x63\xd0\x3a\x11\xa2\
-\x54\xad\x3f\x0a\xdf\x1f\xa6\xb5\x35\x3c\x1c\x4b\x08\xe9\x0a\x19\
-\x5c\x0f\x8a\x20\x68\x4d\x67\x3f\x65\x40\x23\xb1\x90\xde\x0e\xb0\
-\xfe\xe7\x11\xf4\x8b\x29\xcd\x58\xff\x31\xb4\x4e\x84\x90\xc8\x31\
-\x2b\xc2\xa3\x34\x7f\x3e\x3a\x60\x4d\x63\x86\x77\x9c\x49\x6c\x74\
-\x76\xcd\x96\x46\xd0\x3f\x26\x35\x2d\xde\xa5\x59\x0d\xd1\x3a\x11\
-\x42\x22\x46\x02\xc5\x22\x74\xb0\x9a\xc6\x4e\x61\xc1\x13\x12\x2b\
-\xc6\x84\xed\x12\x1b\x42\x04\xfd\x64\xf2\x49\x80\xf3\xbf\x43\x6b\
-\x44\x08\x89\x94\xc4\x8e\xec\xad\xa5\x73\xd1\x81\x6a\x8a\x15\xcc\
-\x79\x4b\x86\xfc\xc3\xd1\x1a\x11\x32\x1d\x8b\x06\xc7\x1e\x2a\xbe\
-\x7a\x0e\xba\xbf\x4c\xd1\x87\xee\x34\x8d\xf0\x7c\xb4\x46\x84\x90\
-\xc8\xe8\x7c\xc7\x5c\x8b\x0e\x52\x53\x04\xae\xab\xf5\x56\x02\x5a\
-\x23\x42\xba\x61\x71\xc3\x3f\xb5\x1a\x69\xdd\x0c\xdd\xa1\xe0\xf9\
-\x19\x42\xc8\x56\x18\xe7\x0f\x44\x07\xa7\x29\x02\xd6\xed\x49\xa3\
-\xf9\x0a\xb4\x3e\x84\xcc\x06\xd3\x68\xbd\x2a\x71\xe1\x0e\x74\xff\
-\x99\xcc\x4c\x23\xbc\x1b\xad\x0f\x21\x24\x12\x3a\xd5\xce\x2e\x45\
-\x07\xa6\x49\x27\x00\x4c\xf4\x43\x72\x8a\xb1\xfe\x50\x74\xff\x99\
-\xb4\x4f\x39\x7f\xc9\xc2\xa1\x75\x3b\xa0\xf5\x21\x84\x44\x80\x0c\
-\xfe\x47\xa0\x83\xd2\xa4\x81\xca\xfa\x2a\xb7\x2b\x49\x5e\xe9\x14\
-\x0f\x8a\xf2\x66\x40\x62\xc3\x61\x68\x7d\x08\x21\x60\xd2\x43\x4b\
-\x2e\x5c\x87\x0e\x48\x93\x04\xa8\xbf\x1d\x6f\x47\x77\x44\xeb\x43\
-\xc8\x7c\xd0\xdd\x35\x99\x04\x9c\x89\xee\x4f\x93\xf4\xaf\xeb\x8d\
-\x3d\xf9\x61\x68\x7d\x08\x21\x40\x64\x95\xfd\x03\x74\x30\xda\xc6\
-\xac\xbf\x81\x87\xfe\x48\x51\x18\x70\x23\x4f\x93\x49\xc0\x4d\xf0\
-\x7e\xb5\x6d\x3f\x3b\x0a\xad\x0d\x21\x04\x84\x26\x06\x91\xc0\x74\
-\x23\x3c\x10\x4d\x5c\x9d\xb8\xf0\x11\xb4\x36\x84\x64\x49\x94\xd9\
-\x35\x65\xa2\x3d\xb0\xba\xb5\x33\x5a\x1b\x42\x08\x80\xc4\x86\x9f\
-\xc0\x83\xd0\x36\x41\x29\x2c\x47\xeb\x42\x48\xd6\xe8\x79\x00\x99\
-\x04\x0c\xc2\xfb\xd7\x36\x93\x6d\xff\x43\xb4\x36\x84\x90\x3e\x63\
-\x56\x8d\x3c\x46\x2b\x85\xa1\x03\xd0\x84\x15\xc9\x15\x5c\x91\x90\
-\xa2\xa2\xdf\xdc\x65\xd2\x7d\x19\xbc\x9f\x6d\x3d\xe1\xbe\x79\x89\
-\x1d\x7d\x34\x5a\x1b\x42\x48\x1f\x91\xc1\x7f\x01\x3c\xf8\x6c\xb9\
-\x12\xb1\xfe\xce\x8a\x6d\xbe\x1a\xad\x0b\x21\xbd\xc4\x34\xc2\xfe\
-\x11\x66\xdb\xfc\x29\x5a\x17\x42\x48\x9f\x18\x58\xd9\x7c\x64\xe2\
-\xfc\xad\x11\x04\x9e\x2d\x56\x22\xfe\x57\x68\x5d\x08\xe9\x07\x32\
-\x01\x38\x0e\xde\xdf\xb6\x9c\x7c\xbb\x70\x8b\xa9\xad\xdd\x05\xad\
-\x0b\x21\xa4\x0f\x48\x87\x3f\x12\x1d\x74\xb6\x0e\x40\xfe\xf2\x45\
-\xb5\x91\x07\xa3\x75\x21\xa4\x1f\x98\x46\xd8\x49\x3f\x77\xa1\xfb\
-\xdd\x56\x7d\xd0\x86\x6f\xa1\x75\x21\x84\xf4\x18\xcd\x00\x26\x2b\
-\x90\xab\xd0\x01\x67\x4b\xab\xb8\xd6\x5b\xd1\xba\x10\xd2\x4f\x4c\
-\xbd\xf5\x4e\x74\xbf\xdb\x7a\x02\xe0\xaf\x66\x76\x40\x42\x0a\x8e\
-\x71\xfe\x60\x74\xb0\xd9\xca\x6c\x58\x81\xd6\x84\x10\x04\x7a\xe3\
-\x05\xde\xff\xb6\x32\x7f\x10\x5a\x13\x42\x48\x8f\x30\xc6\xdc\x53\
-\xcb\xea\xe2\x03\xcd\xf8\xaa\x23\x5c\x6f\x56\x84\x47\xa1\x75\x21\
-\x04\x41\xa5\x71\xca\xae\x31\xe5\xe1\xd0\x32\xc6\x1a\x23\xd0\xba\
-\x10\x42\x7a\x80\x74\xf2\x77\xa0\x83\xcc\x04\xfb\x0a\x5a\x13\x42\
-\x90\x68\x4e\xfe\x08\xfa\xe1\x5d\x93\x80\x46\xf3\x6d\x68\x4d\x08\
-\x21\x3d\xa0\xea\x7c\x13\x1d\x60\x36\x9b\xf5\xe7\x1f\x37\x3c\x7c\
-\x3f\xb4\x26\x84\x20\x19\x1c\x1c\xdb\x5e\xfa\xc2\x45\xf0\xfe\xb8\
-\xb9\x5f\x86\x93\xd1\x9a\x10\x42\x32\x66\x71\xc3\x3f\x35\xa6\xfb\
-\xc7\xc6\xfa\xb7\xa3\x35\x21\x24\x06\x64\x62\xfe\xdf\xe8\xfe\xb8\
-\xa5\x55\x6a\xad\xdd\xd1\x9a\x10\x42\x32\x44\x82\xcc\x31\xe8\xc0\
-\xb2\x85\xad\x41\xeb\x41\x48\x2c\xa4\x69\x82\x6d\xf0\x11\xf4\xcb\
-\xb6\xd9\x70\x34\x5a\x13\x42\x48\x46\x58\x6b\xef\x2b\x13\x80\x2b\
-\xe1\x81\xa5\x63\x89\x1d\xd9\x1b\xad\x09\x21\x31\x91\xd4\xc3\x3e\
-\xe8\x7e\x79\x97\xf9\x2b\x35\x66\xa0\x35\x21\x84\x64\x80\x69\x84\
-\x77\xe3\x83\xca\xf8\xe0\x1f\x6a\x68\x3d\x08\x89\x11\xe9\x1f\x43\
-\xe8\xfe\xb9\xb9\x9f\xba\x70\x00\x5a\x0f\x42\x48\x06\x54\xad\x1f\
-\x46\x07\x94\xf6\xe0\xef\xef\x14\x7b\x1e\x5a\x0f\x42\x62\x64\xa0\
-\xde\x7c\x6e\x44\xe7\x74\x86\xd0\x7a\x10\x42\xe6\xc9\xe2\x95\xad\
-\x27\xc7\x12\x54\x12\xe7\x97\xa2\xf5\x20\x24\x66\x34\x31\x16\xba\
-\x9f\xb6\xcd\x6f\x34\x43\xa3\x8f\x47\xeb\x41\x08\x99\x07\xb1\xdc\
-\x33\xd6\x49\x88\xa9\x87\xa7\xa3\xf5\x20\x24\x66\x06\xac\x7f\x76\
-\x2c\x13\xf6\x2a\xf3\x74\x10\x92\x6f\x64\xd5\x7d\x66\x04\x81\x44\
-\x57\x14\x83\x68\x2d\x08\xc9\x03\x32\x01\x70\xf8\xfe\x9a\xf6\xd9\
-\xd3\xd1\x5a\x10\x42\xe6\x88\xae\xb8\xf1\x41\xa4\x6d\xc6\x86\x97\
-\xa1\xf5\x20\x24\x0f\x24\x2e\xec\x87\xee\xaf\x77\xf5\xdb\xd1\x3d\
-\xd0\x7a\x10\x42\xe6\x40\xd5\x86\x23\xd0\x01\x44\x4d\x56\x34\x63\
-\x68\x2d\x08\xc9\x13\xd2\x6f\x4e\x43\xf7\xdb\x76\xdf\x0d\x87\xa1\
-\xb5\x20\x84\xcc\x01\xe9\xbc\x7f\x43\x07\x90\xce\x04\xe0\x5d\x68\
-\x2d\x08\xc9\x13\x55\xdb\x7c\x2f\xba\xdf\x76\x26\x00\x7f\x43\x6b\
-\x41\x08\x99\x25\xa6\xd6\x7c\x16\x3a\x78\x74\x02\xc8\x85\xc3\xc3\
-\xc3\xf7\x42\xeb\x41\x48\x9e\x58\x30\x36\x76\xef\x58\x6a\x04\x24\
-\x43\x7e\x4f\xb4\x1e\x84\x90\x59\x90\x38\xff\x6d\x74\xe0\x48\x83\
-\x87\xf3\x5f\x43\x6b\x41\x48\x1e\x31\x36\x7c\x03\xdd\x7f\x3b\x7d\
-\xf8\x9b\x68\x2d\x08\x21\xb3\x20\x71\xe1\x2f\xf0\xc0\x61\xc3\xed\
-\x66\x45\x78\x14\x5a\x0b\x42\xf2\xc8\x12\x3b\xfa\x68\xe9\xc7\x77\
-\xa0\xfb\xb1\xd8\xa9\x68\x2d\x08\x21\x5d\x62\x6a\x6b\x77\x89\xe1\
-\x2e\xb1\x3c\xc3\x09\x68\x2d\x08\xc9\x33\xd2\x8f\xea\xe8\x7e\xac\
-\x49\x81\x06\x56\xb7\x76\x46\x6b\x41\x08\xe9\x82\xa4\xe1\x3f\x88\
-\x0f\x1a\x61\x53\xa5\xe1\xdf\x80\xd6\x82\x90\x3c\x63\x6c\xf8\x2f\
-\x74\x3f\x56\x33\xce\x1f\x88\xd6\x82\x10\xd2\x05\xb2\xf2\xae\xa2\
-\x03\x46\xe2\xfc\x25\xc6\x98\x7b\xa2\xb5\x20\x24\xcf\xe8\x61\x40\
-\xe9\x4b\x97\xc3\xfb\xb3\x0d\x03\x68\x2d\x08\x21\x33\xa0\x83\xae\
-\x4c\x00\xae\x86\x07\x0c\x17\xbe\x8f\xd6\x82\x90\x22\x20\x83\xef\
-\x8f\xe1\xfd\x59\x62\x0a\x27\xf4\x84\x44\x4e\x2c\x75\xc5\x59\xf5\
-\x8f\x90\x6c\xa8\x34\xfc\x8b\xd0\xfd\x59\x6d\xa0\xd6\x7a\x01\x5a\
-\x0b\x42\xc8\x34\x54\x9d\x3f\x1c\x1d\x28\xaa\xd6\x9f\xbf\x69\xd3\
-\xa6\xbb\xa3\xb5\x20\xa4\x08\x68\x5f\x8a\x21\x27\x80\x5e\x4b\x44\
-\x6b\x41\x08\x99\x86\xc4\x85\x13\xd1\x81\x42\x9e\xe1\x48\xb4\x0e\
-\x84\x14\x89\xc4\xfa\x1f\xa0\xfb\xb5\xd8\x10\x5a\x07\x42\xc8\x14\
-\x68\xc6\xbd\xc4\x86\xeb\xd1\x81\x42\x26\x00\x7b\xa1\xb5\x20\xa4\
-\x48\x98\x46\x78\x3e\xba\x5f\x57\x9d\xbf\x96\xe7\x00\x08\x89\x14\
-\x33\x34\xfa\x1c\x74\x90\x48\x9c\xbf\x18\xad\x03\x21\x45\xa3\xfd\
-\x19\x20\x5c\x0a\xef\xdf\x8d\x91\x67\xa2\xb5\x20\x84\x4c\x82\xcc\
-\xd0\x3f\x03\x0f\x10\x2e\xfc\x12\xad\x03\x21\x45\x44\x26\x00\xbf\
-\x85\xf7\x6f\xeb\x3f\x89\xd6\x81\x10\x32\x09\x31\xdc\xff\xd7\xc4\
-\x25\x68\x1d\x08\x29\x22\x32\xb9\x3e\x00\xdd\xbf\x25\xc6\x2c\x42\
-\xeb\x40\x08\x99\x04\xdd\x7e\x87\x06\x08\xeb\x6f\x33\xab\xc6\x1e\
-\x88\xd6\x81\x90\x22\xb2\x6c\xd9\xf0\x83\xb4\xbe\x06\x74\x02\xe0\
-\xc2\x05\x68\x1d\x08\x21\x13\xd0\xa2\x3b\xe8\xd5\x81\x4c\x00\x86\
-\xd1\x3a\x10\x52\x64\x64\x92\x3f\x82\xee\xe7\x4b\xdc\x9a\x47\xa0\
-\x75\x20\x84\x6c\x41\x62\x9b\xaf\x43\x07\x06\xb1\xaf\xa0\x75\x20\
-\xa4\xc8\x54\x9d\xff\x3a\xba\x9f\xcb\x24\xe4\x35\x68\x1d\x08\x21\
-\x5b\x90\xb8\xf0\x65\x78\x60\xa8\xf9\x97\xa2\x75\x20\xa4\xc8\x98\
-\xba\xdf\x17\xdd\xcf\x8d\x0b\x5f\x42\xeb\x40\x08\xd9\x02\x2d\xd6\
-\x01\x0d\x0c\xd6\xdf\x36\x38\x38\xb6\x3d\x5a\x07\x42\x8a\xcc\xc2\
-\xa1\x75\x3b\x68\x5f\x83\x4e\xf4\x6d\x58\x88\xd6\x81\x10\xb2\x05\
-\xd2\x29\xd7\x63\x57\x06\x7e\x14\xad\x01\x21\x65\x40\xfa\xdb\xa9\
-\xd8\xc9\x7e\x58\x87\xd6\x80\x10\xd2\xc1\x5a\x7b\x5f\xfc\xaa\xc0\
-\xff\x00\xad\x03\x21\x65\x40\x26\xfb\x3f\x82\xf6\x75\xe7\x6f\x35\
-\x66\xfd\x7d\xd0\x3a\x10\x42\x04\xcd\xce\x85\x5d\xfd\xeb\xfd\x7f\
-\xff\x76\xb4\x0e\x84\x94\x01\xe9\x6f\xef\x40\xf7\xf7\x64\xc8\xef\
-\x89\xd6\x81\x10\x72\xb7\x74\x45\xf0\x1e\x74\x40\xa8\xd8\xe6\x13\
-\xd1\x3a\x10\x52\x06\x16\xaf\x6c\x3d\x19\xdd\xdf\x13\xeb\xdf\x85\
-\xd6\x81\x10\x72\x37\xfc\xd5\xa0\xc4\x85\xeb\x58\xfe\x97\x90\xfe\
-\x70\xd8\x61\x9b\xee\x81\x2e\xfa\xa5\xb7\x8e\xd0\x3a\x10\x42\xee\
-\x96\x5e\x01\xfc\x0d\x74\x45\x60\x83\x47\x6b\x40\x48\x99\x90\x15\
-\xf8\x5a\xf0\x04\x60\x01\x5a\x03\x42\xc8\xdd\xd2\x09\xc0\x89\xd0\
-\x60\x60\xfd\xcf\xd1\x1a\x10\x52\x26\xaa\xd6\xff\x0a\xdc\xe7\x57\
-\xa2\x35\x20\x84\xdc\x2d\x9d\x00\xfc\x13\x1c\x0c\x58\x21\x8c\x90\
-\x3e\x82\xae\xfc\x29\x7d\xfe\x1f\x68\x0d\x08\x29\x3d\xc6\x98\x7b\
-\xc2\xaf\x00\x36\x9a\xaf\x40\xeb\x40\x48\x99\x90\x49\xff\x7e\xd0\
-\x3e\xef\xfc\xad\x7a\x16\x01\xad\x03\x21\xa5\x66\x71\xcd\x3f\x16\
-\x19\x08\xd4\x2a\xae\xf5\x38\xb4\x0e\x84\x94\x09\xbd\x75\x83\xee\
-\xf7\x4b\xec\xe8\xa3\xd1\x3a\x10\x52\x6a\x34\xff\x3e\x74\x25\x60\
-\xc3\xed\xc3\xc3\xc3\xf7\x42\xeb\x40\x48\x99\x58\x30\x36\x76\xef\
-\xc4\x85\x3b\x90\x7d\xdf\xd8\xd6\x8b\xd1\x3a\x10\x52\x6a\x24\x08\
-\x1c\x80\x9d\x00\xf8\xf3\xd0\x1a\x10\x52\x46\xaa\xd6\x5f\x84\xec\
-\xfb\x15\xd7\x7a\x2b\x5a\x03\x42\x4a\x8d\x74\xc4\x8f\x23\x83\x40\
-\xd5\x86\x93\xd0\x1a\x10\x52\x46\xa4\xff\xad\x81\xf6\xfd\x7a\xf3\
-\xa3\x68\x0d\x08\x29\x35\xd2\x11\xbf\x02\x9e\x00\xfc\x16\xad\x01\
-\x21\x65\x24\x71\xfe\x77\xc8\xbe\x6f\xac\x3f\x14\xad\x01\x21\xa5\
-\xa6\xea\xfc\x31\xc8\x20\x90\x58\xff\x1d\xb4\x06\x84\x94\x91\xc4\
-\x85\x23\xc1\x93\xff\xa3\xd1\x1a\x10\x52\x6a\xb4\x36\x37\x74\x15\
-\xe0\x5a\x9f\x47\x6b\x40\x48\x19\x31\x2e\x7c\x09\x3c\xf9\x3f\x0e\
-\xad\x01\x21\xa5\x46\x3a\x62\x1d\x1a\x04\xea\xe1\x7d\x68\x0d\x08\
-\x29\x23\x49\xc3\x7f\x10\xba\x03\xe0\xfc\x20\x5a\x03\x42\x4a\x8d\
-\x74\xc2\x51\x64\x10\xa8\x34\xfc\x1b\xd0\x1a\x10\x52\x46\x8c\x6b\
-\xbd\x09\xbb\x03\x10\x02\x5a\x03\x42\x4a\x8d\x74\xc2\xf5\xd8\x20\
-\x30\xb2\x37\x5a\x03\x42\xca\x48\x52\x0f\xfb\x40\xfb\xbe\xf3\x67\
-\xa0\x35\x20\xa4\xd4\x68\x4e\x6e\x64\x10\x30\xae\xb9\x1b\x5a\x03\
-\x42\xca\x48\xa5\xd6\xda\x1d\xbc\x03\xf0\x77\xb4\x06\x84\x94\x1a\
-\xe9\x84\x17\x42\x27\x00\xab\x46\x1e\x83\xd6\x80\x90\x32\x62\x86\
-\x46\x1f\x8f\xec\xfb\x55\xeb\xcf\x47\x6b\x40\x48\xa9\x49\x9c\xbf\
-\x1c\x3a\x01\xa8\xad\xdd\x05\xad\x01\x21\x65\x64\x60\x65\xf3\x91\
-\xd8\x09\x40\xb8\x14\xad\x01\x21\xa5\x46\x3a\xe2\x06\x64\x10\x58\
-\x54\x1b\x79\x30\x5a\x03\x42\xca\xc8\xd2\x55\x6b\x1f\x82\xec\xfb\
-\x89\xf5\x57\xa1\x35\x20\xa4\xd4\x54\xad\xbf\x01\x19\x04\x16\x0e\
-\xad\xdb\x01\xad\x01\x21\x65\xc4\x0c\x0f\xdf\x1f\x3b\x01\x08\xd7\
-\xa3\x35\x20\xa4\xd4\xc8\x04\xe0\x36\x64\x10\xd0\xaa\x64\x68\x0d\
-\x08\x29\x23\xc6\xac\xbf\x0f\x74\x02\xe0\xfc\xad\x68\x0d\x08\x29\
-\x35\x55\xe7\x37\x22\x83\xc0\x61\x87\x6d\xba\x07\x5a\x03\x42\xca\
-\x88\xf6\x3d\x64\xdf\xd7\xd8\x83\xd6\x80\x90\x52\x93\xb8\x70\x0b\
-\x32\x08\x58\x6b\xef\x8b\xd6\x80\x90\x32\x72\xdc\xf0\xf0\xfd\xa0\
-\x13\x00\x1b\x6e\x46\x6b\x40\x48\xa9\x91\x09\xc0\x75\xc8\x20\xb0\
-\x7c\x79\xf3\x01\x68\x0d\x08\x29\x23\x66\xd5\xd8\x03\x91\x7d\x3f\
-\xb1\xfe\x3f\x68\x0d\x08\x29\x35\x7a\x12\x17\x19\x04\x16\x0d\x8e\
-\x3d\x14\xad\x01\x21\x65\xc4\xd8\x93\x1f\x06\x9d\x00\xb8\xf0\x6f\
-\xb4\x06\x84\x94\x1a\xbd\x8b\x8b\x0c\x02\x7a\x17\x19\xad\x01\x21\
-\x65\x64\x89\x1d\x7d\x34\x76\x02\xe0\x2f\x46\x6b\x40\x48\xa9\xd1\
-\x6c\x5c\xc8\x20\x50\x71\xad\xc7\xcd\xf7\x1d\x86\x87\x87\xef\x35\
-\xb0\xba\xb5\xf3\xe2\xda\xc8\x13\xcc\xd0\xe8\x73\xd4\xb4\xc6\x80\
-\xac\x30\xf6\x53\xab\xb8\xe6\x9b\xe5\xc7\x03\x8c\xf5\x6f\x1f\xff\
-\xbd\xa4\xe6\x5f\x3a\xfe\x67\x35\x1d\x71\xa5\x71\xca\xae\x83\x83\
-\x63\xdb\x67\x20\x29\x21\x53\xa2\x3e\xa6\xbe\xb6\xb8\xe1\x9f\xba\
-\xd9\x57\xc5\x17\xc7\xfd\xb2\xe3\xa3\x07\x74\x7c\xb6\xed\xab\xe2\
-\xcb\xe3\x7f\x56\x7d\x5c\x7d\x5d\x7d\x7e\xbe\xcf\xa2\x7f\x17\xb2\
-\xef\x8b\x9d\x9b\x85\xa6\x84\x90\x39\xa2\xf9\xb8\xa1\xab\x80\x21\
-\xbf\xe7\x54\xcf\xa6\x87\x94\xd2\x40\xd9\x08\xfb\xcb\x9f\xfd\xb8\
-\x4c\x56\x8e\x92\xe7\x5d\x58\x4d\x4b\x18\xfb\xd1\xc4\xfa\x73\xf4\
-\x3b\x62\xc6\xab\x92\x9b\x74\x65\x52\xb5\x61\x9d\xfc\x7a\xb5\x58\
-\x45\xfe\xad\x63\x93\x86\xff\x82\x4c\x56\xde\x2a\x01\x79\x2f\x79\
-\x9e\x9d\xfa\xd9\x46\x24\x7e\xd4\x27\xd2\xc1\xbc\xd1\x7c\x9b\xfa\
-\x4a\xea\x33\xce\x27\xa9\x0f\x89\x2f\xa9\x4f\xa9\x6f\x65\xea\xab\
-\xe2\xfb\xda\x07\x3a\x15\x3d\xeb\xda\x37\xc4\x3f\x8f\xd4\xbe\xa2\
-\x7d\x46\xfb\x8e\xf6\xa1\xa9\x9e\x79\xc0\xb6\x9e\x81\x9d\x00\xf8\
-\xb3\xfa\xd9\x46\x84\x90\x09\x48\x27\x3c\x1d\x19\x04\x64\x50\x7d\
-\xf9\x12\xb7\xe6\x11\x15\xdb\x7c\xb5\x71\xe1\x4b\xe9\x00\x6f\x83\
-\x97\x1f\x2f\xc3\x06\xa7\x19\x83\xd7\xb5\x9d\xc0\xbe\x54\x7e\x3c\
-\x22\xdd\x61\x70\xcd\xdd\x8c\x31\xf7\x44\xb7\x29\xe9\x0d\xda\xb6\
-\x3a\xa8\x4a\xfb\xbf\x43\xda\xfd\xdb\xf2\xe3\xb2\x76\xff\x11\x5f\
-\x80\xfb\xe3\xd4\x96\xf6\x25\xe9\x53\xf2\x9c\xbf\x97\x49\xf4\x17\
-\xd3\xbe\x56\x5b\xbb\x8b\x4c\x56\x5e\x01\x7e\xb6\xd3\xd0\x6d\x4a\
-\x48\xa9\x91\x4e\xb8\x06\x1a\x9c\x9c\x87\xde\x42\xe8\xc1\xfb\xe8\
-\x2a\xef\x54\x99\x10\xfc\xc6\x38\x7f\xb0\x6e\xdf\x32\xd9\x51\xfe\
-\xd0\x24\x39\xe9\x67\x24\x1b\x3e\x2b\x83\xe7\x6f\x65\xa5\x3d\xa6\
-\xd7\xd6\xd0\xfe\x95\xb1\x61\x27\x2e\x36\x9c\x84\x6e\x67\x42\x4a\
-\x4d\xba\x82\xc5\x07\xa2\x62\x9b\xf5\xb7\xe9\x00\x22\x83\xc9\x8f\
-\x75\xa7\x80\x37\x1f\xe2\xe3\x78\x3b\xba\xa3\x7e\x6f\x97\x55\xf2\
-\xe1\xd2\x5e\xab\xb2\xde\xae\xa7\x4d\x6a\x06\xdd\xee\x84\x94\x1a\
-\x09\x7a\xbf\x8c\x20\x10\x94\xca\x64\x32\x70\xa7\x0c\x30\x67\x8a\
-\xfd\x50\xb7\x63\xa7\xfb\x4e\x4b\x7a\x83\x6a\x2e\xfa\xbf\x46\x26\
-\x65\x3f\x4a\xdb\x42\xda\x04\xed\x17\x65\x33\xd1\xfc\xe7\x68\x3f\
-\x20\xa4\xd4\xc8\x04\xe0\xbb\xe8\x40\x50\x76\x4b\x57\x9b\xb2\xea\
-\x14\x3b\xc4\xd8\xd1\x3d\xd0\x3e\x51\x54\xd2\x5b\x22\xd6\x7f\x4c\
-\x34\x37\xe8\x04\x58\xb4\x74\x02\xf0\x1d\xb4\x4f\x10\x52\x6a\xf4\
-\x50\x10\x3a\x10\xd0\x26\x06\xc6\xf0\x77\x3d\x58\x68\xea\xe1\xe9\
-\x68\xff\xc8\x3b\x7a\xd2\xbd\x7d\x60\xcf\x9f\x8d\x6e\x57\xda\x04\
-\xb3\xe1\x73\x68\xff\x20\xa4\xd4\x18\xd7\xfa\x00\x3c\x10\xd0\xa6\
-\x34\x59\x25\x9d\xa7\x57\xbb\xb8\x33\xd0\x3d\x03\x6e\xe4\x69\xe9\
-\xb7\x7c\xe7\xcf\x42\xb7\x1f\x6d\x6a\x33\xce\x1f\x88\xf6\x15\x42\
-\x4a\x8d\xac\x36\xdf\x88\x0e\x04\xb4\x2e\xcd\x86\xbf\xa6\x9f\x09\
-\x6a\x6b\x77\x41\xfb\x4d\x6c\xe8\x55\x52\x99\x28\x7d\x59\xfc\x79\
-\x3d\xbc\x9d\x68\x5d\x59\x62\x9b\xaf\x43\xfb\x0d\x21\xa5\x66\xa0\
-\xde\x7c\x2e\x3a\x10\xd0\x66\x19\x38\x5d\xb8\xa3\x7d\x52\x3d\x1c\
-\x90\x45\x46\xb8\xbc\xa2\xe5\x6c\xdb\x27\xf7\x83\xd1\x9b\x16\xe8\
-\x76\xa1\xcd\xce\x06\xac\x7f\x36\xda\x87\x08\x29\x35\x7a\x25\x0d\
-\x1d\x08\x68\x73\xb7\xc4\xf9\x4b\xf4\x13\x41\x16\x29\x95\xf3\x82\
-\xd6\x8f\xd0\x9d\x10\x74\x1a\x6b\xda\xfc\x6c\xd9\xb2\xe1\x07\xa1\
-\x7d\x89\x90\x52\xb3\x64\xc8\x3f\x5c\x06\x91\x5b\xd1\xc1\x80\x36\
-\x5f\xf3\x1b\xab\x36\xac\x30\xae\xf9\x42\xb4\x4f\xf5\x0a\x4d\xc3\
-\x9c\xa6\xbb\xb5\xe1\x76\xbc\xde\xb4\xf9\x58\x62\xfd\xad\x66\x45\
-\x78\x14\xda\xa7\x08\x29\x25\x8b\x57\xb6\x9e\xdc\x4e\x4c\xc3\x84\
-\x27\xc5\x33\xdf\x4c\x53\x13\x17\x20\x2d\x71\xba\xcd\xaf\xe7\x54\
-\xf4\x9a\x24\x5c\x57\x5a\x96\xa6\x0b\x0f\x9d\xd0\xe9\xa1\x4d\xb4\
-\x9f\x11\x52\x0a\x3a\xf9\xbf\xeb\x4c\x7c\x52\x7c\xd3\xeb\x84\x7a\
-\xef\x3d\x8f\x89\x86\x8c\x09\xdb\xc9\x3b\x7c\x5c\xfc\xf4\x1f\x68\
-\x1d\x69\xbd\xb6\xce\xee\x95\x0d\x2f\x43\xfb\x1d\x21\x85\x24\xa9\
-\x87\x7d\x34\xf7\x36\xbe\xb3\xd3\xfa\x6d\x32\x11\xf8\x97\x7e\x33\
-\xcf\xc3\x44\x40\x73\xf0\xeb\xa4\x45\xcf\x36\xa0\x75\xa3\x21\xcc\
-\x37\x4d\xdd\xef\x8b\xf6\x43\x42\x0a\x41\xa5\xe1\x5f\x54\x6d\x97\
-\xb5\x8d\xa0\x73\xd3\x90\x96\xb8\x70\x81\xac\xb2\x3e\x1c\xe3\xcd\
-\x01\x2d\x98\x54\xad\x37\x3f\x2a\x93\x95\x0b\xd1\x3a\xd1\xf0\x96\
-\x58\xbf\x72\xa0\xd6\x7a\x01\xda\x2f\x09\xc9\x25\x9d\x5a\xdf\x06\
-\xdd\x91\x69\x11\x9a\xf5\xe7\xeb\x2a\x3b\x86\x89\x40\xe7\x2a\xdf\
-\x01\xdc\xea\xa7\x4d\x6a\xd6\xaf\xd2\xab\xca\x68\x3f\x25\x24\x17\
-\x98\x55\x23\x8f\x91\x8e\x53\xe1\x37\x7e\xda\x4c\x96\x38\x7f\x46\
-\xc5\xfa\x57\xa2\x7c\x55\x0b\x21\x69\x21\x1e\xb4\x0e\xb4\xb8\x2d\
-\x2d\x9e\x65\xfd\xa2\x25\x76\xf4\xd1\x28\x5f\x25\x24\x6a\x06\x07\
-\xc7\xb6\xd7\xef\xbc\x89\x0d\xd7\xa3\x3b\x2c\x2d\x67\x26\xab\xac\
-\x4a\xad\xb5\x7b\xbf\x7c\x55\x6f\xa0\x54\xb9\x3b\x45\x9b\xa5\xc9\
-\x64\xf1\xc6\x34\x2d\xf6\xf0\xf0\xfd\xfb\xe5\xab\x84\x44\xcd\xa6\
-\x4d\x9b\xee\x9e\x6e\xa1\xba\x70\x01\xba\x83\xd2\x72\x6c\xd6\xdf\
-\xa6\xd7\x42\xcd\xaa\xb1\x07\xf6\xca\x57\x35\x70\x6b\x8e\x7e\xf1\
-\xd5\x5b\xe0\xef\x4b\xcb\xad\xa5\xc9\xaf\xea\xe1\x7d\x1a\xfb\x7a\
-\xe5\xab\x84\x44\x8f\xa6\xd2\x94\xa0\x1d\xd0\x1d\x92\x56\x1c\x93\
-\xe0\x7a\x79\xd5\x86\xf7\x67\x19\x5c\xf5\xef\x92\x09\xc6\x87\xd2\
-\xdb\x08\x11\xbc\x23\xad\x28\xe6\x9b\x7a\xd6\x29\x2b\x3f\x25\x24\
-\x17\xe8\x75\xae\xf6\x4a\x8a\x19\xfc\x68\x3d\xb3\x35\x95\xfa\xda\
-\xa7\xcc\xd7\x57\x17\xd7\x46\x9e\xc0\x24\x3e\xb4\x5e\x99\x66\x85\
-\xd4\x9d\xab\x85\x43\xeb\x76\xc8\x22\xb6\x12\x12\x35\x15\xd7\x7c\
-\x89\x38\xfc\xdf\xd0\x1d\x8f\x56\x7c\x4b\xb3\x44\x6a\xf5\xc1\x39\
-\x64\x14\xd4\x1b\x06\xc6\xf9\x83\xe5\xff\xbf\x01\xfd\x1e\xb4\x52\
-\xd8\xb9\xc8\x03\xad\x84\xf4\x14\xfd\x36\xab\x33\xdd\x34\x6b\x16\
-\xbe\xb3\xd1\xca\x64\x36\xac\x9b\xcd\x55\xac\xa4\x31\xf2\x4c\xf9\
-\xff\x4e\x81\x3f\x37\xad\x54\xd6\xbe\x2d\x10\x16\x9a\x46\xd8\xa9\
-\x97\xb1\x98\x90\xbe\x22\x0e\xbd\xbf\x38\xf6\x65\xe8\x0e\x46\x2b\
-\xaf\xa5\x5b\xad\xce\x7f\x73\xba\xdc\x01\x9a\xcc\x47\xfe\xcc\xb7\
-\x59\xac\x87\x06\x35\x1b\x2e\x15\x3f\x7c\x4d\x3f\x63\x34\x21\x99\
-\xa3\xdf\xfa\xf5\xda\x0b\x57\xfd\xb4\x88\xec\x14\xbd\xc6\x37\xd1\
-\x57\xcd\xd0\xe8\xe3\xf5\x50\x56\x04\xcf\x47\xa3\xb5\x77\x03\x5c\
-\x58\xa0\xd7\xa3\x11\xb1\x9b\x90\x79\xa1\x15\xb2\x74\xeb\x15\xdd\
-\x91\x68\xb4\x89\xa6\xf7\xb1\xf5\xfb\xfe\xb8\xaf\xea\x95\x2c\xe6\
-\x9f\xa0\xc5\x68\x9a\x68\xca\xd4\x9a\xcf\x42\xc6\x72\x42\xba\x46\
-\xaf\x4c\x75\x8a\xa1\xdc\x88\xee\x3c\x34\xda\x74\x26\x93\x80\x41\
-\xb1\xa5\xe8\xe7\xa0\xd1\xa6\x35\x1b\x6e\xd6\xc3\xac\x9a\x76\x1a\
-\x1d\xdf\x09\x99\x92\xa5\xab\xd6\x3e\x24\xb1\xde\xc1\x3b\x0c\x8d\
-\x46\xa3\x15\xcf\xea\x8b\x6a\x23\x0f\x46\xc7\x79\x42\xb6\x41\xb7\
-\xa9\x64\xf0\x3f\x2f\x82\x4e\x42\xa3\xd1\x68\x85\x34\xad\x36\x29\
-\x71\xf6\x79\xe8\x78\x4f\xc8\x66\xc4\x29\xdf\xc3\x2d\x7f\x1a\x8d\
-\x46\xeb\x83\xb5\x3f\x09\x7c\x08\x1d\xf7\x49\xc9\x31\x66\xfd\x7d\
-\xc4\x21\x7f\x0a\xef\x10\x05\xb0\xc4\x85\x3b\xda\xa9\x66\xfd\x59\
-\x32\xc3\x1f\x93\xdf\x6b\xa5\x19\xe8\xc4\xe4\xd7\x27\xc8\xaf\x8d\
-\xfc\x99\x3f\x8e\xff\x9e\x04\x81\x93\xdb\x7f\xce\x9f\xae\xb9\xc5\
-\xd3\xa0\x10\xc1\x7b\xd0\x4a\x60\xe2\x6b\x1d\x9f\x5b\xd7\xf1\xd5\
-\x35\x9b\x7d\x55\x7d\x54\x7d\x55\x7d\x76\xdc\x57\xc5\x97\x3b\xbe\
-\x7a\x96\xfa\xb8\xfa\x3a\xfc\x1d\x0a\x61\xfe\x58\xbd\xba\x8a\x1e\
-\x07\x48\x09\x19\x58\xdd\xda\x59\x02\x80\xc7\x77\x82\x1c\x58\x3b\
-\x60\x6a\xd9\xd8\x7a\x55\x27\x4c\xd6\x7f\xd1\x58\xff\xf6\xc4\x8e\
-\xec\xad\x57\xd2\xb2\xfa\xae\xa7\xe9\x44\xb5\x9c\xb2\xd6\x58\x30\
-\xce\xbf\x5e\x82\xee\x27\x25\xd8\x7e\xbf\x13\x94\x4f\x95\x5f\x5f\
-\x05\xd7\x82\x16\xb9\xf9\x2b\xe5\xc7\x53\xab\xed\x41\xfc\x7b\xa9\
-\x0f\xd9\xe6\xeb\xd4\xa7\x2a\x8d\x53\x76\xcd\xea\x5a\x9a\x26\xbb\
-\x51\xdf\xd7\x3e\xa0\x7d\xc1\xb8\xf0\xa5\x6a\x7b\x31\x51\xd7\x89\
-\x02\x27\xb4\x5d\xb7\x57\x73\xc9\x90\x7f\x78\x16\x6d\x42\x48\x57\
-\x18\x3b\xba\x87\x0c\x62\xe7\xe3\x9d\x3f\x5e\x93\x01\xff\x0e\xdd\
-\xa6\xd3\x20\x17\xd3\xe9\x5d\x9d\xb8\x99\x46\xeb\x55\x49\xc3\x7f\
-\x41\x9e\xf1\x77\xf2\x8c\x7f\x66\x75\xbb\xf2\x59\xda\xe6\xda\xf6\
-\xd6\x1f\x67\x5c\xeb\xf3\xf2\xeb\xfd\x62\x1a\x48\x34\x7d\xb3\xd6\
-\x72\x30\xf5\xd6\x07\x2b\x96\x3b\x06\x33\xb4\xe5\x3f\x17\x37\xfc\
-\x53\xd1\x6d\x46\x4a\x80\xa9\xfb\x7d\xc5\xe1\xae\x41\x3b\x7d\x1e\
-\x2c\xb1\xe1\xb3\xe8\xf6\xea\x86\x34\xef\xfd\xd0\xe8\x73\xd2\xdc\
-\xf7\xe9\xca\x8f\x55\xef\x8a\x66\x69\x9b\xda\xb0\xa2\x53\xce\x78\
-\x3f\x4d\xd2\x85\xf6\xbb\x6e\xe8\xec\x0c\xc0\xf5\xcb\x81\x6d\xa8\
-\xb8\xd6\xcb\xd1\xed\x45\x0a\x4c\x9a\x30\x85\x15\xfc\xba\x36\x2d\
-\x7a\x94\xd7\x9a\xdf\xba\xa2\x30\x8d\xf0\x29\x79\x8f\x3a\x0f\x78\
-\xe6\xcf\xb4\xcd\xc4\xff\x6a\x32\xe0\x1f\x94\x45\x55\x44\x14\xe9\
-\xe7\x80\x08\xf4\xcc\x83\xe9\xae\x8e\x1e\xc8\x46\xb7\x19\x29\x18\
-\x69\x3d\x74\x5d\x39\x58\x7f\x27\xda\xc9\xf3\x66\x95\x86\x7f\x11\
-\xba\xfd\xe6\x8b\xae\x16\x2b\xb6\xf9\x6a\xf1\x81\x63\x78\xd5\x33\
-\x5e\xd3\xad\x60\x19\xf8\x7f\xa8\x6d\x95\x97\x15\xfe\x74\x24\x35\
-\xff\x52\xb4\xa6\x79\xb3\x76\x0a\x61\xff\x35\x74\xdb\x91\x82\xa0\
-\xdf\xaf\x35\x27\x35\xda\xb1\xf3\x6a\xfa\x8d\x15\xdd\x86\x59\x63\
-\x1a\xe1\xf9\x55\x1b\x8e\xd6\x3b\xc9\x68\x7d\xfb\xda\x96\x11\x3c\
-\xc3\x24\xcf\x74\x41\x7a\xd0\xb3\x80\x77\xc3\xb5\x32\x1e\x5a\xdf\
-\xbc\x9a\x4c\x02\x7e\x16\xd3\xd9\x23\x92\x43\xf4\xdb\xb0\xac\xfa\
-\xfe\x80\x76\xe6\x3c\x9b\x6e\xcb\x99\xda\xda\x5d\xd0\x6d\xd9\x0b\
-\xd2\xb4\xcf\xae\xf9\x42\x09\xd4\x3f\xe1\xb9\x90\xbe\xfa\xd4\x35\
-\x32\xe0\xff\x9f\x9e\xa0\xcf\xeb\x27\xa6\x99\xd0\x03\x89\xbc\x09\
-\x30\x5f\xf3\xbf\xd7\xc3\x94\xe8\xb6\x24\x39\x24\xbd\xe3\x6f\xc3\
-\x62\xbc\x13\x17\xc1\xfc\xe1\xe8\xf6\xec\x35\xd6\xda\xfb\xca\xc0\
-\x74\x40\x27\x6f\x01\x3f\x15\xf5\xc0\xf4\x2e\xbd\xd6\xd9\xd0\xeb\
-\x9e\xe8\xf6\xee\x35\x5a\x96\x19\xad\x77\x11\x4c\xf3\x31\x68\xdf\
-\x44\xb7\x27\xc9\x11\xc6\x84\xed\x64\xd0\xb2\x68\xe7\x2d\x8a\x49\
-\x27\xbc\xba\x0c\x41\x7b\x9c\x4a\xad\xb5\x7b\x62\xc3\x8f\x59\x61\
-\x2f\x0b\xdf\x09\xd7\xab\x96\x65\xba\xe6\xa5\xb9\x06\x98\xb3\x22\
-\x53\xab\x6b\x4c\x47\xb7\x2b\xc9\x01\x66\x78\xf8\xfe\xb2\x8a\x1b\
-\x8e\xc0\x69\x8b\x66\x1f\x47\xb7\x6d\xbf\xd1\x04\x47\xb2\x62\x3d\
-\xb4\x6a\xc3\xa5\x11\xe8\x9f\x2f\x53\xcd\xac\x3f\x64\xd9\xb2\xe1\
-\x07\xa1\xdb\xb1\xdf\xc8\x84\xe7\xd3\x70\xfd\x8b\x66\x36\x9c\xa4\
-\xb1\x1d\xdd\xb6\x24\x62\xd2\x95\x3f\x07\xff\x1e\x99\x3f\xbb\xac\
-\x87\x72\x3a\x9f\x93\xde\xdf\xc9\x86\x18\x41\x5b\xc4\x6b\x32\xf8\
-\xad\xd7\xeb\xb6\xaa\x19\xba\xdd\x10\xe8\x37\x6b\xd1\xe1\x5c\x74\
-\x3b\x14\xd2\x74\x12\xc0\x9d\x00\x32\x19\x1a\x70\xda\xf7\x86\x23\
-\x70\xd4\xcc\x1c\xde\xdf\x50\x6d\xa4\xe9\x77\xf1\xcf\x92\x9a\xff\
-\x6f\x74\x3b\x23\xe9\xdc\x28\x39\x40\xfc\xec\xef\xf8\xb6\x88\xcb\
-\xf4\x7a\xa5\x7e\xdf\x2f\xfb\xa1\x2d\x9d\xfc\xa0\xdb\x62\x73\x9b\
-\xb8\xe6\x52\xe9\xb3\xd7\xa2\x9f\x23\x63\x1b\xe2\x99\x00\xb2\x15\
-\x1a\x74\x24\x00\x55\x23\x70\xce\x8c\x3a\x6e\xb8\x45\xaf\x2e\xea\
-\xe9\x7b\xdd\xf6\x92\x9f\x5f\x87\x7e\xa6\xf4\xb9\xac\xff\x87\xde\
-\xac\x40\xb7\x37\x9a\xbb\x26\x02\xfe\x1c\x74\x9b\xa0\x4d\xaf\xf1\
-\xe9\xc0\x4f\xbf\x18\x5f\xfd\xfb\xb3\xd1\x6d\xd2\x69\x97\xeb\x34\
-\x76\x2c\x1a\x1c\x7b\xa8\xfc\xfc\xc8\xc4\xf9\x9b\xd0\xcf\x94\xdd\
-\xbb\xf9\xa5\xf4\x37\x92\xd2\x09\xc6\xc7\xa3\x9d\x32\x1b\xf3\x1b\
-\xab\x36\xfc\x76\x89\x5b\xf3\x88\x2d\xdf\x51\x1c\xfe\xd7\xf8\x67\
-\xeb\x98\x0d\xef\x47\xb5\x75\x6c\xe8\xae\x53\x27\xfd\xf0\x06\x78\
-\xbb\xf4\xd9\xf4\x60\xa8\x7e\xeb\x66\x35\xb7\xbb\x90\x38\xf4\x11\
-\x74\xbb\x6c\xd1\x3e\x3f\xdf\xf2\xd9\x06\x56\x36\x1f\x99\xd6\xce\
-\xd0\x18\x13\xc1\xf3\xcd\xdf\xfc\xef\xcb\xfa\x49\x92\x74\xd0\x3b\
-\xc4\x45\x49\xf2\x23\x9d\x73\x44\xf3\xd9\x4f\xf6\x9e\x03\xb5\xd6\
-\x0b\xd0\xcf\xb7\xd9\xac\x3f\xbf\xac\xdf\x77\xa7\xa2\xbd\xca\xf2\
-\x3f\x93\x01\xf1\x76\x78\xfb\xf4\xda\x4f\xe5\x1d\xf5\x0e\xbf\x56\
-\xc3\x43\xeb\x1e\x13\x3a\x11\x8a\x29\xcb\xe4\x54\xb1\x44\x13\x2e\
-\x49\x1b\x06\xf4\xf3\x65\xe2\x8b\xd2\xe7\xfa\xdd\xce\x24\x22\xf4\
-\x7e\x3a\xda\x09\xe7\xed\xc4\x36\x5c\x68\xea\xad\x77\x2c\xff\xd6\
-\xd6\x00\x00\x20\x00\x49\x44\x41\x54\xce\x94\x10\x45\xde\xf5\x74\
-\xf4\xb3\x8e\x9b\x6e\xf9\xf6\xab\x8d\xf3\x84\xa9\x87\xa7\x8b\x3e\
-\xab\xd1\xed\xd3\x43\x1b\xd2\x4a\x9a\x68\x9d\x63\x44\xcb\x0e\x47\
-\xd0\x3e\xe3\x76\xda\x74\xcf\x9a\x26\xc0\x6a\x84\x77\xcb\x00\x7a\
-\x71\x04\xcf\x3a\x2f\x63\xda\xe0\x92\x22\x1d\xee\x5d\x79\x4e\xd8\
-\xd2\xce\x79\x1d\x16\x2c\x5f\xde\x7c\x40\x77\xef\x1b\xcf\xd5\x22\
-\xad\xcc\x66\x56\x8d\x3d\xb0\xd7\x6d\x9c\x57\xd2\xf3\x01\x2e\xfc\
-\x1b\xdd\x4e\x19\xda\x06\x4e\xfa\xa6\xe6\x78\x3b\xba\xa3\x0c\x44\
-\x97\x47\xd0\x4e\xa9\x19\xdb\xfa\x44\x37\xcf\x9d\xe6\x2b\x48\xcf\
-\x07\xe4\xb7\x5c\xb1\xc6\x51\xe3\xfc\x81\xbd\x6e\x63\x12\x11\x5a\
-\x64\x23\xcf\x35\xe0\xd3\xab\x52\x76\x64\xef\xd9\xbc\xb3\xde\xa7\
-\x8e\xaa\xaa\x9d\xf5\x47\xf5\xaa\x7d\x8b\x80\xe6\x10\x28\xc8\xe7\
-\x29\x63\xec\xc9\x0f\x43\xeb\x19\x33\x32\x08\xfd\x20\x82\x76\x6a\
-\xc7\x16\xe7\x6f\x9a\x6d\xee\x85\x4e\x3a\xec\xf5\xe8\x67\x9f\xb3\
-\x59\x7f\x9b\x96\x79\xef\x55\xfb\x92\x88\xd0\x2d\xc8\xbc\xe6\x6d\
-\xd7\x52\xc4\xc6\x86\x6f\xcc\xf5\x1b\xba\x16\xe6\x41\xbf\xc3\x5d\
-\xef\x12\x6e\x31\x8d\xf0\xa4\xac\xdb\xb7\x48\x74\x0e\x08\xc2\xdb\
-\x6a\x7e\xe6\x0f\x42\xeb\x18\x33\x5a\xaa\x38\xa6\x12\xe3\xd2\x2f\
-\x7f\x33\x97\xf7\xe8\x5c\xa3\x3e\x2c\xa6\x77\x99\xd5\x7b\x5b\x7f\
-\xb5\x4c\x64\x76\xcb\xba\x7d\x49\x44\xe8\x4a\x24\xaf\x57\xaf\xa4\
-\x73\xfd\x4d\x3a\xe7\x5e\xf3\x79\xff\x64\xc8\xef\x19\xd5\x67\x0f\
-\x1b\x96\x67\xd5\xb6\x45\x43\x06\xff\xd7\xe7\x79\x6b\x75\xb3\xdf\
-\xca\x3b\x54\x5c\xf3\xcd\x68\x3d\x63\x25\xa6\xdc\x23\x1a\x1b\x06\
-\xdc\xc8\xd3\xe6\xf3\x3e\x7a\x78\x30\xaf\x79\x2e\xf4\x10\xe6\xc0\
-\xea\xd6\xce\x59\xb5\x2d\x89\x88\xce\x0c\x35\x97\xa7\x57\xf5\x4a\
-\x8e\x7e\x6f\xcb\x42\x07\xf9\xfb\x86\xd0\xef\xb3\xd5\xbb\x39\xff\
-\x9a\x2c\xde\xab\x48\xa4\x87\x01\x35\x89\x53\x04\xed\x93\x8d\xff\
-\x86\xeb\x79\xf8\x6f\x5b\x2a\xf5\xd6\x6b\xd1\x6d\xb3\xb5\x79\x9b\
-\xc5\x7b\x69\xdd\x0f\x99\xf8\xfd\x12\xff\x3e\x73\x30\x1b\x4e\xe6\
-\xd5\xd4\x02\x22\x8d\xfb\x53\xb8\x73\xcd\x36\x70\xba\xf0\x6f\xe3\
-\x5a\x6f\xca\x52\x87\x8a\x6d\xbe\x1a\xfd\x5e\x13\xde\xf1\x02\xe6\
-\xe8\xbe\x8b\xf4\xac\x46\x4e\x77\xa9\xa6\x6d\x67\x59\x15\xea\x61\
-\x37\xb4\xbe\xb1\xd0\x39\x40\xf7\x4f\x74\xbb\x6c\xd5\x46\x8d\xe6\
-\x2b\xb2\x7c\x47\x63\xc3\x7f\xe5\xb1\xa8\x91\x16\x9f\xca\x52\x07\
-\x02\xa6\x6a\x9b\xef\x45\x3b\xd5\xac\xcd\xfa\x3f\x2f\xae\xf9\xc7\
-\xf6\x42\x0f\x09\x3c\x7f\x81\xbf\xdf\x56\xef\x1a\x8e\xee\xc5\x7b\
-\xe6\x8d\x76\x5e\x0a\xbf\x14\xde\x1e\x3d\x32\x2d\xcd\x3a\xd3\x75\
-\xd5\xb2\x20\x83\xcc\x8f\xd0\xed\x31\xa1\x6d\xc6\x7a\xf1\x9e\x4b\
-\xec\xe8\xa3\xab\xce\x8f\xa2\xdf\x6f\xd6\xc6\x84\x65\xc5\x20\x69\
-\x8c\x3c\x33\xaa\xd3\xef\x5d\x75\xc6\xb0\xb0\x97\x45\x2b\xd4\xb9\
-\xd1\xef\xb8\xb5\xf9\x8d\x7a\x92\xb8\x57\xef\x9b\x17\xf4\x10\x15\
-\xbe\x2d\x7a\x6e\x5f\x41\xeb\x8c\xc6\x34\xc2\xf3\xe3\x3b\xdf\xd1\
-\xbb\x3a\x1d\x9a\x7b\x3f\x6f\x37\x5a\xf4\x36\xc4\x7c\xcf\x5c\x11\
-\x30\x9a\x6d\x2c\xb6\x6d\xb6\xe9\x9d\x2e\xdc\x52\xad\x37\x3f\xda\
-\x73\x5d\xf4\x3c\x84\xf3\x97\xa0\xdf\x77\x2b\xb3\x61\x5d\x99\xbf\
-\xbd\x99\x46\xeb\x55\xf1\x0d\x0a\xbd\x30\xbf\x51\xbf\x7d\xa3\xf5\
-\x46\x91\x66\xfc\x73\xfe\x0c\x7c\x3b\x6c\x15\x77\x2e\xe8\x47\x6e\
-\x7c\x2d\x74\x94\xab\x9a\x02\xd6\x9f\xbf\x74\xd5\xda\x87\xf4\x5a\
-\x17\xd2\x03\xd2\xed\x54\xeb\x1d\xdc\x89\xba\xee\x84\xfe\x72\x5d\
-\x19\xf4\x4b\x1f\xf9\xb7\x3e\x85\x7e\xe7\x6d\x3b\x5c\x38\xa2\x5f\
-\xef\x1f\x13\x15\xd7\x7a\x5c\xb5\x44\xf5\x00\xf4\xbb\x70\xa5\x71\
-\xca\xae\x68\xdd\x11\xc8\x60\xfb\x5d\xb4\xfe\x13\xad\x9f\x49\x9a\
-\x34\x7f\x89\x26\x02\x43\xbf\x73\xd7\x66\xc3\x0a\x7e\xb6\xca\x21\
-\xc6\xb5\x3e\x0f\x77\x9e\x6e\x03\xa2\xf3\x67\xea\x20\xd0\x57\x7d\
-\xd2\x1a\xf5\xfe\x7c\xf4\xbb\x6f\x6d\xb2\x3a\x74\xad\x97\xf7\x53\
-\x07\x34\xed\x62\x54\xfe\x4f\x78\xed\xfb\x6c\x36\x9c\x5c\xb6\xd2\
-\xbf\x15\xd7\x7c\x49\x6c\xbb\x3c\xe9\x21\xdc\x3e\xd7\xe6\x30\x43\
-\xa3\x8f\x97\xbe\x7e\x16\xfa\xdd\xbb\x35\x5d\x2c\xf5\x53\x1f\x32\
-\x4f\xf4\x2e\xab\x04\x98\x9b\xd1\x8e\xd3\x65\x07\x3c\x71\xb6\x99\
-\xb7\xb2\x42\x67\xfe\xe8\xf7\xdf\xc6\xac\xbf\x48\xb3\xe0\x21\xf4\
-\x40\x20\x81\xf0\xeb\x70\xcd\x41\x26\xfe\x77\x28\x5a\xff\x7e\xd1\
-\xce\xc4\x19\x2e\x40\x6b\xbe\x4d\x1b\xb8\xd6\x07\x10\x7a\x68\x1f\
-\x97\xbe\x3e\x8c\x7e\xff\xae\x4c\xc6\x92\x01\xdb\x7a\x06\x42\x27\
-\x32\x4b\x8e\x1b\x1e\xbe\x9f\x34\xd8\x5f\xe1\x4e\xd3\x95\xf9\xdf\
-\x23\x2b\xe3\xe9\xf7\x48\x79\x8e\x73\xf1\x3a\x6c\x63\x06\xa5\x49\
-\x3f\xd1\x2a\x8d\x65\xa8\x00\x38\x95\xa5\x99\x2d\xa7\xa8\x3a\x57\
-\x34\xe4\x7d\x2b\x68\xbd\xb7\xd1\xdf\xfa\x7f\xf4\xe3\xdb\xff\x54\
-\xe8\xe1\x40\x89\x81\x7f\x40\xeb\xd0\x95\xd9\xb0\x4e\x9f\x17\xa5\
-\x15\xe9\x12\x71\xa8\x63\xe1\xce\xd2\x5d\xf0\xfb\x59\x0c\xf5\xa8\
-\xe3\xbb\x11\xd0\x36\xd4\xca\xa4\x5f\x68\xb2\x14\xf1\xd5\xb3\xd1\
-\x3a\xa3\x4d\x73\x1e\x14\x3d\x0f\x44\x94\x3b\x6d\xa9\xf6\xe1\x3d\
-\x68\x6d\xda\x67\xb5\xe2\xba\x12\x39\x8d\xaf\xfe\x00\xad\x17\x99\
-\x06\x4d\x72\x13\x55\xaa\xdb\xa9\x1c\xc9\x85\x23\xd1\x5a\x8d\xa3\
-\xdf\x61\x35\xcd\x30\x5a\x93\x6d\xcc\x86\x9b\x8b\xbc\x3a\x94\xf7\
-\xfb\x2d\x5c\xe3\x58\xcc\xfa\x5f\xa0\xdb\xa3\x57\x0c\x58\xff\xec\
-\x18\x4f\xbe\xeb\xb9\xa3\x18\x16\x20\xe3\xc8\xf3\x7c\x13\xad\xc9\
-\x8c\x9a\xc9\xd8\x52\xe6\x1b\x2c\x51\xd3\xce\xa0\x16\x2e\x43\x3b\
-\xc9\x4c\x66\x6c\xeb\xab\x68\xad\x26\x92\xd4\xfd\x5b\xd0\xba\x4c\
-\x1e\xa4\xc2\x05\x8b\x06\xc7\x1e\x8a\xd6\x27\x6b\xc4\x4f\xdf\x88\
-\xd6\x36\x36\x2b\x62\x60\x4d\xaf\x21\x5b\x7f\x1e\x5a\xdb\xc9\x4c\
-\x6b\x4d\xa0\xf5\x99\x48\x1e\xce\xc3\xe8\xf5\x69\x96\x32\x8f\x10\
-\x59\x45\xfc\x0a\xed\x1c\x33\x3a\x4f\xc3\x7f\x01\xad\xd3\x54\x54\
-\x23\xab\x11\xb0\xd9\xac\x5f\x55\xa4\xd3\xe2\x9a\x0e\x57\x0f\x3a\
-\xc2\x75\x8d\xcc\x64\x52\x74\x61\x91\x3e\x05\xe8\xea\xba\x6a\x43\
-\x03\xad\xeb\x54\x7d\x0a\xad\xcf\x54\xc8\xb3\x7d\x11\xae\xcf\x8c\
-\xbe\xea\x7f\x8e\xd6\x89\x6c\x81\xb1\xe1\x65\xb1\x6f\xfd\xc7\xb8\
-\xf2\xdf\x12\x2d\x40\x13\xdb\x15\xa5\x2d\x3a\xdc\x77\xd0\xfa\x64\
-\x45\x35\x87\x35\x29\xfa\xd7\xce\xe1\x47\xe8\xf6\xc9\x0a\x19\xc8\
-\x8e\x42\xeb\x39\x85\xc6\xb7\xc7\x5e\x98\x49\x4b\x9e\xa3\x75\x9a\
-\xde\xf4\xba\x72\xf3\x25\x68\x9d\xc8\xdd\x3a\x69\x26\x63\xfc\x86\
-\xbd\x65\xa7\x73\xfe\x87\x68\x9d\xba\x41\x67\xb6\x68\xad\xa6\xd6\
-\x30\xfc\x0f\x5a\x9f\xf9\xa2\x49\x50\x34\x78\xa0\xb5\x8c\xd7\xfc\
-\xc6\xa4\x1e\xf6\x41\xb7\xd3\x7c\x91\x01\xec\xc3\x78\x2d\xa7\xe8\
-\x47\x39\x29\x74\xa3\xe7\xa4\xd0\x5a\xcd\xe0\xab\x67\xeb\x8d\x33\
-\xb4\x4e\xa5\x27\x76\x47\x91\x41\xf5\xff\xd0\x1a\x75\x4b\xe7\x9b\
-\xe5\xd5\x68\xcd\x26\x35\xeb\x6f\xd3\x74\xb9\x68\x8d\xe6\x4a\x3b\
-\x1f\xba\x3f\x13\xae\x63\xe4\xa6\x93\xf9\x3c\x5f\xb7\xd2\x8a\x7a\
-\x7a\xbd\x11\xad\xe3\x14\xb6\x21\x2f\xa9\x6d\xf5\x76\x40\x35\xf6\
-\xdd\xb2\x92\x66\x2e\x8d\x86\xf4\x84\x6d\xd4\xf7\xa8\xfd\xef\xf3\
-\x96\x46\x52\x9c\xfa\x73\x78\xdd\xa6\xd4\xf3\xda\xbc\x26\xe4\x10\
-\x3f\xfd\x16\x5e\xbf\x7c\x98\x6e\x01\xa3\xdb\x6b\x2e\x68\x02\x32\
-\x59\x90\x5c\x83\xd6\x6f\x9a\xfe\x73\x10\x5a\xa3\xd9\x90\x66\xc9\
-\xb4\x7e\x11\x5e\xb7\x29\x4c\x16\x25\x79\x8d\x47\xb9\xa7\x53\x3a\
-\x75\x04\xee\x04\x53\xdb\x9a\x3c\xae\x64\xd2\xe4\x40\x36\xac\x8b\
-\x40\xbf\x49\x4d\x0f\x8b\x0d\xac\x6c\x3e\x12\xad\xd3\x6c\xa8\xd8\
-\xe6\x13\xd3\x42\x4f\x11\xe8\x97\x07\x4b\x13\x04\x35\xc2\x93\xd0\
-\xed\x36\x1b\xb4\xec\xad\x3c\xf7\xc5\x68\xed\xa6\xee\x37\x7e\x0c\
-\x99\xf4\x67\xae\xb4\x0b\x97\x85\x13\xd1\xfa\x4d\x69\x36\xf8\xbc\
-\x2d\xf2\x0a\x41\xd5\x36\xdf\x0b\x6f\xfc\x29\xcd\x9f\x95\xe7\x74\
-\xb6\x12\x2c\x9e\x17\xeb\x81\xc0\x8e\xbe\x67\x0f\xac\x6e\xed\x8c\
-\xd6\xa9\x5b\x44\xcf\x13\xf0\x9a\xe5\xcc\x6c\x58\x8c\x6e\xb7\x6e\
-\x31\xf6\xe4\x87\xc5\x9c\xdb\x5e\x77\x49\xf3\x5c\xda\xb6\xfd\x69\
-\x32\xfc\x1d\xad\xe3\x54\x66\xea\xad\x77\xa2\x35\x2a\x15\xc6\x84\
-\xed\x74\x25\x88\x6e\xf8\x49\x3b\x9b\x0b\xff\xce\xdb\xea\x65\x32\
-\x34\xeb\x15\x5a\xcb\xe9\xcd\x9f\xae\x81\x01\xad\xd3\x4c\x98\xba\
-\xdf\x17\xaf\xd5\x14\x56\xf7\x75\x63\x43\xb4\x93\x93\x3c\x9c\xf9\
-\xd0\x3b\xe1\x55\xeb\xff\x8c\xd6\x6a\x3a\x8b\x29\xf1\xd8\x5c\x49\
-\x0b\x08\x59\x7f\x05\x5a\xcb\xc9\xf5\xf5\x17\x0f\x0e\x8e\x6d\x8f\
-\xd6\xa8\x34\x44\x9b\x35\x4a\xb3\xd7\xf5\xb1\xa4\x6f\x2f\x51\x87\
-\xae\xc6\x59\x27\x60\x4b\x6b\x2d\x5f\xde\x7c\x00\x5a\xab\xa9\xd0\
-\x2d\xd7\x68\xeb\x52\xc8\xa0\xa5\x6d\x9c\xa6\x24\x8e\xf5\x93\x8f\
-\x3c\x57\xcc\x39\x20\x54\xbf\xc8\x3f\x43\xea\xd6\xff\x79\xda\xc6\
-\x68\xad\xb2\xc0\xb8\xe6\x0b\xe3\xfd\x94\xe6\xbf\x8e\xd6\xa7\x14\
-\x74\xbe\xb5\xdd\x88\x6f\xf0\x6d\x4d\xaf\xff\xa0\xf5\xc9\x12\x4d\
-\xad\x8c\xd6\x74\x46\xb3\xe1\xa4\x58\x03\x9c\x1e\xba\x82\xeb\x33\
-\x89\xe9\x4d\x8f\xc5\xb5\x91\x27\x8c\x3f\xe7\xe2\x9a\x7f\xac\xfc\
-\xde\x55\xe8\xe7\x9a\xbc\x4f\xf5\xaf\x56\xfd\x6c\x68\x4f\x9c\xe2\
-\xae\x66\xa7\xb9\x51\x74\x07\x0a\xad\x55\x96\xe8\x75\x60\xb4\xae\
-\x93\x6a\xed\xfc\x4d\x66\xd5\xc8\x63\xd0\xfa\x14\x1e\x11\x3a\x41\
-\x37\xf6\x14\x9d\xad\x90\xd9\xa1\xf4\x26\x03\x5a\xdb\x2e\x3a\xdf\
-\x48\x6c\xe9\x39\xd3\x72\xa7\xce\x5f\x89\xd6\x66\x5b\xf3\x1b\x4d\
-\x23\xec\x3f\xf1\x79\x75\xbb\x3d\xc6\x73\x1f\xfa\x49\x0d\x55\x2e\
-\x7b\x2a\xd2\x6d\x7f\xe7\x9b\x68\x6d\xba\xd0\xee\x37\x68\xad\x7a\
-\x81\xf4\xf7\x5f\xa3\xb5\x9d\x42\xef\xe3\xd1\xda\x14\x1a\x2d\x0e\
-\x13\x67\xc6\x3f\x3f\x9a\xc7\x13\xff\xdd\xa0\xc1\x2e\xc6\x3a\xe6\
-\xdb\x98\xf5\x7f\x8e\xa9\x6e\x40\xac\x99\xe0\x64\x45\x7d\xe8\x54\
-\xcf\x9c\xd8\x70\x18\xfa\xf9\x26\x33\x09\xf8\xdf\xee\x67\xdb\x4d\
-\x47\x27\x57\xc6\x5a\xb4\x26\x33\x6a\x66\xfd\x79\x9a\x76\x1a\xad\
-\x57\x2f\x48\x4b\xbe\xbb\x70\x2a\x5a\xe3\x49\x34\xbf\xd3\xd4\x9a\
-\xcf\x42\xeb\x53\x58\x64\xa0\xb5\xe8\x46\xde\x36\x38\x85\x7f\xeb\
-\x67\x09\xb4\x36\xbd\xc4\xd8\xd6\x8b\x63\x5c\x1d\x6e\x6b\xfe\x2c\
-\xb3\x22\x3c\x0a\xad\x97\xde\x50\x90\x09\xc0\x0d\x78\x3d\xb6\xb1\
-\x65\xd3\x5d\x59\x4a\xf3\xd7\xbb\x50\x8f\xe0\x39\xb7\xee\x63\x36\
-\x5c\xaf\x27\xed\xfb\xd9\x86\x93\x61\x6a\x6b\x77\x91\xc9\xc8\x19\
-\x68\x3d\xba\xe8\x07\x1b\x35\x3d\x3a\x5a\xaf\x5e\xd2\xf9\x6c\x15\
-\x61\xd2\x32\x3f\x88\xd6\xa6\x90\x54\x1a\xfe\x45\xf8\xc6\xdd\xd6\
-\x8c\x6b\xbd\x09\xad\x4d\x3f\xd0\x7c\xfc\x68\xad\xbb\x31\xad\x2f\
-\xbf\x78\x65\xeb\xc9\x48\xad\x24\x08\x1c\x83\xd6\x61\x1b\x5d\x9c\
-\xbf\xa4\x9b\x2c\x70\x3a\xd0\xc6\x58\x55\x53\xda\xf5\x7b\xfd\x68\
-\xbb\x29\x75\x71\xcd\xdd\x64\x12\xfc\x4f\xb4\x0e\xdd\x99\x3f\x1c\
-\xa9\x55\xbf\x90\x49\xce\x7f\xe1\xb5\xde\xd6\x06\x6a\xad\x17\xa0\
-\xb5\x29\x1c\x31\x26\x83\x90\xa0\xfa\x33\xb4\x2e\xfd\x22\x3d\xd1\
-\xee\xfc\x28\x5a\xf3\xae\xda\x45\x56\x06\x49\xcd\xbf\x14\xa1\xd3\
-\x12\xb7\xe6\x11\xf1\xd5\x7f\xf7\x1b\x2b\xd6\xbf\xb2\xdb\x77\xd0\
-\xc3\x9f\xb1\x7d\x6a\x53\x4d\x51\x09\xa0\x74\xf1\xa1\x3b\x7d\x68\
-\x0d\xba\xb4\x53\x34\x99\x17\x42\x27\x04\x31\x9e\x07\x90\xbe\xe3\
-\xd0\xba\x14\x0a\xdd\x82\x46\x37\xea\x24\x8d\x7c\x4e\x91\xca\x97\
-\x76\x43\x27\xa3\xdd\x75\x68\xed\xbb\x6a\x1f\x17\x6e\x91\x95\xec\
-\x7b\xfa\xad\x91\x4e\x0a\xd1\xef\x3e\x89\x16\xdf\x9f\xf5\x7b\xd8\
-\xf0\x23\xf4\x73\x6f\xdb\xe7\xfa\x5f\x2d\x50\xb4\x3b\x40\xaf\xf7\
-\xa2\xdf\xbd\x4b\x7d\xae\x47\xef\x7e\xf5\x1b\xbd\x8d\x11\x63\x92\
-\x20\xd4\x02\xa4\x90\x48\x50\xfd\x13\xba\x41\xb7\xb2\xb4\x30\x4d\
-\x31\xee\xfb\xcf\x96\xa4\xe1\x3f\x08\xd7\xbf\xeb\x80\xe8\xef\x94\
-\x00\xfe\xe5\x7e\xa5\xea\xd4\x6b\x40\xd1\xdd\x53\xb6\xe1\xaf\x73\
-\xa9\x5a\xa6\x87\x5a\xa3\xcb\x0f\x20\x03\x71\xbf\xce\xdb\xa8\xcf\
-\x68\x09\xef\xd8\x76\x42\xa6\xf7\xf7\xfe\x4f\x78\x63\x20\x3d\x1c\
-\x1e\x59\x01\x26\xdd\xb1\x46\xeb\x52\x08\xb4\xba\x16\xba\x31\x27\
-\x5a\x5e\x8b\x95\x64\x85\x38\xf7\x02\x74\x1b\xcc\xca\x6c\x58\xde\
-\x8f\x6b\x82\xd1\x95\x53\x9e\x67\xb1\x92\xa4\x31\xf2\x4c\xfd\x3b\
-\xe0\xef\xb1\x95\xf9\x63\xb3\x6c\xb3\xc9\xd0\x9d\x3d\xf9\xb7\x0c\
-\xfe\x5d\xbb\xb7\x3c\x55\x1d\xed\x05\x31\x26\x87\xab\xb8\xe6\x4b\
-\xd0\xba\xe4\x9e\xd8\x4e\xfe\xe7\xbd\x5c\x69\x16\xa4\x05\x83\x72\
-\x70\x0f\x7a\x42\xbb\xfd\xdd\xd8\xd1\x3d\x7a\xa5\x49\x7a\x78\x2e\
-\xb6\x6f\xff\x19\x94\x2b\x95\xc9\xde\x77\xe1\xef\xb1\x65\x3b\x3a\
-\x7f\x63\x2f\x4b\xda\x56\xea\x6b\x9f\x22\xbe\xb2\x1e\xfd\x9e\xb3\
-\xb4\x96\x16\xcd\xe9\x95\x26\x79\x20\x2d\x1a\x14\x5b\xbb\xc9\xc2\
-\x03\xad\x4b\xae\x59\xdc\xf0\x4f\xd5\x03\x4c\xf0\x86\xdc\x6c\x7e\
-\xa3\x1e\x08\x42\xeb\x12\x03\x95\xc6\x29\xbb\x4a\x87\xfb\x17\xbe\
-\x4d\xba\x37\x3d\xbf\x60\xac\x7f\x7b\x2f\xf4\xd0\x93\xd7\xe8\xf7\
-\x9b\xe0\xab\x67\xcf\x65\xeb\x7f\x22\xe9\xa7\x80\xc8\x0a\xdd\xe8\
-\xd6\x7c\x16\x6d\x36\x11\xf1\xe7\x37\xca\x4a\xfa\x3f\xe8\xf7\x9b\
-\x95\x59\x7f\x45\x0c\x57\x5f\x63\x40\x4f\xdf\xc7\x34\x5e\xe8\xe7\
-\xa3\x4a\xad\xb5\x3b\x5a\x97\xdc\xa2\x99\xac\xd0\x8d\xb8\x75\x83\
-\xf6\xff\x10\x52\xcc\x68\x9a\x51\xad\x34\x86\x6e\x97\xd9\x76\x4a\
-\xbd\xa6\x97\xc5\xe0\x38\x4e\xfb\x7b\x79\x4c\x85\x4a\x64\xa2\x9a\
-\xe1\xf6\xa3\xde\x29\x8f\xe9\x5b\xb8\x4e\x3c\xb3\x6c\xbf\x76\x62\
-\x19\x7f\x6c\x4c\xef\xd8\x95\x59\x7f\x1b\x0f\x9b\x6d\x8d\xf8\xc6\
-\x4f\xe0\xed\xb2\x75\x1b\xfd\x02\xad\x49\x2e\x69\x27\x53\x89\xe7\
-\xf4\xad\x56\x1f\x2c\xdb\xa9\xff\x6e\x10\x07\xff\x22\xba\x6d\xe6\
-\x66\xfe\xf4\x64\xc8\xef\x99\x89\x06\xf5\xe6\x47\xf1\xef\xb3\xa5\
-\xaf\x66\x9f\x96\x5a\xda\xf9\x57\xe8\xf7\xda\xca\xac\xff\x50\x16\
-\xef\x65\xea\xe1\xe9\xd1\x16\x6c\x9a\xb1\x9d\xc3\x67\xb3\xd0\xa0\
-\x48\x68\x71\x30\xad\xce\x87\x6e\x9b\xcd\x6d\xe4\xfc\x4d\x4b\x86\
-\xfc\xc3\xd1\xba\xe4\x0e\xfd\x7e\x89\x6e\xbc\x09\xf6\x0e\xb4\x26\
-\xb1\x22\x03\xce\x71\x11\xb4\xcf\xec\x4d\x27\x98\xd6\x1f\xa2\x19\
-\xf0\xe6\xfa\xee\x7a\x5a\x3c\xb2\x2d\xf2\x0d\xbd\x48\x89\xdc\x3e\
-\xe3\x10\xae\x89\xe0\xfd\x52\xd3\x33\x1d\xf3\x6d\x37\x2d\x34\x14\
-\x6b\x61\xb1\x19\xdf\xdf\xf9\x5f\x67\xd9\xbe\x45\x42\x6f\x43\xa0\
-\xdb\x67\x6b\x2b\x47\x62\xa6\xcc\x30\x26\x6c\x17\x53\x75\x32\x2d\
-\x36\xd3\xaf\xab\x64\x79\xa4\x7d\x28\x30\xac\x46\xb7\xd3\x3c\x6c\
-\xa8\xe2\x5a\x8f\x9b\xcb\xbb\x1b\xe7\x5f\x1f\xc1\xf3\x6f\x19\x6c\
-\x3e\x93\x71\xf3\x6e\xf1\xae\xad\xcf\xe3\xdf\xef\x2e\xab\xd4\x5b\
-\xaf\x9d\xd3\x7b\x0c\x8d\x3e\x5e\xe2\xcb\x4a\xf4\xf3\xcf\xd9\x6c\
-\x68\x68\x62\xae\xac\xdb\xb7\x28\xb4\x27\xe5\xa1\x05\x6f\xa7\x8e\
-\x69\x12\xa9\x2c\x3f\x59\x15\x1e\x09\xaa\x07\xa2\x1b\xed\x2e\xf3\
-\x1b\x25\x58\x3c\x0f\xad\x49\xec\x68\xe1\x11\xdd\x56\xc7\xb7\xd7\
-\x5c\x3b\xa9\xac\x04\xad\x3f\x64\xb6\xf5\xe7\x25\x18\xaf\x40\x3f\
-\xfb\x16\xbe\x7a\x56\x2f\xb3\xc0\xe9\xdf\x1d\x55\xd2\x95\x59\x9e\
-\xb2\xd6\x1d\x83\x74\xd5\x6f\xc3\xf5\xf0\x67\x9f\xab\x9f\xda\xb0\
-\x3e\xb6\xea\x88\x31\xa2\xb9\x01\x62\x3a\x10\x68\x1a\xe1\xdd\x68\
-\x4d\x72\x83\x74\xec\x93\xd1\x0d\xb6\xb9\xc3\x15\xb4\xa4\x66\x2f\
-\xd0\xd3\xc8\x31\x7d\x7f\x9b\xa3\x9d\x26\x6d\xbe\x57\x37\xef\xab\
-\x49\x69\x62\x2a\x92\x34\x59\x99\xdf\xac\xa9\x34\xfc\x1b\xd0\xef\
-\xb9\xb9\x6f\xda\x70\x7b\xb7\xe9\x81\x35\x1f\x42\x1e\xaa\xf8\x4d\
-\x6b\x36\x5c\xca\x9a\xf3\xdd\x23\xfe\xb1\x10\xde\x66\x77\xb5\xdd\
-\x49\x68\x3d\x72\x81\x5e\xfd\x8b\xe5\x34\xae\xae\x0a\x35\xb7\x3b\
-\x5a\x93\x3c\x91\xce\xbc\xe3\xac\x84\x37\x8b\xce\xea\x6f\x93\x0e\
-\x7b\xf4\x4c\xc9\x83\x64\x85\xf1\x75\xf8\xb3\xde\x65\x43\xfd\x6a\
-\xe3\xc8\xea\x72\x7c\x65\xba\x67\x5d\x54\x1b\x79\xb0\xde\xde\xc9\
-\xdb\x6d\x95\x89\x96\x5e\x61\x65\xa9\xd9\x59\xa1\x13\xf4\x58\x0e\
-\x92\xeb\x98\x56\xb6\x34\xcd\x73\x42\x84\xfa\x01\xba\xb1\xb6\xe8\
-\x74\xb3\xce\xa1\x4e\xd2\x9a\xe9\xfb\xc7\x96\x9a\x73\x6e\x9d\x36\
-\xfc\x4b\xb7\x8c\x27\xfb\x2c\xa0\xdb\xc9\xe2\x1f\x17\xa0\x9f\x71\
-\xdc\xfa\x59\x81\x2c\xa6\xca\x9c\x5a\xf7\x7e\xb2\xc3\x80\xda\x66\
-\xc6\xb6\x3e\x21\x93\xb4\x2b\xd1\xcf\x38\xef\x77\x74\xe1\x16\xd3\
-\x68\xbd\xaa\x5f\xed\x5b\x24\x62\xaa\x69\x21\xed\x78\x24\x5a\x8f\
-\xa8\x49\xb3\x39\xc5\x52\x75\x4b\x56\xb1\xbc\xbe\x31\x77\x2a\xae\
-\xf5\xd6\xbc\xaf\xba\xee\xf2\x85\xb0\x4e\x53\x52\x6f\xf9\x7e\x3a\
-\xc9\x81\x3f\xd7\x66\xeb\x7f\x0d\x72\xad\x78\x86\x7f\xef\xb6\x4d\
-\xac\x74\xa8\xbf\x96\x09\xe8\x19\xe8\xe7\xca\xc2\xb4\x0f\x55\x5c\
-\xf3\xcd\xfd\x6e\xdf\xa2\x60\x6a\x6b\x77\x89\xe6\xa6\x87\xf5\x57\
-\x94\xa9\x52\xe3\xac\x31\xf5\xd6\x3b\xe1\x8d\x34\xde\xf1\x9c\xff\
-\x36\x5a\x8f\xbc\x53\xb5\xcd\xf7\xc6\x74\x10\x67\xfe\xe6\x9b\x9a\
-\x14\xa7\xfd\x6e\x7e\x09\xfe\x79\xda\x5b\x8b\x03\xd6\x3f\xbb\xdf\
-\x6d\x9b\x16\x60\x89\xe4\x53\x9d\x58\x25\x7d\x26\xd7\x7c\x61\x5c\
-\x87\x32\xe7\xed\x6f\x1b\x79\x78\x6c\xfe\x88\x9f\x7e\x0f\xdf\x96\
-\x6d\xd3\x85\x11\x5a\x8f\x68\x89\x65\x55\xa1\xe9\x40\xa5\xe3\xed\
-\x84\xd6\xa3\x08\x68\xf5\xc0\x88\x06\x8a\x4c\xcc\x68\x75\xca\x58\
-\x76\x37\x6c\x58\x0c\x6b\x5b\xeb\x4f\x80\xbf\xbf\x4b\xb7\x56\xf5\
-\x73\xd3\x32\xf4\x73\x64\xfa\x4e\xed\x4a\x96\xff\x83\x6a\xdb\x22\
-\xa1\x79\x31\xe2\x29\x63\xde\xff\xdd\xba\x5c\xa0\x05\x3e\x62\xa9\
-\x3c\x26\x9d\xef\x3b\x68\x3d\x8a\x44\x6c\xf7\xc7\x8b\x64\xc8\x83\
-\x61\x03\xf5\xe6\x73\xd1\xef\x5f\x58\xb3\xe1\x73\xa8\x76\x2d\x22\
-\xb1\xec\x02\xe8\x79\x0e\x5e\xe3\x9c\x84\x58\xd2\xa9\x6a\x03\xf1\
-\xe4\x7f\xf6\x18\x17\xbe\x54\xb4\x9d\x00\xb4\x69\x32\x1b\x74\xbb\
-\xca\xa4\x7d\x18\xad\x43\x91\x2c\xed\x23\xd6\x7f\x11\xdd\xae\x45\
-\xa3\x73\x45\x39\x8a\x83\xc9\xb2\x20\xfa\x00\x5a\x8f\xe8\x10\xa7\
-\x5f\x85\x6e\x98\xb4\x03\xf2\xde\x7f\xcf\x90\xe0\xf6\x49\x4e\x02\
-\xb2\xf4\x55\xff\x1a\x74\x9b\xc6\x94\x17\x20\xff\x96\x9e\x97\xf9\
-\x38\xba\x4d\x8b\x8a\xe8\xfb\x7b\x7c\x1b\xa7\xed\x6c\xd1\x5a\x44\
-\x45\x9a\x67\x3c\x82\x6f\xaa\xe9\x81\x2a\x37\xf2\x34\xb4\x1e\x45\
-\x46\x0f\x35\xc5\xd0\xd6\xb9\x37\x1b\xfe\x1a\x43\x7a\x6a\x7d\x06\
-\x99\x88\x9c\x09\xd7\x23\xe7\xa6\x09\xa5\xb8\x32\xec\x2d\x5a\xf8\
-\x29\x8a\x05\x88\xf5\xb7\xe9\x27\x6f\xb4\x1e\xd1\xd0\xbe\xaf\x8b\
-\xef\x84\x62\x75\xb4\x16\x65\x40\x82\xdd\x01\xb1\x6c\xc7\xe5\xd5\
-\x62\x1a\x2c\x8c\x0d\x1f\x46\xeb\x91\x67\xd3\xbe\xc0\xd3\xe1\xfd\
-\x41\xf4\x1e\x42\xb7\x77\xbb\xcd\xc3\x47\xd0\x5a\x44\x43\x2c\x99\
-\xc5\xe6\x5a\x5c\x84\xcc\x9e\xb4\x88\x4e\x24\x59\xba\xf2\x67\xfe\
-\x4a\x6b\xed\x7d\xd1\x6d\x38\x8e\x16\x3a\x91\x95\xd5\xd5\x78\x5d\
-\xf2\x67\x7a\x47\xbd\x1f\x29\x9c\x49\x9b\x58\x3e\x59\xc5\x70\x7e\
-\x27\x0a\xd2\x22\x32\x31\x9c\xfe\xb7\xfe\xa2\xd9\x16\x82\x21\xf3\
-\xa3\x9d\x51\x2e\xff\x99\xda\x00\xc1\xe3\x07\xe8\xb6\x9b\x48\x62\
-\xc3\x8f\xd1\xba\xe4\xcd\x34\xe9\x59\x62\x47\xf6\x46\xb7\x5d\x99\
-\xd0\x18\x2f\xbe\x7a\x21\xba\xed\x75\xcc\x9b\x29\xd5\x78\x29\x30\
-\xd6\xbf\x1d\xde\x18\x62\xc6\x86\x6f\xa0\xb5\x28\x23\xb2\xfa\x79\
-\x92\x0c\x68\xff\x40\xb7\x7f\x9e\xcc\xd8\xd1\x3d\xd0\xed\x36\x91\
-\x64\xc8\xef\x89\xd6\x25\x4f\xa6\x55\x15\x2b\xb6\xf9\x44\x74\xbb\
-\x95\x11\xd1\xfe\x5b\xe8\xf6\x6f\xf7\xe3\xf0\x5f\x68\x2d\xe0\xe8\
-\xa9\x7b\x74\x43\xa4\x19\xb7\x58\x65\x0b\x86\x26\x5d\x92\x76\x58\
-\x83\xf7\x83\xf8\x2d\x71\x7e\x04\xdd\x5e\x53\x21\xfd\x68\x14\xad\
-\x4f\x1e\x4c\x06\xa0\xa0\x07\x9f\xd1\xed\x55\x56\x34\xd6\xc7\x50\
-\xc5\x53\x9e\x61\x01\x5a\x0b\x28\x9d\x13\xc4\x97\xc0\x1b\xc2\x86\
-\x1a\x5a\x8b\xb2\x93\x7e\x47\x76\x3e\x41\xfb\x42\xec\x56\xa9\x35\
-\x7f\xab\x85\x7f\xcc\xf0\xf0\xfd\xd1\x6d\x36\x8e\x3e\x8b\x6e\x65\
-\xff\x31\x9a\x6b\x56\xf1\x9a\xc4\x9a\x81\x98\xce\x6f\x94\x95\x6a\
-\x04\x87\x01\xb5\x74\x3a\x5a\x07\x28\x49\x63\xe4\x99\xe8\x46\x68\
-\x37\x44\x38\x00\xad\x05\x69\x4f\x08\xab\x36\x1c\x11\xc5\x55\x9d\
-\xe8\xcd\x6f\xd4\x00\xa2\x3b\x02\x5a\xf7\x5c\x7e\xfc\xa6\xa6\x5d\
-\x36\x75\xbf\xaf\x5e\x77\x1a\x58\xd9\x7c\xa4\x16\xd7\x9a\x6f\x9b\
-\xe8\x60\x95\xfe\x5d\xf2\x77\xea\xdf\xdd\x4e\xed\x1c\xbe\xd5\xf9\
-\x37\x47\x74\x02\xcf\xf6\x9a\xd9\xda\xa9\x7d\xfd\x37\x63\xb8\xba\
-\x49\xd2\xdd\xaa\xff\x46\xfb\x44\xea\x17\x43\x7e\x4f\xb4\x16\x30\
-\x8c\xf5\x87\xa2\x1b\x40\xab\xfe\x2d\x1c\x5a\xb7\x03\x5a\x0b\x72\
-\x17\x5a\xfd\x4c\x3a\xe8\xb5\x70\xdf\x28\x80\xa5\x39\xd0\xad\x3f\
-\x5f\x06\xa0\x31\x35\x99\x60\x9d\xa4\x49\xb7\x3a\x75\x37\x8c\x5a\
-\xfa\x73\x4d\xc4\x65\xfd\x70\xfb\xcf\xf8\x3f\x6b\xa9\x63\x19\xe4\
-\xaf\x47\x3f\x7f\x11\x4c\xb4\xbc\x46\xb4\x7c\x23\xba\x5f\x91\xbb\
-\xd0\x98\xaf\xb1\x1f\xed\x1b\xa5\xce\xfa\x18\x43\x1a\x51\xdd\x76\
-\x46\xeb\x40\xb6\x65\xf1\xca\xd6\x93\x35\xd9\x0d\xda\x3f\x68\xb4\
-\xf9\x98\x0c\xfc\x7f\xab\xd4\x5a\xbb\xa3\xfb\x13\xd9\x16\x2d\xa4\
-\x85\xf6\x0f\xb1\xd5\x68\x1d\x20\xe8\xd6\x62\x0c\xf7\xc0\x79\x12\
-\x33\x5e\xd2\x6f\xcb\x3c\x17\x40\xcb\xa9\xe9\xf7\x7e\xee\x2e\xc6\
-\x8b\x7e\xfa\x85\xfb\x88\xf3\x37\x65\xf1\xa9\x2e\x77\xa4\xb5\xbb\
-\xe1\xe2\x87\xeb\x8c\x09\xdb\xa1\xb5\x20\x53\x93\x1e\x14\x6d\xf8\
-\x2f\x44\x91\x2b\x82\x46\xeb\xc2\xda\x59\x2e\xfd\x67\xd0\x7d\x87\
-\x4c\xcf\xe0\xe0\xd8\xf6\x31\x7c\xe6\x32\x8d\xf0\x7c\xb4\x16\x7d\
-\x27\x0d\xea\xf8\xce\x5a\x41\xeb\x40\xba\xa3\x5d\x7a\xd6\x9f\x1d\
-\x81\xcf\xd0\x68\x53\x9a\x6e\xf9\xcb\xc2\x62\x2f\x74\x7f\x21\xdd\
-\x51\x6d\x9f\x83\xc1\xfa\x4d\x19\x4b\x3f\xcb\x8b\x2f\x43\x0b\x6f\
-\x9c\x3f\x10\xad\x03\xe9\x1e\xdd\xad\x61\xc6\x39\x5a\xac\xa6\x37\
-\x23\xb8\xe5\x9f\x2f\xf4\x56\x0b\xda\x6f\xf4\x2c\x02\x5a\x87\xbe\
-\x93\x38\x7f\x39\x56\x78\xbf\x71\x60\x75\x6b\x67\xb4\x0e\x64\xf6\
-\xe8\xb9\x8d\xc4\xfa\xab\xe0\x1d\x97\x46\x4b\xcd\x5f\xa9\x37\x57\
-\xd0\xfd\x82\xcc\x1e\x53\x5b\xbb\x0b\xfc\x1a\xab\xf5\x57\xa0\x75\
-\xe8\x2b\xe9\x09\x6f\x78\xa7\x0d\xa7\xa2\x75\x20\x73\xc7\xac\x08\
-\x8f\x4a\xaf\xae\xe1\xfd\x88\x56\x66\xb3\xa1\xb1\xc4\xad\x79\x04\
-\xba\x3f\x90\xb9\x23\x6d\xb8\x0e\xed\x47\x8b\x6b\x23\x4f\x40\xeb\
-\xd0\x37\x92\x7a\x78\x1f\x5a\x70\x4d\x38\x83\xd6\x81\xcc\x9f\xf6\
-\x49\x5e\x16\x14\xa2\xf5\xd7\xf4\x6e\xbf\xb1\xfe\x63\x4c\xec\x93\
-\x7f\x64\x21\xf1\xff\xd0\xfe\x54\xb5\xcd\xf7\xa2\x75\xe8\x1b\x12\
-\xb0\x8f\x41\x0b\x2e\x93\x90\x7d\xd0\x3a\x90\x6c\xd0\x4f\x39\xfa\
-\xfd\x15\xed\x53\xb4\xd2\x98\x59\x32\xe4\x1f\x8e\xf6\x7b\x92\x0d\
-\xc6\x86\x97\xc1\x7d\xca\x86\xa3\xd1\x3a\xf4\x0d\x99\x3d\x9f\x08\
-\x16\xfb\xe6\x52\xde\xbd\x2c\x38\xc6\xf9\xd7\x47\x51\xea\x93\x56\
-\x4c\xb3\xe1\x52\xe6\x0d\x29\x1e\x31\xe4\xa4\x49\xac\x5f\x89\xd6\
-\xa1\x6f\x68\x1d\x6c\x70\x47\x3e\x19\xad\x01\xe9\x0d\xc7\xdb\xd1\
-\x1d\xf5\xa6\x80\xd8\xed\xf0\x01\x83\x56\x0c\x4b\x73\x50\xf8\x63\
-\x96\x2f\x6f\x3e\x00\xed\xdf\xa4\x37\xc8\x98\xe0\x91\x3e\xa6\x63\
-\x22\x5a\x83\xbe\xa0\x85\x45\xd0\x1d\x5a\xc4\xfe\x2e\x5a\x07\xd2\
-\x5b\x8c\x6b\xee\xa6\x55\x1e\xd1\xbe\x46\xcb\xb9\x69\xdd\x84\x32\
-\x17\x6c\x29\x09\xb2\x02\xff\x1e\xda\xd7\x4a\xf1\x59\xc9\x34\xc2\
-\xfe\x68\xa1\x2b\x0d\xff\x06\xb4\x0e\xa4\x3f\xc8\x64\x6f\x3f\x99\
-\x08\xac\x47\xfb\x1c\x2d\x6f\xe6\xcf\x66\x95\xd0\xf2\xd0\x2e\x40\
-\x86\xf5\x39\x8d\x55\x68\x1d\x7a\x8e\xbc\xe4\xff\x42\x45\xb6\xfe\
-\xce\x45\x83\x63\x0f\x45\xeb\x40\xfa\x87\x9e\xf7\x30\xae\xf5\x79\
-\x3d\xb9\x8d\xee\xe4\xb4\xe8\x6d\x83\x4c\x18\x3f\xbb\x60\x6c\xec\
-\xde\x68\xbf\x25\xfd\x43\xc7\x04\x74\x3e\x00\x8d\x51\x68\x1d\x7a\
-\x0e\xfa\xb4\xb6\x0c\x02\xff\x44\x6b\x40\x30\x98\x46\xd8\x49\x56\
-\x76\x87\xb3\xd4\x30\x6d\x1b\xb3\xfe\x06\x89\x0d\x47\x2e\xaa\x8d\
-\x3c\x18\xed\xa7\x04\x83\x4c\x00\xce\x43\xfa\xa0\xfc\xfb\xc7\xa1\
-\x35\xe8\x39\x32\x01\x08\x50\x91\x9d\x5f\x8a\xd6\x80\x60\x31\xf6\
-\xe4\x87\xe9\xb5\x1b\xad\xc4\x05\x1f\x78\x68\x50\x13\x1f\xb8\x51\
-\xbf\xff\x72\x57\x90\x88\x1f\x9c\x00\xf5\xc7\x32\x1c\x4e\x8f\x20\
-\x05\xf0\xe1\x68\x0d\x48\x1c\xe8\x44\x40\x57\x7d\xe8\x2b\x40\x53\
-\x0f\x4e\xf8\x67\x28\xaa\x69\xc5\x3e\xd1\x77\x81\x1e\x4a\x46\xfb\
-\x21\x89\x03\x4d\x0e\x07\xf6\xc9\x8b\xd1\x1a\xf4\x94\xe3\x86\x87\
-\xef\x87\xfe\xce\x92\x34\x9a\x6f\x43\xeb\x40\xe2\x42\xd3\x0a\xeb\
-\x2a\x50\xec\x3f\xe8\x81\x89\xd6\xe3\xfe\xef\xc2\x35\x3a\xe9\xe3\
-\xc0\x4f\x26\x22\xfe\xf1\x0e\xac\x7f\xfa\x8d\x9a\x93\x00\xad\x43\
-\xcf\x58\xdc\xf0\x4f\x45\x07\x00\xad\x43\x80\xd6\x81\xc4\x89\x19\
-\x1e\xbe\xbf\x71\xfe\x60\x19\x20\x2e\x40\xfb\x29\x2d\x5b\x4b\x6c\
-\xb8\x4c\x77\xff\x96\x2d\x1b\x7e\x10\xda\xcf\x48\x9c\x70\x7c\xea\
-\x31\xe8\x2b\x80\xfa\xcd\xf7\xb0\xc3\x36\xdd\x03\xad\x03\x89\x1b\
-\xf5\x91\xaa\x6d\xb1\xd0\x50\x41\x2c\xa9\xfb\x3f\xf1\x54\x3f\x99\
-\x09\x63\xcc\x3d\x65\xf2\x7f\x0b\xd2\x57\x2b\xb6\xf9\x6a\xb4\x0e\
-\x3d\xc3\xd8\xd6\x27\xa0\x81\xc0\xf9\x33\xd1\x1a\x90\x7c\x50\xb5\
-\xe1\x24\xf4\xc0\x45\xcb\xc8\xac\x5f\x85\xf6\x27\x92\x0f\x34\xff\
-\x03\xd2\x57\xb5\xc0\x14\x5a\x83\x9e\x21\x1d\xf1\x28\x70\x30\xa8\
-\xa3\x35\x20\xf9\x00\x7d\x25\x88\x96\xa9\x9d\x8b\xf6\x27\x92\x0f\
-\xb4\xbc\x33\xd2\x57\x0b\x9d\xa5\x56\x5e\xee\x78\xa8\xb8\x36\xfc\
-\x04\xad\x01\xc9\x07\xe8\xad\x40\x5a\x86\xfd\xde\xf9\x9b\xd0\xfe\
-\x44\xf2\x81\x2c\x52\x7f\x01\xf6\xd5\xdf\xa1\x35\xe8\x19\x55\xe7\
-\x2d\x34\x18\x58\xff\x45\xb4\x06\x24\x7e\xb4\xe8\x0b\x7a\xd0\xa2\
-\x65\x6b\x83\x83\x63\xdb\xa3\xfd\x8a\xc4\x8f\x8c\x11\x87\x40\x7d\
-\xd5\x86\x15\x68\x0d\x7a\x86\xbc\xe0\x29\x48\x71\x8d\xf5\x6f\x47\
-\x6b\x40\xe2\xa7\xe2\x5a\x8f\x43\x0f\x58\xb4\x6c\xad\xd2\x38\x65\
-\x57\xb4\x5f\x91\xf8\x31\xf5\xd6\x3b\xc1\xbe\xda\x42\x6b\xd0\x33\
-\xe4\xe5\xce\x45\x8a\x9b\xd8\x91\xbd\xd1\x1a\x90\xf8\x31\x43\xa3\
-\xcf\x41\x0f\x58\xb4\x6c\x6d\xc0\xfa\x67\xa3\xfd\x8a\xc4\x4f\xa5\
-\xe1\x5f\x84\xf4\xd3\xc4\xfa\x7f\xa0\x35\xe8\x19\xe8\x44\x2b\x15\
-\xdb\x7c\x22\x5a\x03\x12\x3f\x89\xf3\xaf\x41\x0f\x58\xb4\x6c\xad\
-\x14\x95\xd6\xc8\xbc\xa9\xd4\xd7\x3e\x05\xea\xa7\xd6\x5f\x8d\xd6\
-\xa0\x27\xe8\x3d\x5c\x74\x16\x40\x26\x01\x21\xdd\x60\x1a\xe1\xdd\
-\xe8\x01\x8b\x96\xad\xe9\xd6\x2e\xda\xaf\x48\xfc\x2c\x5d\xb5\xf6\
-\x21\x48\x3f\xd5\x31\x72\x78\x78\xf8\x5e\x68\x1d\x32\xc7\xd4\xd6\
-\xee\x82\x15\x36\xdc\xbe\x69\xd3\xa6\xbb\xa3\x75\x20\xf1\x53\x75\
-\xfe\x33\x60\x5f\xbd\x4e\x56\xac\x77\xa0\x07\xcd\xcc\xde\xa7\xfd\
-\x2e\xd7\x61\x9f\xc3\x1f\x84\xf6\x2b\x12\x3f\x9a\x04\x0c\xdd\xf7\
-\xb4\x46\x09\x5a\x87\xcc\x31\xae\xb9\x1b\x38\x08\xfd\x1b\xad\x01\
-\xc9\x07\x89\xf3\x5f\x83\xfa\xaa\x0d\x3f\xd1\x53\xeb\x03\xf5\xe6\
-\x73\x8d\x0d\x1f\x96\x5f\xff\x48\xef\x27\xcb\x8f\x7f\x8f\xfa\x7a\
-\xa2\x0d\x37\xa7\xcf\x68\xbd\x93\x01\xf7\x98\xaa\xf5\x1f\x4a\xdf\
-\xc1\x84\xed\x44\xd3\x9f\x21\x9f\xcd\xd8\xd6\x57\xd1\x7e\x45\xf2\
-\x81\xf8\xef\x55\x48\x5f\x2d\x64\x3a\xe0\x01\xdb\x7a\x06\x36\x40\
-\xf9\xb3\xd0\x1a\x90\x7c\x10\x41\x55\xb0\x6f\x4e\xf5\x6c\xba\x8b\
-\xa5\x85\x6c\x92\x7a\xd8\xa7\x6a\x9b\xef\x4d\x27\x2b\x7a\x77\xd9\
-\xfa\x25\xf2\xf3\x3f\xc9\xb3\xff\x55\xf3\xde\x6b\xb5\xbb\x0c\x9f\
-\xe7\xd6\x34\x97\xbe\xfe\xdd\xe9\xbf\xe1\x97\xe8\xbf\xa9\xff\xb6\
-\xfc\xfe\x7b\xf4\x59\xf4\x99\xa6\xdb\x61\x83\x6b\x6a\xc3\xb7\x7a\
-\xe3\x2d\xa4\x68\xe8\x24\x16\xea\xab\x43\x7e\x4f\xb4\x06\x99\xa3\
-\x2b\x01\xa4\xa8\x62\xa7\xa2\x35\x20\xf9\x40\x2b\x03\x22\x7d\xd5\
-\xb8\xf0\xa5\x2c\xde\x43\xf3\x19\xe8\x95\x46\xdd\x7d\xd3\x9b\x0d\
-\x6a\xf2\xeb\x97\xeb\x81\x38\xad\xcb\x21\x3f\x1e\xa0\xd6\xf9\xf9\
-\x7e\x49\xa3\xf9\x8a\xf1\x3f\xa7\x85\x51\xe4\xc7\xc7\x1f\x6f\x47\
-\x77\xcc\xe2\x59\x8c\xf5\x87\x42\x83\xaa\x0b\x47\x66\xf1\x1e\xa4\
-\xf8\x88\xbf\x9c\x06\xf6\xd5\xbd\xd0\x1a\x64\x4e\xba\x62\x81\x4e\
-\x00\x7c\x13\xad\x01\xc9\x07\xe9\x96\x3b\x74\x02\xe0\x0f\x46\x6b\
-\x90\x35\x55\x1b\x3e\x87\x0d\xaa\xfe\x87\x68\x0d\x48\x3e\x10\x7f\
-\x69\x61\xfb\x7f\xf3\x85\x68\x0d\x32\x47\x57\x17\xd0\x09\x80\x0d\
-\x27\xa1\x35\x20\xf9\x20\xb1\xfe\xe7\xd0\x00\x60\x5b\x9f\x40\x6b\
-\x90\x35\xa2\xe9\x27\xa1\xfd\xdf\x85\x9f\xa2\x35\x20\xf9\x20\xfd\
-\xcc\x05\xed\xff\xe1\x65\x68\x0d\x32\x07\x5d\x0a\x58\x0f\x51\xa1\
-\x35\x20\xf9\x20\x71\xe1\x37\x58\x5f\xf5\x1f\x42\x6b\x90\x35\xa2\
-\xe9\x47\xc0\x9a\xfe\x0a\xad\x01\xc9\x07\xe2\x2f\x43\x48\x5f\x2d\
-\x64\x49\x60\xe3\x5a\x6f\x42\x8a\x2a\x2b\x90\x13\xd0\x1a\x90\x7c\
-\x80\x2e\x5a\xa5\x87\xfb\xd0\x1a\x64\x8d\x71\xfe\x40\x6c\xff\x0f\
-\x0b\xd1\x1a\x90\x7c\xa0\xf9\xf8\xa1\x13\x80\x86\x7f\x03\x5a\x83\
-\xcc\x49\x1a\xcd\xb7\x61\x83\x6a\x58\x8c\xd6\x80\xe4\x03\x99\x2c\
-\x56\xa1\xbe\xea\xc2\x3b\xd0\x1a\x64\x0d\x3a\xc7\x7a\xe2\x7c\x82\
-\xd6\x80\xe4\x03\x1d\x2b\xa0\xbe\x2a\x63\x25\x5a\x83\xcc\x49\xea\
-\xfe\x2d\xe0\xa0\xba\x0c\xad\x01\xc9\x07\x32\x01\x58\x84\xf4\x55\
-\xcd\x44\x88\xd6\x20\x6b\xf4\xba\x20\xb6\xff\xfb\x3f\xa0\x35\x20\
-\xf9\x40\x26\x00\xcb\x91\xbe\x5a\x71\xcd\x37\xa3\x35\xc8\x9c\xc4\
-\x36\x5f\x07\x9e\x00\xd4\xd1\x1a\x90\x7c\x20\x13\x80\xe3\xa0\x13\
-\x00\xd7\xfa\x00\x5a\x83\xac\x49\x1a\xfe\x83\xd0\xfe\x6f\xc3\x6f\
-\xd1\x1a\x90\x7c\xd0\x4e\x64\x05\xec\xff\x8d\xb0\x3f\x5a\x83\xcc\
-\xa9\x58\xff\x4a\xf0\x04\x60\x35\x5a\x03\x92\x0f\x12\x17\x16\x40\
-\x03\x80\xf5\x1f\x43\x6b\x90\x35\xf2\x5e\x1f\x47\x6a\xaa\x37\x3b\
-\xd0\x1a\x90\x7c\xa0\x37\xc6\xa0\xbe\xda\x68\xbe\x02\xad\x41\xe6\
-\x54\x5c\xf3\x25\xd0\x09\x80\x0d\x27\xa3\x35\x20\xf9\xa0\xea\xfc\
-\xb1\xd8\xc1\x2a\x7c\x1a\xad\x41\xd6\x68\x6e\x03\xb0\xa6\x3f\x42\
-\x6b\x40\xf2\x81\xe6\x8c\x41\xfa\xaa\x96\x24\x46\x6b\x90\x39\x03\
-\xb5\xd6\x0b\xb0\x01\xc0\xaf\x45\x6b\x40\xf2\x81\x4c\x16\x8f\x86\
-\xfa\x6a\xc3\x7f\x01\xad\x41\xd6\x68\x76\x43\xa4\xa6\x55\xeb\x8f\
-\x42\x6b\x40\xf2\x81\xf8\xcb\xa9\x48\x5f\xd5\xac\xb9\x68\x0d\x32\
-\xc7\xd4\x9a\xcf\x82\x06\x00\xe7\x4f\x47\x6b\x40\xf2\x81\x4c\x16\
-\xbf\x03\x9d\x00\x38\xff\x35\xb4\x06\x59\x23\xfd\xef\xeb\xd8\x09\
-\x40\x38\x02\xad\x01\xc9\x07\x5a\xf3\x02\xe9\xab\xa6\x1e\x9e\x8e\
-\xd6\x20\x73\x8c\x1d\xdd\x03\x1c\x54\x2f\x41\x6b\x40\xf2\x81\x0c\
-\x56\x87\x83\x7d\xb5\x70\x69\x6b\xd1\xe9\x95\x8b\x38\xa9\x22\xbd\
-\x21\x2d\x7c\x05\xf4\xd5\x4a\x7d\xed\x53\xd0\x1a\x64\x4e\xa5\x71\
-\xca\xae\x48\x51\xb5\x54\x29\x5a\x03\x92\x0f\x74\x0b\x1e\xea\xab\
-\xce\xff\x1e\xad\x41\xd6\xa0\x93\x2b\x49\x50\xff\x2c\x5a\x03\x92\
-\x0f\xd0\x25\xb7\xcd\x8a\xf0\x28\xb4\x06\x99\xa3\x35\xc1\xb1\x41\
-\x35\x6c\x5a\x38\xb4\x6e\x07\xb4\x0e\x24\x7e\xf4\x1a\x1e\x78\xb0\
-\xaa\xa1\x35\xc8\x1a\xf4\xd5\xaa\x22\x66\x57\x24\xd9\xa3\xd5\x2f\
-\xd1\xe3\x94\xb5\xf6\xbe\x68\x1d\x7a\x42\xe2\xfc\x4d\x48\x61\xcd\
-\xaa\x91\xc7\xa0\x35\x20\xf1\xa3\xa9\x38\xb1\x41\xc0\x8f\xa2\x35\
-\xc8\x9a\x2a\xf8\x60\x55\xa5\xde\x7a\x2d\x5a\x03\x12\x3f\x5a\x02\
-\x1b\xe9\xa7\x32\xf9\xbf\x1e\xad\x41\xcf\xa8\x5a\x7f\x11\x52\xdc\
-\x01\xeb\x9f\x8d\xd6\x80\xc4\x8f\x96\xe3\xc4\x06\x01\x7f\x0e\x5a\
-\x83\xac\x91\x77\x3a\x0f\xa9\xa9\x69\x84\xe7\xa3\x35\x20\xf1\xa3\
-\x27\xf0\x91\x7e\x2a\x63\xe4\xf9\x68\x0d\x7a\x46\xe2\xc2\x5f\xb0\
-\x81\xb5\xf9\x3a\xb4\x06\x24\x7e\xf4\x10\x0e\xd6\x4f\x8b\xb5\x0a\
-\xd8\xb4\x69\xd3\xdd\x13\xe7\x6f\x44\x6a\x5a\xb1\xcd\x27\xa2\x75\
-\x20\xf1\x03\xdf\xfd\xb3\xfe\xcf\x68\x0d\x7a\x86\xbc\xe0\x6a\x6c\
-\x60\xf5\x9f\x44\x6b\x40\xe2\x47\x56\x8b\x3b\x41\x83\x80\xd8\xa2\
-\xc1\xb1\x87\xa2\x75\xc8\x8a\x81\xd5\xad\x9d\xd1\x7a\x9a\x55\x63\
-\x0f\x44\xeb\x40\xe2\x47\x93\x70\x61\x27\x00\x05\x2e\x5b\xaf\x15\
-\xb9\xc0\x13\x80\xef\xa1\x35\x20\xf1\x73\xd8\x61\x9b\xee\x91\xb8\
-\x70\x07\xd2\x57\x8b\x94\x0c\x24\xb1\x23\x7b\x63\x83\xaa\xbf\x4d\
-\x77\x21\xd0\x3a\x90\xf8\x91\x31\xe2\x07\xe0\x31\x6a\x11\x5a\x83\
-\x9e\x01\x4f\xb1\xea\xc2\x1f\xd1\x1a\x90\x7c\x20\x83\xc6\x15\x60\
-\x5f\x3d\x00\xad\x41\x56\x48\x50\x7b\x17\x36\xa8\x86\xcb\xd0\x1a\
-\x90\x7c\x20\xfd\x7e\x09\xd8\x57\x8b\x9b\xb2\x1a\x7f\xbf\x3a\x9c\
-\x8a\xd6\x80\xe4\x03\x4d\x1d\x8d\xf4\x55\x4d\x9d\x8b\xd6\x20\x2b\
-\x64\x32\xf3\x65\x70\x50\x0d\x68\x0d\x48\x3e\xc0\x9f\x53\x2b\x70\
-\xbe\x8a\x8a\x6b\xbd\x15\x2b\xae\xbf\x0a\xad\x01\xc9\x07\xf0\xcf\
-\x55\xce\xff\x0c\xad\x41\x56\xa0\xab\x2b\x4a\x50\x1d\x40\x6b\x40\
-\xf2\x81\xf8\xea\x35\x50\x5f\xad\xfb\xb7\xa0\x35\xe8\x19\x22\xee\
-\x5e\x48\x71\xd5\xf4\x40\x12\x5a\x07\x12\x3f\xe2\xab\x47\x82\x27\
-\x00\x7f\x42\x6b\x90\x15\xe8\xea\x6a\x5a\xdb\x01\xad\x01\x89\x1f\
-\xcd\xc0\x87\x1e\x9f\x92\xc6\xc8\x33\xd1\x3a\xf4\x8c\x18\x4e\x57\
-\x9b\x46\xeb\x55\x68\x1d\x48\xfc\x54\xd1\xf5\xeb\x65\x25\x52\x84\
-\x83\x6b\xed\x2b\x80\xe0\x55\x95\x0b\x1f\x41\xeb\x40\xe2\x47\xc6\
-\xa7\xfd\xe1\xe3\x53\xd1\x6f\xab\xc8\x6c\xfc\x3f\xd0\x60\x50\xc0\
-\x52\xab\x24\x7b\x62\x08\x06\x5a\x3f\x03\xad\xc3\x7c\xa9\xb8\xd6\
-\xe3\xd0\x3a\xca\x04\x60\x3f\xb4\x0e\x24\x7e\xc4\x4f\xfe\x17\xea\
-\xa7\xd6\x5f\x8d\xd6\xa0\xe7\x68\x59\x5e\x6c\x30\xf0\xbf\x43\x6b\
-\x40\xe2\xc7\xb8\xe6\x6e\xe8\x81\xcb\x38\xff\x7a\xb4\x0e\xf3\xc5\
-\xb8\xd6\x9b\xd0\x3a\x32\x09\x10\xe9\x06\x74\xc1\xaa\x42\x27\x01\
-\x1a\x47\x06\xe0\xa5\xe0\x80\x70\x1a\x5a\x03\x12\x3f\xc7\x0d\x0f\
-\xdf\x0f\x9d\x0b\xc0\x58\x7f\x28\x5a\x87\xf9\x22\xef\xf1\x15\xa4\
-\x86\x89\x0d\xb7\x1b\xb3\xfe\x3e\x68\x1d\x48\xfc\xc0\x6f\x00\x94\
-\xe1\x9a\x7a\xd5\x86\x23\xc0\x22\xdf\x52\xd8\x6a\x4b\x24\x53\xaa\
-\xce\x9f\x8d\x1d\xbc\x7c\x15\xad\xc1\x7c\xd1\xa0\x86\xd4\x50\xda\
-\xf0\x2c\xb4\x06\x24\x7e\xda\x13\x7e\x7f\x2b\xd8\x57\x0f\x47\xeb\
-\xd0\x73\xe4\x45\xdf\x81\x15\x59\xbf\xad\xfa\x17\xa1\x75\x20\xf1\
-\x03\x1f\xbc\x6c\xb8\x14\xad\xc1\x7c\xd1\x24\x3c\xe0\xfe\x5e\x41\
-\x6b\x40\xe2\xa7\xe2\x9a\x2f\x81\x8f\x4b\xae\xf5\x56\xb4\x0e\x3d\
-\x67\x71\xc3\x3f\x15\x2d\x74\x91\x92\xac\x90\xde\x61\x6c\xf8\x06\
-\xda\x57\x17\xd7\xfc\x63\xd1\x3a\xcc\x95\xc5\xb5\x91\x27\xa0\xf5\
-\x13\xfb\x0a\x5a\x07\x12\x3f\xfa\xb9\x0d\xed\xab\xa6\x11\x9e\x84\
-\xd6\xa1\xe7\x18\x63\xee\x89\xae\x0c\x26\x2b\xab\xe5\x68\x1d\x48\
-\xfc\x68\x52\x8e\x08\x82\xc2\xbb\xd1\x3a\xcc\x15\xe3\xfc\x81\x68\
-\xfd\xb4\xba\x1b\x5a\x07\x12\x3f\x32\x26\xac\xc0\x8e\x49\xfe\x06\
-\xad\x41\x82\xd6\xa1\x2f\xc8\x0b\x9f\x8a\x0d\x0c\xfe\xca\x22\xdc\
-\xb1\x26\xbd\x25\x86\x15\x6c\x62\xc3\x4f\xd0\x3a\xcc\x15\x09\x6a\
-\xbf\x40\xeb\x97\xe7\x1d\x14\xd2\x1f\xd2\x5c\x15\xd6\x5f\x05\x1e\
-\x93\x46\xd1\x3a\xf4\x0d\x99\x6d\xfd\x16\x1d\x18\xf4\x9a\x17\x5a\
-\x07\x12\x37\x9d\x24\x36\xd7\x41\x7d\xd5\x86\x75\x68\x1d\xe6\x8a\
-\x3c\xfb\x5f\x91\xda\x69\xce\x11\x4e\xf4\xc9\x4c\x18\x3b\xba\x07\
-\x7a\x3c\x92\xc9\xf2\xaf\xd0\x3a\xf4\x0d\x2d\x78\x80\x16\xdc\x34\
-\xc2\xa7\xd0\x3a\x90\xf8\x91\x41\xcc\x83\x07\xb1\x3b\x4d\x6d\xed\
-\x2e\x68\x1d\x66\xcb\xc0\xca\xe6\x23\xf5\xd9\xa1\xda\x39\x3f\x82\
-\xd6\x81\xc4\x8f\x71\xfe\x60\xf4\x78\x24\x63\xe2\xa7\xd1\x3a\xf4\
-\x8d\x81\x5a\xeb\x05\x11\x08\x5e\x43\xeb\x40\xe2\x07\x5d\x1f\x3c\
-\xf5\xd5\x7a\x78\x1f\x5a\x87\xd9\x62\x6c\xf8\x30\x5c\x37\xeb\xbf\
-\x87\xd6\x81\xc4\x8f\x4c\xf2\x1b\x68\x5f\x1d\xa8\x37\x9f\x8b\xd6\
-\xa1\x6f\x2c\x18\x1b\xbb\x37\xfa\x20\xa0\xfc\xfb\x37\x19\x13\xb6\
-\x43\x6b\x41\xe2\x06\x5d\xc1\xb2\x63\xb9\xbb\xca\x06\xbf\x42\xe9\
-\xf4\x5a\x55\xf3\xcd\x68\x1d\x48\xdc\xe8\x18\xa0\x63\x01\xd4\x57\
-\xad\xbf\x41\xc7\x44\xb4\x16\x7d\x45\x5e\x7c\x0d\x3c\x40\xd8\xe6\
-\xab\xd1\x3a\x90\xb8\xd1\xea\x91\x68\x3f\x15\xdb\xa0\xb7\x67\xd0\
-\x5a\x74\x4b\x7a\xd3\xc7\xfa\xab\x91\x9a\xe9\xe7\x87\x25\x43\xfe\
-\xe1\x68\x2d\x48\xdc\x24\xb6\xf9\x3a\x78\xff\xb6\xe1\x24\xb4\x0e\
-\x7d\x47\x66\x3d\xff\x0f\x2e\xbc\xf3\xc7\xa0\x75\x20\xf1\x23\xbe\
-\x72\x2e\xda\x57\x8d\x6b\xbe\x10\xad\x43\xb7\x18\xdb\x7a\x31\x5a\
-\x2f\xcd\xe2\x88\xd6\x81\xc4\x8f\xf8\xc9\xb1\x70\x5f\xb5\xe1\x08\
-\xb4\x0e\x7d\x47\x0b\x9d\xa0\x85\x97\x55\xc2\x79\x3c\x25\x4c\x66\
-\x42\x82\xc4\xef\xd1\xbe\x2a\x13\xe6\xa3\xd0\x3a\x74\x4b\x14\xe7\
-\x26\x5c\xf8\x0d\x5a\x07\x12\x37\x9d\x5b\x3e\x17\xa0\x7d\x55\x2b\
-\x8f\xa2\xb5\xe8\x3b\x8b\x6a\x23\x0f\x96\xc0\xba\x31\x02\xf1\x9f\
-\x8f\xd6\x82\xc4\x8d\xb1\xfe\x63\x68\x3f\x4d\x6c\xb8\x30\x0f\x93\
-\xd5\x58\x82\xaa\x4c\x98\x3e\x84\xd6\x82\xc4\x8d\xa6\x84\x87\xfb\
-\xa9\x8c\x81\x66\xd5\xd8\x03\xd1\x5a\x40\x90\xa0\xb6\x1e\xde\x00\
-\x36\x1c\x8d\xd6\x81\xc4\x4d\x14\xf7\x84\x5d\x3e\x26\xab\x71\x04\
-\xd5\xb0\x49\x53\x8e\xa3\xb5\x20\x71\x23\xe3\xcf\x8f\xd0\x7e\x2a\
-\x13\x80\xd3\xd1\x3a\xc0\x48\x9c\xff\x21\xbc\x01\xac\xbf\x28\x0f\
-\x2b\x2b\x82\x45\xfd\x04\xef\xab\xf1\x4f\x56\xe3\xf8\xa6\xea\x2f\
-\x42\xeb\x40\xe2\x46\xd3\xee\xca\xf8\x73\x09\xda\x57\x13\x17\xbe\
-\x8f\xd6\x02\x86\x9e\xc2\x47\x37\x80\x5a\x9e\x0e\x58\x11\x0c\x12\
-\x2c\x7e\x8d\xf6\xd3\xd8\x27\xab\x1a\xa3\xe4\xd0\xbb\x00\x00\x18\
-\x8c\x49\x44\x41\x54\x54\xb5\x82\x61\x04\x3a\xfd\x02\xad\x05\x89\
-\x1b\x63\xc3\xcb\xe0\x7e\xaa\x63\x4f\xdd\xef\x8b\xd6\x02\x86\xd6\
-\x60\xd6\x3b\x90\xe8\x46\xc8\x73\xbe\x75\xd2\x1f\x92\x46\xf3\x6d\
-\x68\x3f\x4d\x03\x86\x04\x2e\xb4\x16\x53\x21\xab\x99\xfd\xd0\xfa\
-\xa4\xfd\xb9\xee\xdf\x82\xd6\x82\xc4\x8d\xf8\xea\x02\xb8\x9f\xda\
-\x70\xbd\xb5\xf6\xbe\x68\x2d\xa0\x68\x46\x3e\x7c\x43\xf8\xff\x0c\
-\x0e\x8e\x6d\x8f\xd6\x82\xc4\xcb\xf1\x76\x74\x47\x99\xac\xde\x06\
-\xf7\x55\x17\x8e\x47\x6b\x31\x15\x89\xf3\x09\x5a\x1f\x6d\xa3\xd2\
-\x1e\xaa\x22\x5d\xb1\x70\x68\xdd\x0e\x55\xe7\xaf\x45\xfb\xaa\x8c\
-\x3b\x27\xa0\xb5\x80\xa3\x39\xf9\xd1\x0d\x91\x36\x46\x0e\xd3\xad\
-\x92\xfe\x52\xb5\xe1\x64\xb4\x9f\xca\x33\xdc\x2c\x7d\x66\x27\xb4\
-\x16\x13\x59\xba\x6a\xed\x43\x64\x72\x72\x4b\x04\xfa\x94\x2f\xa9\
-\x0a\x99\x15\x31\xa4\xa9\xee\xd8\xc7\xd1\x5a\xc0\x31\x43\xa3\x8f\
-\x8f\xa0\x21\x58\x38\x84\xcc\x88\x0c\x70\x5f\x46\xfb\x69\xea\xab\
-\x11\x16\x0e\x91\x81\xf7\x73\x68\x5d\xd4\x8c\x0b\x5f\x42\x6b\x41\
-\xe2\x46\xfc\xa4\x85\xf6\x53\x35\x2d\x37\x8e\xd6\x22\x0a\x24\xa0\
-\xfd\x1d\xdd\x18\x6a\x95\x5a\x6b\x77\xb4\x16\x24\x5e\x06\x6c\xeb\
-\x19\x68\x1f\x55\x93\xc9\xea\x19\x68\x2d\x26\x12\xc5\x95\x5e\xb1\
-\x01\x37\xf2\x34\xb4\x16\x24\x5e\xd4\x3f\xd0\x3e\xda\xe9\xc3\x67\
-\xa2\xb5\x88\x06\x4d\x85\x88\x6e\x90\xb4\x51\x6c\xf8\x31\x5a\x0b\
-\x12\x37\x9a\x62\x16\xed\xa7\x6a\x9a\x6e\x17\xad\xc5\x38\x49\xcd\
-\xbf\x14\xad\x47\xdb\xfc\x59\x68\x2d\x48\xdc\xe8\x81\x6f\xbc\x9f\
-\xa6\xbe\x7a\x38\x5a\x8b\x68\x30\xf5\xf0\x74\x7c\x83\x84\xb4\x2a\
-\x93\x7e\xcb\x44\xeb\x41\xe2\x45\x02\xc8\xb7\xe0\x7e\xea\xd2\x15\
-\xc4\x52\xb4\x16\xe3\x48\x30\x1b\x44\xeb\x91\x6a\x62\xc3\x61\x68\
-\x2d\x48\xbc\xe8\xd9\x99\x18\x6e\x9d\xa9\x69\x72\x31\xb4\x1e\x51\
-\xa1\x5b\x22\xe8\x46\x69\x07\xd6\xf0\x65\xb4\x16\x24\x5e\xa2\x99\
-\xac\x3a\xbf\x31\x86\x6c\x77\xc6\x35\x77\x8b\x21\xa5\x37\x83\x2a\
-\x99\x09\xf1\xd3\xaf\xa3\x7d\xb4\x3d\xc6\xc4\xf7\x09\x0f\x8e\x6e\
-\x89\xa0\x1b\x26\x35\xeb\xaf\xd0\xfc\x04\x68\x3d\x48\xbc\xc4\x33\
-\x59\xf5\x3f\xc3\x6b\x11\x7e\x89\xd6\xa1\x6d\x25\x4e\xa9\x4a\x66\
-\x44\xef\xdb\x4b\x7f\xb9\x1c\xef\xa7\xe9\xe7\xbb\xaf\xa2\xf5\x88\
-\x0e\x5d\xcd\xa0\x1b\x66\x73\x03\xb9\xd6\x07\xd0\x7a\x90\x78\x89\
-\x65\xb2\x2a\x01\xed\xc6\x45\x83\x63\x0f\x45\xe9\xb0\x64\xc8\x3f\
-\x5c\x9e\xe1\x26\xb4\x0e\x1d\xfb\x0a\x4a\x07\x12\x3f\xd5\x7a\xf3\
-\xa3\x11\xf8\x68\x6a\x8b\x57\xb6\x9e\x8c\xd6\x23\x4a\xaa\x36\xfc\
-\x15\xdd\x38\x9d\xc0\x7a\xa6\x31\xe6\x9e\x68\x3d\x48\x9c\xc4\x52\
-\x1c\x28\xf5\x55\x1b\xbe\x85\xd2\x41\x56\xff\xdf\x45\xbf\x3f\x83\
-\x2a\x99\x09\x8d\xe5\xb1\x1c\xde\x15\x3b\x0d\xad\x47\xb4\x18\xeb\
-\x0f\x8d\xa0\x81\xc6\x03\xeb\x7b\xd0\x7a\x90\x78\xd1\x8e\x8c\xf6\
-\xd1\xb6\xf9\x6b\x11\x07\x57\xd3\xd5\xbf\x0d\xd7\xe3\xdf\x3f\xcd\
-\xa8\xb6\xb6\xdf\xef\x4f\xf2\x83\xee\xe8\xa2\x7d\x74\xb3\xaf\x36\
-\xfc\x17\xd0\x7a\x44\x8b\xa9\xad\xdd\x25\x86\x74\xab\x9d\xa0\x72\
-\xce\xf0\xf0\xf0\xbd\xd0\x9a\x90\x38\x11\xff\xf8\x24\xda\x47\x37\
-\xfb\xaa\x0b\x47\x02\xde\xff\x07\xe8\xf7\xde\xe2\xfd\x3f\xd2\xef\
-\xf7\x27\xf9\x60\xc1\xd8\xd8\xbd\xc5\x3f\xfe\x89\xf6\xd1\xb6\x9f\
-\xfa\x5b\x75\xe2\x8c\xd6\x24\x6a\xf4\x7a\x13\xba\xa1\x36\x37\x58\
-\xc3\x7f\x10\xad\x07\x89\x13\xcd\x37\x1f\xcb\x95\x22\x7d\x8e\x81\
-\xd5\xad\x9d\xfb\xf5\xee\x4b\xdc\x9a\x47\xe8\xf9\x03\xf8\x7b\xbb\
-\x76\x41\x95\xe5\xcb\x9b\x0f\xe8\xd7\xbb\x93\x7c\x61\xac\xff\x18\
-\xda\x47\xef\xf2\x55\x5f\x45\xeb\x11\x3d\x95\x7a\xeb\xb5\xe8\x86\
-\xda\xdc\x60\x2e\x5c\x60\xcc\xfa\xfb\xa0\x35\x21\x71\x22\x1d\xfa\
-\x38\xb4\x8f\xde\xe5\xab\xfe\x87\x7d\x7c\xef\xff\x43\xbf\xef\x66\
-\xb3\xfe\x57\xfd\x7a\x6f\x92\x2f\x34\x76\x8b\x7f\x9c\x0f\xf7\xd1\
-\x8e\x99\x46\xeb\x55\x68\x4d\xa2\x47\x6b\x8a\xcb\xac\xfe\x42\x74\
-\x63\x6d\x6e\x34\xe7\x0f\x46\x6b\x42\xe2\xa4\xd2\xf0\x2f\x42\xfb\
-\xe7\x5d\x03\x61\xb8\x59\xeb\x6a\xf4\xfa\x9d\x4d\x23\x3c\x29\x8a\
-\xa2\x3f\x1d\x1b\xa8\xb5\x5e\xd0\xeb\x77\x26\xf9\x44\xbf\xb7\xa3\
-\xfd\x73\xdc\x64\xd2\x7c\x9e\x8e\x6d\x68\x4d\x72\x81\x66\xf4\x42\
-\x37\xd8\x16\xb6\x01\x79\xd5\x8a\xc4\x4d\x2c\x39\xf0\x53\xb3\x61\
-\x71\xef\xdf\xd7\x9f\x00\x7f\xcf\xf1\xa0\xca\x84\x2a\x64\x0a\xda\
-\x87\x54\xfd\x7f\xd0\x3e\x3a\x6e\xbc\xfb\x3f\x0b\x2a\x8d\x53\x76\
-\x95\xc0\x7a\x3b\xba\xd1\xb6\x08\x34\xf0\x84\x2b\x24\x4e\x74\x87\
-\x08\xed\x9f\x5b\xf9\x6a\xa3\xf9\x8a\x5e\xbd\xab\xac\xfc\xf7\x43\
-\xbf\xdf\x56\xef\x1a\x61\x55\x44\x12\x07\xe2\xab\x0b\xd0\xfe\xb9\
-\x85\x9f\xde\x6e\x56\x84\x47\xa1\x35\xc9\x15\x32\xe8\x26\xe8\x86\
-\xdb\xdc\x80\x2e\xdc\xa1\x95\xe0\xd0\x9a\x90\xf8\xd0\x03\x68\xe2\
-\x1f\xd7\xa0\x7d\x74\x8b\x60\xb3\xbe\x17\xb7\x57\xf4\x2e\xb5\xae\
-\xb8\xd1\xef\x77\x97\xf9\x6b\x8f\xb7\xa3\x3b\x66\xfd\x9e\x24\xff\
-\x98\x5a\xf3\x59\x1a\xb3\xf1\x3e\x3a\xde\x27\xfd\x22\xb4\x26\xb9\
-\x43\x44\x7b\x1e\xba\xe1\xb6\x6a\x44\x17\x4e\x44\x6b\x42\xe2\x44\
-\x7c\xe3\xfb\x68\xff\x9c\x60\x1f\xcf\xfa\x1d\x65\xc0\x3d\x28\x82\
-\xf7\xda\xb2\x3f\xf6\xfd\xea\x23\x89\x9f\x4d\x9b\x36\xdd\x5d\x26\
-\xaa\x7f\x42\xfb\xe7\x96\x66\x86\x46\x9f\x83\xd6\x25\x97\x88\x78\
-\x6b\xd0\x8d\xb7\x55\xd0\xa9\x87\xf7\xa1\x35\x21\xf1\xa1\xdb\x7b\
-\x7a\xc7\x17\xed\x9f\x9b\xfd\xd4\xfa\xff\x64\xb9\xe5\xd8\xbe\xf6\
-\x17\xcf\x2e\x87\xe6\x0a\x59\x62\x47\x1f\x9d\xd5\xfb\x91\xe2\xa0\
-\x57\xb7\xe1\xfe\xb9\xb5\xad\x46\x6b\x92\x5b\x8c\x6b\xbd\x29\x82\
-\x06\xdc\x32\xb0\x5e\xc5\x44\x0e\x64\x32\x64\x85\xfc\x07\xb4\x7f\
-\x6e\xe5\xab\x2e\xfc\x31\xab\x77\x8b\x29\x37\x47\x6a\x36\xfc\x36\
-\xab\x77\x23\xc5\x41\x0f\x6b\x4b\x3f\xbc\x12\xee\x9f\x5b\x98\x5e\
-\x6b\x47\xeb\x92\x5b\x74\x3b\x47\x1a\xf4\x2c\x74\x23\x6e\x15\x58\
-\xf9\x3d\x87\x4c\x82\x9e\x11\x11\xdf\xb8\x13\xed\x9f\x5b\xf9\x6a\
-\xdd\xbf\x65\xbe\xef\x95\x34\x9a\x6f\x43\xbf\xc7\x36\xef\xd5\x18\
-\x79\x66\x16\x6d\x46\x8a\x45\x4c\xe7\xc6\x52\xb3\xe1\xaf\x3a\x86\
-\xa1\x75\xc9\x35\xb2\x92\xf9\x1f\x78\x43\x4e\x0c\x40\x36\xbc\x11\
-\xad\x0b\x89\x0f\xf1\x8d\xd5\x68\xdf\x9c\xe0\xa7\x97\x2d\x5b\x36\
-\xfc\xa0\xb9\xbe\x8f\x66\x3b\x94\xa0\x7a\x09\xfa\x3d\xb6\x36\x6f\
-\xb3\x6c\x33\x52\x0c\x12\xdb\x7c\x1d\xde\x37\x27\xf4\x3f\x66\x92\
-\x9d\x3f\xc7\x0d\x0f\xdf\x2f\xb6\x20\xa4\x89\x8a\xe6\x13\x58\x49\
-\x31\xa9\x58\xff\x4a\xb4\x6f\x6e\xe3\xab\xce\xff\x7a\xae\xef\x13\
-\x53\xa6\xc3\xcd\xef\x53\xf3\x2f\xcd\xb2\xcd\x48\xfe\x59\x54\x1b\
-\x79\xb0\xf8\xf9\xc5\x68\xdf\xdc\xba\xdf\x31\x8b\x6c\x66\xc4\x54\
-\x78\x65\x8b\x06\xce\xec\x1b\x2b\x29\x0e\x55\xeb\x87\xd1\xbe\x39\
-\x89\xbd\x63\xb6\xef\x51\x71\xad\xb7\x46\xf0\xdc\x5b\xf7\x39\xeb\
-\x57\xf6\xa2\xcd\x48\xbe\x89\x6e\xeb\xdf\xb1\x40\x55\xa6\xa4\x15\
-\x9d\xac\x3f\x0f\xdd\xa8\x13\xcd\x38\x7f\x20\x5a\x1b\x12\x17\x49\
-\x3d\xec\x83\xf6\xcb\x49\x6c\x83\x26\xd7\xea\xf6\x1d\xf4\x84\xbd\
-\xf4\xb7\xab\x23\x78\xee\xad\x83\xaa\x1d\xd9\xbb\x97\x6d\x47\xf2\
-\x87\x4c\xb8\x3f\x84\xf6\xcb\x6d\xcc\xfa\xf3\xb9\xfa\xcf\x18\x9d\
-\x51\xc1\x1b\x76\x9b\x80\x14\xae\x5f\xbc\xb2\xf5\x64\xb4\x36\x24\
-\x2e\xc4\x37\x86\xd0\xbe\xb9\x8d\xaf\x3a\xff\xa7\x6e\x72\x91\xa7\
-\xb5\x38\x5c\x38\x11\xfd\xbc\x93\xf4\xb5\x5a\x3f\xda\x8e\xe4\x87\
-\x8a\x6d\x3e\x51\x7c\xf5\x3a\xb4\x6f\x6e\xe3\xab\xbc\x2e\x9e\x3d\
-\x9a\xdd\x4c\x56\x25\xe7\xa0\x1b\x77\x1b\xb3\xc1\xeb\x0e\x05\x5a\
-\x1f\x12\x0f\x5a\xa0\x06\xee\x97\x93\xfa\xaa\xff\xe2\x4c\xcf\x2e\
-\x7f\xee\x2b\xf0\xe7\x9c\x18\x50\xad\xbf\x93\xc9\x54\xc8\x96\xa4\
-\x95\xfe\x5c\x38\x05\xed\x9b\xdb\xfa\x6a\xf8\xbb\x66\xcd\x44\xeb\
-\x53\x48\x74\xcb\x1d\xdd\xc0\x93\x9b\x3f\x06\xad\x0d\x89\x0b\x99\
-\x18\xae\xc0\xfb\xe5\x36\xc1\xe9\x76\x63\xc3\xcb\xa6\x7a\x66\x53\
-\xf7\xfb\xc6\x54\x83\x63\xf3\x73\x3b\xbf\xb4\x9f\x6d\x47\xe2\x47\
-\xeb\xb3\xa0\xfd\x72\xf2\x3e\xe6\xdf\x85\xd6\xa6\xb0\xc4\x97\x8f\
-\x7c\x4b\xf3\xff\x8d\xd6\x87\xc4\x83\xde\x55\x8f\x29\x1f\xf9\x16\
-\x83\xe9\xe5\x03\x2b\x9b\x8f\x9c\xf8\xbc\x69\x01\x2e\x17\xfe\x8d\
-\x7e\xbe\x6d\x03\x6a\xb8\x7d\xc0\x8d\x3c\x0d\xd1\x86\x24\x4e\x74\
-\x8b\x1d\xed\x97\x93\xf7\xad\xf0\x17\x96\xfc\xed\x31\xba\x4a\x41\
-\x37\xf4\x14\x81\xf5\xa6\x01\xeb\x9f\x8d\xd6\x87\xc4\x43\x4c\x15\
-\xc9\x26\x58\xcb\x5a\x7b\xdf\xf1\xe7\xd4\x4f\x58\x32\x81\x6d\x46\
-\xf0\x5c\xdb\xf6\x2b\x1b\x7e\x82\x6c\x43\x12\x17\x69\xc2\x2d\xe7\
-\x6f\x44\xfb\xe5\x64\x36\xdd\xee\x1a\xc9\x90\xaa\x0d\xcb\xd1\x8d\
-\x3d\x79\xb0\xf2\xe7\x30\x3f\x00\x19\x27\xb6\x9a\xe4\x13\xec\xa7\
-\xe3\xcf\x19\xf1\x44\x65\xc3\xd2\x55\x6b\x1f\x82\x6c\x43\x12\x0f\
-\xed\xfb\xfe\xe1\x9f\x11\xf8\xe5\xb6\xb1\x9f\xd7\xc2\xfb\xc7\xe2\
-\xda\xc8\x13\x44\xf0\x5b\xd0\x8d\x3e\xa9\x59\x3f\xcc\x2b\x20\x64\
-\x9c\xa4\xe1\xbf\x00\xf7\xc9\xa9\x82\x96\x0d\x9f\x8e\x31\xd3\xe6\
-\x96\xcf\x87\x6e\x3f\x12\x07\xe9\x2e\x95\xf5\xab\xd0\x3e\x39\x79\
-\xcc\x0f\x37\x57\x5c\xeb\x71\x68\x8d\x4a\x85\xac\xac\xbe\x07\x6f\
-\xf8\xa9\x1d\x82\xc5\x4a\x48\x4a\xfb\xb4\xb2\x3f\x1b\xee\x93\x93\
-\x9a\xdf\x28\x3f\x6e\xc4\x3f\xc7\xa4\xcf\x76\x16\x6f\xd7\x10\xa5\
-\x53\xe2\xf7\x77\x78\x9f\x9c\xdc\xe4\xd9\xbe\x8d\xd6\xa8\x74\x2c\
-\x5f\xde\x7c\x80\xe6\x3a\x47\x37\xfe\x34\x4e\xf1\x35\xb4\x46\x24\
-\x0e\xb4\x76\x04\xda\x1f\xf3\x66\xa6\x11\xf6\x47\xb7\x1b\x89\x03\
-\x99\x0c\x1e\x8e\xf6\xc7\x69\xe2\xfc\xe5\xc7\xdb\xd1\x1d\xd1\x1a\
-\x95\x12\xe3\x5a\x1f\x40\x3b\xc0\x94\x8e\xa1\x95\xe1\x6c\xf3\xbd\
-\x68\x8d\x48\x1c\x88\x4f\xd4\xd1\x3e\x99\x1b\xb3\x61\x39\xba\xbd\
-\x48\x1c\x88\x2f\xbc\x3f\xb6\x2a\x9b\x5b\xc7\xf9\xf0\x1e\xb4\x46\
-\xa5\x46\xf3\x83\xa3\x9d\x60\xea\x40\xe6\x6f\xab\x34\xfc\x1b\xd0\
-\x1a\x11\x3c\x66\xd5\xc8\x63\x62\xcc\x5a\x16\x9f\xf9\x6b\x67\x93\
-\xb6\x98\x14\x17\x59\x5d\xbf\x26\xda\xb3\x5e\x2e\x5d\xe4\x39\xb4\
-\x46\xa5\x47\x0f\x5f\xc8\x40\x7b\x03\xda\x19\xa6\x74\x12\xe7\x6f\
-\x4a\x1a\xcd\x57\xa0\x75\x22\x78\x8c\xf3\x07\xa3\xfd\x31\x76\xd3\
-\xc2\x5f\xe8\x76\x22\x78\xd2\xeb\xde\x36\xdc\x8c\xf6\xc7\x69\xe2\
-\xfa\x8d\x7a\x18\x1d\xad\x13\xb9\x9b\x06\xd6\xf0\x25\xb4\x43\xcc\
-\xe4\x2c\xc6\xb6\x5e\x8c\xd6\x89\x60\xd1\x24\x21\x9a\x3a\x1a\xed\
-\x8f\x11\x5b\x8b\x89\x54\x88\x16\x7d\xd2\x3a\x2b\x11\xf8\xe3\xd4\
-\x31\xdd\x86\xcf\xa2\x75\x22\x1d\x3a\x75\x02\xc6\xd0\x4e\x31\x83\
-\x6d\x30\xb5\xe6\xb3\xd0\x5a\x11\x2c\xc9\x90\xdf\x53\x26\x84\xb7\
-\x46\xe0\x8f\x51\x99\x6e\xf5\x56\x6a\xad\xdd\xd1\xed\x43\xb0\x68\
-\x32\x35\xf1\x85\x6b\xd0\xfe\x38\xad\xaf\x5a\xbf\x96\xf9\xfe\x23\
-\x43\x33\x44\xe9\x37\x77\xb4\x73\xcc\x10\xe4\xae\x61\x49\x53\x22\
-\xab\x87\x6f\xa1\x7d\x31\x36\x33\x36\x7c\x03\xdd\x2e\x04\x8b\x16\
-\x7c\x92\xc1\xf5\x2a\xb4\x2f\x4e\x1b\xc3\x35\x35\x35\x33\xbe\xc6\
-\x49\x3e\x02\xab\xbf\x36\xa9\xf9\x97\xa2\xb5\x22\x38\x34\x0d\x6f\
-\xd5\x86\x75\x78\x5f\x8c\xc6\x4e\x63\xf2\xac\x72\xa3\x69\x74\xf3\
-\x70\x48\x96\x13\xd5\x88\x69\x7f\x0a\x08\x01\xed\x24\x33\x59\x7a\
-\x26\x80\xf7\x9c\x4b\x8d\xb1\xa3\x7b\xe8\x01\x51\xb4\x2f\xc2\xcd\
-\x86\x9b\x4d\x3d\x3c\x1d\xdd\x1e\x04\x47\xa5\xde\x7a\x6d\x3e\xfa\
-\x82\x6f\xea\x18\x83\xd6\x8b\x4c\x43\xc5\x36\x9f\x98\x87\x99\xa4\
-\x7e\xf3\x4c\x1a\xcd\xb7\xa1\xf5\x22\x38\x64\x12\xf8\x29\xb4\x1f\
-\x46\x60\x1f\x47\xb7\x03\xc1\x21\xed\xff\x8e\x7c\x9c\x89\xf1\xd7\
-\x9a\xa1\xd1\xc7\xa3\xf5\x22\x5d\x90\x34\xfc\x07\xf1\x0e\x33\xb3\
-\xb5\x13\x5c\xf8\xc3\xd1\x7a\x11\x0c\x9a\xe2\x54\x56\xc0\x2b\xd0\
-\x7e\x08\x0c\xaa\x56\x35\x40\xb7\x03\xc1\xd0\xbe\x16\xeb\x23\x4d\
-\x45\x3d\xc1\x98\xd4\x2d\x5f\xc8\xac\x32\x81\x3b\x4d\xd7\xce\xe5\
-\x7f\xc5\xad\xa5\x72\x92\x56\x0c\x74\xfe\x72\xb8\x0f\xf6\xd9\x12\
-\x1b\xfe\x35\xb0\xba\xb5\x33\x5a\x7f\xd2\x7f\xf4\x04\xbd\x96\x79\
-\x46\xfb\xe0\x2c\xcc\xa0\x35\x23\xb3\xc4\x34\xc2\x4e\x12\x58\x2f\
-\x8e\xc0\x79\xba\x33\x59\x09\x9a\xe1\xe1\xfb\xa3\x75\x23\xfd\x47\
-\xb3\x45\xc6\x9c\xee\x34\x6b\xd3\x77\xd5\x2c\x6f\x68\xdd\x49\xff\
-\xd1\x18\x57\xcd\x53\x5a\x6c\xeb\xcf\x37\xab\xc6\x1e\x88\xd6\x8d\
-\xcc\x01\xe3\x9a\x2f\xcc\xc7\xf7\xa5\x71\x67\x0b\xeb\x98\x5d\xaa\
-\x9c\x24\x2e\x1c\x09\xf7\xbf\x3e\x99\xde\xd6\x41\xeb\x4d\xfa\x8f\
-\x2c\xca\x9e\x24\xf1\xf8\x0c\xb4\xff\xcd\x22\x1e\xdf\x3c\x50\x6f\
-\x3e\x17\xad\x1b\x99\x07\xc6\xb6\x3e\x01\x77\xa4\x59\x99\xbf\x36\
-\xa9\xfb\xb7\xa0\x75\x23\xfd\xa5\x93\x25\xb0\x81\xf7\xbf\x5e\x07\
-\x55\xbf\x8a\x49\x54\xca\x87\x71\xfe\xf5\xd2\xfe\x1b\xe0\xfe\x37\
-\x0b\x93\x49\xf9\x47\xd0\xba\x91\x0c\x90\x86\xfc\x0d\xda\x99\x66\
-\xe5\x78\xe9\x16\x69\x38\x92\x69\x51\xcb\x45\xfa\xd9\xca\xfa\xf3\
-\xd0\xfe\xd7\xc3\x80\x7a\xc1\xa2\xc1\xb1\x87\xa2\x75\x26\xfd\xa3\
-\x7d\xd0\xd5\x1f\x92\x9b\xc3\x7e\x77\xf9\xea\x2f\xd1\xda\x91\x8c\
-\x30\x26\x6c\x27\x4e\xf8\x67\xb4\x53\xcd\xc1\xea\xc6\x9e\xfc\x30\
-\xb4\x7e\xa4\x7f\xe8\x96\x63\xcc\x45\x50\xe6\x1e\x50\xfd\x4d\xcc\
-\xa0\x56\x2e\xf4\x90\xa7\x56\xcc\x43\xfb\xde\x1c\xec\x14\x4d\xd6\
-\x85\xd6\x8f\x64\x88\x96\x63\x95\x59\xe8\x95\x11\x38\xd7\xec\x02\
-\xa7\x0d\xff\x62\x49\xe1\x72\x61\x9c\x3f\x10\xed\x77\x99\xfb\x71\
-\xc3\x7f\x10\xad\x2b\xe9\x1f\xa6\xd1\x7a\x95\xc4\xae\xcb\xd0\x7e\
-\x37\xfb\x78\xeb\xaf\xe6\x7d\xff\x82\x92\xb8\xb0\x5f\xec\xf5\x02\
-\xa6\x70\xca\x3b\xa5\x33\xfd\xf8\xb8\xe1\xe1\xfb\xa1\x35\x24\xfd\
-\x21\x67\xd7\xa4\x66\xf0\xdf\xf0\x23\xb4\x9e\xa4\x3f\x68\x8c\x92\
-\x85\xd6\xb1\x79\xbc\xd5\xa2\x07\xc6\x2b\xae\xf5\x72\xb4\x86\xa4\
-\x87\xc8\x04\xe0\x43\x68\x47\x9b\x87\x83\x9e\xc1\x8a\x82\xe5\xa0\
-\x73\x57\xba\x86\xf6\xb9\x79\x9b\x0d\xcb\x79\xe8\xaf\x1c\xe8\x27\
-\x1e\x69\xef\xbf\xc2\x7d\x6e\x2e\xb1\x55\x17\x59\xf5\xf0\x3e\xb4\
-\x86\xa4\x0f\x88\x93\x1e\x81\x76\xb8\xb9\x3b\x6a\xb8\x5d\x77\x03\
-\x16\x0e\xad\xdb\x01\xad\x23\xe9\x2d\xc6\x8e\xbe\x3d\x57\xd7\x58\
-\x27\x9a\xf5\xb7\x19\x1b\xde\x83\xd6\x91\xf4\x96\xf4\x8c\x95\xf3\
-\x87\xe7\xd9\x57\x25\xa6\x1e\x86\xd6\x91\xf4\x09\x3d\x99\x2a\x0d\
-\xbe\x10\xed\x74\xf3\x72\x58\x17\xfe\x59\xb1\xfe\x95\x68\x2d\x49\
-\xf6\x98\xda\xda\x5d\xa4\x7d\xff\x88\xf6\xb1\xcc\xcc\x86\x15\x4b\
-\xec\xe8\xa3\xd1\xba\x92\xec\xd1\xca\xa6\x12\x4b\xff\x0e\xf7\xb1\
-\xf9\xc4\x52\x1b\x06\x98\x92\xba\x64\xe8\x29\x4f\x99\xb1\xfe\x09\
-\xed\x7c\xf3\x73\x5c\x7f\xa7\xa6\x11\xe6\x4d\x81\x62\xa0\xe9\xa0\
-\xb5\x40\x90\xb4\xeb\x7f\xd0\xbe\xd5\x03\xdb\x20\x93\x9a\xff\xe1\
-\xe7\x80\x62\xd0\x39\xe1\x7f\x5c\x1e\xbf\xf5\x6f\x15\x43\x5d\x38\
-\x91\xa5\xa8\x4b\x4a\xfb\xde\x75\x58\x8f\x76\xc2\x0c\x9c\xf8\x1a\
-\xe3\x5a\x9f\xa7\x23\xe7\x17\x3d\xa0\x5a\x04\x5f\x9c\xd1\x6c\x58\
-\x97\x34\x9a\xaf\x40\xeb\x4d\xe6\x86\xc6\x18\xe3\xc2\x97\x34\x61\
-\x19\xdc\x97\xe6\x1d\x37\xfd\x19\xcb\x96\x0d\x3f\x08\xad\x29\x01\
-\x92\x16\x63\xc9\xf9\x16\xd6\x66\x87\xb6\xfe\x1f\x32\x90\x1c\x80\
-\xd6\x94\x74\x8f\xa6\x47\x95\xb6\x33\x68\xdf\xe9\xbb\xd9\xb0\x42\
-\x4b\x77\xa3\xf5\x27\xdd\x93\xde\xa2\x72\xfe\x2c\xb8\xef\x64\x13\
-\x2b\xcf\x59\xe2\xd6\x3c\x02\xad\x29\x89\x80\xc5\x35\xff\x58\x99\
-\x04\x5c\x88\x76\xca\xcc\x9c\xdb\x85\x13\x2b\x0d\xff\x22\xb4\xae\
-\x64\x6a\x34\xf8\xa4\xd7\xa5\x72\x7c\x70\x2a\x03\x3f\xbd\x45\xaf\
-\x08\xea\x99\x07\x74\x7b\x90\xa9\x31\xb6\xf5\xe2\xaa\xf5\xc3\x68\
-\x7f\xc9\xd0\xef\x2e\xa8\x34\x4e\xd9\x15\xad\x2b\x89\x88\xb4\x50\
-\x45\x0e\x13\x57\x4c\x6b\xd6\xaf\x92\x99\xee\xf3\xd0\xda\x92\xbb\
-\xd0\x54\xb8\x9a\xe6\x59\x06\xfe\x1b\xe1\xfe\x11\x89\xa5\x13\x01\
-\x17\x16\x70\x22\x10\x17\x03\xb5\xd6\x0b\x74\xa7\x06\xed\x1f\x99\
-\xfa\x9a\x0d\xff\x32\xae\xb9\x1b\x5a\x5b\x12\x21\xc9\x90\xdf\x53\
-\x06\xcc\xab\xd0\x4e\x9a\xad\xc3\x6b\x12\x21\x7f\x02\xab\x5a\x61\
-\x49\x0f\x4d\xb9\xf0\x5d\x09\x40\xd7\xa3\x7d\x22\x56\x53\x6d\xc4\
-\x57\xbf\xa3\x9f\xe5\xd0\xed\x55\x66\x64\x31\xf4\xfc\xa2\x0d\xfc\
-\x6d\xf3\x57\x0e\xb8\x91\xa7\xa1\xf5\x25\x11\x63\x86\x46\x9f\xa3\
-\xe9\x20\xf1\xce\xda\x03\xb3\x7e\x58\xd3\x0a\xf3\xca\x4b\xff\x58\
-\xdc\xf0\x4f\xd5\xc2\x22\x45\xcc\xef\xdf\x2b\xd3\xba\x01\xe2\xab\
-\xbf\xa8\xd4\xd7\x3e\x05\xdd\x7e\x65\x41\x0b\x8f\xc9\x04\xec\x8d\
-\xa2\xff\x1a\x74\xfb\xf7\xc4\xa7\xda\x29\x7e\x9f\x83\xd6\x99\xe4\
-\x80\xa4\x31\xf2\x4c\xdd\x2a\x42\x3b\x6d\xef\xcc\x9f\xa5\xa5\x2e\
-\x99\x5a\xb8\x77\xb4\xef\x47\xfb\x13\xf2\x56\x05\x2d\x2e\x13\xed\
-\x6c\x58\x5e\x71\xcd\x97\xa0\xdb\xb3\xa8\x68\x0c\xd0\x58\x20\xf1\
-\xee\x6f\xf8\xf6\xee\x91\x59\x7f\x85\xa9\x87\xa7\xa3\xb5\x26\x39\
-\x42\xbf\x13\x89\xe3\x5c\x04\x77\xde\x1e\x9a\xde\x37\x6f\x7f\x7b\
-\x65\x7a\xe1\x2c\xd0\x2b\x45\xc6\xfa\x8f\xe9\x55\x37\x74\xdb\x16\
-\xcd\xd2\x01\xca\xfa\x43\x98\xf3\x22\x1b\x2a\xb5\xd6\xee\x7a\x16\
-\x25\x8f\x05\xd2\x66\xe9\x37\x17\x72\x27\x89\xcc\x09\xad\x0a\xa5\
-\x19\xf7\xd0\x4e\xdc\x1f\xf3\xa3\xba\x12\x58\xbe\xbc\xf9\x00\xb4\
-\xee\x79\x42\xb7\x4e\x35\x23\xa3\x68\x58\xd1\xc3\x6c\xf8\x76\x2c\
-\xb6\x75\x6e\x0e\x0c\x98\xba\xdf\x57\xb5\x47\xb7\x7f\x9e\x38\xde\
-\x8e\xee\xa8\x7d\x5c\xfb\x3a\xba\x1d\xfb\xe2\x2b\xd6\x9f\xa3\x37\
-\xbc\xd0\xba\x93\x1c\xa3\x27\x93\xf3\x5a\xe0\x62\x4e\xa6\xdf\xaa\
-\x6d\x58\xa1\x85\x31\x38\x19\x98\x1a\x3d\x4c\x94\xae\xa0\x6c\xb8\
-\x14\xde\x66\x25\xb5\xc4\xf9\x4b\xb4\x2e\x86\x5e\x53\xe3\xb9\x96\
-\xc9\xd1\x3c\xfd\xfa\x6d\x3f\x4d\x7d\x6e\xfd\x0d\xe8\x36\xeb\x9f\
-\xf9\xb3\xcc\x8a\xf0\x28\xb4\xfe\xa4\x00\xe8\xb6\x63\x59\x66\xcd\
-\x5b\x99\x04\x0c\x09\xb2\x89\xb1\xfe\xed\x66\xd5\xd8\x03\xd1\xed\
-\x80\x24\x4d\xd3\x9b\xde\x87\x0e\x47\x17\x29\x67\x44\x51\x4c\xdb\
-\x44\x26\x64\xdf\x97\x89\xeb\x3e\x65\x4f\x37\xac\x9f\xa2\x34\x21\
-\x98\xac\x80\xab\x65\xbc\x6e\x2a\xbe\x10\xf4\xba\x2d\xba\x1d\x48\
-\x81\xd0\xda\x01\xe2\x5c\x15\xb4\x73\xc3\x3a\x95\x0b\x77\x48\x40\
-\x19\xd3\xaa\x5f\x7a\x9a\xb6\x0c\x2b\xae\x34\x4b\x64\x1a\x48\xd3\
-\xc2\x51\x1b\xd0\x6d\x40\xeb\xd2\x57\xf5\xaa\xa5\x0d\x2b\xf4\x3c\
-\x46\x59\x8a\x10\xe9\x8e\x94\x9e\x91\x48\x73\x7f\x94\x38\xb9\x94\
-\xbc\xff\x12\xdd\xf5\x40\xb7\x07\x29\x20\xed\xab\x32\xfe\x07\x70\
-\x27\x8f\xc0\x24\xc8\x5c\x2e\x3f\x1a\xe3\xfc\xc1\x9a\x6c\x48\x57\
-\xc8\xe8\xf6\x99\x2f\x7a\xe6\x43\xde\xe7\x40\x79\x9f\x9f\xeb\x67\
-\x9f\xbc\x17\x3a\xa1\x75\xf2\x60\x38\x7f\x86\xd8\xcf\xaa\xb6\xf9\
-\x5e\x6d\x63\xb4\x9f\xcd\x97\x4e\xd1\xa8\xe7\xcb\x44\xe7\xb3\x69\
-\xd5\x48\xeb\xaf\x40\xeb\x1c\x83\x49\x5b\x7f\x8f\xe7\x42\x48\xcf\
-\x91\x55\xf0\x41\xba\x22\x46\x3b\x7c\x54\xa6\xdf\x17\x35\x5d\xa8\
-\xf5\x47\x49\x60\x7a\xcf\x80\x6d\x3d\x63\xc1\xd8\xd8\xbd\xd1\x6d\
-\x35\x15\x15\xd7\x7a\x5c\xfa\x6d\xd4\x85\x2f\xcb\x60\xbf\xb8\x70\
-\x59\x20\x69\xd3\xf8\x6a\xb8\x54\x07\x4e\x6d\x7b\xcd\x8b\x11\xf3\
-\x41\x31\x2d\xbe\xa3\xd7\x92\x75\xf2\xa2\x7d\x4b\xfb\x58\x19\xb7\
-\xf5\xa7\x33\xe9\xbb\xb7\x1b\xdb\xfa\x04\xba\xad\x48\x89\xd0\xc0\
-\xc1\xac\x6e\x33\x98\xf5\xb7\xc9\x64\xe9\x74\x3d\xb5\x2d\xf6\x2d\
-\xf9\xf5\x87\xb4\x12\x9c\xae\xc2\xfa\xb1\x63\xa0\xd9\xf7\x34\x9d\
-\xa9\xac\x0c\xde\x65\xac\x3f\x54\xaf\x3c\x4a\xf0\x1c\x29\x68\xb9\
-\x5d\xda\x3c\x4c\x2b\x6a\xca\xc4\xe0\x64\x4d\x40\xa4\xbe\x62\xea\
-\xad\x77\xaa\xef\xf4\x23\x2b\xa1\x4e\x94\xd3\xdd\xa7\xba\xdf\x57\
-\xfb\x88\x3c\xc7\x11\x69\x9f\x71\xfe\x8c\x76\x1f\xc2\xeb\x13\xab\
-\x49\xbb\x5d\x97\xd8\xe6\xeb\x7a\xdd\x46\x84\x6c\x83\xb1\xa3\x7b\
-\x14\xa5\x92\x60\xdf\x3b\xae\xcc\xda\x25\xc0\x5d\x9c\x96\x87\x75\
-\xe1\x44\x3d\x6c\x28\xbf\xff\xd3\xce\x44\xe1\x90\xb4\xbc\xb1\xf5\
-\x1f\x53\xd3\x1d\x85\xf4\x5b\xbc\xd8\xf8\xef\xc9\xc4\xe2\x33\xe9\
-\x37\x4f\xe7\xbf\xae\x05\x65\xe4\xbf\x1d\x2f\x3f\xb7\x32\xb8\xaf\
-\xd5\xab\x9b\x69\x36\xb9\x08\xde\x93\x96\x7f\xeb\xf8\xd2\xb9\xea\
-\x5b\xf2\x63\xbd\x7d\x26\xc4\x1f\x23\xbf\xff\x35\xf5\x41\xf9\xf5\
-\xa7\x37\xfb\x6a\xc7\x4f\xd5\x67\x37\xfb\xaa\xf5\x5f\x6c\x7f\x9f\
-\x97\x81\xdd\xf9\x9f\xe9\xe1\x3c\xf9\xf9\x49\xe9\xe4\xb8\x7d\x93\
-\xe1\x76\xf4\x3b\xe6\xd3\xfc\x59\x9a\xcf\x00\x3d\x0e\x90\x12\xa3\
-\x57\xe5\xd2\xef\x70\xf0\xce\x40\xa3\xd1\x68\xe5\x30\xcd\xb2\x59\
-\xf6\x9b\x49\x24\x12\xf4\x44\x7c\xba\x12\xe0\xb9\x00\x1a\x8d\x46\
-\xeb\x99\xb5\x63\xac\x3f\xbc\x0c\xb7\x90\x48\xce\xa8\xb8\xd6\xcb\
-\x8b\x5d\x43\x80\x46\xa3\xd1\x50\xe6\xaf\x34\x8d\xd6\xab\xd0\x71\
-\x9e\x90\x29\xa9\x34\x4e\xd9\x35\x3d\x0d\x0f\xef\x2c\x34\xda\xf4\
-\x96\xd8\xd6\xd5\x55\xcb\xfc\x06\xb4\x5c\xd8\x6a\x66\xf6\x23\xb9\
-\x40\xb7\xa7\xd2\xfb\xf1\x65\x4e\xc8\x41\x8b\xdb\x6c\x68\x68\x9a\
-\xeb\x4e\x96\xcb\x41\xf8\xf3\xd0\x68\x93\x59\xfb\x26\xd1\xe1\xbc\
-\xdf\x4f\x72\xc7\x40\xbd\xf9\x5c\xde\x12\xa0\xc5\x64\x7a\xa2\x5d\
-\x27\xa7\x13\xbf\xa1\x6a\xed\x87\x72\xe5\x8a\xa7\xc5\x6e\x5a\x01\
-\x32\x71\x61\x2f\x54\xfc\x26\x64\xde\x74\x8a\x71\xfc\x18\xdd\x99\
-\x68\x34\xcd\x6e\x38\x5d\x5d\x74\xbd\x52\x25\x7f\xee\x34\xf8\x73\
-\xd2\x4a\x6f\x7a\xd5\x72\xe1\xd0\xba\x1d\xfa\x19\xab\x09\xe9\x19\
-\x9a\xac\x82\x45\x64\x68\x08\xd3\x12\xba\xc6\x86\x6f\x68\x56\xb9\
-\x99\xfc\x54\x6b\x5e\x24\xce\x7f\x93\x9f\xaf\x68\x08\x13\x5f\xbd\
-\xc0\x34\xc2\xfe\xfd\x88\xc9\x84\xf4\x95\xc1\xc1\xb1\xed\xb5\x84\
-\x2c\xaf\x0b\xd2\xfa\x66\x36\x78\x4d\x58\x35\x5b\x5f\x4d\x8b\xcb\
-\xb8\xd0\x82\x3f\x3f\xad\x24\xe6\x37\x6a\xa6\x4e\x96\x20\x27\x85\
-\xc7\xb8\xe6\x0b\x13\x1b\xd6\xe3\x3b\x1d\xad\xa8\x96\xe6\x8b\xd7\
-\x8c\x8a\xf3\x28\x8d\x9b\x1e\x66\x6d\x67\xb7\xbb\x0e\xfd\x3e\xb4\
-\x02\x5b\x5a\x78\x6b\x64\xef\x2c\x63\x2c\x21\x51\xa3\xdb\xb1\xba\
-\x2d\x2b\xce\x7f\x33\xbc\x03\xd2\x0a\x66\x7e\x30\xcb\x32\xb8\x66\
-\xd5\xc8\x63\x64\xc2\x5a\xc3\xbf\x17\xad\x50\x26\xb1\x4f\xd3\x29\
-\xc7\x5c\x34\x8c\x90\x9e\xa2\x79\x03\xf4\xc0\x0b\x4b\xcf\xd2\xe6\
-\x6f\xfe\x6c\x2d\x52\xd5\x2b\x5f\x4d\x5c\xd8\x8f\x3b\x57\xb4\x4c\
-\xcc\x86\x15\x8b\x6b\x23\x4f\xe8\x95\xaf\x12\x92\x2b\xd2\x2c\x82\
-\x2e\xfc\x05\xde\x31\x69\x79\xb4\x0d\xed\xed\xfe\x99\x0f\xf9\xcd\
-\x97\xb4\x72\x5d\xbb\x18\xd3\x95\x11\xbc\x37\x2d\x7f\x76\x5a\x52\
-\xf3\x2f\xed\xb5\x9f\x12\x92\x3b\x34\xd9\x45\xe7\x3e\xf6\x15\x11\
-\x74\x54\x5a\xf4\xe6\x37\xea\xee\x51\x3f\x4a\xd6\x4e\xc4\x34\xc2\
-\x4e\x7a\xbd\x95\x95\xec\x68\xdd\x58\x62\xfd\x55\x9a\x7f\x62\x3e\
-\x67\x52\x08\x29\x05\x5a\xe5\x2a\x71\xfe\xdb\x12\x5c\xaf\x47\x77\
-\x5c\x5a\x7c\xa6\x9f\x8b\xc4\x3f\x96\xea\x49\x7d\xb8\xaf\xd6\xc3\
-\xd3\xb5\x32\x1b\x3f\x61\xd1\x26\x33\x3d\x40\xaa\x25\xbe\x8f\xb7\
-\xa3\x3b\xa2\x7d\x95\x90\x5c\xb1\x68\x70\xec\xa1\xd2\x81\xbe\x9f\
-\x9e\xe8\x8e\xa0\x33\xd3\xf0\xa6\x87\xf1\xcc\xd0\xe8\x73\xd0\xbe\
-\x39\x11\x99\x00\x3c\xaf\xea\xbc\x45\xeb\x43\x8b\xc4\x34\xab\xa4\
-\xf5\x47\x2d\x5d\xb5\xf6\x21\x68\xdf\x24\x24\xd7\x68\xbe\xf6\x76\
-\xfe\x00\x7f\x13\xbc\x63\xd3\x40\xe6\x9b\xc6\x86\x97\xa1\x7d\x71\
-\x26\xf4\x3a\x97\x1e\xf0\xc2\xeb\x45\x43\x98\x26\x90\xd2\xfb\xfc\
-\x4b\xdc\x9a\x47\xa0\x7d\x91\x90\x42\xa1\x57\xbb\x64\x20\x38\x96\
-\x39\xdb\xcb\x61\xe9\xb6\xba\x0d\x8d\x3c\x1e\x9a\xd2\x43\xad\xf2\
-\x0e\x43\xfc\x34\x50\x0e\xd3\xcf\x95\x7a\x26\x84\x15\xfb\x08\xe9\
-\x31\xfa\x3d\xad\x53\x6d\xf0\x62\x74\xc7\xa7\xf5\x20\x98\xea\x2a\
-\xca\x86\x85\xd3\xe5\xed\xcf\x0b\x03\xb6\xf5\x0c\x5d\x11\x32\xdf\
-\x45\x41\x2d\x3d\xb0\xec\x0f\xd7\x43\xa1\x68\x5f\x23\xa4\x54\xe8\
-\xb5\xaf\xf6\xad\x81\xf0\x57\x78\x20\xa0\x65\x60\xfe\x5a\x5d\x45\
-\x69\x6e\x08\xb4\x6f\x65\xcd\xc0\xea\xd6\xce\x3a\x50\x24\xd6\x5f\
-\x8d\xd7\x99\x36\x5f\x93\x76\xfc\x47\xfb\x54\x7f\xd8\x0e\xed\x5b\
-\x84\x94\x1a\x4d\xd9\x5a\xa9\xb7\x5e\xdb\x3e\x8d\xcd\x6b\x59\xf9\
-\x33\x7f\xba\xac\xa0\x3e\x55\x86\x3c\xe8\xfa\x8e\xe2\xa3\x9f\xe6\
-\xa4\x35\x7f\xd6\x89\x2d\xcb\xb4\x58\xcf\xc4\x72\xd2\x84\x90\x08\
-\x30\xb5\xb5\xbb\x68\x52\x18\xe9\xa8\xe7\xa2\x03\x06\x6d\x9a\x60\
-\xda\x3e\xd0\x69\x34\xbb\x1e\xda\x67\x50\xe8\x6d\x06\xfd\x3c\xc0\
-\xeb\xae\x91\x9b\xf5\x17\xe9\x21\x64\x4d\x09\x8d\xf6\x19\x42\x48\
-\x17\xa4\x49\x85\xd2\xd4\xad\xbe\xaa\xe5\x60\xe1\x41\x84\xd6\x31\
-\x3f\x2a\xed\xf1\x11\x33\x3c\x7c\x7f\xb4\x8f\xc4\x82\xee\x0a\xb4\
-\xb3\x0b\x86\x53\xf0\xed\x43\x4b\x4d\xf3\xf4\xdb\x30\x60\xea\x7e\
-\x5f\xae\xf6\x09\xc9\x31\xcb\x96\x0d\x3f\xa8\x73\x56\x60\x05\xeb\
-\xbc\xf7\xdf\x44\xf3\x33\xd3\x83\x52\xae\xb9\x1b\xda\x17\x62\xa7\
-\xe2\x5a\x8f\xd3\x6f\xcb\x7a\xed\x11\xdd\x6e\x65\xb3\x76\x99\x72\
-\xbd\x6e\xea\x3f\xa6\xc9\xc8\xd0\xbe\x40\x08\xc9\x98\x45\xb5\x91\
-\x07\x8f\x4f\x06\xaa\xd6\xdf\x86\x0e\x3a\x45\xb5\xc4\xfa\xf3\x74\
-\xdb\xb4\x52\x6b\xed\x8e\x6e\xf3\xbc\x62\xec\xe8\x1e\x3a\x71\x12\
-\x3b\x0b\xdd\x9e\x45\xb5\xcd\x83\xbe\x4c\xba\x10\x29\xa5\x09\x21\
-\x20\xd2\x04\x43\x3a\x19\x70\xa1\xa2\xb9\xba\xd1\xc1\x28\xcf\x96\
-\xee\xac\xd8\x70\x92\x04\xd4\xff\x8d\x21\x45\x6f\xd1\x48\x86\xfc\
-\x9e\xe9\xd9\x16\xeb\x87\x39\x71\x9d\xa7\xaf\x4a\x5f\x4f\xb7\xf7\
-\x9d\x3f\x50\xb3\x8d\xa2\xdb\x96\x10\x02\x46\xcf\x0c\xe8\xa1\xac\
-\x4e\x90\x5d\xc5\xdb\x04\x5d\x04\x52\xe7\x2f\x4f\x4b\x39\xbb\x70\
-\x00\xb7\x4c\xfb\xc7\xc2\xa1\x75\x3b\x74\x4a\x13\xff\x58\x7e\xbc\
-\x00\xed\x07\xf1\x9b\x16\x8d\xf2\x63\xed\x6c\xa2\x61\x3f\xad\xe8\
-\x88\x6e\x43\x42\x48\xc4\xb4\x77\x07\xfc\x5b\x64\x55\x7b\xb4\x04\
-\xda\xc0\xb3\x03\x69\x20\x3d\x5b\x02\xe9\x71\xc6\x86\x0f\x2f\x6e\
-\xf8\xa7\xa2\xdb\x88\xb4\xd1\xcf\x2c\x7a\xb0\x52\x7c\xf4\x77\x7a\
-\x3f\x1d\xef\x27\x58\xeb\xec\x46\x79\xad\x23\x52\x71\xcd\x37\x73\
-\x95\x4f\x08\x99\x17\xc7\x0d\x0f\xdf\x4f\x82\xc9\x4b\x8c\xf5\x87\
-\xca\x40\x38\xa8\x57\x83\xd0\x81\xae\xc7\x83\xfd\xb5\x12\x48\x47\
-\xd2\x09\x90\x4c\x84\xf8\x7d\x34\x3f\x68\x5b\x8d\x4f\x5e\xdb\x87\
-\x09\xfd\xb5\x78\x7f\xea\xa1\xa5\x7d\x31\xed\x93\x87\x18\xdb\x7a\
-\xb1\xf6\x55\x74\x1b\x10\x42\x0a\x8e\x6e\x7b\x6b\xc0\xd1\x53\xc3\
-\xba\x1d\xab\xc1\x36\x6f\x77\xba\xf5\x10\x94\xd8\x3f\xdb\x05\x6c\
-\xfc\xe1\xba\x9d\xaf\xdf\xf0\xf5\x93\x08\x5a\x5f\x92\x1d\x03\x2b\
-\x9b\x8f\xd4\xed\xef\x34\x85\xb6\x7e\xb6\x69\x6f\x89\xe7\xea\x7a\
-\x6c\xbb\xd0\x8e\x3f\x33\x4d\x13\x9d\xa6\x02\x0f\xfb\x71\x62\x4a\
-\x08\x89\x0a\x0d\xb6\x95\x86\x7f\x91\x04\xaa\xf7\xc8\x04\xe1\xab\
-\xb2\x32\xf9\x95\x04\xb0\xd5\x62\xe7\xf6\xbb\xa2\xa1\x9e\x65\x10\
-\xbb\x2c\xfd\x8c\x61\xc3\x80\x04\xfe\xef\x54\xeb\xcd\x8f\xa6\x83\
-\x41\x23\x3c\x49\xd3\x29\xa3\xf5\x22\x18\xb4\xed\x17\xaf\x6c\x3d\
-\xd9\x34\x5a\xaf\x52\x9f\x10\x3f\xfd\x7f\x6d\x1f\x49\x7d\xe5\xb2\
-\x7e\x9f\x83\xe9\xf4\x8d\x73\xf5\x0c\x4e\xa7\xcf\x7c\x45\x7c\xf4\
-\xdd\xda\x97\x58\x5d\x8f\x10\x52\x08\x06\x07\xc7\xb6\xd7\x7c\xf7\
-\xa6\xd6\x7c\x56\xc5\xfa\x57\xca\xa0\xfc\x2e\x59\x7d\x1f\xd4\x3e\
-\x80\x18\x8e\xe8\x1c\x56\xfa\x7e\x9a\x25\x4e\x0b\xc9\x38\xff\x07\
-\x09\x86\xa6\xda\xce\x9c\x37\xfe\x7b\xc7\x76\xfe\xdc\x91\x1a\x28\
-\xe5\xff\xfb\x9c\xde\x68\x48\x6c\xf3\x75\x03\xb5\xd6\x0b\x74\x70\
-\xd7\xfc\x07\xe8\x77\x25\xf9\x46\x7d\x48\x7d\x49\x7d\x4a\x7d\x4b\
-\x4f\xce\xcb\xc4\xe0\xb3\xfa\x29\x6c\xdc\xff\x3a\x87\x11\x3b\x7e\
-\xd9\xf6\x53\xf5\xd9\xcd\xbf\xa7\x9f\x91\xd2\x3f\x27\x93\xcf\x34\
-\x4b\xa7\x3f\x48\x7d\x5e\x7d\x3f\xed\x03\xd2\x17\xb4\x4f\xa0\xdf\
-\x95\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x05\xe2\xff\x03\xf6\x47\xa9\
-\x7c\xf4\x28\xdf\xc5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x20\x27\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x1f\xd9\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x0b\x90\x25\x57\x79\x1f\x70\x01\x02\x21\x63\xde\xc6\xd8\x60\
-\x9e\x86\x40\x30\x14\x86\x28\x2a\x1e\x01\x8c\x0b\x87\x97\xcb\x10\
-\x43\x01\x2e\x03\xa1\x9c\x50\xc4\x98\x98\xc4\x21\x81\x72\xe1\x88\
-\xb7\xcb\x98\x87\xb1\xb1\x29\x51\x04\x11\x54\xda\xe9\xdb\x5e\x69\
-\x85\xb4\xd3\x7d\x57\x0b\x35\x81\xb9\xa7\x67\xa5\x6c\x8c\x14\xcb\
-\x38\xc6\x60\xde\x0f\xa1\x37\x48\x20\x04\xd2\xa6\xcf\xec\xee\xcc\
-\x95\xd0\x63\x7b\xf7\xde\x7b\xfa\xf6\xf9\xfd\xaa\xbe\x92\x4a\xd2\
-\x6a\xba\xbf\xee\x73\xbe\x7f\xdf\x3b\x33\xf7\xb8\xe3\x80\x2c\x94\
-\x65\x73\xe2\x4a\x3d\x79\x41\x51\x37\x7f\x3a\xaa\x9b\xd5\xa2\x0a\
-\xe7\xc7\xda\xfc\xfb\xf6\x9f\xc5\x7f\x17\xff\x9b\xd4\xc7\x09\x00\
-\xcc\x40\x59\x7d\xe6\x7e\xa3\xaa\x79\xcf\xa8\x0e\x57\xb7\xc3\xfe\
-\xc0\x6d\x57\xb8\xba\x0d\x05\xef\x8d\x7f\x26\xf5\x71\x03\x00\x47\
-\x69\x54\x4d\x5e\xde\x0e\xf4\xcb\x6f\x7f\xf0\xff\x44\x5d\x51\xac\
-\x36\xaf\x4c\x7d\xfc\x00\x40\x07\x07\x0e\x1c\xb8\x43\x51\x87\xf7\
-\x1d\xc5\xe0\xbf\x49\x15\x55\xf3\x67\xf1\xff\x95\xfa\x7c\x00\x80\
-\xdb\xb1\x39\xfc\xab\xf0\xa1\x63\x1d\xfe\x5b\x21\xa0\x6e\x4e\x15\
-\x02\x00\xa0\xc7\x0e\x0e\xff\xe6\x83\xb3\x1a\xfe\xdb\x21\x20\xfc\
-\x95\x10\x00\x00\x3d\x35\xaa\xc2\x9f\xcc\x7a\xf8\x4f\xbd\x1d\xf0\
-\x81\xd4\xe7\x07\x00\xdc\x4c\x51\x85\x77\xcf\x6b\xf8\x6f\x55\xd5\
-\xbc\x27\xf5\x79\x02\x00\x87\x14\x75\x78\xc7\xdc\x87\xff\x56\x08\
-\x08\xef\x4a\x7d\xbe\x00\x90\xbd\xa2\x6a\x4e\x59\xd8\xf0\xdf\xfe\
-\x9e\x80\xb7\xa6\x3e\x6f\x00\xc8\x56\x31\x0e\xff\x65\xd1\xc3\x7f\
-\x2a\x04\xbc\x39\xf5\xf9\x03\x40\x76\x46\x55\x78\x43\xaa\xe1\xbf\
-\x1d\x02\x9a\xff\x96\xba\x0f\x00\x90\x8d\x51\x1d\x7e\x3f\xf5\xf0\
-\x9f\xfa\x9e\x80\x37\xa6\xee\x07\x00\x0c\x5e\xfb\xd4\xfd\xef\x8b\
-\x2a\xdc\x98\x7c\xf0\x1f\x7e\x15\xa0\x3d\x96\x72\xdc\xbc\x2e\x75\
-\x5f\x00\x60\xb0\x46\xab\x93\x57\xf7\x69\xf8\x4f\x87\x80\x36\x98\
-\xbc\x26\x75\x7f\x00\x60\x70\x46\x55\xf3\x6f\x47\x75\xb8\x21\xf5\
-\xb0\x17\x02\x00\x60\x41\x36\x3f\xd5\xaf\x6e\x7e\x9c\x7a\xc8\xdf\
-\x7e\x85\x1b\xca\x3a\xbc\x22\x75\xbf\x00\x60\xe9\x95\xab\x1b\x2f\
-\x5d\x8e\xe1\x7f\xe8\x95\x80\xf6\x58\x8b\x2a\xbc\x2c\x75\xdf\x00\
-\x60\x69\x15\xe3\xc9\x8b\x8a\xaa\xf9\x51\xea\xa1\xde\xfd\xed\x80\
-\xe6\x47\x65\x15\x5e\x9c\xba\x7f\x00\xb0\x74\x56\x56\x37\x9e\xdb\
-\x3e\x4d\x5f\x97\x7a\x98\x1f\x75\x55\xe1\xfa\x62\x35\xbc\x30\x75\
-\x1f\x01\x60\x69\x14\xd5\xe4\x79\x4b\x3d\xfc\x0f\xbf\x12\x50\x87\
-\x1f\x96\x75\x78\x7e\xea\x7e\x02\x40\xef\xad\x54\x93\x7f\x3d\xaa\
-\x9a\x1f\xa4\x1e\xde\xb3\x0b\x01\xcd\x75\x6d\x10\x78\x76\xea\xbe\
-\x02\x40\x6f\xad\xd4\x93\xa7\x8d\xaa\x70\x4d\xea\xa1\x3d\x8f\x10\
-\x10\xdf\xd2\x48\xdd\x5f\x00\xe8\x9d\x62\xb5\x79\x6a\x51\x35\xdf\
-\x4b\x3d\xac\xe7\x17\x02\xc2\xb5\xc5\x78\xf2\xcc\xd4\x7d\x06\x80\
-\xde\x28\xeb\xc9\x93\xdb\xa7\xe4\xef\xa6\x1e\xd2\x8b\x08\x01\x65\
-\xd5\x3c\x23\x75\xbf\x01\x20\xb9\x76\xf0\x3f\xb1\x1d\x8e\x57\xa4\
-\x1e\xce\x0b\xab\x2a\x5c\x13\xdf\xea\x48\xdd\x77\x00\x48\xa6\xdc\
-\x3d\xf9\xe5\xa2\x0a\x97\x27\x1f\xca\x8b\x7e\x25\xa0\x0a\x57\x95\
-\xe3\xe6\xe4\xd4\xfd\x07\x80\x85\x2b\xc6\xeb\x8f\x6f\x07\xe1\x65\
-\xa9\x87\x71\xb2\x10\x50\x37\x57\xee\x58\x9d\x9c\x94\xfa\x3a\x00\
-\xc0\xc2\xec\x1c\x87\x47\x8f\xaa\xf0\xed\xd4\x43\xb8\x07\x75\x45\
-\x7c\x0b\x24\xf5\xf5\x00\x80\xb9\x2b\xeb\xc9\xa3\x8a\xaa\xf9\x66\
-\x0f\x86\x6f\x2f\xaa\x0d\x00\xdf\xd9\x51\xaf\xff\x52\xea\xeb\x02\
-\x00\x73\xb3\xf3\xbc\x8d\x47\x8e\xaa\xe6\x1b\xa9\x87\x6e\xdf\xaa\
-\x0d\x44\x97\x94\xd5\xbe\xc7\xa4\xbe\x3e\x00\x30\x73\x2b\xd5\xe4\
-\x17\x8b\x3a\x7c\x3d\xf5\xb0\xed\x6b\xc5\xde\x94\xe3\xe6\x11\xa9\
-\xaf\x13\x00\xcc\x4c\xb9\x77\xfd\xc1\xa3\x2a\x7c\x29\xf5\x90\xed\
-\x7b\xb5\x21\xe0\x6b\x3b\x77\xaf\x3f\x3c\xf5\xf5\x02\x80\x63\xb6\
-\x32\xbe\xe0\x41\x45\xdd\x7c\x31\xf5\x70\x5d\x96\x2a\xaa\xe6\x2b\
-\xe5\x9e\x7d\x0f\x4b\x7d\xdd\x00\xe0\xa8\x95\xe7\x36\x0f\x6c\x87\
-\xda\x17\x52\x0f\xd5\x65\xab\x36\x30\x7d\x79\xe7\xee\xf0\x90\xd4\
-\xd7\x0f\x00\x3a\x3b\x73\x4f\xf8\xd9\x51\x1d\x3e\x97\x7a\x98\x2e\
-\x6b\x15\x55\xf8\xfc\x8e\xf3\x26\x0f\x48\x7d\x1d\x01\xe0\x88\x95\
-\xd5\x67\xee\x57\x54\xcd\xc5\xa9\x87\xe8\xf2\x57\xf8\x87\x33\xeb\
-\x4f\xff\x7c\xea\xeb\x09\x00\xb7\xeb\x8c\x73\xf6\xff\x4c\x51\x87\
-\xff\x9b\x7e\x78\x0e\xa3\xda\x20\xf5\xf7\xe5\xee\xf3\x7f\x2e\xf5\
-\x75\x05\x80\x5b\xb5\x6b\xd7\xda\xbd\x8a\x2a\xec\x4f\x3d\x34\x87\
-\x57\xe1\xa2\xb3\xf6\x9e\x7f\xdf\xd4\xd7\x17\x00\x7e\x42\xb9\x77\
-\xff\x3d\xdb\x61\x75\x41\xfa\x61\x39\xcc\x2a\xea\xe6\xb3\xe5\xb8\
-\xb9\x4f\xea\xeb\x0c\x00\x5b\x4e\xaf\xf6\xdd\xa3\x7d\x4a\xdd\x97\
-\x7a\x48\x66\x50\x7f\x73\xc6\xee\xf5\x7b\xa7\xbe\xde\x00\x70\xdc\
-\xc7\xf7\x5c\x78\xb7\x76\x30\x7d\xba\x07\xc3\x31\x8b\x2a\xaa\xa6\
-\x39\xfb\xec\xc9\xdd\x53\x5f\x77\x00\x32\x76\xce\x39\xfb\x7f\x6a\
-\x54\x85\xb5\xd4\x43\x31\xbb\xaa\x9a\x50\xae\xad\xfd\x74\xea\xeb\
-\x0f\x40\x86\xca\xb2\x39\xb1\xa8\x9b\x4f\x25\x1f\x86\x99\x56\x51\
-\x87\xf5\xf8\xea\x4b\xea\xfb\x00\x80\x8c\x9c\xb6\xb6\x76\xd7\x76\
-\x08\xed\x49\x3d\x04\xb7\xaa\x0a\xdf\x8e\xbf\x47\x7f\x01\x43\xf7\
-\xeb\x6d\x7d\x2b\xf9\xf9\x1e\x3e\x9e\x2a\x9c\x17\xaf\x45\xea\xfb\
-\x01\x80\x0c\x94\xe5\xc5\x77\x19\xd5\xe1\x9c\xd4\xc3\x6f\x7b\x28\
-\x37\xdf\x29\xf6\x84\xc7\xb6\x7f\xff\xbf\x17\x10\x34\xfe\x4f\x59\
-\x4f\x1e\xd5\xa7\x10\xd0\xd6\x1e\x21\x00\x80\xb9\x3a\x75\xff\xfe\
-\x3b\x8f\xaa\xe6\xec\x1e\x0c\xbd\xc3\xc3\xff\xca\x72\xcf\xbe\x7f\
-\x11\x8f\x6d\x51\x01\x20\x7e\xad\x72\xb5\x79\x5c\x1b\x82\x2e\x4d\
-\x7d\xfe\x5b\x7d\xa8\x42\x5d\x55\xd5\x09\x69\xef\x0e\x00\x06\xa9\
-\x2c\xcb\x3b\xb5\xc3\x66\x25\xf5\xb0\x9b\x1a\x7a\x57\xed\x58\x9d\
-\x9c\x74\xf8\xf8\x16\x19\x00\xa2\x62\xbc\xfe\xf8\xf6\x18\x2e\x4b\
-\xdd\x87\xad\x7e\xd4\xe1\xac\x18\xd0\xd2\xdc\x1d\x00\x0c\x52\x1c\
-\xfe\xed\xb0\x3b\x23\xf5\x90\xdb\xae\x70\x75\x39\x6e\x4e\x9e\x3e\
-\xc6\x45\x07\x80\x68\x47\x15\x9e\xd0\xfe\xf3\x2b\xd2\xf7\xe3\xf0\
-\xf1\x35\x3b\xd7\xd6\xd6\x8e\x5f\xec\xdd\x01\xc0\x20\x9d\x72\xca\
-\x81\x3b\x16\x75\x73\x7a\xf2\xe1\xb6\x3d\x84\xaf\x29\x76\x87\xa7\
-\xdf\xfc\x38\x53\x04\x80\xa8\xa8\xd6\x9f\x14\x03\x49\xf2\xbe\x6c\
-\x57\x29\x04\x00\x70\x4c\x0e\x1c\x38\x70\x87\x76\xf8\x9f\xda\x83\
-\xa1\xb6\x59\x45\x1d\xae\x5d\xa9\x37\x7e\xe5\x96\x8e\x35\x55\x00\
-\x88\x56\xc6\xe1\x29\x6d\x9f\xbe\x9b\xba\x3f\x53\x7d\xfa\x58\x0c\
-\x6e\x73\xbd\x39\x00\x18\xa6\x83\xc3\x3f\xfc\x55\xea\x61\x36\x35\
-\xd4\xbe\x5f\xae\x86\x5f\xbd\xb5\xe3\x4d\x19\x00\xa2\xb2\xda\xf8\
-\x57\x45\xd5\x7c\x2f\x75\x9f\xb6\x8f\xb5\xf9\xa8\x10\x00\x40\x27\
-\x9b\xc3\xbf\x6a\x3e\x98\x7c\x88\x6d\x0f\xff\x1f\x16\xd5\xe4\x79\
-\xb7\x75\xcc\xa9\x03\x40\x54\xd4\xcd\xb3\x62\x50\x49\xdd\xaf\xa9\
-\xbe\x7d\x24\x5e\xcb\xd9\xde\x1d\x00\x0c\x56\x3b\xe8\xfe\x24\xf5\
-\xf0\x9a\x1e\xfe\x2b\xe3\xf0\xeb\xb7\x7b\xcc\x3d\x08\x00\x51\x39\
-\xde\xf8\xb5\xf6\xe9\xfb\x07\xa9\xfb\xb6\xd5\xbf\xaa\xf9\xc0\x6c\
-\xee\x0a\x00\x06\xad\x7d\x8a\xfd\xe3\xd4\x43\x6b\x6a\xe0\x5e\x5f\
-\xd6\x1b\xbf\x71\x24\xc7\xdd\x97\x00\x10\x95\xe3\xe6\x39\x6d\x1f\
-\xaf\x4b\xde\xbf\xad\x0a\xef\x3f\xb6\xbb\x02\x80\x41\x6b\x9f\xb6\
-\xdf\x91\x7e\x58\x1d\x7a\x72\xad\x9b\x1f\x97\xab\x1b\x2f\x3d\xd2\
-\x63\xef\x53\x00\xd8\xec\xe5\x6a\x78\x61\x0c\x30\xa9\xfb\xb8\x7d\
-\xec\xcd\x7b\x8e\xee\xae\x00\x60\xd0\xda\xa7\xc4\xb7\x24\x1f\x52\
-\x53\xc3\xbf\x3d\x9e\xdf\xea\x76\xfc\xfd\x0a\x00\xd1\x4a\xbd\xf1\
-\x9b\x45\xd5\xfc\x28\x75\x3f\xb7\x2b\xbc\xa5\xd3\x4d\x01\xc0\xb0\
-\xb5\x83\xed\x0d\xe9\x87\xd3\xd4\xf0\xaf\x26\x2f\xef\x7c\x0e\x3d\
-\x0c\x00\x51\x59\x85\x17\xf7\x29\x04\x14\x75\x78\x73\xd7\x73\x00\
-\x60\x80\x46\x55\xf3\x9f\x53\x0f\xa5\xad\xe1\x54\x85\x1b\x47\xab\
-\x93\x57\x1f\xd5\x79\xf4\x34\x00\x44\xc5\x6a\xf3\xca\xf6\xe9\xfb\
-\x86\xd4\xfd\x9d\xaa\x3f\x3c\x9a\xf3\x00\x60\x20\xca\x3a\xbc\xbe\
-\x07\xc3\x68\x7b\xf8\xd7\xcd\x7f\x38\xda\x73\xe9\x73\x00\x38\xd8\
-\xeb\x8d\x57\xf5\x2a\x04\x54\xe1\x8d\x47\x7b\x2e\x00\x2c\xb1\xf8\
-\xa4\x7d\x68\xe8\x26\x1f\x46\xf1\x38\xda\x7a\xed\x31\x9d\x4f\xcf\
-\x03\x40\x54\x56\xcd\xbf\xeb\x53\xcf\xcb\x71\xf3\xba\x63\x39\x1f\
-\x00\x96\x4c\x3b\xc8\x7e\xa7\x4f\x4f\xa3\x65\xdd\xfc\xd7\x63\x3e\
-\xa7\x25\x08\x00\x9b\xc7\x39\xb0\xe0\x05\xc0\x92\xe8\xdb\x4b\xd1\
-\x65\x15\xde\x34\x8b\xf3\x5a\x96\x00\x10\xf5\xed\xad\x97\xa2\x6e\
-\x5e\x33\x8b\xf3\x02\xa0\xa7\xda\x0d\xff\x25\x07\x7f\xc4\x2e\xfd\
-\xe0\x39\x54\x33\xfb\x66\xb4\x65\x0a\x00\x51\x1b\xc4\xfe\xa0\x07\
-\xfd\x3f\x54\xe1\x86\x36\x94\xbc\x62\x56\xe7\x06\x40\x8f\xf4\xed\
-\xc7\xd1\xda\xa1\xf3\x47\xb3\x3c\xbf\x65\x0b\x00\x9b\xc7\xdc\xb3\
-\x1f\xbf\x6c\xef\x8f\xdf\x9e\xe5\xf9\x01\x90\x58\xdf\x7e\x21\x4d\
-\x51\x85\x77\xcf\xfa\x1c\x97\x31\x00\x44\xed\x75\x79\x5b\xea\xeb\
-\x71\xd3\x10\x10\x5e\x36\xeb\x73\x04\x20\x81\x95\xd5\x8d\xe7\xf6\
-\xe9\xf7\xd2\xb7\x03\xe6\xbd\xf3\x38\xcf\x65\x0d\x00\x51\xdb\x93\
-\x77\xa6\xbe\x2e\xd3\x21\xa0\xfd\xeb\x4b\xe6\x71\x9e\x00\x2c\x48\
-\x51\x87\x67\xf7\x69\xf8\xcf\xf3\x43\x69\x96\x39\x00\x44\x7d\xfa\
-\x10\xa6\xf8\x09\x8c\x47\xfa\x21\x4c\x00\xf4\x4c\xef\x3e\x96\xb6\
-\x6e\x3e\x3c\xcf\xcf\xa6\x5f\xf6\x00\x10\xc5\xb7\x46\x52\x5f\xa7\
-\x9b\x86\x80\xf0\xfc\x79\x9e\x2f\x00\x33\xb6\x52\x4f\x9e\xd6\x0e\
-\xab\x6b\x52\x0f\x91\xa9\x61\xf2\x91\x79\x0e\xff\x68\x08\x01\x20\
-\xf6\xa8\xfd\x3a\x7f\x99\xfa\x7a\x6d\x5f\xb7\xe6\xba\xf8\x16\xd2\
-\x3c\xcf\x19\x80\x19\x29\x56\x9b\xa7\x16\x55\xf3\xbd\xd4\xc3\x63\
-\x6b\x88\x54\xe1\xb4\x53\x4e\x39\x70\xc7\x79\x9f\xf7\x10\x02\x40\
-\x14\x43\x40\xdb\xb3\x0f\xa5\xbe\x6e\xdb\x21\x20\x5c\x5b\x8c\x27\
-\xcf\x9c\xf7\x79\x03\x70\x0c\xca\x7a\xf2\xe4\xf6\xa9\xed\xbb\xa9\
-\x87\xc6\x76\x85\xff\xb9\x88\xe1\x1f\x0d\x25\x00\x44\x9b\x21\xa0\
-\x6e\x3e\x9c\xfe\xfa\x6d\x87\x80\xb2\x6a\x9e\xb1\x88\x73\x07\xa0\
-\xa3\x76\x60\x3c\xb1\xdd\xac\xaf\x48\x3d\x2c\xa6\xaa\x5c\x5b\x5b\
-\x3b\x7e\x51\xe7\x3f\xa4\x00\x10\x95\x65\x79\xa7\xf6\x9a\x9e\xde\
-\x83\xeb\x78\xf8\xdc\xaf\x89\x6f\x2d\x2d\xea\xfc\x01\x38\x02\xe5\
-\xee\xc9\x2f\x17\x55\xb8\x3c\xf9\x90\xd8\x1e\x16\x67\x2e\x72\xf8\
-\x47\x43\x0b\x00\xd1\x66\x08\xa8\x9a\x1d\xc9\xaf\xe7\xa1\x6a\xef\
-\xb1\xab\xca\x71\x73\xf2\x22\x7b\x00\xc0\xad\x28\xc6\xeb\x8f\x6f\
-\x37\xe6\xcb\x52\x0f\x87\xa9\xda\x75\xea\xfe\xfd\x77\x5e\x74\x1f\
-\x86\x18\x00\xa2\x83\xaf\x04\x84\xa2\x07\xd7\xf5\x60\x08\xa8\x9b\
-\x2b\x77\xac\x4e\x4e\x5a\x74\x1f\x00\x98\x52\xae\x36\x8f\x1b\xd5\
-\xe1\xd2\xd4\x43\x61\xea\x09\xb1\xae\xaa\xea\x84\x14\xbd\x18\x6a\
-\x00\x88\x62\xa0\x6a\x7b\xfb\x89\xd4\xd7\x77\xaa\xae\x88\x6f\x39\
-\xa5\xe8\x05\x40\xf6\xca\x7a\xf2\xa8\xf6\xc9\xf0\x5b\x3d\x18\x06\
-\x87\x6b\xcf\x69\x6b\x6b\x77\x4d\xd5\x8f\x21\x07\x80\xa8\x2c\x2f\
-\xbe\xcb\xa8\x6a\xce\xed\xc1\x75\xde\xac\x36\x00\x7c\xa7\xd8\x13\
-\x1e\x9b\xaa\x1f\x00\x59\xda\x79\xde\xc6\x23\xdb\x61\xf0\x8d\xd4\
-\x43\x60\x6a\x30\xee\x2d\xcb\xe6\xc4\x94\x3d\x19\x7a\x00\x88\x36\
-\x43\x40\xdd\xac\x26\xbf\xde\x87\x43\x40\xd5\x5c\x52\x56\xfb\x1e\
-\x93\xb2\x27\x00\xd9\x28\xc7\xcd\x23\xda\x27\xff\xaf\xa7\xde\xfc\
-\xb7\x9f\x04\xc3\x7a\xb9\xb6\xf6\xd3\xa9\xfb\x92\x43\x00\x88\x62\
-\xd0\x6a\x9f\xbe\x3f\x95\xfa\xba\x4f\xf5\xe4\xdb\x3b\xc7\xe1\xd1\
-\xa9\xfb\x02\x30\x68\xe5\xde\xf5\x07\xb7\x1b\xee\x97\x92\x6f\xfa\
-\x5b\x9b\x7f\x13\xce\x3e\x7b\x72\xf7\xd4\x7d\x89\x72\x09\x00\xd1\
-\x39\xe7\xec\xff\xa9\xf6\x58\xd6\x92\x5f\xff\x43\xd5\x86\xc0\xaf\
-\xed\xdc\xbd\xfe\xf0\xd4\x7d\x01\x18\xa4\x95\xf1\x05\x0f\x2a\xaa\
-\xf0\x4f\xa9\x37\xfb\xa9\xda\xe8\xcb\xf0\x8f\x72\x0a\x00\xd1\xc7\
-\xf7\x5c\x78\xb7\xf6\x98\x3e\xdd\x83\xfb\xe0\x60\x08\xa8\x9a\xaf\
-\x94\x7b\xf6\x3d\x2c\x75\x5f\x00\x06\xe5\xcc\x6a\xdf\x2f\xb4\x9b\
-\xec\x17\x52\x6f\xf2\x53\xf5\x37\x67\xec\x5e\xbf\x77\xea\xbe\x4c\
-\xcb\x2d\x00\x44\xa7\x57\xfb\xee\xd1\x86\xc2\xf3\x7b\x70\x3f\x1c\
-\x0c\x01\x75\xf3\xe5\x9d\xbb\xc3\x43\x52\xf7\x05\x60\x10\x76\x7c\
-\x72\xe3\xfe\xa3\x3a\x7c\x2e\xf5\xe6\xbe\x3d\x04\x9b\x0b\xcb\x71\
-\x73\x9f\xd4\x7d\xb9\xb9\x1c\x03\x40\x54\xee\xdd\x7f\xcf\x85\x9c\
-\xfb\x91\x86\x80\x2a\x7c\x7e\xc7\x79\x93\x07\xa4\xee\x0b\xc0\x52\
-\x3b\x73\x4f\xf8\xd9\xa2\x6a\x2e\x4e\xbd\xa9\x6f\x57\xb8\xe8\x8c\
-\x73\xf6\xff\x4c\xea\xbe\xdc\x92\x5c\x03\x40\xb4\x6b\xd7\xda\xbd\
-\xda\xc1\xbb\x3f\xfd\xfd\xb1\x75\x9f\xfc\xc3\x99\xf5\xa7\x7f\x3e\
-\x75\x5f\x00\x96\x52\x1c\xb4\xed\xd3\xf6\xdf\xa6\xdf\xcc\x0f\x3f\
-\xd9\x35\xff\xaf\xdc\x7d\xfe\xcf\xa5\xee\xcb\xad\xc9\x39\x00\x44\
-\x65\xf5\x99\xfb\xb9\x5f\x00\x96\x9c\x27\xba\xee\x72\x0f\x00\xd1\
-\xe6\x2b\x46\x75\xf8\xbb\xf4\xf7\xcb\xd6\x7d\x73\xd1\x59\x7b\xcf\
-\xbf\x6f\xea\xbe\x00\x2c\x85\x43\xef\xe9\x5e\x90\x7e\xf3\x3e\xfc\
-\x24\x17\xfe\x71\x19\xde\xd3\x15\x00\x0e\xea\xdb\xf7\x8c\x14\x75\
-\xf3\xd9\x3e\x7e\xcf\x08\x40\xaf\xf4\xee\xbb\xba\xab\xe6\x2b\x2b\
-\xf5\xc6\x43\x53\xf7\xe5\x48\x08\x00\xdb\xfc\xd4\x08\xc0\x12\xe9\
-\xdb\xcf\x75\xb7\xc3\xee\xab\xcb\xf4\x73\xdd\x02\xc0\x4d\xf9\xbd\
-\x11\x00\x4b\xa0\x8f\xbf\xd9\x6d\xa5\x9a\xfc\x62\xea\xbe\x74\x21\
-\x00\xfc\xa4\x3e\xfe\xe6\xc8\x3e\xfc\xda\x68\x80\x5e\xe8\xe3\xef\
-\x76\x5f\xd9\xbd\xf1\xcf\x53\xf7\xa5\x2b\x01\xe0\x96\xf5\xf1\xb3\
-\x23\xe2\xab\x5d\xa9\xfb\x02\x90\x94\x4f\x77\x9b\x1d\x01\xe0\xd6\
-\xc5\x4f\x8f\x6c\xaf\xed\x37\x53\xdf\x5f\x53\x7d\x4c\xfe\xe9\x91\
-\x00\xc9\xf8\x7c\xf7\xd9\x12\x00\x6e\x5b\x59\x4f\x1e\xd5\x3e\x7d\
-\x7f\x2b\xf5\x7d\x36\x55\x7b\x4e\x5b\x5b\xbb\x6b\xea\xbe\x00\x2c\
-\xd4\xa9\xfb\xf7\xdf\xb9\xa8\xc2\x27\x7a\xb0\x09\x1f\x1e\xfe\x57\
-\xb6\xf5\xc4\xd4\x7d\x39\x16\x02\xc0\xed\x2b\x57\x9b\xc7\x8d\xea\
-\x70\x69\xea\xfb\x6d\xeb\xbe\xab\x42\x5d\x55\xd5\x09\xa9\xfb\x02\
-\xb0\x10\x65\x59\xde\xa9\x7d\x12\x2b\x52\x6f\xbe\x53\x9b\xf0\x55\
-\x3b\x56\x27\x27\xa5\xee\xcb\xb1\x12\x00\x8e\x4c\x31\x5e\x7f\x7c\
-\x7b\xcd\x2f\x4b\x7d\xdf\x6d\xdd\x7f\x75\x38\x2b\x06\xe2\xd4\x7d\
-\x01\x98\xab\xcd\xe1\x5f\x85\x33\x52\x6f\xba\xd3\xc3\xbf\x1c\x37\
-\x27\xa7\xee\xcb\x2c\x08\x00\x47\x6e\x47\x15\x9e\xd0\x5e\xfb\xcb\
-\x53\xdf\x7f\xdb\x7d\x6d\x76\xae\xad\xad\x1d\x9f\xba\x2f\x00\x73\
-\x71\xca\x29\x07\xee\x58\xd4\xcd\xe9\xc9\x37\xdb\xed\x61\x76\xcd\
-\x4a\x3d\x79\x5a\xea\xbe\xcc\x8a\x00\xd0\x4d\x51\xad\x3f\x69\x54\
-\x87\xab\x93\xdf\x87\xdb\x55\x0a\x01\xc0\xe0\x1c\x38\x70\xe0\x0e\
-\xed\xf0\x3f\xb5\x07\x9b\xec\x66\x15\x75\xb8\x76\xa5\xde\xf8\x95\
-\xd4\x7d\x99\x25\x01\xa0\xbb\x95\x71\x78\x4a\x7b\x5f\x7e\x37\xf5\
-\xfd\x38\x75\x5f\x7e\x2c\x06\xe5\xd4\x7d\x01\x98\x89\xcd\xe1\x5f\
-\x85\x0f\xa5\xde\x5c\xa7\x87\x7f\x31\x9e\x3c\x33\x75\x5f\x66\x4d\
-\x00\x38\x3a\xc5\x6a\xf3\xd4\xa2\x6a\xbe\x97\xfa\xbe\xdc\xee\x71\
-\xf3\x51\x21\x00\x58\x7a\x07\x87\x7f\xf3\xc1\xe4\x9b\xea\xd6\xf0\
-\x6f\xae\x5b\x59\xdd\x78\x6e\xea\xbe\xcc\x83\x00\x70\xf4\xda\xfb\
-\xe2\x59\x6d\x30\xfc\x7e\xea\xfb\x73\xfb\x3e\x0d\x1f\x89\x6b\x27\
-\x75\x5f\x00\x8e\x5a\xfb\xe4\xff\xee\xd4\x9b\xe9\xd4\xa6\xfa\xc3\
-\x95\x71\xf8\xf5\xd4\x3d\x99\x17\x01\xe0\xd8\x94\xe3\x8d\x5f\x6b\
-\x9f\xbe\x7f\x90\xfa\x3e\xdd\xba\x5f\xab\xe6\x03\xa9\x7b\x02\x70\
-\x54\xda\xa7\xaa\x3f\x4e\xbd\x89\x4e\x0d\xae\xeb\xcb\x7a\xe3\x37\
-\x52\xf7\x64\x9e\x04\x80\x63\x57\x8e\x9b\xe7\xc4\x57\x89\x92\xdf\
-\xaf\x5b\x15\xde\x9f\xba\x27\x00\x9d\xb4\x4f\xdb\xef\x48\xbf\x79\
-\x1e\x7a\x92\xaa\x9b\x1f\x97\xab\x1b\x2f\x4d\xdd\x93\x79\x13\x00\
-\x66\xa3\x58\x0d\x2f\x8c\x81\x31\xf5\x7d\xbb\x75\xff\x56\xe1\xbd\
-\xa9\x7b\x02\x70\x44\xda\xe1\xff\xd6\xd4\x9b\xe6\xf4\xf0\x6f\x9f\
-\xa2\x7e\x2b\x75\x4f\x16\x41\x00\x98\x9d\x95\x7a\xe3\x37\x8b\xaa\
-\xf9\x51\xea\xfb\x77\xfb\x3e\x0e\x6f\x4d\xdd\x13\x80\xdb\xd4\x0e\
-\x88\x37\xa4\xde\x2c\x6f\x32\xfc\xab\xc9\xcb\x53\xf7\x64\x51\x04\
-\x80\xd9\x2a\xab\xf0\xe2\x9e\x85\x80\x37\xa7\xee\x09\xc0\x2d\x2a\
-\xeb\x8d\x3f\x48\xbd\x49\x6e\x6d\x96\x55\xb8\x71\xb4\x3a\x79\x75\
-\xea\x9e\x2c\x92\x00\x30\x7b\xed\x39\xbf\xe4\xe0\xab\x48\xe9\xef\
-\xe9\x43\xf5\x87\xa9\x7b\x02\x70\x13\x65\x1d\x5e\xdf\x83\xcd\x71\
-\x6b\xf8\xb7\x9b\xf6\x6b\x52\xf7\x64\xd1\x04\x80\xf9\x68\x83\xed\
-\xab\x46\x75\xb8\x21\xf5\x7d\x3d\x75\x0d\xde\x98\xba\x27\x00\x9b\
-\xe2\x93\xf6\xe6\x13\x77\xea\x8d\xf1\xf0\xf0\xaf\xc2\x6b\x53\xf7\
-\x24\x05\x01\x60\x7e\xda\xf3\xfe\x9d\x3e\xdd\xe3\xe5\xb8\x79\x5d\
-\xea\x9e\x00\x99\xb3\x31\xf6\x87\x00\x30\x5f\x82\x2e\xc0\x21\x5e\
-\x1a\xed\x17\x01\x60\xfe\xbc\xd5\x05\x64\x6f\xe4\x9b\xa3\x7a\x47\
-\x00\x58\x0c\xdf\xec\x0a\x64\xcb\x8f\x47\xf5\x93\x00\xb0\x38\x7d\
-\xfb\x71\xd7\x76\x3d\xfe\x76\xea\x9e\x00\x03\xe7\x17\xa4\xf4\x97\
-\x00\xb0\x58\x7e\xe1\x15\x90\x0d\xbf\x22\xb5\xdf\x04\x80\xc5\xeb\
-\xdb\xaf\xbc\x6e\xff\xfa\x92\xd4\x3d\x01\x06\xc6\x87\xa4\xf4\x9f\
-\x00\x90\x46\x9f\x3e\xf4\x2a\x7e\xe2\xe5\xd0\x3f\xf4\x0a\x58\xa0\
-\xbe\x7d\x4c\x6a\x3b\xfc\xff\x3c\x75\x4f\xfa\x48\x00\x48\xa7\x6f\
-\x1f\x7b\x5d\xd6\xe1\xf9\xa9\x7b\x02\x2c\xb9\xf6\xe9\xe6\x59\xed\
-\x86\xf2\xfd\xd4\x9b\xda\xd4\xe6\xf6\x91\x03\x07\x0e\xdc\x21\x75\
-\x5f\xfa\x48\x00\x48\x27\xde\x93\x6d\x7f\xfe\x32\xf5\xfa\xd8\x5e\
-\x27\xcd\x75\x2b\xab\x1b\xcf\x4d\xdd\x17\x60\x49\x15\xab\xcd\x53\
-\x8b\xaa\xf9\x5e\xea\xcd\x6c\x7b\xf8\x34\x1f\x3d\xe5\x94\x03\x77\
-\x4c\xdd\x97\xbe\x12\x00\xd2\x8a\x21\xa0\xa8\xc2\x87\x92\xaf\x93\
-\xad\x10\x10\xae\x2d\xc6\x93\x67\xa6\xee\x0b\xb0\x64\x56\xc6\xe1\
-\x29\xed\x53\xc4\x77\x53\x6f\x62\x53\x9b\xd9\xc7\x0c\xff\xdb\x26\
-\x00\xa4\xb7\x19\x02\xea\xe6\xd4\xd4\xeb\x65\x3a\x04\x94\x55\xf3\
-\x8c\xd4\x7d\x01\x96\x44\x51\xad\x3f\x69\x54\x87\xab\x53\x6f\x5e\
-\x53\x55\xae\xad\xad\x1d\x9f\xba\x2f\x7d\x27\x00\xf4\x43\x0c\xaa\
-\x6d\x08\x38\xbd\x07\xeb\xe6\xf0\x35\xbb\x66\xa5\x9e\x3c\x2d\x75\
-\x5f\x80\x9e\xdb\x51\x85\x27\xb4\x9b\xc6\x15\xc9\x37\xad\xad\xcd\
-\xab\xd9\x69\xf8\x1f\x19\x01\xa0\x3f\xca\xb2\xbc\x53\x51\x85\x33\
-\x92\xaf\x9f\x43\xd5\x1e\xcb\x55\xe5\xb8\x39\x39\x75\x5f\x80\x9e\
-\x2a\xc6\xeb\x8f\x6f\x37\x8a\xcb\x52\x6f\x56\x5b\x9b\x56\x1d\xce\
-\x3a\x75\xff\xfe\x3b\xa7\xee\xcb\xb2\x10\x00\xfa\x65\x33\x04\xd4\
-\xa1\x48\xbd\x8e\xb6\xd7\x53\x73\xe5\x8e\xd5\xc9\x49\xa9\xfb\x02\
-\xf4\x4c\xb9\xda\x3c\x6e\x54\x87\x4b\x53\x6f\x52\x53\x4f\x2c\x75\
-\x55\x55\x27\xa4\xee\xcb\x32\x11\x00\xfa\x27\x06\xd8\xf6\x5e\xfe\
-\x44\xea\xf5\x34\x1d\x02\xda\x7a\x62\xea\xbe\x00\x3d\x51\xd6\x93\
-\x47\xb5\x4f\x2a\xdf\x4a\xbd\x39\x4d\xd5\x9e\xd3\xd6\xd6\xee\x9a\
-\xba\x2f\xcb\x46\x00\xe8\xa7\xb2\xbc\xf8\x2e\xa3\xaa\x39\xb7\x07\
-\xeb\xea\x70\x08\xf8\x4e\xb1\x27\x3c\x36\x75\x5f\x80\xc4\x76\x9e\
-\xb7\xf1\xc8\xa2\x6a\xbe\x99\x7a\x53\x9a\x1a\x30\x7b\xcb\xb2\x39\
-\x31\x75\x5f\x96\x91\x00\xd0\x5f\x9b\x21\xa0\x6e\x56\x93\xaf\xaf\
-\xc3\x21\xa0\x6a\x2e\x29\xab\x7d\x8f\x49\xdd\x17\x20\x91\x72\xdc\
-\x3c\xa2\x7d\xf2\xff\x7a\xea\xcd\x68\xfb\xc9\x24\xac\x7f\x7c\xcf\
-\x85\x77\x4b\xdd\x97\x65\x25\x00\xf4\x5b\x0c\xb6\xed\xd3\xf7\xa7\
-\x52\xaf\xb3\xa9\x6b\xf9\xed\x9d\xe3\xf0\xe8\xd4\x7d\x01\x16\xac\
-\xdc\xb3\xef\x61\xed\x06\xf0\xd5\xe4\x9b\xd0\xd6\x66\xd4\x7c\xc6\
-\xf0\x3f\x36\x02\x40\xff\xc5\x7b\x3c\xde\xeb\xc9\xd7\xdb\xf6\xf5\
-\xfc\x6a\xdc\x0b\x52\xf7\x05\x58\x90\xf6\xc9\xff\x3e\xed\xe2\xff\
-\x42\xf2\xcd\xe7\x50\x15\x55\xd3\x9c\x7d\xf6\xe4\xee\xa9\xfb\xb2\
-\xec\x04\x80\xe5\x10\xef\xf5\x36\x04\x84\xd4\xeb\x6e\xaa\xbe\x10\
-\xf7\x84\xd4\x7d\x01\x16\x60\x54\x87\x73\x7a\xb0\xe9\x1c\x1a\xfe\
-\xe1\xfc\x72\xef\xfe\x7b\xa6\xee\xc9\x10\x08\x00\xcb\x23\xde\xf3\
-\xf1\xde\x4f\xbd\xfe\xb6\x2b\x9c\x93\xba\x27\xc0\x9c\x15\xe3\xc9\
-\x8b\xd2\x6f\x36\xdb\xc3\xe4\x8c\xdd\xeb\xf7\x4e\xdd\x93\xa1\x10\
-\x00\x96\xcb\xae\x5d\x6b\xf7\x8a\xfd\x4c\xbe\x0e\x0f\x55\xdc\x1b\
-\x52\xf7\x04\x98\x93\x83\x9f\x58\x16\x2e\x4a\xbd\xd1\x1c\x7a\xe2\
-\xb8\xe8\xac\xbd\xe7\xdf\x37\x75\x4f\x86\x44\x00\x58\x3e\x31\x04\
-\x14\x55\xd8\x9f\x7e\x3d\xc6\x6b\xdb\xfc\xad\x4f\xda\x84\x81\x2a\
-\x76\x87\xa7\x27\xdf\x64\x0e\x6d\x34\x65\xf5\x99\xfb\xa5\xee\xc7\
-\xd0\x08\x00\xcb\x29\xae\x85\xb8\x26\x92\xaf\xcb\xb6\xe2\x1e\x91\
-\xba\x1f\xc0\x1c\x14\x75\x78\x5f\xf2\x0d\xa6\x6a\xfe\x7e\xc7\x27\
-\x37\xee\x9f\xba\x17\x43\x24\x00\x2c\xaf\xb8\x26\x46\x75\xf8\x5c\
-\xf2\xf5\xd9\xee\x11\xa9\x7b\x01\xcc\x41\xfc\x6e\xfb\xb4\xc3\x3f\
-\x7c\x7e\xc7\x79\x93\x07\xa4\xee\xc3\x50\x09\x00\xcb\xad\x17\x21\
-\xa0\x6a\x42\xea\x3e\x00\x73\x90\xf8\x77\xfd\x7f\xe1\xcc\x6a\xdf\
-\x2f\xa4\xee\xc1\x90\x09\x00\xcb\x2f\xae\x91\x51\xd2\x1f\xd1\x0d\
-\x97\xa6\xee\x01\x30\x07\x45\xd5\xfc\x28\xcd\x53\x45\xf8\xd2\xce\
-\xdd\xe1\x21\xa9\xcf\x7f\xe8\x04\x80\x61\x28\xf7\xae\x3f\x38\xae\
-\x99\x14\x6b\x35\xee\x11\xa9\xcf\x1f\x98\x83\xa2\x0e\xd7\x2e\x7c\
-\x43\xa9\xc3\xd7\x76\xee\x5e\x7f\x78\xea\x73\xcf\x81\x00\x30\x1c\
-\xc9\x42\x40\x15\xae\x49\x7d\xee\xc0\x1c\x2c\x7a\x43\x89\x9f\x33\
-\x10\x3f\x6f\x20\xf5\x79\xe7\x42\x00\x18\x96\x24\x9f\xd5\xd1\xee\
-\x11\xa9\xcf\x1b\x98\x83\x45\x7e\x2e\x79\xfc\x78\xe1\xf8\x31\xc3\
-\xa9\xcf\x39\x27\x02\xc0\xf0\x2c\xfa\xa3\xba\xe3\x1e\x91\xfa\x9c\
-\x81\x39\x18\xd5\xe1\xf7\x17\x33\xfc\x9b\xef\xec\xa8\xd7\x7f\x29\
-\xf5\xf9\xe6\x46\x00\x18\xa6\x45\x86\x80\xa2\x6a\xfe\x63\xea\xf3\
-\x05\xe6\xa0\x3c\xb7\x79\x60\xbb\x81\x5f\x3f\xdf\x4d\x24\x5c\x5a\
-\xae\x36\x8f\x4b\x7d\xae\x39\x12\x00\x86\x2b\xae\xa9\xb9\xff\x14\
-\x4f\xbb\x37\xc4\x3d\x22\xf5\xb9\x02\x73\xd2\x3e\x9d\x9f\x3e\xc7\
-\x4d\xe4\x8a\x1d\x55\x78\x42\xea\x73\xcc\x95\x00\x30\x6c\x71\x6d\
-\xc5\x35\x36\xaf\x6b\x1b\xf7\x86\xd4\xe7\x08\xcc\xd1\xca\xf8\x82\
-\x07\xc5\xef\xf4\x9d\xf9\xe6\x51\x85\xab\xca\x71\x73\x72\xea\xf3\
-\xcb\x99\x00\x30\x7c\x31\x04\xb4\x6b\xed\xf2\xd9\x0f\xff\x70\xed\
-\x4a\xbd\xf1\xd0\xd4\xe7\x07\xcc\xd9\x68\x75\xf2\xea\xd9\x6e\x20\
-\xe1\xea\xa2\x5a\x7f\x52\xea\xf3\xca\x9d\x00\x90\x87\xb8\xd6\xe2\
-\x9a\x9b\xe9\x75\x6d\xf7\x84\xd4\xe7\x05\x2c\xc8\xac\x3e\x17\x20\
-\x3e\xf9\xaf\x8c\xc3\x53\x52\x9f\x0f\x02\x40\x4e\xe2\x9a\x8b\x6b\
-\x6f\x46\x4f\xff\x7e\xff\x3f\xe4\x64\xf3\xa3\x81\xab\xe6\xed\xed\
-\x26\x72\xe3\xd1\x0f\x83\xe6\x1b\xed\x9f\xff\x97\xa9\xcf\x85\x83\
-\x04\x80\xbc\xc4\xb5\x17\xd7\xe0\x31\x84\xf7\x1b\xe3\x1e\xe0\x23\
-\x80\x21\x53\x45\x35\x79\xde\xd1\xfc\x82\xa0\xa2\x6e\xfe\xda\xa7\
-\xfa\xf5\x8b\x00\x90\x9f\xb8\x06\xe3\x5a\x3c\x8a\xeb\xf8\xa5\xb8\
-\xf6\x53\x1f\x3f\x90\x58\x59\x36\x27\x8e\xea\xf0\x7b\x45\x1d\xfe\
-\xee\x76\x86\xfe\x75\xed\xc6\x71\x66\xb1\xda\x3c\x35\xf5\x31\xf3\
-\x93\x04\x80\x7c\xc5\x35\xb9\xb9\x36\xe3\x1a\xbd\xcd\x35\x1c\xd7\
-\x78\xf8\xbd\xb8\xe6\x53\x1f\x33\xd0\x33\x3b\xcf\xdb\x78\xe4\xa8\
-\x9a\xbc\xbc\xdd\x28\xde\x51\x54\xe1\x2f\x46\x55\xf3\x9e\xb2\x0a\
-\x6f\x5a\x59\xdd\x78\xee\xd9\x67\x4f\xee\x9e\xfa\xf8\xb8\x75\x02\
-\x00\x71\x8d\xc6\xb5\x1a\xd7\x6c\x5c\xbb\x71\x0d\xc7\xb5\x1c\xd7\
-\x74\x5c\xdb\xa9\x8f\x0f\x80\x39\x10\x00\x00\x20\x43\x02\x00\x00\
-\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\
-\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\
-\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\
-\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\
-\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\
-\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\
-\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\
-\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\
-\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\
-\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\
-\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\
-\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\
-\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\
-\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\
-\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\
-\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\
-\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\
-\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\
-\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\
-\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\
-\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\
-\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\
-\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\
-\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\
-\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\
-\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\
-\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\
-\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\
-\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\
-\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\
-\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\
-\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\
-\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\
-\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\
-\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\
-\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\
-\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\
-\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\
-\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\
-\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\
-\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\
-\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\
-\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\
-\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\
-\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\
-\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\
-\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\
-\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\
-\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\
-\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\
-\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\
-\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\
-\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\
-\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\
-\x00\x32\x24\x00\x00\x40\x86\x04\x00\x60\xa6\x56\xea\x8d\x87\x96\
-\x75\x78\x7d\xbb\xf8\x57\xda\xba\xa0\xa8\x9b\x2f\x8e\xea\xf0\xb9\
-\xa2\x0e\xff\xab\xa8\xc2\x5f\xac\xd4\x93\x17\x94\x65\x73\x62\xea\
-\xe3\x84\xdc\x09\x00\x90\x87\x38\x73\xe3\xec\x8d\x33\x38\xce\xe2\
-\x83\x33\x39\xce\xe6\xe6\x82\x38\xab\xe3\xcc\x8e\xb3\xfb\xe8\xbf\
-\xc0\xb8\x39\xb9\xfd\x1f\xad\xb6\x5f\xe0\xc6\xdb\xdb\x14\xda\xff\
-\xe6\xf2\xf6\x20\xde\x71\x7a\xb5\xef\x1e\xb3\x3b\x45\xa0\x0b\x01\
-\x00\x86\x2d\xce\xd8\x38\x6b\xe3\xcc\x3d\x82\xb9\x1c\x67\xf7\x6a\
-\x9c\xe5\x47\xfc\x05\xaa\xaa\x3a\x21\xa6\x8a\x36\x51\xdc\xd0\x75\
-\x73\x28\xaa\xe6\x9b\xed\x17\x7b\xce\x1c\xcf\x1f\xb8\x15\x02\x00\
-\x0c\x57\x9c\xad\x71\xc6\x76\x5f\xb7\xe1\x86\x38\xd3\xe3\x6c\xbf\
-\xcd\x2f\xb0\x6b\xd7\xda\xbd\xda\x3f\xb0\x71\x6c\x9b\x44\xfc\x62\
-\xcd\x7f\x5a\x50\x4f\x80\x43\x04\x00\x18\xa6\x38\x53\x8f\xe6\xa1\
-\xfc\x66\xb5\x11\x67\xfc\x2d\x7e\x81\xf8\x9e\x42\x9b\x12\xce\x9f\
-\xd5\x46\x51\x56\x1b\xbf\xbb\xe0\x1e\x41\xd6\x04\x00\x18\x9e\x38\
-\x4b\x67\xb5\x7e\xe3\x8c\xbf\xc5\xef\xd9\x2b\xea\xe6\x7f\xcc\x78\
-\xa3\xb8\xbe\xa8\xd6\x9f\x94\xa0\x5f\x90\x25\x01\x00\x86\x25\xce\
-\xd0\x38\x4b\x67\xb9\x86\xe3\xac\xbf\xe9\x17\xd9\x1d\x9e\x7e\x24\
-\xdf\xec\xd7\x3d\x6d\x34\x17\x9f\xba\x7f\xff\x9d\x13\xf5\x0e\xb2\
-\x22\x00\xc0\x70\xac\xad\xad\x1d\x3f\xaa\x9a\x0b\xe7\xb1\x8e\xcb\
-\xd5\xf0\xab\x5b\x5f\x68\x74\xcc\xef\xfb\xdf\xc6\x17\xaa\xc3\x2b\
-\x12\xf6\x10\xb2\x21\x00\xc0\x70\x14\xab\xcd\x2b\xe7\xb8\x96\x2f\
-\xd8\xfc\x22\x3b\x56\x27\x27\xcd\x73\xc3\x88\xef\x39\x24\xee\x23\
-\x64\x41\x00\x80\xe1\x98\xe5\xf7\xe4\xdd\x52\xc5\xd9\x7f\x5c\xbb\
-\xa0\xdf\x35\xe7\x00\x70\xe3\xca\xf8\x82\x07\xa5\x6e\x26\x0c\x9d\
-\x00\x00\xc3\x10\x67\xe6\x3c\xde\x96\xbf\xd9\x5a\x7e\x57\xdc\x34\
-\x3e\x3d\xef\x4d\xa3\x5c\xdd\x78\x69\xea\x86\xc2\xd0\x09\x00\x30\
-\x0c\xed\xf0\x7f\xd9\xbc\xd7\x72\xfc\x0d\x82\xf1\xe7\x0b\x2f\x99\
-\xfb\x17\xaa\x9a\x53\x52\x37\x14\x86\x4e\x00\x80\x61\x88\x33\x73\
-\x01\x73\xf9\x92\xe3\x66\xfd\x23\x06\xb7\xf2\x85\x3e\x90\xba\xa1\
-\x30\x74\x02\x00\x0c\x43\x9c\x99\x0b\x58\xcb\xd7\x1f\x37\xf7\x2f\
-\xb2\x19\x00\xc2\x87\x52\x37\x14\x86\x4e\x00\x80\x61\x88\x33\x73\
-\x11\xb3\x59\x00\x80\x81\x10\x00\x60\x18\x04\x00\xa0\x13\x01\x00\
-\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\
-\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\
-\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\
-\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\
-\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\
-\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\
-\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\
-\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\
-\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\
-\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\
-\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\
-\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\
-\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\
-\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\
-\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\
-\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\
-\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\
-\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\
-\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\
-\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\
-\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\
-\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\
-\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\
-\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\
-\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\
-\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\
-\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\
-\x13\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\
-\x01\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\
-\x00\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\
-\x86\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\
-\x41\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\
-\x00\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\
-\x00\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\
-\x3a\x11\x00\x60\x18\x04\x00\xa0\x13\x01\x00\x86\x41\x00\x00\x3a\
-\x29\xea\xb0\x3e\xff\xf5\x1c\x26\xa9\xcf\x13\x86\x4e\x00\x00\x3a\
-\x69\xd7\xda\xae\x05\xac\xe5\x4f\xa4\x3e\x4f\x18\x3a\x01\x00\xe8\
-\xa4\x5d\x67\xef\x9c\xfb\x7a\xae\xc2\xbb\x52\x9f\x27\x0c\x9d\x00\
-\x00\x74\x52\xd4\xe1\xd9\xf3\x5e\xcb\xe5\xb8\x79\x4e\xea\xf3\x84\
-\xa1\x13\x00\x80\x4e\xca\xf2\xe2\xbb\xb4\x6b\xed\xb2\x39\xae\xe3\
-\xcb\xab\xaa\x3a\x21\xf5\x79\xc2\xd0\x09\x00\x40\x67\xa3\xaa\x79\
-\xfb\x1c\xd7\xf1\x3b\x53\x9f\x1f\xe4\x40\x00\x00\x3a\x3b\xbd\xda\
-\x77\x8f\xa2\x6a\xbe\x39\x87\x35\x7c\xd9\x59\x7b\xcf\xbf\x6f\xea\
-\xf3\x83\x1c\x08\x00\xc0\x51\x29\xab\xe6\xdf\xb4\x6b\xee\xc6\x19\
-\xae\xdf\x1b\x8b\xf1\xe4\x45\xa9\xcf\x0b\x72\x21\x00\x00\x47\xad\
-\xa8\xc3\x5b\x67\xb6\x86\xab\xe6\xed\xa9\xcf\x07\x72\x22\x00\x00\
-\xc7\x64\x54\x87\xb7\x1c\xcb\x2b\x01\x9b\x4f\xfe\x55\xf3\xb6\xd4\
-\xe7\x01\xb9\x11\x00\x80\x63\xb6\x52\x4f\x5e\x70\x34\xdf\x13\x50\
-\xd4\xe1\x5b\xc5\x6a\x78\x61\xea\xe3\x87\x1c\x09\x00\xc0\x4c\xc4\
-\x6f\x0c\x2c\xab\xe6\xbf\x8f\xaa\xf0\xed\xdb\x5f\xab\xcd\x25\x6d\
-\x9d\x52\xee\xdd\x7f\xcf\xd4\xc7\x0d\xb9\x12\x00\x80\x99\x2a\xcb\
-\xf2\x4e\xc5\x78\xf2\xcc\x51\x1d\xfe\xa8\x1d\xf2\x3b\xda\x40\xb0\
-\x37\x56\xfc\xfb\x18\x10\xe2\xbf\x5b\x5b\x5b\x3b\x3e\xf5\x71\x42\
-\xee\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\
-\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\
-\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\
-\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\
-\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\
-\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\
-\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\
-\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\x00\x20\x43\x02\x00\
-\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\x21\x01\x00\x00\x32\
-\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\x00\x00\x19\x12\x00\
-\x00\x20\x43\x02\x00\x00\x64\x48\x00\x00\x80\x0c\x09\x00\x00\x90\
-\x21\x01\x00\x00\x32\x24\x00\x00\x40\x86\x04\x00\x00\xc8\x90\x00\
-\x00\x00\x19\x12\x00\x00\x20\x43\x83\x0a\x00\xa3\x3a\x7c\xae\xa8\
-\x9b\x53\x95\x52\x4a\x29\x75\xdb\x15\x67\xe6\x80\x02\x80\x52\x4a\
-\x29\xa5\xfa\x54\x02\x80\x52\x4a\x29\x95\x61\x09\x00\x4a\x29\xa5\
-\x54\x86\x25\x00\x28\xa5\x94\x52\x19\x96\x00\xa0\x94\x52\x4a\x65\
-\x58\x02\x80\x52\x4a\x29\x95\x61\x1d\x57\xd4\xe1\xda\xd4\x07\xa1\
-\x94\x52\x4a\xa9\xc5\x55\x51\x35\xdf\x6b\x03\x40\xf3\xe5\xd4\x07\
-\xa2\x94\x52\x4a\xa9\xc5\x55\x3b\xfb\xbf\x18\x7f\xe3\xd0\xfe\xd4\
-\x07\xa2\x94\x52\x4a\xa9\x85\xd6\x46\xfc\x1e\x80\xb2\x07\x07\xa2\
-\x94\x52\x4a\xa9\x05\x55\xfb\xf0\x3f\x8a\xaf\x00\xbc\x36\xf5\x81\
-\x28\xa5\x94\x52\x6a\x71\x55\x56\x1b\xbf\x7b\xdc\xce\x71\x78\x74\
-\xea\x03\x51\x4a\x29\xa5\xd4\xe2\x6a\x65\xf5\xfc\x7f\x76\xe8\x93\
-\x87\x9a\xaf\xa4\x3e\x18\xa5\x94\x52\x4a\x2d\xa0\xaa\xf0\xa5\xad\
-\x8f\x1e\x2c\xab\xf0\xa6\xe4\x07\xa4\x94\x52\x4a\xa9\xf9\x57\x15\
-\xde\xb0\x15\x00\xce\xd8\xbd\x7e\xef\xf8\x33\x81\xc9\x0f\x4a\x29\
-\xa5\x94\x52\x73\xab\xa2\x6e\xbe\xbb\x6b\xd7\xda\xbd\x8e\x9b\x56\
-\xd4\xe1\x7d\xa9\x0f\x4c\x29\xa5\x94\x52\xf3\xab\x36\x00\xfc\xe9\
-\x71\x37\xf7\xf1\x3d\x17\xde\xad\xa8\xc2\x3f\xa6\x3e\x38\xa5\x94\
-\x52\x4a\xcd\xbe\xda\x19\xff\x4f\x67\x9f\x3d\xb9\xfb\x4f\x04\x80\
-\xcd\x57\x01\x56\x9b\xa7\xb6\xe9\xe0\xc7\xa9\x0f\x52\x29\xa5\x94\
-\x52\xb3\xac\x70\x43\x59\x35\xcf\xb8\xc5\xe1\x7f\xd8\xa8\x6a\xde\
-\x9e\xfe\x40\x95\x52\x4a\x29\x35\xab\x2a\xaa\xe6\x6d\xb7\x39\xfc\
-\xb7\x5e\x09\xa8\xc2\x3b\x53\x1f\xac\x52\x4a\x29\xa5\x8e\xbd\xda\
-\x99\xfe\xde\x23\x1a\xfe\x5e\x09\x50\x4a\x29\xa5\x06\x52\x55\xf3\
-\x9e\x4e\xc3\xff\xb0\xb2\xde\x78\x55\xfb\x3f\xb8\x22\xf9\x09\x28\
-\xa5\x94\x52\xea\x88\xab\x7d\xea\xbf\xac\xac\xc3\x2b\x8e\x6a\xf8\
-\x1f\xb6\xe3\x93\x1b\xf7\x2f\xea\xe6\xaf\x53\x9f\x8c\x52\x4a\x29\
-\xa5\x8e\xa0\xaa\xe6\xdc\xf2\xdc\xe6\x81\xc7\x34\xfc\xa7\xad\x8c\
-\xc3\x53\xda\x20\x70\x6a\x5b\x57\x26\x3f\x39\xa5\x94\x52\x4a\x6d\
-\x55\xfb\xc4\x7f\x55\x3b\x9f\x3f\x5c\xd6\x93\x27\xcf\x6c\xf0\xdf\
-\xdc\x69\x6b\x6b\x77\x2d\x57\x37\x5e\x3a\xaa\xc3\x9f\xb7\x75\x4e\
-\x5b\x17\x09\x05\x4a\x29\xa5\xd4\xc2\xea\x8a\x76\xee\x7e\xb6\xfd\
-\xeb\xae\x76\x06\xbf\xbf\x1d\xfe\x2f\x2b\xcb\xe6\xc4\xae\xf3\xfc\
-\xff\x03\x2b\xa0\x40\xb8\x77\x72\xbc\x53\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x17\x0f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
-\x9c\x18\x00\x00\x16\xa4\x49\x44\x41\x54\x78\x5e\xed\xdd\x7b\x8c\
-\x5c\x57\x7d\x07\xf0\x73\x66\xd6\xeb\x3c\xc0\x98\x52\x50\x08\x81\
-\x12\x24\xfe\xa8\x28\x90\xb4\x10\xdb\xeb\x40\xd8\xa4\x4d\xd8\xb5\
-\x09\x81\x84\x75\x6c\x44\x0b\xed\x1f\xa8\x6a\xa5\xd2\x52\x29\x50\
-\x21\xa0\x51\x8b\x40\x34\xa8\xf4\x8f\x4a\x95\x2a\xa0\x51\x9b\x38\
-\x4b\x1e\x10\xec\x35\x44\x6d\x96\x47\xbc\x4e\x78\xe5\xa1\x54\x54\
-\x50\x11\xc4\x33\x52\x40\x24\x76\xe2\xe7\xee\x9c\xde\xb1\x0f\xd0\
-\x84\xc4\xf1\x3e\x3c\xf7\xde\x39\x9f\x8f\x84\xe6\x77\xce\x8c\x65\
-\xdf\x65\x7f\x73\xbe\xf7\x99\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x03\x14\xf3\x6b\xe3\x4d\xcf\xce\x3e\x23\
-\x1d\x5c\x3d\x99\x52\x1a\x8f\x31\x9c\x9b\x52\x3c\x3b\xc4\xb4\x36\
-\x86\x38\x9a\x3f\x02\xad\x93\x42\x3a\x1c\x52\x7c\x38\xc6\xf4\x40\
-\x35\xb8\x27\xa6\xce\x6c\x38\xed\xe0\xce\xa9\xf1\xf1\x47\xf3\x47\
-\x86\x82\xfe\x65\x18\xb5\xbd\x7f\x1b\x1f\x00\x6e\xdc\xf1\x95\x97\
-\xcc\x77\xbb\x57\xc5\x94\xde\x1a\x62\x3c\x3d\x4f\xc3\xf0\x4a\xe9\
-\xb1\x14\xc3\xb5\x9d\x85\x91\xab\xa7\x36\xaf\x7b\x30\xcf\xb6\x92\
-\xfe\xa5\x38\x2d\xea\xdf\xc6\x06\x80\x99\x99\x99\xd5\xfb\xc2\xb3\
-\x3e\x50\xfd\x20\xdf\x6d\x2f\x81\x22\x1d\xfb\x22\xb9\x66\x4d\x7a\
-\xe4\x43\x93\x93\x93\x87\xf2\x6c\x2b\xe8\x5f\x8a\xd7\x82\xfe\x6d\
-\x64\x00\x98\xde\x71\xd7\x19\xbd\xce\xc2\xcd\x31\x86\x0d\x79\x0a\
-\x4a\xf6\xe5\x98\xe6\xaf\x98\x9a\x7c\xed\x43\x79\xdc\x68\xfa\x17\
-\x1e\xa7\xb1\xfd\xdb\xb8\x00\x30\xbd\x73\xee\xe5\x29\xa6\x9d\x21\
-\xc6\x17\xe6\x29\x28\x5e\x0a\xe9\x87\xbd\xd4\xd9\xb4\x6d\x72\xc3\
-\x7d\x79\xaa\x91\xf4\x2f\xfc\xba\xa6\xf6\x6f\xa3\x02\xc0\xf4\xe7\
-\xe6\x5e\x90\xba\xe1\xab\xd5\xbf\xea\xcc\x3c\x05\xfc\x42\x4a\x3f\
-\x88\xbd\x91\xf3\x9a\x7a\x5e\x51\xff\xc2\x71\x34\xb0\x7f\x3b\xf9\
-\xb5\x76\xfd\x73\x86\xbd\x6e\xf8\xb4\x2f\x0f\x78\x0a\xd5\x5e\x75\
-\xea\x2e\xdc\xf2\xc9\xd9\xd9\x53\xf2\x4c\x63\xe8\x5f\x78\x1a\x0d\
-\xec\xdf\xc6\x04\x80\xbd\x71\xed\x07\x9d\x33\x84\xa7\xb5\xfe\xd4\
-\x03\xa3\x57\xe7\xba\x31\xf4\x2f\x9c\x90\x46\xf5\x6f\x23\x4e\x01\
-\x1c\xbb\x55\xa8\xf3\x2d\x57\x0b\xc3\x09\x48\xe9\x48\x77\xa4\xf3\
-\xb2\x2b\x2e\xde\xf0\x9d\x3c\x53\x2b\xfd\x0b\x8b\xd0\xa0\xfe\x6d\
-\xc4\x11\x80\xf9\x6e\xf7\x3d\xbe\x3c\xe0\x04\xc5\xb8\x6a\x7e\xa1\
-\x77\x55\x1e\xd5\x4e\xff\xc2\x22\x34\xa8\x7f\x6b\x3f\x02\x70\xf4\
-\x09\x61\x07\x46\x1f\xac\x7e\x28\x1e\x12\x02\x27\x2a\xa5\xc7\xe2\
-\xa9\x87\xcf\xa8\xfb\x89\x63\xfa\x17\x96\xa0\x21\xfd\x5b\xfb\x11\
-\x80\xde\xc1\xd5\x13\xbe\x3c\x60\x91\xaa\x9e\xe9\x1d\x18\xdd\x9c\
-\x47\xb5\xd1\xbf\xb0\x04\x0d\xe9\xdf\xda\x03\x40\x4c\xe9\xa2\x5c\
-\x02\x8b\x11\xe3\x85\xb9\xaa\x8d\xfe\x85\x25\x6a\x40\xff\xd6\x7f\
-\x0d\x40\x8c\xaf\xcc\x15\xb0\x08\x31\x84\x73\x72\x59\x1f\xfd\x0b\
-\x4b\xd2\x84\xfe\xad\x3d\x00\xa4\x14\x5e\x92\x4b\x60\x51\xd2\xd9\
-\xb9\xa8\x8d\xfe\x85\xa5\xaa\xbf\x7f\x1b\x70\x04\x20\x3c\x2b\x57\
-\xc0\x22\xa4\x10\xd6\xe4\xb2\x3e\xfa\x17\x96\xa4\x09\xfd\x5b\xff\
-\x35\x00\x21\xac\xce\x25\xb0\x08\x4d\xb8\xf5\x4e\xff\xc2\xd2\x34\
-\xa1\x7f\xeb\x3f\x02\x00\x00\x0c\x9c\x00\x00\x00\x05\x12\x00\x00\
-\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\
-\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\
-\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\
-\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x14\xf3\x6b\x6d\x6e\xd8\x35\
-\x97\x72\x59\x8b\x2d\x13\x63\xb5\xff\x0c\x68\xaf\xd2\x7f\x7f\xf5\
-\x2f\x6d\x56\xfa\xef\xaf\x23\x00\x00\x50\x20\x01\x00\x00\x0a\x24\
-\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\
-\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\
-\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\
-\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\
-\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\
-\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\
-\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\
-\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\
-\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\
-\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\
-\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\
-\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\
-\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\
-\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\
-\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\
-\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\
-\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\
-\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x80\x65\x48\x21\x1c\
-\xca\xe5\xc0\xa5\x90\x0e\xe7\xb2\x36\xa5\x6f\x3f\xb4\x99\x00\x00\
-\xcb\x91\xc2\x23\xb9\x1a\xb8\x18\xc2\xde\x5c\xd6\xa7\xf4\xed\x87\
-\x16\x13\x00\x60\x19\x62\x0c\xdf\xcd\x65\x0d\xe2\x03\xb9\xa8\x4d\
-\xe9\xdb\x0f\x6d\x26\x00\xc0\x32\xa4\x10\xee\xcb\xe5\xe0\xa5\x74\
-\x6f\xae\x6a\x53\xfa\xf6\x43\x9b\x09\x00\xb0\x0c\x9d\x5e\xbc\x3d\
-\x97\x83\x17\x43\x7d\x7f\x77\x56\xfa\xf6\x43\x9b\x09\x00\xb0\x0c\
-\xa3\x47\x16\x66\xaa\x3d\xd1\xc7\xf2\x70\x60\x52\x48\xfb\x0f\xa7\
-\xee\xce\x3c\xac\x4d\xe9\xdb\x0f\x6d\x26\x00\xc0\x32\x5c\x76\xd9\
-\xf9\xfb\x52\x0c\xd7\xe6\xe1\x00\xc5\xed\x6f\x9b\x5c\x5f\xfb\x45\
-\x70\xa5\x6f\x3f\xb4\x99\x00\x00\xcb\xd4\x59\x18\xb9\x3a\xa5\xf0\
-\x68\x1e\x9e\x74\xd5\xdf\x35\x9f\x7a\xdd\x8f\xe4\x61\xed\x4a\xdf\
-\x7e\x68\x2b\x01\x00\x96\x69\x6a\xf3\xba\x07\x43\x4c\x1f\xcb\xc3\
-\x93\x2e\x86\xf0\xf1\xad\x9b\xd6\x7d\x3b\x0f\x6b\x57\xfa\xf6\x43\
-\x5b\x09\x00\xb0\x02\x3a\xfb\xe2\x87\x53\x4a\xdf\xc8\xc3\x93\x27\
-\x85\x7b\xf7\x9f\x7a\xe8\x7d\x79\xd4\x18\xa5\x6f\x3f\xb4\x91\x00\
-\x00\x2b\x60\x6a\x6a\xec\x40\xa7\x37\xb2\x39\x85\xf4\xc3\x3c\xb5\
-\xe2\x52\x08\x0f\x75\x47\xe2\x5b\xde\x31\x3e\x7e\x30\x4f\x35\x46\
-\xe9\xdb\x0f\x6d\x24\x00\xc0\x0a\xe9\x1f\x0a\xef\xa5\xce\xa6\x93\
-\xb1\x08\xf6\x17\xbf\x5e\x4a\x97\x5c\x71\xf1\x86\xef\xe4\xa9\xc6\
-\x29\x7d\xfb\xa1\x6d\x04\x00\x58\x41\xdb\x26\x37\xdc\xb7\x2a\xcc\
-\x9f\x57\x95\x77\x1e\x9b\x59\x01\x29\xdc\x3f\xd2\x8d\x1b\xb7\x4d\
-\x6e\xbc\x3b\xcf\x34\x56\xe9\xdb\x0f\x6d\x22\x00\xc0\x0a\xbb\x7c\
-\xe2\x82\x9f\xec\x3f\xe5\xd0\x78\x4a\xe9\xa3\x21\xa5\x23\x79\x7a\
-\xd1\xfa\x57\xbb\x57\x8b\xdf\x35\xf1\xd1\x70\x5e\x9b\xf6\x7c\x4b\
-\xdf\x7e\x68\x8b\x98\x5f\x6b\x73\xc3\xae\xb9\x94\xcb\x5a\x6c\x99\
-\x18\xab\xfd\x67\xc0\xf0\xba\xf1\xb6\x3d\x2f\x9d\x5f\xe8\x5d\x55\
-\x95\x5b\x63\x88\xa7\x1d\x9b\x3d\xbe\xfe\x43\x6e\xfa\xf7\xb9\xf7\
-\x6f\x75\x6b\xfb\xd5\xee\xa5\x6f\x3f\xcd\x56\xfa\xfa\x23\x00\x08\
-\x00\x4b\x32\x3d\x3d\xdd\x3d\x72\xda\xf3\xd7\xf4\xeb\x55\xfb\x7f\
-\xb2\x77\x6a\x6a\x6a\xe1\xe8\x1b\x3c\xa9\xcf\x7c\xe6\x8e\x67\x1e\
-\x1c\x8d\x9b\x42\x8c\x17\x56\xbf\x70\xe7\x54\xbf\xf4\x2f\x8e\x29\
-\xad\xed\xbf\x97\x62\x7c\xb8\x9a\xfb\x5e\xb5\xcb\x7b\x6f\xff\xf1\
-\xb6\xfd\x27\xdc\x0d\xdb\x43\x6e\x4a\xdf\x7e\x9a\x49\x00\xa8\x99\
-\x00\xd0\x0e\xd3\x9f\x9b\x7b\x41\xaf\x1b\xde\x5c\xfd\xb0\x2e\xaa\
-\xbe\xb2\x5f\x59\xfd\xe6\xbc\xa8\xfa\xf5\xc9\xa7\x90\x52\xaf\xda\
-\x6d\xfb\x7e\x35\xae\xbe\xc0\xd3\xed\x71\x3e\xde\x34\xf5\x86\xb1\
-\x1f\x1d\x7b\x0f\xa0\x99\x4a\x5f\x7f\x5c\x03\xc0\x71\x6d\x9f\xd9\
-\xfd\xea\xea\x7f\x9f\x4d\x23\xe9\xfb\x31\x86\x7f\xaa\x16\xfe\x37\
-\x56\x7b\x71\x2f\xfe\xd5\xe2\xdf\x57\xd5\xfd\xb9\xfe\x7b\x21\x7e\
-\xbc\xff\xd9\x1b\x76\xed\xbe\x75\xfa\xf3\x73\xfd\x8b\xc1\x00\x68\
-\x20\x01\x80\x27\x75\xcb\x2d\xb3\x6b\x6f\x98\x99\xfb\x44\x55\xde\
-\x15\x63\xbc\xf4\xf1\x0b\xfe\xd3\xe9\x7f\x36\xbe\xa1\xd7\x4b\x77\
-\x6e\xdf\xb5\xfb\x53\xff\xb1\xe3\x2b\xcf\xce\x6f\x00\xd0\x10\x02\
-\x00\xbf\x66\x7a\xc7\x1d\xe7\x1c\x5a\x3d\xfa\xcd\x6a\x8f\xfe\x1d\
-\xd5\xe2\xbf\xe4\x43\x54\xfd\x3f\x1b\x43\xfc\xa3\x6e\xb7\x7b\xf7\
-\xf6\x5d\x73\xbf\x9b\xa7\x01\x68\x00\x01\x80\xc7\xb9\x7e\xd7\x9e\
-\xd7\xa5\x6e\xfc\x52\xb5\x74\x9f\x9d\xa7\x96\xad\x4a\x10\xbf\x15\
-\x43\x9a\x9d\x9e\x99\xbb\x20\x4f\x01\x50\x33\x01\x80\x5f\x9a\xde\
-\xb9\xfb\xc2\x18\x7a\x3b\xab\x25\xfb\xe8\xd5\xfd\x2b\x2b\xae\x49\
-\x31\xdd\x7a\xdd\xcc\xee\x73\xf3\x04\x00\x35\x12\x00\x38\xea\xfa\
-\x99\xdd\x17\xf5\x3a\xe1\x73\x27\x7a\xaf\xf6\xd2\xc4\x35\xd5\x2f\
-\xdc\x4d\xfd\xeb\x0b\xf2\x04\x00\x35\x11\x00\x38\xb6\xe7\x1f\xc3\
-\xad\x27\x77\xf1\x3f\xa6\x7f\x6a\xe1\xd0\x29\xa3\xff\x98\x87\x00\
-\xd4\x44\x00\x28\x5c\x7f\xf1\x3f\xf9\x7b\xfe\x4f\x90\xc2\x1f\x5e\
-\xb7\x63\xcf\xba\x3c\x02\xa0\x06\x02\x40\xc1\x6a\x59\xfc\x2b\xfd\
-\x9b\x03\x3a\x9d\xde\xdf\xe4\x21\x00\x35\x10\x00\x0a\x35\x98\x73\
-\xfe\xc7\x11\xe3\xa6\xeb\x6e\xbb\xe3\xcc\x3c\x02\x60\xc0\x04\x80\
-\x02\x0d\xf2\x9c\xff\x53\x89\x21\x74\x47\x16\xe2\x5b\xf2\x10\x80\
-\x01\x13\x00\x0a\x53\xd7\x61\xff\x27\x93\x52\x1c\xcf\x25\x00\x03\
-\x26\x00\x14\xa4\xf6\xc3\xfe\x4f\x90\x42\xf0\x4c\x00\x80\x9a\x08\
-\x00\x85\x68\xc2\x61\xff\x27\x8a\x31\x9d\xf5\x2f\x5f\xff\xfa\xaa\
-\x3c\x04\x60\x80\x04\x80\x02\x34\x6d\xcf\xff\x57\x62\xe7\xd9\x3f\
-\x3d\xfc\xcc\x3c\x00\x60\x80\x04\x80\x21\xd7\x5f\xfc\x9b\xb6\xe7\
-\x0f\x40\xfd\x04\x80\x21\xd6\xc4\xc3\xfe\x8f\x97\x7a\x3f\xff\xcd\
-\xd1\x7d\x79\x00\xc0\x00\x09\x00\x43\xaa\xb9\x87\xfd\xff\x9f\x14\
-\x7e\xf4\xce\x57\xbd\xea\x48\x1e\x01\x30\x40\x02\xc0\x10\x6a\xfe\
-\x9e\xff\x31\x29\x84\xbb\x73\x09\xc0\x80\x09\x00\x43\xa6\x49\xf7\
-\xf9\x3f\xbd\x38\x9b\x0b\x00\x06\x4c\x00\x18\x22\xad\x38\xec\x9f\
-\x55\x7b\xff\x0b\x9d\x85\xf0\xe9\x3c\x04\x60\xc0\x04\x80\x21\xd1\
-\x96\xc3\xfe\xbf\x10\x53\xd8\x35\xf5\x86\xb1\x1f\xe5\x21\x00\x03\
-\x26\x00\x0c\x81\x76\x1d\xf6\xaf\xf6\xfe\xfb\xc2\xc2\xdf\xe7\x21\
-\x00\x35\x10\x00\x5a\xae\x6d\x8b\xff\x31\xf1\xdf\xaf\x9c\x7c\xcd\
-\x9d\x79\x00\x40\x0d\x04\x80\x16\x6b\xd3\x39\xff\x5f\x4a\xe9\x7b\
-\x0b\xbd\x85\xbf\xc8\x23\x00\x6a\x22\x00\xb4\x54\xdb\xce\xf9\xf7\
-\xa5\x10\xf6\xc5\x6e\xf7\x8a\xb7\x6e\x7e\xcd\xcf\xf3\x14\x00\x35\
-\x11\x00\x5a\xa8\x95\x87\xfd\x53\x7a\x2c\x85\x78\xe9\xd4\x25\xeb\
-\xbf\x91\x67\x00\xa8\x91\x00\xd0\x32\xad\x3c\xec\x1f\xd2\xde\x94\
-\xe2\x25\x5b\x27\x36\x7c\x31\x4f\x00\x50\x33\x01\xa0\x45\xda\xf8\
-\x1f\xf6\x49\x29\xfd\x2c\x76\xba\x17\x5e\xb9\x69\x6c\x77\x9e\x02\
-\xa0\x01\x04\x80\x96\x68\xe5\xe2\x1f\xc2\x43\x9d\x5e\xfa\x7d\x87\
-\xfd\x01\x9a\x47\x00\x68\x81\x36\x2e\xfe\xd5\xea\xff\xe3\xb4\x10\
-\x2f\x98\xda\x7c\xfe\x3d\x79\x06\x80\x06\x89\xf9\xb5\x36\x37\xec\
-\x9a\xab\x76\x14\xeb\xb3\x65\x62\xac\xf6\x9f\xc1\xf1\xb4\xf3\x3e\
-\x7f\xa0\x0d\x52\x48\x87\x43\x8a\x0f\xc7\x98\x1e\xa8\x06\xf7\xc4\
-\xd4\x99\x0d\xa7\x1d\xdc\x39\x35\x3e\xfe\x68\xfe\xc8\x50\x2b\x7d\
-\xfd\x71\x04\xa0\xc1\x2c\xfe\xc0\xc9\x54\x7d\xb7\x8c\xc6\x18\x9e\
-\x57\x55\xeb\x42\x8c\xef\x4c\x9d\xb4\x3d\x1d\x18\x7d\x70\xfb\xae\
-\xdd\xff\x3c\xbd\xe3\xae\x33\xf2\xc7\x18\x52\x02\x40\x43\x59\xfc\
-\x81\x5a\xc4\x78\x7a\xf5\xbd\xf3\xa7\xa9\x33\xff\xbf\x55\x10\xf8\
-\xdb\x99\x99\x99\xd5\xf9\x1d\x86\x8c\x00\xd0\x40\xed\xbc\xd5\x0f\
-\x18\x2a\xc7\x82\xc0\xfb\xf7\xc5\xb5\xb7\x4d\xcf\x7c\xf9\xb9\x79\
-\x96\x21\x22\x00\x34\xcc\xf5\xbb\xf6\xbc\xae\x75\x17\xfc\x01\xc3\
-\xec\xb5\xbd\xd8\xfd\xe6\x75\x33\x7b\x5e\x91\xc7\x0c\x09\x01\xa0\
-\x41\xa6\x77\xdc\x71\x4e\x27\xf4\x3e\x6b\xf1\x07\x9a\xa4\xfa\x4e\
-\x3a\xab\x13\x7b\x3b\x6f\xda\xf5\xa5\xe7\xe7\x29\x86\x80\x00\xd0\
-\x10\xd3\x9f\x9f\xfb\x8d\x5e\xa7\xf3\xd9\xaa\xd5\xd6\xe4\x29\x80\
-\xc6\xe8\x87\x80\xf9\xb0\xea\xe6\x4f\xce\xce\x9e\x92\xa7\x68\x39\
-\x01\xa0\x21\x52\x2f\xfc\x43\x8c\xe1\x45\x79\x08\xd0\x44\xeb\x4f\
-\x3d\x30\x7a\x75\xae\x69\x39\x01\xa0\x01\xb6\xcf\xec\x7e\x75\x0a\
-\xe9\xed\x79\x08\xd0\x58\x31\x84\x77\xdd\x78\xdb\x9e\x97\xe6\x21\
-\x2d\x26\x00\x34\xc3\xfb\x62\x25\xd7\x00\xcd\x15\xe3\xaa\xf9\x85\
-\xde\x55\x79\x44\x8b\x09\x00\x35\xbb\x69\xe6\xce\xb3\xaa\xa5\x7f\
-\x73\x1e\x02\x34\x5e\x4c\xe1\xca\xe9\xd9\xd9\x67\xe4\x21\x2d\x25\
-\x00\xd4\xec\x48\xe8\xbd\xa9\x6a\x27\xff\x3f\x00\xed\x11\xe3\xe9\
-\xbd\x03\xa3\x76\x5c\x5a\xce\xc2\x53\xb3\x6a\xef\xff\xc2\x5c\x02\
-\xb4\x47\x8c\xbe\xbb\x5a\x4e\x00\xa8\x5b\x4a\xe7\xe4\x0a\xa0\x35\
-\x62\x08\xbe\xbb\x5a\x4e\x00\xa8\xd1\xec\xec\xec\x48\xd5\x45\x6e\
-\xfd\x03\x5a\x28\x9d\x9d\x0b\x5a\x4a\x00\xa8\xd1\x8f\x1f\x1b\x79\
-\xa6\xf3\xff\x40\x1b\xa5\x10\x3c\xb4\xac\xe5\x2c\x3e\x00\x50\x20\
-\x01\xa0\x46\x67\x9e\x3e\xbf\xef\xe8\x33\x00\x01\x5a\x26\x86\xb0\
-\x37\x97\xb4\x94\x00\x50\xa3\xf1\xf1\xf1\xf9\x90\xc2\xf7\xf3\x10\
-\xa0\x45\xe2\x03\xb9\xa0\xa5\x04\x80\xda\xc5\x7b\x73\x01\xd0\x1e\
-\x29\xf9\xee\x6a\x39\x01\xa0\x6e\x31\xdd\x9e\x2b\x80\xf6\x88\xc1\
-\x77\x57\xcb\x09\x00\x35\x1b\x49\xdd\x9b\x5d\x07\x00\xb4\x49\x0a\
-\x69\xff\xe1\xd4\xdd\x99\x87\xb4\x94\x00\x50\xb3\xcb\x27\xd7\xff\
-\xb0\x7a\xd1\x48\x40\x8b\xc4\xed\x6f\x9b\x5c\xef\x22\xc0\x96\x13\
-\x00\x1a\x20\xc6\xf8\x77\xa9\x92\x87\x00\x8d\x55\x7d\x53\xcd\xa7\
-\x5e\xf7\x23\x79\x48\x8b\x09\x00\x0d\x30\xf5\xfa\xb1\xaf\x86\x18\
-\xae\xcd\x43\x80\xc6\x8a\x21\x7c\x7c\xeb\xa6\x75\xdf\xce\x43\x5a\
-\x4c\x00\x68\x88\xd1\x91\x91\x77\x57\xd1\xfa\x07\x79\x08\xd0\x3c\
-\x29\xdc\xbb\xff\xd4\x43\xef\xcb\x23\x5a\x4e\x00\x68\x88\x37\xff\
-\xc1\xba\x9f\xa5\x18\x2f\xab\x3a\xcc\x79\x35\xa0\x71\x52\x08\x0f\
-\x75\x47\xe2\x5b\xde\x31\x3e\x7e\x30\x4f\xd1\x72\x02\x40\x83\x5c\
-\x39\x31\xf6\xcd\x5e\xe8\xbc\xb1\x7f\x85\x6d\x9e\x02\xa8\x5d\x7f\
-\xf1\xef\xa5\x74\xc9\x15\x17\x6f\xf8\x4e\x9e\x62\x08\x08\x00\x0d\
-\xb3\x75\x62\xc3\x17\x3b\xbd\xf0\x06\x21\x00\x68\x84\x14\xee\x1f\
-\xe9\xc6\x8d\xdb\x26\x37\xde\x9d\x67\x18\x12\x02\x40\x03\x4d\x6d\
-\xda\x78\xbb\x10\x00\xd4\xa9\x7f\xb5\x7f\xb5\xf8\x5f\x13\x1f\x0d\
-\xe7\xd9\xf3\x1f\x4e\x02\x40\x43\x09\x01\x40\x1d\xfa\xdf\x39\x29\
-\x84\x4f\xa4\xd4\x7d\xd9\x96\xc9\xb1\xbf\x9e\x9a\x1a\x3b\x90\xdf\
-\x62\xc8\x08\x00\x0d\x26\x04\x00\x27\x55\x4a\x47\xfa\xe7\xf7\xab\
-\xea\x6b\x55\xfd\xaf\xd5\xc4\xb6\x23\xa9\xfb\xfc\x2b\x27\xc6\xfe\
-\xc4\xad\x7e\xc3\x2f\xe6\xd7\xda\xdc\xb0\x6b\xae\xd6\x07\xe0\x6c\
-\x99\x18\xab\xfd\x67\xf0\x74\xae\x9f\xd9\x7d\x51\x8c\xe1\xd6\x18\
-\xe2\x69\x79\xaa\xf9\x52\xf8\x71\xb7\x93\x2e\xba\xe2\xf5\x1b\xff\
-\x27\xcf\x00\x34\x4a\xe9\xeb\x8f\x23\x00\x2d\xb0\x75\x72\xe3\x7f\
-\xa5\x14\x2e\x6d\xd5\x91\x80\x18\xce\x9c\x4f\xf1\xcb\xd3\x3b\xee\
-\x38\x27\xcf\x00\xd0\x20\x02\x40\x4b\xb4\x31\x04\x54\xd1\xf6\xb9\
-\xbd\x4e\xfc\xcf\xe9\x2f\xdc\xf9\x7b\x79\x0a\x80\x86\x10\x00\x5a\
-\xa4\x95\x21\x20\xc6\xe7\xa4\xde\xc2\xed\xdb\x77\xce\x6d\xcc\x53\
-\x00\x34\x80\x00\xd0\x32\xfd\x10\xd0\xbe\x0b\x03\xe3\x9a\x18\xd3\
-\x17\xae\xdf\xb5\xe7\x75\x79\x02\x80\x9a\x09\x00\x2d\xd4\xca\xbb\
-\x03\x62\x3c\xbd\x13\x7a\x9f\x75\x4d\x00\x40\x33\x08\x00\x2d\xd5\
-\x0f\x01\xad\xbb\x30\x30\xc4\x35\xbd\x4e\xbc\xf9\x96\x5b\x66\xd7\
-\xe6\x09\x00\x6a\x22\x00\xb4\x58\x1b\x4f\x07\xc4\x18\xcf\x3e\xbc\
-\x7a\xf5\xc7\xf2\x10\x80\x9a\x08\x00\x2d\xd7\xc6\xd3\x01\xd5\xbf\
-\xf5\xed\xd7\xed\xbc\xe3\x55\x79\x08\x40\x0d\x04\x80\x21\xd0\xb6\
-\x10\x10\x2b\xdd\x18\xdf\x9b\x87\x00\xd4\x40\x00\x18\x12\x6d\xbb\
-\x26\x20\x85\x78\xe9\x4d\x5f\xd8\xfd\xbc\x3c\x04\x60\xc0\x04\x80\
-\x21\xd2\xa6\x6b\x02\x62\x0c\x23\x47\x16\xc2\x15\x79\x08\xc0\x80\
-\x09\x00\x43\xa6\x4d\xa7\x03\x62\x8c\x9e\x0b\x00\x50\x13\x01\x60\
-\x08\xb5\xe6\x74\x40\x0a\xbf\x9d\x2b\x00\x06\x4c\x00\x18\x52\xad\
-\x78\x6c\x70\x4c\x67\xe4\x0a\x80\x01\x13\x00\x86\x58\xd3\x43\x40\
-\xf5\x6f\x7b\xce\xf4\xf4\xfd\xa3\x79\x08\xc0\x00\x09\x00\x43\xae\
-\x15\x47\x02\x00\x18\x38\x01\xa0\x00\x0d\x0e\x01\x3f\x9f\x9a\xfa\
-\x9d\xc3\xb9\x06\x60\x80\x04\x80\x42\x34\x33\x04\xc4\x9f\xe4\x02\
-\x80\x01\x13\x00\x0a\xd2\x0f\x01\x8d\xba\x45\x30\x86\x6f\xe5\x0a\
-\x80\x01\x13\x00\x0a\xd3\xa4\xe7\x04\xc4\x90\xbe\x98\x4b\x00\x06\
-\x4c\x00\x28\x50\x13\x9e\x13\x90\x42\x58\x18\x09\xf3\x37\xe7\x21\
-\x00\x03\x26\x00\x14\xaa\xfe\xd3\x01\xe9\xd6\xcb\x27\x2e\x70\x0d\
-\x00\x40\x4d\x04\x80\x82\xd5\x75\x3a\x20\x55\x3a\x31\x7e\x38\x0f\
-\x01\xa8\x81\x00\x50\xb8\x9a\x42\xc0\xbf\x4d\xbd\x7e\xec\xab\xb9\
-\x06\xa0\x06\x02\x00\x03\xbd\x26\xa0\xda\xf9\x7f\x60\xf5\xa1\xc3\
-\x7f\x99\x87\x00\xd4\x44\x00\xe0\xa8\xc1\x5c\x13\x90\xf6\xf6\x42\
-\xb8\xfc\x4d\x6f\x1a\x7f\x38\x4f\x00\x50\x13\x01\x80\x5f\x3a\x7a\
-\x24\x20\x74\x36\xf5\x17\xea\x3c\xb5\x82\xd2\xde\x98\xe2\xa5\xdb\
-\x26\x37\xde\x9d\x27\x00\xa8\x91\x00\xc0\xe3\x6c\x9d\xd8\xf0\xc5\
-\xb8\x90\x2e\xe8\x1f\xaa\xcf\x53\xcb\x97\xd2\xf7\x16\x52\x78\xdd\
-\xd4\xe4\xd8\x97\xf2\x0c\x00\x35\x13\x00\xf8\x35\x53\x9b\xcf\xbf\
-\xa7\xb3\x6a\xf5\xb9\x21\x85\x4f\xf6\xaf\xd8\xcf\xd3\x8b\xd6\xff\
-\xb3\x95\x4f\x8d\x1e\x3a\x7c\xae\x3d\x7f\x80\x66\x11\x00\x78\x52\
-\x53\x7f\xf0\xaa\x47\xb6\x4c\x8e\xfd\x71\x2f\xa5\xf3\xaa\x95\xfc\
-\xe6\xfe\x83\x7b\xf2\x5b\x4f\xab\xff\xd9\x14\xd2\x2d\x9d\x4e\x5c\
-\x7f\xe5\xe4\xc6\x77\x38\xe7\x0f\xd0\x3c\x02\x00\xc7\xb5\x6d\xd3\
-\xf9\x5f\xdf\x32\xb9\xf1\xf2\xce\x42\xf7\xac\x6a\x6f\xfe\xcf\xaa\
-\xa9\x4f\x57\x2b\xfc\xfd\xd5\x22\xff\xd0\xb1\x4f\xf4\xa5\x9f\xa6\
-\x14\xfe\xbb\x9a\xbb\xb1\xaa\xff\x7c\x55\x38\xf2\xc2\x2b\x27\x36\
-\xbe\xd9\xad\x7e\x00\xcd\x15\xf3\x6b\x6d\x6e\xd8\x35\xb7\xe4\x43\
-\xcc\x2b\x61\xcb\xc4\x58\xed\x3f\x83\xb6\x9a\x9e\xbe\x7f\xb4\xff\
-\xea\x3f\xe9\xfb\xf4\xa6\x67\x67\x9f\x91\x0e\xae\x9e\xac\x42\xd4\
-\x78\x8c\xe1\xdc\x94\xe2\xd9\x21\xa6\xb5\x47\xdf\x4c\xf1\xe1\x18\
-\xd3\x03\x55\xb0\xba\x27\xa6\xce\x6c\x38\xed\xe0\xce\xa9\xf1\xf1\
-\x47\x8f\xbe\x37\x24\x4a\xdf\x7e\x9a\xa9\xf4\xf5\x47\x00\x10\x00\
-\x38\x89\x6e\xdc\xf1\x95\x97\xcc\x77\xbb\x57\xc5\x94\xde\x1a\x62\
-\x3c\x3d\x4f\x1f\x5f\x4a\x8f\xa5\x18\xae\xed\x2c\x8c\x5c\x3d\xb5\
-\x79\xdd\x83\x79\xb6\x95\x4a\xdf\x7e\x9a\x4d\x00\xa8\x99\x00\xc0\
-\x30\x9a\x99\x99\x59\xbd\x2f\x3c\xeb\x03\xd5\x42\xf6\xee\x18\xe2\
-\xd1\x23\x25\x8b\x76\x6c\x21\xbc\x66\x4d\x7a\xe4\x43\x93\x93\x93\
-\x87\xf2\x6c\x2b\x94\xbe\xfd\xb4\x43\xe9\xeb\x8f\x6b\x00\x60\x85\
-\x4d\xef\xb8\xeb\x8c\xbd\x61\xed\x6c\xb5\xc7\xfb\xde\x25\x2f\x7e\
-\x7d\xd5\x1e\x73\xf5\xe7\xdf\xbf\x2f\xae\xbd\x6d\x7a\xe6\xcb\xcf\
-\xcd\xb3\x8d\x57\xfa\xf6\x43\x5b\x08\x00\xb0\x82\xa6\x77\xce\xbd\
-\x3c\x75\xe6\xbf\x1a\x63\xd8\x90\xa7\x56\xc2\x6b\x7b\xb1\xfb\xcd\
-\xeb\x66\xf6\xbc\x22\x8f\x1b\xab\xf4\xed\x87\x36\x11\x00\x60\x85\
-\x4c\x7f\x6e\xee\x05\x29\x86\xcf\x57\x7b\xae\x2f\xcc\x53\x2b\xa6\
-\xda\x13\x3e\xab\x1b\x7a\x3b\xfa\x7b\xd7\x79\xaa\x71\x4a\xdf\x7e\
-\x68\x1b\x01\x00\x56\x40\xff\x9c\x77\xaf\x1b\x3e\x5d\xad\x54\x67\
-\xe6\xa9\x95\x57\x2d\xac\xa9\xbb\x70\xcb\x27\x67\x67\x4f\xc9\x33\
-\x8d\x51\xfa\xf6\x43\x1b\x09\x00\xb0\x02\xf6\xc6\xb5\x1f\x5c\xe1\
-\xc3\xde\x4f\x65\xfd\xa9\x07\x46\xaf\xce\x75\x63\x94\xbe\xfd\xd0\
-\x46\x02\x00\x2c\x53\xff\x56\xb7\x10\xd2\x5f\xe5\xe1\x49\x17\x43\
-\x78\xd7\x8d\xb7\xed\x79\x69\x1e\xd6\xae\xf4\xed\x87\xb6\x12\x00\
-\x60\x99\xe6\xbb\xdd\xf7\x2c\xeb\x6a\xf7\xc5\x8a\x71\xd5\xfc\x42\
-\xef\xaa\x3c\xaa\x5d\xe9\xdb\x0f\x6d\x25\x00\xc0\x32\xf4\x9f\x70\
-\x17\x53\xda\x96\x87\x03\x13\x53\xb8\xb2\xff\x77\xe7\x61\x6d\x4a\
-\xdf\x7e\x68\x33\x01\x00\x96\xa1\x77\x70\xf5\x44\xb5\x47\x7a\x62\
-\x4f\xb8\x5b\x49\xd5\xdf\xd9\x3b\x30\xba\x39\x8f\x6a\x53\xfa\xf6\
-\x43\x9b\x09\x00\xb0\x0c\xd5\xde\xef\x45\xb9\x1c\xbc\x18\x2f\xcc\
-\x55\x6d\x4a\xdf\x7e\x68\x33\x01\x00\x96\x23\xc6\x57\xe6\x6a\xe0\
-\x62\x08\xe7\xe4\xb2\x3e\xa5\x6f\x3f\xb4\x98\x00\x00\xcb\x90\x52\
-\x78\x49\x2e\x6b\x90\xce\xce\x45\x6d\x4a\xdf\x7e\x68\x33\x01\x00\
-\x96\x23\x86\x67\xe5\x6a\xe0\x52\x08\x6b\x72\x59\x9f\xd2\xb7\x1f\
-\x5a\x4c\x00\x80\x65\x88\x21\xac\xce\xe5\xc0\x0d\xf4\xd6\xbb\xa7\
-\x50\xfa\xf6\x43\x9b\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\
-\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\
-\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\
-\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\
-\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\
-\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\
-\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\
-\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\
-\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\
-\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\
-\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\
-\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\
-\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\
-\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\x02\x00\x00\x14\x48\x00\
-\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\x00\x40\
-\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\x40\x02\
-\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\
-\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\
-\x00\x00\xa0\x40\x02\x00\x00\x14\x28\xe6\xd7\xda\xdc\xb0\x6b\x2e\
-\xe5\x12\x58\xa4\x2d\x13\x63\xb5\xf6\xb0\xfe\x85\xa5\xab\xbb\x7f\
-\x1d\x01\x00\x80\x02\x09\x00\x00\x50\x20\x01\x00\x00\x0a\x24\x00\
-\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\x05\x12\x00\x00\xa0\
-\x40\x02\x00\x00\x14\x48\x00\x00\x80\x02\x09\x00\x00\x50\x20\x01\
-\x00\x00\x0a\x24\x00\x00\x40\x81\x04\x00\x00\x28\x90\x00\x00\x00\
-\x05\x12\x00\x00\xa0\x40\xb5\x07\x80\x14\xc2\xa1\x5c\x02\x8b\x90\
-\x42\x3a\x9c\xcb\xda\xe8\x5f\x58\x9a\x26\xf4\x6f\xfd\x47\x00\x52\
-\x78\x24\x57\xc0\x22\xc4\x10\xf6\xe6\xb2\x3e\xfa\x17\x96\xa4\x09\
-\xfd\x5b\x7b\x00\x88\x31\x7c\x37\x97\xc0\xa2\xc4\x07\x72\x51\x1b\
-\xfd\x0b\x4b\x55\x7f\xff\x36\xe1\x14\xc0\x7d\xb9\x04\x16\x23\xa5\
-\x7b\x73\x55\x1b\xfd\x0b\x4b\xd4\x80\xfe\xad\x3d\x00\x74\x7a\xf1\
-\xf6\x5c\x02\x8b\x11\x43\xed\xbd\xa3\x7f\x61\x89\x9a\xd0\xbf\xf9\
-\xb5\x36\xa3\x47\x16\x66\xaa\x24\xf4\x58\x1e\x02\x27\x20\x85\xb4\
-\xff\x70\xea\xee\xcc\xc3\xda\xe8\x5f\x58\xbc\xa6\xf4\x6f\xed\x01\
-\xe0\xb2\xcb\xce\xdf\x97\x62\xb8\x36\x0f\x81\x13\x12\xb7\xbf\x6d\
-\x72\x7d\xed\x17\x11\xe9\x5f\x58\x8a\x66\xf4\x6f\xed\x01\xa0\xaf\
-\xb3\x30\x72\x75\x4a\xe1\xd1\x3c\x04\x8e\xa3\xea\x95\xf9\xd4\xeb\
-\x7e\x24\x0f\x6b\xa7\x7f\xe1\xc4\x35\xa9\x7f\x1b\x11\x00\xa6\x36\
-\xaf\x7b\x30\xc4\xf4\xb1\x3c\x04\x8e\x23\x86\xf0\xf1\xad\x9b\xd6\
-\x7d\x3b\x0f\x6b\xa7\x7f\xe1\xc4\x35\xa9\x7f\x1b\x11\x00\xfa\x3a\
-\xfb\xe2\x87\x53\x4a\xdf\xc8\x43\xe0\xc9\xa4\x70\xef\xfe\x53\x0f\
-\xbd\x2f\x8f\x1a\x43\xff\xc2\x09\x68\x58\xff\x56\x61\xa4\x39\xa6\
-\x77\xdc\x75\x46\xaf\x3b\xff\xb5\x18\xe2\x59\x79\x0a\xc8\x52\x08\
-\x0f\x8d\x74\xe3\xc6\x2b\x2e\xde\xf0\x9d\x3c\xd5\x28\xfa\x17\x9e\
-\x5a\x13\xfb\xb7\x31\x47\x00\xfa\xfa\x87\x12\x7b\xa9\xb3\x29\x85\
-\xf4\xc3\x3c\x05\x54\xfa\x5f\x1e\xbd\x94\x2e\x69\xea\xe2\xdf\xa7\
-\x7f\xe1\xc9\x35\xb5\x7f\x1b\x15\x00\xfa\xb6\x4d\x6e\xb8\x6f\x55\
-\x98\x3f\xaf\x2a\xef\x3c\x36\x03\x85\x4b\xe1\xfe\xfe\x9e\xc3\xb6\
-\xc9\x8d\x77\xe7\x99\xc6\xd2\xbf\xf0\x04\x0d\xee\xdf\xc6\x05\x80\
-\xbe\xcb\x27\x2e\xf8\xc9\xfe\x53\x0e\x8d\xa7\x94\x3e\x1a\x52\x3a\
-\x92\xa7\xa1\x28\xfd\xab\x85\xab\x2f\x8f\x6b\xe2\xa3\xe1\xbc\x26\
-\xef\xf9\x3f\x91\xfe\x85\x76\xf4\x6f\xa3\xae\x01\x78\x32\x37\xde\
-\xb6\xe7\xa5\xf3\x0b\xbd\xab\xaa\x72\x6b\x0c\xf1\xb4\x63\xb3\x30\
-\xbc\xfa\x0f\x09\xe9\xdf\x27\xdc\xbf\x55\xa8\x49\x57\xfb\x2f\x85\
-\xfe\xa5\x34\x6d\xea\xdf\xc6\x07\x80\x5f\xf8\xcc\x67\xee\x78\xe6\
-\xc1\xd1\xb8\x29\xc4\x78\x61\xf5\x8f\x3e\x27\x85\xf0\xe2\x98\xd2\
-\xda\x6a\xbc\x2a\x7f\x04\xda\xa7\xda\x43\x4e\x31\x3e\x5c\xfd\x4e\
-\x7f\xaf\xaa\xef\xad\x3a\xf2\xf6\xfe\x13\xc2\x9a\xf0\x90\x90\x95\
-\xa4\x7f\x19\x4a\x85\xf4\x2f\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x2c\x5f\x08\xff\x07\xae\x75\xe5\x79\x8a\x49\
-\xcf\x1f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x25\xed\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x0f\x90\x65\x59\x5d\x1f\x70\x14\x15\xc5\x7f\x44\x41\x31\xa2\
-\x80\x81\x52\xe3\x7f\xa0\xc4\x3f\x88\x9a\xf8\x1f\x31\xf1\x7f\x44\
-\xa3\x55\x49\x69\xa1\x26\xb1\x34\x22\x56\x19\xc5\x3f\x31\x45\x4c\
-\x25\x42\xca\x7f\x98\x84\x3f\x0b\x3b\xfd\xce\x75\x86\x59\x87\xee\
-\xfb\x7a\x76\x56\x47\x76\xfa\xde\x9e\xc5\xc1\x80\x85\xac\xba\x14\
-\x88\x05\xfe\x09\x94\x02\xca\x2a\x08\x6c\xce\xe9\xde\x81\x61\x76\
-\x66\xba\x5f\xf7\xb9\xef\xdc\x7b\xee\xe7\x53\x75\x6a\xab\xb6\x16\
-\xed\x77\xee\x3b\xbf\xf7\x7d\xfd\x5e\xdf\xef\xfd\xee\x07\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x50\x9a\xcd\x3b\x1e\
-\xda\x6c\xef\x7e\x65\x58\x76\x3f\x18\xd7\xff\x0c\xcb\x7e\x2b\xb4\
-\xdd\xb9\x7b\xd7\xf9\xc5\xb2\xbb\x10\xff\xfd\x8b\x16\x6d\xf7\xf3\
-\x4d\xdb\x7d\xdf\x62\xb3\x7b\x62\xd3\xbc\xea\x43\x4a\xff\xdc\x30\
-\x27\xf7\xdc\x73\xcf\x07\x6c\x6c\xee\x7e\xfa\xc6\x72\xf7\x9b\xe2\
-\x39\xfc\xf1\xd0\xf6\xcf\xbd\xe2\x9c\x9e\x8b\x67\x74\x27\xfe\xbb\
-\xed\xc5\xb2\xff\xf5\xa6\xdd\xfd\x89\xd0\xee\x7c\x57\xfa\xef\x4b\
-\xff\xdc\xc0\x88\x3c\xe3\x19\xf7\x7c\x60\xb3\xdd\x7f\xfe\xa2\xed\
-\x7f\x36\x0e\x8e\x97\xc7\x17\xf6\xf7\xc4\x17\xfd\x7b\x56\x5a\x6d\
-\xf7\xb7\xf1\x7f\xb7\x8c\xff\xfc\xd1\x8d\x76\xe7\x9f\x94\x7e\x4c\
-\x50\xa3\x9b\xce\xbe\xe2\xc3\x17\x5b\xdd\xbf\x8c\xe7\xec\x7f\xc5\
-\x17\xf7\x37\xae\x7c\x4e\xe3\x8a\x01\xfe\x0d\x31\x1c\xbc\x20\x05\
-\x82\xe6\xfc\xf9\x8f\x28\xfd\x98\x80\x02\xce\x9c\xb9\xf4\xc0\xf8\
-\xce\xe0\xfb\xe3\x0b\xf7\x5d\x47\x19\x24\xd7\x5f\xdd\xbb\xe3\x6a\
-\x17\xed\xce\xd7\xa5\x70\x51\xfa\x71\xc2\xd4\xc5\x77\xf9\x8f\x88\
-\x67\xea\x17\xe3\xbb\xf9\xb7\xdd\xfb\x22\xfe\xf6\x1c\x67\x35\x9e\
-\xfd\xb7\xc4\xe0\xff\xec\x66\xb9\xf3\xa9\xa5\x1f\x23\xb0\x06\x29\
-\xf5\xc7\x01\xf2\x33\x71\xa0\xbc\x29\xef\x0b\xff\x35\x07\xcc\x5d\
-\x71\x68\x7d\x6b\xe9\xc7\x0c\x53\xd4\xb4\x17\xff\x69\x3c\xab\x8b\
-\xf8\x22\xfd\x0f\x03\x9f\xd3\xf4\x5b\xbf\xad\x93\xdb\xdd\xa7\x95\
-\x7e\xcc\xc0\x40\x9a\x65\xf7\xa4\x38\x4c\x5e\x3f\xf4\x0b\xff\x35\
-\xd6\x6d\x3e\x7f\x84\xc3\x69\xdb\xf6\x01\x29\xa4\xc7\xf5\x8e\xb5\
-\x9e\xd3\xb6\x7b\x67\x0c\x03\xbf\xe0\xa3\x01\xa8\x48\xd3\xde\xfe\
-\x90\x78\xc0\x37\x0a\xbc\xf0\xbf\xdf\x70\x69\xda\xfe\xa7\x7c\x2c\
-\x00\xd7\xb7\xd8\xea\xbf\x38\x86\xf4\x3b\x4b\x9e\xd5\xf4\x3d\x81\
-\xc5\xf6\xce\x97\x97\xde\x0b\xe0\x98\x9a\xad\xee\x9f\xc5\x81\xf2\
-\x67\x45\x5f\xfc\xaf\x1c\x2e\x6d\xf7\x9b\x2f\x6c\x2f\x7e\x54\xe9\
-\x7d\x81\x31\x49\xc1\x38\xbe\xf0\xfe\xa7\xa1\x7f\xdd\x7f\xf8\x73\
-\x9a\x7e\x8e\xee\x3f\x94\xde\x17\xe0\x08\xce\x9f\x3f\xff\x41\xa1\
-\xed\x7f\x6e\xff\x4b\x79\xe5\x07\xca\xfb\xaf\xee\xd5\x27\x6f\xdd\
-\x7d\x74\xe9\x3d\x82\x31\x38\xb5\x7c\xe9\x27\x2c\x96\xfd\x6f\x95\
-\x3f\x97\xd7\x08\x02\xcb\xee\xf9\xe9\x23\x89\xd2\x7b\x04\x1c\xd2\
-\xa9\xf6\xe2\xc3\xe2\x8b\xff\xed\xa5\x87\xc7\x01\xef\x30\xfe\xd2\
-\xb7\x8f\x99\xbb\x8d\xb6\xfb\xe7\x63\xfa\x0d\xdd\xb5\xcf\x6a\xf7\
-\x9b\xe9\x0d\x45\xe9\xbd\x02\x0e\xd0\x2c\x77\xbf\x21\x1e\xd8\x37\
-\x97\x1e\x1a\x87\x5a\x6d\xf7\xa7\x27\x37\xbb\x87\x97\xde\x33\x58\
-\xb7\xbd\xdf\xd0\x2d\xbb\x9f\x1e\xe7\x6f\xe8\xae\xb5\xba\x17\xf9\
-\xfe\x0e\x8c\xd4\xde\x37\x87\xdb\xfe\x59\x47\xba\x91\x4f\xd1\x77\
-\x17\xfd\x9d\x2f\x3e\x77\xc7\xc7\x96\xde\x3f\x58\x97\x7b\xff\xae\
-\xff\x62\xe9\xb3\x77\x84\xf5\xcb\xa5\xf7\x0e\xb8\x4a\xfa\x3c\x3d\
-\xdd\xc5\x6f\x04\x03\xe2\xa8\xeb\x74\xe9\x3d\x84\x75\x68\xda\xee\
-\x5b\x16\xcb\xfe\xaf\x47\x70\xe6\x8e\xb8\xba\xef\x28\xbd\x87\xc0\
-\xbd\xa6\x3f\x50\xf6\x57\xea\x15\x28\xbd\x97\x30\x94\xe7\x9d\x3f\
-\xff\xa1\xe9\xae\x7b\xa5\xcf\xd9\x71\x57\xba\x7b\x60\xfa\x0d\x46\
-\xe9\xfd\x84\x59\x4b\xf7\x05\xdf\x2b\x00\x19\xc1\x50\xc8\x32\x58\
-\x96\xdd\xdb\xdd\x89\x8c\x1a\xa5\x9b\x60\xc5\x77\xce\xaf\x2c\x7d\
-\xc6\xf2\xad\x6e\xa7\x69\x9a\xfb\x97\xde\x57\x98\xa5\x7b\x6f\x11\
-\xfa\xfb\xe5\x07\x41\xf6\xb5\x55\x7a\x6f\x21\xa7\xc5\x56\xff\xdd\
-\xa9\x2c\x6b\x04\x67\x2b\xef\x6a\xfb\xef\x29\xbd\xb7\x30\x3b\xf1\
-\xf0\x3d\x35\xbe\xf8\xdf\x5d\x7c\x00\x0c\xb4\x9a\x76\xf7\x09\xa5\
-\xf7\x18\x8e\xeb\x96\x5b\x76\x3e\x32\x7d\x73\xbe\xf4\x79\x1a\x2e\
-\x00\x74\xaf\x53\x03\x0e\x6b\x72\xfa\xf4\xf9\x07\x2d\x96\xfd\x6f\
-\x14\x3f\xf8\x83\x0f\x96\xfe\xf6\xd2\x7b\x0d\xc7\x11\xcf\xe9\x63\
-\x16\x6d\xf7\xc7\xc5\xcf\xd2\xc0\x6b\xd1\xf6\xff\xbe\xf4\x5e\x43\
-\xf5\x4e\x6c\xee\x3e\x3e\x25\xee\xd2\x07\x7e\x6d\x83\xc5\x7d\xc8\
-\x99\xa0\x7b\xee\xb9\xe7\x03\x9a\x65\xf7\x43\x31\x00\xfc\x7d\xe9\
-\x33\xb4\xa6\x00\xf0\x67\xcf\xb9\x74\xe9\x83\x4b\xef\x3b\x54\x69\
-\x7f\xa0\xf4\x4f\x4b\x45\x3a\xa5\x0f\xfb\x5a\x07\xcb\xb2\x7b\x7e\
-\xe9\xbd\x87\x55\xa4\x7b\x59\xa4\x3b\xe6\x95\x3e\x3b\xeb\x5e\xa9\
-\x61\xb4\xf4\xde\x43\x75\x4e\x9d\xed\x3e\x2e\x0e\x94\x65\xe9\x03\
-\x5e\x26\x00\xf4\x6f\x3b\x73\xe6\xd2\x03\x4b\x5f\x03\x38\x8c\x8d\
-\xe5\xce\x97\xa4\xbb\x5a\x96\x3e\x37\x45\xce\x6a\xdb\x9f\x28\xbd\
-\xff\x50\x95\xb1\x35\xf8\x95\x59\x6e\x38\xc2\xb8\x8d\xad\xc1\xaf\
-\x48\x00\x58\x76\x6f\x4f\x5f\x78\x2c\x7d\x2d\x60\xf2\xc6\xdd\xe0\
-\xb7\xe6\xc1\xd2\x76\x37\x97\xbe\x1e\x70\x3d\x63\x6e\xf0\x5b\xf7\
-\xda\x58\xee\xfc\x8b\xd2\xd7\x03\x26\x6d\x63\xfb\x65\x9f\x34\xf6\
-\x06\xbf\x75\xae\x18\x00\xee\x2a\x7d\x4d\xe0\x5a\x9a\xed\xfe\x6b\
-\x52\x9b\x65\xe9\x33\x32\x9a\xd5\x76\xff\xa5\xf4\x35\x81\xc9\x9a\
-\x54\x83\xdf\x9a\x56\x2a\x35\xba\xf9\xcc\xa5\x07\x97\xbe\x36\x70\
-\x59\xfa\xc6\x7b\x7c\x5e\xfe\xc2\xd4\x0a\xb7\xd6\xb0\x6e\x2b\x7d\
-\x6d\x60\x72\xa6\xda\xe0\xb7\xae\xb5\xb1\xb5\xfb\xb5\xa5\xaf\x11\
-\x24\xcd\xd9\x8b\x8f\x9c\x68\x83\xdf\x1a\x56\xf7\x56\x55\xc1\xb0\
-\x82\x66\xbb\x7f\x54\x7c\xe1\xbf\x54\xfe\xf0\x8e\x77\xc5\xfd\xf9\
-\x81\xd2\xd7\x09\x6a\x29\xdc\x1a\x72\xf9\x6d\x1d\x1c\x52\x7c\xf1\
-\x7f\x4a\xfa\x53\xb7\xd2\x87\x76\xec\x2b\x7d\xc3\xba\xf4\xb5\x62\
-\xbe\x9a\xa6\xff\xb0\x18\x42\x7f\xb5\xf4\x39\x98\xc2\x6a\x96\x3b\
-\x9f\x5a\xfa\x7a\xc1\xa8\xed\x0f\x94\xe9\x57\x82\xae\x6f\x75\xbf\
-\x58\xfa\x9a\x31\x4f\xa9\x99\x32\xb4\xfd\x2b\xca\x9f\x81\x69\xac\
-\x18\x00\xbe\xb0\xf4\x35\x83\xd1\x6a\xb6\xfa\xcf\x8a\x2f\x68\xaf\
-\x2e\x7d\x50\xa7\xb5\xba\x17\x94\xbe\x6e\xcc\x4f\x68\xbb\x7f\x53\
-\x65\x83\xdf\x80\x6b\x63\xbb\xfb\xfa\xd2\xd7\x0d\x46\x29\x54\xde\
-\xe0\x37\xe0\x6a\x4a\x5f\x3b\xe6\x23\xdd\xd0\x26\xdd\x7f\x62\x04\
-\xcf\xfb\xc9\xad\xc5\xb2\xff\xd6\xd2\xd7\x0f\x46\xa5\x39\x77\xe9\
-\xa3\x67\xd1\xe0\x37\xdc\x12\x00\x58\x8b\xe6\xec\xc5\xc7\xa6\x7b\
-\x4f\x8c\xe0\x39\x3f\xc9\x25\x00\xc0\x15\x52\x83\x5f\x1c\x28\xaf\
-\x2d\x7d\x30\x27\xbe\x04\x00\x06\x35\xb7\x06\xbf\xa1\x96\x00\x00\
-\xf7\x9b\x6f\x83\xdf\x40\x4b\x00\x60\x30\x73\x6d\xf0\x1b\x62\x09\
-\x00\xcc\x5e\xd3\xde\xfe\x90\xb9\x36\xf8\x0d\xb4\x04\x00\x06\x31\
-\xe7\x06\xbf\x21\x96\x00\xc0\xac\x2d\xb6\x77\xbe\x3c\xb4\xfd\x1b\
-\x4b\x1f\xc4\xca\x96\x00\x40\x56\xe9\x8e\x75\x61\xd9\xfd\xe4\x9c\
-\x1b\xfc\x86\x58\x02\x00\xb3\xd4\x34\xcd\xfd\xe3\x30\xf9\xd9\x78\
-\x00\xde\x55\xfa\x10\xe6\x3d\xd0\xdd\x3b\xe2\x3f\xb7\x0a\xff\x1c\
-\x02\x00\xd9\xd4\xda\xe0\x17\xe7\xcf\xeb\x63\xa8\x79\x65\xd9\x79\
-\x21\x00\x30\x33\xa7\xda\x8b\x0f\x8b\x4f\xfe\x97\x96\x1e\x00\x03\
-\x1c\xe6\x3f\x49\x37\xf6\x48\x87\xba\xf0\xcf\x22\x00\x90\x45\x7c\
-\x2e\x7f\x45\x0c\xb5\x7f\x5e\xfa\x6c\x65\x5f\x6d\x7f\x4b\xb3\xdd\
-\x7f\x4c\x3a\x2b\x85\x67\x86\x00\xc0\x7c\xc4\xd4\xfd\xe4\x2a\x1b\
-\xfc\xda\xfe\xe4\xe9\xd3\xe7\x1f\xb4\xf7\x18\x05\x00\x26\xee\xfc\
-\xf9\xf3\x1f\x14\xdf\x1d\xff\x74\x5c\xef\x2e\x7e\xb6\x32\xae\xf4\
-\x57\x0b\xe9\xaf\x17\xd2\x97\x8e\xd3\xe3\x0c\x02\x00\x0c\x2f\x55\
-\x82\xd6\x38\x50\xe2\x0b\xff\xdf\xa5\x81\x72\xe5\x63\x15\x00\x98\
-\xb2\xe6\xdc\x85\x4f\x8e\xcf\xeb\xae\xf8\xd9\xca\xbe\xba\x3f\x3a\
-\xd1\x76\x9f\x77\xe5\x63\x0d\x02\x00\x0c\x6b\x63\xb9\xfb\x88\xf8\
-\x64\xdf\x2d\x3f\x00\xb2\x0f\x94\x57\xa7\x5b\x15\x5f\xfd\x78\x05\
-\x00\xa6\xaa\x69\xfb\x6f\x8c\xcf\x9f\xbf\x2a\x7f\xb6\xf2\xae\x45\
-\xdb\xdf\xd4\x9c\x3f\xff\x11\x57\x3f\xde\x20\x00\xc0\x70\x16\xdb\
-\x3b\xdf\x5c\x63\x25\x68\x1a\x28\x37\x9d\x7d\xc5\x87\x5f\xf3\x31\
-\x0b\x00\x4c\xcc\xf3\xce\x9f\xff\xd0\x1a\x0b\xb7\xd2\xad\xc4\xaf\
-\xfe\x0d\xdd\x95\x82\x00\x00\xf9\xd5\xdb\xe0\xd7\xbd\x35\xae\xef\
-\xb8\xd1\x63\x17\x00\x98\x92\x5a\x1b\xfc\xe2\x8b\xff\x1f\x2c\xce\
-\x76\x9f\x79\xa3\xc7\x1e\x04\x00\xc8\x6b\x63\x73\xf7\xd3\xe3\xe1\
-\xfb\xfd\xd2\x03\x60\x80\xf5\xbb\xcd\x76\xff\xa8\x83\x1e\xbf\x00\
-\xc0\x54\x2c\xb6\xfa\xef\xae\xb1\xc1\x2f\xfd\x86\xee\xcc\x99\x4b\
-\x0f\x3c\xe8\xf1\x07\x01\x00\xf2\x49\x03\x25\xbe\xf8\xbf\xbd\xf4\
-\x00\xc8\x3b\x4c\xba\xf7\xa4\xdf\x66\x34\xcd\xab\x3e\xe4\x50\x7b\
-\x20\x00\x30\x72\xa9\xc1\x2f\x2c\xbb\x17\x95\x3e\x5b\xf9\x57\xf7\
-\xd6\x66\x6b\xf7\xdb\x0f\xbb\x0f\x41\x00\x80\xe3\x7b\x61\x7b\xf1\
-\xa3\xe2\x8b\xe4\x89\xf2\x03\x20\xfb\x40\x79\x53\xb3\xec\x9e\xb4\
-\xca\x5e\x08\x00\x8c\x59\x7c\x7e\x3e\x26\x86\xda\x3f\x2e\x7f\xb6\
-\xb2\xaf\x97\x9d\xdc\xbc\xf0\x29\xab\xec\x45\x10\x00\xe0\x78\x4e\
-\x6c\xed\x3c\x2e\x3e\x99\x5f\x33\x82\x01\x90\xf9\x70\x76\xbf\xd3\
-\xbc\xa4\xff\xc4\x55\xf7\x43\x00\x60\x8c\x6a\x6d\xf0\xbb\xfc\x1b\
-\xba\xf4\xa7\xc6\xab\xee\x49\x10\x00\xe0\x68\xde\x37\x50\xf6\x6e\
-\x7f\x5b\x7c\x10\x64\x3c\x94\xef\x4a\xf7\x2c\x48\xb7\x2b\x3e\xca\
-\xbe\x08\x00\x8c\x4d\x6a\xf0\x8b\xcf\xe9\x33\xa5\xcf\xd6\x00\x67\
-\xf5\xff\x6d\x6c\xed\x7e\xed\x51\xf7\x25\x08\x00\xb0\xba\x9b\xcf\
-\x5c\x7a\x70\x4c\xdd\x9b\xa5\x07\x40\xf6\xd5\x76\x7f\xd1\x6c\xef\
-\x7e\xe5\x71\xf6\x46\x00\x60\x4c\x4e\x6c\xee\x3e\x3e\xbe\x4b\x7e\
-\x6d\xf1\xb3\x95\xfd\xac\xf6\xbf\x7d\xe2\xd6\x9d\x7f\x7c\x9c\xbd\
-\x09\x02\x00\xac\x66\x63\xb9\xfb\x65\x35\x36\xf8\xc5\x21\x79\xeb\
-\x89\xdb\x76\x3f\xfe\xb8\xfb\x23\x00\x30\x06\x97\x7f\x43\x17\x43\
-\xed\x3b\x4b\x9f\xad\xbc\xe7\x34\x35\x12\x76\x3f\x9d\x1a\x0a\x8f\
-\xbb\x47\x41\x00\x80\xc3\x49\xbf\x12\x4f\x07\xaf\xba\x06\xbf\x8c\
-\x03\x25\x11\x00\x28\xed\xd4\xd9\xee\xe3\x62\x48\xdf\x2e\x7d\xb6\
-\xb2\xaf\xb6\xfb\xd3\xa6\xdd\x7d\x42\xae\x7d\x0a\x02\x00\x1c\xac\
-\xf6\x06\xbf\x9c\x7b\x25\x00\x50\x52\xed\x0d\x7e\x39\xf7\x2a\x08\
-\x00\x70\x63\x73\x68\xf0\xcb\xba\x5f\x02\x00\x05\xcc\xa5\xc1\x2f\
-\xa7\x20\x00\xc0\xb5\xcd\xa9\xc1\x2f\x27\x01\x80\x75\x9b\x53\x83\
-\x5f\x4e\x41\x00\x80\xfb\xaa\xb9\xc1\xef\x44\xbb\xfb\xd9\x43\xee\
-\x9d\x00\xc0\x3a\xcd\xad\xc1\x2f\xa7\x20\x00\xc0\xfb\x9b\x63\x83\
-\x5f\xd6\xfd\x13\x00\x58\x83\xb9\x36\xf8\xe5\x14\x04\x00\xd8\x37\
-\xe7\x06\xbf\x9c\x04\x00\x86\x56\x6d\x83\x5f\xdb\xbf\xea\xa0\x06\
-\xbf\x9c\x82\x00\x00\xf5\x36\xf8\x2d\xda\xee\xd2\x61\x1a\xfc\x72\
-\x12\x00\x18\xd2\xdc\x1b\xfc\x72\x0a\x02\x00\x73\xa7\xc1\x2f\xf3\
-\x7e\x0a\x00\x0c\xa0\xd6\x06\xbf\x78\x56\xdf\xb2\x4a\x83\x5f\x4e\
-\x41\x00\x60\xae\x34\xf8\x0d\x43\x00\x20\xb7\x7b\x1b\xfc\xee\x2a\
-\x7f\xb6\xb2\xaf\x95\x1b\xfc\x72\x0a\x02\x00\x73\xa4\xc1\x6f\x38\
-\x02\x00\xb9\x68\xf0\x1b\x56\x10\x00\x98\x13\x0d\x7e\xc3\x13\x00\
-\xc8\x41\x83\xdf\xf0\x82\x00\xc0\x5c\x68\xf0\x5b\x0f\x01\x80\xe3\
-\x4a\x0d\x7e\xf1\x79\xfd\xba\xe2\x67\x2b\xf3\x8a\x67\xe3\xb7\x8e\
-\xdb\xe0\x97\x53\x10\x00\x98\x83\xd4\xe0\x17\xdf\xf5\xbf\xa1\xf4\
-\x00\xc8\x7e\x80\xda\xee\xd6\x66\xf3\x8e\x87\x96\xde\xdf\x2b\x09\
-\x00\x1c\x95\x06\xbf\xf5\x0a\x02\x00\x35\xd3\xe0\xb7\x7e\x02\x00\
-\x47\xb1\xd7\xe0\xb7\xec\xcf\x96\x3e\x5b\xd9\x57\xe6\x06\xbf\x9c\
-\x82\x00\x40\xad\x34\xf8\x95\x21\x00\xb0\x2a\x0d\x7e\x65\x04\x01\
-\x80\x1a\xa5\xcf\xc4\xd3\x67\xe3\xc5\x07\x40\xf6\x81\xd2\x9d\xba\
-\x79\xf3\xc2\x3f\x2a\xbd\xbf\x37\x22\x00\x70\x58\x1a\xfc\xca\x0a\
-\x02\x00\x35\xa9\x75\xa0\x0c\xdd\xe0\x97\x93\x00\xc0\x61\x9c\xdc\
-\xec\x1e\x5e\x6b\x83\x5f\xb3\xb9\xf3\xb9\xa5\xf7\xf7\x30\x82\x00\
-\x40\x2d\xf6\x06\x8a\x06\xbf\xe2\x04\x00\x0e\xa2\xc1\x6f\x1c\x82\
-\x00\x40\x0d\x34\xf8\x8d\x87\x00\xc0\xf5\x68\xf0\x1b\x97\x20\x00\
-\x30\x65\xf5\x0e\x94\xfe\x6d\xcd\x76\xff\x94\xd2\xfb\x7b\x14\x02\
-\x00\xd7\xb2\xd7\xe0\xb7\xec\x5e\x59\xfa\x6c\x65\x3f\xab\x6b\x6e\
-\xf0\xcb\x29\x08\x00\x4c\x95\x06\xbf\x71\x12\x00\xb8\x9a\x06\xbf\
-\x71\x0a\x02\x00\x53\x54\xe3\x40\x29\xd9\xe0\x97\x93\x00\xc0\x65\
-\x1a\xfc\xc6\x2d\x08\x00\x4c\x49\xcd\x0d\x7e\x1b\xdb\xdd\xd7\x97\
-\xde\xdf\x1c\x04\x00\x92\xe6\xec\xc5\xc7\xd6\xd8\xe0\x17\x1f\xd3\
-\x1d\x25\x1b\xfc\x72\x0a\x02\x00\x53\x91\x1a\xfc\xaa\x1c\x28\x23\
-\x68\xf0\xcb\x49\x00\x98\xb7\x6a\x0b\xb7\x46\xd2\xe0\x97\x53\x10\
-\x00\x18\xbb\x5a\x07\x4a\xba\x57\x41\x3c\x00\xcf\x1c\x43\x83\x5f\
-\x4e\x02\xc0\x7c\xed\x35\xf8\xb5\xfd\x4b\xca\x9f\xad\xbc\x6b\x4c\
-\x0d\x7e\x39\x05\x01\x80\x31\xab\xb9\xc1\x6f\xa3\xdd\xf9\xaa\xd2\
-\xfb\x3b\x04\x01\x60\x9e\x16\xed\x85\x2f\xa8\xb5\xc1\xef\xd4\xf2\
-\xa5\x9f\x50\x7a\x7f\x87\x10\x04\x00\xc6\xaa\xd6\x06\xbf\x38\x24\
-\xcf\x8d\xad\xc1\x2f\x27\x01\x60\x5e\x34\xf8\x4d\x57\x10\x00\x18\
-\x1b\x0d\x7e\xd3\x26\x00\xcc\xc7\x89\xdb\x76\x3f\x3e\x68\xf0\x9b\
-\xac\x20\x00\x30\x26\x1a\xfc\xa6\x4f\x00\x98\x07\x0d\x7e\xd3\x17\
-\x04\x00\xc6\x42\x83\x5f\x1d\x04\x80\xba\xd5\x5a\xb8\x35\x95\x06\
-\xbf\x9c\x82\x00\x40\x69\xb5\x0e\x94\x29\x35\xf8\xe5\x24\x00\xd4\
-\xab\xd6\x06\xbf\x45\xdb\xff\xe1\x54\x1a\xfc\x72\x0a\x02\x00\x25\
-\xa5\x81\x12\x0f\x5f\x5f\x7a\x00\x0c\x30\x50\xee\x9c\x52\x83\x5f\
-\x4e\x02\x40\x9d\x36\x96\xbb\xdf\x14\x34\xf8\x55\x25\x08\x00\x94\
-\xa2\xc1\xaf\x4e\x02\x40\x5d\xea\x2d\xdc\xea\xee\x6e\xda\xee\xfb\
-\x4a\xef\x6f\x49\x41\x00\x60\xdd\xea\x1d\x28\xd3\x6d\xf0\xcb\x49\
-\x00\xa8\x87\x06\xbf\xba\x05\x01\x80\x75\x4a\x0d\x7e\x75\x0e\x94\
-\x69\x37\xf8\xe5\x24\x00\xd4\xa1\xc6\xc2\xad\xfd\xb3\x3a\xed\x06\
-\xbf\x9c\x82\x00\xc0\xba\xd4\x38\x50\x6a\x69\xf0\xcb\x49\x00\x98\
-\x36\x0d\x7e\xf3\x11\x04\x00\x86\xa6\xc1\x6f\x5e\x04\x80\xe9\xd2\
-\xe0\x37\x2f\x41\x00\x60\x48\x1a\xfc\xe6\x47\x00\x98\x9e\x5a\x0b\
-\xb7\x6a\x6c\xf0\xcb\x29\x08\x00\x0c\xa1\xd6\x81\xb2\xd7\xe0\x67\
-\xa0\xdc\x90\x00\x30\x2d\xa9\x70\xab\xd6\x06\xbf\x66\xbb\xff\x9a\
-\xd2\xfb\x3b\x66\x41\x00\x20\x37\x0d\x7e\xf3\x26\x00\x4c\xc7\x62\
-\xb3\x7b\x62\x8d\x85\x5b\x35\x37\xf8\xe5\x14\x04\x00\x72\x6a\xda\
-\xfe\x4b\x6b\x1c\x28\xb5\x37\xf8\xe5\x24\x00\x8c\x9f\x06\x3f\x92\
-\x20\x00\x90\x83\x06\x3f\x2e\x13\x00\xc6\x4d\x83\x1f\x97\x05\x01\
-\x80\xe3\x4a\x03\x65\xd1\x76\xb7\x16\x1f\x00\xf9\x9f\x9c\xb3\x69\
-\xf0\xcb\x49\x00\x18\x2f\x0d\x7e\x5c\x29\x08\x00\x1c\x87\x06\x3f\
-\xae\x26\x00\x8c\x4f\xad\x85\x5b\x73\x6c\xf0\xcb\x29\x08\x00\x1c\
-\x45\xad\x03\x65\xae\x0d\x7e\x39\x09\x00\xe3\xa2\xc1\x8f\xeb\x09\
-\x02\x00\xab\xd2\xe0\xc7\x8d\x08\x00\xe3\xa1\xc1\x8f\x1b\x09\x02\
-\x00\xab\x48\x03\x45\x83\x1f\x37\x22\x00\x94\x57\x6f\xe1\x56\x77\
-\x77\xd8\xda\xf9\xde\xd2\xfb\x5b\x8b\x20\x00\x70\x18\xf5\x0e\x14\
-\x0d\x7e\xb9\x09\x00\x65\xd5\xdc\xe0\x77\x62\x79\xe1\x33\x4a\xef\
-\x6f\x4d\x82\x00\xc0\x41\x34\xf8\xb1\x0a\x01\xa0\x9c\x1a\x0b\xb7\
-\xf6\xcf\xaa\x06\xbf\x21\x04\x01\x80\x1b\xa9\x71\xa0\x68\xf0\x1b\
-\x96\x00\xb0\x7e\xa9\xc1\x2f\x3e\xaf\x6f\x2e\x7d\xb6\x06\x38\xab\
-\x6f\x89\xff\xfc\xb6\xd2\xfb\x5b\xab\x20\x00\x70\x2d\xfb\x0d\x7e\
-\xf5\x0d\x14\x0d\x7e\xc3\x13\x00\xd6\x4b\x83\x1f\x47\x15\x04\x00\
-\xae\x56\xeb\x40\x89\xeb\xa5\x1a\xfc\x86\x27\x00\xac\x47\xad\x85\
-\x5b\x1a\xfc\xd6\x27\x08\x00\x5c\x66\xa0\x90\x83\x00\x30\xbc\x6a\
-\x1b\xfc\xda\xfe\x2f\x35\xf8\xad\x4f\x10\x00\x48\x34\xf8\x91\x8b\
-\x00\x30\xac\x5a\x0b\xb7\x34\xf8\xad\x5f\x10\x00\xa8\x75\xa0\x68\
-\xf0\x2b\x43\x00\x18\x86\x06\x3f\x72\x0b\x02\xc0\x7c\xa5\x03\x17\
-\x87\xc9\xd3\x35\xf8\x91\x93\x00\x90\x5f\xcd\x0d\x7e\x8b\xad\xfe\
-\x8b\x4b\xef\xef\x5c\x05\x01\x60\x9e\x6a\x6e\xf0\xdb\xd8\xee\xbe\
-\xa8\xf4\xfe\xce\x99\x00\x90\x57\xb5\x0d\x7e\xcb\xfe\xb4\x06\xbf\
-\xb2\x82\x00\x30\x3f\xd5\x0e\x14\x0d\x7e\xa3\x20\x00\xe4\x51\x6b\
-\xe1\x96\x06\xbf\xf1\x08\x02\xc0\x7c\xd4\x3a\x50\x34\xf8\x8d\x8b\
-\x00\x70\x7c\x15\x17\x6e\x69\xf0\x1b\x91\x20\x00\xcc\x43\xc5\x03\
-\x45\x83\xdf\xc8\x08\x00\xc7\xa3\xc1\x8f\x75\x09\x02\x40\xfd\x6a\
-\x1e\x28\x1a\xfc\xc6\x47\x00\x38\x9a\x6a\x0b\xb7\xda\xfe\x6f\x9a\
-\x65\xf7\xaf\x4b\xef\x2f\xf7\x15\x04\x80\x7a\x55\x3b\x50\x96\xfd\
-\xdb\xe2\xe3\xfa\xce\xd2\xfb\xcb\xb5\x09\x00\xab\xd3\xe0\x47\x09\
-\x41\x00\xa8\x53\xbd\x03\x45\x83\xdf\xd8\x09\x00\xab\xa9\xb1\x70\
-\x6b\xff\xac\xf6\x37\x35\x4d\xff\x61\xa5\xf7\x97\xeb\x0b\x02\x40\
-\x7d\x6a\x1c\x28\x1a\xfc\xa6\x43\x00\x38\x1c\x0d\x7e\x94\x16\x04\
-\x80\x7a\x54\x3c\x50\xde\xac\xc1\x6f\x3a\x04\x80\x83\xd5\x5a\xb8\
-\x95\x1a\xfc\xe2\x63\x7b\x64\xe9\xfd\xe5\x70\x82\x00\x50\x87\x5a\
-\x07\x4a\x5c\xbb\x1b\xcb\xdd\x47\x94\xde\x5f\x0e\x4f\x00\xb8\x3e\
-\x85\x5b\x8c\x49\x10\x00\xa6\xcd\x40\x61\x6c\x04\x80\x6b\xd3\xe0\
-\xc7\xd8\x04\x01\x60\xba\x6a\x1d\x28\x1a\xfc\xa6\x4d\x00\xb8\xaf\
-\x5a\x0b\xb7\x34\xf8\x4d\x5b\x10\x00\xa6\xa9\xd6\x81\xa2\xc1\x6f\
-\xfa\x04\x80\xf7\x51\xb8\xc5\x98\x05\x01\x60\x5a\x0c\x14\xc6\x4e\
-\x00\xd8\x57\x6b\x83\x5f\x3c\xab\xaf\xd7\xe0\x57\x87\x20\x00\x4c\
-\x47\xb5\x03\x45\x83\x5f\x55\x04\x80\x8a\x0b\xb7\x34\xf8\x55\x25\
-\x08\x00\xd3\x50\xeb\x40\x89\x8f\xe9\xc5\x1a\xfc\xea\x32\xe7\x00\
-\x50\x7b\xe1\x96\x06\xbf\xba\x04\x01\x60\xdc\x6a\x1f\x28\xa5\xf7\
-\x97\xfc\xe6\x1a\x00\x2a\x2e\xdc\xd2\xe0\x57\xa9\x20\x00\x8c\x57\
-\xc5\x03\xe5\xce\xc5\xf6\x85\xcf\x29\xbd\xbf\x0c\x63\x8e\x01\xa0\
-\xe6\xc2\x2d\x0d\x7e\xf5\x0a\x02\xc0\x38\xd5\x3c\x50\x34\xf8\xd5\
-\x6d\x4e\x01\xa0\xda\xc2\xad\xb6\xff\x9b\xd0\xee\x7c\xd7\xba\xf6\
-\x91\x32\x82\x00\x30\x2e\xd5\x0e\x14\x0d\x7e\xb3\x31\x97\x00\x50\
-\x6f\xe1\x96\x06\xbf\xb9\x08\x02\xc0\x78\xd4\x3a\x50\x42\xdb\xbd\
-\x5c\x83\xdf\x7c\xcc\x21\x00\xd4\x58\xb8\x95\x96\x06\xbf\x79\x09\
-\x02\xc0\x38\xd4\x38\x50\x2e\xdf\xce\xb7\x6d\xdb\x07\x94\xde\x5f\
-\xd6\xa7\xe6\x00\x50\x71\xe1\x96\x06\xbf\x19\x0a\x02\x40\x59\x15\
-\x0f\x94\x37\xc7\x17\xff\x27\x97\xde\x5f\xd6\xaf\xd6\x00\x50\x6b\
-\xe1\x96\x06\xbf\xf9\x0a\x02\x40\x39\x27\xb6\x76\x1e\x17\x37\xe1\
-\x35\xa5\x07\x40\xf6\xd5\xf6\xb7\x9f\x6a\x2f\x3e\xac\xf4\xfe\x52\
-\x46\x6d\x01\x60\xbf\x70\x6b\xf7\x47\x6a\x2b\xdc\x4a\x7f\x5a\x1c\
-\x5f\xfc\x7f\x3e\xfd\xa9\x71\xce\xfd\x62\x3a\x82\x00\x50\x46\xb3\
-\xb5\xfb\xed\x71\xa0\xdc\x5d\x7e\x08\x64\xbc\x98\x1a\xfc\xb8\x5f\
-\x5d\x01\x20\x7d\x7c\x15\x5f\x28\x5f\x50\xfa\x6c\xe5\x3f\xab\x1a\
-\xfc\x10\x00\xd6\x2e\xbd\x9b\x48\x37\xf6\x49\x2f\x96\xa5\x87\x40\
-\xee\x81\x12\x03\xcd\x57\x97\xde\x5f\xca\xab\x25\x00\xa4\x96\xbb\
-\x78\x56\x2f\x96\x3e\x5b\xd9\xcf\xaa\x06\x3f\xee\x15\x04\x80\xf5\
-\x49\x2f\xfe\xf1\x85\xff\x57\x4b\x0f\x80\xec\x4b\x83\x1f\x57\xa8\
-\x21\x00\x9c\x3a\xdb\x7d\x5c\xba\x61\x55\xf1\xb3\x95\x71\x29\xdc\
-\xe2\x6a\x41\x00\x58\x9f\xf8\x60\x9f\x59\x7a\x08\x18\x28\x0c\x6d\
-\xea\x01\xe0\xf4\xe9\xf3\x0f\x8a\xff\x37\x7e\xaf\xf4\xf9\xca\x7c\
-\x56\x35\xf8\x71\x1f\x41\x00\x58\x8f\xf8\x40\x7f\xac\xf4\x10\xc8\
-\x3b\x50\xba\xd7\x9e\xd8\xdc\x7d\x7c\xe9\x7d\x65\x7c\xa6\x1c\x00\
-\xf6\x6f\xc4\xd5\xdd\x51\xfa\x7c\x65\x5d\x6d\x77\x4a\xe1\x16\xd7\
-\x12\x04\x80\xe1\x2d\x36\xbb\x27\xee\xbf\x5b\x1e\xc1\x30\xc8\x72\
-\xd1\x34\xf8\x71\x7d\x53\x0e\x00\xf1\xb9\xfd\x2b\xa5\xcf\x57\xb6\
-\xa5\x70\x8b\x03\x04\x01\x60\x58\x4d\x7b\xfb\x43\xe2\x50\x79\x43\
-\xf1\x61\x60\xa0\xb0\x26\x53\x0d\x00\x23\xf8\xb9\xf3\x0d\x56\x0d\
-\x7e\x1c\x42\x10\x00\x86\x55\x7a\x83\xf3\xad\xee\xd5\xcd\x56\xff\
-\x59\xa5\xf7\x93\xf1\x1b\xc1\x0b\xe9\xca\x01\x60\x3f\xa8\xf7\x7f\
-\x5d\xfe\x9c\xe5\x18\xaa\xdd\xf3\x15\x6e\x71\x18\x41\x00\x18\x4e\
-\xd3\xee\x3e\xa1\x86\x3f\xf7\xd3\xe0\xc7\x2a\xa6\x18\x00\xe2\xcf\
-\xfc\xeb\xa5\xcf\x59\x86\x61\xfa\x36\x0d\x7e\xac\x22\x08\x00\xc3\
-\x48\xdf\x8c\x8f\x2f\xfe\x97\x4a\x0f\x85\xe3\x0e\x14\x0d\x7e\xac\
-\x6a\x6a\x01\x20\xfd\xaa\x3c\xfe\xcc\xef\x2a\x7d\xde\x8e\xb9\x7e\
-\xef\xe4\xad\xbb\x8f\x1e\xea\x9a\x52\xa7\x20\x00\x0c\x23\xdd\xe9\
-\x6f\x04\x43\xe1\xe8\xab\xed\x5e\x6e\xa0\x70\x14\x53\x0b\x00\x31\
-\xa8\xff\x66\xf1\xf3\x76\x9c\x21\xaa\xc1\x8f\x23\x0a\x02\xc0\x30\
-\xe2\xa1\xec\x4b\x0f\x86\xa3\x0d\x13\x0d\x7e\x1c\xcf\x94\x02\x40\
-\x2a\xc1\x99\xea\xbb\xff\xd4\xe0\x57\xed\x00\x65\x2d\x82\x00\x90\
-\x5f\xb3\xdd\x7f\x7e\xe9\xe1\x70\xc4\x81\xa2\xc1\x8f\x63\x9b\x52\
-\x00\x88\xcf\xf7\x67\x95\x3e\x77\x47\x5b\xdd\x4e\x73\xee\xc2\x27\
-\x0f\x79\x1d\xa9\x5f\x10\x00\xf2\x8b\x43\xe5\x97\xca\x0f\x88\x15\
-\x97\x06\x3f\x32\x99\x4a\x00\x68\x9a\xe6\xfe\xf1\x85\xf4\x4d\xc5\
-\xcf\xde\x4a\xab\x7b\xf7\x62\xd9\xfd\x67\x0d\x7e\xe4\x10\x04\x80\
-\xfc\x42\xdb\xbd\xae\xfc\xa0\x38\xe4\x05\xd0\xe0\x47\x66\x53\x09\
-\x00\xe9\x06\x5d\xa5\xcf\xdf\x6a\x67\x55\x83\x1f\x79\x05\x01\x20\
-\xaf\x13\x6d\xf7\x79\xa5\x07\xc5\x2a\x03\x45\x83\x1f\xb9\x4d\x26\
-\x00\x2c\xfb\xff\x56\xfa\x0c\xae\xb0\x6e\xd3\xe0\x47\x6e\x41\x00\
-\xc8\x2b\xbe\xfb\xff\xd1\x11\x0c\x8b\x83\x37\xbe\xed\x96\xa9\xf1\
-\xac\xf4\x7e\x51\x9f\x09\x05\x80\xff\x5b\xfa\x1c\x1e\xb8\xda\xee\
-\x9d\x71\x3d\x5d\xe1\x16\x43\x08\x02\x40\x5e\x61\xd9\xbd\xa8\xf8\
-\xd0\xb8\xd1\x86\x6b\xf0\x63\x60\x53\x08\x00\xe9\x23\xaf\xc5\xb2\
-\x7b\x47\xe9\xf3\x78\xc0\x59\xd5\xe0\xc7\xa0\x82\x00\x90\x57\x7c\
-\x71\x7d\x65\xe9\xc1\x71\xa3\x81\xb2\xb1\xdd\x7d\x51\xe9\x3d\xa2\
-\x6e\x53\x08\x00\xe9\xb6\xd6\xa5\xcf\xe3\x01\xeb\x74\xb3\xdd\x7f\
-\xcc\x3a\xae\x17\xf3\x15\x04\x80\x7c\xd2\xb7\x8a\xc7\xfa\xae\x22\
-\x6e\xf4\x6f\xa4\x9e\xf3\xd2\x7b\x44\xfd\xa6\x11\x00\x46\x7a\xa3\
-\xae\x54\xb8\xd5\xee\x7e\xff\x3a\xae\x13\x04\x01\x20\x9f\x54\x91\
-\x5b\x7c\x80\xdc\x67\x83\xbb\xbb\xe3\x3f\x9f\x5a\x7a\x6f\x98\x8f\
-\x49\x04\x80\xed\xfe\xdf\x95\x3e\x9b\xf7\x39\xab\x6d\x7f\xe7\x89\
-\x76\xf7\xb3\xd7\x71\x8d\x20\x09\x02\x40\x3e\x1b\xcb\xdd\x47\x94\
-\x1e\x22\xef\xbf\x34\xf8\xb1\x7e\x93\x08\x00\xed\xee\x4f\x94\x3f\
-\x9f\x57\x0c\xc2\xb6\x7b\x9e\xc2\x2d\xd6\x2d\x08\x00\xf9\x2c\xb6\
-\x2f\x7c\x4e\xe9\x41\xf2\xde\xd5\xf6\xcf\x35\x50\x28\x61\x0a\x01\
-\x20\xb4\xdd\x7f\x2d\x7e\x46\x97\x1a\xfc\x28\x2b\x08\x00\xf9\x08\
-\x00\x20\x00\xac\x38\x00\x35\x6e\x52\x4c\x10\x00\xf2\xf1\x11\x00\
-\x4c\x23\x00\x8c\xed\x23\x00\x81\x9d\x12\x82\x00\x90\x8f\x2f\x01\
-\xc2\x44\x02\xc0\x08\xbf\x04\x98\x02\xbb\x2f\x01\xb2\x4e\x41\x00\
-\xc8\xc7\x9f\x01\xc2\x44\x02\xc0\x48\xff\x0c\x50\x60\x67\x9d\x82\
-\x00\x90\x57\x68\xfb\x57\x94\x1e\x22\xd7\xdd\x6c\x77\x16\x63\x0d\
-\xa6\x10\x00\x16\x67\xbb\xcf\x2c\x7d\x1e\x0f\x58\xa7\xd3\x6f\x14\
-\xd7\x71\xbd\x98\xaf\x20\x00\xe4\x15\x5f\x64\x6f\x1a\xc1\xf0\xb8\
-\xfe\x86\xbb\x15\x30\x03\x9b\x42\x00\x48\x75\xba\xf1\xe7\xfc\xfb\
-\xd2\xe7\xf1\x80\xb3\x2a\xb0\x33\xa8\x20\x00\xe4\xb5\xd8\xee\xfe\
-\x63\xe9\xc1\x71\xb8\xe1\xa2\x0c\x88\x61\x4c\x21\x00\x24\xf1\xbf\
-\xfb\xbd\xd2\xe7\xf0\xc0\xd5\x76\xef\x8c\xfb\xf9\x63\xf7\xdc\x73\
-\xcf\x07\x0c\x7d\xdd\x98\x9f\x20\x00\xe4\x35\xaa\x3f\x05\x3c\x68\
-\xf3\xd5\x01\x33\x80\xa9\x04\x80\x18\x82\x7f\xa1\xf4\x19\x5c\x61\
-\xa9\x03\x26\xbb\x20\x00\xe4\x17\x53\xfb\xeb\x46\x30\x30\x0e\x77\
-\x01\xda\xee\x3d\x31\x08\x3c\x3b\xb5\xa3\x95\xde\x37\xea\x30\x95\
-\x00\xb0\xb1\xdc\xf9\x92\xd2\xe7\x6f\xb5\xb3\x2a\xb0\x93\x57\x10\
-\x00\xf2\x8b\x07\xf5\x97\x4a\x0f\x8b\x95\x57\xdb\xdf\x7e\xaa\xbd\
-\xf8\xb0\xd2\x7b\xc7\xf4\x4d\x25\x00\xec\xfd\xd5\x4e\xdb\xbd\xb9\
-\xf8\xd9\x5b\x69\x75\xef\x8e\x67\xf5\xe7\xd2\x77\x18\x86\xbe\x8e\
-\xd4\x2f\x08\x00\xf9\xc5\x07\xf5\x98\xf2\x83\xe2\x08\x17\x23\x0e\
-\xc3\x18\x5e\x9e\x5c\x7a\xff\x98\xb6\xa9\x04\x80\xbd\x9f\xb5\xed\
-\xfe\x7b\xe9\x73\x77\xa4\x15\x03\xfb\xc6\xf6\xcb\x3e\x69\xc8\xeb\
-\x48\xfd\x82\x00\x30\x8c\xc5\xb2\xbb\x50\x7c\x48\x1c\xfd\xa2\x3c\
-\xa7\x6d\xdb\x07\x94\xde\x43\xa6\x69\x4a\x01\xe0\xe4\x66\xf7\xf0\
-\xf8\xf3\xbe\xab\xf4\x99\x3b\xd2\x39\x6d\xbb\xb7\x54\x3b\x40\x59\
-\x8b\x20\x00\x0c\xa3\x69\xbb\x6f\x29\x3d\x20\x8e\xb5\xda\xee\xe5\
-\x27\x6f\xdd\x7d\x74\xe9\x7d\x64\x7a\xa6\x14\x00\x92\xf8\xdf\x9f\
-\x2e\x7e\xde\x8e\x37\x44\x05\x76\x8e\x24\x08\x00\xc3\x48\x7f\x67\
-\x1f\x1f\xe0\xef\x96\x1e\x0e\xc7\xbc\x38\x9a\xca\x58\xd9\xd4\x02\
-\x40\xb3\xb9\xf3\xb9\x53\xfd\x2d\xc0\x7b\x97\xc0\xce\x11\x04\x01\
-\x60\x38\xe9\x26\x1e\xe9\x5b\xf6\xc5\x87\xc3\x71\x2f\x52\xdb\xdf\
-\xa4\xa8\x84\xc3\x9a\x5a\x00\x48\xe2\x0b\xe8\xaf\x95\x3e\x67\x19\
-\x86\xa9\xc0\xce\x4a\x82\x00\x30\xac\xc5\xb2\x5b\x94\x1e\x0c\x79\
-\x96\x66\x41\x0e\x67\x8a\x01\xa0\x69\x6f\x7f\x48\xfc\xdf\xfd\x55\
-\xf9\x73\x96\x61\x69\x16\xe4\x90\x82\x00\x30\xac\x34\x58\x62\x08\
-\x78\x43\xf1\xa1\x90\x67\xb0\xfc\x5d\xb3\xec\x7e\xa8\xf4\x9e\x32\
-\x6e\x53\x0c\x00\xc9\xe4\xbf\xb7\x73\xc5\x5a\xb4\xfd\x1f\xa6\x9b\
-\x92\xe5\xbe\xb6\xd4\x25\x08\x00\xc3\x5b\x6c\x76\x4f\xdc\xbf\x07\
-\x7f\xf9\xc1\x90\xe7\xa2\x75\x2f\x56\x54\xc2\xf5\x4c\x35\x00\x24\
-\xf1\x7f\xfb\xcb\xa5\xcf\x57\xb6\x25\xb0\x73\x80\x20\x00\xac\x47\
-\xb3\xec\x9f\x56\x7c\x20\xe4\xbc\x70\x6d\xf7\xda\x13\x9b\xbb\x8f\
-\x2f\xbd\xaf\x8c\xcf\x94\x03\xc0\xf3\xce\x9f\xff\xd0\xb0\xec\x2e\
-\x96\x3e\x5f\x59\xcf\xaa\x2a\x70\xae\x23\x08\x00\xeb\x13\x1f\xec\
-\x33\x4b\x0f\x83\xac\x17\x4f\xb3\x20\xd7\x30\xe5\x00\x90\xa4\x17\
-\xcb\x30\x85\xa2\xa0\xd5\xce\xaa\x66\x41\xee\x23\x08\x00\xeb\x93\
-\x1a\xbd\x16\xcb\xee\x57\x4a\x0f\x83\x01\xd6\x6d\xcd\xe6\x1d\x0f\
-\x2d\xbd\xbf\x8c\xc3\xd4\x03\x40\x92\x9a\x32\xe3\x8b\xe6\x9d\x23\
-\x38\x5b\xd9\x96\xc0\xce\xd5\x82\x00\xb0\x5e\x29\x04\x84\xb6\x7b\
-\x7a\x0d\x7f\x1e\x78\xd5\x70\x51\x54\xc2\x9e\x1a\x02\x40\x72\xf3\
-\x99\x4b\x0f\x4e\xb7\xdc\x2d\x7d\xb6\x06\x58\x9a\x05\xd9\x13\x04\
-\x80\x32\xe2\x83\xff\xb6\xf8\x82\x79\xf7\x08\x86\x41\xbe\x8b\xa9\
-\x59\x90\xfb\xd5\x13\x00\x92\x74\x87\xbd\xf8\xae\xf9\x05\xa5\xcf\
-\x56\xfe\xb3\x2a\xb0\x23\x00\x14\x75\x62\x6b\xe7\x71\x71\x13\x5e\
-\x53\x7a\x18\x64\x5f\x9a\x05\x67\xad\xa6\x00\x90\xec\xff\xd6\xae\
-\xff\xe1\xf8\x82\xf9\x8e\xe2\x67\x2b\xeb\xd2\x2c\x38\x77\x41\x00\
-\x28\xeb\x96\x5b\x76\x3e\x32\x1e\xc4\x17\x95\x1f\x06\x99\x2f\xac\
-\xa2\x92\xd9\xaa\x2d\x00\x5c\xf1\xb8\x1e\x13\x9f\xd7\x77\x95\x3e\
-\x5b\xf9\x57\x77\xb1\x39\x7b\xf1\x91\x43\xec\x19\xe3\x16\x04\x80\
-\x71\x58\x6c\xf5\xdf\x1d\xda\xee\x6f\xcb\x0f\x83\x8c\x17\xf7\xde\
-\x8f\x04\x14\x95\xcc\x4b\xad\x01\x20\x11\xd8\xa9\x49\x10\x00\xc6\
-\xe3\xe4\x76\xf7\x69\x71\xb8\xbc\xb2\xf4\x30\xc8\xbe\x14\x95\xcc\
-\x4a\xcd\x01\xe0\xbd\x8f\xb1\xc2\xc0\x9e\x96\x66\xc1\x79\x09\x02\
-\xc0\xb8\xa4\x1b\x91\xa4\x77\xcd\xa5\x07\xc1\x00\x17\xfa\x6d\xf1\
-\x71\x7d\x67\xe9\xfd\x65\x78\x73\x08\x00\x89\xc0\xce\xd4\x05\x01\
-\x60\x9c\x36\x96\xbb\xdf\x14\x6a\x29\x27\xb9\xf2\x82\x6b\x16\xac\
-\xde\x5c\x02\x40\x52\x73\x60\xd7\x2c\x58\xbf\x20\x00\x8c\xd7\xc9\
-\xcd\xee\xe1\xa1\xed\xbb\xd2\xc3\x20\xfb\x45\x6f\xfb\x3b\x15\x95\
-\xd4\x6b\x4e\x01\xe0\xb2\xa6\xed\xbf\x31\x54\x1a\xd8\x9b\xf3\xe7\
-\x3f\x62\xdd\xfb\xc9\x7a\x04\x01\x60\xdc\xd2\x9f\xe8\xa4\xbb\x77\
-\xed\xfd\xc9\xce\x08\x06\x42\xb6\xa5\xa8\xa4\x5a\x73\x0c\x00\x49\
-\xc5\x81\x5d\xb3\x60\xa5\x82\x00\x30\x0d\x71\xa3\xbe\x62\xb1\xec\
-\xfe\xbc\xf4\x30\xc8\xff\x04\xd0\x2c\x58\x9b\xb9\x06\x80\x44\x60\
-\x67\x4a\x82\x00\x30\x1d\x27\x6e\xdb\xfd\xf8\xb8\x69\x67\x8b\x0f\
-\x83\xdc\x4f\x82\xb6\x7f\xfd\xc6\x76\xf7\x45\xa5\xf7\x97\x3c\xe6\
-\x1c\x00\xae\xd8\x83\x2a\x03\x7b\x5c\xa7\x05\xf6\x7a\x04\x01\x60\
-\x5a\xd2\x5d\xc9\x52\x12\x0f\x6d\xf7\xce\x11\x0c\x83\x7c\x4f\x04\
-\x45\x25\xd5\x10\x00\xf6\xd5\x1c\xd8\x35\x0b\xd6\x21\x08\x00\xd3\
-\xd4\xb4\xfd\x97\xc6\x77\x18\x6f\x28\x3d\x0c\xb2\xaf\xb6\x3b\xa7\
-\x59\x70\xda\x04\x80\xf7\x11\xd8\x19\xb3\x20\x00\x4c\xd7\xbd\x6d\
-\x65\x2f\x29\x3d\x0c\x06\x18\x2e\x8a\x4a\x26\x4c\x00\xb8\xaf\x45\
-\x7b\xe1\x0b\x62\x08\x78\x5d\xe9\xb3\x35\xc0\xd2\x2c\x38\x61\x41\
-\x00\x98\xb6\xcb\xef\x30\x6a\x2b\x2a\xd1\x2c\x38\x5d\x02\xc0\xb5\
-\xbd\xf8\xdc\x1d\x1f\x2b\xb0\x33\x26\x41\x00\xa8\x43\x73\xf6\xe2\
-\x63\x15\x95\x30\x06\x02\xc0\xf5\x09\xec\x8c\x49\x10\x00\xea\x91\
-\x8a\x4a\xe2\x41\xbc\xb9\xf4\x30\x18\x60\xb8\xbc\x39\x0e\x97\x27\
-\x97\xde\x5f\x0e\x47\x00\x38\x98\xc0\xce\x18\x04\x01\xa0\x3e\x35\
-\x16\x95\x68\x16\x9c\x0e\x01\xe0\x70\x34\x0b\x52\x5a\x10\x00\xea\
-\xa4\xa8\x84\x52\x04\x80\xd5\xd4\x18\xd8\xd3\xd2\x2c\x38\x7e\x41\
-\x00\xa8\x57\xcd\x45\x25\x9a\x05\xc7\x4b\x00\x58\x9d\xc0\x4e\x09\
-\x41\x00\xa8\x9f\x66\x41\xd6\x49\x00\x38\x9a\x9a\x03\xbb\x66\xc1\
-\x71\x0a\x02\xc0\x3c\xa4\xa2\x92\x38\x5c\xfa\xd2\xc3\x20\xfb\x13\
-\x48\xb3\xe0\xe8\x08\x00\xc7\xa3\x59\x90\x75\x09\x02\xc0\x7c\x28\
-\x2a\x61\x1d\x04\x80\xe3\xd3\x2c\xc8\x3a\x04\x01\x60\x7e\x6a\x2d\
-\x2a\xd1\x2c\x38\x0e\x02\x40\x1e\x02\x3b\x43\x0b\x02\xc0\x3c\xd5\
-\x5c\x54\xa2\x59\xb0\x2c\x01\x20\xaf\x5a\x03\x7b\xd0\x2c\x58\x5c\
-\x10\x00\xe6\x2b\x15\x79\x84\xb6\x7b\x7a\xbc\x08\xef\x1a\xc1\x30\
-\xc8\xf7\xa4\x52\x54\x52\x94\x00\x90\x5f\xcd\x81\x5d\xb3\x60\x39\
-\x41\x00\x40\xb3\x20\x39\x09\x00\xc3\xd0\x2c\x48\x6e\x41\x00\x20\
-\xa9\xb9\x59\x70\xa3\xdd\xf9\xaa\xd2\xfb\x3b\x27\x02\xc0\xb0\x34\
-\x0b\x92\x4b\x10\x00\xb8\x4c\x51\x09\x39\x08\x00\xc3\xd3\x2c\x48\
-\x0e\x41\x00\xe0\x6a\x35\x17\x95\x6c\x2c\x77\x1f\x51\x7a\x7f\x6b\
-\x27\x00\xac\x87\xc0\xce\x71\x05\x01\x80\x6b\xa9\xb9\x59\x70\x63\
-\xbb\xfb\xfa\xd2\xfb\x5b\x33\x01\x60\xbd\x6a\x0e\xec\x9a\x05\x87\
-\x15\x04\x00\x6e\xa4\xc6\xa2\x12\xcd\x82\xc3\x12\x00\xd6\x4f\xb3\
-\x20\x47\x11\x04\x00\x0e\x52\x73\x51\x49\xb3\xdd\x3f\xaa\xf4\xfe\
-\xd6\x46\x00\x28\xa7\xc6\xc0\x9e\x96\x66\xc1\x61\x04\x01\x80\xc3\
-\xa8\xb9\xa8\x44\xb3\x60\x5e\x02\x40\x59\x35\x07\x76\xcd\x82\x79\
-\x05\x01\x80\x55\x68\x16\xe4\x20\x02\x40\x79\x35\x07\x76\xcd\x82\
-\xf9\x04\x01\x80\x55\xd5\xdc\x2c\x78\xa2\xdd\xfd\xec\xd2\xfb\x3b\
-\x75\x02\xc0\x78\xd4\x1c\xd8\x35\x0b\x1e\x5f\x10\x00\x38\x0a\x45\
-\x25\x5c\x8f\x00\x30\x2e\x9a\x05\xb9\x9e\x20\x00\x70\x1c\xb5\x16\
-\x95\x68\x16\x3c\x3a\x01\x60\x7c\x04\x76\xae\x25\x08\x00\x1c\x57\
-\xb5\x45\x25\xcb\xfe\x4f\x34\x0b\xae\x4e\x00\x18\x2f\x81\x9d\x2b\
-\x05\x01\x80\x1c\x34\x0b\x72\x99\x00\x30\x6e\xd5\x06\x76\xcd\x82\
-\x2b\x0b\x02\x00\x39\x69\x16\x44\x00\x18\x3f\xcd\x82\x24\x41\x00\
-\x20\xb7\x5a\x9b\x05\xe3\xb0\xfc\x0b\xcd\x82\x07\x13\x00\xa6\x63\
-\xb1\xd9\x3d\xb1\xca\xc0\xae\x59\xf0\x50\x82\x00\xc0\x10\x14\x95\
-\xcc\x97\x00\x30\x2d\xb5\x06\x76\xcd\x82\x07\x0b\x02\x00\x43\xaa\
-\xb7\xa8\xa4\x7f\x69\xf3\x92\xfe\x13\x4b\xef\xef\x18\x09\x00\xd3\
-\x23\xb0\xcf\x53\x10\x00\x18\xda\x0b\xdb\x8b\x1f\x55\x63\xb3\x60\
-\x58\x76\x6f\xd2\x2c\x78\x5f\x02\xc0\x74\xd5\x1b\xd8\x35\x0b\x5e\
-\x4b\x10\x00\x58\x97\x1a\x8b\x4a\x2e\xbf\xc3\x68\x9a\x57\x7d\x48\
-\xe9\xfd\x1d\x0b\x01\x60\xda\x34\x0b\xce\x47\x10\x00\x58\xa7\x8d\
-\xcd\xdd\x4f\xaf\xb1\xa8\x24\x0e\x97\x4b\x9a\x05\xf7\x09\x00\x75\
-\xa8\x31\xb0\xef\x9d\x55\xcd\x82\xef\x15\x04\x00\xd6\xad\xe6\xa2\
-\x12\xcd\x82\x02\x40\x4d\x34\x0b\xd6\x2d\x08\x00\x94\x92\x8a\x4a\
-\xe2\x13\xe0\xaf\x8b\x0f\x83\xdc\x4f\xea\x99\x37\x0b\x0a\x00\x75\
-\xa9\x39\xb0\xcf\xbd\x59\x30\x08\x00\x94\xa4\x59\xb0\x3e\x02\x40\
-\x9d\x6a\x6e\x16\x9c\x6b\x60\x0f\x02\x00\xa5\x29\x2a\xa9\x8b\x00\
-\x50\xaf\x8a\x9b\x05\xef\x9c\x63\xb3\x60\x10\x00\x18\x8b\x66\x7b\
-\xf7\x2b\x6b\x2c\x2a\x09\x6d\x77\x6a\x4e\x45\x25\x02\x40\xdd\x04\
-\xf6\x7a\x04\x01\x80\x31\x49\x45\x25\x8b\xb6\xbb\xb5\xf8\x30\xc8\
-\xff\x44\x9f\x4d\xb3\xa0\x00\x30\x0f\x9a\x05\xa7\x2f\x08\x00\x8c\
-\x4d\xd3\x34\xf7\x4f\xef\x30\x34\x0b\x4e\x93\x00\x30\x1f\x9a\x05\
-\xa7\x2d\x08\x00\x8c\x95\x66\xc1\x69\x12\x00\xe6\x45\xb3\xe0\x74\
-\x05\x01\x80\x31\x4b\x45\x25\xf1\x20\x6e\x96\x1e\x06\xd9\x57\xc5\
-\xcd\x82\x02\xc0\x3c\x69\x16\x9c\x9e\x20\x00\x30\x76\x8a\x4a\xa6\
-\x45\x00\x98\x2f\xcd\x82\xd3\x12\x04\x00\xa6\xe2\xc4\xd6\xce\xe3\
-\x6a\x2c\x2a\x89\x83\xe5\x77\x6a\x6a\x16\x14\x00\xe6\x4d\x60\x9f\
-\x8e\x20\x00\x30\x25\xfb\xcd\x82\xfd\x89\xd2\xc3\x20\xff\xaa\xa7\
-\x59\x50\x00\x20\xd1\x2c\x38\x7e\x41\x00\x60\x8a\x6a\x2c\x2a\xa9\
-\xa5\x59\x50\x00\xe0\x32\xcd\x82\xe3\x16\x04\x00\xa6\x4a\xb3\xe0\
-\x38\x09\x00\x5c\xad\xc6\xc0\xbe\x77\x56\x27\xde\x2c\x18\x04\x00\
-\xa6\xac\xe6\xa2\x92\x18\x02\x9e\x52\x7a\x7f\x8f\x42\x00\xe0\x5a\
-\x34\x0b\x8e\x4f\x10\x00\xa8\xc1\x62\x7b\xe7\x9b\x35\x0b\x8e\x83\
-\x00\xc0\xf5\xd4\x1c\xd8\xa7\xd8\x2c\x18\x04\x00\x6a\xa1\x59\x70\
-\x1c\x04\x00\x0e\xa2\x59\x70\x1c\x82\x00\x40\x4d\x14\x95\x94\x27\
-\x00\x70\x18\x9a\x05\xcb\x0b\x02\x00\x35\x4a\xcd\x82\xe9\x6e\x7b\
-\xa5\x87\x41\xf6\x35\x81\x66\x41\x01\x80\xc3\x12\xd8\xcb\x0a\x02\
-\x00\xb5\xaa\xb9\x59\xb0\x59\xee\x7c\x61\xe9\xfd\xbd\x1e\x01\x80\
-\x55\x69\x16\x2c\x23\x08\x00\xd4\x4c\xb3\xe0\xfa\x09\x00\x1c\x85\
-\x66\xc1\xf5\x0b\x02\x00\x73\xa0\x59\x70\x7d\x04\x00\x8e\x4a\xb3\
-\xe0\x7a\x05\x01\x80\xb9\xd0\x2c\xb8\x1e\x02\x00\xc7\xa5\x59\x70\
-\x3d\x82\x00\xc0\x9c\xd4\x5a\x54\x92\xbe\x44\x15\x0f\xd3\x33\xd3\
-\x47\x1e\xa5\xf7\x58\x00\x20\x07\xcd\x82\xc3\x0b\x02\x00\x73\xa4\
-\x59\x70\x38\x02\x00\xb9\xd4\x1a\xd8\xc7\xd2\x2c\x18\x04\x00\xe6\
-\x4a\xb3\xe0\x30\x04\x00\x72\xd3\x2c\x38\x8c\x20\x00\x30\x77\x35\
-\x16\x95\x94\x6c\x16\x14\x00\x18\x82\x66\xc1\xfc\x82\x00\x00\xfb\
-\xcd\x82\x8b\x65\xf7\xfb\xa5\x87\xc1\x00\xc3\x65\xed\xcd\x82\x02\
-\x00\x43\xaa\x31\xb0\xef\x9d\xd5\x02\xcd\x82\x41\x00\x80\x7d\x35\
-\x17\x95\xac\xb3\x59\x50\x00\x60\x68\x9a\x05\xf3\x08\x02\x00\xbc\
-\x3f\xcd\x82\xc7\xdc\x3f\x01\x80\x35\xa8\x39\xb0\xaf\xab\x59\x30\
-\x08\x00\x70\x5f\x7b\x45\x25\xcb\x7e\xb7\xf4\x30\xc8\x7e\xe0\xd6\
-\xd0\x2c\x28\x00\xb0\x4e\x9a\x05\x8f\x2e\x08\x00\x70\x6d\x8a\x4a\
-\x8e\x46\x00\x60\xdd\x34\x0b\x1e\x4d\x10\x00\xe0\xc6\x34\x0b\xae\
-\x46\x00\xa0\x04\x81\x7d\x75\x41\x00\x80\x83\x9d\x6a\x2f\x3e\x2c\
-\x3e\x61\x5f\x5a\x7c\x18\xe4\x3f\x80\xd9\x9b\x05\x05\x00\x4a\xd2\
-\x2c\x78\x78\x41\x00\x80\xc3\xd1\x2c\x78\x38\x02\x00\xa5\x69\x16\
-\x3c\x9c\x20\x00\xc0\x6a\x36\x96\xbb\x5f\x56\x65\x51\x49\xa6\x66\
-\x41\x01\x80\x31\xd0\x2c\x78\xb0\x20\x00\xc0\xea\x6a\x6e\x16\x4c\
-\xdf\x79\x38\xce\xde\x08\x00\x8c\x89\x66\xc1\xeb\x0b\x02\x00\x1c\
-\x4d\xad\x45\x25\xc7\x6d\x16\x14\x00\x18\x1b\xcd\x82\xd7\x16\x04\
-\x00\x38\x9e\xd4\x2c\x18\x9f\xcc\xaf\x29\x3d\x0c\xf2\x1f\xce\xa3\
-\x35\x0b\x0a\x00\x8c\x51\xad\x81\xfd\x38\xcd\x82\x41\x00\x80\xe3\
-\xab\xb9\x59\x30\x0e\xcd\x27\xad\xb2\x17\x02\x00\x63\xa6\x59\xf0\
-\x7d\x82\x00\x00\xf9\xa4\xa2\x92\xf8\x0e\xe3\xed\xe5\x87\x41\xc6\
-\x43\xba\x62\xb3\xa0\x00\xc0\xd8\x69\x16\xdc\x17\x04\x00\xc8\x6b\
-\xee\xcd\x82\x02\x00\x53\x31\xf7\x66\xc1\x20\x00\x40\x7e\xb5\x16\
-\x95\xc4\x77\x4d\x6f\x3d\xa8\x59\x50\x00\x60\x4a\xe6\xdc\x2c\x18\
-\x04\x00\x18\xce\x1c\x9b\x05\x05\x00\xa6\xa6\xd6\xc0\x7e\x50\xb3\
-\x60\x10\x00\x60\x58\x1b\xcb\xdd\x47\x84\x0a\x9b\x05\xe3\xbb\xa6\
-\x57\x5f\xab\x59\x50\x00\x60\xaa\xe6\xd6\x2c\x18\x04\x00\x18\xde\
-\x9c\x8a\x4a\x04\x00\xa6\x6c\x4e\xcd\x82\x41\x00\x80\xf5\xa9\xb9\
-\x59\xf0\xf4\xe9\xf3\x0f\x4a\x8f\x51\x00\x60\xea\xe6\x12\xd8\x83\
-\x00\x00\xeb\x55\x7b\xb3\xa0\x00\x40\x2d\x6a\x6f\x16\x0c\x02\x00\
-\xac\x5f\xba\xcd\xee\xa2\xed\x7f\xb6\xba\x66\xc1\xfd\xbb\xac\x6d\
-\x15\xfe\x39\x04\x00\xb2\x49\x77\xc3\x0c\x6d\x77\xbe\x50\xc7\x0b\
-\xd6\x00\x00\x05\x93\x49\x44\x41\x54\xf4\xd9\xca\x7e\x56\xdb\xee\
-\xb5\xa1\xed\x5f\x51\x76\x5e\x08\x00\xcc\x58\xb5\xcd\x82\x65\x97\
-\x00\x40\x56\xb5\x36\x0b\x96\x5e\x02\x00\xb3\x57\x6d\xb3\x60\xb9\
-\x25\x00\x30\x88\xa6\xed\xbf\x54\x60\xcf\xb7\x04\x00\xb8\xdf\xe5\
-\x77\x18\xfd\xd3\xbc\xc3\xc8\xb2\x04\x00\x06\x23\xb0\xe7\x5b\x02\
-\x00\x5c\xe1\xc4\xe6\xee\xe3\xf7\x3e\x9b\x1b\xc1\xe1\x9c\xf0\x12\
-\x00\x18\xd4\x7e\x60\xdf\xfd\x91\xda\x9a\x05\xd7\xbd\x04\x00\xb8\
-\x4a\x73\xee\xd2\x47\xc7\x83\xf1\x1b\xa5\x0f\xe7\x84\x97\x00\xc0\
-\x5a\xd4\x5a\x05\xbe\xae\x25\x00\xc0\x75\xc4\x03\xf2\xd4\xf8\x0e\
-\xe3\xee\xd2\x87\x74\x82\x4b\x00\x60\x6d\x52\x15\x78\x7c\xce\x6d\
-\x8c\xe0\x79\x3f\xb9\x25\x00\xc0\x0d\xd4\xda\x2c\x38\xec\x50\xe9\
-\x9e\x5f\xfa\xba\x31\x3f\xb5\x36\x0b\x0e\xb9\x9a\x65\xf7\xa4\xd2\
-\xd7\x0d\x46\xad\x69\xfa\x0f\xab\xb1\xa8\x64\xa8\x15\x03\xc0\xff\
-\x28\x7d\xcd\x98\xa7\x6a\x9b\x05\x07\x5a\xe9\xc6\x61\xa5\xaf\x19\
-\x4c\x42\xad\xcd\x82\xf9\x57\xf7\x93\xa5\xaf\x15\xf3\x55\x6b\xb3\
-\xe0\x10\x2b\x06\x80\x4f\x2d\x7d\xbd\x60\x32\xea\x6d\x16\xcc\xb7\
-\x16\x6d\xf7\x03\xa5\xaf\x13\xd4\xda\x2c\x98\x73\xa5\x3f\xa9\x2c\
-\x7d\x9d\x60\x52\x9e\x73\xe9\xd2\x07\x57\x59\x54\x92\x69\x2d\x96\
-\xdd\x57\x97\xbe\x46\x90\xd4\xda\x2c\x98\xe5\x9c\xb6\xdd\x5b\x9e\
-\xf1\x8c\x7b\x3e\xb0\xf4\x35\x82\x49\x5a\xb4\xfd\x93\xe3\x21\x7a\
-\x73\xe9\x83\x3c\xa6\x15\xf7\xe3\x3d\x2f\x3e\x77\xc7\xc7\x96\xbe\
-\x36\x70\x59\xb5\xcd\x82\xc7\x3f\xab\xb7\x96\xbe\x36\x30\x69\xb5\
-\x36\x0b\x1e\x7d\x75\x7f\x54\xfa\x9a\xc0\xb5\xd4\xda\x2c\x78\xe4\
-\xd5\xf6\x3f\x57\xfa\x9a\xc0\xe4\xed\xbd\xc3\x88\x87\xc9\x3b\x8c\
-\xb4\xba\x17\x95\xbe\x1e\x70\x3d\xb5\x36\x0b\x1e\x65\x35\xcb\xdd\
-\x6f\x28\x7d\x3d\xa0\x1a\xa9\x59\x30\x06\x81\x37\x96\x3e\xd8\x25\
-\xd7\xa2\xed\xfe\x55\xe9\xeb\x00\x37\xa2\x59\x70\xef\x7b\x3a\x6f\
-\xbf\xe5\x96\x9d\x8f\x2c\x7d\x2d\xa0\x2a\xe9\x5b\xb5\xf1\x80\x6d\
-\x95\x3e\xe0\x65\x56\xf7\xd6\x33\x67\x2e\x3d\xb0\xf4\x35\x80\xc3\
-\x98\x73\xb3\x60\x0c\xea\x37\x97\xde\x7f\xa8\xd2\x5c\x9b\x05\xe3\
-\x50\x79\x5e\xe9\xbd\x87\x55\xcc\xb5\x59\x70\xd1\xee\x7c\x5d\xe9\
-\xbd\x87\xaa\xa5\x66\xc1\x18\x02\x5e\x57\xfa\xb0\xaf\x6b\xa5\x8f\
-\x40\x4a\xef\x39\xac\x6a\x76\xcd\x82\x6d\xff\xc6\xf4\xbd\xa5\xd2\
-\xfb\x0e\xd5\x9b\x4b\x51\x49\x1c\x9e\x17\x4a\xef\x35\x1c\x47\x73\
-\xf6\xe2\x63\x17\x6d\x77\x57\xe9\xb3\x34\xfc\xea\x7e\xb0\xf4\x5e\
-\xc3\xac\xa4\xa2\x92\xf4\xc5\x9b\xf2\x87\x7f\x98\x95\x3e\x4f\x2d\
-\xbd\xc7\x70\x5c\xe9\x8b\x71\xe9\xf3\xf1\xd2\xe7\x69\xa8\xb5\x58\
-\xf6\x7f\xd2\xb6\xed\x03\x4a\xef\x33\xcc\x4e\xad\xcd\x82\xe9\x33\
-\xd4\xd2\x7b\x0b\x39\x55\xdb\x2c\xd8\xf6\xdf\x53\x7a\x6f\x61\xb6\
-\x6e\x3a\xfb\x8a\x0f\x8f\x87\xf0\xb9\xc5\x07\x41\xb6\x81\xd2\xfd\
-\xad\x42\x11\x6a\x74\x62\x79\xe1\x33\x62\xb8\x7d\x55\xf1\x33\x96\
-\x69\xa5\x8f\xe9\x9a\xa6\xb9\x7f\xe9\x7d\x85\xd9\xab\xa6\x59\x70\
-\x6b\xe7\x7b\x4b\xef\x25\x0c\xa5\x96\x66\xc1\x74\xdf\xff\x54\x64\
-\x56\x7a\x3f\x81\x7b\x4d\xbd\x59\x30\xbe\xa3\x78\x71\xe9\x3d\x84\
-\x75\x98\x7a\xb3\x60\xb3\xdd\x3f\xa5\xf4\x1e\x02\x57\x49\x5f\xc8\
-\x89\xef\x30\x9e\x95\x4a\x74\x4a\x0f\x89\x15\x5f\xfc\xff\x20\x0e\
-\x95\x8f\x29\xbd\x7f\xb0\x2e\x27\x37\x2f\x7c\x4a\x7c\xee\xbf\xac\
-\xf4\xd9\x5b\xf9\xac\xb6\xfd\xb3\x4b\xef\x1d\x70\x03\x53\x6a\x16\
-\x8c\x3f\xeb\xeb\x9b\x73\x17\x3e\xb9\xf4\x9e\xc1\xba\x4d\xad\x59\
-\x70\xb1\xec\x5f\xa8\xf2\x17\x26\x60\xaf\x59\xb0\xed\x6f\x2f\x3d\
-\x34\x6e\xb8\xda\xfe\x8d\xe9\x9d\x50\xe9\xbd\x82\x92\x26\xd1\x2c\
-\xd8\xf6\xb7\xb8\xe1\x0f\x4c\xc8\x98\x9b\x05\xef\xfd\xb5\xff\xa3\
-\x4a\xef\x11\x8c\xc1\xa8\x9b\x05\xdb\xfe\xb9\xfe\xde\x1f\x26\x6a\
-\x6c\xcd\x82\xe9\x6f\xfd\x9b\x73\x97\x3e\xba\xf4\xbe\xc0\x98\x8c\
-\xad\x59\x30\x9e\xd3\x7f\x88\x3f\xcb\xd3\x4b\xef\x0b\x70\x4c\x4d\
-\x7b\xfb\x43\xe2\x81\x3e\x51\x74\xa0\xec\xdd\x1f\xbd\xfb\xc9\x34\
-\xe8\x4a\xef\x07\x8c\xd5\x62\xab\xff\xe2\x78\x4e\x5e\x5d\x34\x00\
-\xb4\xdd\x9f\xea\xe3\x80\xca\x6c\x6c\xed\x7e\x6d\x91\x52\xa1\xb6\
-\xff\xed\x74\x33\x94\xd2\x8f\x1f\xa6\xe0\x39\x97\x2e\x7d\x70\x7a\
-\xf7\xbd\x58\xf6\x7f\xbf\xe6\x17\xfe\x77\xa6\x6f\xfa\xa7\xdb\x18\
-\x97\xde\x03\x60\x00\xe9\x0e\x82\x4d\xdb\xff\x54\x3c\xe8\x7f\x39\
-\xf8\xbb\xfe\xb6\xbb\x2b\x0e\xb1\x6f\x2d\xfd\x98\x61\x8a\x4e\x6e\
-\x77\x9f\xb6\xd7\x27\x30\xf0\xc7\x02\xe9\x4f\x87\xd3\x47\x73\xe9\
-\xff\x5f\xe9\xc7\x0c\xac\xc1\xde\x7d\x03\xf6\x8b\x85\xfe\x20\xef\
-\x40\xe9\xde\x1d\x07\xd6\xb9\xf4\xc2\xef\x76\xa1\x70\x7c\xcd\xe6\
-\x1d\x0f\xdd\xff\x93\xc1\xdc\x37\x10\xea\xde\x1a\xcf\xe9\x73\xfc\
-\x76\x0e\x66\x6a\xef\xcb\x47\x67\x2f\x3e\x36\xfd\x56\x20\xec\xdd\
-\x9c\x64\xf5\xbf\x1a\x88\xef\x1e\xfe\x26\xbd\x83\x08\x6d\xff\xc3\
-\xf1\xff\xd6\x23\x4b\x3f\x26\xa8\xd1\x99\x33\x97\x1e\x98\xee\xf3\
-\x11\x03\xf6\xaf\xa5\xcf\xe9\x8f\xf6\x6e\xbf\x7f\x7d\x7c\xd1\xff\
-\x3f\xf1\x9c\x7f\x47\xfa\x6d\x60\xe9\xc7\x04\x8c\xc8\xcd\x67\x2e\
-\x3d\x78\xb1\xbd\xf3\xe5\x71\x58\x3c\x35\x0e\x89\x5f\x8c\x2f\xea\
-\x2f\x49\xef\xe8\xdf\xbb\x96\xfd\xd9\xf8\xef\x5f\xb0\x58\x76\x3f\
-\x13\x43\xc3\xbf\x6d\xda\xdd\x27\xa4\xcf\x2c\x4b\xff\xdc\x30\x37\
-\x27\x6f\xdd\x7d\x74\xb3\xdc\xfd\x86\x66\xd9\x3f\x2d\x9e\xc7\xff\
-\xbd\x77\x36\xaf\x38\xab\x29\x94\xc7\x7f\xff\x2b\x4d\xdb\xfd\x78\
-\xba\x85\x6f\xfa\xef\x4b\xff\xcc\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x90\xc9\xff\x07\x81\x4d\x43\x75\xfb\xaa\x1b\x3b\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x1c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x07\xce\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x41\x6e\x1b\x47\x1a\x86\x61\xe5\x38\xd9\xe5\x76\x46\x0e\x90\
-\x99\x45\xe2\x99\x8d\x56\xb9\x40\xa4\xac\x0d\xe9\x02\x21\x73\x01\
-\xc3\x77\x30\x7c\x04\xc3\x50\x58\x94\xca\xb1\x64\x51\x6a\x92\xd5\
-\x55\x7f\x55\x3d\x0f\xc0\x9d\xba\x05\x09\x78\x3f\x51\xec\x06\x79\
-\x71\xf1\x8d\x3f\xdf\xfd\xf5\xd3\xd5\xed\xf6\xf7\xeb\xdb\xcd\x87\
-\xdd\xe3\xd3\xd5\xcd\xf6\xfd\xee\x71\xf9\xc7\xbb\xbf\x7f\xbc\x00\
-\xba\x91\x9a\x4d\xed\xa6\x86\x53\xcb\xa9\xe9\xd4\x76\x6a\xfc\xbb\
-\x2f\xbe\xbb\xbb\xfb\xe1\xea\x66\xf3\xcb\xee\x8b\xbe\x5c\xdf\x6e\
-\xef\x9e\x3e\x76\x27\xf9\xbc\x3b\xf8\xe7\x06\x3f\x07\x70\xa4\xeb\
-\x9b\xcd\x9b\xd4\xec\x73\x2d\xa7\xc6\x53\xeb\xa9\xf9\x6f\x0f\xf8\
-\xcf\xf3\x5f\xfc\x74\x08\x36\x6f\x1b\xfe\x5c\xc0\x2b\xae\x6f\xb6\
-\xbf\x2d\x69\x39\x35\xbf\x3f\x20\x3d\x25\x38\xf4\x97\xdf\x08\x40\
-\x3f\x52\x9b\x4b\x3b\x4e\xcd\xef\xff\x1d\xb8\xff\x9f\x7f\xe9\x41\
-\x46\x00\x22\x3a\x2e\xfe\x87\x8e\x77\xed\x5f\xdc\xbf\xe0\x77\xdc\
-\x81\x46\x00\xe2\x38\x25\xfe\x87\x67\x01\x1f\x76\x07\x6f\x3f\x9e\
-\x76\xb0\x11\x80\xd6\x4e\x8f\x7f\xff\xe2\xfe\xc7\x8b\xfb\xcb\x04\
-\xa7\x9d\xc0\x08\x40\x3b\xe7\xc4\xff\x30\x00\xef\xd3\x00\x5c\x9e\
-\x73\x12\x23\x00\xf5\x9d\x1b\xff\xc3\x00\x5c\xe6\x1b\x06\x0e\x5c\
-\x33\x34\x02\x10\x4d\xa1\xf8\x3f\x7f\xbd\xc1\x2f\xdd\xe4\x73\xee\
-\x09\x8d\x00\xac\xaf\x44\xfc\xfb\xc7\xcd\xe6\xcd\x2a\x27\x36\x02\
-\xb0\x8e\x62\x8d\xde\x6e\x7f\x7d\xf6\x1b\x2c\xbd\x23\xf0\xf5\xc7\
-\xe6\xff\x95\x7f\x37\x30\xb4\x5d\xb4\xff\x2d\x13\xff\xe6\x7f\x2f\
-\x7e\x23\x23\x00\xb1\x54\x8b\x3f\x33\x02\x10\x43\xf5\xf8\x33\x23\
-\x00\x6d\x35\x8b\x3f\x33\x02\xd0\x46\xf3\xf8\x33\x23\x00\x75\x85\
-\x89\x3f\x33\x02\x50\x47\xb8\xf8\x33\x23\x00\xeb\x0a\x1b\x7f\x66\
-\x04\x60\x1d\xe1\xe3\xcf\x8c\x00\x94\xd5\x4d\xfc\x99\x11\x80\x32\
-\xba\x8b\x3f\x33\x02\x70\x9e\x6e\xe3\xcf\x8c\x00\x9c\xa6\xfb\xf8\
-\x33\x23\x00\xc7\x19\x26\xfe\xcc\x08\xc0\x32\xc3\xc5\x9f\x19\x01\
-\x78\xd9\xb0\xf1\x67\x46\x00\x9e\x37\x7c\xfc\x99\x11\x80\xc7\xa6\
-\x89\x3f\x33\x02\x70\x6f\xba\xf8\x33\x23\xc0\xec\xa6\x8d\x3f\x33\
-\x02\xcc\x6a\xfa\xf8\x33\x23\xc0\x6c\xc4\xff\x84\x11\x60\x16\xe2\
-\x3f\xc0\x08\x30\x3a\xf1\xbf\xc2\x08\x30\x2a\xf1\x2f\x64\x04\x18\
-\x8d\xf8\x8f\x64\x04\x18\x85\xf8\x4f\x64\x04\xe8\x9d\xf8\xcf\x64\
-\x04\xe8\x95\xf8\x0b\x31\x02\xf4\x46\xfc\x85\x19\x01\x7a\x21\xfe\
-\x95\x18\x01\xa2\x13\xff\xca\x8c\x00\x51\x89\xbf\x12\x23\x40\x34\
-\xe2\xaf\xcc\x08\x10\x85\xf8\x1b\x31\x02\xb4\x26\xfe\xc6\x8c\x00\
-\xad\x88\x3f\x08\x23\x40\x6d\xe2\x0f\xc6\x08\x50\x8b\xf8\x83\x32\
-\x02\xac\x4d\xfc\xc1\x19\x01\xd6\x22\xfe\x4e\x18\x01\x4a\x13\x7f\
-\x67\x8c\x00\xa5\x88\xbf\x53\x46\x80\x73\x89\xbf\x73\x46\x80\x53\
-\x89\x7f\x10\x46\x80\x63\x89\x7f\x30\x46\x80\xa5\xc4\x3f\x28\x23\
-\xc0\x6b\xc4\x3f\x38\x23\xc0\x21\xe2\x9f\x84\x11\xe0\x29\xf1\x4f\
-\xc6\x08\x90\x89\x7f\x52\x46\x00\xf1\x4f\xce\x08\xcc\x4b\xfc\xec\
-\x19\x81\xf9\x88\x9f\x47\x8c\xc0\x3c\xc4\xcf\xb3\x8c\xc0\xf8\xc4\
-\xcf\x8b\x8c\xc0\xb8\xc4\xcf\x22\x46\x60\x3c\xe2\xe7\x28\x46\x60\
-\x1c\xe2\xe7\x24\x46\xa0\x7f\xe2\xe7\x2c\x46\xa0\x5f\xe2\xa7\x08\
-\x23\xd0\x1f\xf1\x53\x94\x11\xe8\x87\xf8\x59\x85\x11\x88\x4f\xfc\
-\xac\xca\x08\xc4\x25\x7e\xaa\x30\x02\xf1\x88\x9f\xaa\x8c\x40\x1c\
-\xe2\xa7\x09\x23\xd0\x9e\xf8\x69\xca\x08\xb4\x23\x7e\x42\x30\x02\
-\xf5\x89\x9f\x50\x8c\x40\x3d\xe2\x27\x24\x23\xb0\x3e\xf1\x13\x9a\
-\x11\x58\x8f\xf8\xe9\x82\x11\x28\x4f\xfc\x74\xc5\x08\x94\x23\x7e\
-\xba\x64\x04\xce\x27\x7e\xba\x66\x04\x4e\x27\x7e\x86\x60\x04\x8e\
-\x27\x7e\x86\x62\x04\x96\x13\x3f\x43\x32\x02\xaf\x13\x3f\x43\x33\
-\x02\x87\x89\x9f\x29\x18\x81\xef\x89\x9f\xa9\x18\x81\x7f\x89\x9f\
-\x29\x19\x01\xf1\x33\xb9\x99\x47\x40\xfc\x70\x31\xe7\x08\x88\x1f\
-\xbe\x31\xd3\x08\x88\x1f\x9e\x31\xc3\x08\x88\x1f\x5e\x30\xf2\x08\
-\x88\x1f\x16\x18\x71\x04\xc4\x0f\x47\x18\x69\x04\xc4\x0f\x27\x18\
-\x61\x04\xc4\x0f\x67\xe8\x79\x04\xc4\x0f\x05\xf4\x38\x02\xe2\x87\
-\x82\x7a\x1a\x01\xf1\xc3\x0a\x7a\x18\x01\xf1\xc3\x8a\x22\x8f\x80\
-\xf8\xa1\x82\x88\x23\x20\x7e\xa8\x28\xd2\x08\x88\x1f\x1a\x88\x30\
-\x02\xe2\x87\x86\x5a\x8e\x80\xf8\x21\x80\x16\x23\x20\x7e\x08\xa4\
-\xe6\x08\x88\x1f\x02\xaa\x31\x02\xe2\x87\xc0\xd6\x1c\x01\xf1\x43\
-\x07\xd6\x18\x01\xf1\x43\x47\xae\x6e\x36\x6f\x8b\x04\xbb\x3b\x4f\
-\xc9\x73\xb5\xfe\xbd\xc0\x34\xca\x3d\x13\xf0\x97\x1f\xba\x14\x61\
-\x04\xc4\x0f\x0d\xb5\x1c\x01\xf1\x43\x00\x2d\x46\x40\xfc\x10\x48\
-\xcd\x11\x10\x3f\x04\x54\x63\x04\xc4\x0f\x81\xad\x39\x02\xe2\x87\
-\x0e\xac\x31\x02\xe2\x87\x8e\x94\xba\xc1\x67\x1f\xbf\x9b\x7c\xa0\
-\x2f\xa5\x6e\xef\xbd\x7f\xb4\xff\x04\x22\x60\xa1\xb2\xf1\x1b\x01\
-\xe8\xc6\x3a\xf1\x1b\x01\x08\x6f\xdd\xf8\x8d\x00\x84\x55\x27\x7e\
-\x23\x00\xe1\xd4\x8d\xdf\x08\x40\x18\x6d\xe2\x37\x02\xd0\x5c\xdb\
-\xf8\x8d\x00\x34\x13\x23\x7e\x23\x00\xd5\x79\x4b\x30\x98\xd4\x1a\
-\x6f\xe0\x19\xe1\x63\xc8\x80\x57\xac\xf9\xee\xbd\x46\x00\x02\xab\
-\xf1\xd6\xdd\x46\x00\x02\xaa\xf9\xbe\xfd\x46\x00\x02\x69\xf1\xa1\
-\x1d\x46\x00\x02\x68\xf9\x89\x3d\x46\x00\x1a\x8a\xf0\x71\x5d\x46\
-\x00\x1a\x88\x10\x7f\x66\x04\xa0\xa2\x48\xf1\x67\x46\x00\x2a\x88\
-\x18\x7f\x66\x04\x60\x45\x91\xe3\xcf\x8c\x00\xac\xa0\x87\xf8\x33\
-\x23\x00\x05\xf5\x14\x7f\x66\x04\xa0\x80\x1e\xe3\xcf\x8c\x00\x9c\
-\xa1\xe7\xf8\x33\x23\x00\x27\x18\x21\xfe\xcc\x08\xc0\x11\x46\x8a\
-\x3f\x33\x02\xb0\xc0\x88\xf1\x67\x46\x00\x5e\x30\x72\xfc\x99\x11\
-\x80\x67\xcc\x10\x7f\x66\x04\xe0\x1b\x33\xc5\x9f\x19\x01\xb8\x98\
-\x33\xfe\xcc\x08\x30\xb5\x99\xe3\xcf\x8c\x00\x53\x12\xff\xbf\x8c\
-\x00\x53\x11\xff\xf7\x8c\x00\x53\x10\xff\x61\x46\x80\xa1\x89\xff\
-\x75\x46\x80\x21\x89\x7f\x39\x23\xc0\x50\xc4\x7f\x3c\x23\xc0\x10\
-\xc4\x7f\x3a\x23\x40\xd7\xc4\x7f\x3e\x23\x40\x97\xc4\x5f\x8e\x11\
-\xa0\x2b\xe2\x2f\xcf\x08\xd0\x05\xf1\xaf\xc7\x08\x10\x9a\xf8\xd7\
-\x67\x04\x08\x49\xfc\xf5\x18\x01\x42\x11\x7f\x7d\x46\x80\x10\xc4\
-\xdf\x8e\x11\xa0\x29\xf1\xb7\x67\x04\x68\x42\xfc\x71\x18\x01\xaa\
-\x12\x7f\x3c\x46\x80\x2a\xc4\x1f\x97\x11\x60\x55\xe2\x8f\xcf\x08\
-\xb0\x0a\xf1\xf7\xc3\x08\x50\x94\xf8\xfb\x63\x04\x28\x42\xfc\xfd\
-\x32\x02\x9c\x45\xfc\xfd\x33\x02\x9c\x44\xfc\xe3\x30\x02\x1c\x45\
-\xfc\xe3\x31\x02\x2c\x22\xfe\x71\x19\x01\x5e\x24\xfe\xf1\x19\x01\
-\x9e\x25\xfe\x79\x18\x01\x1e\x11\xff\x7c\x8c\x00\x7b\xe2\x9f\x97\
-\x11\x98\x9c\xf8\x31\x02\x93\x12\x3f\x99\x11\x98\x8c\xf8\x79\xca\
-\x08\x4c\x42\xfc\x1c\x62\x04\x06\x27\x7e\x5e\x63\x04\x06\x25\x7e\
-\x96\x32\x02\x83\x11\x3f\xc7\x32\x02\x83\x10\x3f\xa7\x32\x02\x9d\
-\x13\x3f\xe7\x32\x02\x9d\x12\x3f\xa5\x18\x81\xce\x88\x9f\xd2\x8c\
-\x40\x27\xc4\xcf\x5a\x8c\x40\x70\xe2\x67\x6d\x46\x20\x28\xf1\x53\
-\x8b\x11\x08\x46\xfc\xd4\x66\x04\x82\x10\x3f\xad\x18\x81\xc6\xc4\
-\x4f\x6b\x46\xa0\x11\xf1\x13\x85\x11\xa8\x4c\xfc\x44\x63\x04\x2a\
-\x11\x3f\x51\x19\x81\x95\x89\x9f\xe8\x8c\xc0\x4a\xc4\x4f\x2f\x8c\
-\x40\x61\xe2\xa7\x37\x46\xa0\x10\xf1\xd3\x2b\x23\x70\x26\xf1\xd3\
-\x3b\x23\x70\x22\xf1\x33\x0a\x23\x70\x24\xf1\x33\x1a\x23\xb0\x90\
-\xf8\x19\x95\x11\x78\x85\xf8\x19\x9d\x11\x38\x40\xfc\xcc\xc2\x08\
-\x3c\x21\x7e\x66\x63\x04\x1e\x88\x9f\x59\x4d\x3f\x02\xe2\x67\x76\
-\xd3\x8e\x80\xf8\xe1\xde\x74\x23\x20\x7e\x78\x6c\x9a\x11\x10\x3f\
-\x3c\x6f\xf8\x11\x10\x3f\xbc\x6c\xd8\x11\x10\x3f\x2c\x33\xdc\x08\
-\x88\x1f\x8e\x33\xcc\x08\x88\x1f\x4e\xd3\xfd\x08\x88\x1f\xce\xd3\
-\xed\x08\x88\x1f\xca\xe8\x6e\x04\xc4\x0f\x65\x75\x33\x02\xe2\x87\
-\x75\x84\x1f\x01\xf1\xc3\xba\xc2\x8e\x80\xf8\xa1\x8e\x70\x23\x20\
-\x7e\xa8\x2b\xcc\x08\x88\x1f\xda\x68\x3e\x02\xe2\x87\xb6\x9a\x8d\
-\x80\xf8\x21\x86\xea\x23\x20\x7e\x88\xa5\xda\x08\x88\x1f\x62\x5a\
-\x7d\x04\xae\x6e\x36\x6f\x8b\xc4\xbf\x3b\x4f\xe5\xdf\x0d\x4c\xa1\
-\x58\xa3\xb7\xdb\x5f\x1f\x9f\xf8\x76\xfb\xb3\xf8\x21\xbe\x52\x23\
-\xb0\x7b\x46\xf1\x66\x7f\xc2\x3f\xde\xfd\xfd\xe3\xd5\xcd\xf6\xb3\
-\xf8\xa1\x0f\x25\x46\x20\x35\x9f\xda\xdf\x9d\x6c\x7b\x29\x7e\xe8\
-\x4b\xa1\x11\xb8\x4c\x03\xf0\x5e\xfc\xd0\x9f\x73\x47\x20\xb5\x9f\
-\x06\xe0\xa3\xf8\xa1\x4f\xe7\x8c\x40\x6a\xff\xe2\xfa\x76\xf3\x41\
-\xfc\xd0\xaf\xd3\x47\x60\xf3\x21\x5d\x01\xf8\x5d\xfc\xd0\xb7\x53\
-\x46\x20\xb5\x7f\xf1\xe7\xbb\xbf\x7e\xda\x2d\xc1\x17\xf1\x43\xdf\
-\x8e\x1b\x81\xcd\x97\xd4\xfe\xfe\xc0\xa5\x77\x19\x89\x1f\x62\xbb\
-\xbe\xd9\xfe\xb6\x68\x00\x76\xcd\x7f\x3d\xe8\xee\xee\xee\x87\x5d\
-\xdc\xbf\x1c\x7a\x26\x90\xae\x19\xa6\x9b\x85\x1a\xfe\x5c\xc0\x42\
-\xe9\x26\x9f\xc3\xf7\xf6\x6c\xbe\xa4\xd6\x53\xf3\xdf\x1d\x98\x9e\
-\x12\xdc\xbf\x26\x90\x5e\x18\xdc\x7c\x4a\x97\x09\xd2\xb5\xc2\xfd\
-\x0d\x03\x40\x37\x1e\x6e\xf0\xbb\xbc\xbf\xcc\xbf\xf9\x94\x9a\x4e\
-\x6d\x7f\x7d\xda\xff\xe0\x1f\x04\x7c\x0a\x0a\x12\x79\xfb\x13\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\xd2\
-\x00\
-\x00\x0e\x1f\x78\x9c\xeb\x0c\xf0\x73\xe7\xe5\x92\xe2\x62\x60\x60\
-\xe0\xf5\xf4\x70\x09\x62\x60\x60\x62\x00\x61\x0e\x36\x20\xf5\xa5\
-\xe2\xca\x2f\x20\xc5\x59\xe0\x11\x59\xcc\xc0\xc0\x2d\x0c\xc2\x8c\
-\x0c\xb3\xe6\x48\x00\x15\x5f\xf4\x74\x71\x0c\xa9\x98\xf3\xf6\xae\
-\xfd\x6a\x99\xe7\x8c\x47\x13\x4b\x37\x2a\x7a\xa6\x4f\xf0\x14\x0f\
-\xd8\xc5\xf1\x27\x31\x49\x5b\xfe\xb8\x2f\xd3\xb1\xad\x42\xff\x0f\
-\xbb\x3a\xcc\x8c\x4d\x31\x70\x99\xc5\x68\x2e\x7e\x7c\x66\xa4\xe7\
-\x12\x8e\x27\xd2\x11\x3b\x36\x84\x46\x31\x46\x6b\x3e\x92\x8c\x6c\
-\xd5\x6e\x9e\xf8\xee\xdf\xb7\x7b\x36\xfc\x32\x3b\xee\x14\xf9\x15\
-\xa6\x95\x97\xdd\xdf\x5b\xc4\xca\x40\x19\xd0\x9b\xb8\xbf\xe7\x7b\
-\xdd\xce\xd9\xcf\xee\xbf\x3f\xf6\x73\xef\xdd\x2d\x36\x12\xcb\x9e\
-\xae\xfe\xfa\x5e\xfd\xf5\xfd\xff\xc2\x82\x82\x96\x55\xd7\x78\xab\
-\x76\xb9\xde\xcf\xbf\xb4\xfb\xb0\xc5\xfd\x1f\x3f\x1e\xd7\xff\x59\
-\x74\xef\xb4\xf7\xe3\xf5\xe5\xef\xff\xa7\xed\xdd\x20\xcf\x73\xf9\
-\xcf\xfc\x3d\x39\x82\x82\x13\xe5\x4f\x6e\x0b\xcd\xbe\xb7\xff\xef\
-\xc9\x87\x51\x7b\xe7\x8b\x5f\xab\xdb\xbf\x67\x8f\xf4\xf4\xed\xed\
-\x85\x3f\xf3\x63\x57\x74\x74\x9c\xf0\x3f\xf5\xed\xdd\x01\x8b\xfd\
-\x5f\x1f\xde\xbc\xe9\xfd\x75\x5e\x9c\xc6\xed\xb9\x97\xad\xfe\xfd\
-\x3f\xc7\x2d\x22\x28\x58\xb9\x4f\xc6\x6e\x96\x5d\xed\xd6\x7b\x57\
-\xb9\x1f\x5e\xb3\xd8\xff\xed\xcd\x4c\xaf\xd8\x59\x40\x2d\xc5\xe9\
-\x33\x9e\xb5\x6f\x3f\x76\xf8\x6b\x55\xbc\xff\xad\x6f\xa7\xee\xff\
-\xe8\xee\x38\x91\x7a\xba\x4c\x78\xc3\xfe\xe2\xff\x59\x7b\x37\xab\
-\x67\x56\xfb\x6d\x92\x9e\x5e\x7f\x55\xb5\xb3\xa3\x63\x8e\x7b\x5b\
-\xe1\xbf\xe7\xdf\x7e\x6e\xab\xca\xf7\x3f\xf7\xad\x71\xff\x2e\x19\
-\xa0\x93\x3e\x9f\x31\x38\x9b\x7f\xad\xba\x3a\x68\x5e\xdd\xd5\xf3\
-\xcb\xff\xba\xba\x3c\x99\x94\x7e\x77\xd7\x7a\x5b\xae\x1f\x8d\x6f\
-\xab\xff\x95\x6a\x2a\x29\x29\x1d\x3f\x61\x70\xd6\xfc\xf5\x5d\x5b\
-\xce\xdb\x9c\xf5\x7c\x3f\x81\x7a\xfe\xcf\xee\xf9\x9c\xac\xce\xb6\
-\x6e\x9e\xdc\xfb\xe8\xe9\x8a\x4a\x4a\x45\x47\xde\xbc\x97\xbb\xb7\
-\xe2\xbb\xf9\xf7\x37\x39\xff\xf7\xf0\x00\x55\x24\xa7\xce\x98\x56\
-\xfe\xea\xef\xd9\xb5\xe2\x8f\x1c\x63\x5b\x80\xee\x9c\x58\x0c\x94\
-\xde\x3e\xfb\x99\xbb\x7a\x00\x88\x7b\xd1\xa8\xe7\xf4\xf4\xaf\xff\
-\x9e\xb5\x65\xfe\xdb\xa6\xe7\xe4\xe2\xf2\x64\x86\xe4\xb2\xa7\xb3\
-\xab\xea\x8b\x4b\x39\x81\x16\xba\x02\x75\x5e\x65\xed\xe8\xe8\x10\
-\x59\xf9\xdd\x3c\x5c\x5c\x41\x49\x29\x68\xc9\xbd\xfb\x31\xb1\x0d\
-\x1d\x1d\x1e\x13\x41\x8a\x18\xe9\xaa\x88\x8b\x61\x41\x42\x7d\xd2\
-\x28\x39\x4a\x8e\x92\xa3\xe4\x28\x39\x4a\x8e\x92\xa3\xe4\xc8\x21\
-\xe9\xdc\xdc\x22\x4a\xd1\x61\x93\xfa\xe8\xe9\x40\xd1\xa2\x33\x3c\
-\x97\x3f\xf9\xee\xdd\xbf\xf3\xae\x89\xfd\xaa\x6e\x01\x60\x5b\x3c\
-\xad\xad\xf0\xe7\xa6\x7b\xf7\xef\x54\x29\xca\x5d\x71\x05\x1a\x20\
-\x63\xd9\x0e\x52\xbf\x65\x4f\x35\x13\x98\xab\xff\xf8\xcf\x73\x90\
-\x80\xc5\xfd\x13\x60\xf5\x49\xd7\xc4\xf7\xef\x5f\x0d\x6c\x9c\xda\
-\x5b\xff\xfe\x59\xa5\xfe\x65\x87\x9e\x33\xb0\x3d\xaa\x11\x69\x9e\
-\x7f\x7b\x5f\x55\xbd\xff\x21\x83\xb3\xef\x9f\xb7\x82\x34\x2a\xde\
-\x5e\xfc\xbe\xaa\xdc\xff\xd8\x5b\x7f\xbe\xeb\xd7\xac\x17\xa9\x83\
-\xdb\xc6\xcf\x67\xbe\x5d\xfd\x7e\xfb\xfb\x9a\x6f\xaf\x81\x52\xa7\
-\x0c\xce\xe5\x5f\x3d\x0a\x54\x3b\x27\xfd\x5a\xf8\xff\xfa\x35\xdf\
-\xbf\x3d\xa9\xa9\x28\xfb\x76\xa9\xaa\x90\xaf\xd4\x12\xa4\x78\x62\
-\x62\xcc\xb4\x42\x99\xfa\xb0\xf7\x6f\x3d\x6f\xdd\xdf\x59\x5f\x6a\
-\x7e\x6e\xfe\x75\x50\xcb\x7c\xcf\x85\x9e\xd3\xe2\xbf\xf7\xeb\xee\
-\x5f\x55\xfe\x6d\xc9\x5d\x29\xfe\xeb\xed\x99\x75\x33\xa6\xab\x2a\
-\x29\x7d\x52\xda\xb4\x6f\xc3\xdd\xfb\xb1\x75\xd1\xef\x5f\xb7\x6e\
-\x90\xff\xff\xef\x54\xd5\x45\xbb\xb3\xde\xc0\x3e\x47\x65\x5f\x4e\
-\xfe\xef\xfc\xf7\x79\xd7\x77\x57\x2d\xcc\x39\xef\xd9\x96\x59\x77\
-\x59\x12\x18\x70\x45\x17\x3f\x7d\x69\x7f\x77\xec\x27\xff\xbc\x9f\
-\xf6\xed\x6f\xcf\x65\xee\x9d\x60\x7e\x97\x03\xd8\xe0\x3e\x99\x7e\
-\x77\x55\x62\xd4\xbd\x8f\xa1\xfb\xc5\x33\xac\x4d\x33\xeb\xbf\x7f\
-\x38\x56\x56\xf7\x29\x6f\xd6\xfb\xdc\xfd\x4b\x9e\x2c\x6f\x71\x75\
-\x59\x72\x6a\x9b\xe3\x6d\xb1\xda\xfd\x9e\x9f\xe7\x5f\xfb\xbf\xf7\
-\x5d\x8b\x3d\xa5\x3d\xa6\xd9\xef\x19\x7a\xc4\xdf\xcf\xbd\x1f\xb9\
-\xfb\x14\x88\xef\xe9\xea\xe7\xb2\xce\x29\xa1\x09\x00\x80\xb0\x30\
-\x20\
-\x00\x00\x20\x4a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x1f\xfc\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\xdf\xab\xe5\xfb\x79\x17\xf0\x69\x48\x52\xad\x4a\xaf\x54\x0a\
-\x89\x10\x50\x44\xfd\x0f\xd4\x78\xd1\xa6\xc5\x1f\xa9\x08\xc5\x8b\
-\xfe\x03\xfe\x0b\xde\x48\x4f\xd0\x5a\xb5\xad\x62\xb5\x04\x82\x68\
-\xc5\x8b\xce\x9e\x8d\x07\x4a\xe8\x59\x7b\x8e\x11\x06\xed\xac\x7d\
-\x0e\x87\x51\x4a\x1b\xef\xf4\xa2\x14\xa9\x68\x02\xa5\xa0\xa9\xb1\
-\xc9\xb8\xd6\x9c\xc9\xe9\x64\xcd\xde\xcf\xac\xbd\xf6\xe7\xbb\xbe\
-\xdf\xe7\xfb\x7e\xbd\xe0\x73\xd7\x86\x79\xd6\xf7\xfd\x7d\xd6\x67\
-\x9e\x67\xef\x39\x0f\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xac\x36\x9b\xcd\xf7\x5e\
-\x3e\xbe\xfe\x93\x97\xef\x6c\x7f\xf0\xe2\x9d\xed\xdf\xb8\xb8\xba\
-\xfe\xdc\xfe\x5c\x5e\x3d\xfd\xd3\x5f\x7a\xf6\xec\x13\x73\xff\xf9\
-\x00\x0e\xbd\xbd\x79\xff\x53\xbb\x3e\xf5\x37\x3b\x9c\xfd\x9f\x55\
-\xfd\x2c\xc2\xe5\xe5\x57\x3f\x79\x79\xf5\xde\x5f\xbf\xd8\x5c\xff\
-\xdc\xa3\xcd\xf5\xaf\x5f\x6c\xb6\xdf\x7e\x74\x75\xfd\xfc\xc6\xb3\
-\xd9\x7e\xf3\xe2\x6a\xfb\x5f\x76\xff\x37\xff\xfc\xf2\xf1\x7b\x3f\
-\xbc\xff\xff\x9d\xfb\xcf\x0f\xb0\xff\x62\xb9\xb5\x6f\x2d\xec\xec\
-\xff\xac\xea\x67\x56\x1f\xde\x18\xb7\x3f\xb9\xfb\x52\xff\x1f\x27\
-\x3f\xc8\xcd\xf6\xeb\xbb\xf3\xf7\x7f\xf1\xdf\xbf\xf7\xc7\xe7\xae\
-\x07\xc8\x95\xfe\x05\x98\x5e\x3f\x47\xfa\x37\xef\xfe\xea\x1f\xfa\
-\xf0\x8b\xff\xfa\x1b\xc3\x1e\xea\xfe\x7f\x6b\x73\xfd\xb3\x5f\xfe\
-\xf2\xb3\xef\x9b\xbb\x3e\x20\x4f\xfa\x17\x60\x7a\xfd\x1c\xe1\xe1\
-\xe6\xe9\x8f\xec\xbe\xfc\x7f\x73\xc2\x07\xfb\xdf\x1e\x6e\xb6\x3f\
-\x34\x77\x9d\x40\x96\xf4\x2f\xc0\xf4\xfa\x29\x3c\x7f\xfe\xfc\x7b\
-\x1e\x6d\xb6\x7f\x7b\xf7\xc1\xff\xde\xe4\x0f\x77\xb3\xfd\xf6\xfe\
-\xe7\x09\xfc\x7c\x00\x70\x2e\xe9\x5f\x80\xe9\xf5\x73\x8b\xb7\xde\
-\x7a\xfe\xb1\xdd\xdf\xfa\xff\xf5\xd9\x1f\xf4\xe6\x7a\xfb\xf0\xf1\
-\x07\x9f\x9e\xbb\x7e\x60\xfd\xd2\xbf\x00\xd3\xeb\xe7\x06\xfb\xbf\
-\xf9\xef\xbe\xfc\xbf\x38\xdb\x83\xde\x6c\x7f\xfb\xe2\xf1\xd3\x1f\
-\x9b\xfb\x73\x00\xd6\x2d\xfd\x0b\x30\xbd\x7e\x6e\xf0\xe8\x6a\xfb\
-\x85\xd9\x1f\xf6\x8b\x95\xc0\xf6\xa7\xfd\x1b\x02\xc0\x54\xd2\xbf\
-\x00\xd3\xeb\xe7\xc0\xc3\xab\xa7\x9f\x3d\xc7\xce\xff\x0e\xe7\x83\
-\xcb\x77\xdf\xff\xcc\xdc\x9f\x0b\xb0\x3e\xe9\x5f\x80\xe9\xf5\xf3\
-\x8a\xcb\xaf\x3c\xfb\xfe\x8b\xcd\xf5\x6f\xcc\xfd\xa0\x5f\x7b\xf0\
-\x9b\xed\xd7\x1e\x3e\xde\x7e\x7e\xee\xcf\x07\x58\x97\xf4\x2f\xc0\
-\xf4\xfa\x79\xc5\xee\x03\xfe\x87\x73\x3f\xe4\xe2\x12\xe0\xb7\x04\
-\x80\xa1\xd2\xbf\x00\xd3\xeb\xe7\xa5\xb7\xaf\xfe\xc3\x0f\x5c\x5c\
-\x6d\xff\xf7\xdc\x0f\xf9\x88\x63\x25\x00\x0c\x91\xfe\x05\x98\x5e\
-\x3f\x2f\xed\xfe\x86\xfd\x8f\xe7\x7e\xc0\x47\x07\xc1\x4a\x00\x18\
-\x20\xfd\x0b\x30\xbd\x7e\x76\x9e\x3c\x79\xf2\xf1\xdd\xdf\xfe\x7f\
-\x6b\xee\x07\x7c\xc7\x4b\x80\x95\x00\x70\x2f\xe9\x5f\x80\xe9\xf5\
-\xf3\x60\xff\xb7\xff\xa7\x7f\x75\xee\x87\x7b\x8f\x63\x25\x00\x9c\
-\x24\xfd\x0b\x30\xbd\x7e\x1e\xec\x43\x30\xdf\x3f\xfa\x33\x24\x18\
-\x56\x02\xc0\x09\xd2\xbf\x00\xd3\xeb\xe7\xc1\xfe\x1f\xfe\xb9\xfe\
-\xcf\x73\x3f\xdc\x7b\x87\xc3\x4a\x00\xb8\xa3\xf4\x2f\xc0\xf4\xfa\
-\xe3\x5d\x5e\x5e\xff\xc1\x47\x9b\xed\x37\xe7\x7e\xb8\x03\x8f\x95\
-\x00\x70\x94\xf4\x2f\xc0\xf4\xfa\xe3\x5d\x6e\xde\xff\xb3\x73\x3f\
-\xd8\xe1\x41\xf1\xdf\x12\x00\x8e\x90\xfe\x05\x98\x5e\x7f\xbc\x8b\
-\x77\xae\xff\xc2\xdc\x0f\x76\x92\xb0\x58\x09\x00\x6f\x90\xfe\x05\
-\x98\x5e\x7f\xbc\xdd\x97\xe4\x8f\xce\xfd\x60\x27\x3e\x56\x02\xc0\
-\x8d\xd2\xbf\x00\xd3\xeb\x8f\xd7\x29\x00\x27\x07\xc7\x4a\x00\xb8\
-\x41\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\xdc\x2b\x3c\x56\x02\
-\xc0\x81\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x18\x74\xac\x04\
-\x80\x17\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\x60\x58\x90\xac\
-\x04\x80\x07\xbd\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x30\x34\x4c\
-\x56\x02\x10\xaf\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\x26\x3a\
-\x56\x02\x10\xaa\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\x26\x0b\
-\x96\x95\x00\x44\xea\xd4\xff\x5c\x00\x5c\x00\x86\xeb\x14\x80\x49\
-\xc3\x65\x25\x00\x71\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\xe0\
-\x4c\xc7\x4a\x00\x42\x74\xea\x7f\x2e\x00\x2e\x00\xc3\x75\x0a\xc0\
-\xd9\x82\x66\x25\x00\x11\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\
-\xe0\xac\x61\xb3\x12\x80\xd5\xeb\xd4\xff\x5c\x00\x5c\x00\x86\xeb\
-\x14\x80\x99\x8e\x95\x00\xac\x54\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\
-\xa7\x00\xcc\x16\x3c\x2b\x01\x58\xa5\x4e\xfd\xcf\x05\xc0\x05\x60\
-\xb8\x4e\x01\x98\x35\x7c\x56\x02\xb0\x3a\x9d\xfa\x9f\x0b\x80\x0b\
-\xc0\x70\x9d\x02\xb0\x90\x63\x25\x00\x2b\xd1\xa9\xff\xb9\x00\xb8\
-\x00\x0c\xd7\x29\x00\x4b\x39\x56\x02\xb0\x0e\x9d\xfa\x9f\x0b\x80\
-\x0b\xc0\x70\x9d\x02\xb0\xa4\x63\x25\x00\xfd\x75\xea\x7f\x2e\x00\
-\x2e\x00\xc3\x75\x0a\xc0\x42\x8f\x95\x00\x34\xd5\xa9\xff\xb9\x00\
-\xb8\x00\x0c\xd7\x29\x00\x4b\x3d\x56\x02\xd0\x53\xa7\xfe\xe7\x02\
-\xe0\x02\x30\x5c\xa7\x00\x2c\xf9\x58\x09\x40\x3f\x9d\xfa\x9f\x0b\
-\x80\x0b\xc0\x70\x9d\x02\xd0\xe4\x58\x09\x40\x13\x9d\xfa\x9f\x0b\
-\x80\x0b\xc0\x70\x9d\x02\xd0\xe5\x58\x09\x40\x0f\x9d\xfa\x9f\x0b\
-\x80\x0b\xc0\x70\x9d\x02\xd0\xe9\x58\x09\xc0\xf2\x75\xea\x7f\x2e\
-\x00\x2e\x00\xc3\x75\x0a\x40\xd3\x63\x25\x00\x0b\xd5\xa9\xff\xb9\
-\x00\xb8\x00\x0c\xd7\x29\x00\x5d\x8f\x95\x00\x2c\x53\xa7\xfe\xe7\
-\x02\xe0\x02\x30\x5c\xa7\x00\x74\x3e\x56\x02\xb0\x3c\x9d\xfa\x9f\
-\x0b\x80\x0b\xc0\x70\x9d\x02\xb0\x92\x63\x25\x00\x0b\xd1\xa9\xff\
-\xb9\x00\xb8\x00\x0c\xd7\x29\x00\x6b\x39\x56\x02\xb0\x0c\x9d\xfa\
-\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\xb0\xa6\x63\x25\x00\xf3\xeb\xd4\
-\xff\x5c\x00\x5c\x00\x86\xeb\x14\x80\x95\x1e\x2b\x01\x98\x49\xa7\
-\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\xac\xf5\x58\x09\xc0\x3c\x3a\
-\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\x60\xcd\xc7\x4a\x00\xce\xaf\
-\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\x42\x8e\x95\x00\x9c\x49\
-\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\xa4\x1c\x2b\x01\x38\x8f\
-\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x48\x3a\x56\x02\x30\xbd\
-\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x08\x3d\x56\x02\x30\x91\
-\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x48\x3d\x56\x02\x30\x8d\
-\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x48\x3e\x56\x02\x30\x5e\
-\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\x38\x2f\x8e\x95\x00\x0c\
-\xd2\xa9\xff\xb9\x00\xb8\x00\x0c\xd7\x29\x00\xce\xcb\x17\xc1\x4a\
-\x00\x86\xe8\xd4\xff\x5c\x00\x5c\x00\x86\xeb\x14\x00\xe7\x95\x97\
-\xc1\x4a\x00\xee\xad\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\x9c\
-\x1b\x8f\x95\x00\x9c\xa8\x53\xff\x73\x01\x70\x01\x18\xae\x55\x00\
-\x36\xdb\xaf\xcd\xfd\x67\x58\xe2\xd9\x7f\x2e\x0f\x1f\x6f\x3f\x3f\
-\x77\x96\xa0\x9b\x56\xfd\xcf\x05\xc0\x05\x60\xb4\x4e\x01\x78\x74\
-\xb5\xfd\xf1\xdd\xf9\xc2\xee\x7c\x6b\xfe\x3f\xcb\xb2\x8e\x95\x00\
-\xdc\x5d\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xc7\x00\xec\xff\xb6\x6b\
-\x1a\x70\xeb\xb1\x12\x80\x23\x75\xec\x7f\xea\x67\x98\xae\x01\x78\
-\xf8\xf8\x83\x4f\x3f\xba\xda\x3e\x9d\xfb\xcf\xb4\xc4\xe3\xb7\x04\
-\xe0\x38\x5d\xfb\x9f\xfa\x19\xa2\x73\x00\x9e\x3c\x79\xf2\x71\x2b\
-\x81\x5b\x3e\x2b\x2b\x01\x78\xa3\xce\xfd\x4f\xfd\xdc\xdb\x1a\x02\
-\x60\x25\x50\x1e\x2b\x01\xb8\xc5\x1a\xfa\x9f\xfa\x39\xd9\x5a\x02\
-\x60\x25\x50\x7c\x6e\x56\x02\x70\xa3\xb5\xf4\x3f\xf5\x73\x92\x35\
-\x05\xc0\x4a\xa0\xf8\xec\xac\x04\xe0\x35\x6b\xea\x7f\xea\xe7\xce\
-\xd6\x18\x00\x2b\x81\xf2\x58\x09\xc0\x4b\x6b\xec\x7f\xea\xe7\x68\
-\x6b\x0d\x80\x95\x40\xf1\x39\x5a\x09\xc0\x0b\x6b\xed\x7f\xea\xe7\
-\x28\x6b\x0e\x80\x95\x40\xf1\x59\x5a\x09\xc0\xaa\xfb\x9f\xfa\x79\
-\xa3\x84\x00\x58\x09\x94\xc7\x4a\x80\x58\x09\xfd\x4f\xfd\xdc\x2a\
-\x25\x00\x56\x02\xc5\xe7\x6a\x25\x40\xa8\x94\xfe\xa7\x7e\x6e\x94\
-\x14\x00\x2b\x81\xe2\xb3\xb5\x12\x20\x50\x52\xff\x53\x3f\xaf\x49\
-\x0c\x80\x95\x40\x79\xac\x04\x88\x91\xd8\xff\xd4\xcf\x47\x52\x03\
-\x60\x25\x50\x7c\xce\x56\x02\x84\x48\xed\x7f\xea\xe7\x85\xe4\x00\
-\x58\x09\x14\x9f\xb5\x95\x00\x01\x92\xfb\x9f\xfa\x11\x80\x07\x56\
-\x02\x6f\x38\x56\x02\xac\x56\x7a\xff\x4b\xaf\x3f\x9e\x00\x7c\xc8\
-\x4a\xa0\xf8\xdc\xad\x04\x58\xa9\xf4\xfe\x97\x5e\x7f\x3c\x01\xf8\
-\x7d\x56\x02\xc5\x67\x6f\x25\xc0\x0a\xa5\xf7\xbf\xf4\xfa\xe3\x09\
-\xc0\xeb\xac\x04\xca\x63\x25\xc0\x6a\xa4\xf7\xbf\xf4\xfa\xe3\x09\
-\xc0\xcd\xac\x04\x8a\xe7\x60\x25\xc0\x4a\xa4\xf7\xbf\xf4\xfa\xe3\
-\x09\xc0\xed\xac\x04\x8a\x67\x61\x25\xc0\x0a\xa4\xf7\xbf\xf4\xfa\
-\xe3\x09\xc0\x9b\x59\x09\x94\xc7\x4a\x80\xb6\xd2\xfb\x5f\x7a\xfd\
-\xf1\x04\xe0\x38\x56\x02\xc5\x73\xb1\x12\xa0\xa9\xf4\xfe\x97\x5e\
-\x7f\x3c\x01\x38\x9e\x95\x40\xf1\x6c\xac\x04\x68\x28\xbd\xff\xa5\
-\xd7\x1f\x4f\x00\xee\xce\x4a\xa0\x3c\x56\x02\xb4\x91\xde\xff\xd2\
-\xeb\x8f\x27\x00\xa7\xb1\x12\x28\x9e\x93\x95\x00\x4d\xa4\xf7\xbf\
-\xf4\xfa\xe3\x09\xc0\xe9\xac\x04\x8a\x67\x65\x25\x40\x03\xe9\xfd\
-\x2f\xbd\xfe\x78\x02\x70\x7f\x56\x02\xe5\xb1\x12\x60\xb1\xd2\xfb\
-\x5f\x7a\xfd\xf1\x04\x60\x0c\x2b\x81\xe2\xb9\x59\x09\xb0\x50\xe9\
-\xfd\x2f\xbd\xfe\x78\x02\x30\x8e\x95\x40\xf1\xec\xac\x04\x58\xa0\
-\xf4\xfe\x97\x5e\x7f\x3c\x01\x18\xcf\x4a\xa0\x3c\x56\x02\x2c\x46\
-\x7a\xff\x4b\xaf\x3f\x9e\x00\x4c\xc3\x4a\xa0\x78\x8e\x56\x02\x2c\
-\x44\x7a\xff\x4b\xaf\x3f\x9e\x00\x4c\xc7\x4a\xa0\x78\x96\x56\x02\
-\x2c\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\x4c\xcf\x4a\xa0\x3c\x56\x02\
-\xcc\x26\xbd\xff\xa5\xd7\x1f\x4f\x00\xce\xc3\x4a\xa0\x78\xae\x56\
-\x02\xcc\x24\xbd\xff\xa5\xd7\x1f\x4f\x00\xce\xc7\x4a\xa0\x78\xb6\
-\x56\x02\xcc\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\xce\xcf\x4a\xa0\x3c\
-\x56\x02\x9c\x4d\x7a\xff\x4b\xaf\x3f\x9e\x00\xcc\xc3\x4a\xa0\x78\
-\xce\x56\x02\x9c\x49\x7a\xff\x4b\xaf\x3f\x9e\x00\xcc\xc7\x4a\xa0\
-\x78\xd6\x56\x02\x9c\x41\x7a\xff\x4b\xaf\x3f\x9e\x00\xcc\xcf\x4a\
-\xa0\x3c\x56\x02\x4c\x26\xbd\xff\xa5\xd7\x1f\x4f\x00\x96\xc1\x4a\
-\xa0\x78\xee\x56\x02\x4c\x24\xbd\xff\xa5\xd7\x1f\x4f\x00\x96\xc3\
-\x4a\xa0\x78\xf6\x56\x02\x4c\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\x96\
-\xc7\x4a\xa0\x3c\x56\x02\x0c\x93\xde\xff\xd2\xeb\x8f\x27\x00\xcb\
-\x64\x25\x50\xe4\xc0\x4a\x80\x41\xd2\xfb\x5f\x7a\xfd\xf1\x04\x60\
-\xb9\xac\x04\x8a\x2c\x58\x09\x30\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\
-\x2c\x9f\x95\x40\x79\xac\x04\x38\x59\x7a\xff\x4b\xaf\x3f\x9e\x00\
-\xf4\x60\x25\x50\xe4\xc2\x4a\x80\x13\xa5\xf7\xbf\xf4\xfa\xe3\x09\
-\x40\x1f\x56\x02\x45\x36\xac\x04\x38\x41\x7a\xff\x4b\xaf\x3f\x9e\
-\x00\xf4\x63\x25\x50\x1e\x2b\x01\x8e\x96\xde\xff\xd2\xeb\x8f\x27\
-\x00\x3d\x59\x09\x14\x39\xb1\x12\xe0\x48\xe9\xfd\x2f\xbd\xfe\x78\
-\x02\xd0\x97\x95\x40\x91\x15\x2b\x01\x8e\x90\xde\xff\xd2\xeb\x8f\
-\x27\x00\xfd\x59\x09\x94\xc7\x4a\x80\x5b\xa5\xf7\xbf\xf4\xfa\xe3\
-\x09\xc0\x3a\x58\x09\x14\xb9\xb1\x12\xe0\x16\xe9\xfd\x2f\xbd\xfe\
-\x78\x02\xb0\x1e\x56\x02\x45\x76\xac\x04\xb8\x41\x7a\xff\x4b\xaf\
-\x3f\x9e\x00\xac\x8f\x95\x40\x79\xac\x04\xf8\x48\x7a\xff\x4b\xaf\
-\x3f\x9e\x00\xac\x93\x95\x40\x91\x23\x2b\x01\x5e\x4a\xef\x7f\xe9\
-\xf5\xc7\x13\x80\xf5\xb2\x12\x28\xb2\x64\x25\xc0\x03\xfd\x2f\xbd\
-\xfe\x78\x02\xb0\x7e\x56\x02\xe5\xb1\x12\x08\x96\xde\xff\xd2\xeb\
-\x8f\x27\x00\x19\xac\x04\x8a\x5c\x59\x09\xc4\x4a\xef\x7f\xe9\xf5\
-\xc7\x13\x80\x1c\x56\x02\x45\xb6\xac\x04\x22\xa5\xf7\xbf\xf4\xfa\
-\xe3\x09\x40\x1e\x2b\x81\xf2\x58\x09\x04\x49\xef\x7f\xe9\xf5\xc7\
-\x13\x80\x4c\x56\x02\x45\xce\xac\x04\x62\xa4\xf7\xbf\xf4\xfa\xe3\
-\x09\x40\x2e\x2b\x81\x22\x6b\x56\x02\x11\xd2\xfb\x5f\x7a\xfd\xf1\
-\x04\x00\x2b\x81\xf2\x58\x09\xac\x58\x7a\xff\x4b\xaf\x3f\x9e\x00\
-\xb0\x67\x25\x50\xe4\xce\x4a\x60\xb5\xd2\xfb\x5f\x7a\xfd\xf1\x04\
-\x80\xef\xb0\x12\x28\xb2\x67\x25\xb0\x4a\xe9\xfd\x2f\xbd\xfe\x78\
-\x02\xc0\x21\x2b\x81\xf2\x58\x09\xac\x48\x7a\xff\x4b\xaf\x3f\x9e\
-\x00\x70\x13\x2b\x81\x22\x87\x56\x02\xab\x91\xde\xff\xd2\xeb\x8f\
-\x27\x00\xdc\xc6\x4a\xa0\xc8\xa2\x95\xc0\x2a\xa4\xf7\xbf\xf4\xfa\
-\xe3\x09\x00\x6f\x62\x25\x50\x1e\x2b\x81\xc6\xd2\xfb\x5f\x7a\xfd\
-\xf1\x04\x80\x63\x58\x09\x14\xb9\xb4\x12\x68\x2b\xbd\xff\xa5\xd7\
-\x1f\x4f\x00\x38\x96\x95\x40\x91\x4d\x2b\x81\x96\xd2\xfb\x5f\x7a\
-\xfd\xf1\x04\x80\xbb\xb2\x12\x28\x8f\x95\x40\x23\xe9\xfd\x2f\xbd\
-\xfe\x78\x02\xc0\x29\xac\x04\x8a\x9c\x5a\x09\xb4\x91\xde\xff\xd2\
-\xeb\x8f\x27\x00\x9c\xca\x4a\xa0\xc8\xaa\x95\x40\x0b\xe9\xfd\x2f\
-\xbd\xfe\x78\x02\xc0\x7d\x59\x09\x94\xc7\x4a\x60\xc1\xd2\xfb\x5f\
-\x7a\xfd\xf1\x04\x80\x11\xac\x04\x8a\xdc\x5a\x09\x2c\x56\x7a\xff\
-\x4b\xaf\x3f\x9e\x00\x30\x8a\x95\x40\x91\x5d\x2b\x81\x45\x4a\xef\
-\x7f\xe9\xf5\xc7\x13\x00\x46\xb3\x12\x28\x8f\x95\xc0\x82\xa4\xf7\
-\xbf\xf4\xfa\xe3\x09\x00\x53\xb0\x12\x28\x72\x6c\x25\xb0\x18\xe9\
-\xfd\x2f\xbd\xfe\x78\x02\xc0\x54\xac\x04\x8a\x2c\x5b\x09\x2c\x42\
-\x7a\xff\x4b\xaf\x3f\x9e\x00\x30\x35\x2b\x81\xf2\x58\x09\xcc\x28\
-\xbd\xff\xa5\xd7\x1f\x4f\x00\x38\x07\x2b\x81\x22\xd7\x56\x02\xb3\
-\x49\xef\x7f\xe9\xf5\xc7\x13\x00\xce\xc5\x4a\xa0\xc8\xb6\x95\xc0\
-\x2c\xd2\xfb\x5f\x7a\xfd\xf1\x04\x80\x73\xb3\x12\x28\x8f\x95\xc0\
-\x19\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x73\xb0\x12\x28\x72\x6e\x25\
-\x70\x36\xe9\xfd\x2f\xbd\xfe\x78\x02\xc0\x5c\xac\x04\x8a\xac\x5b\
-\x09\x9c\x45\x7a\xff\x4b\xaf\x3f\x9e\x00\x30\x37\x2b\x81\xf2\x58\
-\x09\x4c\x28\xbd\xff\xa5\xd7\x1f\x4f\x00\x58\x02\x2b\x81\x22\xf7\
-\x56\x02\x93\x49\xef\x7f\xe9\xf5\xc7\x13\x00\x96\xc2\x4a\xa0\xc8\
-\xbe\x95\xc0\x24\xd2\xfb\x5f\x7a\xfd\xf1\x04\x80\xa5\xb1\x12\x28\
-\x8f\x95\xc0\x40\xe9\xfd\x2f\xbd\xfe\x78\x02\xc0\x12\x59\x09\x14\
-\xef\x81\x95\xc0\x30\xe9\xfd\x2f\xbd\xfe\x78\x02\xc0\x52\x59\x09\
-\x14\xef\x82\x95\xc0\x10\xe9\xfd\x2f\xbd\xfe\x78\x02\xc0\xd2\x59\
-\x09\x94\xc7\x4a\xe0\x1e\xd2\xfb\x5f\x7a\xfd\xf1\x04\x80\x0e\xac\
-\x04\x8a\xf7\xc2\x4a\xe0\x64\xe9\xfd\x2f\xbd\xfe\x78\x02\x40\x17\
-\x56\x02\xc5\xbb\x61\x25\x70\x92\xf4\xfe\x97\x5e\x7f\x3c\x01\xa0\
-\x1b\x2b\x81\xf2\x58\x09\xdc\x41\x7a\xff\x4b\xaf\x3f\x9e\x00\xd0\
-\x91\x95\x40\xf1\x9e\x58\x09\x1c\x2d\xbd\xff\xa5\xd7\x1f\x4f\x00\
-\xe8\xca\x4a\xa0\x78\x57\xac\x04\x8e\x92\xde\xff\xd2\xeb\x8f\x27\
-\x00\x74\x67\x25\x50\x1e\x2b\x81\x42\x7a\xff\x4b\xaf\x3f\x9e\x00\
-\xb0\x06\x56\x02\xc5\x7b\x63\x25\x70\xab\xf4\xfe\x97\x5e\x7f\x3c\
-\x01\x60\x2d\xac\x04\x8a\x77\xc7\x4a\xe0\x46\xe9\xfd\x2f\xbd\xfe\
-\x78\x02\xc0\xda\x58\x09\x94\xc7\x4a\xe0\x15\xe9\xfd\x2f\xbd\xfe\
-\x78\x02\xc0\x1a\x59\x09\x14\xef\x91\x95\xc0\x47\xd2\xfb\x5f\x7a\
-\xfd\xf1\x04\x80\xb5\xb2\x12\x28\xde\x25\x2b\x81\x17\xd2\xfb\x5f\
-\x7a\xfd\xf1\x04\x80\xb5\xb3\x12\x28\x4f\xf4\x4a\x20\xbd\xff\xa5\
-\xd7\x1f\x4f\x00\x48\x60\x25\x50\xbc\x57\xc1\x2b\x81\xf4\xfe\x97\
-\x5e\x7f\x3c\x01\x20\x85\x95\x40\xf1\x6e\x85\xae\x04\xd2\xfb\x5f\
-\x7a\xfd\xf1\x04\x80\x34\x56\x02\xe5\x89\x5a\x09\xa4\xf7\xbf\xf4\
-\xfa\xe3\x09\x00\x89\xac\x04\x8a\xf7\x2c\x68\x25\x90\xde\xff\xd2\
-\xeb\x8f\x27\x00\xa4\xb2\x12\x28\xde\xb5\x90\x95\x40\x7a\xff\x4b\
-\xaf\x3f\x9e\x00\x90\xce\x4a\xa0\x3c\xab\x5e\x09\xa4\xf7\xbf\xf4\
-\xfa\xe3\x09\x00\x58\x09\x94\xef\xdd\x8a\x57\x02\xe9\xfd\x2f\xbd\
-\xfe\x78\x02\x00\x1f\xb2\x12\x28\xde\xbd\x95\xae\x04\xd2\xfb\x5f\
-\x7a\xfd\xf1\x04\x00\xbe\x9b\x95\x40\x79\x56\xb5\x12\x48\xef\x7f\
-\xe9\xf5\xc7\x13\x00\x78\x9d\x95\x40\xf1\x1e\xae\x68\x25\x90\xde\
-\xff\xd2\xeb\x8f\x27\x00\x70\x33\x2b\x81\xe2\x5d\x5c\xc9\x4a\x20\
-\xbd\xff\xa5\xd7\x1f\x4f\x00\xa0\x66\x25\x50\x9e\xd6\x2b\x81\xf4\
-\xfe\x97\x5e\x7f\x3c\x01\x80\x37\xb3\x12\x28\xde\xcb\xc6\x2b\x81\
-\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\xe3\x58\x09\x14\xef\x66\xd3\x95\
-\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\xdd\x58\x09\x94\xa7\xd5\x4a\
-\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\xe0\xee\xac\x04\x8a\xf7\xb4\xd1\
-\x4a\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\xe0\x34\x56\x02\xc5\xbb\xda\
-\x64\x25\x90\xde\xff\xd2\xeb\x8f\x27\x00\x70\x3f\x56\x02\xe5\x59\
-\xf4\x4a\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\xe0\xfe\xac\x04\x8a\xf7\
-\x76\xc1\x2b\x81\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\x31\xac\x04\x8a\
-\x77\x77\xa1\x2b\x81\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\xb1\xac\x04\
-\xca\xb3\xa8\x95\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\x78\x56\x02\
-\xc5\x7b\xbc\xa0\x95\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\x34\xac\
-\x04\x8a\x77\x79\x21\x2b\x81\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\x69\
-\x59\x09\x94\x67\xd6\x95\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\xf4\
-\x2e\xbf\xf2\x2b\x7f\x62\xf7\x37\xde\xeb\xb9\xdf\xa1\x25\x9e\xfd\
-\xe5\x68\x7f\x49\x9a\xe3\xb9\xa4\xf7\xbf\xf4\xfa\xe3\x09\x00\x9c\
-\x87\x95\x40\xf1\x6e\x6f\xb6\xdf\xde\x7f\x36\xe7\x7e\x26\xe9\xfd\
-\x2f\xbd\xfe\x78\x02\x00\xe7\x75\xb1\xb9\xfe\xd1\xdd\x17\xde\xd7\
-\xe7\x7e\x9f\x16\x79\x36\xd7\xff\xea\xad\xb7\x9e\x7f\xec\x6c\xcf\
-\x22\xbc\xff\xa5\xd7\x1f\x4f\x00\xe0\xfc\xfc\x96\x40\xf1\x9e\x6f\
-\xb6\xbf\xf0\xfc\xf9\xf3\xef\x39\xc7\x73\x48\xef\x7f\xe9\xf5\xc7\
-\x13\x00\x98\xc7\x97\x9e\x3d\xfb\xc4\x2e\xd3\x3f\xf3\xe1\xf8\x7b\
-\xfe\xf7\x6b\x49\xe7\x72\x73\xfd\x13\xe7\x78\x06\xe9\xfd\x2f\xbd\
-\xfe\x78\x02\x00\xf3\xf2\x5b\x02\x37\x9d\xed\xb7\x76\xef\xfb\xe7\
-\xa6\xfe\xec\xd3\xfb\x5f\x7a\xfd\xf1\x04\x00\xe6\xe7\xb7\x04\x6e\
-\x38\x9b\xeb\xff\xfe\x4b\xbf\xf4\xf4\x8f\x4c\xf9\xb9\xa7\xf7\xbf\
-\xf4\xfa\xe3\x09\x00\x2c\x83\xdf\x12\xb8\xf1\x9d\xff\x07\x53\x7e\
-\xe6\xe9\xfd\x2f\xbd\xfe\x78\x02\x00\xcb\xe2\xb7\x04\xbe\xeb\x9d\
-\xff\xdd\xb7\x37\xef\x7f\x6a\xb2\xcf\x3a\xbc\xff\xa5\xd7\x1f\x4f\
-\x00\x60\x79\xfc\x96\xc0\x2b\x67\xb3\xfd\xa9\xa9\x3e\xe7\xf4\xfe\
-\x97\x5e\x7f\x3c\x01\x80\x65\xf2\x5b\x02\xdf\x39\xdb\xff\xb5\xd9\
-\x6c\xbe\x77\x8a\xcf\x38\xbd\xff\xa5\xd7\x1f\x4f\x00\x60\xd9\xfc\
-\x96\xc0\xf5\xf3\xcb\xc7\xd7\x7f\x79\x8a\xcf\x36\xbd\xff\xa5\xd7\
-\x1f\x4f\x00\x60\xf9\xd2\x57\x02\x17\x9b\xeb\x9f\x9f\xe2\x73\x4d\
-\xef\x7f\xe9\xf5\xc7\x13\x00\xe8\x21\x7a\x25\xb0\xb9\xfe\xf5\x29\
-\x3e\xd3\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\x5e\x12\x57\x02\x17\x9b\
-\xeb\xff\x37\xc5\xcf\x01\xa4\xf7\xbf\xf4\xfa\xe3\x09\x00\xf4\x93\
-\xf8\x0f\x07\xfd\xe2\xd5\xaf\xfc\xb9\xd1\x9f\x63\x7a\xff\x4b\xaf\
-\x3f\x9e\x00\x40\x4f\x69\xff\x70\xd0\xc5\x2f\x6f\xff\xd2\xe8\xcf\
-\x30\xbd\xff\xa5\xd7\x1f\x4f\x00\xa0\xb7\x94\x95\xc0\xfe\x1f\x48\
-\x1a\xfd\xd9\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\xf4\x96\x72\x01\xd8\
-\xd7\x39\xfa\xb3\x4b\xef\x7f\xe9\xf5\xc7\x13\x00\xe8\x29\x6d\x05\
-\xf0\xf0\xea\xe9\x67\x47\x7f\x86\xe9\xfd\x2f\xbd\xfe\x78\x02\x00\
-\xfd\xf8\x21\xc0\x31\xd2\xfb\x5f\x7a\xfd\xf1\x04\x00\x7a\x49\x19\
-\xf9\x7f\xd7\xd9\x6c\xbf\x79\x79\xf9\xd5\x4f\x8e\xfe\x2c\xd3\xfb\
-\x5f\x7a\xfd\xf1\x04\x00\x7a\x48\xfe\x87\x80\x2e\xae\xb6\xbf\x36\
-\xc5\x67\x9a\xde\xff\xd2\xeb\x8f\x27\x00\xb0\x7c\xe9\xff\x14\xf0\
-\xae\xf6\x7f\x36\xc5\xe7\x9a\xde\xff\xd2\xeb\x8f\x27\x00\xb0\x6c\
-\x91\x23\xff\x83\xf3\x70\xf3\xf4\x47\xa6\xf8\x6c\xd3\xfb\x5f\x7a\
-\xfd\xf1\x04\x00\x96\x29\x79\xe4\x7f\xf0\xde\xff\x4f\xff\x39\x60\
-\x17\x00\xfd\x7f\x02\x02\x00\xcb\x63\xe4\xff\xea\x7b\xbf\xfd\xc9\
-\xa9\x3e\xe7\xf4\xfe\x97\x5e\x7f\x3c\x01\x80\x65\xd9\xff\x8b\x77\
-\xbb\xbf\xf5\x7f\x7d\xee\xf7\x6d\x11\x67\x73\xfd\x8d\xb7\x37\xef\
-\x7f\x6a\xb2\xcf\x3a\xbc\xff\xa5\xd7\x1f\x4f\x00\x60\x19\xd2\xfe\
-\x61\x9f\xe3\xde\xf9\xe9\xfe\xf6\xbf\x97\xde\xff\xd2\xeb\x8f\x27\
-\x00\x30\xbf\xc4\x7f\xd8\xe7\xcd\xef\xfb\xf6\x37\x2f\x9f\x3c\xf9\
-\xc3\x53\x7e\xee\xe9\xfd\x2f\xbd\xfe\x78\x02\x00\xf3\xf2\x53\xfe\
-\x37\x9d\xed\xb7\x2e\xdf\xd9\xfe\xe0\xd4\x9f\x7d\x7a\xff\x4b\xaf\
-\x3f\x9e\x00\xc0\x3c\xfc\x94\x7f\xf5\xae\x6f\xff\xce\x39\x9e\x41\
-\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\xf9\xf9\x29\xff\xea\x3d\xdf\x7e\
-\xf1\x5c\xcf\x21\xbd\xff\xa5\xd7\x1f\x4f\x00\xe0\xbc\xfc\x94\x7f\
-\x71\x36\xdb\x7f\xf1\xd6\x5b\xcf\x3f\x76\xb6\x67\x11\xde\xff\xd2\
-\xeb\x8f\x27\x00\x70\x1e\x7e\xca\xbf\x78\xb7\x5f\xac\x41\xb6\x5f\
-\x38\xf7\x33\x49\xef\x7f\xe9\xf5\xc7\x13\x00\x98\x9e\x9f\xf2\x2f\
-\xde\xeb\xcd\xf6\x6b\xfb\x1f\x84\x9c\xe3\xb9\xa4\xf7\xbf\xf4\xfa\
-\xe3\x09\x00\x4c\xcb\x4f\xf9\x97\xe7\x83\xcb\x77\xdf\xff\xcc\x5c\
-\xcf\x26\xbd\xff\xa5\xd7\x1f\x4f\x00\x60\x1a\x46\xfe\xc5\xbb\xbc\
-\xd9\x7e\xfb\x62\x73\xfd\x73\x97\x97\x5f\xfd\xe4\x9c\xcf\x28\xbd\
-\xff\xa5\xd7\x1f\x4f\x00\x60\x3c\x3f\xe5\x5f\xbc\xc7\x9b\xed\x6f\
-\x5f\x3c\x7e\xfa\x63\x73\x3f\xa3\xbd\xf4\xfe\x97\x5e\x7f\x3c\x01\
-\x80\xb1\x8c\xfc\xcb\x33\xeb\xc8\xff\x50\x7a\xff\x4b\xaf\x3f\x9e\
-\x00\xc0\x18\x46\xfe\xc5\xbb\xbb\x90\x91\xff\xa1\xf4\xfe\x97\x5e\
-\x7f\x3c\x01\x80\xfb\x33\xf2\x2f\xde\xdb\x05\x8d\xfc\x0f\xa5\xf7\
-\xbf\xf4\xfa\xe3\x09\x00\xdc\x8f\x91\x7f\x79\x16\x35\xf2\x3f\x94\
-\xde\xff\xd2\xeb\x8f\x27\x00\x70\x1a\x23\xff\xe2\x5d\x5d\xe8\xc8\
-\xff\x50\x7a\xff\x4b\xaf\x3f\x9e\x00\xc0\xdd\x19\xf9\x17\xef\xe9\
-\x82\x47\xfe\x87\xd2\xfb\x5f\x7a\xfd\xf1\x04\x00\xee\xc6\xc8\xbf\
-\x3c\x8b\x1e\xf9\x1f\x4a\xef\x7f\xe9\xf5\xc7\x13\x00\x38\x8e\x91\
-\x7f\xf1\x6e\x36\x19\xf9\x1f\x4a\xef\x7f\xe9\xf5\xc7\x13\x00\x78\
-\x33\x23\xff\xe2\xbd\x6c\x34\xf2\x3f\x94\xde\xff\xd2\xeb\x8f\x27\
-\x00\x50\x33\xf2\x2f\x4f\xab\x91\xff\xa1\xf4\xfe\x97\x5e\x7f\x3c\
-\x01\x80\x9b\x19\xf9\x17\xef\x62\xd3\x91\xff\xa1\xf4\xfe\x97\x5e\
-\x7f\x3c\x01\x80\xd7\x19\xf9\x17\xef\x61\xe3\x91\xff\xa1\xf4\xfe\
-\x97\x5e\x7f\x3c\x01\x80\xef\x66\xe4\x5f\x9e\xd6\x23\xff\x43\xe9\
-\xfd\x2f\xbd\xfe\x78\x02\x00\x1f\x32\xf2\x2f\xde\xbd\x95\x8c\xfc\
-\x0f\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x18\xf9\x97\xef\xdd\x8a\x46\
-\xfe\x87\xd2\xfb\x5f\x7a\xfd\xf1\x04\x80\x74\x46\xfe\xe5\x59\xd5\
-\xc8\xff\x50\x7a\xff\x4b\xaf\x3f\x9e\x00\x90\xca\xc8\xbf\x78\xd7\
-\x56\x3a\xf2\x3f\x94\xde\xff\xd2\xeb\x8f\x27\x00\x24\x32\xf2\x2f\
-\xde\xb3\x15\x8f\xfc\x0f\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x69\x8c\
-\xfc\xcb\xb3\xea\x91\xff\xa1\xf4\xfe\x97\x5e\x7f\x3c\x01\x20\x85\
-\x91\x7f\xf1\x6e\x85\x8c\xfc\x0f\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\
-\x09\x8c\xfc\x8b\xf7\x2a\x68\xe4\x7f\x28\xbd\xff\xa5\xd7\x1f\x4f\
-\x00\x58\x3b\x23\xff\xf2\x44\x8d\xfc\x0f\xa5\xf7\xbf\xf4\xfa\xe3\
-\x09\x00\x6b\x65\xe4\x5f\xbc\x4b\xa1\x23\xff\x43\xe9\xfd\x2f\xbd\
-\xfe\x78\x02\xc0\x1a\x19\xf9\x17\xef\x51\xf0\xc8\xff\x50\x7a\xff\
-\x4b\xaf\x3f\x9e\x00\xb0\x36\x46\xfe\xe5\x89\x1e\xf9\x1f\x4a\xef\
-\x7f\xe9\xf5\xc7\x13\x00\xd6\xc2\xc8\xbf\x78\x77\x8c\xfc\x6f\x94\
-\xde\xff\xd2\xeb\x8f\x27\x00\xac\x81\x91\x7f\xf1\xde\x18\xf9\xdf\
-\x2a\xbd\xff\xa5\xd7\x1f\x4f\x00\xe8\xce\xc8\xbf\x3c\x46\xfe\x85\
-\xf4\xfe\x97\x5e\x7f\x3c\x01\xa0\x2b\x23\xff\xe2\x5d\x31\xf2\x3f\
-\x4a\x7a\xff\x4b\xaf\x3f\x9e\x00\xd0\x91\x91\x7f\xf1\x9e\x18\xf9\
-\x1f\x2d\xbd\xff\xa5\xd7\x1f\x4f\x00\xe8\xc6\xc8\xbf\x3c\x46\xfe\
-\x77\x90\xde\xff\xd2\xeb\x8f\x27\x00\x74\x61\xe4\x5f\xbc\x1b\x46\
-\xfe\x27\x49\xef\x7f\xe9\xf5\xc7\x13\x00\x3a\x30\xf2\x2f\xde\x0b\
-\x23\xff\x93\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x4b\x67\xe4\x5f\x1e\
-\x23\xff\x7b\x48\xef\x7f\xe9\xf5\xc7\x13\x00\x96\xca\xc8\xbf\x78\
-\x17\x8c\xfc\x87\x48\xef\x7f\xe9\xf5\xc7\x13\x00\x96\xc8\xc8\xbf\
-\x78\x0f\x8c\xfc\x87\x49\xef\x7f\xe9\xf5\xc7\x13\x00\x96\xc6\xc8\
-\xbf\x3c\x46\xfe\x03\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x4b\x61\xe4\
-\x5f\x64\xdf\xc8\x7f\x12\xe9\xfd\x2f\xbd\xfe\x78\x02\xc0\x12\x18\
-\xf9\x17\xb9\x37\xf2\x9f\x4c\x7a\xff\x4b\xaf\x3f\x9e\x00\x30\x37\
-\x23\xff\xf2\x18\xf9\x4f\x28\xbd\xff\xa5\xd7\x1f\x4f\x00\x98\x8b\
-\x91\x7f\x91\x75\x23\xff\xb3\x48\xef\x7f\xe9\xf5\xc7\x13\x00\xe6\
-\x60\xe4\x5f\xe4\xdc\xc8\xff\x6c\xd2\xfb\x5f\x7a\xfd\xf1\x04\x80\
-\x73\x33\xf2\x2f\x8f\x91\xff\x19\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\
-\xe7\x62\xe4\x5f\x64\xdb\xc8\x7f\x16\xe9\xfd\x2f\xbd\xfe\x78\x02\
-\xc0\x39\x18\xf9\x17\xb9\x36\xf2\x9f\x4d\x7a\xff\x4b\xaf\x3f\x9e\
-\x00\x30\x35\x23\xff\xf2\x18\xf9\xcf\x28\xbd\xff\xa5\xd7\x1f\x4f\
-\x00\x98\x8a\x91\x7f\x91\x65\x23\xff\x45\x48\xef\x7f\xe9\xf5\xc7\
-\x13\x00\xa6\x60\xe4\x5f\xe4\xd8\xc8\x7f\x31\xd2\xfb\x5f\x7a\xfd\
-\xf1\x04\x80\xd1\x8c\xfc\xcb\x63\xe4\xbf\x20\xe9\xfd\x2f\xbd\xfe\
-\x78\x02\xc0\x28\x46\xfe\x45\x76\x8d\xfc\x17\x29\xbd\xff\xa5\xd7\
-\x1f\x4f\x00\x18\xc1\xc8\xbf\xc8\xad\x91\xff\x62\xa5\xf7\xbf\xf4\
-\xfa\xe3\x09\x00\xf7\x65\xe4\x5f\x1e\x23\xff\x05\x4b\xef\x7f\xe9\
-\xf5\xc7\x13\x00\x4e\x65\xe4\x5f\x64\xd5\xc8\xbf\x85\xf4\xfe\x97\
-\x5e\x7f\x3c\x01\xe0\x14\x46\xfe\x45\x4e\x8d\xfc\xdb\x48\xef\x7f\
-\xe9\xf5\xc7\x13\x00\xee\xca\xc8\xbf\x3c\x46\xfe\x8d\xa4\xf7\xbf\
-\xf4\xfa\xe3\x09\x00\xc7\x32\xf2\x2f\xb2\x69\xe4\xdf\x52\x7a\xff\
-\x4b\xaf\x3f\x9e\x00\x70\x0c\x23\xff\x22\x97\x46\xfe\x6d\xa5\xf7\
-\xbf\xf4\xfa\xe3\x09\x00\x6f\x62\xe4\x5f\x1e\x23\xff\xc6\xd2\xfb\
-\x5f\x7a\xfd\xf1\x04\x80\xdb\x18\xf9\x17\x59\x34\xf2\x5f\x85\xf4\
-\xfe\x97\x5e\x7f\x3c\x01\xe0\x26\x46\xfe\x45\x0e\x8d\xfc\x57\x23\
-\xbd\xff\xa5\xd7\x1f\x4f\x00\x38\x64\xe4\x5f\x1e\x23\xff\x15\x49\
-\xef\x7f\xe9\xf5\xc7\x13\x00\xbe\xc3\xc8\xbf\xc8\x9e\x91\xff\x2a\
-\xa5\xf7\xbf\xf4\xfa\xe3\x09\x00\x7b\x46\xfe\x45\xee\x8c\xfc\x57\
-\x2b\xbd\xff\xa5\xd7\x1f\x4f\x00\x30\xf2\x2f\x8f\x91\xff\x8a\xa5\
-\xf7\xbf\xf4\xfa\xe3\x09\x40\x2e\x23\xff\x22\x6b\x46\xfe\x11\xd2\
-\xfb\x5f\x7a\xfd\xf1\x04\x20\x93\x91\x7f\x91\x33\x23\xff\x18\xe9\
-\xfd\x2f\xbd\xfe\x78\x02\x90\xc7\xc8\xbf\x3c\x46\xfe\x41\xd2\xfb\
-\x5f\x7a\xfd\xf1\x04\x20\x87\x91\x7f\x91\x2d\x23\xff\x48\xe9\xfd\
-\x2f\xbd\xfe\x78\x02\x90\xc1\xc8\xbf\xc8\x95\x91\x7f\xac\xf4\xfe\
-\x97\x5e\x7f\x3c\x01\x58\x3f\x23\xff\xf2\x18\xf9\x07\x4b\xef\x7f\
-\xe9\xf5\xc7\x13\x80\xf5\x32\xf2\x2f\xb2\x64\xe4\xcf\x03\xfd\x2f\
-\xbd\xfe\x78\x02\xb0\x4e\x46\xfe\x45\x8e\x8c\xfc\x79\x29\xbd\xff\
-\xa5\xd7\x1f\x4f\x00\xd6\xc7\xc8\xbf\x3c\x46\xfe\x7c\x24\xbd\xff\
-\xa5\xd7\x1f\x4f\x00\xd6\xc3\xc8\xbf\xc8\x8e\x91\x3f\x37\x48\xef\
-\x7f\xe9\xf5\xc7\x13\x80\x75\x30\xf2\x2f\x72\x63\xe4\xcf\x2d\xd2\
-\xfb\x5f\x7a\xfd\xf1\x04\xa0\x3f\x23\xff\xf2\x18\xf9\x73\xab\xf4\
-\xfe\x97\x5e\x7f\x3c\x01\xe8\xcb\xc8\xbf\xc8\x8a\x91\x3f\x47\x48\
-\xef\x7f\xe9\xf5\xc7\x13\x80\x9e\x8c\xfc\x8b\x9c\x18\xf9\x73\xa4\
-\xf4\xfe\x97\x5e\x7f\x3c\x01\xe8\xc7\xc8\xbf\x3c\x46\xfe\x1c\x2d\
-\xbd\xff\xa5\xd7\x1f\x4f\x00\xfa\x30\xf2\x2f\xb2\x61\xe4\xcf\x09\
-\xd2\xfb\x5f\x7a\xfd\xf1\x04\xa0\x07\x23\xff\x22\x17\x46\xfe\x9c\
-\x28\xbd\xff\xa5\xd7\x1f\x4f\x00\x96\xcf\xc8\xbf\x3c\x46\xfe\x9c\
-\x2c\xbd\xff\xa5\xd7\x1f\x4f\x00\x96\xcb\xc8\xbf\xc8\x82\x91\x3f\
-\x03\xa4\xf7\xbf\xf4\xfa\xe3\x09\xc0\x32\x19\xf9\x17\x39\x30\xf2\
-\x67\x90\xf4\xfe\x97\x5e\x7f\x3c\x01\x58\x1e\x23\xff\xf2\x18\xf9\
-\x33\x4c\x7a\xff\x4b\xaf\x3f\x9e\x00\x2c\x87\x91\x7f\xf1\xec\x8d\
-\xfc\x99\x40\x7a\xff\x4b\xaf\x3f\x9e\x00\x2c\x83\x91\x7f\xf1\xdc\
-\x8d\xfc\x99\x48\x7a\xff\x4b\xaf\x3f\x9e\x00\xcc\xcf\xc8\xbf\x3c\
-\x46\xfe\x4c\x26\xbd\xff\xa5\xd7\x1f\x4f\x00\xe6\x63\xe4\x5f\x3c\
-\x6b\x23\x7f\xce\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\xe6\x61\xe4\x5f\
-\x3c\x67\x23\x7f\xce\x24\xbd\xff\xa5\xd7\x1f\x4f\x00\xce\xcf\xc8\
-\xbf\x3c\x46\xfe\x9c\x4d\x7a\xff\x4b\xaf\x3f\x9e\x00\x9c\x8f\x91\
-\x7f\xf1\x6c\x8d\xfc\x99\x41\x7a\xff\x4b\xaf\x3f\x9e\x00\x9c\x87\
-\x91\x7f\xf1\x5c\x8d\xfc\x99\x49\x7a\xff\x4b\xaf\x3f\x9e\x00\x4c\
-\xcf\xc8\xbf\x3c\x46\xfe\xcc\x26\xbd\xff\xa5\xd7\x1f\x4f\x00\xa6\
-\x63\xe4\x5f\x3c\x4b\x23\x7f\x16\x20\xbd\xff\xa5\xd7\x1f\x4f\x00\
-\xa6\x61\xe4\x5f\x3c\x47\x23\x7f\x16\x22\xbd\xff\xa5\xd7\x1f\x4f\
-\x00\xc6\x33\xf2\x2f\x8f\x91\x3f\x8b\x91\xde\xff\xd2\xeb\x8f\x27\
-\x00\xe3\x18\xf9\x17\xcf\xce\xc8\x9f\x05\x4a\xef\x7f\xe9\xf5\xc7\
-\x13\x80\x31\x8c\xfc\x8b\xe7\x66\xe4\xcf\x42\xa5\xf7\xbf\xf4\xfa\
-\xe3\x09\xc0\xfd\x19\xf9\x97\xc7\xc8\x9f\xc5\x4a\xef\x7f\xe9\xf5\
-\xc7\x13\x80\xd3\x19\xf9\x17\xcf\xca\xc8\x9f\x06\xd2\xfb\x5f\x7a\
-\xfd\xf1\x04\xe0\x34\x46\xfe\xc5\x73\x32\xf2\xa7\x89\xf4\xfe\x97\
-\x5e\x7f\x3c\x01\xb8\x3b\x23\xff\xf2\x18\xf9\xd3\x46\x7a\xff\x4b\
-\xaf\x3f\x9e\x00\x1c\xcf\xc8\xbf\x78\x36\x46\xfe\x34\x94\xde\xff\
-\xd2\xeb\x8f\x27\x00\xc7\x31\xf2\x2f\x9e\x8b\x91\x3f\x4d\xa5\xf7\
-\xbf\xf4\xfa\xe3\x09\xc0\x9b\x19\xf9\x97\xc7\xc8\x9f\xb6\xd2\xfb\
-\x5f\x7a\xfd\xf1\x04\xe0\x76\x46\xfe\xc5\xb3\x30\xf2\x67\x05\xd2\
-\xfb\x5f\x7a\xfd\xf1\x04\xe0\x66\x46\xfe\xc5\x73\x30\xf2\x67\x25\
-\xd2\xfb\x5f\x7a\xfd\xf1\x04\xe0\x75\x46\xfe\xe5\x31\xf2\x67\x35\
-\xd2\xfb\x5f\x7a\xfd\xf1\x04\xe0\xf7\x19\xf9\x17\x9f\xbd\x91\x3f\
-\x2b\x94\xde\xff\xd2\xeb\x8f\x27\x00\x1f\x32\xf2\x2f\x3e\x77\x23\
-\x7f\x56\x2a\xbd\xff\xa5\xd7\x1f\x4f\x00\x8c\xfc\xdf\x70\x8c\xfc\
-\x59\xad\xf4\xfe\x97\x5e\x7f\xbc\xe4\x00\x18\xf9\x17\x9f\xb5\x91\
-\x3f\x01\x92\xfb\x9f\xfa\x89\x0d\x80\x91\x7f\xf1\x39\x1b\xf9\x13\
-\x22\xb5\xff\xa9\x9f\x17\x12\x03\x60\xe4\x5f\x1e\x23\x7f\x62\x24\
-\xf6\x3f\xf5\xf3\x91\xa4\x00\x18\xf9\x17\x9f\xad\x91\x3f\x81\x92\
-\xfa\x9f\xfa\x79\x4d\x4a\x00\x8c\xfc\x8b\xcf\xd5\xc8\x9f\x50\x29\
-\xfd\x4f\xfd\xdc\x28\x21\x00\x46\xfe\xe5\x31\xf2\x27\x56\x42\xff\
-\x53\x3f\xb7\x5a\x73\x00\x8c\xfc\x8b\xcf\xd2\xc8\x1f\x56\xdd\xff\
-\xd4\xcf\x1b\xad\x35\x00\x46\xfe\xc5\xe7\x68\xe4\x0f\x2f\xac\xb5\
-\xff\xa9\x9f\xa3\xac\x31\x00\x46\xfe\xe5\x31\xf2\x87\x97\xd6\xd8\
-\xff\xd4\xcf\xd1\xd6\x14\x00\x23\xff\xe2\xb3\x33\xf2\x87\xd7\xac\
-\xa9\xff\xa9\x9f\x3b\x5b\x4b\x00\x8c\xfc\x8b\xcf\xcd\xc8\x1f\x6e\
-\xb4\x96\xfe\xa7\x7e\x4e\xb2\x86\x00\x18\xf9\x97\xc7\xc8\x1f\x6e\
-\xb1\x86\xfe\xa7\x7e\x4e\xd6\x39\x00\x46\xfe\xc5\x67\x65\xe4\x0f\
-\x6f\xd4\xb9\xff\xa9\x9f\x7b\xeb\x1a\x00\x23\xff\xe2\x73\x32\xf2\
-\x87\xa3\x74\xed\x7f\xea\x67\x88\x8e\x01\x30\xf2\x2f\x8f\x91\x3f\
-\x1c\xa9\x63\xff\x53\x3f\xc3\x74\x0a\xc0\xee\x6f\xfc\x3f\x6e\xe4\
-\x7f\xcb\xcb\x61\xe4\x0f\x77\xd6\xa9\xff\xb9\x00\xb8\x00\x0c\xd7\
-\x2a\x00\xfe\xd6\x7f\xeb\xe7\xb2\x9f\x8a\xcc\x9d\x25\xe8\xa6\x55\
-\xff\x73\x01\x70\x01\x18\xad\x53\x00\x9c\x1b\x8f\x91\x3f\x9c\xa8\
-\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\x9c\x57\x5e\x06\x23\x7f\
-\xb8\xb7\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x70\x5e\xbe\x08\
-\x7e\xca\x1f\x86\xe8\xd4\xff\x5c\x00\x5c\x00\x86\xeb\x14\x00\xe7\
-\xc5\x31\xf2\x87\x41\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\x20\
-\xf9\x18\xf9\xc3\x78\x9d\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x90\
-\x7a\x8c\xfc\x61\x1a\x9d\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x10\
-\x7a\x8c\xfc\x61\x22\x9d\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x90\
-\x74\x8c\xfc\x61\x7a\x9d\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x90\
-\x72\x8c\xfc\xe1\x3c\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\x20\
-\xe4\x18\xf9\xc3\x99\x74\xea\x7f\x2e\x00\x2e\x00\xc3\x75\x0a\xc0\
-\x9a\x8f\x91\x3f\x9c\x5f\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\
-\xac\xf5\x18\xf9\xc3\x3c\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\
-\x60\xa5\xc7\xc8\x1f\x66\xd2\xa9\xff\xb9\x00\xb8\x00\x0c\xd7\x29\
-\x00\x6b\x3a\x46\xfe\x30\xbf\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\
-\x01\x58\xcb\x31\xf2\x87\x65\xe8\xd4\xff\x5c\x00\x5c\x00\x86\xeb\
-\x14\x80\x95\x1c\x23\x7f\x58\x88\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\
-\x4e\x01\xe8\x7c\x8c\xfc\x61\x79\x3a\xf5\x3f\x17\x00\x17\x80\xe1\
-\x3a\x05\xa0\xeb\x31\xf2\x87\x65\xea\xd4\xff\x5c\x00\x5c\x00\x86\
-\xeb\x14\x80\xa6\xc7\xc8\x1f\x16\xaa\x53\xff\x73\x01\x70\x01\x18\
-\xae\x53\x00\x3a\x1d\x23\x7f\x58\xbe\x4e\xfd\xcf\x05\xc0\x05\x60\
-\xb8\x4e\x01\xe8\x72\x8c\xfc\xa1\x87\x4e\xfd\xcf\x05\xc0\x05\x60\
-\xb8\x4e\x01\x68\x72\x8c\xfc\xa1\x89\x4e\xfd\xcf\x05\xc0\x05\x60\
-\xb8\x4e\x01\x58\xf2\x31\xf2\x87\x7e\x3a\xf5\x3f\x17\x00\x17\x80\
-\xe1\x3a\x05\x60\xa9\xc7\xc8\x1f\x7a\xea\xd4\xff\x5c\x00\x5c\x00\
-\x86\xeb\x14\x80\x85\x1e\x23\x7f\x68\xaa\x53\xff\x73\x01\x70\x01\
-\x18\xae\x53\x00\x96\x74\x8c\xfc\xa1\xbf\x4e\xfd\xcf\x05\xc0\x05\
-\x60\xb8\x4e\x01\x58\xca\x31\xf2\x87\x75\xe8\xd4\xff\x5c\x00\x5c\
-\x00\x86\xeb\x14\x80\x85\x1c\x23\x7f\x58\x89\x4e\xfd\xcf\x05\xc0\
-\x05\x60\xb8\x4e\x01\x98\x35\x7c\x46\xfe\xb0\x3a\x9d\xfa\x9f\x0b\
-\x80\x0b\xc0\x70\x9d\x02\x30\x5b\xf0\x8c\xfc\x61\x95\x3a\xf5\x3f\
-\x17\x00\x17\x80\xe1\x3a\x05\x60\xa6\x63\xe4\x0f\x2b\xd5\xa9\xff\
-\xb9\x00\xb8\x00\x0c\xd7\x29\x00\x67\x0d\x9b\x91\x3f\xac\x5e\xa7\
-\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\x9c\x2d\x68\x46\xfe\x10\xa1\
-\x53\xff\x73\x01\x70\x01\x18\xae\x53\x00\xce\x74\x8c\xfc\x21\x44\
-\xa7\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\x4c\x1a\x2e\x23\x7f\x88\
-\xd3\xa9\xff\xb9\x00\xb8\x00\x0c\xd7\x29\x00\x93\x05\xcb\xc8\x1f\
-\x22\x75\xea\x7f\x2e\x00\x2e\x00\xc3\x75\x0a\xc0\x44\xc7\xc8\x1f\
-\x42\x75\xea\x7f\x2e\x00\x2e\x00\xc3\x75\x0a\xc0\xd0\x30\x19\xf9\
-\x43\xbc\x4e\xfd\xcf\x05\xc0\x05\x60\xb8\x4e\x01\x18\x16\x24\x23\
-\x7f\xe0\x41\xaf\xfe\xe7\x02\xe0\x02\x30\x5c\xa7\x00\x0c\x3a\x46\
-\xfe\xc0\x0b\x9d\xfa\x9f\x0b\x80\x0b\xc0\x70\x9d\x02\x70\xaf\xf0\
-\x18\xf9\x03\x07\x3a\xf5\x3f\x17\x00\x17\x80\xe1\x3a\x05\xe0\xe4\
-\xe0\x18\xf9\x03\x37\xe8\xd4\xff\x5c\x00\x5c\x00\x86\x7b\xf8\x78\
-\xfb\xf9\xb9\x1f\xec\xc4\xc7\xc8\x1f\xb8\x51\xfa\x17\x60\x7a\xfd\
-\xf1\x76\x17\x80\x3f\x3f\xf7\x83\x9d\x24\x2c\x46\xfe\xc0\x1b\xa4\
-\x7f\x01\xa6\xd7\x1f\xef\xe1\x2f\xbf\xf7\x67\xe6\x7e\xb0\xc3\x83\
-\x62\xe4\x0f\x1c\x21\xfd\x0b\x30\xbd\xfe\x78\xbf\xf0\xe4\xc9\x1f\
-\x78\xb4\xd9\x7e\x73\xee\x87\x3b\xf0\x18\xf9\x03\x47\x49\xff\x02\
-\x4c\xaf\x9f\x9d\xdd\x05\xe0\x3f\xcd\xfd\x70\xef\x1d\x0e\x23\x7f\
-\xe0\x8e\xd2\xbf\x00\xd3\xeb\xe7\xc1\x3e\x04\xdb\x2f\xce\xfd\x70\
-\xef\x15\x8c\xcd\xf6\x6b\xfb\x1f\x66\x9c\xfb\x73\x04\x7a\x49\xff\
-\x02\x4c\xaf\x9f\x9d\x87\xef\xbc\xf7\x57\xe6\x7e\xb8\xf7\x38\x46\
-\xfe\xc0\x49\xd2\xbf\x00\xd3\xeb\x67\xe7\xc9\x93\x27\x1f\xbf\xb8\
-\xda\xfe\xd6\xdc\x0f\xf8\x4e\x61\x30\xf2\x07\xee\x29\xfd\x0b\x30\
-\xbd\x7e\x5e\xda\x7d\xb8\x3f\x33\xf7\x03\xbe\xc3\x97\xbf\x91\x3f\
-\x70\x6f\xe9\x5f\x80\xe9\xf5\xf3\xd2\xdb\xef\x6e\xff\xd8\xee\x03\
-\xfe\x9d\xb9\x1f\xf2\x11\xc7\xc8\x1f\x18\x22\xfd\x0b\x30\xbd\x7e\
-\x5e\xf1\x68\xb3\xfd\xa9\xb9\x1f\xf2\xad\x0f\xdf\xc8\x1f\x18\x2c\
-\xfd\x0b\x30\xbd\x7e\x5e\x71\xf9\x95\x67\xdf\xbf\xfb\x92\xfd\x8d\
-\xb9\x1f\xf4\x0d\x5f\xfe\x46\xfe\xc0\x70\xe9\x5f\x80\xe9\xf5\x73\
-\xe0\x72\xf3\xde\x5f\xdc\x7d\xd0\xbf\x37\xf7\xc3\x7e\xe5\x18\xf9\
-\x03\x93\x48\xff\x02\x4c\xaf\x9f\x1b\x5c\x6e\xae\x7f\x62\xf6\x87\
-\xfd\x62\xe4\xbf\xfd\xe9\x2f\x3d\x7b\xf6\x89\xb9\x3f\x0f\x60\x9d\
-\xd2\xbf\x00\xd3\xeb\xe7\x16\x17\x57\xdb\x7f\x32\xe3\x97\xbf\x7f\
-\xcb\x1f\x98\x5c\xfa\x17\x60\x7a\xfd\xdc\xe2\xad\xb7\x9e\x7f\x6c\
-\xf7\x81\xff\xcb\xb3\x3f\xe8\xcd\xf5\xf6\xe1\xe3\x0f\x3e\x3d\x77\
-\xfd\xc0\xfa\xa5\x7f\x01\xa6\xd7\xcf\x1b\x5c\x6e\xb6\x7f\xeb\x1c\
-\xff\xb1\x20\x3f\xe5\x0f\x9c\x5b\xfa\x17\x60\x7a\xfd\x1c\x61\xf7\
-\xc1\x7f\x6e\xe2\xdf\x0e\xf8\xaf\x0f\x37\xdb\x1f\x9a\xbb\x4e\x20\
-\x4b\xfa\x17\x60\x7a\xfd\x1c\xe9\xcb\x5f\x7e\xf6\x7d\x8f\x36\xd7\
-\x7f\x6f\x77\xbe\x31\xee\x81\x6e\xff\xcf\xa3\xcd\xf6\x1f\xed\xff\
-\xb7\xe7\xae\x0f\xc8\x93\xfe\x05\x98\x5e\x3f\x77\xf4\xf6\xe6\xfd\
-\x4f\xed\x2f\x02\xf7\xf9\x6f\x07\xec\x7f\xaf\xff\x62\x73\xfd\x77\
-\x2f\x37\xff\xf1\x8f\xce\x5d\x0f\x90\x2b\xfd\x0b\x30\xbd\x7e\x4e\
-\xb4\xdf\xd5\x5f\x5e\x6d\xff\xda\x8b\xdf\x16\xd8\x5c\xff\xea\x7e\
-\x87\x7f\xfb\x83\xdb\xfe\xdf\xdd\xf9\xb5\xdd\x97\xfe\x3f\xdd\x8f\
-\xfa\xfd\x6a\x1f\xb0\x04\xe9\x5f\x80\xe9\xf5\x33\xc8\x8b\x0b\xc1\
-\xbb\xef\x7f\xe6\xe1\xd5\xd3\xcf\x5e\x3e\x7e\xef\x87\xf7\x3f\x37\
-\xb0\xff\xb2\xff\xb7\xff\xee\xbd\x3f\xb5\xff\xaf\x0d\xce\xfd\xe7\
-\x03\x38\xb4\x9f\x68\xee\xbf\x58\x3a\x9c\xfd\x9f\x55\xfd\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x70\x8a\xff\x0f\xe0\x81\x47\x03\x4d\xd4\x98\x65\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x34\x87\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x0b\x9c\x5c\x45\x95\xf8\x71\x14\x91\x87\x88\xa2\x28\xa0\xf2\
-\x54\x17\x11\x50\x44\x51\x16\x45\x51\xc4\xd7\x8a\xbb\xeb\x9b\x15\
-\x59\x75\x45\x71\xf9\xa3\xa0\xac\xf8\x46\x45\xc5\x45\x5d\x51\xd1\
-\xdd\x88\x1a\x4d\xcc\xf4\xed\x72\x42\xe2\xd0\x5d\xd5\x93\x44\x9b\
-\x30\x5d\xd5\x13\x76\xd0\x20\x0f\x79\x8b\x80\x02\xf2\x7e\x3f\x93\
-\xfc\x4f\xf5\x0c\x2e\x60\x08\x99\x99\xee\x3a\xb7\xbb\x7e\xdf\xcf\
-\xe7\x7c\xc2\x46\x57\xe6\xd4\x74\x9d\x7b\xea\xf6\xbd\x55\x1b\x6c\
-\x00\x94\xcc\x7c\x3b\xbe\xc5\x82\xda\xd8\x96\x95\xc6\x99\xdb\x0d\
-\xd7\xc6\x76\x2e\x46\xfd\xee\x66\x74\xfc\xc5\x31\x86\x97\xb4\x9f\
-\x1b\xff\xee\x81\x18\x5a\xd2\x7a\x46\xfc\xef\xc6\x58\xb3\x66\xcd\
-\x63\xb4\x7f\x76\x00\x00\x20\x4c\x6d\xc5\x36\x85\x1d\xdb\xa7\xe2\
-\xda\x6f\xad\xba\x70\x78\xe1\xfc\xe7\x0a\x1b\x4e\xaa\x3a\xff\xf3\
-\xaa\x0d\x0d\xf9\xbb\xdf\x54\xad\xbf\x42\xfe\xbc\xb1\xb0\x7e\xb5\
-\xfc\xb9\x66\x36\x21\xff\x1b\x37\x17\x2e\x5c\x2e\xff\xdb\x2b\xe5\
-\x7f\xb7\x29\x7f\xb7\x48\xfe\x6e\xae\xfc\xfb\xbe\x2d\xff\xf7\x31\
-\xf2\xcf\xef\x36\xb6\xfd\x8a\xe1\x9a\xdf\x61\xce\xc4\xc4\x46\xda\
-\xe3\x03\x00\x40\x5f\x8a\x17\x51\x53\x0f\x7b\x14\x8d\xd6\xdb\x8a\
-\x86\xff\x84\x5c\xdc\x4f\x96\xa8\xc9\x85\xfe\x3c\x89\x3b\x67\x7b\
-\x41\xef\x6d\xf8\x55\xd2\x28\xfc\x49\xfe\x1c\x97\x3f\x87\xa5\x71\
-\x38\xc1\x38\xff\xde\xa1\x7a\xeb\x25\xa6\xd9\xdc\x5c\x7b\x6c\x01\
-\x00\x28\x85\x85\x76\xfc\x59\x95\x7a\xfb\x8d\xb2\x92\x3e\xb6\xb3\
-\x82\x77\xfe\x6c\xf9\xe7\x7b\xf5\x2f\xe4\xbd\x89\xce\x9d\x04\x17\
-\x46\xe3\xdd\x03\x63\xfd\x87\x62\x63\xc0\x5d\x03\x00\xc0\x40\x5b\
-\xb4\xa8\xf9\xe4\x78\xb1\x97\xd5\xfc\x97\xe5\x22\xb8\x2c\xde\xa2\
-\xd7\xbe\x20\x97\x22\x6c\xb8\x4b\xfe\x6c\xcb\xb8\x7c\xa7\x6a\x5b\
-\x87\x18\xd7\xda\x85\x67\x0f\x00\x00\x7d\x2b\x5e\xc8\x8c\x6b\xbf\
-\x4f\x56\xf4\xa7\xc8\xc5\xed\xdc\xce\xed\x71\xed\x8b\x6d\x9f\x44\
-\xe1\xc2\x4d\xf2\xe7\xa8\xb1\xed\xcf\xc6\xe7\x1d\x9a\xcd\xe6\xe3\
-\xb4\x7f\x9f\x00\x00\xac\xd5\x82\x91\x89\xad\xe4\xc2\xf5\x0e\x89\
-\x39\x85\xf3\x57\x6a\x5f\x44\x07\x2a\xac\xbf\x5d\x62\x69\xfc\xaa\
-\x24\xbe\xb9\xc0\x1d\x02\x00\x80\x9a\xce\xc3\x7a\x36\xbc\xaa\xb0\
-\xfe\xab\x12\x13\xac\xf0\xd3\x85\x34\x58\x57\xcb\x98\x2f\x30\xf5\
-\xf6\xbb\xe2\x2b\x8e\xda\x9f\x05\x00\xc0\x80\x8b\x4f\xb2\xc7\x8b\
-\x8e\xac\xf2\x7f\x21\x71\xab\xf6\x85\x90\xe8\x7c\x5d\x70\xb7\xfc\
-\x59\xaf\xd6\x5b\x87\x0d\x2d\x6b\x6f\xad\xfd\x19\x01\x00\x0c\x88\
-\xc5\x8b\x5b\x4f\x94\xd5\xfd\xc1\x55\xeb\x17\x96\xff\x35\xbc\xdc\
-\xc3\xaf\x92\xdf\xd1\x98\x71\xed\x8f\x9b\xd1\xf1\x9d\xb4\x3f\x3b\
-\x00\x80\x3e\xd3\xb9\xe8\xdb\xd6\x21\x55\x1b\x16\x4f\x3d\xa5\x5e\
-\x82\x8b\x1b\x31\x9d\x88\x9b\x20\xc5\x66\xa0\x70\xe1\x83\x66\xe9\
-\xc4\x93\xb4\x3f\x53\x00\x80\x12\x8b\x0f\x98\x4d\x3e\xc4\xc7\xed\
-\xfd\x41\x8a\xce\xd7\x04\x36\x9c\x16\x1f\xd2\xe4\x8d\x02\x00\x40\
-\x47\x67\x6b\x5d\x17\x3e\x59\xd8\x70\x81\xf6\x85\x8a\x48\xd0\x0c\
-\xd8\xf0\xe7\xc2\xfa\x13\x2b\xb5\xf6\xae\xda\x9f\x3d\x00\x40\x62\
-\xc6\x98\x0d\x8d\x6b\xbf\x45\x2e\x04\xbf\x94\x0b\xc2\x7d\xda\x17\
-\x25\x42\xa3\x11\xf0\xab\xe3\xab\x85\xf2\xfb\x3f\xe8\xb8\xe3\xd6\
-\x3c\x56\xfb\x33\x09\x00\xe8\xa1\xf8\xdd\x7e\xdc\x82\x96\xd5\x3e\
-\xf1\xe0\x28\x5c\xb8\x34\xee\x31\x70\xea\xd2\x15\x4f\xd5\xfe\x8c\
-\x02\x00\xba\x28\x3e\x11\x2e\x45\xfe\xeb\x55\xb6\xdf\x25\xd6\x15\
-\x36\xdc\x25\xcd\xe1\xbc\x78\x18\x93\xf6\x67\x16\x00\x30\x0b\x9d\
-\x87\xfa\xa4\xa0\x73\x9b\x9f\x98\x76\x74\xbe\x1e\x18\xdb\x47\xfb\
-\x33\x0c\x00\x98\x86\xc2\xb6\xde\x54\x58\xbf\x42\xfd\x22\x42\x0c\
-\x42\x8c\x56\x5c\x6b\x3f\xed\xcf\x34\x00\x60\x1d\x0a\x17\x5e\xdb\
-\x39\x8b\x5e\xff\xa2\x41\x0c\x5c\xf8\x56\x7c\x60\x50\xfb\x33\x0e\
-\x00\x78\x90\x78\xcc\x2e\x17\x7e\x22\x49\xd8\xe0\x2b\xb6\xf5\x3a\
-\xed\xcf\x3c\x00\x64\xcd\x34\xc2\x1b\xb8\xf0\x13\x4a\x31\x3a\x64\
-\xdb\x2f\xd0\x9e\x03\x00\x90\x15\x63\xc7\x9f\x2f\x17\x7e\x5b\x82\
-\x8b\x00\x91\x75\x74\x4e\x80\x34\x15\xd7\xde\x51\x7b\x4e\x00\xc0\
-\x40\x1b\x5a\xd2\x7a\xc6\xd4\x56\xbd\xf7\xeb\x17\x7f\x82\x98\x8c\
-\xc2\xf9\x3b\xe2\x6b\xa6\x9c\x39\x00\x00\x5d\x36\x32\x32\xb1\x99\
-\xb1\xe1\x0b\x55\xeb\x6f\xd7\x2e\xf6\x04\xf1\x48\x51\xd8\x70\xad\
-\xfc\x79\x38\x3b\x0b\x02\xc0\x2c\xad\x59\xb3\xe6\x31\xf1\x00\x17\
-\xb9\xf0\xff\x41\xbb\xb8\x13\xc4\x34\xe2\x37\xa6\x11\x5e\xaa\x3d\
-\x7f\x00\xa0\x2f\xc5\xdd\xd8\x64\x45\x15\x4a\x50\xcc\x09\x62\xda\
-\x31\xf9\x35\x95\xff\x76\xdc\x7e\x5a\x7b\x2e\x01\x40\x5f\x30\x26\
-\x6c\x2a\x2b\xfe\xaf\x49\xdc\xab\x5d\xc4\xfb\x2d\xa4\x61\xba\x2d\
-\xde\x2d\x99\xda\x04\xa9\x2e\x17\xa0\x9f\x75\x9e\x99\xb0\xe1\xa4\
-\xf8\x1d\x75\xe1\xfc\x97\xe2\x9e\xf7\xc6\xb5\x3f\x1e\xcf\x44\x98\
-\x3a\x17\xe1\xa8\xf8\x77\x0f\x84\xfc\xdd\xa7\x26\xb7\x4d\xf6\xdf\
-\x8d\xbb\x28\xca\x9f\x23\x55\x1b\xce\x90\x38\x47\xfe\xff\xaf\x8c\
-\xdf\x77\x6b\xe7\xd9\x4f\x21\xe3\x75\x55\xc5\xb5\xdf\xaa\x3d\xaf\
-\x00\xa0\xd4\xe2\x46\x3e\x72\xf1\xba\x58\xbb\x68\x97\x31\xe4\x42\
-\x72\xa7\xc4\x79\xf2\xcf\x75\xb9\x30\x9f\x5c\x34\xfc\x27\x8a\x46\
-\xeb\x6d\x71\xbb\xe3\x85\x76\xfc\x59\x73\x9b\xcd\x4d\x52\xfd\x9e\
-\x4c\x23\x3c\x25\xbe\x02\x57\x69\xf8\x37\xcb\xcf\x73\xb8\x34\x07\
-\xc7\x4f\x36\x1b\xfe\x74\xf9\x1d\xfe\x45\x7b\xac\x4a\x19\x36\x9c\
-\xc6\xdb\x02\x00\xf0\x30\x0b\x46\x26\xb6\xea\x5c\x40\xe2\x11\xad\
-\xda\x85\x5a\x39\xe4\x22\x7a\x8f\x5c\x2c\x56\xca\x85\x74\xbe\xc4\
-\x27\xe3\x5e\x07\xf1\x02\xaf\xfd\x3b\x9a\x8e\x78\xaa\x9e\xb1\xed\
-\x57\x54\xeb\xad\xc3\xe4\x77\xfa\x2d\xc9\xa7\x21\xf1\x27\xed\xb1\
-\x55\x0f\xeb\x6f\x97\x71\xf9\x48\x7c\xb6\x45\xfb\x77\x04\x00\xea\
-\x64\x35\xfb\x1e\xb9\xf8\x5f\xa7\x5e\x9c\x55\xc2\xaf\x92\x0b\xfe\
-\xef\xe4\xc2\xf0\x3f\x45\x3d\x1c\x5a\x8c\xfa\xdd\xe7\x4c\x4c\x6c\
-\xa4\xfd\x3b\xe9\x15\x73\x5a\x78\xa6\xb1\xe1\x9f\x3b\x5f\xf1\xb8\
-\xb0\x4c\x9a\x83\x9b\xf5\x7f\x07\xe9\x43\xf2\x76\xf1\x95\x56\xed\
-\xdf\x07\x00\xa8\x88\xb7\x91\xa5\x18\x1a\xed\x62\x9c\x34\x26\x5f\
-\x63\x1c\x95\x0b\xff\x17\xe3\x76\xb2\xf3\xed\xf8\x16\xda\xbf\x07\
-\x4d\xf1\x75\xb9\xe1\x86\x7f\xde\xe4\xb3\x08\xbe\x9a\x53\x23\x28\
-\xf9\xde\x20\x7f\xbe\x53\xfb\x77\x00\x00\x49\x55\xac\x3f\x20\x3e\
-\x50\xa6\x5d\x84\x93\x14\x7a\x17\x2e\x2d\x6c\xf8\x4e\x7c\xbe\xc1\
-\x5a\xbb\xb1\xf6\xd8\x97\xdd\x70\x6d\x6c\xe7\xd8\x10\xc8\xd8\x99\
-\x4c\xee\x10\x98\xd8\x0c\x6b\x8f\x3b\x00\xf4\x54\x7c\x50\xad\xf3\
-\x44\xfa\x00\x7f\xd7\x3f\x75\xd1\xaa\x54\x6d\xf8\xd7\x85\x6e\xf9\
-\xb6\xda\x63\xde\xcf\x62\xc3\x14\x0f\x7a\x8a\x6f\x32\x54\xad\xbf\
-\x46\xfb\x77\xdb\xb3\xcf\x4c\xe7\xed\x8a\xf0\x5a\xed\xf1\x06\x80\
-\x9e\x88\xdf\x6f\xc7\x87\xdb\xb4\x8b\x6d\x6f\x0a\x78\xb8\x29\xbe\
-\x32\x17\x37\x2d\x8a\xbb\x16\x6a\x8f\xf5\x20\x8a\x5f\x17\xc4\x37\
-\x1e\xe2\xd7\x27\x32\xd6\xbf\xd7\xfe\x9d\x77\xfd\x33\x24\x4d\x71\
-\x67\x3b\x61\x63\x36\xd4\x1e\x6b\x00\xe8\x8a\xce\x6e\x7e\xf1\x95\
-\xb5\xf8\x74\x7b\x09\x0a\x6d\x17\x0b\xf6\x0d\xd2\xd0\xfc\xa4\xb0\
-\xad\x37\x19\x73\xee\xe3\xb5\xc7\x39\x37\xa6\xd6\xda\x33\x6e\xb4\
-\x33\xb5\xfd\xae\xfa\xe7\xa1\x8b\x9f\xab\x25\xc6\x9e\xf1\x34\xed\
-\xf1\x05\x80\x59\x89\xbb\xa0\x55\x07\xea\x41\x3f\xbf\xaa\x6a\xfd\
-\xd2\xf8\xc4\x3e\x2b\xfd\x72\x88\x2b\xe6\xc9\xfd\x23\xe2\x1d\x98\
-\xc1\xd8\xa4\x28\x7e\x25\x50\x69\xf8\x7d\xb5\xc7\x16\x00\x66\x64\
-\xc8\x8d\xed\x26\x45\xf9\x02\xed\x62\xda\x95\xb0\xfe\x0f\xf1\x30\
-\x22\xb3\x74\x6c\x7b\xed\x71\xc5\x23\x8b\x0f\xd3\xc9\x0a\xfa\xdf\
-\x3b\xaf\x56\x6a\x7f\x66\x66\xdf\x04\xdc\x23\xf3\xe7\x48\xed\x31\
-\x05\x80\x69\x91\x22\xfc\xee\xce\xb6\xb4\x25\x28\xa4\x33\x2f\xc0\
-\xe1\x7e\xb9\xf0\x2f\x8c\xab\x4b\x4e\x77\xeb\x3f\x15\xd7\xde\x7f\
-\xea\xf7\xd7\xef\x47\x47\x57\x4c\xb3\xb9\xb9\xf6\x78\x02\xc0\x3a\
-\xc5\x4d\x6c\xe2\x2b\x6f\x25\x28\x9a\xb3\x08\x7f\x4b\xfc\x6e\x39\
-\xbe\x8e\xa6\x3d\x9e\x98\xbd\x78\xd7\xa6\x73\x0e\x82\xf5\xd7\xeb\
-\x7f\xb6\x66\x18\x36\x9c\x33\x5c\xf3\x3b\x68\x8f\x25\x00\xac\x55\
-\xdc\xd9\x4c\x2e\x9c\x2d\xf5\x62\x39\xc3\x90\x0b\xc4\x65\x52\x68\
-\x8f\xce\x7d\x73\x9e\x41\x15\x0f\x99\x92\x46\xe0\xc3\xfd\x7a\xb4\
-\x74\xe1\xfc\xd5\x1c\x31\x0c\xa0\x74\xe2\xc1\x30\x52\x58\xaf\xd0\
-\x2e\x92\x33\x0b\x7f\x76\x7c\x7d\x8f\xd7\xaf\xf2\xd0\xb9\x4b\xd5\
-\xf0\xef\xef\xc7\x43\xa7\xe2\x43\x8e\x9c\x2c\x08\xa0\x34\x4c\xa3\
-\x7d\x60\x3f\xee\xd8\x56\xd8\x70\x6e\x7c\x9a\x9f\x0b\x7f\x9e\xe2\
-\x73\x1d\xb1\xf1\x93\x06\xf0\x7c\xed\xcf\xe2\xf4\x3e\xb7\x71\x13\
-\x2d\xff\x45\xed\xf1\x03\x90\xb9\x78\x4b\x55\x2e\xa4\xf7\x69\x17\
-\xc5\x69\x15\x50\xe7\x7f\x17\x8f\xd1\xe5\x44\x36\x44\x9d\x46\xc0\
-\xfa\x77\xcb\x67\xe3\x12\xed\xcf\xe6\xf4\x3e\xc7\x61\x4e\xb3\xd9\
-\x7c\x9c\xf6\xf8\x01\xc8\xcc\xd4\xea\xe9\x1b\xda\x45\x70\x5a\x05\
-\xd3\x86\x0b\x8c\xf5\x6f\xe7\x89\x7e\xac\x4d\xdc\xcc\x49\x3e\x23\
-\x47\xf5\xd9\xc3\x82\xa3\x3c\xb3\x02\x20\x99\xb8\x9f\x7f\x35\xee\
-\x75\xaf\x5f\xfc\xd6\xf3\xc2\x1f\x77\xec\xf3\xc7\x72\x10\x0f\xd6\
-\x47\x7c\xe5\x2e\xde\x62\xaf\xda\x70\x97\xf6\x67\x77\x3d\x3f\xdf\
-\x13\x0b\x46\x26\xb6\xd2\x1e\x37\x00\x03\xee\xd4\xa5\x2b\x9e\x2a\
-\xc5\x71\x5c\xbb\xe8\xad\x57\x61\xec\x6c\xa4\xe2\xbf\xb5\xa0\x36\
-\xb6\xa5\xf6\xb8\xa1\xff\xc4\xd7\xee\xe4\xf3\xb3\xa0\x1f\x0e\xae\
-\x8a\x5f\x6b\x99\xda\x8a\x6d\xb4\xc7\x0c\xc0\x80\x1a\x5a\xd6\xde\
-\x3a\x3e\x31\xaf\x5d\xec\xd6\x2b\x6c\x38\xcd\x34\xc2\x73\xb4\xc7\
-\x0c\xfd\xaf\xe2\x5a\xfb\xc5\x07\x46\xd5\x3f\xd3\x8f\xd6\x04\x58\
-\x7f\x99\x19\x1d\xdf\x49\x7b\xbc\x00\x0c\x98\xce\x66\x2a\xd6\x5f\
-\xa4\x5d\xe4\xd6\x23\x2e\x89\x6f\x25\x68\x8f\x17\x06\x4b\xe7\xf9\
-\x00\xe7\x3f\x57\xf6\xaf\x05\x0a\x17\x2e\xa7\xf1\x05\xd0\x35\x71\
-\x55\x21\x85\xe5\x52\xed\xe2\xb6\xee\xd5\x4f\xb8\x2f\xee\x40\x38\
-\x6f\x74\xe5\x13\xb4\xc7\x0b\x83\x2b\xee\x0e\x29\x8d\xb0\xd3\xfe\
-\xbc\xaf\x33\xac\xbf\x26\xee\xcb\xa1\x3d\x56\x00\xfa\xdc\xd4\x81\
-\x3e\x7f\x56\x2f\x6a\xeb\x0c\x3f\x4e\xc1\x43\x4a\xf2\x99\x3b\x58\
-\xe2\x3a\xfd\xcf\xfe\x23\xce\x89\xeb\xa4\x69\xdf\x4b\x7b\x9c\x00\
-\xf4\xa9\x58\x40\xca\x5c\xe4\xe4\xe7\xbb\xd5\x34\xc2\xff\xe3\xb5\
-\x3e\x68\x58\xe8\x96\x6f\x2b\x9f\xc3\xba\xf6\x3c\x78\xc4\xf9\x61\
-\xfd\xf5\xc5\xa8\xdf\x5d\x7b\x9c\x00\xf4\x99\xa1\x5a\xfb\x65\x72\
-\x81\xbd\x49\xbb\x88\x3d\xf2\xc5\xdf\x8f\xf1\xc0\x13\xb4\xc5\xcd\
-\xa4\xa6\xce\x17\xb8\x5d\x7b\x4e\xac\xbd\x09\x08\x7f\xe6\x99\x00\
-\x00\xeb\x2d\xde\x4e\xef\xbc\x3b\x5f\x82\x02\xb6\x96\x82\x76\x5f\
-\x7c\x47\x9b\xed\x7b\x51\x26\xb1\x19\xad\xda\x70\x86\xf6\xfc\x58\
-\x6b\x58\x7f\x45\xc5\xb5\x77\xd4\x1e\x23\x00\x25\x57\xa9\xb5\x77\
-\x95\x15\xcd\x5f\xd4\x8b\xd6\x5a\xc3\x9f\xcf\xf7\x9a\x28\xab\xd8\
-\x94\xc6\x37\x05\xe4\x33\x7a\xbf\xfe\x5c\x79\x78\xe3\xec\x2f\x62\
-\x9f\x00\x00\x8f\x68\xf2\x55\xbf\xf0\x47\xed\x62\xb5\x96\xe2\xb5\
-\x3a\xee\x7b\xce\x13\xfe\xe8\x07\x45\xcd\xbf\xb2\x8c\x0f\xce\xc6\
-\xcd\x82\xe2\x46\x5e\xda\xe3\x03\xa0\x64\x16\xda\xf1\x67\xc5\x8d\
-\x44\xb4\x8b\xd4\xdf\x16\xad\x70\x93\x71\xed\xb7\x68\x8f\x0f\x30\
-\x1d\x43\x4b\x5a\xcf\x88\xcf\xa9\x68\xcf\x9f\xb5\xc4\x99\x9c\x1d\
-\x00\xe0\xaf\x8c\x3d\xe3\x69\xa5\x3c\x12\xd5\x86\x95\x3c\xc0\x84\
-\x7e\x15\x4f\xea\x93\x06\xf6\xeb\xa5\xdb\x4a\xd8\xfa\x66\xdc\xd8\
-\x48\x7b\x7c\x00\x28\x93\x0b\xec\x53\xca\xb8\xbd\x6f\x61\xc3\xbc\
-\x91\x91\x89\xcd\xb4\xc7\x07\x98\xad\x78\xf4\xb4\xcc\xb1\x5b\xb4\
-\xe7\xd4\x43\xe6\x97\x0b\x3f\xd4\x1e\x17\x00\x8a\xe2\xe9\x78\x65\
-\x7b\x72\x79\xea\x00\x9f\x7f\xd7\x1e\x1b\xa0\x9b\xe2\x86\x5a\xb2\
-\xf2\xfe\x83\xf6\xfc\x7a\x58\x13\xf0\x49\xed\x71\x01\xa0\x20\xbe\
-\xbf\x2c\xab\x92\x9f\x6b\x17\xa1\x87\x84\x0d\x7f\x8a\xfb\x0f\x68\
-\x8f\x0d\xd0\x0b\x53\x87\x69\x95\xe8\x24\x4d\xbf\x2a\xde\x9d\xd0\
-\x1e\x17\x00\x89\xc9\x4a\xfb\x4b\xfa\x05\xe8\x21\xc5\xe8\xec\xf8\
-\x20\xa2\xf6\xb8\x00\xbd\x64\x4c\xd8\x54\x56\xde\xbf\xd0\x9f\x6f\
-\x93\x21\x75\xe0\x4e\xd3\x08\x2f\xd5\x1e\x17\x00\x89\x14\xd6\xbf\
-\xbb\x4c\x0f\x26\xc9\xcf\xb2\xc4\x2c\x9d\x78\x92\xf6\xb8\x00\x29\
-\x4c\xdd\x7d\xfb\xa2\xf6\xbc\x7b\x50\xf3\x7d\x5d\xc5\xb6\x9e\xad\
-\x3d\x2e\x00\x7a\xac\xe2\xda\xfb\xc7\xef\xd9\xf5\x8b\xce\x5f\x2f\
-\xfe\xff\x1d\x9f\x96\xd6\x1e\x17\x20\xb5\xc2\x85\x0f\x4e\xee\x6c\
-\x59\x86\x79\x18\xce\x5d\xbc\xb8\xf5\x44\xed\x31\x01\xd0\x23\xc3\
-\x0d\xff\x3c\x99\xec\x37\x6a\x17\x9b\xa9\x0b\xff\xea\xb8\x0a\xd2\
-\x1e\x13\x40\x93\x5c\x78\x0f\xaa\xda\x70\x97\xf6\x7c\x9c\x8a\x45\
-\xf1\xee\x84\xf6\x98\x00\xe8\xb2\xb8\x03\x98\xac\x38\x2e\x2d\x41\
-\x91\x89\x4f\x1f\xdf\xcd\xc3\x47\xc0\x24\xd3\x08\x6f\x28\x9c\xbf\
-\x43\x7b\x5e\xc6\x30\xce\x7f\x4c\x7b\x3c\x00\x74\x51\x3c\x2e\x57\
-\x56\xdc\x4e\xbb\xb8\x4c\x5e\xfc\xfd\x1d\x15\xdb\x7a\x9d\xf6\x98\
-\x00\x65\x52\x71\xad\xfd\x4a\xb1\x57\x80\xf5\xf7\xc6\x9f\x45\x7b\
-\x3c\x00\x74\x49\xd5\x86\xe3\xd5\x0b\x8b\xeb\x7c\xcf\x78\x9b\xa9\
-\xfb\xd7\x68\x8f\x07\x50\x46\x66\x74\xfc\xc5\xf1\x81\x3c\xf5\x79\
-\xea\xfc\xd5\x0b\xdd\xf2\x6d\xb5\xc7\x03\xc0\x2c\x19\xe7\xff\x21\
-\xbe\xef\xab\x5e\x54\xac\xbf\x41\x62\x6f\xed\xf1\x00\xca\xcc\xd4\
-\xc3\x1e\xb2\x0a\xbf\x46\x7b\xbe\x4a\x2c\xe3\xc8\x6d\xa0\x8f\x0d\
-\xd7\xfc\x0e\x72\xd1\xbd\x5e\xbb\x98\xc8\xca\xff\xda\xa2\x31\xf6\
-\x42\xed\xf1\x00\xfa\x41\x31\xea\x77\x2f\xc5\xbc\x75\xfe\x2b\xda\
-\x63\x01\x60\x06\xa6\x36\x1c\xf9\x6d\x09\x8a\xc8\x55\xc6\xb5\x76\
-\xd1\x1e\x0f\xa0\x9f\xc4\xbb\x65\xfa\xcf\x04\xf8\x55\x32\x7f\x5f\
-\xaf\x3d\x16\x00\xa6\xa9\x6a\xc3\x4f\xf4\x2f\xfe\xe1\x2f\xc6\x8e\
-\x3f\x5f\x7b\x2c\x80\x7e\x54\x69\xf8\x7d\xab\xd6\xdf\xae\x3a\x8f\
-\x6d\xf8\x53\x7c\x83\x48\x7b\x2c\x00\xac\x27\x29\x1a\x1f\xd0\xbe\
-\xf8\x4b\xdc\x68\x6a\xad\x3d\xb5\xc7\x02\xe8\x67\x71\x05\x1e\x5f\
-\x9b\xd5\x6d\xe4\x7d\xa1\x3d\x0e\x00\xd6\xc3\x70\x6d\x6c\x67\x29\
-\x18\xb7\x2a\x17\x8c\x3b\x8c\x6d\xbf\x42\x7b\x2c\x80\x41\x50\xd4\
-\xfd\x3f\x69\xef\x18\x68\x1a\xe1\x5f\xb4\xc7\x01\xc0\x3a\xc4\x2d\
-\x75\xa5\x50\x04\xe5\x8b\xff\x9d\x45\xa3\xf5\x6a\xed\xb1\x00\x06\
-\x89\xb1\xe1\xdf\x34\xe7\xb5\xc4\x8d\x1c\xd6\x05\x94\x98\x14\x89\
-\x2f\xa8\x16\x89\xb8\x89\x48\xc3\xbf\x59\x7b\x1c\x80\x41\x54\xb8\
-\x70\x82\x72\x13\xb0\x8c\xad\x82\x81\x12\xea\x3c\x35\x2c\x17\x60\
-\xb5\x95\xbf\xf5\xab\xb9\x4d\x08\xf4\xce\xe4\x29\x82\xc1\xe8\x36\
-\x01\xfe\xa3\xda\xe3\x00\xe0\x41\xe6\x8d\xae\x7c\x82\x4c\xcc\x0b\
-\x95\x0b\xc3\xe7\xb5\xc7\x01\x18\x74\xf1\xf5\x5e\x99\x6f\x6d\xb5\
-\x46\xdf\xf9\x3b\x39\x3a\x18\x28\x11\x59\xf9\xff\x8f\xe6\xc5\xbf\
-\xb0\x61\x88\x5b\x83\x40\x1a\x0b\x46\x26\xb6\x2a\xac\xbf\x58\x71\
-\xce\x8f\x6a\x8f\x01\x80\x0d\xa6\x4e\x12\xeb\x1c\xad\xab\x54\x0c\
-\x6c\xf8\xb5\x31\xe7\x3e\x5e\x7b\x1c\x80\x9c\xc4\xfd\x35\x64\xde\
-\xdf\xac\xd7\xf4\xfb\x77\x6b\x8f\x01\x90\xb5\x91\x91\x89\xcd\x34\
-\x8f\xf8\x95\x95\xff\xef\x17\xd4\xc6\xb6\xd4\x1e\x07\x20\x47\x32\
-\xff\x0e\xd2\x6a\xfe\xe3\x81\x41\x8b\x16\x35\x9f\xac\x3d\x06\x40\
-\xb6\xe4\xe2\xff\x0d\xb5\x8b\x7f\xdc\xe5\x6f\x74\x7c\x27\xed\x31\
-\x00\x72\xa6\x59\x03\x24\xbe\xaf\x9d\x3f\x90\xa5\x21\xdb\x7e\x81\
-\xd6\x53\xff\x52\x74\xee\xaf\xd8\xd6\xeb\xb4\xc7\x00\xc8\x5d\xdc\
-\xfb\x43\xe6\xe4\x72\x9d\x06\xc0\xaf\x32\xae\xf5\xf7\xda\x63\x00\
-\x64\xe5\xb8\xe3\xd6\x3c\xb6\xaa\xfa\x24\x70\xf8\xa4\xf6\x18\x00\
-\x98\x34\xb4\xac\xbd\x75\xdc\xb3\x5f\xa9\x09\x38\x7b\xce\xc4\xc4\
-\x46\xda\x63\x00\x64\xa3\xb0\xe1\x28\xad\x8b\xbf\xc4\x22\x9e\xf8\
-\x07\xca\xc5\xd8\xf0\x2a\xbd\xed\x82\xd9\x1b\x00\x48\xc2\x2c\x1d\
-\xdb\x5e\x26\xfa\x6d\x4a\x13\xfd\x42\xb3\x74\xe2\x49\xda\x63\x00\
-\xe0\x6f\xc9\x1c\xfd\x8c\x46\x5d\x28\xac\xbf\x9e\x07\x02\x81\x04\
-\x64\xb2\xfd\x52\xe5\xe2\x6f\xfd\xed\xc5\xa8\xdf\x5d\x3b\x7f\x00\
-\x6b\x67\x8c\xd9\x50\x9a\xf4\x96\x52\x13\x70\xa2\x76\xfe\xc0\x40\
-\x2b\x5c\x78\xad\xce\xca\x3f\x36\x00\xad\x43\xb4\xf3\x07\xb0\x6e\
-\x6a\xa7\x81\xda\x70\x57\xc5\xb5\x77\xd4\xce\x1f\x18\x48\x9d\x07\
-\xff\xac\x3f\x4b\xa7\x01\xf0\x3f\xd7\xce\x1f\xc0\xfa\x91\x06\xe0\
-\x83\x4a\x77\x01\x16\x68\xe7\x0e\x0c\xa4\x6a\xbd\x75\x98\xca\xa4\
-\x76\xfe\x4a\x36\xfb\x01\xfa\x8b\xac\xc8\x87\x15\x1a\x80\xd5\xf1\
-\x50\x32\xed\xdc\x81\x81\x62\x9a\xcd\xcd\x0b\x1b\xfe\xac\xb0\xf2\
-\x5f\x65\xea\xfe\x35\xda\xf9\x03\x98\x1e\x63\xcf\x78\x5a\xd5\xfa\
-\x6b\x14\x16\x0d\xcb\xb5\x73\x07\x06\x8a\x74\xf3\xc7\xeb\xac\xfe\
-\xc3\x37\xb4\x73\x07\x30\x33\xc6\xfa\xb7\xab\xd4\x0d\x1b\x0e\xd2\
-\xce\x1d\x18\x08\x0b\xed\xf8\xb3\x0a\xe7\xef\x50\x98\xc4\xe7\xce\
-\x6d\x36\x37\xd1\xce\x1f\xc0\xcc\x55\x9d\x1f\x51\x68\x02\x7e\xc3\
-\x5e\x21\x40\x17\xc8\x2a\x7c\x7e\xfa\x95\xbf\xbf\xc7\xd4\xc3\x1e\
-\xda\xb9\x03\x98\x9d\xf8\x64\xbe\xce\x02\xa2\xf5\x26\xed\xdc\x81\
-\xbe\x36\xe4\xc6\x76\x8b\xdf\xc3\x2b\xac\xfe\xbf\xac\x9d\x3b\x80\
-\xee\xa8\x5a\x7f\x6c\xfa\xbb\x00\x7e\x5c\x3b\x6f\xa0\xaf\xc9\x44\
-\x32\xe9\x2f\xfe\xfe\x22\x6e\xfd\x03\x83\xa3\x73\x60\x90\x0d\x2b\
-\x53\xd7\x92\x8a\xf5\x07\x68\xe7\x0e\xf4\x25\x8d\xd5\x7f\x7c\x8d\
-\x87\x49\x0b\x0c\x9e\xa1\x5a\xfb\x65\xc9\xeb\x89\xf3\xa7\x6b\xe7\
-\x0d\xf4\x25\x8d\xd5\xbf\xac\x12\x7e\xa2\x9d\x37\x80\xde\x90\x06\
-\x7f\x6e\xea\x9a\x52\xd4\xfc\x2b\xb5\xf3\x06\xfa\x8a\xce\x77\xff\
-\xfe\xba\xf8\xee\xb0\x76\xee\x00\x7a\x63\x68\x49\xeb\x19\xf1\x4c\
-\x8f\xc4\x4d\xc0\xa8\x76\xde\x40\x5f\x29\x5c\xf8\x45\xea\x4e\xdd\
-\x38\xff\x5e\xed\xbc\x01\xf4\x96\xc6\x9e\x22\x52\xcf\xf6\xd2\xce\
-\x1b\xe8\x0b\x4a\xab\xff\x71\xde\xdb\x05\x06\x5f\x67\x57\x51\xe7\
-\xaf\x4e\xda\x00\x58\x3f\x57\x3b\x6f\xa0\x2f\xc8\x64\xa9\x26\x9e\
-\x9c\xab\x2b\x0d\xbf\xaf\x76\xde\x00\xd2\x30\xb6\xfd\x91\xa4\x0b\
-\x0c\x1b\xee\xe2\xeb\x45\xe0\x51\x0c\xd7\xfc\x0e\x85\x0d\xf7\xa5\
-\x5d\xfd\x87\x8a\x76\xde\x00\xd2\x31\xc6\x6c\x18\x77\xfa\x4c\x59\
-\x67\xa4\xe9\xf8\xac\x76\xde\x40\xa9\x49\xa7\xfc\xcd\xe4\x9d\xf9\
-\xe8\xf8\x4e\xda\x79\x03\x48\xab\xa8\xfb\x7f\x4a\x59\x6b\xe2\xa9\
-\xa2\x73\x26\x26\x36\xd2\xce\x1b\x28\xa5\xc5\x8b\x5b\x4f\x2c\x5c\
-\xb8\x29\xed\xa4\x0c\x27\x68\xe7\x0d\x20\xbd\xf8\xcc\x4f\xd5\xfa\
-\xb3\x92\x2e\x38\x5c\x78\xa7\x76\xde\x40\x29\x15\x36\x1c\x99\xf4\
-\xe2\x6f\xc3\xb5\xf3\xed\xf8\x16\xda\x79\x03\xd0\x91\xfa\xb4\xc0\
-\xc2\xf9\x31\xed\x9c\x81\xd2\x39\xee\xb8\x35\x8f\x2d\xac\xbf\x38\
-\xe5\x64\x34\xae\xfd\x71\xed\xbc\x01\xe8\xe9\xd4\x1d\xe7\xcf\x4b\
-\x59\x77\x86\xac\x7f\x91\x76\xde\x40\xa9\xa4\xfe\x3e\xae\x6a\xfd\
-\x35\x23\x23\x13\x9b\x69\xe7\x0d\x40\x57\x61\xc3\x7b\x92\xde\x05\
-\xb0\xfe\x7b\xda\x39\x03\xa5\x12\xf7\xcc\x66\xf5\x0f\x20\xb5\xf8\
-\x46\x40\xd5\xf9\x0b\x13\x36\x00\x37\x58\x6b\x37\xd6\xce\x1b\x28\
-\x05\x63\xc7\x9f\x9f\xb4\x03\x77\xfe\x6a\x56\xff\x00\x1e\x50\x34\
-\xfc\xfb\x53\xd6\xa0\x8a\x6b\xbf\x55\x3b\x67\xa0\x14\x52\xbf\xfa\
-\xc7\xea\x1f\xc0\x83\xc5\xd7\xf3\x64\x61\x70\x55\xc2\x3a\xb4\x48\
-\x3b\x67\x40\x5d\x3c\xa7\x3b\xe9\xb6\x9c\x7c\xf7\x0f\x60\x2d\xaa\
-\xce\x7f\x31\x61\x1d\xba\x97\x9d\x01\x91\x3d\x63\xc3\x3f\xa7\x5d\
-\xfd\x87\xff\xd0\xce\x19\x40\xf9\x2c\x74\xcb\xb7\x95\xc5\xc8\x3d\
-\xe9\xea\x91\xff\xa8\x76\xce\x80\xaa\xc2\x86\x5a\xaa\x09\x27\xff\
-\xae\xdb\x16\x2d\x6a\x3e\x59\x3b\x67\x00\xe5\x54\x58\xbf\x20\x5d\
-\x3d\xf2\x13\xda\xf9\x02\x6a\xe2\xd9\xdc\x29\xf7\xfd\xe7\xf5\x1b\
-\x00\xeb\x52\xd8\xb1\x7d\xd2\xdd\x01\x88\xe7\x03\x8c\x3f\x5f\x3b\
-\x67\x40\x45\xe1\xc2\xa7\xd3\x4d\x36\xbf\xca\xb8\xd6\x2e\xda\x39\
-\x03\x28\x37\x59\x28\xac\x48\xb6\x28\x71\xfe\x73\xda\xf9\x02\xc9\
-\xc5\x7d\xb8\x65\xa2\x5d\x94\x70\xf5\xff\x4b\xed\x9c\x01\x94\x9f\
-\x71\xed\xf7\x25\xac\x4b\x7c\x0d\x80\xfc\xc8\x07\x7f\xef\x74\xab\
-\xff\xce\x7b\xb7\xfb\x6b\xe7\x0c\xa0\xfc\x4c\xb3\xb9\x79\x7c\x5e\
-\x28\x55\x6d\xe2\x34\x52\x64\xa7\x70\xe1\xeb\xc9\x1a\x00\x1b\x56\
-\x6a\xe7\x0b\xa0\x7f\x48\x7d\x9a\x9f\x6e\x81\xc2\xdb\x00\xc8\x8c\
-\x7c\xf0\x2f\x49\xd6\x61\xdb\xf6\x47\xb4\xf3\x05\xd0\x3f\x4c\xa3\
-\x7d\x60\xba\x05\x8a\x6f\x6a\xe7\x0b\x24\x23\xdd\xf5\x5e\xa9\x26\
-\x57\xe1\xfc\x9d\x0b\x6a\x63\x5b\x6a\xe7\x0c\xa0\x7f\xc4\x53\x02\
-\xe5\xc2\x7c\x45\x9a\x1a\x15\xee\x5f\x30\x32\xb1\x95\x76\xce\x40\
-\x12\x32\xb1\xbe\x96\xae\x01\x08\xf3\xb5\xf3\x05\xd0\x7f\xa4\x76\
-\x9c\x90\xaa\x4e\xc5\x07\x0f\xb5\xf3\x05\x92\x48\x7a\xf2\x56\xa3\
-\xf5\x6a\xed\x7c\x01\xf4\x9f\x4a\xad\xbd\x6b\xba\x85\x8a\x3f\x55\
-\x3b\x5f\xa0\xe7\x4c\xad\xb5\x67\xb2\x49\x65\xfd\x65\xf1\x56\x9e\
-\x76\xce\x00\xfa\x53\xd5\x86\x73\xd2\x34\x00\xe1\xa6\x78\x2c\xb1\
-\x76\xbe\x40\x4f\x15\x36\x7c\x39\x61\x57\xcd\x26\x1b\x00\x66\x4c\
-\x1a\x80\xe3\x13\x2e\x58\xf6\xd6\xce\x17\xe8\xa9\xb8\xf1\x45\xa2\
-\xc9\xb4\xba\xd2\x38\x73\x3b\xed\x7c\x01\xf4\xaf\x94\x0f\x2c\x57\
-\xad\x3f\x56\x3b\x5f\xa0\x67\xe2\x93\xae\x71\x4b\xde\x34\x93\x29\
-\x78\xed\x7c\x01\xf4\xbf\xf8\x55\x62\xa2\x45\xcb\x12\xed\x5c\x81\
-\x9e\x29\x6c\x78\x4f\xba\x6e\x3a\x1c\xad\x9d\x2f\x80\xfe\x27\x75\
-\xeb\x3b\x89\x6a\xd6\x5d\x73\x9b\xcd\x4d\xb4\xf3\x05\x7a\x42\x26\
-\xd2\xbc\x44\x9d\xf4\xea\xe1\x9a\xdf\x41\x3b\x5f\x00\xfd\x2f\x6e\
-\x23\x9e\x6a\xe1\xc2\x96\xe5\x18\x48\x9d\xc3\x7f\x9c\xbf\x3a\x51\
-\x03\xb0\x42\x3b\x5f\x00\x83\xa1\xd9\x6c\x3e\x4e\xea\xca\x8d\x89\
-\xee\x02\x1c\xaf\x9d\x2f\xd0\x75\x29\x5f\xff\xab\x5a\x7f\x8c\x76\
-\xbe\x00\x06\x87\xd4\x94\x85\x89\x1a\x80\x33\xb4\x73\x05\xba\x2e\
-\x3e\xe1\x9a\xaa\x01\x18\xae\x8d\xed\xac\x9d\x2f\x80\xc1\x51\x75\
-\xfe\x88\x24\x77\x2f\x9d\xbf\x23\xde\x71\xd0\xce\x17\xe8\xaa\xc2\
-\x85\x5f\xa5\x69\x00\xfc\xd9\xda\xb9\x02\x18\x2c\xc3\x0d\xff\xbc\
-\x54\x0b\x98\x78\xb7\x54\x3b\x5f\xa0\x6b\x62\x47\x9b\xec\x7c\x6d\
-\xeb\xff\x53\x3b\x5f\x00\x83\x47\x56\xe7\x57\x26\x69\x00\xac\xff\
-\x90\x76\xae\x40\xd7\x0c\xd5\x5b\x2f\x49\xd6\x3d\xd7\xfd\x6b\xb4\
-\xf3\x05\x30\x78\xaa\xce\xff\x2c\xd1\x22\xe6\x14\xed\x5c\x81\xae\
-\x91\x89\xf3\xd1\x44\x13\xe7\x76\x6b\xed\xc6\xda\xf9\x02\x18\x3c\
-\x45\x3d\x1c\x9a\xa2\x8e\x15\xce\xff\x4e\x3b\x57\xa0\x6b\x0a\x1b\
-\x86\x92\x4c\x1c\x1b\x6a\xda\xb9\x02\x18\x4c\x15\xd7\xde\x31\x4d\
-\x03\x10\xee\x37\xcd\xe6\xe6\xda\xf9\x02\x5d\x21\x17\xe6\x3f\x26\
-\x6a\x00\x8e\xd4\xce\x15\xc0\xe0\xaa\x5a\x7f\x4d\x8a\x5a\x66\x6c\
-\x78\x95\x76\xae\xc0\xac\x0d\x2d\x69\x3d\x23\xc5\x84\xe9\x4c\x1a\
-\xd7\xda\x45\x3b\x5f\x00\x83\xab\xea\xfc\x48\x92\x7a\xc6\x56\xe6\
-\x18\x04\x85\x0b\xef\x48\x33\x61\xfc\x35\xda\xb9\x02\x18\x6c\xd2\
-\x00\x7c\x3e\xc9\xdd\x4c\x17\x7e\xa8\x9d\x2b\x30\x6b\x85\xf5\xdf\
-\x4a\xd4\x00\x2c\xd4\xce\x15\xc0\x60\xab\xd8\xd6\xeb\xd2\xdc\xd1\
-\xf4\x2d\xed\x5c\x81\x59\x4b\xb5\x01\x50\xd1\xf0\x9f\xd0\xce\x15\
-\xc0\x60\x5b\xb4\xa8\xf9\xe4\x78\xd8\x58\xcf\xeb\x99\xf5\xd7\x6b\
-\xe7\x0a\xcc\x5a\x61\xc3\xb5\x29\x1a\x80\x4a\xc3\xef\xab\x9d\x2b\
-\x80\xc1\x27\xab\xf3\x0b\x53\xd4\xb4\xa1\x65\xed\xad\xb5\x73\x05\
-\x66\x6c\xa1\x5b\xbe\x6d\x92\xd5\xbf\x0b\x77\x73\x8e\x36\x80\x14\
-\xaa\x36\x0c\xa7\xa8\x6b\xbc\x09\x80\xbe\x96\xec\xfb\x32\x1b\xbc\
-\x76\xae\x00\xf2\x10\x8f\xec\x4d\x52\xd7\x5c\x38\x5c\x3b\x57\x60\
-\xc6\x8c\x6b\x7f\x3c\xc9\x1d\x00\xeb\xbf\xa5\x9d\x2b\x80\x3c\x54\
-\x9d\x3f\x38\x4d\x03\xe0\xbf\xab\x9d\x2b\x30\x63\x72\x61\x9e\x9b\
-\xa4\x01\xa8\x87\x43\xb5\x73\x05\x90\x87\x21\xeb\x5f\x94\x68\x61\
-\xe3\xb4\x73\x05\x66\x4c\x3e\xc4\xbf\x49\x32\x51\x1a\x63\x2f\xd4\
-\xce\x15\x40\x1e\x46\x46\x26\x36\x93\xd5\xf9\xaa\x9e\xd7\x35\xe7\
-\xcf\xd3\xce\x15\x98\x11\x63\xcc\x86\x55\x1b\xee\xea\x7d\x97\x1c\
-\xee\xe3\x00\x20\x00\x29\xc9\xea\xfc\xb2\xde\x2f\x6e\xfc\x2d\xda\
-\x79\x02\x33\x62\x96\x8e\x6d\x9f\x64\xf5\x4f\x97\x0c\x20\x31\xa9\
-\x3d\xf5\x14\xf5\x6d\xbe\x1d\xdf\x42\x3b\x57\x60\xda\xe2\x2b\x2c\
-\x29\x26\x88\x44\x45\x3b\x57\x00\x79\x91\xba\xf3\xfd\x14\xf5\x6d\
-\xc8\x8d\xed\xa6\x9d\x2b\x30\x6d\x55\x1b\xfe\x35\x51\x03\xf0\x19\
-\xed\x5c\x01\xe4\xa5\x70\xe1\xd3\x29\xea\x5b\xe1\xfc\xeb\xb5\x73\
-\x05\xa6\xad\xb0\xe1\xb8\x14\x13\xa4\xe2\x5a\xff\xa8\x9d\x2b\x80\
-\xbc\x54\x6d\xeb\x90\x34\x0d\x40\xf8\xa0\x76\xae\xc0\xb4\x49\xe7\
-\xfa\xd3\x24\x13\x64\xd4\xef\xae\x9d\x2b\x80\xbc\xa4\xfb\x8a\xd3\
-\x7f\x51\x3b\x57\x60\xda\xa4\x01\x38\x3d\xc5\x04\x31\xcd\xe6\xe6\
-\xda\xb9\x02\xc8\xcb\x70\x6d\x6c\xe7\x24\x0d\x80\xf5\xa7\x68\xe7\
-\x0a\x4c\x9b\x7c\x70\xaf\x48\x70\x7b\xec\x2f\xda\x79\x02\xc8\x4f\
-\x7c\xf5\x38\xc5\xa9\x80\xf1\xdc\x01\xed\x5c\x81\x69\x93\x8b\xf3\
-\xfd\x09\x3a\xe4\x33\xb5\xf3\x04\x90\xa7\x44\x27\x9d\x2e\xd3\xce\
-\x13\x98\xb6\x14\xb7\xc7\xa4\x03\xaf\x6a\xe7\x09\x20\x4f\x55\xe7\
-\xcf\x4f\x50\xe3\x26\xb4\xf3\x04\xa6\x2d\x49\x03\xe0\xc2\xd7\xb5\
-\xf3\x7c\x40\xbc\x25\x58\xa9\xb7\xdf\x58\x38\xff\x25\xf9\xd9\x2a\
-\x32\x71\x97\x54\xad\x5f\x4a\x10\xc4\xec\x43\xe6\x55\x21\xf1\x15\
-\x59\x75\x1f\x64\x4c\xd8\x54\x7b\xbe\x47\xf2\xb3\x84\x04\x35\xee\
-\x52\xed\x3c\x81\x69\x4b\xd1\x00\x48\x07\x7e\x84\x76\x9e\x0b\xdd\
-\xf2\x6d\xe3\x69\x84\x12\x37\xa7\xc9\x99\x20\xf2\x0e\xb9\xf0\xde\
-\x26\xf3\xed\x7b\x95\xc6\x99\xdb\x69\xce\x7d\xa9\x3f\xb6\xf7\xb9\
-\xfa\x1b\x34\x73\x04\x66\x24\x45\x21\x30\xd6\xbf\x5d\x39\xc7\xc3\
-\xe3\x7e\xdd\xda\x05\x91\x20\xb2\x0c\xeb\x6f\x8f\x47\x8e\xaf\x59\
-\xb3\xe6\x31\x1a\xf3\x5f\x1a\x91\xa1\x5e\xe7\x18\x9f\xa5\xd2\xca\
-\x0f\x98\xb1\x14\x05\xa0\xe2\xda\xfb\x6b\xe4\xd6\x6c\x36\x1f\x97\
-\x6a\x9f\x03\x82\x20\x1e\x25\x6c\x18\xd6\x38\x10\x4c\x6a\xc0\x0f\
-\x52\xe4\xc7\x79\x00\xe8\x3b\x29\x26\x86\xc6\x26\x40\xb1\x1b\x4f\
-\xd1\xf9\x13\x04\x31\x9d\xf0\x23\xf1\x04\xd2\x94\xb5\xa0\x6a\xfd\
-\xd7\x52\xe4\xa6\xfd\x55\x07\x30\x6d\x29\x26\x86\xa9\xad\xd8\x26\
-\x79\x5e\xd6\x1f\xab\x5f\xec\x08\x82\x78\x78\x14\xd6\x7f\x75\x10\
-\x6b\x41\xc5\xb6\x9e\x9d\x32\x2f\x60\xd6\x12\x4c\xf6\xd5\x73\x26\
-\x26\x36\x4a\x99\xd3\xf0\x92\xf6\x73\x0b\x17\xee\xd6\x2e\x74\x04\
-\x41\xac\x2d\xfc\x2a\xa9\x0b\x7b\xa7\xaa\x07\x55\x1b\x8e\x4e\x91\
-\x97\x71\xad\x5d\x52\xe5\x04\x74\x45\xaf\x27\x85\xc6\xd3\xb1\x72\
-\xf1\xff\x85\x7e\x91\x23\x08\x62\x1d\x31\x9a\xac\x1e\xd8\x70\x64\
-\x8a\x9c\x38\x12\x18\x7d\x27\xc1\xc4\xb8\x24\x65\x3e\x66\xe9\xd8\
-\xf6\x89\x76\x37\x24\x08\x62\x86\x11\xef\x0c\x56\x6a\xed\x5d\x53\
-\xd4\x84\x6a\xe7\x2d\xa0\xde\xe7\x64\x6a\xad\x3d\x53\xe4\x03\x74\
-\x4d\xcf\x27\x86\x0d\xe7\x24\xcd\x27\xd1\xed\x3e\x82\x20\x66\x17\
-\xc6\x86\x2f\x24\xa9\x09\xf5\xd6\x61\x29\xf2\x19\xaa\xb7\x5e\x92\
-\x22\x1f\xa0\x6b\x12\x4c\x8c\xa4\xe7\x00\xc8\xbf\x6f\x91\x76\x61\
-\x23\x08\x62\xbd\x22\xc9\xfe\xf9\x45\xc3\xbf\x3f\x45\x3e\x85\x1d\
-\xdb\x27\x45\x3e\x40\xd7\xf4\x7c\x62\xd8\x70\x46\xda\x7c\xfc\x85\
-\x25\x28\x6c\x04\x41\x3c\x4a\x14\xce\x5f\x9d\xa2\x26\x18\xe7\xdf\
-\x9b\x22\x1f\x63\xdb\xaf\x48\x91\x0f\xd0\x35\x3d\x9f\x18\xd6\x2f\
-\x4d\x9c\xcf\x8d\xda\x85\x8d\x20\x88\x47\x8f\xc2\x86\xfb\xd2\xd4\
-\x04\x7f\x70\x8a\x7c\xb4\x36\x3c\x03\x66\xac\xf7\x13\xc3\x8f\x24\
-\xce\x87\x06\x80\x20\xfa\x20\x62\x03\x90\x62\xfb\xdc\x64\x5f\x01\
-\xd4\xc3\xcb\x7b\x9d\x0b\xd0\x55\x09\x26\x86\x49\x9c\xcf\x25\xda\
-\x85\x8d\x20\x88\x47\x8f\xc2\x85\xbf\xa4\xa8\x09\xc6\xb6\x3f\x92\
-\x22\x1f\x33\x3a\xfe\xe2\x14\xf9\x00\x5d\xd3\xf3\x49\x6e\xc3\x50\
-\xd2\x7c\x6c\x38\x4d\xbb\xb0\x11\x04\xf1\xe8\x51\x38\x7f\x7a\xa2\
-\x9a\x90\xe4\xcd\x20\xf6\x01\x40\xdf\x49\x30\xc9\x8b\x94\xf9\x18\
-\xeb\x3f\xa5\x5d\xd8\x08\x82\x58\x8f\xb0\xfe\x6b\x29\x6a\x82\xfc\
-\xbb\x3e\x93\x22\x9f\xe1\xda\xd8\xce\x29\xf2\x01\xba\xa6\xf7\x93\
-\x3c\x0c\xa7\xcc\xa7\x52\x5f\xf1\x77\x71\x93\x11\xf5\xe2\x46\x10\
-\xc4\x3a\x23\xd5\x2d\xf3\xc2\x86\x2f\xa7\xc8\x67\xa1\x5b\xbe\x6d\
-\x8a\x7c\x80\xae\xe9\xf9\xc4\xb0\x61\x71\xea\x9c\xa4\x01\x70\xda\
-\xc5\x8d\x20\x88\x75\x85\x6f\x25\xac\x07\x27\xa6\xc8\x69\x41\x6d\
-\x6c\xcb\x54\x39\x01\x5d\xd1\xeb\x49\x21\xdd\x77\x2d\x75\x4e\x71\
-\x65\xc1\x76\xc0\x04\x51\xde\x28\x1a\xad\x57\xa7\xaa\x07\x52\x83\
-\x4e\x4e\x91\x93\x31\x61\xd3\x54\x39\x01\x5d\xd1\xf3\x89\x61\x43\
-\x43\x25\x2f\x1b\xbe\xa9\x5d\xe4\x08\x82\xf8\xdb\x90\xe6\xfc\x87\
-\x49\x6b\x81\x0b\x95\x9e\xe7\x64\xfd\xea\xe3\x8e\x5b\xf3\xd8\x94\
-\x79\x01\xb3\xd6\xf3\x09\x9f\x78\x23\xa0\x07\xc4\x23\x88\xe5\xdf\
-\xbf\x4c\xbb\xd8\x11\x04\xf1\x7f\x21\xab\xf1\x30\xb7\xd9\xdc\x24\
-\x65\x2d\xa8\x26\xa8\x03\xd2\xd4\xdc\x94\x32\x27\xa0\x2b\x7a\x3f\
-\x31\xfc\x98\x56\x6e\x23\x23\x13\x9b\xc9\xcf\x30\xaa\x5d\xf4\x08\
-\x82\x98\xac\x05\x66\xe9\xc4\x93\x52\xd7\x81\xaa\x0d\x2b\x13\xe4\
-\x97\xf4\xd4\x53\xa0\x2b\x12\x4c\xfa\xdf\x69\xe6\x67\x8c\xd9\x50\
-\x7e\x86\xaf\x54\xad\xbf\x57\xbb\x00\x12\x44\x8e\x11\x9f\xc7\x91\
-\x39\xf8\x5f\xc6\x9c\xfb\x78\x8d\x1a\x20\xff\xee\xab\x12\xe4\xd9\
-\xd6\xc8\x0d\x98\x95\xde\x4f\x7e\x7f\xa5\x76\x8e\x51\xdc\xa4\xa3\
-\xb0\xbe\xca\xc3\x81\x04\x91\x2a\xfc\x2a\xf9\x73\xd1\x90\xf5\x2f\
-\xd2\x9c\xfb\x32\xe7\xef\x4e\x90\x6b\xd2\x2d\xcf\x81\xae\xe8\xf5\
-\xc4\x28\x6c\xb8\x4d\x3b\xc7\x07\x33\xb5\x15\xdb\xc4\xf3\xc1\xa5\
-\x28\xfc\x38\x7e\x1f\x29\x0d\xca\x79\xf2\xcf\x97\x12\x04\x31\xbb\
-\x90\x8b\xe0\xf9\x53\x73\xea\xa7\x71\xfb\x5d\x73\x5a\x78\xa6\xf6\
-\x7c\x9f\x6f\xc7\xb7\x48\xd1\xec\x48\xfe\x3f\xd6\xce\x15\x98\xb6\
-\x14\x93\x23\x3e\x90\xa7\x9d\x27\x80\xfc\x98\x46\x78\x4e\x92\x06\
-\xc0\xfa\x13\xb5\x73\x05\xa6\x2d\xc5\xe4\x58\x30\x32\xb1\x95\x76\
-\x9e\x00\xf2\x63\x1a\xed\x03\x53\xd4\x38\xe3\xc2\x7f\x68\xe7\x0a\
-\x4c\x5b\x8a\xc9\x31\xbc\xa4\xfd\x5c\xed\x3c\x01\xe4\xc7\x58\xff\
-\xa1\x34\x0d\x40\xfb\x7d\xda\xb9\x02\xd3\x96\x66\x72\xb4\xfe\x5e\
-\x3b\x4f\x00\xf9\x89\x07\x0e\xa5\xa8\x71\x85\xf3\xaf\xd7\xce\x15\
-\x98\xb6\x14\x93\x43\xe2\x9d\xda\x79\x02\xc8\x4f\x3c\x8d\x94\xbb\
-\x9c\xc0\x23\x48\x74\x7b\xec\xe3\xda\x79\x02\xc8\x4f\xd5\xf9\xf1\
-\xde\xd7\x38\xbf\xca\x5a\xbb\xb1\x76\xae\xc0\xb4\xa5\xb9\x03\xe0\
-\xbf\xad\x9d\x27\x80\xfc\x14\x36\x5c\xdb\xeb\xfa\x56\x96\xbd\x4e\
-\x80\x69\x4b\xd1\x00\x14\x2e\xfc\x42\x3b\x4f\x00\x79\x89\x7b\x00\
-\xc4\x43\x7a\x12\x34\x00\x6a\xdb\x9d\x03\xb3\x22\x1f\xde\x3b\x13\
-\xdc\x01\x18\xd7\xce\x13\x40\x5e\x2a\x0d\xbf\x6f\x92\x05\x8e\x0d\
-\xf3\xb4\x73\x05\x66\x44\x3a\xe4\x8b\x13\x74\xc8\x57\x69\xe7\x09\
-\x20\x2f\x85\x0b\x1f\x4e\x73\x87\xd3\x7f\x49\x3b\x57\x60\x46\xaa\
-\x36\xfc\x3a\xc1\x1d\x80\x55\xc6\x84\x4d\xb5\x73\x05\x90\x0f\x59\
-\xdc\x7c\x2f\x49\x03\xd0\xf0\xef\xd7\xce\x15\x98\x91\x78\xfb\x2a\
-\xc5\x24\x31\xb5\xd6\x9e\xda\xb9\x02\xc8\x87\xac\xcc\x4f\x4f\xd2\
-\x00\xd4\xc3\xcb\xb5\x73\x05\x66\x44\xba\xe4\xaf\xa6\x98\x24\x55\
-\xe7\x0f\xd6\xce\x15\x40\x3e\xa4\xb6\x5d\xdf\xf3\x8b\xbf\xf5\xab\
-\x17\x2d\x6a\x3e\x59\x3b\x57\x60\x46\x52\x7d\x4f\x56\xb5\xe1\x78\
-\xed\x5c\x01\xe4\x21\x9e\x44\x98\x64\xf5\xef\xc2\xe5\xda\xb9\x02\
-\x33\x56\x71\xed\xfd\x13\x35\x00\xc3\xda\xb9\x02\xc8\x43\x61\xc3\
-\x41\x89\xea\xda\x69\xda\xb9\x02\x33\x36\xb4\xac\xbd\x75\x92\x4e\
-\xd9\x86\x73\xb5\x73\x05\x90\x07\x59\x99\x9f\x90\xa6\xae\xf9\xaf\
-\x6a\xe7\x0a\xcc\x4a\x92\xef\xca\x9c\xbf\x67\xce\xc4\xc4\x46\xda\
-\xb9\x02\x18\x7c\xa9\x1e\x00\x34\x8d\xf0\x2f\xda\xb9\x02\xb3\x52\
-\x75\xbe\x95\x64\xb2\xf0\x26\x00\x80\x1e\x8b\x0b\x0d\x69\x00\xee\
-\x48\x51\xd3\x86\xdc\xd8\x6e\xda\xf9\x02\xb3\x52\xb8\xf0\xc3\x14\
-\x93\xa5\x5a\x6f\x1d\xa6\x9d\x2b\x80\xc1\x26\xab\xf2\x97\xa6\xa8\
-\x67\xf1\xae\xa6\x31\xe7\x3e\x5e\x3b\x5f\x60\x56\xaa\x36\x1c\x9d\
-\xa4\x01\xb0\xfe\x14\xed\x5c\x01\x0c\x36\xe3\xfc\xc7\x12\xd5\xb3\
-\xb3\xb4\x73\x05\x66\x4d\x3a\xe6\x37\xa4\x99\x30\x61\xa5\x76\xae\
-\x00\x06\x5b\x61\x7d\x35\xc9\x1d\x00\x1b\x4e\xd6\xce\x15\x98\xb5\
-\x4a\xe3\xcc\xed\x12\x4d\x98\xfb\xe6\x8d\xae\x7c\x82\x76\xbe\x00\
-\x06\xd3\x9a\x35\x6b\x1e\x23\x2b\xf3\x6b\x52\xd4\x33\x1e\x00\xc4\
-\xc0\x48\x35\x69\x2a\xae\xb5\x9f\x76\xae\x00\x06\x53\xe1\xc2\x5e\
-\x49\xee\x66\x4a\x0c\xd7\xfc\x0e\xda\xf9\x02\x5d\x11\x37\xb4\x48\
-\x72\x17\xa0\xe1\x3f\xa1\x9d\x2b\x80\xc1\x64\xac\xff\x54\x92\x06\
-\xc0\x86\x3f\x69\xe7\x0a\x74\x8d\xb1\xe1\x0b\x69\x3a\x67\x3f\xa2\
-\x9d\x2b\x80\xc1\x94\xea\xfd\x7f\x09\xa3\x9d\x2b\xd0\x35\xa9\x1e\
-\x04\x2c\x5c\xb8\x95\x0d\x81\x00\x74\x5b\x7c\xbe\x48\xea\xcb\xdd\
-\x49\xea\x98\x0d\x47\x69\xe7\x0b\x74\x8d\x34\x00\x4f\x89\x27\x5b\
-\xa5\x98\x3c\xc6\xb5\xfe\x5e\x3b\x5f\x00\x83\xc5\xb8\xf6\x5b\x12\
-\xad\xfe\xe3\x03\x80\x2f\xd5\xce\x17\xe8\x2a\x69\x00\x2e\x4e\x33\
-\x81\xfc\xe7\xb5\x73\x05\x30\x58\xa4\xb6\x7c\x3f\xd1\xea\xff\x36\
-\x36\x00\xc2\xc0\x91\x0f\xf6\x50\x92\x09\xe4\xfc\xe9\xda\xb9\x02\
-\x18\x1c\x53\xaf\xff\x5d\x91\x68\x01\xc3\x73\x4c\x18\x3c\xa9\x76\
-\xd0\x8a\x5b\x68\xb2\x1f\x00\x80\x6e\xa9\x34\xfc\xbe\x69\x2e\xfe\
-\x9d\x06\xe0\x08\xed\x7c\x81\xae\x1b\xb2\xed\x17\xa4\x9a\x44\x85\
-\x6d\xbd\x49\x3b\x5f\x00\x83\x41\x16\x15\xff\x95\xaa\x76\x0d\x2f\
-\x69\x3f\x57\x3b\x5f\xa0\xeb\x52\xee\xa2\x55\xb8\x30\x47\x3b\x5f\
-\x00\xfd\x2f\xd6\xad\xc2\x86\x3f\xa6\x59\xb8\xf8\xcb\xb4\xf3\x05\
-\x7a\x46\x3a\xe9\x22\x49\x27\x2d\x8d\x86\x31\x66\x43\xed\x7c\x01\
-\xf4\xb7\xc2\x8e\xed\x93\xec\xce\xa5\xf3\x3f\xd0\xce\x17\xe8\x99\
-\x78\x64\x6f\xb2\xc9\x54\x0f\x2f\xd7\xce\x17\x40\x7f\xab\xda\xf0\
-\xcd\x54\x35\xab\xe2\x5a\xff\xa8\x9d\x2f\xd0\x33\xc3\xb5\xb1\x9d\
-\xd3\x75\xd3\xe1\x1b\xda\xf9\x02\xe8\x5f\xc7\x1d\xb7\xe6\xb1\x52\
-\x47\x2e\x4f\x52\xb3\xac\xbf\x77\xbe\x1d\xdf\x42\x3b\x67\xa0\xa7\
-\xe2\xf7\x5c\x49\x1a\x00\xeb\x2f\xd6\xce\x15\x40\xff\xaa\x58\x7f\
-\x40\xc2\x05\xcb\xaf\xb4\xf3\x05\x7a\xae\x70\xfe\x47\xa9\x26\x95\
-\xa9\x87\x3d\xb4\xf3\x05\xd0\x9f\x64\x11\xb1\x20\x55\xad\x92\x38\
-\x5c\x3b\x5f\xa0\xe7\x4c\xbd\xfd\xae\x64\x93\xca\x86\xe3\xb5\xf3\
-\x05\xd0\x7f\x16\xd4\xc6\xb6\x94\xc5\xca\x9d\x89\x56\xff\xf7\x0f\
-\x2d\x6b\x6f\xad\x9d\x33\xd0\x73\x8b\x17\xb7\x9e\x98\xec\x50\x0d\
-\x17\x2e\x8f\xdf\xe3\x69\xe7\x0c\xa0\xbf\xc4\x0d\x79\xd2\x2d\x54\
-\x7c\x53\x3b\x5f\x20\x99\xc2\x7a\x97\x6a\x72\x15\x8d\xd6\xab\xb5\
-\xf3\x05\xd0\x5f\xa4\x46\x4d\x24\x6b\x00\xd8\xfd\x0f\x39\x31\xd6\
-\x7f\x28\x59\x03\x60\xfd\x5c\xed\x7c\x01\xf4\x8f\xf8\xec\x50\xc2\
-\x8b\xff\xaa\xa1\x25\xad\x67\x68\xe7\x0c\x24\x13\xbf\xef\x8a\xdf\
-\x7b\x25\x99\x60\xd6\xdf\x6e\x9a\xcd\xcd\xb5\x73\x06\xd0\x1f\xe2\
-\x4e\xa2\xe9\x1a\x80\xb0\x5c\x3b\x5f\x20\x39\xe9\x7c\x5b\xa9\x26\
-\x99\x71\xfe\xbd\xda\xf9\x02\x28\x3f\xd3\x08\x4f\x89\x8b\x86\x54\
-\xb5\xa9\xb0\xe1\x48\xed\x9c\x81\xe4\x64\x92\x1d\x93\x6c\x92\xf1\
-\x8e\x2d\x80\xf5\x60\x6c\xfb\xb3\x09\x2f\xfe\xf7\x99\xda\x8a\x6d\
-\xb4\x73\x06\x92\x33\xa3\xe3\x3b\xa5\x9a\x68\x9d\xc9\x36\xea\x77\
-\xd7\xce\x19\x40\x79\xcd\x99\x98\xd8\xa8\x70\xfe\xaa\x64\x75\xc9\
-\x86\xc5\xda\x39\x03\x6a\x64\x12\xfc\x26\xdd\x5d\x00\x0e\xda\x00\
-\xf0\xc8\x8a\x7a\x38\x34\xe5\xa2\x84\xbd\xff\x91\x35\xe9\x80\x8f\
-\x4e\xd8\x00\xdc\x11\x37\xf7\xd0\xce\x19\x40\x39\x15\x2e\xfc\x36\
-\xdd\xea\xdf\x5f\x13\xef\x38\x68\xe7\x0c\xa8\x59\x38\xea\x9f\x1e\
-\xbf\x07\x4b\xd6\x04\xd8\x70\x94\x76\xce\x00\xca\xc7\xd4\xfd\x6b\
-\x52\xae\xfe\x0b\xeb\x4f\xd4\xce\x19\x50\x57\xb5\xe1\xb4\x84\x13\
-\xef\x12\x76\x06\x04\xf0\x70\x85\xf3\xa7\xa7\x6c\x00\x2a\xb5\xf6\
-\xae\xda\x39\x03\xea\x8c\xf5\x6f\x4f\x39\xf1\x8c\xf3\xff\xa0\x9d\
-\x33\x80\xf2\x88\xbb\x85\xa6\xac\x41\xb2\xe8\xf1\xda\x39\x03\xa5\
-\x60\xad\xdd\xb8\xb0\xfe\x86\x54\x93\x2f\x76\xfa\xda\x39\x03\x28\
-\x8f\xb8\x17\x7f\xd2\x45\x88\x0d\xff\xa6\x9d\x33\x50\x1a\xf1\x09\
-\xfd\x94\x13\xb0\xa8\xf9\x57\x6a\xe7\x0c\x40\x9f\xb1\xed\x57\x24\
-\xad\x3d\xb2\xd8\x99\x37\xba\xf2\x09\xda\x79\x03\xa5\x31\x54\x6b\
-\xbf\x2c\xf1\x24\x5c\xa2\x9d\x33\x00\x7d\xa9\x57\xff\xb2\xd8\xf9\
-\x8a\x76\xce\x40\xe9\x54\x9d\x3f\x3b\x6d\x13\x30\xb6\x8f\x76\xce\
-\x00\xf4\x18\x1b\x5e\x95\xf8\xe2\x7f\x0f\x07\xff\x00\x6b\x51\xad\
-\xb7\x0e\x4b\xdb\x00\x84\x9a\x76\xce\x00\x74\xac\x59\xb3\xe6\x31\
-\x29\xcf\x23\x99\xaa\x39\xf3\xb4\xf3\x06\x4a\xc9\x98\xb0\x69\x61\
-\xfd\xf5\x29\x27\xe4\x50\xbd\xf5\x12\xed\xbc\x01\xa4\x27\x17\xe3\
-\xf7\xa4\xac\x35\x93\x0d\x80\xdf\x5b\x3b\x6f\xa0\xb4\xe2\xe6\x18\
-\x69\x27\xa5\x1f\xd1\xce\x19\x40\x5a\x9d\xc5\x86\x0b\x97\x27\x6e\
-\x00\x38\xf6\x17\x58\x97\xe1\x9a\xdf\x41\x26\xe6\xfd\x29\x27\x66\
-\xc5\xfa\x03\xb4\xf3\x06\x90\x4e\xca\x13\xff\xfe\x5a\x67\xd8\xf7\
-\x1f\x78\x74\x32\x59\x16\x25\x9e\x9c\xff\x1b\xbf\x0f\xb6\x64\x05\
-\xf4\x00\x00\x14\x2d\x49\x44\x41\x54\xd4\xce\x1b\x40\xef\xc5\xe3\
-\x77\x65\x91\x71\x6b\xda\x1a\xe3\x2f\x64\x07\x52\x60\x3d\xa4\xde\
-\x93\x7b\x6a\x82\x1e\xac\x9d\x37\x80\xde\xab\x5a\x7f\x4a\xea\xfa\
-\x62\x9c\x7f\xaf\x76\xde\x40\x5f\xe8\x3c\x9d\x6b\xc3\x39\x49\x27\
-\xa9\xf5\x7f\x88\x3b\x12\x6a\xe7\x0e\xa0\x77\xe2\x43\xbf\xa9\xbf\
-\x62\x8c\xab\x7f\x63\xcc\x86\xda\xb9\x03\x7d\x43\xe3\x09\x5d\x69\
-\x02\x8e\xd1\xce\x1b\x40\x6f\xc4\x8b\xb0\xcc\xf1\xb3\x58\xfd\x03\
-\x25\x17\x27\x6b\x61\xfd\x45\x89\x27\xeb\x8d\x0b\x46\x26\xb6\xd2\
-\xce\x1d\x40\xf7\x19\xd7\xfe\x78\xf2\x45\x05\xab\x7f\x60\x66\x8a\
-\x86\x7f\x7f\xea\x09\x2b\x4d\xc7\x5c\xed\xbc\x01\x74\x97\x59\x3a\
-\xb6\x7d\x61\xc3\x6d\xc9\x1b\x00\xdb\x3a\x44\x3b\x77\xa0\x2f\xcd\
-\x99\x98\xd8\x48\x2e\xc8\x97\x25\x6e\x00\x56\xc7\x87\x10\xb5\x73\
-\x07\xd0\x3d\x71\xbf\x0f\x85\xc5\xc4\x45\xcd\x66\xf3\x71\xda\xb9\
-\x03\x7d\xab\x70\xe1\xc3\xe9\x27\x6e\xf8\x3d\x0f\x04\x02\x83\x41\
-\x6a\xc8\x3b\x92\xaf\xfc\x59\xfd\x03\xb3\x17\x2f\xc4\x85\xf3\x57\
-\xa6\x9f\xc0\xfe\xf3\xda\xb9\x03\x98\x9d\xf8\x4c\x8f\xd4\x8f\xab\
-\xd3\x5f\xfc\xc3\x4a\xbe\xfb\x07\xba\x40\x56\xe4\x47\x26\xbf\x0b\
-\xe0\xc2\xdd\xc6\xb5\x76\xd1\xce\x1d\xc0\xcc\xc9\x5c\x36\x1a\xab\
-\x7f\xd3\x68\x1f\xa8\x9d\x3b\x30\x10\xe6\x36\x9b\x9b\x48\x13\xf0\
-\xc7\xf4\x5d\xbc\x5f\xca\x0e\x81\x40\x7f\x92\xf9\xfb\x01\x8d\x8b\
-\x3f\xe7\x8b\x00\x5d\x16\xbf\x4f\x53\x9a\xcc\x47\x68\xe7\x0e\x60\
-\x7a\xcc\xe8\xf8\x4e\xe9\xb7\xfb\xed\x2c\x1a\xee\xad\xd4\x57\xfc\
-\x9d\x76\xfe\xc0\x40\x89\x2b\xf1\xc2\xfa\x89\xd4\x13\xba\x70\xfe\
-\x0e\xbe\x0a\x00\xfa\x47\xdc\x73\x5f\xe6\xee\x72\x8d\x05\x43\x61\
-\xc3\x49\xda\xf9\x03\x03\xa9\xe2\xda\xfb\xab\xdc\x05\xb0\xfe\xac\
-\xf8\x4a\xa2\x76\xfe\x00\x1e\x9d\xb1\xe1\x0b\x2a\x75\xc2\x85\x1b\
-\x4f\x5d\xba\xe2\xa9\xda\xf9\x03\x03\x4b\x3a\xec\x9a\x52\x67\x7f\
-\x9c\x76\xee\x00\xd6\xad\xd2\xf0\xfb\xc6\xdb\xf0\x3a\x0b\x85\x70\
-\xb4\x76\xfe\xc0\x40\x1b\x72\x63\xbb\xa5\x3f\xcc\xa3\xd3\x00\xdc\
-\x57\x58\xbf\xb7\x76\xfe\x00\xd6\x6e\x68\x59\x7b\xeb\xc2\xf9\xab\
-\x74\x56\xff\xfe\x7c\x63\xce\x7d\xbc\xf6\x18\x00\x03\x4f\x1a\x80\
-\x39\x4a\x77\x01\x2e\x58\xbc\xb8\xf5\x44\xed\xfc\x01\x3c\x54\xdc\
-\x71\x4f\x56\xfe\x4d\x9d\xba\xe0\x57\x57\x5c\x6b\x3f\xed\x31\x00\
-\xb2\x60\x6a\x2b\xb6\x91\x8e\xfb\x16\xa5\xc9\x5e\xd5\xce\x1f\xc0\
-\x43\xc9\xbc\x3c\x51\x67\xe5\x1f\xe2\x33\x42\xa7\x68\xe7\x0f\x64\
-\x45\x63\x73\xa0\x07\xc2\x38\xff\x31\xed\xfc\x01\x4c\x32\xae\xfd\
-\x96\xb8\x0a\x57\xba\xf8\x5f\xb3\xa0\x36\xb6\xa5\xf6\x18\x00\x59\
-\x99\x7a\xd5\xa7\xad\x34\xe9\xef\x35\xb6\xfd\x0a\xed\x31\x00\x72\
-\x37\xbc\xa4\xfd\x5c\xb9\xf8\xdf\xac\xb6\xfa\x77\xfe\x60\xed\x31\
-\x00\xb2\x54\xb8\xb0\x97\xc6\x03\x81\x31\xe2\xf9\x04\x0b\x47\xfd\
-\xd3\xb5\xc7\x00\xc8\x55\x5c\x79\xc7\x87\xef\xd4\x2e\xfe\x36\x34\
-\xb4\xc7\x00\xc8\x5a\x61\xc3\x77\x14\x0b\xc0\xaf\x39\xf0\x03\x48\
-\x2f\xee\xcb\x21\x73\x70\x99\xd6\xdc\x97\x05\xc0\x9d\x15\xdb\x7a\
-\xb6\xf6\x38\x00\x59\x8b\x4f\xe5\xeb\xbd\xfa\xd3\x69\x02\xbe\xa9\
-\x3d\x06\x40\x4e\x3a\xbb\x82\x3a\xff\x53\xb5\x39\xdf\x99\xf7\xfe\
-\x18\xed\x71\x00\xb0\x41\xdc\xf9\xcb\xbf\x5d\xb3\x18\x14\xd6\xff\
-\xbb\xf6\x18\x00\xb9\x88\x47\x75\xeb\x5e\xfc\xc3\x19\xdc\xf9\x03\
-\x4a\x24\x9e\xc0\xa5\xd7\x00\x84\xfb\x64\x45\xf2\x7a\xed\x31\x00\
-\x06\x9d\x69\x84\x7f\x51\x7b\xe2\xdf\x75\x8e\x09\xbf\xc9\x2c\x1d\
-\xdb\x5e\x7b\x1c\x00\x3c\xc8\x42\xb7\x7c\x5b\x69\x02\xae\xd3\x5b\
-\x19\xf8\x5b\x4c\x3d\xec\xa1\x3d\x0e\xc0\xa0\x2a\x6a\xfe\x95\x72\
-\x01\xbe\x5b\x73\xf5\x2f\xcd\xfe\x7b\xb4\xc7\x01\xc0\x5a\x14\x75\
-\xff\x4f\xaa\xc5\xc1\xf9\xab\xcc\x69\xe1\x99\xda\xe3\x00\x0c\x9a\
-\xa2\x31\xf6\x42\x99\x63\x37\x6a\xce\xef\xaa\x0d\xc3\xda\xe3\x00\
-\x60\x1d\x64\x25\xfe\x33\xd5\x22\xe1\xc2\x99\xf3\x46\x57\x3e\x41\
-\x7b\x1c\x80\x41\x11\xcf\xff\x90\x79\x7d\xbd\x72\x73\x7f\x25\x1b\
-\xfe\x00\x25\x67\x96\x4e\x3c\xa9\x70\xe1\x72\xdd\x62\x11\x7e\x35\
-\xb7\xd9\xdc\x44\x7b\x2c\x80\x7e\xb7\xe0\x34\xed\x8d\x7e\x62\xf8\
-\x55\xa6\xee\x5f\xa3\x3d\x16\x00\xd6\x43\xd1\x68\xbd\x3a\x4e\x5a\
-\xe5\xa2\x31\x12\xdf\x55\xd6\x1e\x0b\xa0\x5f\x9d\xba\xe4\xac\x5d\
-\xe5\xe2\x7f\xa7\xee\x3c\xee\xbc\xe5\x73\xa2\xf6\x58\x00\x98\x06\
-\x99\xb4\xdf\xd2\x2e\x1c\xf1\x3b\xc3\x78\x4a\x99\xf6\x58\x00\xfd\
-\x26\x6e\xb2\x63\x9c\xfe\xc5\x5f\xe6\xb0\xa7\x91\x07\xfa\x4c\xbc\
-\x05\x2f\xab\xf0\xb3\xb5\x0b\x48\xe1\xfc\x8f\xe2\xc6\x25\xda\xe3\
-\x01\xf4\x8b\x85\x6e\x62\x5b\xad\xd3\x3e\x1f\xba\xf2\x0f\x7f\x8e\
-\x27\x8f\x6a\x8f\x07\x80\x19\x30\x8d\xf0\x1c\xfd\xef\x0f\x3b\xb7\
-\x10\xbf\xa7\x3d\x16\x40\x3f\x88\xef\xd8\x17\xb6\x75\xad\xfe\x9c\
-\x0d\xf7\x55\x5c\x6b\x3f\xed\xf1\x00\x30\x0b\xaa\x47\x85\x3e\x34\
-\xbe\x1f\x4f\x30\xd4\x1e\x0f\xa0\xac\xcc\xe8\xf8\x4e\x45\x23\xfc\
-\xa1\x04\x73\x95\x23\xbf\x81\x41\x11\xf7\xeb\xd7\x2e\x28\x53\xab\
-\x8a\x79\x3c\x13\x00\xfc\xad\x4a\xad\xbd\xab\xea\x99\x1e\x0f\x9e\
-\xa7\xce\x17\xda\xe3\x01\xa0\x4b\xe2\x45\x57\x26\xf6\x72\xed\xc2\
-\xf2\x40\x71\xe1\xa1\x22\xe0\xff\xc4\x63\xbd\x75\x77\xf1\x7c\x48\
-\x93\x7e\xc1\x7c\x3b\xbe\x85\xf6\x98\x00\xe8\xa2\xb8\x55\xb0\x5c\
-\x7c\xaf\xd6\x2e\x30\x93\x45\xc6\xff\xd2\x5a\xbb\xb1\xf6\x98\x00\
-\xda\xe2\xfb\xf5\x65\x78\x4e\x67\x2a\x6e\x34\xae\xb5\x8b\xf6\x98\
-\x00\xe8\x01\x63\xc3\xab\xe2\xc3\x3d\x25\x28\x34\xf1\x38\xd1\x66\
-\x3c\xca\x58\x7b\x4c\x00\x2d\xc6\xb5\xdf\x27\x4d\xf9\x3d\xea\x73\
-\x71\x72\x3e\xde\x5b\xb1\xfe\x00\xed\x31\x01\xd0\x43\xd2\x00\x1c\
-\xa5\x5e\x6c\xa6\x42\x56\x3e\x2b\x86\x96\xb5\xb7\xd6\x1e\x13\x20\
-\xa5\xf8\x5a\xac\x5c\xf8\xbf\xa2\x3d\xff\x1e\x32\x17\xeb\xfe\xfd\
-\xda\xe3\x02\x20\x01\x69\x02\x4e\xd6\x2e\x38\x7f\x2d\x3c\xf1\x00\
-\xa1\x5a\x6b\x4f\xed\x31\x01\x52\x88\x5f\x7d\x55\x9d\xff\xb9\xf6\
-\xbc\xfb\xdb\xf0\x3f\xe3\x2d\x1d\x20\x03\x93\x0f\x05\x7a\xab\x5f\
-\x74\xa6\x9a\x00\xeb\x6f\x36\x8d\xf6\x81\xda\xe3\x02\xf4\xd2\x82\
-\x91\x89\xad\x64\xde\xb5\xb4\xe7\x1b\x4d\x00\x90\xb9\xf8\xfd\x7b\
-\x19\x76\x0a\xfc\x6b\x58\x7f\x6f\xb5\xde\x3a\x4c\x7b\x5c\x80\x5e\
-\x98\x3a\xce\xf7\x12\xf5\x79\xf6\xe8\x51\xe1\x55\x5d\x20\x03\x95\
-\xc6\x99\xdb\xc5\xed\x3e\x4b\x50\x74\x1e\xdc\x08\xfc\x27\xab\x10\
-\x0c\x92\xa2\x1e\x0e\x2d\x9c\xbf\x43\x7d\x6e\xad\x67\xc8\xcf\xfa\
-\x53\xe6\x20\x90\x81\xce\x3b\xc8\xd6\xdf\xae\x5d\x74\x1e\xda\x04\
-\x84\x5f\xf3\x70\x20\xfa\x5d\xfc\xbe\x5f\x1a\xec\xef\xa8\xcf\x27\
-\x9a\x00\x00\x8f\xa4\xe2\x5a\xff\x28\x8d\xc0\xfd\xda\x45\xe7\x21\
-\x05\xc8\x86\x3f\x0e\xd5\xda\x2f\xd3\x1e\x1b\x60\x26\x26\xef\xae\
-\xf9\x15\xda\xf3\x68\x96\x51\x31\xc6\x6c\xa8\x3d\x96\x00\x7a\xac\
-\x6a\xfd\x07\x4a\x72\x66\xc0\x83\x57\x21\xf7\x54\x9d\x3f\x42\x7b\
-\x6c\x80\xe9\xa8\xd8\xd6\xeb\xca\xb2\xb3\x5f\x17\xe6\x20\x77\x02\
-\x80\x1c\x98\x46\xf8\x7f\xda\x05\x67\xad\x45\xc8\x86\x21\xd3\x6c\
-\x6e\xae\x3d\x3e\xc0\xba\x74\x6e\xf9\xbb\xf0\x75\xb9\xf8\xaf\xd2\
-\x9e\x33\x34\x01\x00\xa6\xcd\xd8\xf6\x67\xb5\x0b\xce\xda\xc3\x9f\
-\x1f\x9f\x57\xd0\x1e\x1f\x60\x6d\x86\x6c\xfb\x05\x72\xa1\xfc\x9d\
-\xfe\x3c\xa1\x09\x00\x30\x0b\x72\xa1\x3d\x41\xbb\xe0\xac\xb5\x08\
-\xd9\x70\x5f\x5c\x61\x71\x98\x10\xca\x22\xee\xea\x17\x8f\xce\x95\
-\xcf\xe5\xdd\xda\xf3\x83\x26\x00\x40\x57\x94\x69\xb7\xc0\xb5\x34\
-\x02\xc1\x34\xc2\x73\xb4\xc7\x08\x79\x5b\x68\xc7\x9f\x25\x17\xfe\
-\x5f\x69\xcf\x87\xc4\xc1\x83\x81\xc0\xa0\x8b\x2b\x9b\xaa\xf5\xa7\
-\x94\xa0\xe0\xac\xbd\x09\x70\xfe\xce\xb8\xf2\x8a\x3f\xa7\xf6\x58\
-\x21\x2f\x9d\x55\xbf\xf5\x1f\xaa\x3a\x7f\x8b\xf6\x3c\xa0\x09\x00\
-\xd0\x13\x71\x92\xc7\xed\x41\x4b\x50\x70\xd6\x11\xde\x56\x5c\x7b\
-\x47\xed\xb1\x42\x1e\xe2\x77\xfd\xf2\x99\x1b\xd7\xff\xdc\xab\x07\
-\x4d\x00\x30\xe8\x3a\x27\x97\xd9\x70\x52\x09\x0a\xce\x23\x46\xbc\
-\x1b\x20\x45\xf9\x8b\xc6\x9c\xfb\x78\xed\xf1\xc2\x60\x32\x26\x6c\
-\x1a\x3f\x63\xa5\x39\xbe\xb7\x1c\x41\x13\x00\x0c\xba\xa9\xaf\x03\
-\xfe\xb3\x04\x05\x67\xdd\x61\xc3\x39\x45\x3d\xbc\x5c\x7b\xbc\x30\
-\x58\x2a\xf5\xf6\x1b\x0b\xeb\x2f\x53\xff\x7c\x97\x33\x68\x02\x80\
-\x1c\x48\x13\x70\x6c\x09\x0a\xce\x3a\x23\x6e\x66\x54\xd8\x30\x2f\
-\x9e\xbc\xa6\x3d\x5e\xe8\x6f\xc6\xb5\x76\x91\xcf\x94\xd1\xfe\x4c\
-\xf7\x41\xd0\x04\x00\x39\x90\x8b\xeb\x51\x65\xdb\x31\x70\xed\xe1\
-\xaf\x93\x9f\xf5\x48\x5e\x19\xc4\x74\xc5\xe6\x31\xbe\x05\x13\x5f\
-\x3b\xd5\xff\x1c\xf7\x4d\xd0\x04\x00\x39\xa8\xda\xd6\x21\xfd\x52\
-\x1c\x0b\x17\x2e\x8f\xa7\xb1\xf1\xb6\x00\x1e\x4d\x6c\x16\xa7\x9e\
-\xee\x1f\x88\x6d\x7c\x69\x02\x00\xf4\x44\xc5\xb5\xdf\xda\x4f\x47\
-\x9c\x56\x6d\xf0\x95\x86\xdf\x57\x7b\xdc\x50\x3e\xf1\xa2\x65\x9c\
-\x7f\xaf\x7c\x4e\x2e\x51\xff\x9c\x4e\x23\xa4\xb9\xfd\x71\xa5\xd1\
-\x2e\xdb\xb3\x39\x34\x01\x40\x0e\x0a\xeb\xf7\x96\x26\xe0\xea\x12\
-\x14\x9d\xf5\x2b\x98\xf1\xab\x0b\x1b\x86\x8b\x51\xbf\xbb\xf6\xd8\
-\x41\xdf\xff\x5d\xf8\xfd\x85\xda\x9f\xcd\x69\x7f\x8e\x5d\xf8\xcc\
-\x03\x79\x94\x70\xe7\x4e\x9a\x00\x20\x07\xe6\xb4\xf0\x4c\x99\xf0\
-\xbf\x29\x41\xd1\x99\x6e\x23\x70\x5a\x6c\x60\xb4\xc7\x0f\xe9\xc5\
-\xed\x6c\xe5\xa2\xf9\x8e\xc2\x86\x0b\xb4\x3f\x8b\xd3\xfe\xec\xba\
-\x70\xb7\xfc\xdc\xef\x79\x78\x4e\x34\x01\x00\x54\x98\xa5\x13\x4f\
-\x92\x09\x3f\x5a\x82\xa2\x33\xa3\x46\x60\xa8\xd6\x7e\x99\xf6\x18\
-\xa2\xf7\xe2\x69\x7d\x53\xc7\x5e\x5f\xa4\xfd\xd9\x9b\x59\xf8\xeb\
-\xd6\xf5\x9a\xeb\xe4\x49\x84\xda\x3f\x23\x4d\x00\x90\x9d\x66\xb3\
-\xf9\x38\x29\x40\x73\x4a\x50\x74\x66\xda\x0c\x2c\x91\x9f\xff\xb5\
-\x3c\x2c\x38\x78\x16\x8e\xfa\xa7\xcb\xaa\xf9\x38\xb9\xf8\x5f\xa3\
-\xfd\x39\x9b\x71\x58\x7f\x96\x19\x1d\xdf\xe9\xd1\x72\xa5\x09\x00\
-\xa0\x46\x0a\xd5\x31\x52\x84\xee\x2f\x41\xe1\x99\x59\x23\xe0\xfc\
-\x79\xf2\xe7\xe1\xf3\x46\x57\x3e\x41\x7b\x2c\x31\x3b\xf1\x59\x0f\
-\xf9\x7d\xfe\xa8\x6a\xc3\x5d\xda\x9f\xab\x59\x7e\x26\x7f\x34\xb7\
-\xd9\xdc\x64\xbd\xf3\xa6\x09\x00\xa0\xa5\x62\xfd\x01\xb2\xe2\xba\
-\xb6\x04\x85\x67\x16\x45\x37\xdc\x24\x17\x8e\x6f\x0e\xd7\xc6\x76\
-\xd6\x1e\x4f\xac\xbf\xb8\x1d\xb4\xb1\xfe\xed\x9d\x3b\x3a\x7d\xb1\
-\x5f\xc5\x3a\x42\x1a\x17\x63\xc3\xbf\xcd\x64\x1c\x68\x02\x00\xa8\
-\xe9\x3c\x1c\x68\x83\x2f\x41\xe1\x99\x65\xf8\x55\x9d\x07\x06\x1b\
-\xad\xb7\xc5\xef\x90\xb5\xc7\x15\x6b\x67\xea\x61\x0f\xf9\x5d\x7d\
-\x7b\x60\xde\xe1\xb7\xfe\x0f\x72\x11\xdf\x6b\x36\x63\x42\x13\x00\
-\x40\x4d\xdc\x58\xa5\xec\x07\x09\x4d\x27\x64\x45\x79\x83\xfc\xf9\
-\xfd\xc2\x8e\xed\xa3\x3d\xb6\xd8\x60\x83\x45\x8b\x9a\x4f\x36\xb6\
-\xfd\x11\xf9\x9d\x9c\xa9\xfd\xd9\xe8\x6e\x78\x6b\x1a\xe1\x29\xdd\
-\x18\x23\x9a\x00\x00\xaa\x64\xd2\xbf\x53\x0a\xd1\xad\x25\x28\x3e\
-\x5d\x8b\xa9\x57\xc8\x3e\xc3\x57\x04\x69\x2d\xa8\x8d\x6d\x69\x5c\
-\xfb\x7d\x32\xfe\xb5\x81\x3b\x99\xcf\xfa\x7b\xe3\x67\x2a\xbe\xa6\
-\xd8\xcd\x31\xa3\x09\x00\xa0\x6a\xb8\xe1\x9f\x27\x45\xfb\xdc\x12\
-\x14\x9f\x1e\x14\xee\xb0\xb2\x73\x1c\x71\xad\xb5\xa7\xf6\x38\x0f\
-\xa2\x53\x97\xae\x78\xea\xd4\xeb\x7b\x6e\xea\x22\xa9\xff\x3b\xef\
-\x72\xc4\x86\x72\xa8\xde\x7a\x49\xaf\xc6\x90\x26\x00\x80\xaa\xa9\
-\x33\xd5\xbf\xdb\xf7\x0f\x67\xad\xb3\x90\xfb\xcb\x64\x65\xfa\x5f\
-\xc6\x86\x57\x71\x10\xd1\xcc\x4c\x6d\xd4\xb3\x97\xc4\xa7\x65\x2c\
-\x4f\xef\x97\x73\x27\x66\xf8\x79\x59\x2d\x39\xfe\x60\x64\x64\x62\
-\xb3\x5e\x8f\x2b\x4d\x00\x00\x75\xf1\x7d\x7b\x29\x7a\x57\x96\xa0\
-\x00\xf5\xb6\xb8\xc7\xb3\x12\xac\x5f\x1a\x8f\x51\x36\xa3\xe3\x2f\
-\xee\xf6\xad\xdd\x41\x62\xec\x19\x4f\xeb\xec\xce\xe7\xc2\x1c\x19\
-\xb7\xab\xb4\x7f\x77\x49\x3e\x1f\x36\x5c\x2b\x71\x50\xca\x71\xa6\
-\x09\x00\xa0\x2e\x7e\x97\x2b\xc5\x6f\xa8\x04\x05\x28\x5d\xc1\x77\
-\xe1\x2f\xb2\xe2\xab\xc6\x07\xd7\x86\xac\x7f\x51\xdc\x3c\x49\xfb\
-\xf7\xa0\x21\x6e\xb6\x64\xec\xf8\xf3\xe3\x2b\x6e\x55\x1b\x7e\x22\
-\x9f\x83\xdf\x0f\xf2\x5d\xa1\xb5\x86\x0d\x8b\x63\xd3\xa3\x31\xfe\
-\x34\x01\x00\x4a\xc1\xd4\xdb\xef\x9a\x7a\xba\x5e\xbb\x08\x25\x0f\
-\x59\xe9\xde\x39\xf9\xaa\x64\xe7\xf5\xb5\x83\x2b\xb6\xf5\x6c\xed\
-\xdf\x47\x2f\x54\x5c\x7b\xc7\x4a\xc3\xbf\x59\x1a\x9f\xcf\x76\x1e\
-\xde\xcb\xf4\xf7\xdd\xf9\x9d\x5b\x7f\x7d\x7c\x88\x51\xfb\x77\x42\
-\x13\x00\xa0\x14\xe2\x9e\x01\x9d\x07\xbc\xf4\x8b\x90\x7a\xc8\x38\
-\xdc\x2c\xcd\xc0\x78\x67\x65\xec\xc2\x27\xe3\x2d\x62\xd3\x08\xcf\
-\x29\x7b\x71\x8c\x5f\x6f\x54\x1a\x67\x6e\x27\x17\xfb\xfd\xe5\xe7\
-\x3f\xa2\x6a\xfd\xff\x4c\x35\x37\xb7\x68\x8f\x69\x59\x42\x7e\x97\
-\xf3\xb4\x56\xfd\x6b\x43\x13\x00\xa0\x34\xe2\x2a\xb8\x9f\x8e\x17\
-\x4e\x7a\xf1\x70\xe1\x6e\x19\x9f\xf3\xe3\x33\x05\xd2\x24\xcc\x95\
-\x71\xfa\x52\xb5\xde\x3a\xac\x52\x6f\xbf\x71\xc8\x8d\xed\x16\xf7\
-\xbb\x8f\xbb\xe0\xf5\xe2\xf7\x12\xb7\xa1\x5d\x68\xc7\x9f\x55\x34\
-\xc6\x5e\x68\x1a\xed\x03\xe3\x69\x74\x93\x0f\xe8\x85\x39\x53\x3b\
-\xee\x5d\x3c\x70\xaf\xe4\x75\xf3\x77\xd7\x19\x9f\xf0\xda\x5e\xfc\
-\x6e\x66\x8b\x26\x00\x40\x69\xc4\xcd\x5d\xe2\x53\xd1\x9d\x1d\xf8\
-\xf4\x8b\x51\xdf\xc5\xe4\x83\x87\xe1\x4f\x9d\x33\x0d\x26\x77\x62\
-\xac\x4b\x98\x07\x62\xb2\x79\x88\x0f\xda\x3d\x28\x64\x65\xda\xf9\
-\xcf\x6d\x38\xad\xd3\x60\x38\x3f\x26\xff\xbd\x89\xce\x6e\x74\x36\
-\xdc\xa6\x9d\x53\xdf\x86\xf5\xf7\xca\x38\x7e\x35\xbe\xfd\xa2\x3d\
-\xaf\xd6\x85\x26\x00\x40\xa9\xc4\x23\x7a\xa5\x30\xfd\xb6\x04\xc5\
-\x88\x20\x66\x10\xbe\x15\x0f\x23\xd2\x9e\x47\xeb\x8b\x26\x00\x40\
-\xa9\xc4\xa7\xe4\x8d\xf3\x1f\x1b\xb4\x5d\x04\x89\xc1\x8d\xf8\x7a\
-\x6b\x51\x0f\x87\xf6\xe3\xb1\xd2\x34\x01\x00\x4a\xa7\xf3\xfd\xb3\
-\xf3\x3f\xe5\x6b\x01\xa2\xbc\xe1\x6f\x31\xd6\x7f\x6a\x3a\xc7\xf6\
-\x96\x11\x4d\x00\x80\x52\x8a\xef\x8e\x77\xbe\xa7\xd6\x2f\x4a\x04\
-\x31\x15\x7e\x55\xe7\xe9\xfe\xda\x8a\x6d\xb4\xe7\x47\xb7\xd0\x04\
-\x00\x28\x2d\xd3\x08\x6f\x28\x9c\xff\x5d\x09\x0a\x13\x91\x77\x8c\
-\xf6\xd3\xf7\xfc\xd3\x41\x13\x00\xa0\xb4\xa6\xf6\x8b\x8f\x5b\xc7\
-\x5e\x5e\x82\xe2\x44\x64\x15\xbe\x55\xb1\xfe\x00\xed\x39\xd0\x6b\
-\x34\x01\x00\x4a\x2d\x1e\xa2\x52\xb5\xfe\x18\xf6\x0f\x20\x7a\x1e\
-\xd6\x37\xe3\x21\x4f\xda\x9f\xf9\x94\x68\x02\x00\x94\x5e\xdc\x04\
-\xc7\x58\xff\x21\x29\xd2\x57\x94\xa0\x48\x11\x03\x15\xbe\x55\xd6\
-\x8d\x7c\x52\xa0\x09\x00\xd0\x17\xac\xb5\x1b\x4b\xc1\xfa\x70\x3c\
-\x96\xb7\x04\x85\x8a\xe8\xef\x58\x96\xdb\x8a\xff\x91\xd0\x04\x00\
-\xe8\x1b\x73\x26\x26\x36\x8a\x87\xae\xc8\xea\xed\xc2\x12\x14\x2b\
-\xa2\x4f\x22\x6e\xb9\xdc\xd9\x2d\xb1\x31\xf6\x42\xed\xcf\x70\xd9\
-\xd0\x04\x00\xe8\x2b\x71\x43\x96\x78\xfb\xb6\x1a\xb7\xc1\x75\xe1\
-\xfe\x12\x14\x2d\xa2\x84\xd1\x39\xaa\x59\x2e\x70\x71\xcf\x09\xed\
-\xcf\x6c\x99\xd1\x04\x00\xe8\x4b\xf1\x54\xbd\xa9\x02\x76\x63\x09\
-\x0a\x17\x51\x82\x90\xd5\xfe\x45\x71\xb7\xc9\xf8\x30\xa9\xf6\xe7\
-\xb3\x5f\xd0\x04\x00\xe8\x5b\xf3\xed\xf8\x16\x55\xe7\x3f\xca\xd7\
-\x03\x79\x46\xe7\xc0\x24\xe7\x7f\x16\xbf\xdf\xef\xc7\x2d\x7b\xb5\
-\x75\xee\xaa\xd9\x70\x92\xf6\xef\xf1\x21\xbf\x53\xeb\xe7\xc6\x57\
-\x83\xb5\xc7\x06\x40\x9f\x88\x05\xc3\xd4\xfd\x6b\xe2\xc5\x80\x53\
-\xef\xb2\x88\x76\x3c\x42\x39\x36\x80\xda\x9f\xbd\x7e\x47\x13\x00\
-\x60\x60\xc4\x23\x5b\xe3\xc6\x42\x71\xab\x61\x9e\x15\x18\xa8\xb8\
-\xb1\x73\xe4\x31\x0f\xf5\x75\x1d\x4d\x00\x80\x81\x63\x96\x8e\x6d\
-\x6f\x6c\xfb\xb3\x52\xdc\x2e\xd0\x2e\x68\xc4\x4c\xc2\x5f\x27\x17\
-\xfd\x1f\x9a\x46\xfb\xc0\x78\xa2\xa4\xf6\xe7\x69\x90\xd1\x04\x00\
-\x18\x58\x43\x6e\x6c\xb7\xaa\xf5\xc7\x76\x36\x83\xb1\x7e\xb5\x76\
-\x71\x23\x1e\xb1\xe8\x5f\x1f\x0f\xe5\x91\x38\x28\xbe\x02\xaa\xfd\
-\xb9\xc9\x09\x4d\x00\x80\x81\x57\x71\xed\x1d\xab\x36\x1c\x2d\x05\
-\x66\x39\x5f\x13\xe8\x87\xfc\x0e\x2e\x95\x0b\xcf\xc9\x45\xa3\xf5\
-\x6a\x9e\x02\xd7\x45\x13\x00\x20\x1b\xc6\x9e\xf1\xb4\xaa\xf5\x1f\
-\x90\x42\x53\x91\x3f\xaf\xd1\x2e\x76\x39\xc4\xe4\x83\x9a\x7e\x44\
-\xe2\x88\xe1\x25\xed\xe7\x6a\x7f\x06\xf0\x50\x34\x01\x00\xb2\x13\
-\x0b\x9f\xa9\x87\x3d\xe2\xfb\xe4\x53\x17\xa8\x5b\xb4\x0b\xdf\x20\
-\x44\xbc\xcb\x22\x05\x7c\x42\xfe\x3c\xa1\xe2\xda\xfb\xc7\xf3\x1e\
-\xb4\x7f\xd7\x58\x37\x9a\x00\x00\x59\x8b\x0f\x9e\x15\x76\x6c\x1f\
-\xb9\x70\x7d\x5a\x8a\xcf\x2f\x39\xa9\x70\xbd\x2f\xf8\x37\x49\xf3\
-\x64\x25\x3e\x1f\x8f\xdb\x35\xcd\xe6\xe6\xda\xbf\x4b\x4c\x1f\x4d\
-\x00\x00\x3c\x48\xa5\x71\xe6\x76\x45\xa3\xf5\x36\x29\x44\x27\xc6\
-\x63\x65\xe5\x62\x77\xab\x76\x51\x54\x0d\x1b\xee\x92\x71\x38\x2b\
-\x16\xe6\x78\x8a\x63\x31\xea\x77\xa7\x40\x0f\x0e\x9a\x00\x00\x78\
-\x04\xf1\xa1\x35\x63\xc7\x9f\x1f\xf7\x1e\x30\x36\x7c\x41\x0a\x54\
-\x45\xfe\xf9\xb7\x9d\x0b\x63\x09\x8a\x65\x17\x8b\x6e\x7c\x73\xe2\
-\x12\x89\x45\x92\xdb\xf1\x31\xdf\xe1\x86\x7f\x1e\xaf\xe7\x0d\x3e\
-\x9a\x00\x00\x98\x86\x58\x9c\x2a\xb6\xf5\xec\x4a\xc3\xbf\x59\x56\
-\xc8\xc7\x54\x9d\xff\xae\x5c\x38\x17\x4b\xf1\xfa\xdf\xf2\x7e\x95\
-\xe0\x6f\x91\x9f\x71\x65\xe7\x22\xef\xfc\xb7\xe3\x36\xcb\xf1\x75\
-\xbc\xb8\xaa\x67\x8f\xfd\xbc\xd1\x04\x00\x40\x97\x58\x6b\x37\x1e\
-\xae\x8d\xed\x5c\x71\xad\xfd\xaa\xb6\x75\x88\x14\xd7\x23\xe3\x77\
-\xe6\x52\xd4\xbe\x25\xab\xeb\x1f\x4b\xd3\xb0\x50\xfe\xfc\x55\xe7\
-\xf6\x7a\x7c\x4d\xce\xf9\xab\xaa\x93\x87\x1f\x75\x62\x72\x1f\xfc\
-\x87\x15\x44\xe7\xef\xe9\xfc\xe7\xd6\x5f\x33\xf5\x6a\xdd\xef\x3b\
-\x0f\xdf\xd9\x10\xe4\x4f\x27\x7f\x37\x3f\x16\x71\xf9\xef\x7d\x4e\
-\xfe\xf9\xc3\xc6\x86\x7f\x2e\x6a\xfe\x95\xf1\x0e\xc6\xa9\x4b\x57\
-\x3c\x55\x7b\x4c\x50\x6e\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\
-\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\
-\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\
-\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\x4d\x35\
-\x01\xdf\xd1\xbe\xf0\xd3\x04\x00\x00\x90\x18\x4d\x00\x00\x00\x99\
-\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\
-\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x55\xc6\x26\xa0\
-\x6a\xc3\x4f\x68\x02\x00\x00\xe8\x31\x9a\x00\x00\x00\x32\x45\x13\
-\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\
-\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\
-\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\
-\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\
-\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\
-\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\
-\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\
-\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\x29\
-\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\
-\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\
-\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\
-\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\
-\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\
-\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\xa9\xd8\x04\x54\x9d\xff\xae\
-\xfa\x85\x9f\x26\x00\x00\x80\xb4\x68\x02\x00\x00\xc8\x14\x4d\x00\
-\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\
-\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\xa9\x32\x36\x01\x85\x0b\x3f\
-\xa6\x09\x00\x00\xa0\xc7\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\
-\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\
-\x80\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\
-\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\
-\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\
-\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\
-\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\
-\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\
-\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\
-\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\
-\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\x29\x9a\
-\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\
-\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\
-\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\
-\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x54\x6c\x02\x0a\
-\xeb\xbf\xa7\x7d\xe1\xa7\x09\x00\x00\x20\x31\x9a\x00\x00\x00\x32\
-\x45\x13\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\
-\x99\xa2\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\
-\x80\x4c\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\
-\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\
-\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\
-\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\
-\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\
-\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\xd1\x04\x00\x00\
-\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\xa6\x68\x02\x00\
-\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\x09\x00\x00\x20\x53\x34\x01\
-\x00\x00\x64\xaa\x9c\x4d\x80\xff\x11\x4d\x00\x00\x00\x3d\x46\x13\
-\x00\x00\x40\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\xa2\
-\x09\x00\x00\x20\x53\x34\x01\x00\x00\x64\x8a\x26\x00\x00\x80\x4c\
-\xd1\x04\x00\x00\x90\x29\x9a\x00\x00\x00\x32\x45\x13\x00\x00\x40\
-\xa6\x68\x02\x00\x00\xc8\x14\x4d\x00\x00\x00\x99\x9a\x6a\x02\xfe\
-\x5b\xfb\xc2\xff\x90\x26\xc0\x86\x93\xb4\xc7\x05\x00\x80\x81\x57\
-\xca\x26\xa0\x1e\x0e\xd5\x1e\x17\x00\x00\x06\x5e\xf9\xbe\x0e\xf0\
-\xb7\x2c\x74\xcb\xb7\xd5\x1e\x17\x00\x00\x06\x5e\xf9\xee\x04\xf8\
-\xef\x6a\x8f\x09\x00\x00\x59\x28\x55\x13\x60\xfd\xed\xf3\xed\xf8\
-\x16\xda\x63\x02\x00\x40\x16\x26\x9b\x80\x70\xb2\x7a\x03\x20\x61\
-\xea\xed\x77\x69\x8f\x07\x00\x00\xd9\x28\x4b\x13\x50\x38\xff\x03\
-\xed\xb1\x00\x00\x20\x2b\x25\xf9\x3a\x60\xb9\xf6\x38\x00\x00\x90\
-\x1d\xed\x3b\x01\xf2\xef\x3e\x57\x7b\x0c\x00\x00\xc8\x92\xee\x9d\
-\x00\x7f\xbe\x76\xfe\x00\x00\x64\x4b\xad\x09\xb0\xc1\x6b\xe7\x0e\
-\x00\x40\xd6\x54\xbe\x0e\xb0\xfe\x14\xed\xbc\x01\x00\xc8\x5e\xea\
-\x3b\x01\xc6\xb5\xdf\xa7\x9d\x33\x00\x00\xd8\x20\x5d\x13\x50\x38\
-\x7f\xcf\x82\x91\x89\xad\xb4\xf3\x05\x00\x00\x53\x52\x7c\x1d\x20\
-\x4d\xc6\x5c\xed\x3c\x01\x00\xc0\xc3\xf4\xb2\x09\x28\x5c\xb8\xbb\
-\x52\x5f\xf1\x77\xda\x39\x02\x00\x80\xb5\xe8\xd5\xd7\x01\xc6\x85\
-\xff\xd0\xce\x0d\x00\x00\xac\x43\xa7\x09\x70\xfe\x07\x5d\xbc\xf5\
-\x5f\x8d\xff\x9b\xda\x79\x01\x00\x80\x47\x31\xd9\x04\x84\x6f\x74\
-\xe3\xe2\x3f\x67\x62\x62\x23\xed\x7c\x00\x00\xc0\x34\x54\x6d\xeb\
-\x10\xb9\x90\xdf\x38\xed\x8b\xbf\x0d\x77\xc5\xdb\xfe\xac\xfc\x01\
-\x00\xe8\x53\x0b\x47\xfd\xd3\x0b\x1b\x4e\x92\xb8\x6d\x7d\x5e\xf5\
-\x93\xf8\xe9\x70\x6d\x6c\x67\xed\x9f\x1b\x00\x00\x74\xc1\xe2\xc5\
-\xad\x27\x16\x2e\xbc\x43\x2e\xf4\xdf\x97\x58\x2e\xab\xfc\x73\xe4\
-\x62\x7f\x5e\xdc\xde\x57\xfe\xfe\x87\x71\x93\x9f\xf5\x79\xcf\xff\
-\xff\x03\x9e\xd3\x8a\xa1\x28\x16\x47\x53\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x38\x73\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x09\x9c\xa4\x45\x7d\xff\x71\x15\x01\x01\x6f\x51\x94\xe0\x89\
-\xe0\x2d\x1e\xd1\x80\x9a\xe0\x15\x8d\x57\xbc\x31\x9e\x7f\x92\x78\
-\x80\x51\x8c\x1a\xc5\x23\x66\x11\x8d\x27\x1e\xa0\x44\x17\xe5\x5a\
-\xdc\xe9\xa7\xcb\x1d\x58\x87\xe9\xaa\x9e\xd9\xd5\x11\xa6\xab\x7a\
-\x16\x47\x58\x65\x41\x14\x0f\x14\x04\x41\x2e\x59\x56\x8e\x5d\x98\
-\x7f\xfd\x7a\x06\x5d\x60\x8f\xe9\x99\x7e\xea\xf7\x74\xd7\xe7\xfd\
-\x7a\xd5\x6b\x37\x9b\x84\x99\x5f\x3d\x4f\x55\x7d\x9f\xee\xe7\xa9\
-\xe7\x2e\x77\x01\x2a\x68\x62\x62\xe2\xee\xcb\x47\x27\xef\xb7\x7c\
-\x64\x7a\xf7\x15\xa3\x93\x8f\xda\xbc\xc9\xbf\x75\xfe\x77\x73\xcd\
-\x98\xb0\x8b\xf6\xef\x0b\x00\x00\x36\x63\x26\x26\xee\x59\x8c\xf9\
-\x27\x9a\x66\xf8\xa7\xba\x6d\xbd\xc5\x38\xff\xbe\xba\x0d\x9f\xaa\
-\x5b\xff\xcd\xc2\xf9\x53\xe3\xdf\xcf\x8c\x7f\x9e\x17\xff\xfc\x7d\
-\xdd\x85\xab\xe3\xbf\x5f\x1f\xff\x9c\x59\x48\x2b\x5c\xb8\x2e\xfe\
-\xff\xff\x2e\xfe\xf7\x7e\x2a\xff\xdd\xba\xf3\x23\x85\x0d\xcb\xe2\
-\x9f\xc7\xc4\x7f\xfb\xa4\xb1\xfe\x9d\xf1\xe7\xbf\x4c\x7e\x1f\x09\
-\x0e\xda\x7d\x03\x00\x40\xdf\x9a\x99\x99\xb9\xab\x5c\x95\x77\x16\
-\x78\x17\x0e\x89\x0b\xf0\xe7\x0b\xeb\xeb\xf1\xef\x67\xc5\x05\xf9\
-\x8a\x85\x2e\xe6\x49\x5a\x27\x6c\xf8\xf3\xe3\x9f\xab\x62\x60\x38\
-\x21\xfe\x79\x78\xcd\xb5\x5e\xb9\x62\xbc\xbd\x8f\x31\x66\x07\xed\
-\xbe\x05\x00\xa0\x12\x3a\x1f\xb7\xdb\x70\x60\x5c\xec\xdf\x13\x17\
-\xf7\xa5\x71\x11\x6d\xc7\x2b\xec\xf5\xea\x0b\x79\x09\x2d\xd6\x77\
-\xa3\x7c\x92\x30\x1b\x66\xfc\x11\xf1\xdf\x0e\x8a\x75\x3f\x5a\xfb\
-\x18\x00\x00\x50\xaa\x91\x91\xe9\x5d\x8b\x51\xff\x0f\x71\x21\xfc\
-\xa8\x7c\x94\x2e\x1f\xad\x6b\x2f\xca\x55\x68\x31\x10\x5c\x15\x9b\
-\x8b\xc1\xe7\xc8\x5a\xd3\xbf\x7c\x68\x75\x7b\x0f\xed\x63\x05\x00\
-\xc0\x82\x0d\xdb\xa9\xbd\x4c\xa3\xfd\x86\xb8\xb0\x7d\x35\x2e\x74\
-\x67\xc5\x05\xff\x66\xed\xc5\xb6\x5f\x5a\x0c\x49\x17\xcd\x7d\x52\
-\xf0\x1f\x2b\x9a\xfe\xb1\xda\xc7\x12\x00\x80\xad\x32\xab\xa6\xef\
-\x63\x6c\x78\x75\xe7\x66\x3c\xeb\x7f\xad\xbd\x88\x0e\x52\x2b\x9c\
-\xbf\x24\x86\x81\x93\x8b\x46\x78\x9b\x39\x3d\xfc\x8d\xf6\xb1\x06\
-\x00\x64\x6c\xc9\x92\x99\xbb\xc5\x85\xfe\x19\x71\x71\xfa\xef\xce\
-\x9d\xf7\x36\x6c\xd4\x5e\x28\x73\x69\xb1\xaf\x2f\x88\xed\xeb\x35\
-\xdb\x7a\x91\x31\xeb\x76\xd2\x3e\x17\x00\x00\x03\xee\xc4\x89\x89\
-\x7b\x18\xd7\xfe\xe7\xb9\x47\xe1\xfe\xa8\xbd\x10\xd2\x3a\x5f\x17\
-\x5c\x13\x8f\xc5\x77\x8c\xf5\xaf\x5b\x36\xb6\x76\x37\xed\x73\x04\
-\x00\x30\x20\x64\x53\x1c\xf9\x68\x3f\x5e\xed\x2f\x8f\x0b\xcd\x9f\
-\xb4\x17\x3c\xda\x36\x9a\x0d\x37\x74\xf6\x2a\x68\xfa\x7f\x95\xcd\
-\x8d\xb4\xcf\x1d\x00\x40\x9f\x91\x45\xbf\x68\xb6\x5e\x1b\x17\x95\
-\xda\xa0\x3e\x96\x37\xf0\xcd\xfa\x9b\x63\x68\xfb\x5e\xcd\xb5\x5f\
-\x63\xad\xdd\x59\xfb\x9c\x02\x00\x54\xd8\x90\x9b\x7c\x42\xe1\xc2\
-\xe7\xf8\x78\x7f\xb0\x9a\x7c\x4d\x20\xfb\x2c\x18\xdb\x7e\x8e\x6c\
-\xb4\xa4\x7d\x9e\x01\x00\x2a\xe0\xd4\x55\x6b\x1e\x10\x17\xfc\xc3\
-\xea\x36\xac\xd5\x5e\xa8\x68\x09\xc2\x80\x0d\x3f\x93\xbd\x18\x86\
-\xc6\x5b\x7b\x6a\x9f\x7b\x00\x80\xc4\xe4\x0e\x7e\xb9\x83\x5c\x9e\
-\x35\x97\x1d\xea\xb4\x17\x25\x9a\x42\x93\xaf\x08\x9c\x2f\x8a\x46\
-\x78\xb6\xf6\xf9\x08\x00\x28\x99\xdc\xc5\x2f\xcf\x92\x77\x5e\x96\
-\xa3\xbd\x00\xd1\xaa\xd4\xce\x96\x17\x1b\xc9\x6e\x8d\xda\xe7\x28\
-\x00\xa0\x87\xcc\xe8\x9a\x07\xcb\xfe\xf3\xf1\x8a\xff\xca\x0a\x2c\
-\x36\xb4\x8a\xb6\xce\xbd\x02\x36\x1c\xbd\x62\xd4\x3f\x5c\xfb\x9c\
-\x05\x00\x2c\x82\x69\x86\x67\xc6\x89\xbd\xc6\x36\xbc\xb4\x6e\x9a\
-\x6c\xea\x54\x38\x7f\x52\xad\xb1\x66\x5f\xed\x73\x18\x00\xd0\x85\
-\x78\x25\xf7\xc2\xd9\xf7\xd7\xeb\x2f\x26\xb4\xfe\x6d\xf1\x3c\xda\
-\x14\xc3\xc0\x90\x3c\x1d\xa2\x7d\x4e\x03\x00\xb6\x41\x1e\xf3\x8a\
-\x93\xf6\xf7\xb5\x17\x0e\xda\x60\xb5\xc2\xfa\x5b\x63\xa0\x3c\x5d\
-\xb6\x7e\xd6\x3e\xc7\x01\x00\x9b\x31\x0d\xff\x7c\xae\xf8\x69\x65\
-\xb7\xdb\x82\x80\x19\x9b\x7a\xba\xf6\x39\x0f\x00\x59\x2b\x9a\xad\
-\xe7\xb1\xf0\xd3\x52\x37\x09\x02\xb2\x35\x34\x37\x0b\x02\x40\x62\
-\xf2\x8e\x78\xb9\x12\xd3\x5e\x08\x68\x79\xb7\xc2\xf9\x9b\xe4\xa9\
-\x81\xd3\x4e\x9b\xb8\xaf\xf6\x98\x00\x80\x81\x26\xbb\xf6\xc9\x84\
-\xcb\xab\x77\x69\x55\x6a\x85\xf5\x57\xd5\xad\x3f\x9c\x77\x0e\x00\
-\x40\x8f\x75\x5e\xc3\x6b\xfd\x47\x78\x1b\x1f\xad\xe2\xed\x97\xf2\
-\x5a\x62\xed\xf1\x02\x00\x03\x21\x5e\xed\xbf\xa2\x70\xe1\x57\x15\
-\x98\xdc\x69\xb4\xf9\x35\x1b\x7e\x60\x5c\xeb\x31\xda\x63\x07\x00\
-\xfa\x52\x6d\xb4\xfd\xb8\xc2\xf9\x49\xf5\xc9\x9c\x46\x5b\x40\x8b\
-\xe7\xee\x9f\x8d\x6d\x7f\xdc\x98\x75\x3b\x69\x8f\x25\x00\xe8\x0b\
-\xf2\x3d\x6a\x9c\x3c\x3f\x29\x37\x58\x69\x4f\xe2\xfd\xd7\xfc\x2d\
-\x85\x0d\x97\x77\xde\x75\x60\xc3\x99\xf1\xcf\x53\x3b\x2f\xbc\x71\
-\x61\xe9\x5c\xfb\xdc\x5c\xfb\xa8\x7c\x67\x7d\x5b\x9b\xed\xef\xbf\
-\xfc\xef\x3e\x17\xff\x1b\x5f\x95\x9d\xf0\xe2\x7f\x63\x65\xfc\xf3\
-\x87\xf2\xa6\xc4\xf8\xef\x17\x15\xd6\x5f\xab\x5f\x63\x7f\x35\x39\
-\x16\xc5\xa8\xff\x07\xed\x71\x05\x00\x95\x66\x6c\x38\x30\x2e\x3e\
-\x17\x68\x4f\xda\x55\x6c\x73\xbb\xd2\xfd\x36\xfe\xfd\x0c\x59\x9c\
-\xe3\xdf\x97\xc8\x8b\x8d\x6a\xae\xf5\xf7\xf2\x54\x84\xb1\x67\x3e\
-\x30\xc5\xbb\xee\xe5\x8a\xb6\xe6\xda\x8f\x90\x4d\x97\x4c\x33\xbc\
-\x29\xfe\x5e\x1f\x8e\xc1\xe3\x98\xd9\xb0\x10\xce\x91\x2b\x5f\xed\
-\xbe\xaa\x5a\x9b\x7b\x6c\xf0\xc4\xe5\x23\xd3\xbb\x97\x7d\x7c\x00\
-\xa0\xaf\xc4\x85\xe4\xfe\x71\xf1\x38\xbe\xb3\xd1\x4a\x05\x26\x6c\
-\xdd\x26\x57\xf1\xfe\xc2\x78\x65\x3e\x2c\x2f\x30\x92\x9b\xca\x64\
-\x4f\xfa\xa5\xd3\xd3\x3b\x6a\x1f\xa7\xf9\x90\x57\x2d\xaf\x18\x9d\
-\x7c\x94\x71\xfe\x65\xb1\x86\xff\x8a\x81\xe0\xdb\x31\xac\x84\x78\
-\x7c\xaf\xd3\xef\x5b\xed\xe6\xff\x58\x34\x5b\xaf\xd5\x3e\x46\x00\
-\x50\x09\xa6\xd1\x7e\x43\x5c\x28\xfe\xa0\x3f\x39\xeb\x34\x59\xec\
-\xe3\x02\xb9\x2c\x5e\x51\x1f\x2a\x2f\x2f\x5a\x36\xb6\x76\x37\xed\
-\x63\x52\x06\x09\x06\xb2\xa7\xbe\x71\xed\x83\x63\x28\xf8\xbf\x58\
-\xf7\x74\xae\x2f\x69\xea\x1c\xef\x55\xd3\xf7\xd1\x3e\x26\x00\xa0\
-\x42\x36\x4f\x91\x17\xad\x68\x4f\xc6\x49\x27\x7e\x17\x6e\x94\x1b\
-\x1b\xe3\xe2\xf7\x85\x9a\x6b\xbd\x72\x68\x75\x7b\x0f\xed\xe3\xa0\
-\x49\x1e\xef\x2c\xec\xe4\xfe\x9d\xfb\x10\xac\x1f\x8f\x7d\xb3\x41\
-\xfb\x18\x25\x0c\x01\xbf\x95\x2d\xac\xb5\x8f\x01\x00\x24\x55\x6b\
-\xfa\x67\xe5\xf2\x68\x9f\xd4\x39\x77\x03\xde\xeb\x4f\xb1\x53\xf7\
-\xd6\xee\xfb\x2a\x9b\x98\x98\xb8\xbb\xec\xb3\x3f\x77\x73\xe2\xaa\
-\x41\xbf\x11\xb4\x73\x6f\x40\x3c\x37\x46\x46\xa6\x77\xd5\xee\x7b\
-\x00\x28\x95\xdc\xe1\x5f\xb7\xe1\x28\xf9\x9e\x5b\x7b\xf2\x2d\x6f\
-\xc1\x8f\x57\xb1\x36\xac\x8c\x7f\x3f\x24\x2e\x66\x8f\xd4\xee\xf3\
-\x7e\x26\x9f\x12\xc9\x8d\x86\xb1\x2f\x4d\xbc\x62\x5e\xaf\x7d\x6c\
-\x4b\x3c\x67\xce\x8b\x41\xe0\x69\xda\xfd\x0d\x00\xa5\x90\xef\x7f\
-\xe3\x64\x77\xb6\xf6\x64\x5b\xd2\x04\xfe\xe7\xce\xeb\x62\x1b\xe1\
-\x6d\x2b\x57\xb6\xee\xa5\xdd\xd7\x83\xa8\xf3\x75\x81\x0b\x2f\x9c\
-\xdb\x0a\xfa\x52\xed\x63\xde\xf3\x73\x48\xb6\xb7\xb6\xfe\x70\xed\
-\x7e\x06\x80\x9e\x91\x47\xd3\x8c\xf3\xef\x93\xef\xbf\xb5\x27\xd9\
-\xde\x2e\xfa\xe1\x3a\xb9\x87\xa1\xe6\xda\xaf\x31\x26\xec\xa2\xdd\
-\xcf\x39\x31\xc6\xec\xd0\x79\x05\xb4\xf3\x27\x0f\xda\x27\x03\xf2\
-\x96\xc1\x41\xbd\x11\x14\x40\x46\xcc\xc4\xc4\x3d\xe3\x84\x56\xd7\
-\x9e\x54\x7b\x3c\x41\x4f\x1b\xeb\xdf\x29\xb5\x69\xf7\x2f\x24\x0c\
-\x84\x5d\xe4\xfe\x8a\xce\x27\x30\x2e\x6c\xd2\x3e\x3f\x7a\x73\x8e\
-\x85\x0b\xe4\x13\x33\xed\xbe\x05\x80\x05\x91\xad\x7c\xe3\x15\xda\
-\xf9\xda\x93\x69\x4f\x9a\x0d\xbf\xaf\x5b\xff\x99\x15\xe3\xed\x7d\
-\xb4\xfb\x15\x5b\x67\x56\x4d\x3e\xac\x70\xfe\xbf\xe7\x36\x4c\xd2\
-\x3f\x6f\x16\x13\x02\x66\xf7\x4d\x38\x48\xbb\x4f\x01\xa0\x2b\x32\
-\x71\xf5\xfb\x47\xb3\x73\x9b\x12\x35\x6a\x4d\xff\x72\xf9\xc8\x59\
-\xbb\x4f\x31\x7f\x72\xbc\x64\xc3\x9d\x18\xda\x26\xb4\xcf\xa3\xc5\
-\x9f\x87\xe1\xab\xfd\xb2\x09\x14\x80\x8c\xc9\x63\x5c\xf1\x0a\xec\
-\xcb\xda\x93\xe6\xa2\x26\x5c\xe7\x37\xc4\xc5\xff\x1b\xbc\xcd\x6d\
-\x30\x98\x46\x78\x52\xbc\x9a\x3e\xae\xaf\xf7\x18\xb0\xe1\xcc\x53\
-\x57\xad\x79\x80\x76\x5f\x02\xc0\x16\x99\xd1\x35\x0f\x96\x89\x4a\
-\x7d\xb2\x5c\xf8\xc2\x7f\x89\xb1\xfe\x23\xb2\x2d\xb1\x76\x5f\xa2\
-\xf7\xe4\xb8\xc6\xe3\xfc\x31\xd9\x8e\x57\xfb\x5c\x5b\xd0\xf9\x69\
-\xfd\x2f\x64\x4b\x68\xed\x7e\x04\x80\xdb\xe9\x5c\x65\xf5\xed\xf7\
-\xae\xfe\xfc\xf8\xbb\xbf\x99\x8f\x59\xf3\x20\x37\x6f\xca\x3b\x0a\
-\xfa\x71\xfb\xe9\x18\x02\xae\xe4\xcd\x82\x00\x2a\x63\xf6\xd9\xec\
-\xfe\x7b\x4d\xac\xec\xd0\xd7\xb9\x9b\x9f\xef\xf7\xb3\x24\x9b\x52\
-\xc9\xf1\x2f\x9c\xbf\x58\xfb\x5c\xec\xee\xbc\xf5\x37\xc9\x7e\x13\
-\xda\xfd\x07\x20\x73\x9d\x09\x54\x36\x30\xa9\xc0\xc4\x38\xef\x09\
-\xd4\x86\x9f\xc9\xee\x72\xf2\x72\x1a\xed\xfe\x83\xbe\xce\xee\x94\
-\xce\xff\x47\x3c\x2f\x2e\xd7\x3e\x37\xe7\x7f\x0e\xcb\x0d\xaa\xfe\
-\x88\x14\xaf\x7f\x06\x80\xdb\x91\xc5\xb3\x6e\xfd\xe7\xb5\x27\xc2\
-\x2e\xdb\x2f\x65\xe1\xe7\x8a\x1f\x5b\x22\x3b\x38\xc6\xab\xeb\x4f\
-\xf7\xd7\xcd\x82\xfe\x3b\xc6\xac\xdb\x49\xbb\xef\x00\x64\x42\xae\
-\x98\xfa\xe9\x2d\x7e\xb3\x8f\x23\xfa\x23\x64\x2b\x59\xed\xbe\x43\
-\xf5\x99\xd3\xc3\xdf\xcc\xbd\xbc\xa9\x2f\x36\x15\x8a\xbf\xe7\xf7\
-\xd9\x94\x0a\x40\xe9\xe4\x51\xa4\x38\xe9\xb4\xb5\x27\xbd\x79\x35\
-\xeb\x6f\x2e\xac\xff\xda\xf2\x91\xe9\xdd\xb5\xfb\x0d\xfd\x67\xc8\
-\xb6\x9f\x1c\xcf\xa3\x31\xf5\xf3\x78\x5e\x21\xc0\xff\x90\x77\x50\
-\x00\x28\x8d\xbc\xbb\x3e\x5e\x49\xff\x44\x7b\xb2\x9b\xe7\xe2\xbf\
-\xaa\x18\xf3\x4f\xd4\xee\x33\xf4\xbf\xc2\x86\x57\xf4\xc3\x13\x2e\
-\xb2\x45\x35\x61\x17\x40\xcf\xd5\x9a\x67\x3d\x34\x2e\xfe\x3f\xd7\
-\x9e\xe4\xe6\xb1\xf0\xff\xa6\xd6\x68\xbf\x44\xbb\xbf\x30\x58\x4e\
-\xb1\x53\xf7\xee\xbc\x85\xb0\xf2\x5f\x0b\xf8\x9f\x48\x50\xd7\xee\
-\x2f\x00\x03\xa2\xe6\xda\x8f\x90\x47\xe6\xf4\x27\xb7\x6d\x5d\xfd\
-\x84\x8d\x32\x41\xf3\x5d\x28\xca\x64\x46\x5b\x4f\x89\x8b\xec\x94\
-\xf6\xf9\xbe\xed\xb1\xe0\x7f\x6d\xc6\xa6\x1e\xa9\xdd\x57\x00\xfa\
-\x9c\xb1\x53\x8f\xef\xbc\x08\xa7\x02\x13\xdb\x36\x26\xbc\xe9\x18\
-\x50\x9e\xa6\xdd\x57\xc8\x83\x3c\x45\x12\x43\xc0\x61\x55\x7e\x5a\
-\x20\x8e\x87\x8b\x6a\xb6\xb5\xb7\x76\x5f\x01\xe8\x53\xb2\xa8\x56\
-\x7a\xdb\x54\xeb\xaf\x8f\xe1\xe4\xfd\x3c\xd6\x07\x0d\xb2\x2d\x6f\
-\x95\x3f\x0d\xe8\x84\x80\xe6\x59\x0f\xd5\xee\x27\x00\x7d\xa6\xb0\
-\x93\xfb\xc7\x09\xe4\x1a\xed\x49\x6c\xab\x93\x9b\x0d\x81\x2b\x1c\
-\x68\x93\x97\x5f\xc5\x10\xf0\x09\x79\xe2\x44\x7b\x4c\x6c\xb9\xf9\
-\x9f\x73\x4f\x00\x80\x79\x93\xc7\x9f\x0a\xeb\xaf\xd2\x9f\xbc\xb6\
-\xb8\xf0\x6f\x8c\xc1\xe4\x73\xec\xdb\xdf\x9d\xa1\xf1\xd6\x9e\xc6\
-\xb6\x0f\x2d\x9c\x2f\xea\x36\x9c\x2b\x5f\xeb\xc4\xbe\xbc\x34\xfe\
-\xcf\xe7\xc5\x7e\x35\xf1\xef\xef\x35\xab\x26\x1f\xa6\xfd\x7b\xf6\
-\xab\xd9\x47\x06\xab\xf9\x84\x4c\x3c\xc6\x3f\xe5\x4d\x82\x00\xb6\
-\xab\x36\xda\x7e\x5c\x5c\x60\xaf\xd0\x9e\xb4\xb6\x76\x35\x13\x83\
-\xc9\x33\xb4\xfb\xa8\x9f\x98\x66\x78\xb4\x6c\xda\x34\xbf\xed\x9a\
-\xfd\x2d\x31\x18\xac\x90\xfb\x3e\xb4\x7f\xef\x7e\x64\x4c\xd8\x45\
-\xf6\x9d\xd0\x1f\x27\x5b\x0a\xce\x7e\x8d\x3c\xc9\xa0\xdd\x47\x00\
-\x2a\x4a\xae\x00\xab\xfa\xbc\x73\xfc\xbd\x96\x71\x87\xff\xfc\xc9\
-\x1e\xf1\xc6\x85\x0f\xc5\x05\xfd\x86\xae\xfb\xbb\xb3\x81\x52\x58\
-\xc2\xbb\x12\x16\xa6\x68\xf8\x57\x55\xf2\xe5\x58\x36\xf8\x65\x63\
-\x6b\x77\xd3\xee\x1f\x00\x15\x33\x6c\xa7\xf6\x92\x67\xe8\xd5\x27\
-\xa9\x3b\x5f\xb9\x5c\x6b\x6c\x78\xb5\x76\xff\xf4\x13\xf9\x5e\x3a\
-\xf6\xdb\xf2\x1e\x2c\x18\x2b\xd9\x67\x7e\x61\x56\x34\xfd\x63\x63\
-\x88\x5a\xa7\x3d\x7e\xb6\x30\x9e\x1c\xc7\x14\xc0\x5f\xc8\x4d\x42\
-\x71\xb2\xba\x40\x7b\x72\xda\xc2\x02\x74\xae\xdc\x69\xad\xdd\x3f\
-\xfd\xa6\xee\xfc\xc9\xbd\x3b\x06\x7e\x98\x37\xce\x2d\x8c\x5c\x6d\
-\xf7\x24\x88\xf5\x3e\x04\x2c\xe7\x98\x02\xb8\xcb\x69\xa7\x4d\xdc\
-\x37\x4e\xf2\x3f\xd6\x9e\x94\xee\x3c\x49\x85\x21\x3e\xae\xec\x5e\
-\x9c\xdc\xdf\xdd\xeb\x63\x61\xac\xff\x88\x76\x5d\xfd\xac\xf3\xca\
-\x6c\xe7\x6f\xd2\x1e\x53\xb7\x1b\x5f\xce\x7f\x52\xbb\x5f\x00\x28\
-\xea\xbc\xd5\xcf\xf9\x49\xed\xc9\xe8\x0e\x13\xd3\x4d\x72\x47\xba\
-\x76\xdf\xf4\x23\xb9\xd3\xbf\x70\xe1\xba\x9e\x1f\x17\x1b\x6e\xe0\
-\x91\xcb\xc5\x31\xb6\xfd\x9c\x2a\xed\xa9\x11\x83\xe2\xad\x45\x23\
-\xbc\x4d\xbb\x5f\x00\x28\x90\x8f\x00\xab\xf6\x4a\x5f\x79\x2c\xad\
-\xd6\xf4\xcf\xd2\xee\x9b\x7e\x25\x5b\x21\x97\x76\x7c\x6c\x38\x41\
-\xbb\xbe\x7e\x27\x4f\x64\x54\xe9\x7d\x1a\x12\xb6\x8d\x0d\x07\x6a\
-\xf7\x0b\x80\xc4\xe2\x84\xfe\x29\xed\x09\xe8\x0e\x93\xd1\x4f\xd9\
-\xb5\x6c\xe1\x3a\x8f\xa0\x95\x71\xf5\xff\x97\xe3\x13\x6e\x5c\x3e\
-\x3a\x79\x3f\xed\x3a\xfb\x5d\x0c\x01\xf7\x97\x57\xf7\x6a\x8f\xb7\
-\xbf\x1c\x57\xeb\xaf\xe2\x3e\x1b\x20\x23\xc6\xb5\x0f\xd6\x9e\x78\
-\xee\x30\x09\x8d\x9b\x55\xd3\xf7\xd1\xee\x97\x7e\x26\xaf\xac\x2d\
-\xff\x38\x85\x37\x6b\xd7\x39\x08\xe4\x2e\xfc\x18\x02\x4e\xd2\x1e\
-\x77\x9b\x85\xbb\x5f\x0d\x8f\xf9\x07\x69\xf7\x0b\x80\x92\x99\x86\
-\x7f\x7e\xa5\x6e\x48\xb2\xfe\x9b\xf2\xd8\x9a\x76\xbf\xf4\x3b\xd9\
-\x1d\x31\xc1\xf1\x3a\x56\xbb\xce\x41\x21\x5f\xc1\xc9\x16\xc2\xf2\
-\x5d\xbc\xfa\x18\xec\x84\x00\x3f\xc9\xe3\x81\xc0\x00\x93\x5d\xfe\
-\xe2\x60\xbf\x5a\x7b\xb2\xe9\x4c\x38\x9d\x89\xcf\x1f\xa1\xdd\x27\
-\x83\x22\x4e\xe0\xa7\x26\x38\x6e\xab\xb5\xeb\x1c\x34\x31\xb8\xbd\
-\xab\xb3\x03\x63\x05\xc6\x64\xfc\x3d\x8e\xd1\xee\x0f\x00\x25\x30\
-\xf6\xcc\x07\xca\x7b\xc2\xf5\x27\x99\xd9\xef\x93\x8d\xf5\xaf\xd3\
-\xee\x93\x41\x52\xb7\x7e\xa2\xf4\x63\x67\xfd\x8f\xb5\xeb\x1c\x44\
-\xc6\xf9\xb7\xce\x6f\xab\xe6\x04\x63\xd3\xfa\x7f\xd1\xee\x0f\x00\
-\x3d\x24\x5b\xba\xd6\x6d\x68\x6a\x4f\x2e\xb3\x8b\xbf\xdf\x10\xdb\
-\x8b\xb5\xfb\x64\xd0\xc8\x36\xaf\xe5\x07\x80\x70\xae\x76\x9d\x83\
-\xaa\x73\x0f\xc7\x42\xb6\x6d\xee\x7d\xc8\xbb\x7e\xc8\x4d\x3e\x41\
-\xbb\x3f\x00\xf4\x48\x1c\xd4\x9f\x51\x9f\x58\x3a\x57\x17\x61\xbd\
-\xdc\x83\xa0\xdd\x1f\x83\x88\x00\xd0\xff\x8a\x66\xeb\x79\x32\x46\
-\xb4\xc7\xa9\x3c\xaa\xc8\x8b\x83\x80\x01\x60\x5c\xfb\x9f\xab\x70\
-\xa3\x91\x3c\x6e\x64\x9a\xe1\x99\xda\xfd\x31\xa8\x08\x00\x83\xa1\
-\x18\xf5\xff\x50\xe6\xe3\x9c\x5d\xb4\x9a\x76\x5f\x00\x58\x84\xce\
-\xab\x60\x5d\xb8\x46\x7b\x32\x89\x57\x35\x97\x17\xcd\xc9\xfd\xb4\
-\xfb\x63\x90\x11\x00\x06\x87\x6c\x86\x25\x1f\xc5\x6b\x8f\xdb\xba\
-\xf3\x87\x69\xf7\x05\x80\x05\x18\x19\x99\xde\x35\x0e\xe0\x9f\x68\
-\x4f\x22\x85\xf3\x97\x18\xd7\x7a\x8c\x76\x7f\x0c\x3a\x02\xc0\x60\
-\x91\xfb\x64\xb4\x1f\xd7\x95\x9f\x3f\xd4\x68\xfd\xad\x76\x5f\x00\
-\xe8\x52\x61\xfd\x89\xfa\x8b\x7f\xb8\xc2\xd8\xa9\xc7\x6b\xf7\x45\
-\x0e\x08\x00\x83\xa7\x68\xf8\x57\x69\x3f\x1d\x10\x7f\xfe\xcf\xe4\
-\x62\x42\xbb\x2f\x00\xcc\x93\xbc\x7d\x4c\x7b\xf1\x8f\xed\x6a\x33\
-\xda\x7a\x8a\x76\x5f\xe4\x82\x00\x30\x98\xe4\x11\x41\xfd\x7d\x02\
-\xd8\x1f\x00\xe8\x0b\xf2\xd6\x36\xed\x3b\x89\xe5\x51\x3f\x79\xfb\
-\x99\x76\x5f\xe4\x84\x00\x30\xb8\xea\xd6\xff\x9b\xe6\x8d\xbc\xf2\
-\xb3\x6b\x8d\xf6\x4b\xb4\xfb\x01\xc0\x36\xc8\x96\xba\x71\xb0\xae\
-\x51\x5e\xfc\xff\x5c\x73\xed\xe7\x6a\xf7\x45\x6e\x08\x00\x83\x2d\
-\x8e\xab\xff\x56\x1e\xd7\x97\xf0\x32\x28\xa0\xc2\xe2\x95\xff\x91\
-\x9a\x93\x44\xbc\x52\xb9\xd9\x38\xff\x32\xed\x7e\xc8\x11\x01\x60\
-\xf0\x15\x2e\x2c\xd5\x1d\xdf\x61\x85\x76\x1f\x00\xd8\x02\xe3\x5a\
-\x07\x68\xde\x30\x34\xb7\xb7\xff\x1b\xb5\xfb\x21\x57\x04\x80\xc1\
-\x27\x2f\xeb\x49\xb2\xe5\xf3\xb6\xc7\x39\x5b\x05\x03\x55\x62\x26\
-\x26\xee\x19\x07\xe6\x85\x9a\x13\x83\xb1\xed\x8f\x6b\xf7\x43\xce\
-\x08\x00\x79\x90\x8f\xe1\x63\xd0\xbf\x40\x31\x00\x5c\x35\xb4\xba\
-\xbd\x87\x76\x3f\x00\x98\x53\x38\xff\x6d\xcd\xc5\x3f\x2e\x0c\x27\
-\x68\xf7\x41\xee\x08\x00\xf9\x30\x63\x53\x8f\x94\xcd\xb5\xd4\x42\
-\x80\x0b\xa7\x68\xf7\x01\x80\xbb\x74\x76\x0d\x7b\xb9\xea\xe2\xef\
-\xc2\xea\xa5\xd3\xd3\x3b\x6a\xf7\x43\xee\x08\x00\x79\x29\x1a\xe1\
-\xd9\xf2\x56\x4d\xad\x71\x5f\xb3\xfe\x05\xda\x7d\x00\x64\x6d\xd9\
-\xd8\xda\xdd\xea\xd6\xff\x46\x6f\xf1\xf7\xe7\x73\x67\x70\x35\x10\
-\x00\xf2\x63\x6c\xfb\x50\xad\xb1\x5f\x58\xff\x8b\x13\x27\x26\xee\
-\xa1\xdd\x07\x40\xb6\x0a\x1b\xbe\xaa\x37\x01\x84\xcb\x6b\xae\xfd\
-\x08\xed\x3e\xc0\x2c\x02\x40\x9e\xe4\xe3\x78\xad\x39\x20\x5e\x00\
-\x1c\xa1\x5d\x3f\x90\x25\xd9\xa3\x3b\x0e\xfe\x4d\x4a\x8b\xff\x46\
-\x63\xc3\x81\xda\x7d\x80\xbf\x22\x00\xe4\xc9\x98\xb0\x4b\x3c\x36\
-\x67\xab\xcc\x03\x2e\xdc\xb8\xa2\xe9\x1f\xab\xdd\x07\x40\x56\x64\
-\xc3\x9f\xba\xf5\x3f\xd6\x4a\xfe\x45\xd3\x7f\x50\xbb\x0f\x70\x7b\
-\x04\x80\x7c\xad\x18\x6f\xef\x53\x58\x7f\xad\x4e\x08\xf0\x3f\x9c\
-\x99\x99\xb9\xab\x76\x1f\x00\xd9\x30\x2e\x7c\x48\x6b\xf1\x97\xcd\
-\x40\x18\xf0\xd5\x43\x00\xc8\x5b\xd1\x6c\xbd\x56\x6f\xbb\x60\xf6\
-\xff\x00\x92\xe8\x3c\x02\xe4\xfc\x06\x95\xb4\x6f\xc3\x05\x2b\x57\
-\xb6\xee\xa5\xdd\x07\xb8\x33\x02\x00\xb4\xee\x09\x2a\x5c\xb8\x88\
-\x1b\x02\x81\x04\x62\xda\xb6\x4a\x8b\xff\x7a\x5e\xed\x5b\x5d\x04\
-\x00\xc8\x22\x1c\xc7\xe9\x3a\xa5\x10\xf0\x61\xed\xfa\x81\x81\x26\
-\x6f\xe4\xd2\x18\xdc\xb3\x01\x80\x2d\x40\xab\x8c\x00\x00\x31\x64\
-\xfd\x53\x0b\xe7\x6f\x52\x08\x00\xd7\x2c\x1f\x99\xde\x5d\xbb\x7e\
-\x60\x20\x19\x63\x76\xd0\x4b\xf7\xfe\x24\xed\xfa\xb1\x6d\x04\x00\
-\xdc\x26\x1e\xab\x8f\xa9\xcc\x13\x36\x1c\xad\x5d\x3b\x30\x90\xe2\
-\x15\xf8\xbb\x35\x06\xb5\x6c\x34\x74\x8a\x9d\xba\xb7\x76\xfd\xd8\
-\x36\x02\x00\x6e\xb3\x64\xc9\xcc\xdd\xe2\xf1\x3a\x43\x61\xae\xb8\
-\x59\x9e\x48\xd0\xae\x1f\x18\x28\x72\xe3\x5d\x1c\x5c\x7f\x48\x1f\
-\x00\xfc\x2d\x35\xd7\x7e\xae\x76\xfd\xd8\x3e\x02\x00\x36\x37\x7b\
-\xb3\x70\xb8\x2e\xf5\x9c\x11\x7f\xe6\x77\xb5\x6b\x07\x06\x4a\x5c\
-\xfc\x3f\x9f\x7e\xf1\xef\x0c\xe6\xcf\x6a\xd7\x8e\xf9\x21\x00\xe0\
-\x8e\x34\xb6\x0a\x96\x47\x11\xe5\xd5\xe4\xda\xb5\x03\x03\x41\x92\
-\x7c\x9c\x78\x6f\x50\x08\x00\x67\xcb\xfb\xc7\xb5\xeb\xc7\xfc\x10\
-\x00\x70\x47\xf2\x55\x40\x61\x43\x50\x98\x3b\xc6\xb4\x6b\x07\x06\
-\x42\x4c\xd4\xf5\xe4\x29\xde\x85\x1b\x79\xe4\xaf\xbf\x10\x00\xb0\
-\x25\x45\x73\x72\x3f\xd9\xba\x3b\xf5\x1c\x32\x34\xda\xfe\x3b\xed\
-\xda\x81\xbe\xd6\x79\xa4\x47\x65\x77\x2f\xff\x09\xed\xda\xd1\x1d\
-\x02\x00\xb6\x26\x1e\xb7\xa3\x92\xcf\x21\x36\x9c\xae\x5d\x37\xd0\
-\xd7\xe2\xe2\xff\xbd\xd4\x03\x57\x76\xfb\xb3\xd6\xee\xac\x5d\x3b\
-\xba\x43\x00\xc0\xd6\x8c\x8c\x4c\xef\xaa\xf1\xda\x70\x79\x61\x99\
-\x76\xed\x40\x5f\xd2\xb8\xfa\x97\x9f\x57\x34\x5b\xcf\xd3\xae\x1d\
-\xdd\x23\x00\x60\x5b\x0a\xdb\x7a\x69\xea\x00\x10\x43\xc7\xb0\x76\
-\xdd\x40\x5f\x52\xb9\xfa\x77\xe1\x38\xed\xba\xb1\x30\x04\x00\x6c\
-\x8f\x7c\x2c\x9f\x76\x4e\xf1\xb7\x14\x63\xfe\x89\xda\x75\x03\x7d\
-\x25\x2e\xc4\x4f\x4b\x7e\xf5\xef\xfc\x65\xcb\x47\x27\xef\xa7\x5d\
-\x3b\x16\x86\x00\x80\xed\x31\xae\xf5\x98\xd4\x37\x04\xc6\x9f\x37\
-\xa4\x5d\x37\xd0\x57\x62\x72\x1e\x49\x9b\xd4\xd9\xeb\xbf\xdf\x11\
-\x00\x30\x1f\x71\x9c\x7f\x23\xe9\xbc\xe2\xc2\xa6\x15\xa3\x93\x8f\
-\xd2\xae\x1b\xe8\x0b\x1a\x57\xff\xb2\x78\xcc\xcc\xcc\xdc\x55\xbb\
-\x76\x2c\x1c\x01\x00\xf3\x31\x3c\xe6\x1f\x14\x2f\x30\xfe\x94\x78\
-\x7e\x39\x4a\xbb\x6e\xa0\x2f\xc4\xc1\xb2\x32\x69\x42\x97\x1b\xff\
-\xac\x7f\x86\x76\xdd\x58\x1c\x02\x00\xe6\x4b\x1e\xf3\x4d\x3a\xc7\
-\xb8\x70\xcd\xb2\xb1\xb5\xbb\x69\xd7\x0d\x54\x9a\xbc\x48\x43\x6e\
-\x9c\x49\x9a\xce\x9d\x3f\x59\xbb\x6e\x2c\x1e\x01\x00\xf3\x65\x4c\
-\xd8\xa5\x6e\xfd\xef\xd2\xce\x33\xe1\x10\xed\xba\x81\x4a\x2b\x6c\
-\xf8\x7a\xda\x64\xee\x37\xd4\x9a\x67\x3d\x54\xbb\x6e\x2c\x1e\x01\
-\x00\xdd\x88\x57\xe5\x6f\x4f\x3c\xd7\x9c\xc7\xd7\x8c\xc0\x56\x9c\
-\x76\xda\xc4\x7d\x63\x00\x58\x9f\x78\x50\x7e\x52\xbb\x6e\xf4\x06\
-\x01\x00\xdd\x58\x3a\x3d\xbd\x63\x61\xfd\xaf\xd3\xce\x37\xe1\x85\
-\xda\x75\x03\x95\x14\x07\xc7\x87\x53\x0e\x46\x79\xbd\xb0\xbc\x66\
-\x58\xbb\x6e\xf4\x06\x01\x00\xdd\x8a\xc7\xf4\x90\xa4\x01\xc0\xfa\
-\xef\x69\xd7\x0c\x54\xce\xc4\xc4\xc4\xdd\xe3\xd5\xff\x6f\x93\x06\
-\x00\xe7\xff\x43\xbb\x6e\xf4\x0e\x01\x00\xdd\x92\x2d\xbf\x0b\xe7\
-\x2f\x4e\x16\x00\x5c\xd8\x24\x6f\x37\xd5\xae\x1b\xa8\x14\x79\x06\
-\x3f\x6d\x12\x0f\x97\xca\x8d\x40\xda\x75\xa3\x77\x08\x00\x58\x88\
-\x78\x21\x70\x58\xd2\xb9\x87\xaf\x1d\x81\xdb\x8b\x03\xa3\x9d\x72\
-\x10\x72\xf5\x3f\x78\x08\x00\x58\x88\x13\x27\x26\xee\x11\x8f\xeb\
-\xef\xd3\x05\x80\x70\xd1\x92\x25\x33\x77\xd3\xae\x1b\xa8\x04\x33\
-\x36\xf5\xf4\xc4\x09\xfc\x62\xde\xf6\x37\x78\x08\x00\x58\xa8\xba\
-\xf5\xff\x95\x72\x0e\xaa\xb9\xf6\x73\xb5\x6b\x06\x2a\x21\x0e\x88\
-\x63\x93\x06\x00\xeb\xdf\xad\x5d\x33\x7a\x8f\x00\x80\x85\x92\x9b\
-\x81\x93\xee\x0e\x68\xc3\x09\xda\x35\x03\xea\x3a\x1f\xbf\xb9\x70\
-\x75\xba\x81\xe7\x7f\xc7\xd5\xff\x60\x22\x00\x60\x31\x62\x00\x38\
-\x26\xdd\x45\x48\x58\x6f\x26\x26\xee\xa9\x5d\x33\xa0\xca\x34\xc3\
-\x9b\x92\x2d\xfe\xb3\x03\xef\xbd\xda\x35\xa3\x1c\x04\x00\x2c\xc6\
-\xec\x9b\x02\x13\xbe\x83\xc4\xb6\xde\xa2\x5d\x33\xa0\xaa\x70\xe1\
-\xfb\xc9\x16\x7f\x17\xae\x21\x75\x0f\x2e\x02\x00\x16\x2b\x06\x00\
-\x97\xee\x62\xc4\x8f\x6b\xd7\x0b\xa8\x91\xe7\x61\x53\xee\xfb\x1f\
-\x03\xc0\x17\xb5\x6b\x46\x79\x08\x00\x58\xac\xc2\xb6\x5e\x9a\x6a\
-\x3e\x92\xb9\x6f\x68\xbc\xb5\xa7\x76\xcd\x80\x8a\xc2\x86\x23\xd3\
-\xa5\xed\xb0\xd1\xac\x9a\x7c\x98\x76\xcd\x28\x0f\x01\x00\x8b\x25\
-\x7b\xf5\xc7\xb9\xe2\x82\x84\x21\x80\xc7\x91\x91\x1f\x79\x0e\x36\
-\xe5\xce\x7f\x85\xf5\x75\xed\x9a\x51\x2e\x02\x00\x7a\xc1\xb8\xf6\
-\x07\x92\x05\x00\xeb\x57\x69\xd7\x0b\x24\x67\x6c\x38\x30\x5d\xca\
-\x96\x00\x30\xb9\xbf\x76\xcd\x28\x17\x01\x00\xbd\x30\x3c\xe6\x1f\
-\x24\x9f\x18\x26\x0a\x00\x37\x9b\x66\xb8\xbf\x76\xcd\x40\x52\x29\
-\x1f\xb9\x89\x3f\x6b\x4a\xbb\x5e\x94\x8f\x00\x80\x5e\x89\x01\x60\
-\x34\xd5\xfc\x64\x9c\x7f\xab\x76\xbd\x40\x32\xf2\xf1\x7f\xca\xad\
-\x37\x8d\x6b\x1f\xac\x5d\x33\xca\x47\x00\x40\xaf\x98\x46\xfb\x0d\
-\xc9\x2e\x50\xac\x1f\xd6\xae\x17\x48\xc6\xd8\xf6\x73\x52\x0d\x2e\
-\x36\xdc\xc8\x07\x01\x00\xbd\x22\x1b\x94\xc9\x63\xc3\x49\xe6\x28\
-\xe7\x37\x8c\x8c\x4c\xef\xaa\x5d\x33\x90\x44\x5c\x94\xbf\x9a\x2c\
-\x00\xb8\x70\x9c\x76\xbd\x48\x83\x00\x80\x5e\x8a\x73\xc7\xd2\x54\
-\xf3\x54\xcd\xb5\x5e\xa9\x5d\x2f\x50\x3a\x79\xcc\x46\xb6\xe3\x4d\
-\x35\xb0\x8c\x6b\x1d\xa0\x5d\x33\xd2\x20\x00\xa0\x97\x6a\x4d\xff\
-\xac\x84\x17\x2a\xc7\x6b\xd7\x0b\x94\x4e\x16\xe4\x64\x83\xca\x86\
-\x9f\x69\xd7\x8b\x74\x08\x00\xe8\xa5\x94\x17\x2b\xf2\x48\xb4\x76\
-\xbd\x40\xe9\xe2\x04\x7a\x54\xb2\x00\xd0\xf4\x1f\xd4\xae\x17\xe9\
-\x10\x00\xd0\x6b\x71\x61\xfe\x7a\xaa\xf9\xca\x34\xc3\xa3\xb5\xeb\
-\x05\x4a\x55\x77\xfe\xfc\x44\x89\x7a\xa3\x3c\xcf\xab\x5d\x2f\xd2\
-\x21\x00\xa0\xd7\x0a\x17\x5e\x98\xec\x82\xc5\x85\x77\x69\xd7\x0b\
-\x94\x66\xd8\x4e\xed\x95\x6a\x30\xb1\xc3\x56\x7e\x08\x00\xe8\xb5\
-\x89\x89\x89\xbb\x17\xd6\x5f\x95\xe6\xa2\x85\xdd\x4a\x31\xc0\xea\
-\x8d\xd6\x3b\x48\xd3\x28\x0b\x01\x00\x65\x28\x6c\x58\x96\x28\x00\
-\x5c\x29\x7b\xa4\x68\xd7\x0b\x94\x22\x4e\x9e\x2b\x12\x2d\xfe\x9b\
-\xf8\xf8\x3f\x3f\x04\x00\x94\xc1\xd8\xf0\xea\x64\x17\x2e\xcd\xc9\
-\xfd\xb4\xeb\x05\x7a\xae\xf3\x51\x5a\xa2\x8d\x35\xea\xd6\x4f\x68\
-\xd7\x8b\xf4\x08\x00\x28\xc3\xb2\xb1\xb5\xbb\xc5\xe3\x7e\x43\x9a\
-\x00\xc0\x8d\xcb\x18\x40\x29\x9f\xa9\xe5\x15\x9b\x79\x22\x00\xa0\
-\x2c\xf1\xb8\xff\x20\xcd\xc5\x4b\x38\x5d\xbb\x56\xa0\xe7\x0a\x1b\
-\x8e\x4c\xb4\xf8\xdf\x32\x34\xde\xda\x53\xbb\x5e\xa4\x47\x00\x40\
-\x59\x8c\x6d\x7f\x3c\xc5\xfc\x55\xb8\x70\x85\x76\xad\x40\xcf\xc5\
-\x93\xbb\x9d\x64\x00\xd9\x10\xb4\x6b\x85\x0e\x02\x00\xca\x22\xaf\
-\x13\x4f\x73\x01\x23\xdb\x02\xb7\x1f\xa1\x5d\x2f\xd0\x33\xc6\x84\
-\x5d\xe4\xbd\xd7\x89\x02\xc0\x12\xed\x7a\xa1\x83\x00\x80\xb2\xcc\
-\x3d\x0e\x78\x6d\xa2\x10\x70\x90\x76\xbd\x40\xcf\x18\x1b\x0e\x4c\
-\x95\x9e\x25\xa9\x6b\xd7\x0b\x1d\x04\x00\x94\xa9\xee\xfc\x48\x92\
-\x79\xcc\x86\xa3\xb4\x6b\x05\x7a\xa6\x70\xe1\xa3\x89\x02\xc0\xd5\
-\xc6\x98\x1d\xb4\xeb\x85\x0e\x02\x00\xca\x64\x9c\x7f\x5f\xa2\x00\
-\x70\xa6\x76\xad\x40\xcf\x14\xd6\x7f\x2f\x51\x00\x30\xda\xb5\x42\
-\x0f\x01\x00\x65\x92\x67\xf4\xd3\x04\x00\x7f\xbd\x7c\xe5\xa0\x5d\
-\x2f\xb0\x68\xf2\x46\x2d\xb9\xb3\x35\xd1\xc0\xf9\x37\xed\x7a\xa1\
-\x87\x00\x80\x32\xc9\xa7\x8b\xb2\x38\xa7\x98\xcb\xd8\x10\x08\x03\
-\x61\xc5\x78\x7b\x9f\x24\x8b\x7f\x6c\xf2\xae\x01\xed\x7a\xa1\x87\
-\x00\x80\xb2\xc9\xc7\xf3\x5c\xcc\x00\xf3\x64\x5c\xfb\xe0\x24\x89\
-\xd9\xfa\x0b\xb5\x6b\x85\x2e\x02\x00\xca\x96\xea\x75\xe6\x85\x0b\
-\x5f\xd4\xae\x15\x58\xb4\x98\x64\xbf\x99\x26\x00\x84\x65\xda\xb5\
-\x42\x17\x01\x00\x65\x8b\xe7\xc0\x41\x29\xe6\xb3\xd8\x1a\xda\xb5\
-\x02\x8b\x16\xaf\xcc\xd7\x24\x1a\x30\x87\x68\xd7\x0a\x5d\x04\x00\
-\x94\x4d\x36\xe9\x49\x72\x41\xe3\xc2\xaf\xb4\x6b\x05\x16\x45\x5e\
-\x6d\x19\xaf\xcc\xd7\x27\x19\x30\xdc\x34\x93\x3d\x02\x00\x52\x88\
-\x73\xda\xe5\xe5\xcf\x69\xfe\x96\x91\x91\xe9\x5d\xb5\x6b\x05\x16\
-\xcc\x34\xc3\xa3\x13\xa5\xe5\xeb\x78\xfe\x1f\x04\x00\xa4\x50\xb7\
-\x7e\x55\x8a\x79\xcd\x8c\xb6\x9e\xa2\x5d\x2b\xb0\x60\x35\xd7\x7e\
-\x4d\x92\x00\x60\xfd\xb8\x76\xad\xd0\x47\x00\x40\x0a\xf1\xea\xfc\
-\x98\x14\xf3\x5a\xfc\x39\x6f\xd4\xae\x15\x58\x30\x63\xc3\xff\xa4\
-\x09\x00\xe1\x48\xed\x5a\xa1\x8f\x00\x80\x14\xe2\x79\x70\x08\xf3\
-\x1a\xb0\x1d\x85\x0b\xdf\x4d\x31\x50\xe4\x93\x06\xed\x5a\xa1\x8f\
-\x00\x80\x14\xe2\x7c\xf3\xdc\x34\x01\xc0\xd7\xb5\x6b\x05\x16\x2c\
-\x9e\xc0\xbf\x48\x12\x00\x6c\x6b\x6f\xed\x5a\xa1\x8f\x00\x80\x14\
-\x86\x56\xb7\xf7\x48\x13\x00\x78\xb5\x39\xfa\x94\xbc\x02\xb8\x70\
-\x61\x53\xf9\x13\xb2\xbf\x5e\x9e\x36\xd0\xae\x17\xfa\x08\x00\x48\
-\x25\x5e\xdc\x5c\x55\x7a\x00\x70\xfe\x62\xed\x3a\x81\x05\x31\x76\
-\xea\xf1\x69\x52\xb2\x5f\xa3\x5d\x2b\xaa\x81\x00\x80\x54\xea\xce\
-\xb7\xca\x9f\xdb\xc2\x46\x5e\x0a\x84\xbe\x64\x9c\x7f\x59\x8a\x00\
-\x50\xb7\xfe\x5b\xda\xb5\xa2\x1a\x08\x00\x48\x25\x06\x80\xef\xa4\
-\x98\xdf\x78\xbf\x09\xfa\x92\x69\x86\xf7\x24\x09\x00\xce\x1f\xa6\
-\x5d\x2b\xaa\x81\x00\x80\x54\x0a\x17\x3e\x9b\x62\x7e\x33\xae\x75\
-\x80\x76\xad\x40\xd7\x52\xbd\x34\xa3\x66\xfd\x0b\xb4\x6b\x45\x35\
-\x10\x00\x90\x4a\x61\xfd\xbb\x53\xcc\x6f\x31\x68\xbc\x5e\xbb\x56\
-\xa0\x6b\x75\xeb\x87\x53\x0c\x90\x15\xa3\xfe\xe1\xda\xb5\xa2\x1a\
-\x08\x00\x48\xa5\xb0\xe1\x15\x29\xe6\x37\xe3\xda\x1f\xd0\xae\x15\
-\xe8\x5a\x0c\x00\x3f\x2e\x3d\x1d\x73\x93\x0c\x36\x43\x00\x40\x2a\
-\x43\xd6\x3f\x35\x45\x00\x28\xac\xff\x92\x76\xad\x40\xd7\xe2\xc9\
-\x7b\x75\x82\xc1\xf1\x6b\xed\x3a\x51\x1d\x04\x00\xa4\xb2\x7c\x64\
-\x7a\xf7\x14\x01\x20\x9e\x6f\x27\x68\xd7\x0a\x74\x2d\xd1\xe0\xf8\
-\x81\x76\x9d\xa8\x0e\x02\x00\x52\x99\x99\x99\xb9\x6b\x3c\x17\x6e\
-\x28\xfd\x22\xc7\xf9\x53\xb5\x6b\x05\xba\x96\x22\x00\x14\x2e\x1c\
-\xaf\x5d\x27\xaa\x83\x00\x80\x94\xe2\xe2\x7c\x09\x17\x39\xc0\x16\
-\xa4\x08\x00\x75\xe7\x3f\xa1\x5d\xe7\x6d\xac\xb5\x3b\x9b\x66\xf8\
-\xa7\xf8\x3b\x1d\x51\xd8\x30\x14\x7f\xbf\xb1\xce\x6b\x43\x69\xc9\
-\x5a\x61\xfd\xb5\xa5\x87\x4e\x1b\xd6\x6b\xd7\x99\x5d\x93\xb1\xe4\
-\x42\x2d\x2e\x86\x9f\xaa\x35\xfd\xcb\x65\x97\x51\xed\xf1\x2e\xe2\
-\xb9\xb0\x2e\xc1\x45\xce\x39\xda\x75\x02\x5d\x4b\x11\x00\x8a\x46\
-\x78\x9b\x76\x9d\x66\x74\xcd\x83\xe5\x91\xc7\x14\x8b\x0f\x8d\x46\
-\x9b\x0b\x61\xce\x1f\x53\x6b\x9e\xf5\x50\xcd\xb1\x9f\x62\x37\xc0\
-\x18\x80\x7e\xa3\x59\x23\xb0\x20\x49\x26\x02\xe7\x5f\xac\x59\x63\
-\x4c\xe7\xef\x62\xe1\xa7\xd1\x94\x9a\xf5\xd7\xc7\xf0\xfd\x7e\xf9\
-\x3e\x5e\x65\xfc\xdb\x30\x5a\x76\x8d\x71\x8e\xb9\x46\xa3\x36\x60\
-\x51\x52\x4c\x00\x66\x6c\xea\xe9\x1a\xb5\xc9\xa3\x87\x31\x7c\x9c\
-\xa4\x3e\x01\xd2\x68\x34\x59\x24\xbf\x6b\xcc\xba\x9d\x52\xcf\x03\
-\xf1\xe7\x9e\x52\x7e\x7d\xfe\x16\x5e\x76\x86\xbe\x93\x62\xe0\x6b\
-\x6c\x02\x24\x57\x1b\xf1\xaa\x7f\xb9\xf6\xa4\x47\xa3\xd1\x36\x6f\
-\x7e\xc4\x18\xb3\x43\xca\xb9\xa0\xb0\xe1\xeb\x29\x6a\x33\xab\xa6\
-\xef\x93\xb2\x2e\x60\xd1\x52\x0c\x8c\x65\x63\x6b\x77\x4b\x5e\x97\
-\xf5\x87\xeb\x4f\x76\x34\x1a\xed\x8e\x2d\x06\xf3\xff\x4d\x39\x17\
-\x14\xce\x7f\x3a\x45\x5d\xc3\x63\xfe\x41\x29\xeb\x02\x16\xad\xf4\
-\xc1\xee\xfc\x86\xd4\x35\xad\x18\x6f\xef\x53\xb8\x70\xa3\xf6\x44\
-\x47\xa3\xd1\xee\xdc\xe2\xd8\xdc\x24\x3b\xf4\xa5\x9a\x0f\x0a\x1b\
-\x96\xa4\xa8\x6b\x68\xbc\xb5\x67\xaa\x9a\x80\x9e\x48\x30\xd8\x2f\
-\x52\xa8\xc9\x68\x4f\x72\x34\x1a\x6d\x1b\xcd\x86\x66\xaa\xf9\xc0\
-\xd8\xf6\xc7\x53\xd4\x64\x56\x4d\x3e\x2c\x55\x4d\x40\x4f\x94\x3d\
-\x28\x52\x3f\x1f\x2b\x83\x50\xae\x30\xd4\x27\x38\x1a\x8d\xb6\xd5\
-\x56\x58\x7f\x6b\x6d\xb4\xfd\xb8\x24\x73\x82\x0b\x1f\x4a\x51\x53\
-\xcd\xb6\xf6\x4e\x51\x0f\xd0\x33\xa5\x0f\x0c\x1b\x7c\xca\x7a\x0a\
-\x1b\xfe\x53\x7b\x72\xa3\xd1\x68\xf3\x69\x69\x36\x08\x93\x37\xf5\
-\xa5\xa8\xa7\xd6\x58\xb3\x6f\x8a\x7a\x80\x9e\x29\x7b\x50\xc4\xab\
-\xf1\xef\x27\xae\xe7\x34\xfd\x89\x8d\x46\xa3\xcd\xa3\xad\x4e\x33\
-\x27\xf8\xc3\x52\xd4\x33\xe4\x26\x9f\x90\xa2\x1e\xa0\x67\x12\x0c\
-\x8c\x46\xda\x7a\xfc\xcf\x2b\x30\xb1\xd1\x68\xb4\xed\xb4\xc2\xf9\
-\xcb\x52\xcc\x09\x85\xf5\xef\x4e\x52\x4f\x73\x72\xbf\x14\xf5\x00\
-\x3d\x53\xfa\xc0\xb0\x7e\x38\x71\x3d\xa5\xbf\xde\x98\x46\xa3\x2d\
-\xbe\x15\x36\x6c\x4c\x31\x27\x18\xeb\xdf\x99\xa2\x1e\xad\x0d\xcf\
-\x80\x05\x2b\x7f\x90\xfb\xe5\x89\xeb\x21\x00\xd0\x68\x7d\xd0\x24\
-\x00\xa4\xd8\x1e\x38\xfe\x9c\xf7\xa6\xa8\x67\xc8\xb6\x9f\x5c\x76\
-\x2d\x40\x4f\x95\x3e\xc8\x13\xbf\x0a\x38\xfe\xcc\x5f\x6a\x4f\x6c\
-\x34\x1a\x6d\xfb\x2d\xce\x0d\x57\xa4\x98\x13\xe2\xcf\xf9\x70\x8a\
-\x7a\xb8\x09\x10\x7d\xa7\xf4\x81\x61\xfd\x37\x93\xd6\x63\xc3\xe9\
-\xda\x13\x1b\x8d\x46\xdb\x7e\x2b\x9c\xff\x61\x92\x39\xc1\xf9\x4f\
-\xa4\xa8\x87\x7d\x00\xd0\x77\xca\x1f\xe4\xe1\xb8\x94\xf5\x18\xeb\
-\x3f\xa2\x3d\xb1\xd1\x68\xb4\x79\x34\xeb\x3f\x93\x62\x4e\x90\x9f\
-\x93\xa2\x1e\x63\xcf\x7c\x60\x8a\x7a\x80\x9e\x29\x7f\x90\x87\x13\
-\x52\xd6\x23\x1f\xc3\xc9\x26\x23\xea\x93\x1b\x8d\x46\xdb\x66\x1b\
-\x6a\xb4\xfe\x36\xc5\x9c\x50\x38\xff\xe5\x14\xf5\xac\x5c\xd9\xba\
-\x57\x8a\x7a\x80\x9e\x29\x7f\x60\xf8\x93\x93\xd7\x64\x43\x53\x7b\
-\x72\xa3\xd1\x68\xdb\x68\x09\x37\x08\x8b\x01\xe0\xff\x52\xd4\x24\
-\xaf\x1f\x4f\x55\x13\xd0\x13\x65\x0f\x8a\xc2\x86\xa1\xd4\x35\xc9\
-\xe3\x38\x6c\x07\x4c\xa3\x55\xb7\x99\x86\x7f\x7e\xaa\xf9\x20\x06\
-\x80\x93\xca\xae\x47\xe6\x9b\x54\xf5\x00\x3d\x53\xfa\xc0\xb0\xbe\
-\xae\x51\x57\xfc\xb9\x5f\xd2\x9e\xe4\x68\x34\xda\x16\x9a\xf5\xdf\
-\x4a\x39\x17\xa4\xb8\x31\x38\x5e\xe8\xac\x4f\x59\x13\xd0\x13\x09\
-\x06\x7b\xd2\x8d\x80\x6e\xb3\x74\x7a\x7a\xc7\xf8\xf3\x57\xab\x4f\
-\x76\x34\x1a\x6d\xf3\xd6\x3e\x71\x62\xe2\x1e\x29\xe7\x82\xba\xf3\
-\x53\x65\xd7\x55\x38\x7f\x71\xca\x9a\x80\x9e\x28\x7d\x60\xd8\x30\
-\xaa\x55\xdb\xc8\xc8\xf4\xae\x85\xf5\xe3\x15\x98\xf4\x68\x34\x9a\
-\xf3\x2d\xb3\x6a\xfa\x3e\xa9\xe7\x81\x7a\x8a\xbd\x41\x6c\x58\x9b\
-\xba\x2e\x60\xd1\x52\x0c\x7a\xcd\xfa\xe4\xc6\x9c\x18\x02\xfe\xb7\
-\x6e\xfd\xcd\xfa\x13\x20\x8d\x96\x5f\x9b\xbd\x1f\xc7\x7f\xc5\x98\
-\x75\x3b\x69\xcc\x01\x71\xfc\x5f\x5b\x7a\x9d\xd6\xaf\xd2\xa8\x0d\
-\x58\x94\xd2\x07\xbf\x0d\xeb\xb4\x6b\x14\xc5\x98\x7f\x62\xfc\x7d\
-\x0c\x37\x07\xd2\x68\xa9\x9a\xbf\x25\x5e\x19\xaf\x8c\x63\xee\x69\
-\x5a\xe3\x5e\x42\x47\x8a\xc7\x82\x35\x6e\x76\x06\x16\xad\xf4\x81\
-\xe1\xfc\x25\xda\x35\x6e\xce\x8c\xae\x79\x70\xe7\xe5\x20\x36\x9c\
-\x10\x7f\xbf\x76\x9c\xa4\xce\x8f\x13\xd4\xaf\x68\xe9\x5a\xec\xfb\
-\x1b\x12\x9c\x77\x37\x69\xd7\x99\x5d\xb3\xe1\x67\xb3\xdf\xb7\xfb\
-\x93\xe5\x0d\x7c\xc3\x76\x6a\x2f\xed\xf1\x3e\x34\xde\xda\x33\x45\
-\xd8\x89\xb5\x1f\xad\x5d\x2b\xd0\xb5\x04\x13\xf1\x06\xed\x1a\x51\
-\x2d\xf2\x0c\x78\xe9\x93\xb2\x0d\xe7\x6a\xd7\x09\x7d\x66\xb4\xf5\
-\x94\x14\x01\xc0\xd8\xf0\x3f\xda\xb5\x02\x5d\x4b\x31\x38\xac\xb5\
-\x3b\x6b\xd7\x89\xea\x20\x00\x20\x95\xa2\xe1\x5f\x95\x26\x00\xb4\
-\x0f\xd5\xae\x15\xe8\x5a\x8a\xc1\x31\x3c\xe6\x1f\xa4\x5d\x27\xaa\
-\x83\x00\x80\x54\xe2\x79\xf0\xfe\x34\x01\xc0\xbf\x4e\xbb\x56\xa0\
-\x6b\x69\x06\xc7\xd4\xe3\xb5\xeb\x44\x75\x10\x00\x90\x8a\x7c\x37\
-\x9f\x62\x8e\x2b\x1a\xe1\xd9\xda\xb5\x02\x5d\x4b\x31\x38\x6a\xb6\
-\xf5\x22\xed\x3a\x51\x1d\x04\x00\xa4\x92\xea\xf5\xe0\x72\xb3\xa1\
-\x76\xad\x40\xd7\x52\x0c\x0e\x63\xc3\xbf\x6b\xd7\x89\xea\x20\x00\
-\x20\x15\x39\x0f\x12\x9c\x6b\x37\x2c\x59\x32\x73\x37\xed\x5a\x81\
-\xae\xa5\x08\x00\x85\x0d\x4b\xb4\xeb\x44\x75\x10\x00\x90\x8a\xec\
-\xd1\x9f\x60\x7e\xbb\x40\xbb\x4e\x60\x41\x92\x04\x00\xe7\xbf\xad\
-\x5d\x27\xaa\x83\x00\x80\x14\x86\xdd\x19\x0f\x49\x73\x81\xe3\x9d\
-\x76\xad\xc0\x82\xa4\xd8\x25\x2b\x4e\xc6\x4d\xed\x3a\x51\x1d\x04\
-\x00\xa4\x60\x9a\xed\x7f\x4c\x14\x00\xbe\xa1\x5d\x2b\xb0\x20\x85\
-\x0b\x57\x94\x3e\x40\x9c\x3f\x4f\xbb\x4e\x54\x07\x01\x00\x29\x18\
-\xd7\xfe\x40\x92\x00\xe0\xc2\x87\xb5\x6b\x05\x16\x24\x9e\xc0\x67\
-\x27\x08\x00\x1b\xb8\x49\x06\xb7\x21\x00\x20\x85\xb9\xed\xbe\x53\
-\x04\x80\xd7\x6b\xd7\x0a\x2c\x48\x61\xfd\xf7\x52\x0c\x92\x9a\x6b\
-\x3f\x42\xbb\x56\x54\x03\x01\x00\x29\xc4\xf3\xe0\x47\x29\xe6\xb6\
-\x21\xeb\x9f\xaa\x5d\x2b\xb0\x20\xf1\x04\x3e\x36\x49\x00\x68\xb4\
-\x5f\xa2\x5d\x2b\xaa\x81\x00\x80\xb2\x19\x63\x76\x90\x4f\x1e\xcb\
-\x3e\xcf\x0a\x1b\x36\xb2\xd5\x39\xfa\x56\xdd\xfa\xc3\x53\x04\x00\
-\xf9\x3e\x4e\xbb\x56\x54\x03\x01\x00\x65\xab\x35\xd6\xec\x9b\x62\
-\x5e\xe3\xfe\x26\xf4\xb5\x54\x2f\xcb\xe0\x51\x40\xdc\x86\x00\x80\
-\xb2\x99\x46\xfb\x0d\x89\xe6\xb5\x42\xbb\x56\x60\xc1\x8c\x6b\x3d\
-\x26\xc5\x40\xa9\x3b\xdf\xd2\xae\x15\xd5\x40\x00\x40\xd9\x52\xbd\
-\x03\xc0\xd8\xf6\xc7\xb5\x6b\x05\x16\x6c\x62\x62\xe2\xee\x31\xc5\
-\xde\x94\x60\xb0\x5c\xad\x5d\x2b\xaa\x81\x00\x80\xb2\xc5\x73\xe0\
-\xac\x14\x01\xa0\xe6\x5a\xaf\xd4\xae\x15\x58\x94\x98\x96\xd7\xa5\
-\x18\x2c\x2b\x46\xfd\xc3\xb5\x6b\x85\x3e\x02\x00\xca\x34\x32\x32\
-\xbd\x6b\xdd\xfa\x9b\xd3\x04\x00\x9e\x6e\x42\x9f\x2b\x5c\xf8\x6e\
-\x8a\xc1\xc2\xf3\xb2\x10\x04\x00\x94\x29\x2e\xca\xcf\x4d\x34\x9f\
-\x5d\x37\x33\x33\x73\x57\xed\x7a\x81\x45\x29\x9c\xff\x64\x92\x01\
-\x63\xfd\x17\xb4\x6b\x85\x3e\x02\x00\xca\x14\x17\xe6\x8f\xa6\x09\
-\x00\x7e\x52\xbb\x56\x60\xd1\xe2\xc2\xfc\x2f\x29\x06\x4c\xdd\xfa\
-\x09\xed\x5a\xa1\x8f\x00\x80\x32\x15\x36\x8c\xa6\x09\x00\xe1\x73\
-\xda\xb5\x02\x8b\x66\x1a\xe1\x49\x49\x06\x8c\x0d\xeb\x65\x83\x0e\
-\xed\x7a\xa1\x8b\x00\x80\xb2\xcc\xde\xd4\x1c\xae\x49\x32\x9f\x35\
-\xfc\xab\xb4\xeb\x05\x16\x4d\x16\xe5\x78\x75\x7e\x7d\x92\x41\x33\
-\xe6\x9f\xa8\x5d\x2f\x74\x11\x00\x50\x96\xa2\x11\x9e\x9d\x62\x1e\
-\x93\x36\xb4\xba\xbd\x87\x76\xbd\x40\x4f\xc8\x73\xfa\x49\x06\x8e\
-\xf5\xff\xa6\x5d\x2b\x74\x11\x00\x50\x96\xc2\x86\x23\x93\x5c\xc8\
-\x58\x7f\xa1\x76\xad\x40\xcf\x14\xce\x7f\x39\x4d\x72\xf6\x27\x6b\
-\xd7\x0a\x5d\x04\x00\x94\x25\x2e\xcc\x6b\x92\x04\x00\xe7\x4f\xd2\
-\xae\x15\xe8\x99\xb8\x30\xbf\x31\x49\x00\xb0\xe1\xf7\xda\xb5\x42\
-\x17\x01\x00\x65\x58\x3e\x3a\x79\xbf\xc2\x85\x4d\x29\xe6\x31\x63\
-\xfd\x3b\xb5\xeb\x05\x7a\xa6\x66\x5b\x7b\x27\x09\x00\xb1\xad\x68\
-\xfa\xc7\x6a\xd7\x0b\x3d\x04\x00\x94\x21\xd5\xfe\xff\xd2\xb8\x97\
-\x09\x03\x45\x36\xb4\xa8\x3b\xff\xc7\x24\xe9\xb9\x19\xde\xa3\x5d\
-\x2f\xf4\x10\x00\x50\x86\x78\xcc\x4f\x48\xb2\xf8\x5b\x7f\xe5\x92\
-\x25\x33\x77\xd3\xae\x17\xe8\xa9\x18\x00\x6c\x92\x01\xe4\xfc\xa9\
-\xda\xb5\x42\x0f\x01\x00\xbd\x26\x4f\x32\x15\x36\x5c\x9e\x68\xfe\
-\xe2\x0d\x80\x18\x3c\x31\x00\x1c\x91\x66\x00\x85\x6b\xd8\x0f\x20\
-\x5f\x04\x00\xf4\x5a\xcd\xfa\x17\xa4\x98\xbb\x66\xcf\x2d\x9e\x64\
-\xc2\x00\x32\x36\x1c\x98\x6a\x10\x15\x76\x72\x7f\xed\x7a\xa1\x83\
-\x00\x80\x5e\x2b\xac\xff\x46\xaa\xb9\x6b\xd8\x4e\xed\xa5\x5d\x2f\
-\xd0\x73\xc6\xac\xdb\x29\xd9\x86\x40\x2e\x7c\x56\xbb\x5e\xe8\x20\
-\x00\xa0\x97\xe4\xfb\xf8\xc2\xf9\xcb\x92\x04\x00\xce\x2b\x0c\xb2\
-\x98\xa4\xc7\x93\x04\x00\xeb\x7f\xa1\x5d\x2b\x74\x10\x00\xd0\x4b\
-\x45\xb3\xf5\xbc\x24\x8b\xff\xec\xbc\xf5\x25\xed\x7a\x81\xd2\xd4\
-\xad\x3f\x3c\xd5\x60\xe2\x71\xc0\x3c\x11\x00\xd0\x4b\xf1\x78\x1f\
-\x9b\x6a\xce\xaa\xd9\xd6\x8b\xb4\xeb\x05\x4a\x63\xc6\xa6\x9e\x9e\
-\x2c\x4d\xbb\xf0\x51\xed\x7a\x91\x1e\x01\x00\xbd\xd2\x79\xf9\x8f\
-\x0d\x97\xa6\x99\xaf\xfc\x9f\x8d\x09\xbb\x68\xd7\x0c\x94\xa6\xf3\
-\x7d\x9a\xf5\x57\x25\x19\x50\xd6\xaf\xd1\xae\x17\xe9\xe7\xc9\x28\
-\xb8\x00\x00\x18\x19\x49\x44\x41\x54\x11\x00\xd0\x2b\xc6\xf9\x97\
-\x25\xbb\x60\xb1\x61\x54\xbb\x5e\xa0\x74\x75\xeb\x87\x13\x05\x80\
-\x5b\x6b\xcd\xb3\x1e\xaa\x5d\x2f\xd2\x22\x00\xa0\x57\x52\xcd\x55\
-\x73\xe7\xd4\xff\xd3\xae\x17\x28\x5d\x3c\xd9\x0f\x49\x38\xa8\xde\
-\xaf\x5d\x2f\xd2\x22\x00\xa0\x17\x86\xc7\xfc\x83\x0a\xe7\x6f\x4a\
-\x33\x4f\xf9\x9b\xe5\x5d\x03\xda\x35\x03\xa5\x1b\x1a\x6f\xed\x29\
-\x57\xe7\x29\x06\x56\xe1\xc2\x39\xda\xf5\x22\x2d\x02\x00\x7a\xa1\
-\x68\xfa\x0f\x26\xbb\x50\x71\xde\x6a\xd7\x0b\x24\x93\xea\xb5\x9a\
-\x9d\x10\xd0\x9c\xdc\x4f\xbb\x5e\xa4\x43\x00\x40\x2f\xc4\x45\xf9\
-\x27\xc9\x02\x00\xbb\xff\x21\x27\xc6\xfa\x8f\xa4\x1b\x5c\xe1\x28\
-\xed\x7a\x91\x0e\x01\x00\x8b\x35\x34\xda\xfe\xbb\x64\x17\x28\x36\
-\x6c\x5c\x3e\x32\xbd\xbb\x76\xcd\x40\x32\xf2\x8c\x7e\xb2\x01\xe6\
-\xfc\x65\xf2\x38\x8f\x76\xcd\x48\x83\x00\x80\xc5\x2a\xac\x3f\x31\
-\x5d\x00\xf0\xe3\xda\xf5\x02\xc9\xd5\x9d\x3f\x3f\xdd\x20\x6b\xbd\
-\x54\xbb\x5e\xa4\x41\x00\xc0\x62\xc8\xcd\x7f\xf1\xf8\xde\x90\x6a\
-\x6e\xaa\x37\x5a\xef\xd0\xae\x19\x48\xae\x6e\xfd\x67\x92\x0d\x32\
-\x17\x8c\x76\xbd\x48\x83\x00\x80\xc5\x28\x6c\x38\x32\xd9\x85\x89\
-\x0b\x37\x9e\xba\x6a\xcd\x03\xb4\x6b\x06\x92\x2b\xac\x7f\x46\xb2\
-\x81\x66\xc3\x46\xde\xb2\x95\x07\x02\x00\x16\xca\x5a\xbb\x73\xbc\
-\x30\xf9\x43\xba\x00\xe0\x0b\xed\x9a\x01\x15\x33\x33\x33\x77\x8d\
-\x09\xf8\xa2\x84\x21\xe0\x48\xed\x9a\x51\x3e\x02\x00\x16\x4a\x3e\
-\x8e\x4f\x35\x1f\xcd\x05\x80\x17\x6b\xd7\x0c\xa8\x89\x03\xe0\xd3\
-\xe9\x06\x5b\xb8\xe2\xc4\x89\x89\x7b\x68\xd7\x8c\x72\x11\x00\xb0\
-\x10\xb3\x17\x24\xfe\xbc\x84\x8b\xff\xc5\xc6\x98\x1d\xb4\xeb\x06\
-\xd4\xac\x18\x6f\xef\x93\x6a\x53\x20\x69\xc6\xf9\xb7\x6a\xd7\x8c\
-\x72\x11\x00\xb0\x10\xb5\x46\xfb\x25\xa9\xe6\xa1\x4e\x00\xe0\x13\
-\x49\xa0\x73\xd3\x4d\x48\x36\xf0\xac\xff\xb1\x76\xbd\x28\x17\x01\
-\x00\x0b\x11\xaf\xc8\x27\xd3\x2d\xfe\xfe\xd6\x9a\x6d\xed\xad\x5d\
-\x33\xa0\xae\x70\xe1\x5d\x69\x93\xf7\xe4\xfe\xda\x35\xa3\x3c\x04\
-\x00\x74\x4b\xbe\x8b\x4f\x3a\x07\xb9\xf0\x7d\xed\x9a\x81\x4a\x38\
-\xed\xb4\x89\xfb\x26\x7d\xee\xd6\x86\x15\xda\x35\xa3\x3c\x04\x00\
-\x74\x2b\xe9\xa7\x90\x9d\xf3\xa7\xf5\x16\xed\x9a\x81\xca\x28\xac\
-\xaf\x27\x4b\xdf\xd6\xdf\x6a\x1a\xe1\x49\xda\x35\xa3\x1c\x04\x00\
-\x74\x23\xf9\xd5\xbf\x0d\x97\x73\x33\x32\xb0\x19\xd9\xa9\x2f\xf1\
-\x20\x1c\xd2\xae\x19\xe5\x20\x00\xa0\x1b\x29\xbf\xfb\x9f\x6d\xfe\
-\x13\xda\x35\x03\x95\x22\x7b\xf5\xc7\x45\xf9\xb7\xc9\x02\x80\x0b\
-\x9b\x8c\x6b\x3d\x46\xbb\x6e\xf4\x1e\x01\x00\xf3\x55\xb3\xad\x17\
-\x25\x5d\xfc\x6d\xb8\x41\xb6\x1a\xd6\xae\x1b\xa8\x9c\xa4\x6f\x08\
-\xec\x84\x00\x7f\x92\x76\xcd\xe8\x3d\x02\x00\xe6\x63\xc9\x92\x99\
-\xbb\xc5\x63\xf9\xa3\xb4\x01\xc0\x7f\x4b\xbb\x6e\xa0\x92\x4c\x33\
-\xdc\x3f\x2e\xca\x1b\xd2\x05\x80\xb0\x49\xf6\x21\xd0\xae\x1b\xbd\
-\x45\x00\xc0\x7c\x18\xd7\x3e\x38\xe9\xe2\x1f\xdb\x90\x6d\x3f\x59\
-\xbb\x6e\xa0\xb2\xe2\xa2\x7c\x7c\xca\x01\x29\xaf\xfd\xd4\xae\x19\
-\xbd\x45\x00\xc0\xf6\x2c\x1b\x5b\xbb\x5b\xbc\xd8\xb8\x24\x71\x00\
-\x18\xd3\xae\x1b\xa8\x34\x33\xda\x7a\x4a\xda\x41\xe9\x6f\x19\xb2\
-\xfe\xa9\xda\x75\xa3\x77\x08\x00\xd8\x9e\xb8\xf8\x7f\x32\xf1\xe2\
-\xcf\xbe\xff\xc0\x7c\x24\xbf\x2b\xd7\x86\xa6\x76\xcd\xe8\x1d\x02\
-\x00\xb6\x45\xde\x0a\x9a\xf2\xab\xc6\xdb\xce\x17\x79\xd7\x80\x76\
-\xed\x40\xe5\xc5\x01\x73\x50\xea\x74\x2e\x77\x03\x6b\xd7\x8d\xde\
-\x20\x00\x60\x5b\x0a\x1b\x96\xa5\x9e\x5f\x64\x4e\xd3\xae\x1b\xe8\
-\x0b\x9d\x47\x02\x9d\xbf\x38\x71\x42\x5f\x2b\x77\x05\x6b\xd7\x8e\
-\xc5\x23\x00\x60\x6b\x8c\x6b\x1d\x20\x5f\xfb\xa5\x9c\x5b\x62\xe0\
-\x58\xc7\xdc\x02\x74\xc1\x38\xff\xbe\xd4\x29\x5d\xee\x0a\xd6\xae\
-\x1b\x8b\x47\x00\xc0\x96\xcc\x5e\x58\x84\x73\x52\xcf\x2b\x75\xae\
-\xfe\x81\xee\x18\x13\x76\x29\x9c\xbf\x2c\x69\x52\x77\xfe\x62\xb9\
-\x3b\x58\xbb\x76\x2c\x0e\x01\x00\x5b\x92\x7a\x9f\x91\xce\x9c\xc2\
-\xd5\x3f\xb0\x30\xc6\x85\x0f\xa5\x1f\xb0\xfe\x0b\xda\x75\x63\x71\
-\x08\x00\xb8\xa3\x9a\x6b\x3f\xa2\x6e\xfd\xf5\xa9\xe7\x93\x3a\x57\
-\xff\xc0\xc2\xcc\x3e\xab\x1b\xae\x48\x9c\xd8\x37\xca\xa3\x88\xda\
-\xb5\x63\xe1\x08\x00\xb8\xa3\x18\xec\xc7\x53\x2f\xfe\x85\xf3\xe7\
-\x71\xf5\x0f\x2c\x42\x1c\x48\x1f\x4b\x3e\x70\x6d\x08\x0c\xdc\xfe\
-\x45\x00\xc0\xe6\xe2\x78\x7e\x73\xea\x39\x64\xae\x71\xf5\x0f\x2c\
-\xc6\x29\x76\xea\xde\x71\x20\x5d\xad\x30\x78\x0f\xd1\xae\x1d\x0b\
-\x43\x00\xc0\x6d\xe4\xc5\x3b\xf2\xfa\x5d\x85\xf9\xe3\x47\x5c\x44\
-\x00\x3d\x50\x77\xfe\x88\xd4\x03\xb8\xb0\xfe\xda\xa1\xf1\xd6\x9e\
-\xda\xb5\xa3\x7b\x04\x00\xdc\x26\xce\x1d\x23\x0a\x8b\xff\x4c\xcd\
-\xb5\xfe\x5e\xbb\x76\x60\x20\x9c\x76\xda\xc4\x7d\xe3\x82\x7c\x95\
-\xc2\x40\xae\x69\xd7\x8e\xee\x11\x00\x20\x0a\x17\xde\xa5\xb1\xf8\
-\xc7\x73\x63\x85\x76\xed\xc0\x40\x89\x83\xea\xfd\x1a\x83\xd9\x34\
-\xda\x6f\xd0\xae\x1d\xdd\x21\x00\xa0\x66\x5b\x7b\x17\x36\xac\x4f\
-\x3d\x5f\x14\xce\xdf\x64\x9a\xe1\xd1\xda\xf5\x03\x03\xc5\x98\x75\
-\x3b\x15\xd6\x5f\x98\x7e\x40\x87\x6b\x6a\xcd\xb3\x1e\xaa\x5d\x3f\
-\xe6\x8f\x00\x90\x37\xd9\xf0\xa7\xee\xfc\x54\xea\xb9\xa2\x33\x5f\
-\xf0\x18\x31\x50\x8e\xba\xc2\x3b\x02\xe6\x06\xf5\x38\x2f\xf2\xe8\
-\x1f\x04\x80\xbc\xc5\x2b\xff\x23\x55\xe6\x09\x17\xae\x30\xab\xa6\
-\xef\xa3\x5d\x3f\x30\x90\x64\x11\x8e\x03\xad\xad\x31\xb8\x8d\x6d\
-\x1f\xaa\x5d\x3f\xe6\x87\x00\x90\x2f\xb9\xf9\x4e\xf6\xf2\x50\x09\
-\x00\xd6\xbf\x5b\xbb\x7e\x60\xa0\xc5\x85\xf8\x39\x1a\x83\x5b\x76\
-\x11\xab\x35\xd6\xec\xab\x5d\x3f\xb6\x8f\x00\x90\xa7\x61\x77\xc6\
-\x43\xe2\xe2\x7f\xa9\xca\xfc\xe0\xfc\x4f\xe4\xab\x07\xed\x3e\x00\
-\x06\x5e\x5c\x8c\x87\x95\x12\xfe\x1a\xb9\x17\x41\xbb\x7e\x6c\x1b\
-\x01\x20\x3f\x4b\xa7\xa7\x77\x8c\xc7\xe4\x4c\xa5\xc5\xff\x96\xc2\
-\x4e\xee\xaf\xdd\x07\x40\x16\x56\x8c\xb7\xf7\x29\x5c\xb8\x51\x69\
-\xb0\x1f\xa3\x5d\x3f\xb6\x8d\x00\x90\x9f\x18\xce\xbf\xa4\x33\x1f\
-\x74\xda\xb1\xda\xf5\x03\x59\xd1\xba\xd1\x47\x9a\x71\xfe\xad\xda\
-\xf5\x63\xeb\x08\x00\x79\x29\x1a\xfe\x55\x31\x00\xdc\xaa\x31\x17\
-\xc8\x1b\x4b\x65\x9f\x12\xed\x3e\x00\xb2\x62\xad\xdd\x39\x86\x80\
-\x0b\x54\x42\x80\xf5\xd7\x0f\xb9\xc9\x27\x68\xf7\x01\xb6\x8c\x00\
-\x90\x0f\xb9\x2f\xa7\xee\xfc\x9f\x54\xe6\x01\x09\x00\xcd\xd6\x6b\
-\xb5\xfb\x00\xc8\x92\x69\xb6\xff\x51\x6b\xe0\xc7\x49\xe7\x7c\x33\
-\x31\x71\x4f\xed\x3e\xc0\x9d\x11\x00\xf2\x60\x9a\xe1\xfe\x6a\x17\
-\x01\xb3\x73\xc0\x88\x76\x1f\x00\x59\x8b\x13\xc0\x90\x5a\xfa\xb7\
-\xbe\xae\x5d\x3f\xee\x8c\x00\x30\xf8\x3a\x37\xfd\xb9\xb0\x5a\x6d\
-\xec\x3b\xbf\xc1\x8c\x4d\x3d\x52\xbb\x1f\x80\xac\x0d\xad\x6e\xef\
-\x21\xbb\xf5\x69\x4d\x04\xc6\x85\x0f\x69\xf7\x01\x6e\x8f\x00\x30\
-\xd8\x64\x3f\x90\x18\xfc\x97\x69\x8d\xf9\xd9\x71\xef\xdf\xa7\xdd\
-\x0f\x00\xee\xd2\xd9\x1b\xe0\x50\xbd\xc9\xc0\xdf\x52\x73\xed\xd7\
-\x68\xf7\x01\xfe\x8a\x00\x30\xd8\x34\xde\x0e\x7a\xfb\x63\xef\x57\
-\xf1\xaa\x5f\xa0\x22\x64\x30\xc6\x2b\x82\xa0\x35\x21\xc8\xc7\x81\
-\x85\xf5\xcf\xd0\xee\x07\xcc\x22\x00\x0c\x2e\x79\x02\x47\xeb\x8e\
-\xff\xce\x58\xb7\xfe\xaa\x61\x3b\xb5\x97\x76\x3f\x00\xd8\x8c\xec\
-\x0d\x20\x77\xe7\x2b\x86\x80\xcb\x56\x8c\xfa\x87\x6b\xf7\x03\x08\
-\x00\x83\xaa\xe6\xda\xcf\x95\xb7\xed\x69\x8d\x71\x69\xbc\x1d\x14\
-\xa8\x28\xdd\xaf\x02\x3a\x21\xe0\x3c\x9e\x09\xd6\x47\x00\x18\x3c\
-\x66\xb4\xf5\x94\xd8\xef\x57\x6b\x8e\xef\xba\xf3\x27\x6b\xf7\x03\
-\x80\xad\x98\x7d\x59\x90\xb7\xaa\x93\x84\x0d\x4d\xb9\x43\x59\xbb\
-\x2f\x72\x46\x00\x18\x2c\xb2\xe7\x86\x7c\xf4\xae\x39\xae\x0b\x17\
-\x2e\xe2\x4d\x7f\x40\xc5\xcd\xbe\x10\xc4\x5f\xa9\x1b\x02\xfc\x30\
-\x2f\x06\xd1\x43\x00\x18\x1c\xcb\x4f\x6f\xef\x13\xc7\xf3\xb5\xaa\
-\xe3\x79\xf6\x46\xdf\xe7\x6a\xf7\x05\x80\x79\x88\x69\xfd\xf5\xba\
-\x13\x46\xe7\xeb\x80\x6f\xcb\x27\x12\xda\x7d\x91\x23\x02\xc0\x60\
-\x30\xab\xcf\x7e\x7c\x1c\x47\x7f\xd6\x1e\xcb\x31\xd0\x7f\x46\xbb\
-\x2f\x00\x74\x21\x86\x80\x53\xb4\x27\x8e\x78\xe5\xf2\x35\xed\x7e\
-\xc8\x11\x01\xa0\xff\xd5\x6c\x6b\x6f\x53\x89\xc5\x3f\xfc\x80\x4f\
-\xf3\x80\x3e\x23\x37\xe3\xc9\xf7\x76\xda\x13\x48\xbc\x82\xf9\xb4\
-\x76\x5f\xe4\x86\x00\xd0\xdf\x86\xdd\xf4\x43\x34\xf7\xf7\xdf\x6c\
-\xec\x5e\x32\x3c\xe6\x1f\xa4\xdd\x1f\x00\x16\x40\xee\x1c\xae\xc2\
-\x47\x88\xc6\xfa\x8f\x68\xf7\x45\x4e\x08\x00\xfd\xcb\xac\x9a\x7c\
-\x58\x61\xc3\xe5\xda\x63\xb6\x6e\xfd\xcd\xc6\xb6\x9f\xa3\xdd\x1f\
-\x00\x16\x41\xfb\xd1\xc0\xbf\x5e\x4d\x84\x0f\x6b\xf7\x45\x2e\x08\
-\x00\xfd\x49\xf6\xf2\x88\xe3\xe4\x77\xda\x63\x55\x9a\x69\x86\xf7\
-\x68\xf7\x07\x80\x1e\x28\x9c\x3f\x49\x7b\x42\x99\x0b\x01\x9f\xd3\
-\xee\x8b\x1c\xc4\xbe\x3e\x23\xc1\xb1\x3c\x47\xbb\xce\x41\x52\x1b\
-\x6d\x3f\x2e\x86\xaa\xdf\x6b\x8f\xd1\xce\xb1\xb5\x61\x48\xbb\x3f\
-\x00\xf4\x88\x31\x61\x97\x38\xb0\xcf\xd6\x9e\x58\xe6\xda\xb1\xec\
-\x23\x5e\xae\xc2\xfa\xef\x95\x7e\x1c\xad\x9f\xd0\xae\x73\x50\x98\
-\xb1\xa9\xa7\xd7\x9d\xff\x63\x05\xc6\x66\xe7\x93\x9d\x65\x63\x6b\
-\x77\xd3\xee\x13\x00\x3d\x54\x6b\xac\xd9\xb7\x0a\x37\x16\x75\xae\
-\x30\x9c\xff\xb6\x31\x66\x07\xed\x3e\x19\x54\x71\x12\x3f\xaa\xfc\
-\x63\x18\x8e\xd3\xae\x73\x10\x98\x86\x7f\x7e\x65\xc6\xa5\xf5\x57\
-\xc9\xd7\x10\xda\x7d\x02\xa0\x04\x35\xd7\x7a\xa5\xe6\x8b\x44\xee\
-\x10\x02\x0a\x76\x0c\x2c\x47\xec\xdf\x83\x12\x04\x80\xb7\x6b\xd7\
-\xd9\xef\x8c\x6b\x1f\xac\xbd\xb7\xff\x5f\x9a\xdc\xf4\x17\xc3\x88\
-\x76\x9f\x00\x28\x91\x7c\x0f\xaf\x3e\xd9\xfc\xf5\x8a\xc3\xad\x5c\
-\xd9\xba\x97\x76\x9f\x0c\x9a\x53\xec\xd4\xbd\xe3\x71\xbe\xb1\xc4\
-\xc5\x7f\x93\x19\x5d\xf3\x60\xed\x3a\xfb\x55\x67\xcb\x6e\x1b\x3e\
-\xa5\x3d\xfe\x36\x6f\x66\xd4\xbf\x55\xbb\x5f\x00\x94\x4c\x26\x1f\
-\xb9\xc9\x47\x7b\xc2\xf9\xeb\x95\x47\x38\x97\xb7\x08\xf6\x5e\xec\
-\xd7\x13\x4a\x3c\x66\x2b\xb4\xeb\xeb\x57\xd6\xda\x9d\xab\xb0\x49\
-\xd7\x9d\x9b\x3f\x99\x7b\x73\x80\x0c\xc8\x4d\x81\xf1\xea\x7b\x8d\
-\xfe\xa4\x33\xdb\x62\x20\xb9\x54\x6e\x84\xd2\xee\x97\x41\x32\xf7\
-\x48\x59\xcf\x3f\x05\x90\xab\xff\xa2\x39\xb9\x9f\x76\x7d\xfd\xe8\
-\xd4\x55\x6b\x1e\x50\x38\x3f\xa9\x3d\xde\xb6\x7e\x6c\xfd\x49\x84\
-\x00\x20\x03\x43\xab\xdb\x7b\xd4\xad\xff\x8d\xf6\xa4\xf3\x97\x66\
-\xfd\xf5\x72\x8f\x82\x76\xbf\x0c\x92\x18\xac\x96\xf4\x3e\xac\xf9\
-\x2f\x69\xd7\xd5\x8f\x4c\x23\x3c\x29\xf6\xdd\x85\xea\xe3\x8c\x10\
-\x00\x40\xcc\xbd\x66\x54\xf9\x4d\x63\x9b\x37\x7f\x8b\x71\xed\x0f\
-\x68\xf7\xcb\xa0\x90\x27\x2d\xe4\xf5\xcc\x3d\x5c\x1c\x26\xb9\x71\
-\xb3\x7b\x31\x88\xbd\x39\xf6\xdd\x06\xfd\xf1\x45\x08\x00\xb0\x19\
-\x79\xcd\x67\x65\xee\x44\xfe\x6b\x10\xf8\x0e\xcf\x22\xf7\xc6\xc8\
-\xc8\xf4\xae\xf2\x42\x97\x1e\x1c\x97\x36\xef\x83\xef\x8e\xbc\x44\
-\xa7\x4a\x37\xdd\x12\x02\x00\xdc\x49\xbd\xd1\x7a\x87\xf6\x84\x73\
-\xa7\x66\xc3\xb9\xc6\xb5\x1e\xa3\xdd\x37\x83\xc0\x98\x75\x3b\xc9\
-\x9b\x19\x17\xfa\x08\x68\x5c\xc4\x8e\x97\xfb\x46\xb4\xeb\xe8\x27\
-\xc3\x76\x6a\x2f\x09\x4d\xea\xe3\x88\x10\x00\x60\x7b\x8c\x6d\x7f\
-\x5c\x7b\xc2\xd9\xc2\xc2\x73\x9d\xb1\xfe\x75\xda\x7d\x33\x28\xe4\
-\xe5\x2e\x75\xe7\x5b\x5d\x1c\x83\xb3\x6a\xd6\xbf\x40\xfb\xf7\xee\
-\x37\xf1\xbc\x7d\x61\x6c\x57\x68\x8f\x1f\x42\x00\x80\x79\x8b\x93\
-\xd6\x67\xb5\x27\x9c\xad\x04\x81\xa5\x72\x15\xab\xdd\x3f\x83\x42\
-\x9e\xb8\xe8\x1c\x6b\x1b\xfc\xe6\xf7\x80\x48\xe0\x8a\x01\x61\x2a\
-\xfe\xf9\x45\xe3\x5a\x07\x68\xff\x9e\xfd\x46\xee\x8f\x88\xfd\x77\
-\x84\xdc\xcb\xa2\x3d\x66\x08\x01\x00\xba\x56\xd8\xf0\x75\xed\x09\
-\x67\x8b\x93\x90\x0d\x61\xc5\xe8\xe4\xa3\xb4\xfb\x67\x10\xc9\xcd\
-\x82\xf2\x7d\xb5\xf6\xef\xd1\xcf\x8a\x31\xff\xc4\x18\xa8\xd6\x6a\
-\x8f\x13\x42\x00\x80\x05\x9b\xdd\xa5\xcc\x7f\x4b\x7b\xc2\xd9\xca\
-\x24\xb4\xc1\x38\xff\x3e\xf9\x1d\xb5\xfb\x09\x10\x72\x2e\x1a\xeb\
-\xdf\xd9\x4f\x77\xf9\x13\x02\x00\x6c\x95\x5c\x11\x16\x2e\x7c\x57\
-\x7b\xc2\xd9\x6a\xb3\xe1\x74\xd9\xc7\x40\xbb\x9f\x90\xb7\xa1\xf1\
-\xd6\x9e\x85\xf5\xe3\xea\xe3\x21\x6d\xab\xf1\x22\x2f\x60\xc0\x75\
-\xbe\xcf\x8c\x0b\x6d\x05\x26\x9c\x2d\x36\xb9\xc9\xca\xd8\xf0\x6a\
-\xed\x7e\x42\x7e\x3a\xdb\x69\x37\xc2\xdb\xe2\xe2\x7f\xa5\xf6\x38\
-\x20\x04\x00\x28\x85\x3c\xfa\x55\x77\xde\x56\x60\xc2\xd9\x46\xf3\
-\x27\x2f\x1f\x99\xde\x5d\xbb\xaf\x90\x07\xd9\x3c\xab\xcb\x27\x29\
-\x06\xb5\x11\x02\x80\x41\x27\x77\xdf\xc7\xc1\x6e\x2a\x30\xe1\x6c\
-\xab\x5d\x2d\xf7\x06\xf0\xfd\x24\xca\x72\xe2\xc4\xc4\x3d\xe4\x0e\
-\xff\x32\xdf\xb2\xd8\x87\x8d\x10\x00\x0c\xba\xce\x96\xb2\xf1\x4a\
-\xbb\x02\x13\xce\xb6\x9b\x0d\x67\x1a\x3b\xf5\x78\xed\xfe\xc2\x60\
-\xe9\x3c\xd7\xdf\x07\xfb\xf8\x13\x02\x00\x94\xa2\xf3\x74\x80\xf3\
-\x5f\xa9\xc0\x84\xb3\x9d\x10\xe0\x6f\x2e\x6c\x38\xda\x4c\x4c\xdc\
-\x53\xbb\xcf\xd0\xdf\xe4\x8d\x8a\xf5\xea\x7f\xfa\x55\x85\x46\x08\
-\x00\x72\xd0\x37\x7b\x9b\x77\xde\x74\xe8\xdf\xc8\x23\x83\xe8\xd6\
-\xf2\xd1\xc9\xfb\x75\xc2\x6e\x0c\x93\xea\xe7\x71\xff\x34\x42\x00\
-\x90\x83\x38\x31\x1e\x5e\x81\x09\x67\xbe\xed\x47\x45\xb3\xf5\x3c\
-\xed\x3e\x43\xf5\xc9\x93\x2f\x9d\x67\xfa\x6d\xb8\xbc\x02\xe7\x6d\
-\x3f\x36\x42\x00\x90\x83\xc2\x85\x77\xc5\x89\x72\x63\x05\x26\x9d\
-\x79\xb5\xc2\xfa\xef\xd5\x46\xdb\x8f\xd3\xee\x37\x54\x8f\xdc\x3c\
-\x6a\x1a\xed\x37\xc4\xf3\xf9\x02\xed\xf3\xb4\xab\x66\xc3\x09\xb5\
-\x66\xfb\xf3\xea\xbf\x07\x21\x00\xc8\x4f\xe1\xfc\x8b\xeb\xce\xff\
-\xa9\x02\x93\xce\x3c\x43\x40\x0c\x2c\xd6\x7f\xd3\xac\x9a\x7c\x98\
-\x76\xdf\x41\xdf\x66\x0b\xff\x3a\xed\x73\xb3\xbb\xf3\xd8\xdf\x2a\
-\x2f\xef\xba\xad\x8e\x0a\xbe\xc3\x83\x10\x00\xe4\x40\xf6\x40\x8f\
-\x13\xd0\x45\x15\x98\x74\xe6\xdf\x66\x6f\x14\x5c\x56\x6b\xac\xd9\
-\x57\xbb\xff\x90\x9e\x2c\xfc\xf1\xf8\xbf\x22\x9e\xb7\xe7\xa8\x9f\
-\x8b\xdd\x2e\xfe\x2e\xdc\x18\x7f\xf7\x37\xdf\xb1\xa6\x0a\xde\x9b\
-\x43\x08\x00\x72\x30\xec\xce\x78\x48\x1c\xf0\x3f\xaa\xc0\xa4\xd3\
-\xdd\x64\x6a\xc3\x46\xd9\xdf\x9c\x20\x90\x07\xf9\x8e\x5f\x16\xcf\
-\x78\xcc\xcf\xd3\x3e\xf7\x16\xd6\xfc\x1f\x8b\x46\x78\xf6\xd6\xea\
-\x23\x04\x00\x50\x31\x32\x32\xbd\x6b\x9c\x58\x4f\xad\xc0\xa4\xd3\
-\x7d\x10\x70\x61\x53\x5c\x18\x86\x86\xac\x7f\xaa\x76\x3f\xa2\xf7\
-\x4c\x33\xdc\xdf\x58\xff\x91\x78\x7e\x5e\xa2\x7d\xae\x2d\xa2\x9d\
-\x3d\x9f\xb7\x61\x12\x02\x00\xa8\xe8\x7c\xb4\xea\xc2\x17\x2b\x30\
-\xe9\x2c\x22\x0c\xf8\xc9\xf8\xe7\x41\xbc\x1e\xb7\xff\xc9\x27\x3b\
-\xf1\x58\x1e\x5b\xb7\xfe\x7a\xed\xf3\x6a\x51\xcd\x86\x13\x64\x5b\
-\xee\xf9\xd6\x4d\x08\x00\xa0\x66\xee\xc6\xaa\xf5\x15\x98\x78\x16\
-\x13\x04\x2e\x8e\x7f\x7e\xcc\xd8\x33\x1f\xa8\xdd\x9f\x98\x3f\x09\
-\x6e\xf2\xfd\xfe\xec\x8b\xac\xfc\x2d\xda\xe7\xd1\xe2\xce\xc1\x70\
-\x63\xbd\xd1\x7a\xc7\x42\xfa\x81\x10\x00\x40\x8d\x3c\x72\xd7\xbf\
-\xdf\xb5\x6e\xd6\x6c\xb8\x41\xb6\x41\x96\xbd\x04\x78\xd7\x40\x75\
-\xc9\xd5\xbe\x2c\x7a\x71\xf1\xbf\x54\xfd\x9c\xe9\x41\x93\x1b\x6b\
-\x87\x1a\xad\xbf\x5d\x4c\x9f\x10\x02\x00\xa8\x91\xed\x78\xe5\xbb\
-\xf5\x0a\x4c\x3c\xbd\x99\x94\x6d\xf8\x6d\x0c\x04\x9f\xe2\xa6\xc1\
-\x6a\xe8\x9c\x5f\x4d\xff\xaf\x73\x5f\xdb\xa8\x9f\x1f\x3d\x6b\x36\
-\x34\x4f\x5d\xb5\xe6\x01\xbd\xe8\x23\x42\x00\x00\x55\xa6\x19\xde\
-\x13\x27\xe9\x9b\x2a\x30\xf9\xf4\xac\xc5\x30\x10\xe2\x9f\x87\xf0\
-\x2a\xe2\xb4\x64\xd1\x97\xaf\x98\xe2\x22\xb9\x22\x9e\x53\x1b\xb4\
-\xcf\x83\x1e\x9f\x53\x1b\xeb\xce\x7f\xa2\xd7\x9f\x34\x11\x02\x00\
-\xa8\x2a\xec\xe4\xfe\x75\xeb\x7f\x57\x81\xc9\xa7\xb7\x93\xb6\x0b\
-\x9b\x62\x5d\x13\xf2\x3a\xe2\x15\xa3\xfe\xe1\xda\xfd\x3c\x88\x56\
-\xae\x6c\xdd\x2b\x86\xc8\x37\xc9\x53\x26\xb1\xfd\x59\xfb\x98\x97\
-\x72\x1e\x59\xff\x8b\x58\xe3\x33\xcb\xea\x43\x42\x00\x00\x55\xf2\
-\x38\x56\x9c\xc0\x8b\x0a\x4c\x3e\xe5\x35\xeb\x7f\x2c\x57\x71\x43\
-\xb6\xfd\x64\xed\xfe\xee\x67\x9d\x7b\x48\x6c\xf8\xcf\xd8\x97\x76\
-\xf6\x3e\x8c\x0a\x1c\xdb\x92\x5a\x5c\x9c\x97\x2e\x1b\x5b\xbb\x5b\
-\xd9\x7d\x4a\x08\x00\xa0\x2e\x4e\x44\xaf\x8f\x57\x3c\x57\x55\x60\
-\x02\x2a\x77\x62\x9f\x7d\xa9\x8c\x91\x17\xcc\x98\xb1\xa9\x47\x6a\
-\xf7\x7b\x95\xcd\xdd\x2f\x22\xbb\xf3\x2d\xed\xbb\x9d\x25\x17\x7a\
-\x7e\xb8\x70\x45\xcd\xb5\x5e\x99\xb2\x9f\x09\x01\x00\xd4\x0d\xdb\
-\xa9\xbd\xe2\xd5\xf2\xaa\x0a\x4c\x40\xe9\x26\x7c\xeb\x2f\x94\x77\
-\x11\xc8\x6b\x8a\xe7\xb3\xa9\xcb\x20\x93\xaf\x4b\x3a\x1f\xeb\x5b\
-\xff\xb5\xd8\x37\x67\x77\xbe\x4a\xa9\xc0\x31\x4a\xd6\x6c\x38\x7d\
-\x68\x75\x7b\x0f\x8d\xbe\x27\x04\x00\x50\x37\x33\x33\x73\xd7\x78\
-\xd5\xf7\xde\x41\xfd\x5e\x77\xfb\xcd\xff\x31\xfe\xd9\x88\x7d\xb0\
-\xa4\xd6\x68\xbf\x64\x50\x6f\x28\x94\xba\x4c\xc3\x3f\x3f\x2e\x7a\
-\xef\x8f\xf5\x9a\xf8\xe7\xef\xf5\xfb\x5e\xad\x5d\x1d\x17\xe0\xb7\
-\xcb\xb9\xaf\x79\x4c\x08\x01\x00\x2a\x61\x45\xd3\x3f\x36\x4e\x00\
-\x67\x55\x60\x12\x52\x6f\x9d\x47\x0d\x5d\x18\x8b\xe1\xe0\x2b\xf2\
-\xca\x65\x63\xc3\x81\xfd\xb2\x19\x91\xdc\xe3\x21\xcf\xae\x77\x1e\
-\xcd\xb3\xfe\x4b\xb1\x8d\xc7\x70\x77\x99\x76\x9f\x56\xa5\x75\xb6\
-\x9b\x56\xba\xea\xdf\x12\x42\x00\x80\x4a\x90\x81\x1f\x17\xbd\xc3\
-\xfa\xe9\xf5\xc2\x69\x17\x0f\x7f\x65\xec\x9b\xa9\xba\xf5\xc3\x71\
-\x21\xf9\xaa\x71\xed\x0f\xc8\xe3\x70\xb5\xa6\x7f\x96\x7c\x9d\xd2\
-\xcd\x56\xb1\x0b\x71\xda\x69\x13\xf7\x95\xfd\x0f\x8c\x6b\x1d\xd0\
-\xd9\x69\x2f\x1e\xab\xb8\xb8\x7f\x39\xfe\x6e\xa7\xc5\x2b\xfa\xb5\
-\x1c\xb7\x6d\x1e\xbb\x5f\xc7\x70\xf4\x4f\x65\x1e\x9f\x85\x22\x04\
-\x00\xa8\x0c\x73\x7a\xf8\x9b\x38\x29\x7d\xb7\x02\x13\x51\xdf\xb5\
-\xce\xd6\xb1\xd6\xff\x21\x2e\xd0\x17\xcc\x86\x85\xd0\x8c\xff\x6e\
-\xe2\xbf\x1f\x3f\x77\x73\xdd\x6c\x93\xab\x73\xd9\x35\x4f\x26\x7f\
-\xeb\x3f\x3f\xf7\xef\xc7\xc9\xff\x6d\xa7\xc9\xbd\x19\xd6\x4f\xc4\
-\xff\xff\x73\x3b\x3b\xeb\x59\x7f\xb3\x76\x6d\xfd\xd8\x3a\xcf\xf5\
-\xc7\xfe\x95\x17\x65\x69\x8f\xab\x6d\x21\x04\x00\xa8\x94\xc2\xb6\
-\x5e\x2a\x57\x4e\x15\x98\x8c\x68\xb4\x05\x34\x3f\x55\x34\x27\xf7\
-\xd3\x1e\x47\xf3\x45\x08\x00\x50\x29\xf2\xb1\x76\x9c\x48\x8f\xe8\
-\x5c\xd9\xea\x4f\x48\x34\xda\x76\x9b\xbc\x72\x58\x1e\xfb\xec\xc7\
-\xf7\x46\x10\x02\x00\x54\xce\xdc\xa6\x30\xa3\x15\x98\x90\x68\xb4\
-\x2d\xb6\xd9\xb7\x5f\xfa\x4f\x54\xfd\xe3\xfe\xed\x21\x04\x00\xa8\
-\x24\xb9\xe1\x6d\x6e\x0f\x7e\xed\x49\x89\x46\x9b\x6b\x9d\x57\x0e\
-\x1b\xb3\x6a\xf2\x61\xda\xe3\xa3\x57\x08\x01\x00\x2a\x49\x3e\x5a\
-\xad\xdb\xd6\x5b\xe6\x1e\x97\xd3\x9e\x98\x68\x39\x37\x1b\x7e\x30\
-\x64\xfd\x53\xb5\xc7\x44\x19\x08\x01\x00\x2a\xcb\x98\x75\x3b\xc9\
-\x0b\x78\xe2\x44\x75\x4d\x05\x26\x27\x5a\x46\x4d\x3e\x85\x92\x47\
-\x21\xb5\xc7\x40\xd9\x08\x01\x00\x2a\x4d\x76\x99\x8b\x13\xd5\x67\
-\x63\xbb\xae\x02\x13\x14\x6d\x90\x9b\x0d\xde\x34\xdb\xff\xa8\x7d\
-\xce\xa7\x44\x08\x00\x50\x79\xa7\xd8\xa9\x7b\xd7\xad\x3f\x3c\x87\
-\x97\x0c\xd1\xd2\xb6\x5c\xae\xf8\xb7\xa6\x6a\x21\x20\x8e\xf1\x13\
-\xfb\xf1\x29\x0b\x00\x25\xeb\x04\x01\x17\x3e\x36\xb7\xcf\xbe\xfa\
-\x64\x45\xeb\xe3\x66\xc3\x99\x35\xdb\x7a\x91\xf6\x39\xad\x6d\xee\
-\x9d\x1d\x5f\x55\x3f\x1e\x9b\x35\x42\x00\x80\xad\x92\xd7\xcb\xd6\
-\xad\xff\x2f\xf6\xa2\xa7\x75\xd5\xac\xbf\x59\xf6\xec\x8f\x0b\xcc\
-\x33\xb4\xcf\xe1\x2a\x21\x04\x00\xe8\x3b\x72\xb3\x60\xe1\xc2\xeb\
-\xeb\xce\xb7\xb4\x27\x2c\x5a\x95\x9b\xff\x53\x5c\xe0\x8e\x1e\xa4\
-\xc7\xf9\x7a\x8d\x10\x00\xa0\x6f\x99\xb1\xa9\xa7\xcb\xbe\xf7\x75\
-\x1b\x6e\xd0\x9e\xb8\x68\x95\x69\xbf\x94\xa7\x49\x96\x8d\xad\xdd\
-\x4d\xfb\xfc\xec\x07\x84\x00\x00\x7d\x6d\xd8\x9d\xf1\x90\xd9\x2d\
-\x86\xf9\x7a\x20\xc7\x26\x5b\x4b\xc7\x63\x5f\xc4\xf6\x62\x16\x8e\
-\xee\x11\x02\x00\xf4\xbd\xce\xd7\x03\xcd\xd6\x6b\x63\x18\x18\xe1\
-\x8d\x77\x83\xdf\xe2\xc2\x7f\x4e\x5c\xb8\xde\x6b\x9a\xe1\xfe\xda\
-\xe7\x5e\xbf\x23\x04\x00\x18\x18\xb2\x28\xc8\x4b\x5c\xb8\x57\x60\
-\xb0\x5a\x5c\x14\xae\x95\xaf\x7d\x8c\x6d\x3f\x47\xfb\x1c\x1b\x34\
-\x84\x00\x00\x03\xc7\x34\xc2\x93\xea\x36\x1c\xc5\x57\x04\xfd\xd9\
-\x3a\x8b\xbe\x0d\xcb\x8c\x6b\xff\xb3\xb5\x76\x67\xed\xf3\x69\x90\
-\x11\x02\x00\x0c\x24\x99\x44\xe4\xca\x71\x76\x23\x14\xff\x73\xed\
-\x89\x8d\xb6\x8d\x49\xdf\x85\x6b\x64\xd1\x97\x0d\x7b\x58\xf4\xd3\
-\x22\x04\x00\x18\x78\xf2\xe2\x97\x38\xd1\x1d\x59\x38\xff\x53\xed\
-\x09\x8e\xd6\xd9\xa1\xef\xd2\x78\x2c\xbe\x5d\x6b\xb4\x5f\x22\xf7\
-\x73\x68\x9f\x1f\x39\x23\x04\x00\xc8\x46\xcd\xb6\xf6\x2e\x9a\xfe\
-\x83\x71\x92\x71\x75\xeb\xaf\xd7\x9e\xec\x72\x68\x72\xf7\x7e\xec\
-\xeb\x55\xc6\x85\x0f\x0d\xd9\xf6\x93\xb5\xcf\x01\xdc\x1e\x21\x00\
-\x40\x76\xe4\xea\xb3\xe6\x5a\x7f\x3f\xf7\x68\xe1\x24\x4f\x14\xf4\
-\xb2\xf9\xf3\x65\x51\x91\xab\xfc\x91\x91\xe9\x5d\xb5\x8f\x35\xb6\
-\x8d\x10\x00\x20\x6b\xb2\xa9\x8c\x2c\x58\x31\x08\x7c\x3e\x4e\x40\
-\x67\xc4\x09\x71\xbd\xf6\x24\xd8\x0f\x2d\x86\xa7\x3f\x77\xfa\x4b\
-\xde\xee\x68\xc3\x2b\xe4\x4d\x8f\xda\xc7\x12\xdd\x23\x04\x00\xc0\
-\x1c\x79\x7d\xa9\x3c\x59\x60\x6c\xf8\x77\x79\x24\x6d\xee\x79\xf4\
-\x8d\xda\x93\xa2\xee\x62\x1f\x36\xc9\x8d\x95\x71\x62\xae\xc7\xbe\
-\xf8\x4f\xd3\x0c\xcf\x5c\x3a\x3d\xbd\xa3\xf6\xb1\x42\x6f\x10\x02\
-\x00\x60\x2b\xe4\xe3\x6c\xe3\x5a\x07\xc4\x85\xf0\xed\x9d\x47\x0e\
-\x67\xef\x25\xf8\x4d\xfc\xf3\x56\xed\x89\xb2\xf7\x8b\xbd\xbf\x2c\
-\xd6\x35\x1e\xdb\x97\x8c\x6b\x1f\x2c\x5b\x32\x1b\x13\x76\xd1\x3e\
-\x06\x28\x17\x21\x00\x00\xba\x20\xc1\x20\x86\x82\xa7\xc5\x2b\xe2\
-\x37\xc9\x13\x07\xf1\x2a\xf9\xe4\x18\x10\x7e\xd0\xb9\x5a\x9e\xfd\
-\x88\x5c\x7d\x12\xdd\xc2\x02\x7f\x53\x9c\x58\x2f\x94\x1b\xf4\xe2\
-\xef\x7e\x5c\x6c\x1f\x8d\xff\xf3\xbf\x14\x76\x72\x7f\x3e\xc6\xcf\
-\x1b\x21\x00\x00\x7a\x44\x16\xd4\xa2\x39\xb9\x9f\x7c\x47\x6e\x6c\
-\xfb\xd0\x38\xa1\x7d\x2c\x4e\x68\x5f\x90\x85\x37\xfe\xdd\xc8\x22\
-\x1c\xff\xfc\x51\x67\x41\x76\xfe\x8f\xf1\xef\x57\xcf\x37\x38\xc8\
-\x06\x3a\xf2\x7f\xdf\xf9\x24\xc2\x85\x5f\xc5\xbf\x9f\xdd\xd9\x19\
-\xd1\x86\x95\xf2\xb8\x5d\xfc\xf7\xcf\xc4\x2b\xf8\x0f\x14\x8d\xf0\
-\xb6\xc2\xb6\x5e\x3a\x34\xda\xfe\xbb\x61\x3b\xb5\x97\x7c\xc5\xa1\
-\xdd\x2f\xa8\x2e\x42\x00\x00\x54\x84\x7c\xfc\xbe\x7c\x74\xf2\x7e\
-\xb7\x35\x26\x42\x94\x8d\x10\x00\x00\x40\xa6\x08\x01\x00\x00\x64\
-\x8a\x10\x00\x00\x40\xa6\xe6\x42\xc0\xd1\xda\x0b\x3f\x21\x00\x00\
-\x80\xc4\x08\x01\x00\x00\x64\x8a\x10\x00\x00\x40\xa6\x08\x01\x00\
-\x00\x64\xaa\x8a\x21\xa0\x6e\xc3\x09\x84\x00\x00\x00\x4a\x46\x08\
-\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\
-\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\
-\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\
-\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\
-\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\
-\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\
-\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\
-\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\
-\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\
-\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\
-\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\
-\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\
-\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x25\
-\x21\xa0\xee\xfc\x31\xea\x0b\x3f\x21\x00\x00\x80\xb4\x08\x01\x00\
-\x00\x64\x8a\x10\x00\x00\x40\xa6\x08\x01\x00\x00\x64\x8a\x10\x00\
-\x00\x40\xa6\xaa\x18\x02\x0a\x17\x8e\x27\x04\x00\x00\x50\x32\x42\
-\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\
-\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\
-\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\
-\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\
-\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\
-\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\
-\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\
-\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\
-\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\
-\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\
-\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\
-\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\
-\x04\x00\x00\x90\x29\x42\x00\x00\x00\x99\x22\x04\x00\x00\x90\x29\
-\x09\x01\x85\xf5\x5f\xd3\x5e\xf8\x09\x01\x00\x00\x24\x46\x08\x00\
-\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\
-\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\
-\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\
-\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\
-\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\
-\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\
-\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\
-\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\
-\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x55\xcd\x10\xe0\
-\xbf\x4d\x08\x00\x00\xa0\x64\x84\x00\x00\x00\x32\x45\x08\x00\x00\
-\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\
-\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\
-\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\
-\x00\x00\x32\x45\x08\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\
-\x00\x00\x20\x53\x84\x00\x00\x00\x32\x45\x08\x00\x00\x20\x53\xb3\
-\x21\x20\x7c\x5d\x7b\xe1\x27\x04\x00\x00\x90\x18\x21\x00\x00\x80\
-\x4c\x11\x02\x00\x00\xc8\x14\x21\x00\x00\x80\x4c\x11\x02\x00\x00\
-\xc8\x14\x21\x00\x00\x80\x4c\x11\x02\x00\x00\xc8\x14\x21\x00\x00\
-\x80\x4c\x11\x02\x00\x00\xc8\x14\x21\x00\x00\x80\x4c\x11\x02\x00\
-\x00\xc8\x14\x21\x00\x00\x80\x4c\x11\x02\x00\x00\xc8\x14\x21\x00\
-\x00\x80\x4c\x11\x02\x00\x00\xc8\xd4\x6c\x08\xf0\xdf\xd0\x5e\xf8\
-\x6f\xdf\xfc\x57\xb4\xfb\x05\x00\x80\x81\x57\xc5\x10\x60\x9c\x7f\
-\xab\x76\xbf\x00\x00\x30\xf0\xaa\xf7\x75\x80\xff\xd3\xb0\x3b\xe3\
-\x21\xda\xfd\x02\x00\xc0\xc0\x93\x10\x50\xb7\xfe\x9b\xfa\x8b\xff\
-\x6c\x8b\x81\xe4\x68\xed\x3e\x01\x00\x20\x0b\x55\x0a\x01\x31\x00\
-\xac\x5f\xb9\xb2\x75\x2f\xed\x3e\x01\x00\x20\x0b\x55\xfa\x3a\xc0\
-\x34\xda\x6f\xd0\xee\x0f\x00\x00\xb2\x51\x95\x10\x50\x38\xff\x7f\
-\xda\x7d\x01\x00\x40\x56\x2a\xf2\x75\xc0\x19\xda\xfd\x00\x00\x40\
-\x76\xb4\x3f\x09\x88\x3f\x7b\x9d\x76\x1f\x00\x00\x90\x25\xdd\x4f\
-\x02\xfc\xf9\xda\xf5\x03\x00\x90\x2d\xb5\x10\x60\x83\xd7\xae\x1d\
-\x00\x80\xac\xa9\x7c\x1d\x60\xfd\xb7\xb4\xeb\x06\x00\x20\x7b\xa9\
-\x3f\x09\x28\x9a\xfe\x5f\xb5\x6b\x06\x00\x00\x77\x49\x17\x02\x0a\
-\xe7\x6f\x5a\x3e\x32\xbd\xbb\x76\xbd\x00\x00\x60\x4e\x8a\xaf\x03\
-\x62\x00\x38\x49\xbb\x4e\x00\x00\x70\x07\x65\x86\x80\xc2\x85\x1b\
-\x6b\x8d\x35\xfb\x6a\xd7\x08\x00\x00\xb6\xa0\xac\xaf\x03\x62\x00\
-\xf8\xb0\x76\x6d\x00\x00\x60\x1b\x66\x3f\x09\xf0\xdf\xe8\x61\x00\
-\x30\xf2\xdf\xd4\xae\x0b\x00\x00\x6c\xc7\xec\x27\x01\xe1\xa8\x5e\
-\x2c\xfe\x4b\xa7\xa7\x77\xd4\xae\x07\x00\x00\x74\xc1\x38\xff\xd6\
-\xc2\x85\x6b\xba\x5e\xf8\x6d\xb8\x41\x3e\xf6\xe7\xca\x1f\x00\x80\
-\x3e\x35\xb4\xba\xbd\x47\x61\xc3\xd1\xb1\xad\x9f\xcf\xa3\x7e\x75\
-\xe7\x4f\xae\xd9\xd6\xde\xda\xbf\x37\x00\x00\xe8\x81\x95\x2b\x5b\
-\xf7\x8a\x8b\xfc\x41\xf2\x4a\xdf\x78\x85\x7f\xa6\xbc\xd8\x27\xb6\
-\x9f\xc5\x16\x64\x87\x3f\xd9\xe4\x67\x3e\xcf\xf9\xff\x7f\xca\xd9\
-\xe3\xb8\x98\xef\x0a\xa5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x21\x25\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x5f\x8c\x66\x75\x99\x27\x70\xc1\x41\xb2\x2d\xc9\x28\xbb\x99\
-\x19\x93\xbd\x58\x61\x2f\x46\x82\x26\x1b\x91\x99\xb9\x10\x89\xee\
-\x6e\x70\x91\xd9\x44\xc2\x70\xb1\xb2\xec\xec\x26\x83\x64\x4c\x36\
-\x98\x1e\xb3\x89\x84\xf6\x62\x90\x99\xb9\xc1\x45\x6e\x9a\xa0\x17\
-\x0a\x55\xef\x7b\x16\x68\x52\x53\x75\xce\x5b\xdb\x9a\x8a\x76\x9d\
-\xf3\xb6\x49\xb1\x60\x62\x06\xc9\xba\x7b\x21\x78\x05\x99\xac\x2d\
-\x1b\x98\x40\xac\x3d\x2f\x6e\x34\x84\x7f\xfd\x76\x9f\xe7\x3c\xe7\
-\x3d\xef\xe7\x93\x7c\xe3\x85\x49\xf5\x79\x7e\xa7\xed\xdf\xf7\xad\
-\x2e\xfb\x79\xd7\xbb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x68\
-\x52\xd6\x1f\x9b\x54\xcd\x5f\x89\x74\x94\x7f\x99\xfd\x7b\x1a\x80\
-\xb3\x50\x94\xcd\x7f\x9a\x56\xcd\xa1\x48\x17\x99\x54\xf5\x3f\x14\
-\xd5\xfc\x8f\xb3\x7f\x5f\x03\xf0\x0e\x14\x00\xe9\x3a\x4a\x00\xc0\
-\x0a\x50\x00\x24\x22\x4a\x00\xc0\xc0\x29\x00\x12\x15\x25\x00\x60\
-\xc0\x14\x00\x89\x8c\x12\x00\x30\x50\x0a\x80\x44\x47\x09\x00\x18\
-\x20\x05\x40\xfa\x88\x12\x00\x30\x30\x0a\x80\xf4\x15\x25\x00\x60\
-\x40\x14\x00\xe9\x33\x4a\x00\xc0\x40\x28\x00\xd2\x77\x94\x00\x80\
-\x01\x50\x00\x24\x23\x4a\x00\x40\x32\x05\x40\xb2\xa2\x04\x00\x24\
-\x52\x00\x24\x33\x4a\x00\x40\x12\x05\x40\xb2\xa3\x04\x00\x24\x50\
-\x00\x64\x08\x51\x02\x00\x7a\xa6\x00\xc8\x50\xa2\x04\x00\xf4\x48\
-\x01\x90\x21\x45\x09\x00\xe8\x89\x02\x20\x43\x8b\x12\x00\xd0\x03\
-\x05\x40\x86\x18\x25\x00\x20\x58\x44\x01\x98\x94\xf5\xff\x69\xff\
-\xf3\xef\x65\x5c\x99\x54\xcd\x99\x65\x7e\x1f\x9c\x6f\xda\x5f\xef\
-\xe5\xcd\x59\xfd\x99\xec\xff\x8d\x00\x8c\x52\x44\x01\x28\xb6\x7f\
-\xf0\x7b\xd9\x73\xd1\xbd\xa2\x28\xde\xdd\x96\xbb\x87\xfb\x2d\x01\
-\xf5\x3f\x6c\x56\xfb\xff\x36\x7b\x76\x80\xd1\x51\x00\x58\x86\x12\
-\x00\x30\x12\x0a\x00\xcb\x52\x02\x00\x46\x40\x01\xe0\x5c\x28\x01\
-\x00\x2b\x4e\x01\xe0\x5c\x29\x01\x00\x2b\x4c\x01\xe0\x7c\x28\x01\
-\x00\x2b\x4a\x01\xe0\x7c\x29\x01\x00\x2b\x48\x01\xa0\x0b\x4a\x00\
-\xc0\x8a\x51\x00\xe8\x8a\x12\x00\xb0\x42\x14\x00\xba\xa4\x04\x00\
-\xac\x08\x05\x80\xae\x29\x01\x00\x2b\x40\x01\x20\x82\x12\x00\x30\
-\x70\x0a\x00\x51\x94\x00\x80\x01\x53\x00\x88\xa4\x04\x00\x0c\x94\
-\x02\x40\x34\x25\x00\x60\x80\x14\x00\xfa\xa0\x04\x00\x0c\x8c\x02\
-\x40\x5f\x94\x00\x80\x01\x51\x00\xe8\x93\x12\x00\x30\x10\x0a\x00\
-\x7d\x53\x02\x00\x06\x40\x01\x20\x83\x12\x00\x90\x4c\x01\x20\xcb\
-\xde\xde\xde\x6f\x4d\xaa\xe6\xbf\xf5\x5d\x02\xda\x5f\xf3\x1b\x6d\
-\x8e\x8b\xc8\xb0\x52\xcc\xe6\xff\x2a\xfb\xcf\xa5\xb5\xa2\x00\x90\
-\x29\xe3\x3b\x01\x22\x32\xd0\x94\xf5\xd1\xec\x3f\x93\xd6\x8a\x02\
-\x40\x36\x25\x40\x44\x5e\x8b\x02\xd0\x2f\x05\x80\x21\x50\x02\x44\
-\x44\x01\xe8\x99\x02\xc0\x50\x28\x01\x22\x6b\x1e\x05\xa0\x5f\x0a\
-\x00\x43\xa2\x04\x88\xac\x71\x14\x80\x7e\x29\x00\x0c\x8d\x12\x20\
-\xb2\xa6\x51\x00\xfa\xa5\x00\x30\x44\x4a\x80\xc8\x1a\x46\x01\xe8\
-\x97\x02\xc0\x50\x29\x01\x22\x6b\x16\x05\xa0\x5f\x0a\x00\x43\xa6\
-\x04\x88\xac\x51\x14\x80\x7e\x29\x00\x0c\x9d\x12\x20\xb2\x26\x51\
-\x00\xfa\xa5\x00\xb0\x0a\x94\x00\x91\x35\x88\x02\xd0\x2f\x05\x80\
-\x55\xa1\x04\x88\x8c\x3c\x0a\x40\xbf\x14\x00\x56\x89\x12\x20\x32\
-\xe2\x28\x00\xfd\x52\x00\x58\x35\x4a\x80\xc8\x48\xa3\x00\xf4\x4b\
-\x01\x60\x15\x29\x01\x22\x23\x8c\x02\xd0\x2f\x05\x80\x55\xa5\x04\
-\x88\x8c\x2c\x0a\x40\xbf\x14\x00\x56\x99\x12\x20\x32\xa2\x28\x00\
-\xfd\x52\x00\x58\x75\x4a\x80\xc8\x48\xa2\x00\xf4\x4b\x01\x60\x0c\
-\x94\x00\x91\x11\x44\x01\xe8\x97\x02\xc0\x58\xec\xed\xed\xfd\xd6\
-\xa4\x6c\xbe\x35\xa9\x9a\xff\x25\x22\xc1\x29\xeb\xff\xad\x00\xac\
-\x38\x05\x00\x80\x65\x95\x65\x79\xb1\x02\xb0\xe2\x14\x00\x00\x96\
-\xa5\x00\x8c\x80\x02\x00\xc0\xb2\x14\x80\x11\x50\x00\x00\x58\x96\
-\x02\x30\x02\x0a\x00\x00\xcb\x52\x00\x46\x40\x01\x00\x60\x59\x0a\
-\xc0\x08\x28\x00\x00\x2c\x4b\x01\x18\x01\x05\x00\x80\x65\x29\x00\
-\x23\xa0\x00\x00\xb0\x2c\x05\x60\x04\x14\x00\x00\x96\xa5\x00\x8c\
-\x80\x02\x00\xc0\xb2\x14\x80\x11\x50\x00\x00\x58\x96\x02\x30\x02\
-\x0a\x00\x00\xcb\x52\x00\x46\x40\x01\x00\x60\x59\x0a\xc0\x08\x28\
-\x00\x00\x2c\x4b\x01\x18\x01\x05\x00\x80\x65\x29\x00\x23\xa0\x00\
-\x00\xb0\x2c\x05\x60\x04\x14\x00\x00\x96\xa5\x00\x8c\x80\x02\x00\
-\xc0\xb2\x14\x80\x11\x50\x00\x00\x58\x96\x02\x30\x02\x0a\x00\x00\
-\xcb\x52\x00\x46\x40\x01\x00\x60\x59\x0a\xc0\x08\x28\x00\x00\x2c\
-\x4b\x01\x18\x01\x05\x00\x80\x65\x29\x00\x23\xa0\x00\x00\xb0\x2c\
-\x05\x60\x04\x14\x00\x00\x96\xa5\x00\x8c\x80\x02\x00\xc0\xb2\x14\
-\x80\x11\x50\x00\x00\x58\x96\x02\x30\x02\x0a\x00\x00\xcb\x52\x00\
-\x46\x40\x01\x00\x60\x59\x0a\xc0\x08\x28\x00\x00\x2c\x4b\x01\x18\
-\x01\x05\x00\x80\x65\x29\x00\x23\xa0\x00\x00\xb0\x2c\x05\x60\x04\
-\x14\x00\x00\x96\xa5\x00\x8c\x80\x02\x00\xc0\xb2\x14\x80\x11\x50\
-\x00\x00\x58\x96\x02\x30\x02\x0a\x00\x00\xcb\x52\x00\x46\x40\x01\
-\x00\x60\x59\x0a\xc0\x08\x28\x00\x00\x2c\x4b\x01\x18\x01\x05\x00\
-\x80\x65\x29\x00\x23\xa0\x00\x9c\x9d\xa2\x68\xfe\xd1\x23\xdb\xa7\
-\x2e\x13\x11\x91\x36\xb3\xfa\xf7\x03\x0a\xc0\x57\xd3\xe7\x5a\x91\
-\x14\x7b\x7b\x97\x9c\xff\xc5\xa6\x00\x9c\x95\x69\x55\xff\x79\xe7\
-\xbf\xd9\x45\x44\x44\xce\x21\xc5\xee\xe9\x8f\x9e\xf7\xc5\xa6\x00\
-\x9c\x9d\xb6\x00\x6c\x65\xbf\x70\x11\x11\x91\xf6\x3e\x7a\xfe\xd8\
-\xb1\xc3\x0b\xcf\xfb\x62\x53\x00\xde\x59\x51\xfc\xe8\x3d\x93\xaa\
-\x39\x93\xff\xd2\x45\x44\x64\xdd\xd3\xde\x47\xdf\xee\xe6\x72\x53\
-\x00\xde\x51\xb1\x53\x7f\x32\xfb\x85\x8b\x88\x88\xbc\x96\x72\xff\
-\x73\xdd\x5c\x6e\x0a\xc0\x3b\x9a\x96\xf5\x5f\xa7\xbf\x70\x11\x11\
-\x59\xfb\x4c\xca\xfa\x97\x8f\xee\xd6\xbf\xd3\xc9\xe5\xa6\x00\xbc\
-\xb3\x69\xd9\x3c\x95\xfd\xd2\x45\x44\x44\xda\x02\x70\xd0\xd9\xe5\
-\xa6\x00\xbc\xbd\xc5\x2c\x8b\xc6\x95\xfd\xd2\x45\x44\x44\x26\x55\
-\xfd\x97\xdd\x5d\x70\x0a\xc0\xdb\x2a\xaa\xf9\x7f\xc8\x7e\xe1\x22\
-\x22\x22\x8b\x6c\x56\xfb\x1f\xef\xee\x82\x53\x00\xde\x56\x3b\xcf\
-\x66\xf6\x0b\x17\x11\x11\x99\x56\xf5\xcf\x8f\x1f\x1c\x5c\xd4\xd9\
-\x05\xa7\x00\xbc\xb5\xa2\x28\xde\x3d\x29\xeb\x17\xf2\x5f\xba\x88\
-\x88\xac\x7d\xca\xfa\xd1\x6e\x2f\x39\x05\xe0\x2d\x6d\x6c\xcf\xff\
-\x20\xfd\x85\x8b\x88\x88\xb4\x29\xca\xfa\xcf\x3a\xbd\xe4\x14\x80\
-\xb7\x36\x29\x9b\x63\xd9\x2f\x5c\x44\x44\x64\x91\x62\xf7\xf4\x07\
-\x3b\xbd\xe4\x14\x80\xb7\xd6\x16\x80\x26\xfb\x85\x8b\x88\x88\x4c\
-\xab\xfa\xef\x3a\xbf\xe4\x14\x80\x37\xf7\xf0\xf6\xa9\xf7\x4f\xaa\
-\xe6\xd5\xfc\x97\x2e\x22\x22\x52\xdf\xdb\xf9\x45\xa7\x00\xbc\xb9\
-\x76\x8e\x3f\xc9\x7f\xe1\x22\x22\x22\xed\xbd\x3a\x6b\xae\xeb\xfc\
-\xa2\x53\x00\xde\x5c\xfb\xe9\xff\x1b\xd9\x2f\x5c\x44\x44\x64\x5a\
-\x36\x2f\x6d\x6d\x1d\x1c\xe9\xfc\xa2\x53\x00\xde\xdc\xb4\xac\x7f\
-\x9a\xfe\xd2\x45\x44\x44\xca\x66\x16\x72\xd1\x29\x00\x6f\x54\xec\
-\x34\x1f\x4e\x7f\xe1\x22\x22\x22\x8b\x94\xcd\x1d\x31\x97\x9d\x02\
-\xf0\x06\x45\xd5\xfc\x45\xfa\x0b\x17\x11\x11\x69\xb3\xb9\x3d\xff\
-\x50\xcc\x65\xa7\x00\xbc\x41\x3b\xc3\x77\xb2\x5f\xb8\x88\x88\xc8\
-\xa4\xaa\x9f\x0d\xbb\xec\x14\x80\xd7\xfb\xd6\xee\x53\xef\x9d\x54\
-\xcd\xcb\x9d\x9f\x49\x59\xff\x97\xf6\xeb\xde\x24\x22\x22\x23\x4d\
-\x59\x1f\x74\x5f\x00\x9a\x07\xc2\x2e\x3c\x05\xe0\xf5\x36\x67\xf5\
-\x67\x3a\x6f\x71\x65\xfd\x62\x59\x96\x17\x67\xcf\x06\x40\x8c\xa8\
-\xdd\x31\x9b\xd5\xfc\xb3\x71\x0f\xad\x00\xbc\x4e\xfb\x02\xbf\xde\
-\x7d\x01\x68\x1e\xcf\x9e\x0b\x80\x38\x93\xf2\xd4\x1f\x76\xfe\xe9\
-\xbf\x6c\x5e\x29\x4e\x1e\xfc\x76\xd8\x43\x2b\x00\xaf\xd7\x16\x80\
-\xff\xd9\xf9\x79\x94\xf3\xdb\xb3\xe7\x02\x20\x4e\xc8\xee\x98\xb2\
-\xf9\x7e\xe8\x43\x2b\x00\xbf\xb1\x58\xb4\xd0\xf9\x0b\x6c\xb3\x59\
-\xee\x5f\x9e\x3d\x1b\x00\x71\x22\x76\xc7\xb4\x1f\x1e\xbf\x1c\xfa\
-\xd0\x0a\xc0\x6f\x4c\xab\xfa\xcf\xbb\x2f\x00\xf5\x33\xd9\x73\x01\
-\x10\x27\x6a\x77\x4c\xfb\xa1\xf4\xa3\xa1\x0f\xae\x00\xfc\x46\x7b\
-\x59\x6f\x05\x14\x80\xfb\xb2\xe7\x02\x20\xce\x34\x64\x77\x4c\xfd\
-\xfc\xb1\x63\x87\x17\x86\x3e\xb8\x02\xf0\x2b\x45\xf1\xa3\xf7\xb4\
-\x0d\xee\x4c\xe7\x67\x51\xd5\xd7\x67\xcf\x06\x40\x9c\x49\xc0\xee\
-\x98\xf6\x6b\x7e\x3b\xfc\xc1\x15\x80\x5f\x29\x76\xea\x4f\x06\xbc\
-\xc0\x97\x8b\xbd\xbd\x4b\xb2\x67\x03\x20\x4e\xc8\xee\x98\x72\xff\
-\x73\xe1\x0f\xae\x00\xfc\x4a\xfb\x02\xff\xba\xfb\x17\x58\x9f\xcc\
-\x9e\x0b\x80\x38\x11\xbb\x63\x26\x65\xfd\xcb\x47\x77\xeb\xdf\x89\
-\x7f\x78\x05\xe0\x35\xd3\xb2\x79\x2a\xa0\x00\x1c\xcd\x9e\x0b\x80\
-\x38\x11\xbb\x63\x16\xff\xa2\x60\x3f\x0f\xaf\x00\xbc\x6b\xf1\xbc\
-\x8b\xc6\xd5\xf9\x4b\xdc\xad\xaf\xcc\x9e\x0d\x80\x38\xd3\x80\xdd\
-\x31\x93\xaa\xfe\xcb\x5e\x1e\x5e\x01\x78\xd7\xbb\x26\xb3\xfa\x4f\
-\x03\x5e\xe0\x73\x87\x87\x87\x17\x64\xcf\x06\x40\x8c\xa8\xdd\x31\
-\x9b\xd5\xfe\xc7\x7b\x19\x40\x01\x58\xfc\x04\x67\x3d\x09\x28\x00\
-\x0f\x66\xcf\x05\x40\x9c\x90\xdd\x31\x55\xfd\xf3\xe3\x07\x07\x17\
-\xf5\x32\xc0\xba\x17\x80\xa8\x05\x0e\x8b\xcd\x50\xd9\xb3\x01\x10\
-\x27\x66\x77\x4c\xfd\x68\x6f\x03\xac\x7b\x01\x08\x59\xe0\x50\x35\
-\xaf\x16\xb3\xe6\xd2\xec\xd9\x00\x88\x13\xb3\x3b\xa6\xfe\xb3\xde\
-\x06\x50\x00\x42\x16\x38\xd4\xd9\x73\x01\x10\x27\x6a\x77\xcc\xe2\
-\xeb\xf6\x37\x84\x02\x10\xb0\xc0\xa1\xb9\x2b\x7b\x2e\x00\xe2\x04\
-\xed\x8e\xf9\xbb\x5e\x87\x58\xe7\x02\x10\xb6\xc0\x61\xd6\x5c\x9d\
-\x3d\x1b\x00\x71\x82\x76\xc7\xdc\xdb\xeb\x10\xeb\x5c\x00\xa6\x01\
-\x0b\x1c\x16\x3f\x50\xb8\xf8\xc1\xc2\xec\xd9\x00\x88\xf1\xda\xee\
-\x98\xb2\xf9\x45\xc0\x87\xc7\xeb\xfa\x1d\x64\x8d\x0b\x40\xc8\x02\
-\x87\xb2\xd9\xc8\x9e\x0b\x80\x38\x11\xbb\x63\xa6\x65\xf3\xd2\xd6\
-\xd6\xc1\x91\x7e\x07\x59\xe3\x02\x10\xb3\xc0\xa1\xb9\x35\x7b\x2e\
-\x00\xe2\xc4\xec\x8e\x69\x66\xbd\x0f\xb2\xae\x05\x20\x6c\x81\x43\
-\xf5\xbd\x0f\x64\xcf\x06\x40\x9c\x69\x55\xff\x30\xa0\x00\xdc\xd1\
-\xfb\x20\x6b\x5b\x00\x22\x16\x38\x54\xcd\x93\xd9\x73\x01\x10\x27\
-\x6a\x77\xcc\xe6\xf6\xfc\x43\xfd\x0f\xb3\xa6\x05\x60\x1a\xb2\xc0\
-\xa1\xb9\x27\x7b\x2e\x00\xe2\x04\xed\x8e\x79\x36\x65\x98\x75\x2c\
-\x00\x71\x0b\x1c\xe6\xd7\x66\xcf\x06\x40\x9c\x98\xdd\x31\xcd\xf1\
-\x94\x61\xd6\xb1\x00\x84\x2c\x70\x28\xeb\x17\xcb\xb2\xbc\x38\x7b\
-\x36\x00\x62\x44\xed\x8e\x69\x3f\x3c\x7e\x36\x67\xa0\x35\x2c\x00\
-\x31\x0b\x1c\x9a\xc7\xb3\xe7\x02\x20\x4e\xc8\xee\x98\xb2\x79\xa5\
-\x38\x79\xf0\xdb\x29\x03\xad\x69\x01\x08\x58\xe0\x30\xbf\x3d\x7b\
-\x2e\x00\xe2\x04\xed\x8e\xf9\x7e\xda\x40\xeb\x56\x00\xa2\x16\x38\
-\x6c\x96\xfb\x97\x67\xcf\x06\x40\x9c\x98\xdd\x31\xf3\x2f\xa7\x0d\
-\xb4\x6e\x05\x20\x68\x81\xc3\x33\xd9\x73\x01\x10\x27\x6c\x77\xcc\
-\xee\xe9\x8f\xa6\x0d\xb5\x86\x05\x20\x62\x81\xc3\x7d\xd9\x73\x01\
-\x10\x67\x1a\xb0\x3b\xa6\xbd\x3b\x9e\x3f\x76\xec\xf0\xc2\xb4\xa1\
-\xd6\xa9\x00\xbc\xb6\xc0\xa1\x6a\xce\x74\x3e\x6f\x55\x5f\x9f\x3d\
-\x1b\x00\x71\x42\x76\xc7\x54\xcd\xb7\x53\x87\x5a\xab\x02\x10\xb0\
-\xc0\x61\xf1\xef\x09\x14\x7b\x7b\x97\x64\xcf\x06\x40\x9c\x98\xdd\
-\x31\xfb\x9f\x4b\x1d\x6a\x9d\x0a\x40\xcc\x02\x87\xfa\x64\xf6\x5c\
-\x00\xc4\x89\xda\x1d\xb3\xf1\x9d\xf9\xef\xe6\x0e\xb6\x4e\x05\x20\
-\x64\x81\x43\x7d\x34\x7b\x2e\x00\xe2\x84\xec\x8e\x29\xeb\x83\xec\
-\xb9\xd6\xa6\x00\x44\x2d\x70\x98\xec\xd6\x57\x66\xcf\x06\x40\x9c\
-\x69\xc4\xee\x98\xb2\xbe\x3b\x7b\xae\xb5\x29\x00\x41\x0b\x1c\x9e\
-\x3b\x3c\x3c\xbc\x20\x7b\x36\x00\x62\x44\xed\x8e\x99\x6c\xd7\xd7\
-\x64\xcf\xb6\x3e\x05\x20\x64\x81\x43\xfd\x60\xf6\x5c\x00\xc4\x09\
-\xd9\x1d\x53\xd5\x3f\x3f\x7e\x70\x70\x51\xf6\x6c\x6b\x51\x00\xa2\
-\x16\x38\xb4\xad\xf0\xa6\xec\xd9\x00\x88\x13\xb1\x3b\xa6\xfd\xf0\
-\xf8\x58\xf6\x5c\xaf\x59\x87\x02\x10\xb2\xc0\xa1\x6a\x5e\x2d\x66\
-\xcd\xa5\xd9\xb3\x01\x10\x27\x62\x77\x4c\x7b\x7f\xdc\x96\x3d\xd7\
-\x6b\xd6\xa3\x00\x84\x2c\x70\xa8\xb3\xe7\x02\x20\x4e\xd4\xee\x98\
-\xc5\xd7\xcd\x9e\xed\x35\x6b\x52\x00\x02\x16\x38\x34\x77\x65\xcf\
-\x05\x40\x9c\x88\xdd\x31\xed\x7d\xf4\x74\xf6\x5c\xbf\x36\xf6\x02\
-\x10\xb6\xc0\x61\xd6\x5c\x9d\x3d\x1b\x00\x71\x82\x76\xc7\xdc\x9b\
-\x3d\xd7\xaf\x8d\xbd\x00\x4c\x03\x16\x38\x2c\x7e\xa0\x70\xf1\x83\
-\x85\xd9\xb3\x01\x10\xe3\xb5\xdd\x31\x65\xf3\x8b\x80\x0f\x8f\xd7\
-\x65\xcf\xf6\x6b\x63\x2f\x00\x21\x0b\x1c\xca\x66\x23\x7b\x2e\x00\
-\xe2\x44\xec\x8e\x99\x96\xcd\x4b\x5b\x5b\x07\x47\xb2\x67\xfb\xb5\
-\xb1\x17\x80\x98\x05\x0e\xcd\xad\xd9\x73\x01\x10\x27\x66\x77\x4c\
-\x33\xcb\x9e\xeb\x75\xc6\x5c\x00\xa2\x16\x38\x3c\x5a\x7d\xef\x03\
-\xd9\xb3\x01\x10\x27\x66\x77\x4c\x73\x47\xf6\x5c\xaf\x33\xea\x02\
-\x10\xb1\xc0\xa1\x6a\x9e\xcc\x9e\x0b\x80\x38\x51\xbb\x63\x36\xb7\
-\xe7\x1f\xca\x9e\xed\x75\xc6\x5c\x00\xa6\x11\x0b\x1c\xaa\xe6\x9e\
-\xec\xb9\x00\x88\x13\xb4\x3b\xe6\xd9\xec\xb9\xde\x60\xac\x05\x20\
-\x6a\x81\xc3\x66\x35\xbf\x36\x7b\x36\x00\xe2\xc4\xec\x8e\x69\x8e\
-\x67\xcf\xf5\x06\x63\x2d\x00\x21\x0b\x1c\xca\xfa\xc5\xb2\x2c\x2f\
-\xce\x9e\x0d\x80\x18\x51\xbb\x63\xda\x0f\x8f\x9f\xcd\x9e\xed\x0d\
-\xc6\x5a\x00\x22\x16\x38\x4c\xcb\xe6\xf1\xec\xb9\x00\x88\x13\xb2\
-\x3b\xa6\x6c\x5e\x39\x71\x62\xef\x7d\xd9\xb3\xbd\xc1\x88\x0b\x40\
-\xe7\x0b\x1c\x8a\x72\x7e\x7b\xf6\x5c\x00\xc4\x09\xda\x1d\xf3\xfd\
-\xec\xb9\xde\xd4\x18\x0b\x40\xd4\x02\x87\xcd\x72\xff\xf2\xcc\xb9\
-\x00\x88\x15\xb3\x3b\x66\xfe\xe5\xec\xb9\xde\xd4\x18\x0b\x40\xc4\
-\x02\x87\xf6\x6b\x3e\x93\x39\x13\x00\xb1\xa2\x76\xc7\x6c\xec\xec\
-\x5f\x95\x3d\xdb\x9b\x1a\x69\x01\x88\x58\xe0\x70\x5f\xe6\x4c\x00\
-\xc4\x2a\x76\xe6\x37\x07\xdc\x1d\xcf\x1f\x3b\x76\x78\x61\xf6\x6c\
-\x6f\x6a\x6c\x05\x20\x6c\x81\x43\x55\x5f\x9f\x35\x13\x00\xf1\xa6\
-\x65\xf3\xcd\xae\xef\x8e\x49\xd5\x7c\x3b\x7b\xae\xb7\x34\xba\x02\
-\x10\xb0\xc0\x61\xf1\xef\x09\x14\x7b\x7b\x97\x64\xcd\x04\x40\xbc\
-\x98\xdd\x31\xfb\x9f\xcb\x9e\xeb\x2d\x8d\xad\x00\xc4\x2c\x70\xa8\
-\x4f\x66\xcd\x03\x40\xbc\x8d\x72\xfe\x91\xce\x3f\x3c\x96\xf5\x2f\
-\x37\xbe\x33\xff\xdd\xec\xd9\xde\xd2\xe8\x0a\x40\xc8\x02\x87\xfa\
-\x68\xd6\x3c\x00\xc4\x0b\xd9\x1d\x53\xd6\x07\xd9\x73\xbd\xad\x31\
-\x15\x80\xa8\x05\x0e\x93\xdd\xfa\xca\x8c\x79\x00\xe8\xc7\x34\x62\
-\x77\x4c\x59\xdf\x9d\x3d\xd7\xdb\x1a\x53\x01\x08\x5a\xe0\xf0\xdc\
-\xe1\xe1\xe1\x05\x19\xf3\x00\x10\x2f\x6a\x77\xcc\x64\xbb\xbe\x26\
-\x7b\xb6\xb7\x35\xaa\x02\x10\xb2\xc0\xa1\x7e\x30\x63\x16\x00\xfa\
-\x11\xb2\x3b\xa6\xaa\x7f\x7e\xfc\xe0\xe0\xa2\xec\xd9\xde\xd6\x58\
-\x0a\x40\xd4\x02\x87\xb6\x15\xde\xd4\xf7\x2c\x00\xf4\x27\x62\x77\
-\x4c\xfb\xe1\xf1\xb1\xec\xb9\xde\xd1\x58\x0a\x40\xc8\x02\x87\xaa\
-\x79\xb5\x98\x35\x97\xf6\x3d\x0b\x00\xfd\x89\xd8\x1d\xd3\xde\x1f\
-\xb7\x65\xcf\xf5\x8e\xc6\x53\x00\x42\x16\x38\xd4\x7d\xcf\x01\x40\
-\x7f\xa2\x76\xc7\x2c\xbe\x6e\xf6\x6c\xef\x68\x44\x05\x20\x60\x81\
-\x43\x73\x57\xdf\x73\x00\xd0\x9f\x88\xdd\x31\xed\x7d\xf4\x74\xf6\
-\x5c\x67\x65\x0c\x05\x20\x6a\x81\x43\x31\x6b\xae\xee\x73\x0e\x00\
-\xfa\x15\xb4\x3b\xe6\xde\xec\xb9\xce\xca\x18\x0a\x40\xfb\x6b\xfe\
-\x49\xf7\x0d\xae\x7e\x61\xf1\x83\x85\x7d\xce\x01\x40\x7f\xc2\x76\
-\xc7\xcc\x9a\xeb\xb2\x67\x3b\x2b\x63\x28\x00\xed\xa7\xff\x6f\x74\
-\x5f\x00\x9a\x8d\x3e\x67\x00\xa0\x5f\x11\xbb\x63\xa6\x65\xf3\xd2\
-\xd6\xd6\xc1\x91\xec\xd9\xce\xca\x18\x0a\x40\xcc\x02\x87\xe6\xd6\
-\x3e\x67\x00\xa0\x5f\x31\xbb\x63\x9a\x59\xf6\x5c\x67\x6d\xd5\x0b\
-\x40\xb1\xd3\x7c\xb8\xfb\x4f\xff\xf5\x2f\x1f\xad\xbe\xf7\x81\xbe\
-\x66\x00\xa0\x7f\x31\xbb\x63\x9a\x3b\xb2\xe7\x3a\x6b\x2b\x5f\x00\
-\x22\x16\x38\x54\xcd\x93\x7d\x3d\x3f\x00\xfd\x8b\xda\x1d\xb3\xb9\
-\x3d\xff\x50\xf6\x6c\x67\x6d\xd5\x0b\xc0\x34\x62\x81\x43\xd5\xdc\
-\xd3\xd7\xf3\x03\xd0\xbf\xa0\xdd\x31\xcf\x66\xcf\xb5\x94\x55\x2e\
-\x00\x51\x0b\x1c\x36\xab\xf9\xb5\x7d\x3c\x3f\x00\x39\x62\x76\xc7\
-\x34\xc7\xb3\xe7\x5a\xca\x2a\x17\x80\x90\x05\x0e\x65\xfd\x62\x59\
-\x96\x17\xf7\xf1\xfc\x00\xf4\x2f\x6a\x77\x4c\xfb\xe1\xf1\xb3\xd9\
-\xb3\x2d\x65\x95\x0b\x40\xc4\x02\x87\x69\xd9\x3c\xde\xc7\xb3\x03\
-\x90\x23\x64\x77\x4c\xd9\xbc\x72\xe2\xc4\xde\xfb\xb2\x67\x5b\xca\
-\x8a\x17\x80\xce\x17\x38\x14\xe5\xfc\xf6\x3e\x9e\x1d\x80\x1c\xd3\
-\xaa\xfe\x4a\xc0\x87\xc7\xef\x67\xcf\xb5\xb4\x55\x2d\x00\x51\x0b\
-\x1c\x36\xcb\xfd\xcb\xa3\x9f\x1d\x80\x3c\xed\x9f\xf5\xf3\x80\x0f\
-\x8f\x5f\xce\x9e\x6b\x69\xab\x5a\x00\x22\x16\x38\xb4\x5f\xf3\x99\
-\xe8\xe7\x06\x20\x4f\xd4\xee\x98\x8d\x9d\xfd\xab\xb2\x67\x5b\xda\
-\x0a\x17\x80\x88\x05\x0e\xf7\x45\x3f\x37\x00\x79\x8a\x9d\xf9\xcd\
-\x01\x77\xc7\xf3\xc7\x8e\x1d\x5e\x98\x3d\xdb\xd2\x56\xb1\x00\x84\
-\x2d\x70\xa8\xea\xeb\x23\x9f\x1b\x80\x5c\xd3\xb2\xf9\x66\x40\x01\
-\x78\x28\x7b\xae\x73\xb2\x92\x05\x20\x60\x81\xc3\xe2\xdf\x13\x28\
-\xf6\xf6\x2e\x89\x7c\x6e\x00\x72\x45\xec\x8e\x69\x3f\x3c\xde\x92\
-\x3d\xd7\x39\x59\xc5\x02\x10\xb3\xc0\xa1\x3e\x19\xf9\xcc\x00\xe4\
-\xda\x28\xe7\x1f\xe9\xfc\xc3\xe3\x2a\xef\x8e\x59\xc9\x02\x10\xb2\
-\xc0\xa1\x3e\x1a\xf9\xcc\x00\xe4\x8a\xd8\x1d\xd3\xde\x1d\x4f\x64\
-\xcf\x75\xce\x56\xad\x00\x44\x2d\x70\x98\xec\xd6\x57\x46\x3d\x33\
-\x00\xf9\xa6\x11\xbb\x63\xca\xfa\xee\xec\xb9\xce\xd9\xaa\x15\x80\
-\xa0\x05\x0e\xcf\x1d\x1e\x1e\x5e\x10\xf5\xcc\x00\xe4\x8a\xda\x1d\
-\x33\xd9\xae\xaf\xc9\x9e\xed\x9c\xad\x5c\x01\x08\x59\xe0\x50\x3f\
-\x18\xf5\xbc\x00\xe4\x8b\xd8\x1d\xd3\x16\x8a\x33\xc7\x0f\x0e\x2e\
-\xca\x9e\xed\x9c\xad\x52\x01\x88\x5a\xe0\xd0\xbe\xc4\x9b\x22\x9e\
-\x17\x80\x61\x88\xd8\x1d\xd3\x7e\x78\x7c\x2c\x7b\xae\xf3\xb2\x4a\
-\x05\x20\x64\x81\x43\xd5\xbc\x5a\xcc\x9a\x4b\x23\x9e\x17\x80\x61\
-\x88\xd8\x1d\xd3\xde\x1f\xb7\x65\xcf\x75\x5e\x56\xab\x00\x34\xc7\
-\xba\x7e\xd6\x69\xd9\xd4\x11\xcf\x0a\xc0\x30\x44\xed\x8e\x59\x7c\
-\xdd\xec\xd9\xce\xcb\x8a\x15\x80\xa6\xf3\x67\x2d\x9b\xbb\x22\x9e\
-\x15\x80\x61\x88\xd8\x1d\xd3\xde\x47\x4f\x67\xcf\x75\xde\x56\xa5\
-\x00\x44\x2d\x70\x28\x66\xcd\xd5\x5d\x3f\x2b\x00\xc3\x11\xb4\x3b\
-\xe6\xde\xec\xb9\xce\xdb\xaa\x14\x80\x88\x05\x0e\x8b\x1f\x28\x5c\
-\xfc\x60\x61\xd7\xcf\x0a\xc0\x30\x84\xed\x8e\x99\x35\xd7\x65\xcf\
-\x76\xde\x56\xa5\x00\x44\x2c\x70\x68\x7f\x53\x6c\x74\xfd\x9c\x00\
-\x0c\x47\xc4\xee\x98\xf6\x3e\x7a\x69\x6b\xeb\xe0\x48\xf6\x6c\xe7\
-\x6d\x75\x0a\x40\xf7\x0b\x1c\xda\x97\x78\x6b\xd7\xcf\x09\xc0\x70\
-\xc4\xec\x8e\x69\x66\xd9\x73\x75\x62\x15\x0a\x80\x05\x0e\x00\x9c\
-\x8b\x98\xdd\x31\xcd\x1d\xd9\x73\x75\x62\x15\x0a\x40\xc4\x02\x87\
-\x49\xd5\x3c\xd9\xe5\x33\x02\x30\x2c\x51\xbb\x63\x8a\xf2\xf4\x15\
-\xd9\xb3\x75\x62\x15\x0a\xc0\x34\x62\x81\x43\xd5\xdc\xd3\xe5\x33\
-\x02\x30\x2c\x41\xbb\x63\x9e\xcd\x9e\xab\x33\x43\x2f\x00\x51\x0b\
-\x1c\x36\xab\xf9\xb5\x5d\x3d\x23\x00\xc3\x13\xb3\x3b\xa6\x79\x20\
-\x7b\xae\xce\x0c\xbd\x00\x44\x2c\x70\x98\x96\xf5\x8b\x65\x59\x5e\
-\xdc\xd5\x33\x02\x30\x2c\x61\xbb\x63\x66\xfb\x37\x66\xcf\xd6\x99\
-\xa1\x17\x80\x88\x05\x0e\xd3\xb2\x79\xbc\xab\xe7\x03\x60\x78\x42\
-\x76\xc7\x94\xcd\x2b\x27\x4e\xec\xbd\x2f\x7b\xb6\xce\xac\x40\x01\
-\xe8\x7c\x81\x43\x51\xce\x6f\xef\xea\xf9\x00\x18\x9e\x69\x55\x7f\
-\xa5\xf3\x02\x50\xd5\xa7\xb2\xe7\xea\xd4\x90\x0b\x40\xd4\x02\x87\
-\xcd\x72\xff\xf2\x2e\x9e\x0f\x80\x61\x6a\xff\xac\x9f\x07\x14\x80\
-\x3b\xb3\xe7\xea\xd4\x90\x0b\x40\xc4\x02\x87\xf6\x6b\x3e\xd3\xc5\
-\xb3\x01\x30\x4c\x51\xbb\x63\x36\x76\xf6\xaf\xca\x9e\xad\x53\x03\
-\x2f\x00\x11\x0b\x1c\xee\xeb\xe2\xd9\x00\x18\xa6\x88\xdd\x31\xed\
-\xdd\xf1\xfc\xb1\x63\x87\x17\x66\xcf\xd6\xa9\xa1\x16\x80\xb0\x05\
-\x0e\x55\x7d\x7d\x17\xe7\x06\xc0\x30\x45\xec\x8e\x69\x0b\xc0\x43\
-\xd9\x73\x75\x6e\xb0\x05\x20\x60\x81\xc3\xe2\xdf\x13\x28\xf6\xf6\
-\x2e\xe9\xe2\xdc\x00\x18\x9e\xc3\xc3\xc3\x0b\x26\x55\xfd\x5c\xc0\
-\x87\xc7\x5b\xb2\x67\xeb\xdc\x50\x0b\x40\xcc\x02\x87\xfa\x64\x17\
-\x67\x06\xc0\x30\xd9\x1d\xb3\x84\xc1\x16\x80\x90\x05\x0e\xf5\xd1\
-\x2e\xce\x0c\x80\x61\x8a\xd8\x1d\xd3\xde\x1d\x4f\x64\xcf\x15\x62\
-\x88\x05\x20\x6a\x81\xc3\x64\xb7\xbe\xb2\xab\x73\x03\x60\x78\xa6\
-\x11\xbb\x63\xca\xfa\xee\xec\xb9\x42\x0c\xb1\x00\x04\x2d\x70\x78\
-\x6e\xf1\x77\x43\x5d\x9d\x1b\x00\xc3\x12\xb5\x3b\x66\xb2\x5d\x5f\
-\x93\x3d\x5b\x88\x41\x16\x80\x90\x05\x0e\xf5\x83\x5d\x9d\x19\x00\
-\xc3\x33\x29\x9b\x1b\xba\xbf\x3b\x9a\x33\xc7\x0f\x0e\x2e\xca\x9e\
-\x2d\xc4\xd0\x0a\x40\xd8\x02\x87\xaa\xb9\xa9\xcb\x73\x03\x60\x58\
-\xda\x02\x70\x7f\xc0\x87\xc7\xc7\xb2\xe7\x0a\x33\xb4\x02\x10\xb2\
-\xc0\xa1\x6a\x5e\x2d\x66\xcd\xa5\x5d\x9e\x1b\x00\xc3\x12\xb1\x3b\
-\xa6\xbd\x3f\x6e\xcb\x9e\x2b\xcc\xd0\x0a\x40\xc4\x02\x87\x69\xd9\
-\xd4\x5d\x9e\x19\x00\xc3\x12\xb5\x3b\x66\xf1\x75\xb3\x67\x0b\x33\
-\xbc\x02\xd0\xfd\x02\x87\x76\xc6\xbb\xba\x3c\x33\x00\x86\x25\x62\
-\x77\xcc\xa4\x6c\x9e\xce\x9e\x2b\xd4\x90\x0a\x40\xd4\x02\x87\x62\
-\xd6\x5c\xdd\xf5\xb9\x01\x30\x1c\x41\xbb\x63\xee\xcd\x9e\x2b\xd4\
-\x90\x0a\x40\xc4\x02\x87\xc5\x0f\x14\x2e\x7e\xb0\xb0\xeb\x73\x03\
-\x60\x18\xc2\x76\xc7\xcc\x9a\xeb\xb2\x67\x0b\x35\xa4\x02\x10\xb1\
-\xc0\xa1\xfd\x4d\xb1\xd1\xf5\x99\x01\x30\x1c\x11\xbb\x63\xda\xfb\
-\xe8\xa5\xad\xad\x83\x23\xd9\xb3\x85\x1a\x56\x01\xa8\x7f\x1a\xf0\
-\x12\x6f\xed\xfa\xcc\x00\x18\x8e\x98\xdd\x31\xcd\x2c\x7b\xae\x70\
-\x43\x29\x00\x16\x38\x00\x70\x2e\x62\x76\xc7\x34\x77\x64\xcf\x15\
-\x6e\x28\x05\x20\x62\x81\xc3\xa4\x6a\x9e\x8c\x38\x33\x00\x86\x21\
-\x6a\x77\x4c\x51\x9e\xbe\x22\x7b\xb6\x70\x43\x29\x00\xd3\x88\x05\
-\x0e\x55\x73\x4f\xc4\x99\x01\x30\x0c\x41\xbb\x63\x9e\xcd\x9e\xab\
-\x17\x43\x28\x00\x51\x0b\x1c\x36\xab\xf9\xb5\x41\xc7\x06\xc0\x00\
-\xc4\xec\x8e\x69\x1e\xc8\x9e\xab\x17\x43\x28\x00\x9b\xb3\xfa\x33\
-\x5d\x3f\xc3\xb4\xac\x5f\x2c\xcb\xf2\xe2\xa8\x73\x03\x20\x57\xd8\
-\xee\x98\xd9\xfe\x8d\xd9\xb3\xf5\x62\x08\x05\xa0\x7d\x81\x5f\xef\
-\xbe\x00\x34\x8f\x47\x9d\x19\x00\xf9\x42\x76\xc7\x94\xcd\x2b\x27\
-\x4e\xec\xbd\x2f\x7b\xb6\x5e\x0c\xa4\x00\x74\xbe\xc0\xa1\x28\xe7\
-\xb7\x47\x9d\x19\x00\xf9\x22\x76\xc7\x4c\xaa\xfa\x54\xf6\x5c\xbd\
-\xc9\x2e\x00\x51\x0b\x1c\x36\xcb\xfd\xcb\x23\xcf\x0d\x80\x5c\xd3\
-\x80\xdd\x31\x6d\x01\xb8\x33\x7b\xae\xde\x64\x17\x80\x88\x05\x0e\
-\xed\xd7\x7c\x26\xf2\xcc\x00\xc8\x15\xb5\x3b\x66\x63\x67\xff\xaa\
-\xec\xd9\x7a\x33\x80\x02\x10\xb1\xc0\xe1\xbe\xc8\x33\x03\x20\x57\
-\xc4\xee\x98\xf6\xee\x78\xfe\xd8\xb1\xc3\x0b\xb3\x67\xeb\x4d\x66\
-\x01\x08\x5b\xe0\x50\xd5\xd7\x47\x9f\x1b\x00\x79\x22\x76\xc7\xb4\
-\x05\xe0\xa1\xec\xb9\x7a\x95\x5a\x00\x02\x16\x38\x2c\xfe\x3d\x81\
-\x62\x6f\xef\x92\xe8\x73\x03\x20\xc7\xe1\xe1\xe1\x05\x6d\x01\xf8\
-\x59\xc0\x87\xc7\x5b\xb2\x67\xeb\x55\x66\x01\x88\x59\xe0\x50\x9f\
-\x8c\x3e\x33\x00\xf2\xd8\x1d\xd3\x91\xd4\x02\x10\xb2\xc0\xa1\x3e\
-\x1a\x7d\x66\x00\xe4\x99\x54\xcd\x97\x02\xee\x8e\x27\xb2\xe7\xea\
-\x5d\x56\x01\x88\x5a\xe0\x30\xd9\xad\xaf\xec\xe3\xdc\x00\xc8\xd1\
-\x16\x80\xef\x06\x7c\x07\xe0\xee\xec\xb9\x7a\x97\x55\x00\x82\x16\
-\x38\x3c\xb7\xf8\xbb\xa1\x3e\xce\x0d\x80\xfe\x45\xed\x8e\x99\x6c\
-\xd7\xd7\x64\xcf\xd6\xbb\xb4\x02\x10\xb2\xc0\xa1\x7e\xb0\x8f\x33\
-\x03\x20\xc7\xa4\x6c\x6e\xe8\xfe\xee\x68\xce\x1c\x3f\x38\xb8\x28\
-\x7b\xb6\xde\x65\x14\x80\xb0\x05\x0e\x55\x73\x53\x5f\xe7\x06\x40\
-\xff\xda\x02\x70\x7f\xc0\x87\xc7\xc7\xb2\xe7\x4a\x91\x51\x00\x42\
-\x16\x38\x54\xcd\xab\xc5\xac\xb9\xb4\xaf\x73\x03\xa0\x7f\x11\xbb\
-\x63\xda\xfb\xe3\xb6\xec\xb9\x52\x64\x14\x80\x88\x05\x0e\xd3\xb2\
-\xa9\xfb\x3a\x33\x00\xfa\x17\xb5\x3b\xe6\x91\xed\x53\x97\x65\xcf\
-\x96\x22\xa7\x00\x74\xbf\xc0\xa1\x9d\xe3\xae\xbe\xce\x0c\x80\xfe\
-\x45\xec\x8e\x99\x94\xcd\xd3\xd9\x73\xa5\xe9\xbb\x00\x44\x2d\x70\
-\x28\x66\xcd\xd5\x7d\x9e\x1b\x00\xfd\x8a\xd8\x1d\xd3\x16\x80\xaf\
-\x65\xcf\x95\xa6\xef\x02\x10\xb1\xc0\x61\xf1\x03\x85\x6b\xb5\xc0\
-\x01\x60\xcd\x44\xed\x8e\xd9\xdc\x99\x7f\x3a\x7b\xb6\x34\x7d\x17\
-\x80\x88\x05\x0e\xed\x6f\x8a\x8d\x3e\xcf\x0c\x80\x7e\x45\xec\x8e\
-\x69\xef\xa3\x97\xb6\xb6\x0e\x8e\x64\xcf\x96\xa6\xff\x02\x50\xff\
-\x34\xe0\x25\xde\xda\xe7\x99\x01\xd0\xaf\x90\xdd\x31\x55\xb3\x9b\
-\x3d\x57\xaa\x3e\x0b\x80\x05\x0e\x00\x9c\x8b\x88\xdd\x31\x45\x35\
-\xff\x62\xf6\x5c\xa9\xfa\x2c\x00\x45\xd5\xfc\x45\xe7\x05\xa0\x6a\
-\x9e\xec\xfb\xcc\x00\xe8\x4f\xd4\xee\x98\xa2\x3c\x7d\x45\xf6\x6c\
-\xa9\xfa\x2c\x00\xed\x7f\xf7\x9d\x80\x02\x70\x4f\xdf\x67\x06\x40\
-\x7f\x82\x76\xc7\x3c\x9b\x3d\x57\xba\xbe\x0a\x40\xd4\x02\x87\xcd\
-\x6a\x7e\x6d\xc2\xb1\x01\xd0\x93\x98\xdd\x31\xcd\x03\xd9\x73\xa5\
-\xeb\xab\x00\x6c\xce\xea\xcf\x74\xfd\xeb\x4c\xcb\xfa\xc5\xb2\x2c\
-\x2f\xce\x38\x37\x00\xe2\x85\xed\x8e\x99\xed\xdf\x98\x3d\x5b\xba\
-\xbe\x0a\x40\xfb\x02\xbf\xde\x7d\x01\x68\x1e\xcf\x38\x33\x00\xfa\
-\x11\xb2\x3b\xa6\x6c\x5e\x39\x71\x62\xef\x7d\xd9\xb3\xa5\xeb\xb1\
-\x00\x74\xbe\xc0\xa1\x28\xe7\xb7\x67\x9c\x19\x00\xfd\x88\xd8\x1d\
-\x33\xa9\xea\x53\xd9\x73\x0d\x42\x1f\x05\x20\x6a\x81\xc3\x66\xb9\
-\x7f\x79\xd6\xb9\x01\x10\x6f\x1a\xb0\x3b\xa6\x2d\x00\x77\x66\xcf\
-\x35\x08\x7d\x14\x80\x88\x05\x0e\xed\xd7\x7c\x26\xeb\xcc\x00\x88\
-\x17\xb5\x3b\x66\x63\x67\xff\xaa\xec\xd9\x06\xa1\xa7\x02\xd0\xf9\
-\x02\x87\xf6\x6b\xde\x97\x75\x66\x00\xc4\x8b\xd8\x1d\xd3\xde\x1d\
-\xcf\xdb\x1d\xf3\xff\x45\x17\x80\xa8\x05\x0e\x45\x55\x5f\x9f\x79\
-\x6e\x00\xc4\x8a\xd8\x1d\xd3\x16\x80\x87\xb2\xe7\x1a\x8c\xf0\x02\
-\x10\xb0\xc0\x61\xf1\xef\x09\x14\x7b\x7b\x97\x64\x9e\x1b\x00\x71\
-\x0e\x0f\x0f\x2f\x68\x0b\xc0\xcf\x02\x3e\x3c\xde\x92\x3d\xdb\x60\
-\x44\x17\x80\x90\x05\x0e\x65\x7d\x32\xf3\xcc\x00\x88\x65\x77\x4c\
-\x0f\xc2\x0b\x40\xc0\x02\x87\xb6\x00\x1c\xcd\x3c\x33\x00\x62\x4d\
-\xaa\xe6\x4b\x01\x77\xc7\x13\xd9\x73\x0d\x4a\x64\x01\x88\x5a\xe0\
-\x30\xd9\xad\xaf\xcc\x3e\x37\x00\xe2\xb4\x05\xe0\xbb\x01\xdf\x01\
-\xb8\x3b\x7b\xae\x41\x89\x2c\x00\x41\x0b\x1c\x9e\x5b\xfc\xdd\x50\
-\xf6\xb9\x01\x10\x23\x6a\x77\xcc\x64\xbb\xbe\x26\x7b\xb6\x41\x09\
-\x2d\x00\x21\x0b\x1c\xea\x07\xb3\xcf\x0c\x80\x38\x93\xb2\xb9\xa1\
-\xfb\xbb\xa3\x39\x73\xfc\xe0\xe0\xa2\xec\xd9\x06\x25\xaa\x00\x84\
-\x2d\x70\xa8\x9a\x9b\xb2\xcf\x0c\x80\x38\x6d\x01\xb8\x3f\xe0\xc3\
-\xe3\x63\xd9\x73\x0d\x4e\x54\x01\x08\x59\xe0\x50\x35\xaf\x16\xb3\
-\xe6\xd2\xec\x33\x03\x20\x4e\xc4\xee\x98\xf6\xfe\xb8\x2d\x7b\xae\
-\xc1\x89\x2a\x00\x11\x0b\x1c\xa6\x65\x53\x67\x9f\x17\x00\x71\xa2\
-\x76\xc7\x3c\xb2\x7d\xea\xb2\xec\xd9\x06\x27\xae\x00\x74\xbf\xc0\
-\xa1\x7d\xd6\xbb\xb2\xcf\x0b\x80\x38\x11\xbb\x63\x26\x65\xf3\x74\
-\xf6\x5c\x83\x14\x51\x00\x36\xb7\xe7\x1f\x8a\x58\xe0\x50\xcc\x9a\
-\xab\xb3\xcf\x0b\x80\x38\x11\xbb\x63\xda\x02\xf0\xb5\xec\xb9\x06\
-\x29\xe4\x3b\x00\x55\xfd\x9f\xbb\x7f\x81\xf5\x0b\x16\x38\x00\x8c\
-\x57\xd4\xee\x98\xcd\x9d\xf9\xa7\xb3\x67\x1b\xa4\x88\x02\xd0\x36\
-\xb8\x32\xa0\xc1\x6d\x64\x9f\x15\x00\x71\x36\xcb\xfa\x53\x9d\xdf\
-\x47\x65\xf3\xd2\xd6\xd6\xc1\x91\xec\xd9\x06\x29\xa2\x00\x4c\xaa\
-\xfa\xff\x06\xbc\xc4\x5b\xb3\xcf\x0a\x80\x38\x21\xbb\x63\xaa\x66\
-\x37\x7b\xae\xc1\x8a\xf9\x0e\x40\xd7\x9f\xfe\x2d\x70\x00\x18\xbb\
-\x88\xdd\x31\x45\x35\xff\x62\xf6\x5c\x83\xb5\x12\x05\xa0\x6a\x9e\
-\xcc\x3e\x27\x00\xe2\x2c\x3e\xe4\x45\xec\x8e\x29\xca\xd3\x57\x64\
-\xcf\x36\x58\x2b\x52\x00\xee\xc9\x3e\x27\x00\xe2\x04\xed\x8e\x79\
-\x36\x7b\xae\x41\x5b\x85\x02\xb0\x59\xcd\xaf\xcd\x3e\x27\x00\xe2\
-\xc4\xec\x8e\x69\x1e\xc8\x9e\x6b\xd0\x06\x5f\x00\xca\xfa\xc5\xb2\
-\x2c\x2f\xce\x3e\x27\x00\x62\x84\xed\x8e\x99\xed\xdf\x98\x3d\xdb\
-\xa0\x0d\xbf\x00\x34\x8f\x67\x9f\x11\x00\x71\xa2\x76\xc7\x3c\xbc\
-\x7d\xea\xfd\xd9\xb3\x0d\xda\xd0\x0b\x40\x51\xce\x6f\xcf\x3e\x23\
-\x00\xe2\x44\xec\x8e\x99\x54\xf5\xa9\xec\xb9\x06\x6f\xe8\x05\x60\
-\xb3\xdc\xbf\x3c\xfb\x8c\x00\x88\x33\x0d\xd8\x1d\xd3\x16\x80\x3b\
-\xb3\xe7\x1a\xbc\x61\x17\x80\xfa\x99\xec\xf3\x01\x20\xce\xe2\xdb\
-\xf4\x11\xbb\x63\x36\x76\xf6\xaf\xca\x9e\x6d\xf0\x06\x5e\x00\xee\
-\xcb\x3e\x1f\x00\xe2\x14\x3b\xf3\x9b\x03\xee\x8e\xe7\xed\x8e\x39\
-\x0b\x43\x2e\x00\x45\x55\x5f\x9f\x7d\x3e\x00\xc4\x99\x96\xcd\x37\
-\x03\x0a\xc0\x43\xd9\x73\xad\x84\xa1\x16\x80\x49\xd5\xbc\x5c\xec\
-\xed\x5d\x92\x7d\x3e\x00\xc4\x38\x3c\x3c\xbc\xa0\x2d\x00\x3f\x0b\
-\xf8\xf0\x78\x4b\xf6\x6c\x2b\x61\xa8\x05\x60\x5a\xd6\x27\xb3\xcf\
-\x06\x80\x38\x1b\xe5\xfc\x23\x9d\x7f\x78\xb4\x3b\xe6\xec\x0d\xb8\
-\x00\x1c\xcd\x3e\x1b\x00\xe2\x4c\xaa\xe6\x4b\x01\x77\xc7\x13\xd9\
-\x73\xad\x8c\xa1\x16\x80\xc9\x6e\x7d\x65\xf6\xd9\x00\x10\xa7\x2d\
-\x00\xdf\x0d\x28\x00\x5f\xcd\x9e\x6b\x65\x0c\xb1\x00\x4c\xaa\xfa\
-\xb9\xc5\xdf\x0d\x65\x9f\x0d\x00\x31\xbe\xb5\xfb\xd4\x7b\x17\x3f\
-\xeb\xd5\xf5\xfd\xd1\xde\x69\x9f\xc8\x9e\x6d\x65\x0c\xb4\x00\x3c\
-\x98\x7d\x2e\x00\xc4\x99\x94\xcd\x0d\xdd\xdf\x1d\xcd\x99\xe3\x07\
-\x07\x17\x65\xcf\xb6\x32\x86\x59\x00\x9a\x9b\xb2\xcf\x05\x80\x38\
-\x6d\x01\xb8\x3f\xe0\xfe\x38\x91\x3d\xd7\x4a\x19\x5a\x01\x58\xfc\
-\x8b\x50\xc5\xac\xb9\x34\xfb\x5c\x00\x88\xd3\xfe\x79\xff\x93\x80\
-\x3b\xe4\xf3\xd9\x73\xad\x94\xa1\x15\x80\x69\xd9\xd4\xd9\x67\x02\
-\x40\x9c\x62\xf7\xf4\x07\x23\xee\x8f\x47\xb6\x4f\x5d\x96\x3d\xdb\
-\x4a\x19\x5a\x01\x68\x9f\xe7\xae\xec\x33\x01\x20\x4e\x31\x6b\xbe\
-\xd0\xf5\xdd\x31\x29\x9b\x1f\x67\xcf\xb5\x72\x06\x57\x00\x66\xcd\
-\xd5\xd9\x67\x02\x40\x9c\x69\xd9\xfc\x6d\x40\x01\xf8\x5a\xf6\x5c\
-\x2b\x67\x48\x05\x60\x52\xd6\x2f\x58\xe0\x00\x30\x5e\x45\xf1\xa3\
-\xf7\xb4\x97\xf5\x2f\xba\xbe\x3f\x36\x77\xe6\x9f\xce\x9e\x6d\xe5\
-\x0c\xab\x00\x34\x1b\xd9\xe7\x01\x40\x9c\xcd\xb2\xfe\x54\xe7\xf7\
-\x47\xd9\xbc\xb4\xb5\x75\x70\x24\x7b\xb6\x95\x33\xa4\x02\xd0\xbe\
-\xc4\x5b\xb3\xcf\x03\x80\x38\x93\xb2\xfe\x9b\x80\xfb\x63\x37\x7b\
-\xae\x95\x34\x94\x02\x60\x81\x03\xc0\xf8\x4d\xab\xfa\x87\x5d\xdf\
-\x1f\x45\x35\xff\x62\xf6\x5c\x2b\x69\x30\x05\xa0\x6a\x9e\xcc\x3e\
-\x0b\x00\xe2\x2c\x3e\xe4\x2d\x3e\xec\x75\x5e\x00\xca\xd3\x57\x64\
-\xcf\xb6\x92\x06\x54\x00\xee\xc9\x3e\x0b\x00\xe2\x4c\x66\xf5\x9f\
-\x76\x7f\x77\xd4\xcf\x66\xcf\xb5\xb2\x86\x52\x00\x36\xab\xf9\xb5\
-\xd9\x67\x01\x40\x9c\xf6\xb2\x9e\x04\x7c\x78\x7c\x20\x7b\xae\x95\
-\x35\x88\x02\x50\xd6\x2f\x96\x65\x79\x71\xf6\x59\x00\x10\xa3\x28\
-\x8a\x77\x2f\xfe\xaf\xde\x9d\x17\x80\xd9\xfe\x8d\xd9\xb3\xad\xac\
-\x61\x14\x80\xe6\xf1\xec\x73\x00\x20\xce\xa4\x3c\xf5\x87\x01\x9f\
-\xfe\xed\x8e\x39\x1f\x43\x28\x00\x45\x39\xbf\x3d\xfb\x1c\x00\x88\
-\x33\xad\xea\xaf\x74\x5f\x00\xea\x53\xd9\x73\xad\xb4\x21\x14\x80\
-\xcd\x72\xff\xf2\xec\x73\x00\x20\x4e\xfb\x67\xfd\x3c\xa0\x00\xdc\
-\x99\x3d\xd7\x4a\xcb\x2f\x00\xf5\x33\xd9\x67\x00\x40\x9c\x87\xb7\
-\x4f\xbd\x7f\xf1\xed\xfa\xce\x0b\x40\x59\x7f\x2c\x7b\xb6\x95\x36\
-\x80\x02\x70\x5f\xf6\x19\x00\x10\xa7\xd8\x99\xdf\x1c\x70\x77\x3c\
-\x6f\x77\xcc\x79\xca\x2e\x00\x45\x55\x5f\x9f\x7d\x06\x00\xc4\x99\
-\x96\xcd\x37\x03\x0a\xc0\x43\xd9\x73\xad\xbc\xcc\x02\x30\xa9\x9a\
-\x97\x8b\xbd\xbd\x4b\xb2\xcf\x00\x80\x18\x87\x87\x87\x17\xb4\x05\
-\xe0\x67\x01\x1f\x1e\x6f\xc9\x9e\x6d\xe5\xa5\x7e\x07\xa0\xac\x4f\
-\x66\xcf\x0f\x40\x9c\x8d\x72\xfe\x91\xce\x3f\x3c\xda\x1d\xd3\x8d\
-\xe4\x02\x70\x34\x7b\x7e\x00\xe2\x4c\xaa\xe6\x4b\x01\x77\xc7\x13\
-\xd9\x73\x8d\x42\xea\x5f\x01\xec\xd6\x57\x66\xcf\x0f\x40\x9c\xb6\
-\x00\x7c\x37\xa0\x00\x7c\x35\x7b\xae\x51\xc8\x2a\x00\x93\xaa\x7e\
-\x6e\xf1\x77\x43\xd9\xf3\x03\x10\xe3\x5b\xbb\x4f\xbd\x77\xf1\xb3\
-\x5e\x5d\xdf\x1f\xed\xbd\xf5\x89\xec\xd9\x46\x21\xb1\x00\x3c\x98\
-\x3d\x3b\x00\x71\x26\x65\x73\x43\xf7\x77\x47\x73\xe6\xf8\xc1\xc1\
-\x45\xd9\xb3\x8d\x42\x5e\x01\x68\x6e\xca\x9e\x1d\x80\x38\x6d\x01\
-\xb8\x3f\xe0\xfe\x38\x91\x3d\xd7\x68\x64\x14\x00\x0b\x1c\x00\xc6\
-\xaf\xfd\xf3\xfe\x27\x01\x77\xc8\xe7\xb3\xe7\x1a\x8d\x94\xef\x00\
-\x94\x4d\x9d\x3d\x37\x00\x71\x8a\xdd\xd3\x1f\x8c\xb8\x3f\x1e\xd9\
-\x3e\x75\x59\xf6\x6c\xa3\x91\x51\x00\xda\x5f\xf3\xae\xec\xb9\x01\
-\x88\x53\xcc\x9a\x2f\x74\xfe\xdd\xe3\xb2\xf9\x71\xf6\x5c\xa3\x92\
-\x52\x00\x66\xcd\xd5\xd9\x73\x03\x10\x67\x5a\x36\x7f\x1b\x50\x00\
-\xbe\x96\x3d\xd7\xa8\xf4\x5d\x00\x26\x65\xfd\x82\x05\x0e\x00\xe3\
-\x55\x14\x3f\x7a\x4f\x7b\x59\xff\xa2\xeb\xfb\x63\x73\x67\xfe\xe9\
-\xec\xd9\x46\xa5\xff\x02\xd0\x6c\x64\xcf\x0c\x40\x9c\xcd\xb2\xfe\
-\x54\xe7\xf7\x47\xd9\xbc\xb4\xb5\x75\x70\x24\x7b\xb6\x51\xe9\xfd\
-\xaf\x00\xca\xe6\xd6\xec\x99\x01\x88\x33\x29\xeb\xbf\x09\xb8\x3f\
-\x76\xb3\xe7\x1a\x9d\x3e\x0b\x80\x05\x0e\x00\xe3\x37\xad\xea\x1f\
-\x76\x7d\x7f\x14\xd5\xfc\x8b\xd9\x73\x8d\x4e\xaf\x05\xa0\x6a\x9e\
-\xcc\x9e\x17\x80\x38\x8b\x0f\x79\x8b\x0f\x7b\x9d\x17\x80\xf2\xf4\
-\x15\xd9\xb3\x8d\x4e\xcf\x05\xe0\x9e\xec\x79\x01\x88\x33\x2d\xeb\
-\xff\xd8\xfd\xdd\x51\x3f\x9b\x3d\xd7\x28\xf5\x59\x00\x36\xab\xf9\
-\xb5\xd9\xf3\x02\x10\xa7\xfd\xf4\x3f\x0d\xf8\xf0\xf8\x40\xf6\x5c\
-\xa3\xd4\x5b\x01\x28\xeb\x17\xcb\xb2\xbc\x38\x7b\x5e\x00\x62\x14\
-\x45\xf1\xee\xc5\xff\xd5\xbb\xf3\x02\x30\xdb\xbf\x31\x7b\xb6\x51\
-\xea\xaf\x00\x34\x8f\x67\xcf\x0a\x40\x9c\xa2\xda\xff\xa3\x80\x4f\
-\xff\x76\xc7\x44\xe9\xab\x00\x14\xe5\xfc\xf6\xec\x59\x01\x88\x33\
-\xad\xea\xaf\x74\x5f\x00\xea\x53\xd9\x73\x8d\x56\x5f\x05\x60\xb3\
-\xdc\xbf\x3c\x7b\x56\x00\xe2\xb4\x7f\xd6\xcf\x03\x0a\xc0\x9d\xd9\
-\x73\x8d\x56\x3f\x05\xa0\x7e\x26\x7b\x4e\x00\xe2\x3c\xbc\x7d\xea\
-\xfd\x8b\x6f\xd7\x77\x5e\x00\xca\xfa\x63\xd9\xb3\x8d\x56\x4f\x05\
-\xe0\xbe\xec\x39\x01\x88\x53\xec\xcc\x6f\x0e\xb8\x3b\x9e\xb7\x3b\
-\x26\x50\x1f\x05\xa0\xa8\xea\xeb\xb3\xe7\x04\x20\xce\xb4\x6c\xbe\
-\x19\xf0\xe9\xff\xe1\xec\xb9\x46\x2d\xba\x00\x4c\xaa\xe6\xe5\x62\
-\x6f\xef\x92\xec\x39\x01\x88\x71\x78\x78\x78\x41\x5b\x00\x7e\xd6\
-\xf9\xfd\xb1\xd3\xfc\xfb\xec\xd9\x46\x2d\xfc\x3b\x00\x65\x7d\x32\
-\x7b\x46\x00\xe2\x6c\x94\xf3\x8f\x04\x7c\xfa\xb7\x3b\x26\x5a\x0f\
-\x05\xe0\x68\xf6\x8c\x00\xc4\x99\x54\xcd\x97\x02\xee\x8f\xff\x91\
-\x3d\xd7\xe8\x85\xff\x15\xc0\x6e\x7d\x65\xf6\x8c\x00\xc4\x69\x0b\
-\xc0\x77\x03\x3e\x3c\x7e\x35\x7b\xae\xd1\x8b\x2c\x00\x93\xaa\x7e\
-\x6e\xf1\x77\x43\xd9\x33\x02\x10\xe3\x5b\xbb\x4f\xbd\x77\xf1\xb3\
-\x5e\x5d\xdf\x1f\xed\xdd\xf4\x89\xec\xd9\x46\x2f\xb8\x00\x3c\x98\
-\x3d\x1f\x00\x71\x26\x65\x73\x43\xf7\x77\x47\x73\xe6\xf8\xc1\xc1\
-\x45\xd9\xb3\x8d\x5e\x6c\x01\x68\x6e\xca\x9e\x0f\x80\x38\x6d\x01\
-\xb8\x3f\xe0\xfe\x38\x91\x3d\xd7\x5a\x88\x2a\x00\x16\x38\x00\x8c\
-\x5f\xfb\xe7\xfd\x4f\x02\xee\x90\xcf\x67\xcf\xb5\x16\xc2\xbe\x03\
-\x50\x36\x75\xf6\x6c\x00\xc4\x29\x76\x4f\x7f\x30\xe2\xfe\x78\x64\
-\xfb\xd4\x65\xd9\xb3\xad\x85\xa8\x02\xd0\x7e\xdd\xbb\xb2\x67\x03\
-\x20\x4e\x31\x6b\xbe\xd0\xf9\x77\x8f\xcb\xe6\xc7\xd9\x73\xad\x8d\
-\xa8\x02\xb0\xb1\x3d\xff\x83\xec\xd9\x00\x88\xd3\xfe\x59\x5f\x04\
-\x14\x80\xff\x9a\x3d\xd7\xda\x88\x28\x00\x93\xb2\x7e\xc1\x02\x07\
-\x80\x71\x9b\x96\xcd\x53\x5d\xdf\x1f\x9b\x3b\xf3\x4f\x67\xcf\xb5\
-\x36\x62\x0a\x40\xb3\x91\x3d\x17\x00\xb1\xa6\x55\xfd\xf3\x4e\xef\
-\x8f\xb2\x79\x69\x6b\xeb\xe0\x48\xf6\x5c\x6b\xe3\xe1\xad\x83\x7f\
-\xd2\xf9\x5f\x01\xb4\x2f\xb1\xfd\xcf\xbf\x17\x11\x91\x51\xa7\xeb\
-\xef\x1e\xff\xf7\xec\x3b\x71\xad\x3c\x76\xf2\x07\xff\xb8\xeb\x97\
-\x28\x22\x22\xb2\x6c\x26\x55\x7d\x67\xf6\x9d\xb8\x56\x8a\xed\x1f\
-\xfc\x5e\xf6\x4b\x17\x11\x11\xb1\x3c\xae\x67\x8f\x96\xa7\xff\x69\
-\xfa\x4b\x17\x11\x11\x51\x00\xfa\xb5\x59\xcd\xff\x59\xfa\x4b\x17\
-\x11\x11\x51\x00\xfa\x55\xcc\x9a\x7f\x9e\xfe\xd2\x45\x44\x44\x14\
-\x80\x7e\x3d\x32\xab\x7f\x3f\xfd\xa5\x8b\x88\x88\x28\x00\xfd\x2a\
-\x76\x9a\x0f\xa7\xbf\x74\x11\x11\x11\x05\xa0\x5f\x1b\x65\xfd\x2f\
-\xd2\x5f\xba\x88\x88\x88\x02\xd0\xaf\x49\x59\x7f\x2c\xfd\xa5\x8b\
-\x88\x88\x28\x00\xfd\x2a\xaa\xfd\x3f\x4a\x7f\xe9\x22\x22\x22\x0a\
-\x40\xbf\x36\xab\xfd\x8f\xa7\xbf\x74\x11\x11\x11\x05\xa0\x5f\xc5\
-\x4e\xfd\xc9\xf4\x97\x2e\x22\x22\xa2\x00\xf4\x6b\xb3\xdc\xff\xd7\
-\xe9\x2f\x5d\x44\x44\x44\x01\xe8\xd7\xa4\xdc\xff\x37\xe9\x2f\x5d\
-\x44\x44\x44\x01\xe8\x57\x51\xcd\xff\x38\xfd\xa5\x8b\x05\x35\xef\
-\xc0\x00\x00\x00\xcb\x49\x44\x41\x54\x88\x88\x28\x00\xfd\xda\xac\
-\xe6\x9f\x4d\x7f\xe9\x22\x22\x22\x0a\x40\xbf\x8a\x9d\xf9\xcd\xe9\
-\x2f\x5d\x44\x44\x44\x01\xe8\xd7\xa4\x6c\xfe\x5d\xfa\x4b\x17\x11\
-\x11\x51\x00\xfa\x35\x2d\x9b\x5b\xd3\x5f\xba\x88\x88\x88\x02\xd0\
-\xaf\x8d\x9d\xfd\xab\x26\x55\xf3\x57\x22\x22\x22\xa9\xd9\xae\xaf\
-\xc9\xbe\x13\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x4f\xff\x0f\
-\x79\x7d\xb5\xc4\xb6\x06\x73\x87\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x34\xa2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x0b\x9c\x24\x65\x79\xef\xf1\xc8\x55\xb9\x0a\x2a\x82\x28\x49\
-\x8c\x9a\xa8\x48\x40\xbc\x44\xe3\x35\x22\x98\x18\x62\x4c\xe4\x22\
-\x2a\xe0\x41\x8d\x31\x31\x9e\x68\x22\xe7\x24\xe7\xe3\xca\x31\x51\
-\x62\x8c\x11\x4f\xa2\xac\x9a\x43\xb2\x64\xa7\xab\xdf\xec\xb2\x9b\
-\xd9\x99\xb7\x7a\x18\x62\x67\x99\x7e\xdf\x9e\x5d\x87\xb0\xe8\xaa\
-\x44\x45\x14\x41\xee\xb7\x2c\x77\x58\x26\xcf\xdb\x33\xcb\xde\x66\
-\x66\xe7\xd2\xdd\xff\xea\xae\xdf\xf7\xf3\xf9\x7f\x00\xa3\x64\xeb\
-\x79\x9e\xae\xb7\xaa\xab\xba\xea\x67\x7e\x06\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\xc9\x8a\x91\x4d\x07\
-\x56\xf2\xc6\x6b\x9d\x0f\x1f\xa8\xfa\xf0\xe9\x6a\x1e\x2b\x99\x8f\
-\x31\xcb\xe3\x75\x59\x1e\x6e\xb4\x7f\xbe\xcb\xfe\xfe\x31\xfb\xeb\
-\x24\xe9\xbd\x4c\xf7\xee\xae\xaa\x8f\x37\xa5\x9e\xda\xdf\x37\x5b\
-\x3d\xce\xe3\x67\x52\xcf\x53\xef\xd3\x0c\xa8\xe7\x10\x00\xd0\x61\
-\x6b\xd6\xd4\x9f\x9a\xf9\x70\xa6\x2d\x00\xcb\x6d\x51\xd8\x64\x8b\
-\xfd\xa3\xea\x45\x8a\x88\x0f\x12\xd2\x0c\xa4\x59\xb0\x99\x48\xb3\
-\x91\x66\x44\x3d\xa7\x00\x80\x36\x18\xb8\xa2\xf9\xcc\x6a\x1e\xfe\
-\xc8\x76\xf6\x57\xd8\x59\xfe\x23\xea\x05\x87\x14\x3c\x53\x33\x72\
-\x85\xcb\xc3\x47\xd2\xec\xa8\xe7\x17\x00\xb0\x00\xcb\x96\x4d\xee\
-\x65\x67\x74\x27\xd9\x8e\xdc\xb1\xe8\x93\xc5\xa6\x75\x09\xc1\x87\
-\x51\xfb\xeb\x69\xce\xb9\xbd\xd5\x73\x0d\x00\x98\xc5\xf2\x89\x89\
-\x7d\x6d\x67\xfd\xbe\xe9\xeb\xbd\xf2\x05\x84\xf4\x55\x7e\xe0\x7c\
-\x3c\x2f\xcd\x98\x7a\xce\x01\x00\xd3\xa6\x17\xfe\xdf\xb3\xfc\xa8\
-\x00\x0b\x05\xe9\xe7\xf8\x70\x7d\x9a\x35\x0e\x04\x00\x40\xac\x92\
-\x37\xdf\x90\xf9\xb8\x59\xbe\x30\x90\x92\x25\xfc\x67\x96\x87\x53\
-\xd4\xf3\x0f\x00\xa5\xe3\xd6\xc5\xa3\x33\x1f\xaa\xfa\x85\x80\x94\
-\x39\x76\x10\x90\xa5\x59\x54\x7f\x1e\x00\xa0\x14\xec\xac\xff\x77\
-\x6c\xf1\xbf\x53\xbd\xf3\x27\x24\xc5\x66\xf1\x9e\x6a\x1e\xde\xa9\
-\xfe\x5c\x00\x40\xdf\x72\x2e\x3e\x25\xf3\xf1\x22\xf5\x0e\x9f\x90\
-\x99\x62\xb3\xb9\xc2\xd5\xeb\x07\xa9\x3f\x27\x00\xd0\x57\x56\x0d\
-\x8d\x3d\x37\xcb\xc3\xb7\xd5\x3b\x79\x42\xe6\x4a\x9a\xd1\x34\xab\
-\xea\xcf\x0b\x00\xf4\x05\x97\x37\x5e\x65\x67\x57\xb7\xaa\x77\xee\
-\x84\xcc\x27\x99\x0f\x77\x64\x43\xe1\x75\xea\xcf\x0d\x00\xf4\x34\
-\x57\x8b\x67\x65\x79\x7c\x48\xbd\x53\x27\x64\x21\x99\x9a\x59\xee\
-\x0b\x00\x80\x45\xc9\x6a\xe1\xbd\xb6\x13\xdd\xaa\xde\x99\x13\xb2\
-\xb8\xd8\xec\xfa\x78\x8e\xfa\x73\x04\x00\x3d\x85\xc5\x9f\xf4\x47\
-\x38\x08\x00\x80\x79\xcb\x7c\x7c\x17\x8b\x3f\xe9\x9f\xa4\x59\xe6\
-\x72\x00\x00\xcc\xc9\xf9\xe6\x6b\xb8\xe6\x4f\xfa\x2d\x59\x1e\x1e\
-\x4e\x4f\xad\x54\x7f\xbe\x00\xa0\x90\xa6\x7e\xea\x17\x6f\x53\xef\
-\xac\x09\xe9\x44\xd2\xaf\x03\x5c\x2d\x3e\x4f\xfd\x39\x03\x80\x42\
-\x59\xbb\xb6\x71\x70\x7a\xbe\xba\x7a\x27\x4d\x48\x67\x13\xbe\xb3\
-\x62\x64\xd3\x81\xea\xcf\x1b\x00\x14\x86\xed\x18\xff\x49\xbf\x73\
-\x26\xa4\x0b\xf1\xe1\xab\xea\xcf\x1b\x00\x14\x82\xf3\xe1\x1d\xf2\
-\x9d\x32\x21\x5d\x4c\xe6\xc3\x99\xea\xcf\x1d\x00\x48\x55\x6a\x1b\
-\x9f\x93\xe5\xf1\x6e\xf5\x0e\x99\x90\x2e\xe7\xae\xd5\x7e\xfc\xd9\
-\xea\xcf\x1f\x00\xc8\x54\x7d\x58\x5d\x80\x9d\x31\x21\x5d\x4f\x7a\
-\x9d\xb5\xfa\xf3\x07\x00\x12\xae\xd6\x7c\xb3\x7a\x27\x4c\x88\x32\
-\xae\x16\xdf\xa2\xfe\x1c\x02\x40\x57\x39\xb7\x79\xbf\xcc\xc7\x6b\
-\xd5\x3b\x60\x42\x94\xc9\x7c\xf8\x9e\xf7\x7e\x7f\xf5\xe7\x11\x00\
-\xba\xc6\x16\xff\x0f\xab\x77\xbe\x84\x14\x21\xce\x37\x7f\x5f\xfd\
-\x79\x04\x80\xae\x98\x3e\xfb\xff\xb1\x7a\xc7\x4b\x48\x21\xe2\xc3\
-\x0d\xe9\x33\xa1\xfe\x5c\x02\x40\xc7\xd9\x4e\xef\x83\xf2\x9d\x2e\
-\x21\x45\xca\x70\xe3\xfd\xea\xcf\x25\x00\x74\x54\xbd\x5e\xdf\xc7\
-\xce\x78\xae\x97\xef\x70\x09\x29\x50\x32\x1f\x7e\xe8\x9c\xdb\x5b\
-\xfd\xf9\x04\x80\x8e\x71\x79\xf3\xb7\xd4\x3b\x5b\x42\x8a\x18\x97\
-\x87\xb7\xaa\x3f\x9f\x00\xd0\x31\x76\xa6\xf3\xaf\xea\x1d\x2d\x21\
-\x05\xcd\x1a\xf5\xe7\x13\x00\x3a\xc2\x0d\x6d\x38\xb2\xea\xc3\x23\
-\x05\xd8\xd1\x12\x52\xb8\x64\x3e\x3e\x3a\x70\x79\xe3\x59\xea\xcf\
-\x29\x00\xb4\x9d\xcb\xe3\x9f\xaa\x77\xb2\x73\xef\x80\xc3\x3d\xf6\
-\xd7\x35\xe9\x27\x8a\x03\x43\xcd\x57\xba\xd1\xb1\x63\x06\x07\x27\
-\x0e\x50\xd7\x0d\x8b\x93\x7a\x97\x7a\xd8\xea\x65\x2d\xfe\x61\x96\
-\x87\xcb\xa6\x7b\x2c\x9f\xb5\x59\x67\xb0\x16\x3e\xa6\xae\x1b\x00\
-\xb4\x5d\xd5\xc7\x2b\xd5\x3b\xd8\x59\x16\xfe\xef\xa7\x05\xc2\xd5\
-\xeb\x07\xa9\x6b\x84\xce\x4a\xaf\xe2\xad\xe6\xe1\x0f\x52\xcf\xd5\
-\x73\x37\x4b\xd6\xab\x6b\x04\x00\x6d\x65\x0b\xec\xe1\xe9\x2b\xce\
-\x02\xec\x60\xb7\xc7\x87\x47\xb2\x3c\x5e\xc8\x6f\xb0\xcb\x67\xfa\
-\xd7\x28\xe7\x5b\xff\x1f\x92\xcf\xe1\x8e\x07\xa3\x79\x7c\xec\xb2\
-\xd1\x0d\x4f\x53\xd7\x07\x00\xda\xc6\xce\xba\xde\xa9\xde\xb9\xee\
-\xb2\xa3\xbd\x2e\x1b\x09\xc7\xaa\xeb\x02\xad\x81\x7c\xec\xc5\x36\
-\x0f\x3f\x50\xcf\xe3\xce\x09\xef\x54\xd7\x05\x00\xda\xc6\xce\xfe\
-\x57\xe8\x77\xac\x4f\xec\x60\xaf\x59\x9d\xaf\x3f\x4a\x5d\x13\x14\
-\xc3\xd4\xcd\xa9\x71\x93\x7e\x2e\xa7\x0f\x4e\xed\xb3\xa2\xae\x09\
-\x00\xb4\x4d\x7a\xdc\xa9\x7a\xc7\xda\xda\xb9\xda\x99\x7f\xba\x1c\
-\xa1\xae\x07\x8a\xa5\x75\x89\xca\x66\x43\x3d\x9f\xad\xd8\x67\x45\
-\x5d\x0f\x00\x68\x8b\x8a\x6f\xfc\x82\x7c\xa7\xda\xda\xb1\xc6\x07\
-\x6d\x27\xff\x52\x75\x3d\x50\x4c\x03\xbe\x79\x5c\x96\x87\xfb\xe5\
-\x73\x6a\x49\x9f\x19\x75\x3d\x00\x60\xc9\xec\x8c\xe6\x7f\xa8\x77\
-\xa8\x29\x2e\x6f\x7e\x54\x5d\x0b\x14\x9b\x1d\x24\xfe\xb1\x7a\x4e\
-\x5b\xb3\xea\xe3\x79\xea\x5a\x00\xc0\x92\x15\xe2\xfa\xbf\x0f\xd7\
-\xf3\xde\x75\xec\x49\xfa\x45\x48\xb5\x10\x37\x05\x86\x7f\x52\xd7\
-\x02\x00\x96\xac\x10\xd7\xff\x7d\x3c\x47\x5d\x07\xf4\x86\x6c\x38\
-\x9e\xad\x9f\x57\xee\x03\x00\xd0\xe3\x8a\x70\xfd\x3f\x5d\xd7\x4d\
-\x0f\x80\x51\xd7\x02\xbd\x21\x3d\x41\x30\xf3\x71\x8b\x7a\x6e\x57\
-\x0d\x8d\x3d\x57\x5d\x0b\x00\x58\xb4\x74\x2d\x53\xbd\x23\xb5\x03\
-\x80\x4c\x5d\x07\xf4\x16\x3b\x00\x18\x50\xcf\x6d\xba\x77\x46\x5d\
-\x07\x00\x58\xb4\x22\x5c\xff\xb7\x3f\xc3\xbb\xd4\x75\x40\x6f\xc9\
-\x7c\x38\xb3\x00\x73\xcb\xf3\x00\x00\xf4\x2e\xdb\x89\xfd\x58\xbd\
-\x23\x75\xeb\xe2\xd1\xea\x3a\xa0\xb7\xa4\x07\x45\xa9\xe7\x96\xfb\
-\x00\x00\xf4\xac\x42\x5c\xff\xf7\xe1\x7b\xea\x3a\xa0\x37\xd9\xc1\
-\xeb\xb5\xea\xf9\x75\x23\xe3\x3f\xaf\xae\x03\x00\x2c\x58\x31\xae\
-\xff\xc7\xaf\xa8\xeb\x80\xde\x64\x67\xe0\x17\xcb\xe7\xb7\x16\xde\
-\xab\xae\x03\x00\x2c\x18\xd7\xff\xd1\xcb\x8a\xf0\x02\xab\x2c\x0f\
-\xff\xa8\xae\x03\x00\x2c\x18\xd7\xff\xd1\xcb\xb8\x0f\x00\x00\x16\
-\x21\xfd\x86\x59\xbd\xf3\xe4\xfa\x3f\x96\xaa\x9a\x87\xff\x54\xcf\
-\x31\xf7\x01\x00\xe8\x29\x45\x78\xfe\x3f\xd7\xff\xb1\x54\x36\x43\
-\xcb\xd5\x73\xec\xf2\xe6\xb9\xea\x3a\x00\xc0\xbc\xa5\x67\x99\xab\
-\x77\x9c\x5c\xff\xc7\x52\xb9\x5a\x3c\x4b\x3f\xc7\xe1\x12\x75\x1d\
-\x00\x60\xde\xec\xcc\xe9\x47\xea\x1d\x27\xd7\xff\xb1\x54\x45\xb8\
-\x0f\x20\xdd\x4b\xa3\xae\x03\x00\xcc\x0b\xd7\xff\xd1\x4f\x8a\x70\
-\x1f\x40\x25\x6f\xfe\x9c\xba\x0e\x00\xb0\x47\x5c\xff\x47\x3f\xe1\
-\x3e\x00\x00\x98\x27\xae\xff\xa3\x9f\x70\x1f\x00\x00\xcc\x53\x11\
-\xae\xff\x57\x6a\x1b\x9f\xa3\xae\x03\xfa\x43\x11\xee\x03\xa8\xfa\
-\x70\xbd\xba\x0e\x00\x30\x27\xae\xff\xa3\x1f\x15\xe1\x3e\x80\x55\
-\x43\xe1\x67\xd5\x75\x00\x80\x59\x71\xfd\x1f\xfd\x28\xcd\x94\x7a\
-\xae\xab\x3e\x9e\xa3\xae\x03\x00\xcc\x8a\xeb\xff\xe8\x47\x69\xa6\
-\xd4\x73\x6d\x07\x00\xff\x5f\x5d\x07\x00\x98\x15\xd7\xff\xd1\x8f\
-\x8a\x70\x1f\x40\xe6\xc3\x0f\xd5\x75\x00\x80\x19\x71\xfd\x1f\xfd\
-\x2c\xcd\x96\x7a\xbe\xb9\x0f\x00\x40\x21\xa5\x77\x97\xab\x77\x90\
-\x5c\xff\x47\xa7\x70\x1f\x00\x50\x12\xae\x5e\x3f\xc8\x8d\x8c\x9f\
-\x98\xde\x09\x9e\xe5\xe1\x02\x4b\x66\x1f\xbe\x60\xff\x7c\x8d\xed\
-\x08\xae\xb3\xb3\x81\x3b\xed\x3f\x7b\x58\xbe\x43\x20\xbb\xec\x20\
-\x1b\xef\x56\xcf\x0e\xfa\x53\x11\x9e\x07\x40\x76\x4e\xda\x07\x4f\
-\xed\x8b\xe3\x75\xb6\x7f\xde\x94\xf6\xd1\x69\x5f\x9d\xf6\xd9\x53\
-\xfb\xee\xf8\xd2\xb4\x2f\x57\xcf\x0e\x0a\x6e\xc5\xc8\xa6\x03\x6d\
-\x58\x4e\xb2\x5c\x68\x03\x35\x61\xc3\xb3\x55\x3d\xdc\x64\xe1\x71\
-\xa3\x63\xc7\xa8\x67\x09\xfd\xa9\x08\xf7\x01\x90\xc5\x24\x6c\xb5\
-\x03\x82\x6f\xa7\x27\x3a\x5a\x4e\x73\xa3\x13\x87\xaa\x67\x09\x05\
-\x70\xa9\x1f\x3f\xa4\xf5\xb5\xb5\x8f\x5f\xcf\x7c\x7c\x54\x3f\xa8\
-\x64\x29\xb1\x03\xb7\xef\xab\x67\x0a\xfd\xad\x08\xf7\x01\x90\x25\
-\xc6\x87\x47\xec\xaf\x57\xa4\xc7\x2b\xaf\x5d\xdb\x38\x58\x3d\x53\
-\xe8\xa2\xc9\xc9\xc9\x27\x55\x7c\xe3\x64\xfb\x20\xaf\xb4\xa3\xc2\
-\x07\xe4\xc3\x48\xda\x16\xeb\xe7\xd7\xd4\xf3\x85\xfe\x56\x88\xfb\
-\x00\x48\x3b\xf7\x19\xf7\x57\xf3\xf0\xcf\xae\xd6\x7c\x73\x5a\x1b\
-\xd4\xf3\x85\x0e\x59\xb6\x6c\x72\x2f\x3b\xcb\x3f\xd5\x9a\xfe\x0d\
-\xf5\xd0\x91\x0e\x85\xeb\xff\xe8\xb0\x42\x3c\x0f\x80\x74\x24\x76\
-\x30\xf0\xcd\x6c\x38\x9e\xed\x9c\xdb\x5b\x3d\x67\x68\x93\xd4\xcc\
-\xf4\x55\x8f\x7d\x70\xaf\x55\x0f\x18\xe9\x6c\x56\xfb\xf1\x67\xab\
-\xe7\x0d\xfd\xcd\xad\x8b\x47\xab\xe7\x9c\x74\x36\xb6\x56\x7c\x37\
-\x1d\x08\xa4\x93\x46\xf5\xbc\x61\x09\xd2\x1d\xa0\x99\x0f\x1b\xd4\
-\x03\x45\xba\xf1\xa1\xe5\xfa\x3f\xba\x23\xcd\x9a\x7a\xde\x49\x57\
-\xf2\x1f\x99\x1f\xfb\x15\xf5\xbc\x61\x81\x56\x0e\x8d\x1d\x66\x47\
-\x71\x17\xd9\x01\xc0\x63\x05\x18\x22\xd2\x8d\xf8\xf0\x55\xf5\xdc\
-\xa1\x1c\xd2\xac\xc9\xe7\x9d\x74\x25\x76\xb0\xf7\xb8\xad\x25\x2b\
-\x56\x0e\x4e\x3c\x5d\x3d\x77\x98\x07\x97\x87\xb7\xda\xc2\x7f\x9b\
-\x7a\x70\x48\x97\xc3\xf5\x7f\x74\x09\xf7\x01\x94\x2f\xd6\xf3\x5b\
-\x5d\x2d\xbe\x45\x3d\x7b\x98\x45\xbd\x5e\xdf\xa7\x9a\x87\x4f\xf2\
-\xfb\xfd\x72\x86\xdf\xff\xa3\x5b\x06\x2e\x6f\x3c\x4b\x3d\xef\xa4\
-\xfb\x99\xfe\x36\xe0\xa2\xe5\x13\x13\xfb\xaa\x67\x10\x3b\x48\x2f\
-\x7f\xb1\x85\xbf\xa1\x1e\x10\x22\xfb\x60\x72\xfd\x1f\x5d\xc5\x7d\
-\x00\xe5\x4d\xba\xaf\xac\x92\x37\x7f\x4e\x3d\x83\x30\xd9\x48\x38\
-\xb6\xea\xe3\x4d\xea\xa1\x20\xc2\x70\xfd\x1f\x5d\xc6\x7d\x00\xe5\
-\x4e\x96\x87\x9b\x07\x7c\x38\x41\x3d\x87\xa5\x66\x47\x61\x6f\xb0\
-\xa3\xb1\x7b\xd4\xc3\x40\xc4\xe1\xfa\x3f\xba\x2c\xcd\x9c\x7c\xee\
-\x89\x34\x99\x8f\x5b\xd2\x03\x84\xd4\xb3\x58\x4a\x95\xbc\xf1\x36\
-\x3b\xf3\x7f\x50\x3d\x04\x44\x1f\xae\xff\xa3\xdb\xd2\x33\x27\xd4\
-\x73\x4f\xf4\xc9\xf2\xf8\x90\xfd\xf5\x74\xf5\x3c\x96\x4a\x56\x6b\
-\xfc\x2e\x3f\xf1\x23\xd3\xf9\x81\x7a\x1e\x51\x4e\xdc\x07\x40\x52\
-\xd2\x5a\xe4\x7c\x7c\xbb\x7a\x1e\x4b\x21\x7d\xed\xcf\x99\x3f\x79\
-\x22\x5c\xff\x87\x48\x7a\xf7\x84\x7c\xfe\x49\x21\x92\x5e\x4b\xcc\
-\xe5\x80\x0e\x1b\xf0\xcd\xe3\xec\x68\xeb\x6e\x75\xb3\x49\x81\xc2\
-\xf5\x7f\x88\xb8\x3c\xbc\x47\x3e\xff\xa4\x40\x09\xf7\x72\x63\x60\
-\x87\xa4\xeb\xbc\x76\xb6\x77\x8b\xbe\xc9\xa4\x48\x49\x3f\x01\x55\
-\xcf\x26\xca\x89\xfb\x00\xc8\xae\xc9\x7c\xfc\x29\xef\x24\x69\xb3\
-\xe9\x87\xfc\xf0\x3b\x7f\xb2\x53\xf8\xfd\x3f\xd4\x6c\x0e\x7f\xa0\
-\xfe\x1c\x90\xc2\xa5\xc9\xc3\x82\xda\xc8\x76\xf4\x9f\x2d\x40\x53\
-\x49\xc1\x92\xae\xc1\xaa\x67\x13\xe5\xc6\x7d\x00\x64\xa6\x64\x79\
-\xfc\x8c\x7a\x36\xfb\x42\x65\xb8\xf9\xeb\xe9\x11\x8c\xea\x86\x92\
-\xe2\x25\xf3\xf1\x54\xf5\x7c\xa2\xdc\x5c\xde\xfc\x2d\xf5\xe7\x80\
-\x14\x2f\xd3\x8f\x0d\x66\xff\xb4\x14\xae\x16\x0f\xe7\xc5\x3e\x64\
-\xa6\xa4\x9b\x41\xbd\xf7\xfb\xab\x67\x14\xe5\x96\x66\x90\x87\x91\
-\x91\x19\xe3\xc3\x2d\xe9\xcd\xb4\xea\x19\xed\x59\xb6\x93\x5f\x2e\
-\x6f\x22\x29\x6a\xfe\x5e\x3d\x9f\x40\x62\x3b\xfa\x8b\x0b\xf0\x79\
-\x20\xc5\x0c\xfb\xa9\xc5\x18\x18\x6e\xbc\x8c\x37\xfb\x91\x99\x92\
-\xe5\xe1\x01\xee\xb4\x45\x51\xa4\xb7\x03\xda\x4c\xde\xaf\xfe\x5c\
-\x90\x22\x26\x6c\x1d\x18\x6a\xbe\x52\x3d\xa3\x3d\xc5\x39\xb7\xb7\
-\x1d\x55\x5f\xa5\x6f\x1e\x29\x64\x7c\xfc\x94\x7a\x46\x81\x1d\x65\
-\x3e\xfc\xa5\xfc\x73\x41\x8a\x9a\x8d\xcb\x96\x4d\xee\xa5\x9e\xd1\
-\x9e\xe1\xf2\xe6\xb9\x05\x68\x1a\x29\x66\x9a\xce\x6d\xde\x4f\x3d\
-\xa3\xc0\x8e\xa6\xef\x05\xd8\x50\x80\xcf\x07\x29\x62\x78\x60\xd9\
-\xfc\xa4\xb3\xff\xcc\xc7\x6b\xe5\x0d\x23\xc5\x8b\x0f\xb7\xf0\xd5\
-\x3f\x8a\x2a\x3d\x94\xca\xf6\x5d\xb7\xca\x3f\x27\xa4\x70\xc9\xf2\
-\xf0\x6d\xbe\x05\x98\x07\x37\xdc\x3c\x43\xdd\x2c\x52\xc0\xf8\x78\
-\x53\x36\x12\x8e\x55\xcf\x27\x30\x97\xca\x50\xf3\x85\x76\xa0\x7a\
-\x83\xfc\xf3\x42\x0a\x97\xf4\x12\x3b\xf5\x7c\x16\xda\xe4\xe4\xe4\
-\x93\x6c\x47\xbf\x49\xdd\x28\x52\xb8\xfc\x07\x8f\xfc\x45\xaf\x48\
-\x8f\x2d\xcf\xf2\x78\x75\x01\x3e\x37\xa4\x58\xf9\x8f\xb4\xc6\xa9\
-\xe7\xb3\xb0\x2a\xbe\x71\x72\x01\x9a\x44\x0a\x92\xf4\xae\xed\x2c\
-\x0f\xff\x87\xc7\x6a\xa2\xd7\xa4\x99\x75\x3e\x7e\x22\xbd\x25\x4e\
-\xfd\x39\x22\xc5\x89\xed\xd3\x4e\x52\xcf\x66\x61\x65\x3e\xac\x54\
-\x37\x88\x14\x21\xe1\x5e\x9b\x85\xbf\x59\x35\x14\x7e\x56\x3d\x93\
-\xc0\x52\x54\xf2\xe6\xcf\xd9\x41\xc0\xe7\xd3\x4c\xeb\x3f\x57\x44\
-\x1d\x3b\x00\xb8\x54\x3d\x93\x85\x74\xa9\x1f\x3f\x84\xdf\xd2\x96\
-\x2f\xa9\xe7\xb6\xd8\xff\x30\xf3\x31\xda\x4e\xf2\x6f\xd3\xe3\x33\
-\x5d\xbd\x7e\x90\x7a\x1e\x81\x76\x4a\x33\x9d\x66\x7b\x7a\xc6\x63\
-\x6b\xe6\xd9\xdf\x95\x2f\x3e\xdc\xc7\xfe\x6d\x06\x59\x2d\xbc\x57\
-\xde\x9c\x39\x93\xce\x4a\xe3\x80\x1d\xc1\xbd\xcf\x3e\xbc\x2f\x77\
-\xfe\xca\x67\xf0\xd5\x34\x00\xe8\x4c\x5d\x6a\xb9\xf2\x19\x69\x9f\
-\x5c\x1d\x6e\xbc\xdf\xf6\xd5\x15\xdb\x47\xff\x97\x7e\xbd\x98\xeb\
-\x20\x20\x9e\xa3\xae\x5b\xe1\x58\x51\xbe\x2e\x6f\xcc\x0c\xb1\xc1\
-\xfa\x9e\xf3\xf1\xbc\xc1\xc1\x89\x03\xd4\x35\x02\x00\xcc\x6d\xc5\
-\xc8\xa6\x03\xa7\x0f\x06\x8a\xf9\xaa\x66\x1f\x46\xd5\x35\x2a\x94\
-\xb5\x6b\x1b\x07\x5b\x51\x1e\x91\x37\x66\xc7\x85\x3f\x0f\x0f\xd8\
-\x9f\xe9\x4f\x38\xcb\x07\x80\xde\x93\xf6\xdd\xb6\x0f\x3f\x3f\xdd\
-\x4c\xac\x5e\x4f\x76\x59\x5b\x1e\x4e\x07\x29\xea\xfa\x14\x46\xe6\
-\x1b\xbf\xa1\x6e\xca\x4e\x0d\xf2\xe1\xfb\x6e\x38\xbe\x44\x5d\x17\
-\x00\xc0\xd2\x54\x6a\xe1\xd5\xe9\x21\x62\xea\x75\x65\x97\x83\x80\
-\x53\xd4\x75\x29\x8c\xaa\x8f\x9f\x53\x37\x64\x7b\x63\xe2\xd5\xab\
-\x47\xc2\x11\xea\x9a\x00\x00\xda\x23\x3d\x47\xc4\xd6\x99\x6f\xa9\
-\xd7\x97\x27\xe2\xc3\x5f\xa9\x6b\x52\x18\x45\x79\xf1\x4f\x3a\xf3\
-\x67\xf1\x07\x80\xfe\x33\x75\x10\x50\x98\x6f\x02\xbe\xa1\xae\x47\
-\x21\xa4\x9f\x44\x14\xe1\xb5\xbf\xe9\x9a\x3f\x5f\xfb\x03\x40\xff\
-\x4a\x97\x03\x8a\x70\x4f\x80\xfd\x19\x1e\xe3\x3e\x00\xe3\x46\xc6\
-\x4f\x54\x37\xa3\x15\x1f\xfe\x44\x5d\x0b\x00\x40\x67\x65\x3e\x2e\
-\x93\xaf\x37\x96\x01\x1f\x4e\x50\xd7\x42\xce\xd5\xe2\x59\xea\x46\
-\xa4\x9f\xfa\x71\xb7\x3f\x00\xf4\xbf\xd6\xb7\xce\x05\xb8\x14\x60\
-\xeb\xce\x99\xea\x5a\xc8\x65\x79\xb8\x40\xdd\x88\xf4\x3b\x7f\x75\
-\x1d\x00\x00\xdd\x61\x8b\xef\x87\xd4\xeb\x4e\xfa\x26\x42\x5d\x07\
-\x39\x6b\x44\x55\xdb\x88\x70\x2f\x0f\xf9\x01\x80\xf2\x48\xd7\xdf\
-\x6d\x01\xde\x22\x3e\x00\x18\x50\xd7\x41\xce\x16\xe0\x06\x4d\x00\
-\x00\x74\x93\xfa\xe4\x33\xcb\xc3\x98\xba\x06\x72\x56\x84\x6f\x6a\
-\x9b\x10\xdf\xa7\xae\x01\x00\xa0\xbb\x6c\xdf\xff\x7b\xca\xb5\xa7\
-\xea\xe3\x26\x75\x0d\xe4\xaa\x3e\x5c\xaf\xfd\x06\x20\xbc\x5c\x5d\
-\x03\x00\x40\x77\xb9\xbc\xf1\x2a\xf1\xc9\xe7\x75\xea\x1a\xc8\xd9\
-\x02\x7c\x87\xb2\x09\x2b\x07\x27\x9e\xae\xae\x01\x00\xa0\xbb\xd2\
-\x43\xdf\xa4\xdf\x00\xe4\xe1\x76\x75\x0d\xe4\xd2\x8b\x11\x94\x4d\
-\x70\x6e\xf3\x7e\xea\x1a\x00\x00\xba\xcb\x7b\xbf\xbf\xf8\x1b\x80\
-\x87\xd4\x35\x90\xd3\x1e\x81\xc5\x49\xf5\xf6\x03\x00\x34\x58\x7f\
-\xc4\x68\x00\x00\x40\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\
-\x68\x00\x00\x40\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\
-\x00\x00\x40\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\x00\
-\x00\x40\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\x00\x00\
-\x40\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\x00\x00\x40\
-\x81\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\x00\x00\x40\x81\
-\xf5\x47\x8c\x06\x00\x00\x14\x58\x7f\xc4\x68\x00\x00\x40\x81\xf5\
-\x47\x8c\x06\x00\x4b\xb7\x62\x64\xd3\x81\x03\xf9\xd8\x8b\x2b\xb5\
-\xf0\x9b\x99\x8f\x1f\xce\xf2\x78\xa1\xe5\x1f\x6c\xc6\xd7\x54\x7d\
-\xbc\x32\xcb\xc3\xb7\x33\x1f\x7e\x68\xff\x7c\x57\x2b\x3e\xdc\xb7\
-\xed\x33\x60\xff\xfd\x2d\xe9\x3f\xb3\xff\xfb\x9d\xf6\xbf\xb9\xce\
-\xfe\x79\xb3\xfd\xf3\x7a\xfb\xef\xac\xb6\x7f\x5e\x6e\xff\xf9\x5f\
-\x3a\xdf\xfc\x7d\x57\x8b\x6f\x59\x55\x0b\xbf\x74\x49\xbd\xfe\x64\
-\xf5\xf6\x62\x61\x2e\xf5\xe3\x87\x54\xf3\xf0\x4e\xeb\xe9\x57\xad\
-\xb7\x1b\xad\xaf\xb7\xd9\xdf\x3f\xb2\xe4\x7d\xa8\xfd\x3b\x5a\xff\
-\xae\xa9\x7f\xe7\x57\x6c\x56\xce\x5c\xbb\xb6\x71\xb0\x7a\x7b\xe7\
-\x8b\xf5\x47\x8c\x06\x00\xf3\xe7\x5c\x7c\xca\xc0\x70\xe3\x65\xce\
-\xc7\xf3\x6c\xa1\xfe\x82\x2d\xee\x5f\x9f\xde\x01\x77\xf5\x73\x63\
-\x07\x14\x37\xda\x5f\x47\x6c\x87\xff\x59\x97\x87\xf7\xb8\xa1\xc6\
-\xf1\xce\x6d\xde\x4f\x5d\x1f\xec\xac\x32\xbc\xe1\x05\xe9\x40\xd0\
-\xfa\x75\x7f\x17\x67\xe3\x7e\xcb\xd7\x56\x5d\xde\x7c\xbe\x7a\xfb\
-\xf7\x84\xf5\x47\x8c\x06\x00\xb3\x1b\xb8\xbc\xf1\x2c\xdb\x81\x9f\
-\x66\x67\x6f\x7f\x6b\x8b\xed\x86\xb6\x9c\xb5\x75\x2a\x3e\x3e\x68\
-\x3b\xfe\xb1\xd6\xb7\x0f\x3e\x9e\xba\x72\x70\xe2\xe9\xea\xfa\x95\
-\x55\x3a\x50\xb4\x7e\x7c\xce\xfa\xf0\xa8\x6e\x1e\xc2\x23\xe9\x00\
-\xb1\xc8\xdf\x18\xa9\x3f\x33\xea\xed\x97\xa3\x01\xc0\x76\x69\x67\
-\x69\x8b\xe8\x29\x53\x0b\x7e\xbc\x56\xfd\xf9\x58\x4a\x6c\xe7\xff\
-\xb8\x1d\x0c\x5c\x6d\xf9\x4c\x36\x14\x5e\x57\xaf\xd7\xf7\x51\xd7\
-\xb7\x0c\xd2\x99\xb7\x2d\xfe\xdf\x52\xf7\x7f\x87\x34\x57\xe7\xeb\
-\x8f\x52\xd7\x65\x26\xea\xda\xa8\xb7\x5f\x8e\x06\xa0\xec\xd6\xac\
-\xa9\x3f\xd5\xe5\xcd\x73\x6d\xc1\x1f\xea\xe6\x57\xb5\xdd\x8e\x1d\
-\x10\xdc\x63\x7f\x75\xe9\x1b\x8d\xc1\xc1\x89\x03\xd4\x75\xef\x47\
-\x03\x3e\x9c\xa0\xb8\x24\xb4\xc7\xde\xe7\xe1\x27\x03\xbe\x79\x9c\
-\xba\x3e\xbb\x52\xd7\x45\xbd\xfd\x72\x34\x00\x65\xe4\xea\xf5\x83\
-\x6c\xc1\x7f\x97\x9d\xe9\x0f\xda\x0e\xfb\x21\xf5\xe7\xa0\xeb\x99\
-\xba\x09\xb1\x92\x0d\x87\xdf\xf6\xde\xef\xaf\xee\x47\x3f\x48\x67\
-\xfe\x45\x5c\xfc\xb7\x25\x1d\x04\xb8\xa1\x0d\x47\xaa\xeb\xb4\x23\
-\x75\x4d\xd4\xdb\x2f\x47\x03\x50\x26\xe9\x4e\xfd\xa9\x6b\xe4\xe1\
-\x4e\xf5\xec\x17\x25\x56\x8f\xbb\xd3\xaf\x0d\x8a\x78\x86\xd8\x2b\
-\xd2\xa5\xa3\xaa\x8f\x9b\xd4\xbd\xdc\x63\xaf\x7d\x98\x48\xf7\x27\
-\xa8\xeb\xb5\x8d\xba\x1e\xea\xed\x97\xa3\x01\xe8\x77\x69\x87\xe7\
-\x7c\xf8\x80\x9d\xf5\x5e\xa5\x9e\xf7\xa2\x27\xdd\x44\xe8\x6a\xf1\
-\xac\xe5\x13\x13\xfb\xaa\xfb\xd6\x4b\xd2\x0d\x7f\xea\xde\x2d\xa0\
-\xc7\x17\xa8\xeb\xb5\x8d\xba\x16\xea\xed\x97\xa3\x01\xe8\x57\xab\
-\x47\xc2\x11\xd5\x3c\x7c\xb2\xc8\x5f\xcb\x16\x36\x3e\xdc\x60\xf9\
-\x13\x37\x3a\x71\xa8\xba\x8f\x45\xd7\xfa\xa9\x9f\xf2\x6e\xff\x05\
-\x26\x3d\x77\xa2\x28\x97\x02\xd4\xb5\x50\x6f\xbf\x1c\x0d\x40\xbf\
-\x59\x35\x14\x7e\xd6\x16\xaf\x8b\xd3\xcf\xe2\xd4\xf3\xdd\xfb\x09\
-\xf7\xa6\xb3\xdb\x74\x30\xa5\xee\x6b\x51\x4d\x3f\xf0\xa9\x00\xbd\
-\x9a\x7f\xb2\x3c\x7c\x49\x5d\xb7\x44\x5d\x07\xf5\xf6\xcb\xd1\x00\
-\xf4\x8b\xb4\x48\xa5\xeb\xfb\x2c\xfc\x1d\x88\x0f\xf7\xd9\x99\xe3\
-\x45\x03\x57\x34\x9f\xa9\xee\x73\x91\xa4\x27\xfc\xf5\xe4\x2f\x47\
-\xac\x9f\x45\x78\x62\xa0\xba\x0e\xea\xed\x97\xa3\x01\xe8\x75\xae\
-\x16\x0f\xb7\x9d\xf0\xe7\x59\xf8\xbb\x91\x70\x6f\xba\x86\x9c\x7e\
-\x45\xa1\xee\x7b\x11\xb4\x1e\xef\x2b\xef\xc9\xe2\xe2\x86\x9b\x67\
-\xe8\xeb\xa7\xad\x81\x7a\xfb\xe5\x68\x00\x7a\x55\x7a\xb0\x8d\x2d\
-\xfe\x7f\xc8\x1d\xfd\x82\xf8\x78\x93\xe5\x9c\xc9\xc9\xc9\x27\xa9\
-\xe7\x40\x69\xfa\xd9\xfe\xfa\x7e\x2c\x22\xe9\x97\x1f\xf2\xfa\x89\
-\x6b\xa0\xde\x7e\x39\x1a\x80\x5e\x54\xf1\x8d\x93\xd3\x0b\x76\xd4\
-\xf3\x4b\xe2\x46\x97\x37\x5e\xa5\x9e\x07\x95\xb4\xfd\x05\xe8\xc1\
-\x22\x13\xc6\x0b\x50\x3f\x69\x0d\xd4\xdb\x2f\x47\x03\xd0\x4b\xa6\
-\xee\xec\x8f\x15\xf5\xdc\x92\xed\x49\x8f\x1c\x4e\x37\x5d\x96\xf1\
-\x17\x03\xb6\x88\xde\xae\xae\xff\xe2\xfb\x16\x6f\xd5\xd7\x4f\x5b\
-\x03\xf5\xf6\xcb\xd1\x00\xf4\x8a\xe9\x97\xf2\xf4\xec\x0e\xb7\xdf\
-\x93\xe5\xe1\xe6\xac\xd6\xf8\x5d\xf5\x9c\x74\x93\x6d\xf3\xc3\xea\
-\xba\x2f\xbe\x5f\xf1\x21\x75\xfd\xd4\x35\x50\x6f\xbf\x1c\x0d\x40\
-\xd1\xb9\x75\xf1\xe8\xaa\x8f\x35\xf5\xac\x92\xf9\x25\xf3\xa1\x7a\
-\xd9\xe8\x86\xa7\xa9\xe7\xa6\x1b\x38\x00\x58\x1a\x75\x0d\xd4\xdb\
-\x2f\x47\x03\x50\x64\x95\xbc\xf9\x3b\xb6\xa0\xdc\xa1\x9e\x53\xb2\
-\xb0\xd8\xc2\x78\x63\xc5\x87\x37\xa9\xe7\xa7\xd3\x7a\xf9\x1b\x29\
-\x2e\x01\xb0\xfe\xd0\x00\x14\x52\x7a\x7c\x6f\xfa\xdd\xb9\x7a\x3e\
-\xc9\xe2\xd3\x7a\x1d\xb1\xf5\xb0\x9f\x5f\x36\x54\xed\xe9\x9b\x00\
-\x63\xb3\x00\xf5\x93\xd6\x40\xbd\xfd\x72\x34\x00\x45\x53\x19\x6a\
-\xbe\xd0\x16\x8e\xef\xaa\x67\x93\xb4\x2d\x1b\xdd\xe8\xd8\x31\xea\
-\xb9\xea\x84\x2c\x8f\x5f\x29\x40\x7d\x17\x17\x1f\x2e\x56\xd7\x4f\
-\x5d\x03\xf5\xf6\xcb\xd1\x00\x14\x49\xba\x89\xcc\x76\xaa\xff\xa5\
-\x9e\x4b\xd2\xee\x84\xdb\xfb\xf1\x92\x40\xe6\xc3\x99\xfa\xda\x2e\
-\x2e\xe9\xa6\x5a\x75\xfd\xd4\x35\x50\x6f\xbf\x1c\x0d\x40\x11\x38\
-\xe7\xf6\x9e\x7e\x4d\xef\xe3\xea\x99\x24\x9d\x89\xf5\xf7\x31\x3b\
-\xeb\x3c\xbf\x9f\x1e\x1e\x94\x1e\xa7\xdb\xab\x8f\x02\x2e\xc2\xd3\
-\x1c\xd5\x75\x50\x6f\xbf\x1c\x0d\x80\x5a\xda\x11\x55\x7d\x5c\xa7\
-\x9e\x45\xd2\x9d\xd8\x81\xc0\xa5\xce\x6d\xde\x4f\x3d\x77\xed\x62\
-\x07\x00\x5f\x53\xd7\x74\x11\x3d\xf8\x8a\xba\x6e\x89\xba\x0e\xea\
-\xed\x97\xa3\x01\x50\x5a\x9d\xaf\x3f\xca\xce\x46\xae\x52\xcf\x21\
-\xe9\x72\x7c\xa8\xaf\x1c\x1a\x3b\x4c\x3d\x7f\xed\xb0\xea\xf2\xe6\
-\xf3\x6d\x7b\x1e\x91\xd7\x74\x9e\x49\x3f\x5d\x5c\x35\x34\xf6\x5c\
-\x75\xdd\x12\x75\x2d\xd4\xdb\x2f\x47\x03\xa0\x92\x8d\x84\x63\x33\
-\x1f\x7f\xac\x9e\x41\xa2\x4a\xf8\x8e\x1b\x19\xff\x79\xf5\x1c\xb6\
-\x43\xe6\xc3\x67\xf5\xf5\x9c\x5f\xec\xec\xff\x33\xea\x7a\x6d\xa3\
-\xae\x85\x7a\xfb\xe5\x68\x00\x14\x06\x86\x1b\x2f\xe3\xf7\xfd\xc4\
-\xce\x9c\x6f\x71\xc3\xf1\x25\xea\x79\x5c\xaa\x4b\xea\xf5\x27\xdb\
-\xf6\x34\xe5\xf5\xdc\x43\xec\x80\x3b\x16\xe9\x67\x99\xea\x7a\xa8\
-\xb7\x5f\x8e\x06\xa0\xdb\xb2\xa1\xf0\xba\xf4\x5a\x59\xf5\xec\x91\
-\xc2\xe4\xae\x81\xa1\xe6\x2b\xd5\x73\xb9\x54\x6e\x68\xc3\x91\x76\
-\x40\x73\x43\x01\xea\x39\x73\x7c\xbc\x29\x3d\x55\x53\x5d\xa7\x1d\
-\xa9\x6b\xa2\xde\x7e\x39\x1a\x80\x6e\x72\xb5\xf8\x96\x2c\x0f\x0f\
-\xa8\xe7\x8e\x14\x2b\x59\x1e\xef\xae\xd4\xc2\xab\xd5\xf3\xb9\x54\
-\x03\xbe\x79\x9c\xcd\xf7\x4f\xd4\xf5\xdc\x2d\x76\x60\x52\xc4\x6f\
-\x5a\xd4\x75\x51\x6f\xbf\x1c\x0d\x40\xb7\x4c\x2d\xfe\xf1\x21\xf5\
-\xcc\x91\x62\x26\xf3\x71\x4b\x3f\x1c\x04\xb4\xbe\x09\x28\xd0\xe5\
-\x80\xf4\xb5\x7f\xfa\x33\xa9\xeb\x32\x13\x75\x6d\xd4\xdb\x2f\x47\
-\x03\xd0\x0d\xce\xc7\xd7\x73\xe6\x4f\xf6\x94\xcc\x87\x7b\xec\x20\
-\xf1\xa5\xea\x79\x5d\xaa\x74\x9d\xdd\xe6\xfd\x82\xf4\x7b\x7b\x59\
-\x2d\xd3\x8b\x8a\x7c\xf8\x74\x91\xae\xf9\xef\x4a\x3d\x6f\xea\xed\
-\x97\xa3\x01\xe8\xb4\x74\x7d\x97\xa7\xfb\x91\xf9\x27\xdc\x3e\x90\
-\x8f\xbd\x58\x3d\xb7\xed\x90\xce\xbc\x6d\x21\xfe\x52\x57\x0f\x04\
-\xec\xff\x97\x7d\xde\x96\x17\xe5\xa7\x7e\x73\x51\xcf\x9a\x7a\xfb\
-\xe5\x68\x00\x3a\x29\xfd\xd4\xcf\xfa\x7c\x97\x7a\xce\x48\x6f\x25\
-\xf3\xf1\xa7\xfd\xf2\x13\xc1\x24\x3d\xec\xca\x0d\x37\xcf\x48\xcf\
-\xdf\xb7\x03\x9c\xf1\xf4\x26\xbe\x76\xbc\x4a\x38\xfd\x3b\xd2\xbf\
-\x6b\xea\xdf\x19\xbe\x6c\xff\xd9\xe9\x45\x78\xc2\xdf\x7c\xa9\xe7\
-\x4c\xbd\xfd\x72\x34\x00\x9d\x92\x1e\xf2\x53\xb6\xdf\xf9\xb7\xde\
-\x80\x97\xc7\xeb\xa6\x9e\x6c\x18\xbe\xe8\xf2\xe6\x47\x9d\x0f\xef\
-\x68\x5d\x02\xb1\x83\xa1\x54\x93\xf4\x00\x9c\x15\x23\x9b\x0e\xdc\
-\x56\xa7\xf4\xf7\xe9\x3f\x6b\xd5\xcb\xfe\x3b\x53\x97\x4b\xe2\x69\
-\xe9\x7f\x9b\xfe\x1d\x56\xc3\xa1\xf4\xef\x2c\xdf\x63\x92\xc3\x77\
-\xfa\xe5\x61\x41\x98\x99\x7a\xc6\xd4\xdb\x2f\x47\x03\xd0\x09\x53\
-\x8f\xf7\xed\xff\x27\xfc\xa5\xf7\xde\xdb\xc2\x5c\xb5\xc5\xea\x8f\
-\x5c\xde\x78\x55\x7a\x36\x7c\xa7\x6a\x9a\xfe\xdd\xe9\x26\x39\x97\
-\x87\x8f\xd8\xff\x6f\x97\x7e\xd6\xa5\xde\xfe\x8e\xc7\x87\x7a\x3f\
-\x3d\x36\x18\x3b\x53\xcf\x97\x7a\xfb\xe5\x68\x00\xda\x2d\xbd\xd8\
-\xa7\x6f\x9f\xed\xef\xe3\x83\xb6\xe0\xe7\x69\x11\xae\x0c\x6f\x78\
-\x81\xbc\xd6\x79\xe3\x17\x33\x1f\xff\xa7\xfd\xb9\x6a\xfd\xfa\x0b\
-\x0b\xdb\xbe\x15\xfd\xf4\x02\x21\x6c\xa7\x9e\x2d\xf5\xf6\xcb\xd1\
-\x00\xb4\x5b\x7a\xab\x9f\x7a\xae\xda\xba\x00\xb5\xee\xa6\x8e\xeb\
-\x6c\xd1\x7f\xcf\xa5\x7e\xfc\x10\x75\x7d\x67\xe3\x46\x27\x0e\xcd\
-\x86\xe3\xd9\xe9\x92\x41\x2f\x3d\x9b\x7e\x7e\x3d\x88\x1f\x57\xd7\
-\x17\xed\xa7\x9e\x2b\xf5\xf6\xcb\xd1\x00\xb4\x53\x25\x6f\xbc\xad\
-\x5f\xae\x55\xdb\x76\x7c\x2f\xbd\xbe\x76\xe0\x8a\xe6\x33\xd5\x75\
-\x5d\xa8\xf4\x67\x4e\xdf\x52\xd8\xc1\xc0\x66\x75\x1d\xdb\x93\xb0\
-\xd5\x0e\xc4\x4e\x51\xd7\x15\xed\xa5\x9e\x2b\xf5\xf6\xcb\xd1\x00\
-\xb4\x4b\xfa\x3a\xba\x3f\x1e\xf1\x1b\x1a\xb6\x70\x9e\xda\x2f\x5f\
-\x3b\x3b\xdf\x7c\x4d\xfa\x06\xa3\xd7\x0f\xcc\xec\xcf\x7f\x67\x3f\
-\xfd\x32\x00\xac\x3f\x72\x34\x00\xed\x90\x6e\xfa\xb3\x45\xf3\xbb\
-\xea\x79\x5a\xc2\xe2\xf2\xb8\x9d\x61\x5e\xe6\x86\x1a\xc7\xab\x6b\
-\xd9\x29\xe9\x01\x3b\x76\x20\xb0\xb6\xc7\x0f\x04\x36\x72\x53\x60\
-\xff\x50\xcf\x93\x7a\xfb\xe5\x68\x00\xda\xc1\x16\xcf\xaf\xa9\x67\
-\x69\xf1\x09\xde\xce\x2c\x4f\x54\xd7\xb0\x5b\xd2\x9b\x18\xd3\x4d\
-\x83\xfa\xba\x2f\x32\x3e\xfc\x95\xba\x86\x68\x0f\xf5\x2c\xa9\xb7\
-\x5f\x8e\x06\x60\xa9\x9c\x8f\x6f\x57\xcf\xd1\x62\x92\xf9\x78\xad\
-\xcb\xc3\x5b\xd5\xf5\x53\xc9\xf2\x78\x92\x1d\x08\x7c\x4b\xdd\x87\
-\x85\x27\x6c\x75\xc3\xe1\xd7\xd4\xf5\xc3\xd2\xa9\x67\x49\xbd\xfd\
-\x72\x34\x00\x4b\x91\x5e\x2f\x9a\xf9\x70\x87\x7a\x8e\x16\x92\x2c\
-\x0f\xf7\xa7\x87\xec\xd4\xeb\xf5\x7d\xd4\xf5\x53\x5b\x3e\x31\xb1\
-\x6f\xba\xc3\xbe\xd7\xde\xd3\x90\xde\xb8\xe7\x6a\xf1\x70\x75\xfd\
-\xb0\x34\xea\x39\x52\x6f\xbf\x1c\x0d\xc0\x52\xf4\xdc\x57\xc9\x3e\
-\x8c\xf6\xc2\x33\xd2\xbb\xcd\x16\xd3\xe7\xd9\x81\xc0\xbf\xc9\xfb\
-\xb3\xb0\x54\xd4\x75\xc3\xd2\xa8\x67\x48\xbd\xfd\x72\x34\x00\x8b\
-\x65\x8b\xff\x39\xea\xf9\x99\x77\x7c\x7c\x30\xfd\xa4\x6f\xd9\xb2\
-\xc9\xbd\xd4\x75\x2b\xaa\xf4\xab\x07\xe7\xc3\x07\xd2\x37\x24\xf2\
-\x7e\xcd\x33\xe9\x67\xa7\xea\xba\x61\xf1\xd4\xf3\xa3\xde\x7e\x39\
-\x1a\x80\xc5\x58\x3d\x12\x8e\xe8\x9d\xaf\xfe\xc3\x35\xfd\xf2\x76\
-\xb9\x6e\x70\xc3\xf1\x25\xbd\xf2\xfc\x80\x74\x29\xa0\xc8\x0f\x67\
-\xc2\xdc\xd4\xf3\xa3\xde\x7e\x39\x1a\x80\xc5\xb0\xde\x55\xd4\xb3\
-\x33\xaf\x05\xc2\xc7\x81\x1d\x5f\xbc\x83\xf9\x71\x2e\x3e\xc5\x16\
-\xd7\x7f\x54\xf7\x6f\x9e\x3d\xfe\x3b\x75\xbd\xb0\x38\xea\xd9\x51\
-\x6f\xbf\x1c\x0d\xc0\x42\x55\x7c\xe3\x64\xf5\xdc\xec\x71\x51\xc8\
-\xe3\x63\xe9\x19\xf9\xea\x5a\xf5\xba\xac\x16\x3e\x96\xee\xba\x57\
-\xf7\x73\xee\x84\xad\x03\x43\xcd\x57\xaa\x6b\x85\x85\x53\xcf\x8e\
-\x7a\xfb\xe5\x68\x00\x16\x22\xdd\x39\x5f\xf4\x9f\x8e\x4d\xbf\x67\
-\xfd\x74\x75\xad\xfa\x45\xeb\x67\x9e\xe9\x1e\x8a\x02\xf4\x76\x8e\
-\x34\xfb\xe5\xc9\x8d\x65\xa2\x9e\x1b\xf5\xf6\xcb\xd1\x00\x2c\x44\
-\x7a\xed\xad\x7a\x66\xe6\x8a\x9d\xf5\x6f\x49\xdf\x50\xa8\xeb\xd4\
-\x6f\xb2\x5a\xe3\x8d\x85\x7f\xcc\xb3\x6f\xbc\x5b\x5d\x27\x2c\x8c\
-\x7a\x66\xd4\xdb\x2f\x47\x03\x30\x5f\x2b\x87\xc6\x0e\x2b\xf4\x8d\
-\x7f\x3e\xdc\x92\x1e\x77\xab\xae\x53\xbf\x4a\x4f\x4b\xb4\x03\xac\
-\x5b\xe5\x7d\x9e\x25\x59\x1e\x6e\xe4\x7e\x8f\xde\xa2\x9e\x19\xf5\
-\xf6\xcb\xd1\x00\xcc\x97\xed\x60\x3f\xaf\x9e\x97\x59\xe3\xc3\xf5\
-\xe9\xb7\xec\xea\x1a\xf5\xbb\x55\x97\x37\x9f\x9f\x6a\x2d\xef\xf7\
-\x2c\x71\x3e\x7e\x42\x5d\x23\xcc\x9f\x7a\x5e\xd4\xdb\x2f\x47\x03\
-\x30\x1f\xab\xf3\xf5\x47\x15\xf5\x69\x71\x76\xd6\x7f\x5b\x7a\x13\
-\xa1\xba\x46\x65\x51\xf1\x8d\x5f\xb0\x59\xb8\x59\xdd\xf7\x19\x67\
-\xc1\x87\x7b\x78\x42\x60\xef\x50\xcf\x8b\x7a\xfb\xe5\x68\x00\xe6\
-\xc3\x7a\xf5\xf7\xea\x59\x99\x39\xe1\x5e\xbe\xf6\xef\xbe\x01\xdf\
-\x3c\xce\xea\x7e\xb7\xbe\xff\xbb\xc7\x0e\x4e\xfe\x42\x5d\x1f\xcc\
-\x8f\x7a\x56\xd4\xdb\x2f\x47\x03\xb0\x27\x6e\x74\xec\x18\xdb\xd9\
-\x3f\xa4\x9e\x95\x19\x76\xf4\x0f\xbb\x5a\xf3\xcd\xea\xfa\x94\x55\
-\xba\x31\xb0\x90\x73\xe1\xe3\x96\xf4\xa0\x2a\x75\x7d\xb0\x67\xea\
-\x59\x51\x6f\xbf\x1c\x0d\xc0\x9e\x54\x7d\xb8\x58\x3d\x27\xbb\xed\
-\xe4\xf3\xf8\x98\xf3\xe1\x1d\xea\xda\x94\x9d\x1b\x6e\x9e\x51\xc8\
-\xe7\x04\xf0\xca\xe0\x9e\xa0\x9e\x13\xf5\xf6\xcb\xd1\x00\xcc\xa5\
-\xf5\xc8\xdf\x02\x5e\xfb\xe7\x21\x3f\xc5\x91\xde\x26\xa8\x9e\x87\
-\xdd\xe7\x23\xdc\xc3\x23\x82\x8b\x4f\x3d\x27\xea\xed\x97\xa3\x01\
-\x98\x8b\x2d\xfe\x17\xa8\x67\x64\x86\x9d\xfb\x4a\x75\x5d\xb0\x5d\
-\x7a\x00\x4f\xd5\xc7\xb5\xea\xb9\xd8\x35\xe9\x95\xcf\xea\xda\x60\
-\x6e\xea\x19\x51\x6f\xbf\x1c\x0d\xc0\x6c\xa6\x9e\x07\x1f\x6f\x53\
-\xcf\xc8\xce\x09\xd7\x0c\x0e\x4e\x1c\xa0\xae\x0d\x76\x76\xd9\xe8\
-\x86\xa7\x55\x7d\xb8\x41\x3f\x1f\xdb\x93\xf9\xf8\xe3\xe5\x13\x13\
-\xfb\xaa\x6b\x83\xd9\xa9\x67\x44\xbd\xfd\x72\x34\x00\xb3\x49\xaf\
-\x86\x55\xcf\xc7\x4e\x3b\xf4\x3c\x3c\xc0\x5b\xfd\x8a\xab\x52\x0b\
-\xaf\xb6\x83\x80\x47\xd4\x73\xb2\x63\x5c\x2d\x9e\xa5\xae\x0b\x66\
-\xa7\x9e\x0f\xf5\xf6\xcb\xd1\x00\xcc\xc6\x76\xe6\x57\xa9\xe7\x63\
-\x97\x9d\xf9\x1f\xaa\x6b\x82\xb9\xd9\xcc\x9c\xaf\x9e\x93\x5d\xb2\
-\x5e\x5d\x13\xcc\x4e\x3d\x1f\xea\xed\x97\xa3\x01\x98\x49\x7a\xec\
-\xab\x7a\x36\x76\x8a\x0f\xa3\xbc\xec\xa5\xf8\x52\x8f\xb2\x3c\xfc\
-\xbb\x7c\x5e\xa6\x93\xf9\xf0\xf8\xaa\x5a\xf8\x25\x75\x5d\x30\x33\
-\xf5\x7c\xa8\xb7\x5f\x8e\x06\x60\x26\x59\x1e\x97\xab\x67\xe3\x89\
-\x9d\x78\x1e\xee\x4f\x4f\x9f\x53\xd7\x04\xf3\xe3\xfc\xf8\x8b\x8a\
-\x74\x29\xc0\x66\xf9\xaf\xd5\x35\xc1\xcc\xd4\xb3\xa1\xde\x7e\x39\
-\x1a\x80\x5d\xb9\x7a\xfd\xa0\x22\xbd\xf9\x8d\xbb\xb9\x7b\x8f\x9d\
-\x79\x7f\x56\x3d\x37\xdb\xd2\x7a\x54\xb4\xdb\xbc\x9f\xba\x26\xd8\
-\x9d\x7a\x36\xd4\xdb\x2f\x47\x03\xb0\xab\xf4\x5a\x55\xf5\x5c\x6c\
-\x4f\xf8\x0e\x77\x72\xf7\x9e\xf4\x4b\x0d\x5b\x78\x7f\xa4\x9f\x9f\
-\xa9\x54\xf2\xc6\xdb\xd4\x35\xc1\xee\xd4\x73\xa1\xde\x7e\x39\x1a\
-\x80\x5d\x55\x7d\x5c\xa7\x9e\x8b\x6d\x71\xb5\xf8\x16\x75\x3d\xb0\
-\x38\xe9\x49\x8d\xea\xf9\xd9\x96\xcc\xc7\x01\x75\x3d\xb0\x3b\xf5\
-\x5c\xa8\xb7\x5f\x8e\x06\x60\x47\x6b\xd6\xd4\x9f\x5a\x9c\xe7\xbb\
-\x07\xaf\xae\x07\x96\xc6\xfa\x78\x85\x7e\x8e\xa6\xde\x0f\x90\x9e\
-\x6b\xa1\xae\x07\x76\xa6\x9e\x0b\xf5\xf6\xcb\xd1\x00\xec\x28\xab\
-\x85\xf7\xaa\x67\x62\x6a\x87\x1d\x1e\xb7\xbc\x5c\x5d\x0f\x2c\x4d\
-\xeb\xd9\x00\x05\x98\xa7\xd6\x4c\xd5\x1a\xbf\xab\xae\x07\x76\xa6\
-\x9e\x09\xf5\xf6\xcb\xd1\x00\xec\xc8\xce\x94\x86\xd4\x33\xd1\xda\
-\x59\xe7\xe1\x32\x75\x2d\xd0\x1e\xd6\xcf\xf5\xea\x79\x9a\x9e\xa9\
-\x4c\x5d\x0b\xec\x4c\x3d\x13\xea\xed\x97\xa3\x01\xd8\xe6\x92\x7a\
-\xfd\xc9\xe9\x27\x77\xea\x99\x48\x71\x43\x8d\xe3\xd5\xf5\x40\x7b\
-\x54\x7c\xe3\x64\xf5\x3c\x4d\xe7\xae\x7a\xbd\xbe\x8f\xba\x1e\xd8\
-\x4e\x3d\x13\xea\xed\x97\xa3\x01\xd8\xc6\x16\xff\x53\xd4\xf3\xd0\
-\x8a\x0f\xa3\xea\x5a\xa0\xbd\xac\xaf\x1b\xe5\x73\x65\xc9\x86\xe3\
-\xaf\xaa\x6b\x81\xed\xd4\xf3\xa0\xde\x7e\x39\x1a\x80\x6d\x32\x1f\
-\xbf\xa0\x9e\x87\x14\xee\xfc\xef\x3f\xd9\x70\xf8\x6d\xf5\x5c\xb5\
-\xe2\xe3\xa7\xd4\xb5\xc0\x76\xea\x79\x50\x6f\xbf\x1c\x0d\xc0\x36\
-\x76\x00\x70\xad\x7a\x1e\x32\x1f\xbe\xc7\x23\x7f\xfb\x4f\xeb\x95\
-\xc1\x79\xfc\x41\x01\xe6\x6b\x42\x5d\x0b\x6c\xa7\x9e\x07\xf5\xf6\
-\xcb\xd1\x00\x24\x03\x97\x37\x9e\xa5\x9e\x85\xd6\x0e\x3a\x8f\x1f\
-\x57\xd7\x02\x9d\x61\xfd\xfd\x33\xf9\x7c\xf9\xf0\xb8\xab\xc5\xc3\
-\xd5\xb5\xc0\x14\xf5\x3c\xa8\xb7\x5f\x8e\x06\x20\xb1\x5e\x9c\xae\
-\x9e\x85\xf4\xfc\x78\x37\xb4\xe1\x48\x75\x2d\xd0\x19\xa9\xb7\x45\
-\x78\x47\x80\xcb\xc3\x5b\xd5\xb5\xc0\x14\xf5\x2c\xa8\xb7\x5f\x8e\
-\x06\x20\x29\xc6\xf5\xff\x30\xa8\xae\x03\x3a\xcb\xce\xc0\x73\xf9\
-\x9c\xf9\xf0\x69\x75\x1d\x30\x45\x3d\x0b\xea\xed\x97\xa3\x01\x48\
-\xac\x17\xdf\x50\xcf\x42\x7a\x07\x81\xba\x0e\xe8\x2c\x97\x37\xcf\
-\x95\xcf\x59\x1e\xd7\xab\xeb\x80\x29\xea\x59\x50\x6f\xbf\x1c\x0d\
-\x40\x7a\x44\xaa\xfc\xab\x59\x1f\x1f\xbc\xd4\x8f\x1f\xa2\xae\x05\
-\x3a\x6b\xea\x51\xd3\xe1\x61\xf5\xac\xf1\x76\xc0\x62\x60\xfd\x11\
-\xa3\x01\x70\xb5\xf8\x0a\xf5\x1c\xa4\xaf\x86\xd5\x75\x40\x77\xa4\
-\xe7\x3c\xa8\xe7\xcd\x0d\xc7\x97\xa8\xeb\x00\xd6\x1f\x39\x1a\x80\
-\x2c\x8f\xef\x53\xcf\x41\x35\x0f\x7f\xa4\xae\x03\xba\x23\xab\x85\
-\x8f\xa9\xe7\x2d\xf3\xf1\x5d\xea\x3a\x80\xf5\x47\x8e\x06\xc0\x76\
-\x86\x17\xa9\xe7\x60\xd5\xe5\xcd\xe7\xab\xeb\x80\xee\x70\x7e\xfc\
-\x45\xea\x79\xb3\x83\xde\x0b\xd5\x75\x00\xeb\x8f\x1c\x0d\x40\xd5\
-\x87\xba\x76\x67\x1c\x6e\x54\xd7\x00\xdd\x65\x07\x9d\x3f\xd5\xee\
-\x7b\x78\xd5\x74\x11\xb0\xfe\x88\xd1\x00\xd8\xce\xf8\x56\xe9\x01\
-\x80\x0f\x55\x75\x0d\xd0\x5d\x55\x1f\x57\x69\x67\x2e\xfe\x58\x5d\
-\x03\xb0\xfe\xc8\xd1\x80\x72\x5b\x31\xb2\xe9\x40\xf5\x0c\x70\xfd\
-\xbf\x7c\xec\x00\xe0\x8f\xc5\x33\xb7\xd5\x7b\xbf\xbf\xba\x0e\x65\
-\xa7\xde\xf7\xa8\xb7\x5f\x8e\x06\x94\x5b\x36\x12\x8e\x55\xcf\x80\
-\xcb\x1b\xaf\x52\xd7\x01\xdd\x95\xde\xca\xa7\x9e\x3b\xee\x3b\xd1\
-\x53\xcf\x80\x7a\xfb\xe5\x68\x40\xb9\x65\x3e\x9e\xaa\x9d\x81\xb0\
-\xd5\xd5\xeb\x07\xa9\xeb\x80\xee\x72\xa3\x13\x87\xa6\xe7\xf2\x2b\
-\x67\xcf\xd5\x9a\x6f\x56\xd7\xa1\xec\x58\x7f\xc4\x68\x40\xb9\xd9\
-\x01\xc0\x87\x95\xfd\xb7\x45\xe0\xfb\xea\x1a\x40\x23\xcb\xe3\x8f\
-\xa4\x07\x00\x3e\x7c\x40\x5d\x83\xb2\x63\xfd\x11\xa3\x01\xe5\x96\
-\x7e\x0e\xa5\x9d\x01\x9e\xff\x5f\x56\xe9\x4e\x7c\xe9\xec\xf9\xf8\
-\x29\x75\x0d\xca\x8e\xf5\x47\x8c\x06\x94\x9b\x1d\x00\xfc\x83\xb2\
-\xff\xe9\x19\x04\xea\x1a\x40\x23\xcb\xc3\x97\xb4\xb3\x17\xbe\xac\
-\xae\x41\xd9\xb1\xfe\x88\xd1\x80\x72\xb3\xb3\xa0\xb5\xca\xfe\xbb\
-\xbc\xf9\x51\x75\x0d\xa0\xe1\xf2\xf8\xa7\xd2\x03\x80\x3c\xfe\x8b\
-\xba\x06\x65\xc7\xfa\x23\x46\x03\xca\xcd\x0e\x00\xae\x94\x1e\x00\
-\xf8\xf0\x0e\x75\x0d\xa0\x61\xfd\x3f\x5d\xba\xff\xf1\xa1\xae\xae\
-\x41\xd9\xb1\xfe\x88\xd1\x80\x72\xcb\x7c\xfc\xae\xb2\xff\xd9\x50\
-\x78\x9d\xba\x06\xd0\xc8\x6a\x8d\x37\x4a\x67\x2f\x0f\xdf\x54\xd7\
-\xa0\xec\x58\x7f\xc4\x68\x40\xb9\xd9\x4e\xf0\x27\xd2\x9d\xf0\x48\
-\x38\x56\x5d\x03\x68\x0c\xf8\xe6\x71\xda\x03\x80\xf8\x23\x75\x0d\
-\xca\x8e\xf5\x47\x8c\x06\x94\x9b\xfa\x31\xc0\xab\xf3\xf5\x47\xa9\
-\x6b\x00\x0d\xb7\x2e\x1e\xad\x3d\x00\x08\x37\xab\x6b\x50\x76\xac\
-\x3f\x62\x34\xa0\xdc\x32\x1f\xee\x51\xf6\x3f\x3d\x10\x46\x5d\x03\
-\x68\xac\x1c\x1a\x3b\x4c\xbc\xff\xb9\x4b\x5d\x83\xb2\x63\xfd\x11\
-\xa3\x01\xe5\x66\x67\x41\x0f\x48\x0f\x00\x5c\x7c\x8a\xba\x06\xd0\
-\x18\x1c\x9c\x38\x40\x39\x7b\x36\xfb\xf7\xab\x6b\x50\x76\xac\x3f\
-\x62\x34\xa0\xdc\xb2\x3c\x3e\xa6\x3d\x00\x70\x7b\xab\x6b\x00\x8d\
-\xd4\x7b\xed\x01\x40\x7c\x4c\x5d\x83\xb2\x63\xfd\x11\xa3\x01\xe5\
-\xc6\x01\x00\x54\xea\xf5\xfa\x3e\x1c\x00\x94\x1b\xeb\x8f\x18\x0d\
-\x28\x37\x2e\x01\x40\x45\xfd\x2a\x6a\x2e\x01\xe8\xb1\xfe\x88\xd1\
-\x80\x72\xe3\x26\x40\xa8\xb8\x5a\x3c\x5c\xbc\xff\xe1\x26\x40\x31\
-\xd6\x1f\x31\x1a\x50\x6e\xea\x9f\x01\x0e\x5c\xde\x78\x96\xba\x06\
-\xd0\xa8\xd4\x36\x3e\x47\xba\xff\xf1\xe1\x16\x75\x0d\xca\x8e\xf5\
-\x47\x8c\x06\x94\x1b\x0f\x02\x82\x8a\x1b\x6a\x1c\x2f\x9d\x3d\x1f\
-\x7f\xac\xae\x41\xd9\xb1\xfe\x88\xd1\x80\x72\xab\xe6\xe1\x3b\xca\
-\xfe\x57\xf2\xe6\x1b\xd4\x35\x80\x46\x96\xc7\x93\xa4\xfb\x1f\x1f\
-\xbf\xa5\xae\x41\xd9\xb1\xfe\x88\xd1\x80\x72\xe3\x65\x40\x50\xc9\
-\x7c\x38\x53\x39\x7b\x59\x1e\xfe\x5d\x5d\x83\xb2\x63\xfd\x11\xa3\
-\x01\xe5\x66\x3d\x58\x23\x3d\x00\xe0\x75\xc0\xa5\x65\x07\x7f\xff\
-\x4b\xba\xff\xf1\x71\x95\xba\x06\x65\xc7\xfa\x23\x46\x03\xca\xcd\
-\xce\x82\xbe\xa6\x9d\x81\xf0\x45\x75\x0d\xa0\x51\xf5\xe1\x62\xe5\
-\xec\x65\x79\x5c\xae\xae\x41\xd9\xb1\xfe\x88\xd1\x80\x5f\x97\x27\
-\x1c\x00\x00\x14\x48\x49\x44\x41\x54\x72\xb3\x9d\xe0\x85\xd2\x19\
-\xf0\x71\x9d\xba\x06\xd0\xb0\xfe\x8f\x68\x67\x2f\x7c\x5a\x5d\x83\
-\xb2\x63\xfd\x11\xa3\x01\xe5\x96\xf9\xf8\x61\x65\xff\xed\x00\xe4\
-\x3a\x75\x0d\xa0\x91\xe5\xe1\x46\xe9\xec\xf9\xf0\x21\x75\x0d\xca\
-\x8e\xf5\x47\x8c\x06\x94\x5b\xa5\x16\x7e\x53\xbc\x13\x7e\xfc\x52\
-\x3f\x7e\x88\xba\x0e\xe8\xae\x02\x3c\x04\x68\xb2\x32\xdc\xfc\x75\
-\x75\x1d\xca\x4e\x3d\x03\xea\xed\x97\xa3\x01\xe5\x96\x7e\x87\xaf\
-\x9e\x01\x3b\x08\x79\xb5\xba\x0e\xe8\xae\xf4\xf3\x4f\xf9\xdc\x0d\
-\x35\x5f\xa8\xae\x43\xd9\xa9\x67\x40\xbd\xfd\x72\x34\xa0\xdc\xd4\
-\xcf\x63\x4f\x71\x79\xf8\x88\xba\x0e\xe8\x2e\xf5\x2f\x00\xd2\x37\
-\x4f\xe9\x75\xc4\xea\x3a\x94\x9d\x7a\xdf\xa3\xde\x7e\x39\x1a\x00\
-\xf5\xe3\x80\x2d\x4e\x5d\x03\x74\x57\x35\x0f\x83\xda\x03\x80\xf8\
-\x53\x75\x0d\xc0\xfa\x23\x47\x03\x90\xe5\xf1\xdf\xa4\x73\xe0\xe3\
-\x4d\xea\x1a\xa0\x7b\x26\x27\x27\x9f\x64\x67\xe0\x77\x6a\x0f\x00\
-\xc2\xe5\xea\x3a\x80\xf5\x47\x8e\x06\xc0\xce\x86\xbe\xa0\x9e\x83\
-\xca\xf0\x86\x17\xa8\xeb\x80\xee\x18\xf0\xe1\x04\xf5\xbc\xd9\x41\
-\xe7\xe7\xd4\x75\x00\xeb\x8f\x1c\x0d\x80\xf3\xf1\x3c\xf5\x1c\x70\
-\x1f\x40\x79\x58\xbf\xff\x4c\x3d\x6f\x76\x00\x70\x8e\xba\x0e\x60\
-\xfd\x91\xa3\x01\xc8\x7c\x78\xb9\x7a\x0e\x6c\x87\x5c\x53\xd7\x01\
-\xdd\x61\xfd\x5e\xaf\x9e\xb7\xf4\x2d\x84\xba\x0e\x60\xfd\x91\xa3\
-\x01\x70\x2e\x3e\xa5\xea\xc3\x23\xca\x39\xc8\xf2\xf8\x90\x1b\x9d\
-\x38\x54\x5d\x0b\x74\x96\xf3\x57\x3e\x23\xf3\xf1\x51\xed\xac\x85\
-\x87\x2f\xa9\xd7\x9f\xac\xae\x05\x58\x7f\xe4\x68\x00\x92\xcc\x87\
-\x0d\xea\x59\xc8\x86\xe3\xd9\xea\x3a\xa0\xb3\xac\xcf\x1f\x54\xcf\
-\x59\xd5\xc7\xa0\xae\x03\xa6\xa8\x67\x41\xbd\xfd\x72\x34\x00\x49\
-\x35\x0f\x7f\xab\x9e\x05\x3b\x33\x1c\x52\xd7\x01\x9d\x55\xf5\xa1\
-\xae\x9f\xb3\xf0\x59\x75\x1d\x30\x45\x3d\x0b\xea\xed\x97\xa3\x01\
-\x48\x9c\x0f\xef\x50\xcf\x42\xfa\x6a\x78\x75\xbe\xfe\x28\x75\x2d\
-\xd0\x19\x95\xda\xc6\xe7\x64\x79\x7c\x4c\x3d\x67\x95\xbc\xf1\x36\
-\x75\x2d\x30\x45\x3d\x0b\xea\xed\x97\xa3\x01\x48\xdc\xd0\x86\x23\
-\xd5\xb3\xd0\x8a\x0f\xe7\xab\x6b\x81\xce\xc8\xf2\x70\x81\x7a\xbe\
-\xd2\x13\x00\x57\x8f\x84\x23\xd4\xb5\xc0\x14\xf5\x3c\xa8\xb7\x5f\
-\x8e\x06\x60\x1b\x3b\x03\xff\xae\x7a\x1e\x6c\x07\xfd\xfd\xf4\xa0\
-\x18\x75\x2d\xd0\x5e\xce\xb9\xbd\xed\xe0\xee\x06\xf9\x7c\xe5\xe1\
-\x9b\xea\x5a\x60\x3b\xf5\x3c\xa8\xb7\x5f\x8e\x06\x60\x9b\x22\xdc\
-\x07\xd0\xda\x49\xfb\xc6\x6f\xa8\x6b\x81\xf6\xca\xf2\x78\x9a\x7a\
-\xae\x5a\xf1\xe1\xaf\xd4\xb5\xc0\x76\xea\x79\x50\x6f\xbf\x1c\x0d\
-\xc0\x36\x15\xdf\x38\x59\x3d\x0f\x29\xe9\xd1\xc4\xea\x5a\xa0\xbd\
-\xac\xaf\x4d\xf5\x5c\xb5\x66\xab\xd6\x78\xa3\xba\x16\xd8\x4e\x3d\
-\x0f\xea\xed\x97\xa3\x01\xd8\x26\xfd\x36\x3a\xcb\xc3\xfd\xea\x99\
-\x68\xed\xa8\xf3\xf8\x52\x75\x3d\xd0\x1e\xce\xc7\xd7\xab\xe7\x69\
-\x7a\xa6\xfe\xcb\xb9\xcd\xfb\xa9\xeb\x81\xed\xd4\x33\xa1\xde\x7e\
-\x39\x1a\x80\x1d\x55\x7d\x5c\xa7\x9e\x89\x56\x7c\x5c\xab\xae\x05\
-\xda\xc3\x7a\xf9\x75\xf9\x3c\x4d\x65\x8d\xba\x16\xd8\x99\x7a\x26\
-\xd4\xdb\x2f\x47\x03\xb0\xa3\xf4\x30\x1e\xf5\x4c\x6c\x8b\xab\xc5\
-\x57\xa8\xeb\x81\xa5\xa9\xe4\x8d\xd7\xaa\xe7\x68\x7b\xc2\x3b\xd5\
-\xf5\xc0\xce\xd4\x33\xa1\xde\x7e\x39\x1a\x80\x1d\xa5\xc7\xf1\xa6\
-\xc7\xf2\xaa\xe7\xa2\x15\xde\x0f\xd0\xd3\xa6\x5e\xfb\x1b\xa3\x7c\
-\x8e\xf2\xd6\xdd\xff\x0f\xac\x5d\xdb\x38\x58\x5d\x13\xec\x4c\x3d\
-\x17\xea\xed\x97\xa3\x01\xd8\x55\xe6\xc3\xbf\xaa\xe7\xe2\x89\x1d\
-\x37\xbf\x08\xe8\x59\x59\x2d\xbc\x57\x3d\x3f\x4f\xc4\xc7\x55\xea\
-\x7a\x60\x77\xea\xb9\x50\x6f\xbf\x1c\x0d\xc0\xae\x5c\x2d\x9e\xa5\
-\x9e\x8b\x6d\x49\xcf\x05\xe0\xc6\xad\xde\xb3\x72\x68\xec\x30\x3b\
-\xfb\xbf\x55\x3d\x3f\x4f\xcc\x51\x1e\x4f\x53\xd7\x04\xbb\x53\xcf\
-\x85\x7a\xfb\xe5\x68\x00\x76\xb5\x62\x64\xd3\x81\xd5\x3c\xdc\xab\
-\x9e\x8d\x1d\x76\xde\x1f\x57\xd7\x04\x0b\x63\x07\x6e\x5f\x56\xcf\
-\xcd\x0e\xf3\x73\x77\x7a\xe3\xa5\xba\x26\xd8\x9d\x7a\x36\xd4\xdb\
-\x2f\x47\x03\x30\x93\x62\xed\xc0\xc3\x03\xae\x16\x9f\xa7\xae\x09\
-\xe6\xc7\x8d\x8c\x9f\x58\x84\x67\xfe\x3f\x31\x3f\x3e\xfc\x3f\x75\
-\x4d\x30\x33\xf5\x6c\xa8\xb7\x5f\x8e\x06\x60\x26\xe9\x77\xf8\xea\
-\xd9\xd8\x69\x27\x9e\xc7\x7f\xe3\x11\xc1\xc5\xd7\x7a\xe4\x6f\x1e\
-\xbf\xa1\x9e\x97\x9d\x66\xa7\x36\xf6\xcb\xea\xba\x60\x66\xea\xd9\
-\x50\x6f\xbf\x1c\x0d\xc0\x6c\xaa\x3e\x5c\xa5\x9e\x8f\x1d\xe3\xf2\
-\xf0\x11\x75\x4d\x30\x37\xe7\xe3\x27\xd4\x73\xb2\x4b\x36\xaa\x6b\
-\x82\xd9\xa9\xe7\x43\xbd\xfd\x72\x34\x00\xb3\xa9\x0e\x37\xde\xaf\
-\x9e\x8f\x9d\xe2\xe3\x83\x6e\x38\xbe\x44\x5d\x17\xcc\x2c\xf3\x63\
-\xbf\x92\x5e\xe9\x2c\x9f\x93\x1d\x62\x07\x24\xe7\xa9\xeb\x82\xd9\
-\xa9\xe7\x43\xbd\xfd\x72\x34\x00\xb3\x49\x37\x4e\x15\xe9\x4e\xee\
-\x14\xfb\xf3\x6c\x4e\x37\x29\xaa\x6b\x83\x9d\xb5\xee\xfa\xcf\xe3\
-\x75\xea\xf9\xd8\x29\x3e\xdc\x92\x1e\x6f\xad\xae\x0d\x66\xa7\x9e\
-\x11\xf5\xf6\xcb\xd1\x00\xcc\xc5\x16\xdc\x65\xea\x19\xd9\x35\x59\
-\x1e\x2e\xe3\x7e\x80\xe2\x58\xb6\x6c\x72\x2f\xeb\xcb\xb0\x7a\x2e\
-\x76\x8d\xf3\xcd\x3f\x57\xd7\x06\x73\x53\xcf\x88\x7a\xfb\xe5\x68\
-\x00\xe6\xe2\xfc\x95\xcf\x48\x77\xe1\xab\xe7\x64\xd7\x64\xb5\xf0\
-\x31\x75\x6d\x30\xc5\xe6\xe3\x02\xf5\x3c\xec\x16\x1f\xee\xbb\x6c\
-\x74\xc3\xd3\xd4\xb5\xc1\xdc\xd4\x73\xa2\xde\x7e\x39\x1a\x80\x3d\
-\xb1\x1d\xfc\x97\xd4\x73\xb2\x7b\xc2\x56\xfb\xeb\xe9\xea\xda\x94\
-\x5d\xba\xc6\x9e\xf9\xf0\xb8\x7e\x1e\x76\x9b\x8f\x2f\xaa\x6b\x83\
-\x3d\x53\xcf\x89\x7a\xfb\xe5\x68\x00\xf6\xc4\x8d\x8e\x1d\x53\x98\
-\xf7\x03\xec\x18\x1f\x1e\xb1\x83\x93\x53\xd4\xf5\x29\xab\xcc\xc7\
-\x53\x8b\x76\xd3\xdf\xd4\x5c\xc4\x07\x57\xfb\xf1\x67\xab\xeb\x83\
-\x3d\x53\xcf\x8a\x7a\xfb\xe5\x68\x00\xe6\x23\x3d\x4c\x45\x3d\x2b\
-\x33\xa5\xf5\x8e\xf7\x91\xf1\x13\xd5\xf5\x29\x9b\x74\xc7\x7f\xfa\
-\x9a\x5d\xdd\xff\x99\x67\x22\x7c\x5e\x5d\x1f\xcc\x8f\x7a\x56\xd4\
-\xdb\x2f\x47\x03\x30\x1f\xab\xf3\xf5\x47\xd9\x8e\xf5\x7e\xf5\xbc\
-\xcc\x9c\x70\xbb\xcb\x1b\xbf\xa8\xae\x51\x59\x0c\xe4\x63\x2f\xb6\
-\x03\xc2\x3b\xf5\x7d\x9f\x21\x76\x50\x32\x70\x45\xf3\x99\xea\x1a\
-\x61\x7e\xd4\xf3\xa2\xde\x7e\x39\x1a\x80\xf9\xaa\xfa\xf8\x39\xf5\
-\xbc\xcc\xb1\xe3\xbf\x7e\xd5\xe5\xcd\xe7\xab\x6b\xd4\xef\xb2\x91\
-\x70\xac\xcd\xc1\x4d\xf2\x7e\xcf\x92\x2c\x8f\x17\xaa\x6b\x84\xf9\
-\x53\xcf\x8b\x7a\xfb\xe5\x68\x00\xe6\x2b\xfd\xd6\x3b\x9d\x6d\xab\
-\x67\x66\xd6\x9d\xbf\x0f\x77\xa4\xaf\xa6\xd5\x75\xea\x57\x03\x43\
-\xcd\x57\xa6\x1a\xab\xfb\x3c\x7b\xff\xe3\xad\x6e\x74\xe2\x50\x75\
-\x9d\x30\x7f\xea\x99\x51\x6f\xbf\x1c\x0d\xc0\x42\xd8\x02\xf0\x21\
-\xf5\xcc\xec\x61\x11\xd8\xc2\x8d\x81\xed\xd7\xba\xe1\xaf\x80\x3f\
-\x07\xdd\x29\xc3\x8d\xf7\xab\xeb\x84\x85\x51\xcf\x8c\x7a\xfb\xe5\
-\x68\x00\x16\x22\xbd\xec\xc5\x16\x82\x6f\xaa\xe7\x66\xae\xd8\x9f\
-\xef\x61\x3b\x50\x39\x53\x5d\xab\x7e\x91\x0d\xc7\xb3\x0b\x79\xb7\
-\xff\x4e\x3d\x8f\x57\xa7\xd9\x54\xd7\x0a\x0b\xa3\x9e\x1b\xf5\xf6\
-\xcb\xd1\x00\x2c\x94\xed\x6c\x4f\x52\xcf\xcd\x9e\x13\xb6\xda\x9f\
-\xf3\xe3\x3c\x31\x70\xf1\xd2\x13\xfe\xd2\x43\x7e\x8a\xf9\x3b\xff\
-\xed\x49\x7f\xbe\x4a\xde\x7c\x83\xba\x5e\x58\x38\xf5\xec\xa8\xb7\
-\x5f\x8e\x06\x60\x31\x6c\xa7\xbb\x52\x3d\x3b\xf3\x8a\x0f\xa3\xdc\
-\x15\xbe\x70\x97\xfa\xf1\x43\xac\x7e\x6b\xe4\xfd\x9b\x47\x6c\x16\
-\x2f\x51\xd7\x0b\x8b\xa3\x9e\x1d\xf5\xf6\xcb\xd1\x00\x2c\x46\x7a\
-\x44\x70\x91\x6f\x08\xdc\x29\x3e\xdc\x50\xa9\x85\x57\xab\x6b\xd6\
-\x2b\x5a\x37\xfb\x15\xed\xc5\x3e\xb3\x24\xdd\xf8\xc7\x23\x7f\x7b\
-\x97\x7a\x7e\xd4\xdb\x2f\x47\x03\xb0\x58\x2e\x0f\xef\x51\xcf\xcf\
-\x02\x16\x8a\x47\xed\x80\xe5\x93\xe9\x6b\x6d\x75\xdd\x8a\x2a\x5d\
-\x43\xb7\x83\xa5\xf3\xd3\x13\x16\xd5\xfd\x9a\x7f\x5f\xb9\xd7\xa3\
-\x97\xa9\xe7\x47\xbd\xfd\x72\x34\x00\x4b\x61\x3b\xe0\x5c\x3d\x43\
-\x0b\x5a\x30\xf2\xf0\xef\xe9\x41\x36\xea\xba\x15\x8d\xf5\xf1\xe5\
-\x56\x9f\x6f\xa8\xfb\xb3\xa0\xf8\xb8\x4e\x5d\x37\x2c\x8d\x7a\x86\
-\xd4\xdb\x2f\x47\x03\xb0\x14\xe9\xfa\x7a\x7a\xef\xba\x7a\x8e\x16\
-\x92\xf4\x6d\x80\xe5\xa2\xb5\x6b\x1b\x07\xab\xeb\xa7\xb6\x66\x4d\
-\xfd\xa9\xa9\x16\x59\x1e\x1f\x53\xf7\x65\x41\x3d\xcc\xe3\x6d\x6e\
-\x68\xc3\x91\xea\xfa\x61\x69\xd4\x73\xa4\xde\x7e\x39\x1a\x80\xa5\
-\xaa\xe4\x8d\xb7\xa9\xe7\x68\x51\xf1\xf1\xa6\xf4\x13\x37\x75\xfd\
-\x14\xd2\xaf\x23\xa6\x7f\xde\x77\xab\xbc\x0f\x0b\x4c\xba\xeb\x3f\
-\x3d\x97\x40\x5d\x43\x2c\x9d\x7a\x96\xd4\xdb\x2f\x47\x03\xd0\x0e\
-\x76\x46\xb6\x5c\x3d\x4b\x4b\xc8\x15\x76\x10\xf3\x5a\x75\x0d\xbb\
-\x25\xab\x35\xde\x68\x0b\x68\x2c\x40\xdd\x17\x15\xfb\xb3\xff\x9d\
-\xba\x86\x68\x0f\xf5\x2c\xa9\xb7\x5f\x8e\x06\xa0\x1d\x56\x8c\x6c\
-\x3a\x30\xcb\xc3\xb7\xd5\xf3\xb4\xc4\xac\xef\xe7\xa7\x08\x3a\x1f\
-\x5f\x5f\xf5\xf1\xeb\x05\xa8\xf3\x12\x12\xae\x71\x2e\x3e\x45\x5d\
-\x4b\xb4\x87\x7a\x9e\xd4\xdb\x2f\x47\x03\xd0\x2e\xe9\x8d\x7c\xb6\
-\x83\xbe\x57\x3d\x53\x6d\xc8\xc6\x74\x59\xa3\x1f\x1e\x22\x94\xee\
-\xec\x77\x3e\xbc\x23\xf3\x61\x43\x01\xea\xba\xa4\x64\x79\xbc\xdb\
-\xd5\xe2\xf3\xd4\x35\x45\xfb\xa8\x67\x4a\xbd\xfd\x72\x34\x00\xed\
-\xe4\xf2\xe6\x6f\x15\xfd\xc9\x71\xf3\x8e\x0f\x37\xa4\xb7\xcb\xb9\
-\xd1\xb1\x63\xd4\x75\x5d\x28\xb7\x2e\x1e\x3d\xfd\x93\xbe\xeb\xe5\
-\x75\x6c\x43\xd2\x4c\x39\x1f\xdf\xae\xae\x2b\xda\x4b\x3d\x57\xea\
-\xed\x97\xa3\x01\x68\x37\x5b\x74\x3e\xad\x9e\xab\xf6\x2e\x3e\xe9\
-\x57\x03\x21\xb7\x83\x9b\x73\xd3\x5d\xf3\xea\xfa\xce\x66\xea\xe1\
-\x4c\xf1\x83\x53\x5f\xf3\x87\xad\xea\xba\xb5\xb9\x07\xff\x57\x5d\
-\x5f\xb4\x9f\x7a\xae\xd4\xdb\x2f\x47\x03\xd0\x6e\xad\x17\x06\xf9\
-\xf0\xaf\xea\xd9\xea\xc8\x42\x34\xf5\xa2\xa1\xcb\xed\x60\xe0\xa3\
-\xce\x8f\xbf\x48\x59\xe7\x74\x89\x62\xc0\x87\x13\xb2\x3c\xfe\xef\
-\x6a\xba\x7f\xa1\xe0\x2f\xec\x59\x74\x7c\x58\xcd\x03\x9c\xfa\x93\
-\x7a\xb6\xd4\xdb\x2f\x47\x03\xd0\x09\xe9\xa6\xc0\x6a\xaf\x3d\x58\
-\x66\x11\xb1\x03\x82\x9b\xed\x8c\x7b\x95\xe5\x8f\xb3\xe1\xf8\xab\
-\x9d\x7c\x1f\xbd\xab\xc5\xc3\xd3\x4b\x6f\xd2\x4b\x8e\xec\x0c\x7f\
-\xd0\x0e\x44\xee\x50\x6f\x7f\xe7\x13\xc6\xb9\xe9\xaf\x7f\xa9\xe7\
-\x4b\xbd\xfd\x72\x34\x00\x9d\x92\x1e\xd4\x62\x8b\xd5\x8f\xd4\x33\
-\xd6\xf5\xb4\xae\xbb\x07\x6f\x7f\xff\xf7\x2e\x8f\x7f\xea\x86\x9b\
-\x67\xa4\x9f\xde\x0d\xf8\xe6\x71\xe9\xda\xfc\xca\xa1\xb1\xc3\x76\
-\x7c\x08\x51\x7a\xf1\x4e\xfa\xcf\x56\xfb\xf1\x67\x67\xb5\xb1\x5f\
-\xae\xf8\xf0\x26\x5b\xec\xcf\x9a\xbe\x86\x7f\xb1\xfd\x7b\x46\xec\
-\x40\xe3\x27\xf2\xed\xea\x72\xd2\xfb\x08\x56\x8f\x84\x23\x94\x33\
-\x8c\xce\x52\xcf\x98\x7a\xfb\xe5\x68\x00\x3a\x29\x7d\x4d\x6e\x67\
-\xaa\x77\xaa\xe7\x8c\xf4\x5a\xc2\xed\xab\x6a\xe1\x97\xd4\xf3\x8b\
-\xce\x52\xcf\x99\x7a\xfb\xe5\x68\x00\x3a\xcd\x0d\x35\x8e\x4f\x3f\
-\xe1\x52\xcf\x1a\xe9\x95\x84\x7b\x07\x86\x1b\x2f\x53\xcf\x2d\x3a\
-\x4f\x3d\x6b\xea\xed\x97\xa3\x01\xe8\x86\xf4\x3a\xde\xcc\xc7\x2d\
-\xea\x79\x23\xc5\x4e\x96\x87\xfb\xb3\xa1\xf0\x3a\xf5\xbc\xa2\x3b\
-\xd4\xf3\xa6\xde\x7e\x39\x1a\x80\x6e\xa9\xf8\xc6\xc9\x59\x1e\x1f\
-\x52\xcf\x1c\x29\x68\x7c\x7c\xd0\xe6\xe3\x24\xf5\x9c\xa2\x7b\xd4\
-\x33\xa7\xde\x7e\x39\x1a\x80\x6e\x6a\xdd\xc5\xce\x37\x01\x64\x97\
-\xa4\x33\xff\x74\x80\xa8\x9e\x4f\x74\x97\x7a\xee\xd4\xdb\x2f\x47\
-\x03\xd0\x6d\xce\x37\x5f\xd3\x27\x8f\x0c\x26\x6d\x48\xe6\xc3\x3d\
-\xe9\x27\x94\xea\xb9\x44\xf7\xa9\x67\x4f\xbd\xfd\x72\x34\x00\x0a\
-\x6e\x64\xfc\xc4\x74\xa7\xb7\x7a\xfe\x88\x3c\x77\x0d\x0c\x35\x5f\
-\xa9\x9e\x47\x68\xa8\xe7\x4f\xbd\xfd\x72\x34\x00\x2a\xe9\x27\x82\
-\xfd\xf2\xac\x7a\xb2\xf0\xa4\xdf\xf9\xf3\x53\xbf\x72\x53\xcf\xa0\
-\x7a\xfb\xe5\x68\x00\x94\x56\x0e\x4e\x3c\xbd\x9a\x87\x86\x7a\x0e\
-\x49\x77\x93\xde\x4e\x38\x70\x45\xf3\x99\xea\xf9\x83\x96\x7a\x0e\
-\xd5\xdb\x2f\x47\x03\xa0\x76\x49\xbd\xfe\x64\x5b\x10\xaa\xea\x59\
-\x24\xdd\x49\x96\x87\xcb\x06\x07\x27\x0e\x50\xcf\x1d\xf4\xd4\xb3\
-\xa8\xde\x7e\x39\x1a\x80\x22\x48\x2f\x7b\xb1\x85\xe1\x2f\xfa\xe6\
-\x55\xc2\x64\xb7\xa4\xde\xa6\xb7\xfa\xf1\x62\x1f\x6c\xa3\x9e\x49\
-\xf5\xf6\xcb\xd1\x00\x14\x89\xcb\xc3\x5b\x79\x6a\x60\x3f\x26\xdc\
-\xeb\x7c\x7c\xbb\x7a\xbe\x50\x2c\xea\xb9\x54\x6f\xbf\x1c\x0d\x40\
-\xd1\x54\x86\x37\xbc\xc0\xce\x14\x37\xab\x67\x93\xb4\x2b\xe1\x1a\
-\x57\x8b\xcf\x53\xcf\x15\x8a\x47\x3d\x9b\xea\xed\x97\xa3\x01\x28\
-\xa2\xf4\x0a\x58\x3b\x08\xb8\x88\x4b\x02\xbd\x1d\xeb\xe1\x8a\xf4\
-\x6a\x68\xf5\x3c\xa1\x98\xd4\xf3\xa9\xde\x7e\x39\x1a\x80\x22\xcb\
-\xf2\x70\x8a\xe5\x66\xf5\x9c\x92\x85\x25\xcb\xe3\x6d\xb6\xf8\x9f\
-\xaa\x9e\x1f\x14\x9b\x7a\x4e\xd5\xdb\x2f\x47\x03\x50\x74\x6e\x68\
-\xc3\x91\x36\x2b\xc3\xea\x59\x25\xf3\x8c\x8f\xeb\xf8\x89\x1f\xe6\
-\x43\x3d\xab\xea\xed\x97\xa3\x01\xe8\x15\x76\x56\x79\x9a\x9d\x55\
-\xde\xaa\x9e\x59\x32\x73\x52\x6f\xb2\xe1\x78\xb6\x7a\x4e\xd0\x3b\
-\xd4\x33\xab\xde\x7e\x39\x1a\x80\x5e\xb2\x72\x68\xec\x30\x3b\x10\
-\x58\xce\xbd\x01\x85\x8b\x4b\x0f\x75\x52\xcf\x07\x7a\x8b\x7a\x6e\
-\xd5\xdb\x2f\x47\x03\xd0\x8b\xdc\x70\xf8\xb5\x74\x77\xb9\x7a\x7e\
-\xcb\x1e\x3b\x18\xbb\x3a\xbd\xe1\x51\x3d\x0f\xe8\x4d\xea\xf9\x55\
-\x6f\xbf\x1c\x0d\x40\xaf\x6a\x3d\x3c\x68\x38\x9e\xcd\x65\x81\xee\
-\x27\xf3\xe1\x0e\x97\x87\x8f\x38\xe7\xf6\x56\xcf\x01\x7a\x97\x7a\
-\x8e\xd5\xdb\x2f\x47\x03\xd0\xeb\xd6\xac\xa9\x3f\xd5\x16\xa4\xcf\
-\xa6\x77\xca\xab\xe7\xb9\xef\xe3\xc3\x7d\x76\xd6\x7f\xa1\x1b\x9d\
-\x38\x54\xdd\x77\xf4\x3e\xf5\x3c\xab\xb7\x5f\x8e\x06\xa0\x5f\x38\
-\x7f\xe5\x33\xd2\xe2\x64\x07\x02\x0f\xa8\xe7\xba\xdf\x62\x35\x7d\
-\x38\xdd\x7b\xb1\x3a\x5f\x7f\x94\xba\xcf\xe8\x1f\xea\xb9\x56\x6f\
-\xbf\x1c\x0d\x40\xbf\x59\xed\xc7\x9f\x9d\xf9\xf8\x77\x7c\x23\xd0\
-\x86\xd8\x19\x7f\x35\x0f\x5f\x74\xeb\xe2\xd1\xea\xbe\xa2\xff\xa8\
-\xe7\x5b\xbd\xfd\x72\x34\x00\xfd\x2a\x7d\x4d\x9d\xae\x53\xdb\x81\
-\xc0\x8d\xea\x39\xef\xb5\x4c\xdd\x57\x11\x3e\x79\xd9\xe8\x86\xa7\
-\xa9\xfb\x88\xfe\xa5\x9e\x73\xf5\xf6\xcb\xd1\x00\xf4\xbb\xd6\xeb\
-\x86\xf3\xf8\x3e\x9b\xb7\x6f\xa8\xe7\xbd\x07\xb2\xd1\xf9\x78\x9e\
-\xf7\x7e\x7f\x75\xdf\xd0\xff\xd4\xf3\xae\xde\x7e\x39\x1a\x80\x32\
-\x71\x7e\xfc\x45\xad\xfb\x04\x7c\xb8\x43\x3d\xfb\x45\x89\xd5\xe2\
-\x9e\x74\x7d\x7f\xc0\x87\x13\xd4\xfd\x41\xb9\xa8\x67\x5f\xbd\xfd\
-\x72\x34\x00\x65\x34\x38\x38\x71\x80\x2d\x7c\x67\x66\x79\xb8\xac\
-\xea\xe3\x83\xea\xcf\x41\xd7\x17\xfd\x74\xa3\xa4\x0f\xab\xed\xef\
-\x4f\x4f\x2f\x5e\x52\xf7\x03\xe5\xa4\xfe\x1c\xa8\xb7\x5f\x8e\x06\
-\xa0\xec\x2e\xf5\xe3\x87\x54\x7d\xe3\xdd\x36\x8f\x6b\x32\x1f\xb7\
-\xa8\x3f\x13\x1d\x5b\xf4\x6d\xdb\xd2\x01\x8f\xab\xc5\xb3\xd6\xae\
-\x6d\x1c\xac\xae\x3b\xa0\xfe\x4c\xa8\xb7\x5f\x8e\x06\x00\xdb\xd5\
-\xeb\xf5\x7d\x9c\x6f\xbe\x66\xfa\x32\xc1\x44\xaf\x3f\x72\xd8\xb6\
-\xe3\xba\xd6\x6b\x95\xf3\x78\x12\xd7\xf5\x51\x34\xea\xcf\x87\x7a\
-\xfb\xe5\x68\x00\x30\xbb\xd5\x23\xe1\x88\xf4\x5a\xdb\x74\x47\x7c\
-\xd5\x87\xd1\x22\x5f\x2e\xb0\x3f\xe7\xa3\x53\x07\x2d\xad\x05\xff\
-\xb4\xf4\x67\x57\xd7\x0f\x98\x8b\xfa\x33\xa3\xde\x7e\x39\x1a\x00\
-\xcc\x5f\xfa\x45\x81\x1b\x19\x3f\x31\xab\x85\xf7\xda\x62\xfb\x37\
-\xe9\xa0\xc0\x16\xdc\x9f\x76\xfd\xb3\xe3\xe3\x4d\x53\xff\xbf\xc3\
-\xdf\xb8\xbc\x79\xae\x2d\xf8\x2f\x4d\x7f\x36\x75\x7d\x80\x85\x60\
-\xfd\x11\xa3\x01\xc0\xd2\xa5\x1b\xe9\x5a\xbf\x30\xf0\x8d\xdf\xa8\
-\xe6\xe1\x0f\x6c\x61\xfe\x4b\x5b\xa0\xbf\xda\xba\xc9\x30\x8f\xeb\
-\xed\x20\x61\x73\xfa\x3a\xde\xfe\x6f\xb7\xdb\x3f\xdf\xb5\xe3\xbd\
-\x06\xd3\x7f\x7f\x57\xfa\xbf\xb5\xfe\x3b\x3e\x7e\xab\xf5\xbf\xb1\
-\xff\xad\xfd\xf3\x57\xd2\xbf\xcb\xf2\xa1\xf4\xef\xae\x0c\x35\x5f\
-\xc8\x42\x8f\x7e\xc1\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\
-\x00\x00\xa0\xc0\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\
-\x00\xa0\xc0\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\
-\xa0\xc0\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\xa0\
-\xc0\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\xa0\xc0\
-\xfa\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\xa0\xc0\xfa\
-\x23\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\xa0\xc0\xfa\x23\
-\x46\x03\x00\x00\x0a\xac\x3f\x62\x34\x00\x00\xa0\xc0\xfa\x23\x96\
-\xe5\xe1\x61\x65\x03\x9c\xdb\xbc\x9f\xba\x06\x00\x80\xee\xf2\xde\
-\xef\xaf\x5c\x7b\xb2\x3c\x3e\xa4\xae\x81\x5c\x35\x0f\xb7\x2b\x9b\
-\xb0\x72\x70\xe2\xe9\xea\x1a\x00\x00\xba\x6b\xe0\x8a\xe6\x33\xb5\
-\xdf\x00\x84\xdb\xd5\x35\x90\xab\xfa\x70\xbd\xf4\x28\xcc\x87\x97\
-\xab\x6b\x00\x00\xe8\x2e\x97\x37\x5e\x25\xfe\x06\xe0\x3a\x75\x0d\
-\xe4\xec\x28\xe8\x1a\xe9\x51\xd8\x70\xe3\xfd\xea\x1a\x00\x00\xba\
-\xcb\xf6\xff\x1f\x94\xae\x3d\x3e\x6e\x52\xd7\x40\xce\x0e\x00\x1a\
-\xd2\x26\xe4\xb1\xa2\xae\x01\x00\xa0\xbb\xec\x0c\xfc\x5f\xb4\xdf\
-\x00\x84\x31\x75\x0d\xe4\xac\x08\x99\xb4\x09\x3e\x6e\x71\xf5\xfa\
-\x41\xea\x3a\x00\x00\xba\x63\xc5\xc8\xa6\x03\xd3\xbe\x5f\xbb\xf6\
-\x84\x95\xea\x3a\xc8\x55\xf3\xf0\x49\xf1\x37\x00\x5c\x06\x00\x80\
-\x12\xb1\xb3\xff\xdf\x53\xaf\x3b\x76\x00\xb2\x4c\x5d\x07\x39\x3b\
-\x00\x78\xa7\xbe\x11\xe1\xfb\xcb\x27\x26\xf6\x55\xd7\x02\x00\xd0\
-\x59\xad\x9f\xff\x89\x6f\x3e\x4f\x71\xc3\xcd\x33\xd4\xb5\x90\xb3\
-\x23\xb1\x97\xaa\x1b\xd1\x8a\x0f\xe7\xab\x6b\x01\x00\xe8\x2c\xe7\
-\x9b\x7f\x2e\x5f\x6f\xd2\x01\xc0\x50\xe3\x78\x75\x2d\xe4\xd2\xf5\
-\xf7\x6a\x1e\xb6\xaa\x9b\x91\x1e\xca\x50\xa9\x85\x57\xab\xeb\x01\
-\x00\xe8\x0c\x5b\xfc\x5f\xa3\x7e\xf8\xdc\xf4\x7a\xf3\x58\xba\x0f\
-\x41\x5d\x8f\x42\xb0\xb3\xef\xab\xd4\x0d\x69\xc5\x87\x5b\x2a\xb5\
-\x8d\xcf\x51\xd7\x03\x00\xd0\x5e\x6e\x74\xec\x98\xb4\x8f\x97\xaf\
-\x33\x53\xd9\xa8\xae\x47\x61\xd8\xd1\xd0\x5f\x17\xa0\x21\xd3\x07\
-\x01\xf1\x5b\x1c\x04\x00\x40\xff\x48\x8b\x7f\xe6\xe3\x66\xf9\xfa\
-\x32\x1d\x5b\xf3\x2e\x54\xd7\xa4\x30\x2a\xc3\xcd\x5f\x57\x37\x64\
-\xe7\x84\xdb\x9d\x8f\xaf\x57\xd7\x05\x00\xb0\x34\xe9\xd2\x6e\x81\
-\xce\xfc\x5b\xa9\xf8\xc6\xc9\xea\xba\x14\x46\xeb\x3e\x00\x1f\x1e\
-\x51\x37\x65\x97\x23\xb4\x87\xd2\xcf\x34\x78\x46\x00\x00\xf4\x9e\
-\x74\xb7\x7f\xba\xe1\xaf\x08\xd7\xfc\x77\x5e\x5b\xc2\xc3\x83\x83\
-\x13\x07\xa8\xeb\x53\x28\x56\x98\x2b\xd4\x8d\x99\x31\x76\xe4\x98\
-\xf9\xf0\x21\x6e\xd8\x00\x80\xe2\x4b\x27\x6d\xad\xdf\xf9\x17\xe0\
-\xa7\x7e\xb3\x64\x44\x5d\xa3\xc2\x71\x79\xf3\xdc\x02\x34\x66\xf6\
-\xa3\x36\x1f\xb7\xd8\x81\x40\xd5\xfe\xfe\x83\x99\x1f\xfb\x95\xd5\
-\x23\xe1\x88\x74\x84\xa9\xae\x1b\x00\x94\x55\xda\x07\xa7\x7d\x71\
-\xda\x27\xdb\xd9\xfe\xef\xb7\x1e\xef\xeb\xc3\x7d\xea\xf5\x62\xae\
-\xb8\x3c\xbc\x47\x5d\xb7\xc2\x69\x1d\xb5\x89\x1f\xcd\x48\x08\x21\
-\x84\x74\x2c\x76\x70\xc2\x65\xe5\x59\x54\xf3\xf0\xcf\xf2\x06\x11\
-\x42\x08\x21\x1d\x49\xf8\x27\xf5\x3a\x5b\x58\xae\xd6\x7c\xb3\xbe\
-\x41\x84\x10\x42\x48\xfb\x53\xf1\xe1\x4d\xea\x75\xb6\xd0\x32\x1f\
-\x26\xd4\x4d\x22\x84\x10\x42\xda\x99\x2c\x8f\x57\x4f\x4e\x4e\x3e\
-\x49\xbd\xc6\x16\x9a\x15\xe9\x34\x75\xa3\x08\x21\x84\x90\x76\xa6\
-\x92\x37\x7f\x47\xbd\xbe\x16\xde\xb2\x65\x93\x7b\x15\xe9\x89\x4d\
-\x84\x10\x42\xc8\xd2\x12\xbe\x93\xd6\x36\xf5\xfa\xda\x13\xb2\xe1\
-\x78\xb6\xbe\x61\x84\x10\x42\xc8\xd2\xe3\x6a\xf1\x2c\xf5\xba\xda\
-\x33\xd2\x91\x92\x1d\x31\x8d\xab\x9b\x46\x08\x21\x84\x2c\x31\x1b\
-\x39\xfb\x5f\x20\x37\x32\x7e\x62\x7a\x65\x62\x01\x9a\x47\x08\x21\
-\x84\x2c\x22\x61\xab\x9d\xfd\xbf\x42\xbd\x9e\xf6\xa4\xcc\x87\x2f\
-\xeb\x1b\x48\x08\x21\x84\x2c\x26\xe1\x8b\xea\x75\xb4\x67\xad\x1c\
-\x1a\x3b\x2c\xf3\xf1\x56\x7d\x13\x09\x21\x84\x90\xf9\x27\xcb\xc3\
-\xcd\x6b\xd6\xd4\x9f\xaa\x5e\x47\x7b\x9a\xab\xc5\xb7\xa4\xaf\x51\
-\xd4\xcd\x24\x84\x10\x42\xe6\x97\xb0\x95\x57\xfe\xb6\x49\x96\xc7\
-\xcf\xe8\x1b\x4a\x08\x21\x84\xcc\x23\x3e\x7e\x4a\xbd\x6e\xf6\x8d\
-\x7a\xbd\xbe\x4f\x96\x87\x31\x79\x53\x09\x21\x84\x90\xb9\xb3\x3e\
-\xad\x59\xea\x75\xb3\xaf\xac\xf6\xe3\xcf\xce\x7c\xfc\x69\x01\x9a\
-\x4b\x08\x21\x84\xec\x1e\x1f\x6f\x1a\xb8\xbc\xf1\x2c\xf5\x7a\xd9\
-\x97\xdc\x70\x7c\x89\x15\xf9\x2e\x79\x93\x09\x21\x84\x90\x1d\x92\
-\xf9\x70\x8f\x1b\x6a\x1c\xaf\x5e\x27\xfb\x9a\xf3\xf1\xf5\x76\x94\
-\xf5\xa0\xba\xd9\x84\x10\x42\x48\x2b\xb6\x26\x55\xf2\xc6\x6b\xd5\
-\xeb\x63\x29\xa4\x97\x2a\xf0\x90\x20\x42\x08\x21\xea\xa4\xb5\x28\
-\x1b\x0e\xbf\xad\x5e\x17\x4b\xc5\x8e\xb6\xde\x96\xe5\xe1\x01\x75\
-\xf3\x09\x21\x84\x94\x33\xb6\xf8\x3f\x94\xde\x60\xab\x5e\x0f\x4b\
-\x29\x5d\x0e\x48\xd7\x5d\xd4\x43\x40\x08\x21\xa4\x5c\xb1\x85\xff\
-\xee\x6c\x28\xbc\x4e\xbd\x0e\x96\x5a\x36\x12\x8e\xcd\xf2\x70\xa3\
-\x7a\x18\x08\x21\x84\x94\x23\xe9\x17\x69\xdc\xf0\x57\x10\xe9\x27\
-\x82\x55\x1f\xaf\x54\x0f\x05\x21\x84\x90\xbe\xcf\x7a\xb7\x2e\x1e\
-\xad\x5e\xf7\xb0\x83\xf4\xe0\x85\x6a\x1e\x3e\xc9\x63\x83\x09\x21\
-\x84\xb4\x3b\x99\x0f\x8f\xdb\x99\xff\x45\xcb\x27\x26\xf6\x55\xaf\
-\x77\x98\x45\xeb\xdd\x01\x3e\xdc\xa2\x1e\x16\x42\x08\x21\xfd\x91\
-\xf4\x62\x1f\x9e\xed\xdf\x23\xd2\x1b\x98\xd2\x91\x1a\x3f\x15\x24\
-\x84\x10\xb2\xf8\x84\xad\xb6\x96\xac\xb8\x6c\x74\xc3\xd3\xd4\xeb\
-\x1a\x16\x68\xc0\x87\x13\xac\x89\x4d\xfd\x10\x11\x42\x08\xe9\xa9\
-\xf8\x70\x95\xab\xc5\x57\xa8\xd7\x31\x2c\xc1\xb2\x65\x93\x7b\x55\
-\x7d\xe3\xdd\x59\x1e\xbe\x2d\x1f\x28\x42\x08\x21\x85\x8e\x9d\xf1\
-\x6f\xb6\x85\xff\xac\xb4\x76\xa8\xd7\x2f\xb4\xc9\xe4\xe4\xe4\x93\
-\xac\xb1\xa7\x5a\x83\x37\xaa\x07\x8c\x10\x42\x48\xd1\x12\xae\xc9\
-\x86\xe3\xd9\xce\xb9\xbd\xd5\xeb\x15\x3a\xa4\x75\x20\x90\xc7\x93\
-\x2c\x97\x56\x7d\xb8\x4f\x3f\x74\x84\x10\x42\x14\xb1\x93\xc2\x2d\
-\xe9\x1a\x7f\xc5\x87\x37\xa9\xd7\x26\x74\x99\xab\xd7\x0f\xaa\xfa\
-\x78\x8e\x1d\x08\x8c\x66\x79\x78\x58\x3d\x8c\x84\x10\x42\x3a\x9b\
-\xe9\x7d\xfd\x88\xcb\xc3\x7b\x56\x8c\x6c\x3a\x50\xbd\x0e\xa1\x00\
-\x06\x07\x27\x0e\x98\xfe\x66\xe0\xc2\x6a\x1e\x1a\x76\x50\xf0\x88\
-\x7a\x50\x09\x21\x84\x2c\x2d\xad\x97\xf5\xf8\x30\x31\xfd\xcb\xb0\
-\xd3\x2e\xf5\xe3\x87\xa8\xd7\x1b\x14\x5c\x3a\x32\x4c\xbf\x22\xb0\
-\xc1\x39\xd3\x06\x67\x99\x0d\x52\xc5\x8e\x1c\xc7\x6c\x80\xae\xb6\
-\x5c\x67\xff\xf9\x1d\x7c\x6b\x40\x08\x21\xba\xa4\x7d\xf0\xd4\xbe\
-\xd8\xf6\xc9\xb6\x6f\x4e\x4f\x84\xb5\xfd\xf5\x80\xf3\xf1\x13\x6e\
-\xb8\x79\x46\xda\x87\xa7\x93\x3b\xf5\x7a\x02\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\xee\xbf\x01\xa7\x2c\x4a\
-\xc0\x4c\x69\x8e\x5a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x1a\x36\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x19\xe8\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\x4d\xaf\x65\xe5\x75\x27\x70\xa4\xee\x8e\xb1\xe4\xb8\xed\xb4\
-\x1c\xe1\x76\x8f\x22\x61\x75\x0f\x82\xec\xbc\x38\x2d\x65\x10\x94\
-\x7c\x86\x04\xfc\x15\xd2\x4a\xba\xbf\x02\x93\x44\x42\x1e\x13\x83\
-\xb1\x89\xda\x72\xd5\x39\xa7\x8b\x40\x42\xd5\x3e\x98\x0c\xae\x30\
-\xb5\xf7\x05\xc4\xc0\x12\x1e\xdb\x1d\x90\x07\x40\x7a\x40\x07\x4b\
-\x06\xc7\xee\xde\xfb\x16\x57\x40\xf1\x52\xf7\xd6\xbd\x55\xff\xb3\
-\xce\xfa\xfd\xa4\xbf\x74\x55\x2e\x8b\x5a\xcf\x5a\xcf\x7e\xf6\x79\
-\xbd\x77\xdc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x7c\xc8\x77\x87\xe7\x3f\xbb\xde\x8e\x5f\x5f\x0f\xe3\xb7\
-\xd6\xdb\xe9\xc5\xd5\x76\x7a\x7d\xfe\xf9\x9d\xf9\xe7\xff\x27\x52\
-\x36\xf3\x0c\x1f\xcd\xf2\xb5\x99\x7e\x64\x35\x8c\xf7\x3f\xf9\xe4\
-\xd5\x5f\x4f\xef\xb7\xf3\x66\xff\xca\x5e\xa6\xc9\xfe\x8d\xb9\x78\
-\xe5\x85\x2f\xcf\x0b\xfb\xed\xd5\x76\xfc\x59\xbc\xd9\x22\xb7\x21\
-\xcb\xac\xcf\x79\xf4\xd2\x33\x87\x77\xa7\xf7\xdf\x59\xd9\xbf\xd2\
-\x2d\xfb\xb4\x7f\x63\x36\x9b\xe9\xd3\xeb\x61\xfa\xc6\x6a\x98\x7e\
-\x91\x6e\xa8\x48\x24\xcb\xa3\x8b\x61\x7c\xf0\xb1\x83\x83\x3b\xd3\
-\xfb\xf1\xb4\xec\x5f\x69\x9f\xc2\xfb\x37\x6a\xb9\x73\x9a\x2f\x1e\
-\x2f\xc7\x1b\x28\xb2\x1b\x39\x7c\x7c\xfb\xec\x17\xd3\xfb\xf2\xa4\
-\xec\x5f\x91\x0f\xa4\xd4\xfe\x8d\xba\x30\x8c\x5f\x7d\xf7\x35\x95\
-\x74\xd3\x44\x76\x26\xab\xed\xf8\xea\x85\xe1\xf0\x9e\xf4\xfe\xbc\
-\x11\xfb\x57\xe4\xc3\xa9\xb2\x7f\xa3\x96\x47\x0e\x2e\x1e\x22\x1f\
-\x9d\xe5\x22\xb2\xb9\xfc\xc2\x5d\xe9\x7d\xfa\x71\xec\x5f\x91\x8f\
-\xcf\xae\xef\xdf\xa8\xe5\x75\x92\xf5\x30\xfd\x30\xdd\x24\x91\x5d\
-\xce\x6a\x18\x5f\x5a\x5e\x5f\x4f\xef\xd7\xeb\xd9\xbf\x22\x37\xce\
-\xae\xee\xdf\xb8\xe5\x0d\x43\xe9\xe6\x88\x54\xc8\xfc\x48\xe2\x81\
-\xf4\x7e\xbd\x9e\xfd\x2b\x72\xb2\xec\xe2\xfe\x8d\x3a\xfa\xa8\x90\
-\x77\x0b\x8b\x9c\x28\xf3\x5e\xf9\x97\x5d\x7a\x2a\xd1\xfe\x15\x39\
-\x79\x76\x6d\xff\xc6\x2d\x9f\x13\x4e\x37\x45\xa4\x52\xe6\x47\x11\
-\x0f\xa5\xf7\xed\x31\xfb\x57\xe4\x74\xd9\xa5\xfd\x1b\xb5\x7c\x43\
-\x98\x2f\x09\x11\x39\x65\x86\xf1\xad\x5d\xf8\xc6\x31\xfb\x57\xe4\
-\x26\xb2\x23\xfb\x37\xee\xe8\xeb\x41\xd3\xcd\x10\x29\x98\xcd\x95\
-\xc3\xfb\xec\x5f\x91\x9a\xd9\x85\xfd\x1b\xf7\xee\x77\x83\xc7\x9b\
-\x21\x52\x2d\xab\xed\xf4\xb0\xfd\x2b\x52\x33\xbb\xb0\x7f\xe3\xe6\
-\x85\x78\x31\xdd\x08\x91\xa2\x39\xb4\x7f\x45\xca\x26\xbe\x7f\xe3\
-\xd6\xdb\xf1\x8d\x1d\x68\x84\x48\xb9\xac\x86\xe9\x35\xfb\x57\xa4\
-\x66\x76\x61\xff\xc6\xad\xb6\xe3\xdb\xe9\x46\x88\x54\xcc\x6a\x3b\
-\xfd\xdc\xfe\x15\xa9\x99\x5d\xd8\xbf\x71\xe9\x26\x88\x54\x8e\xfd\
-\x2b\x52\x37\xe9\xfd\x1b\x97\x6e\x80\x48\xe5\xd8\xbf\x22\x75\x93\
-\xde\xbf\x71\xe9\x06\x88\x54\x8e\xfd\x2b\x52\x37\xe9\xfd\x1b\x97\
-\x6e\x80\x48\xe5\xd8\xbf\x22\x75\x93\xde\xbf\x71\xe9\x06\x88\x54\
-\x8e\xfd\x2b\x52\x37\xe9\xfd\x1b\x97\x6e\x80\x48\xe5\xd8\xbf\x22\
-\x75\x93\xde\xbf\x71\xe9\x06\x88\x54\x8e\xfd\x2b\x52\x37\xe9\xfd\
-\x1b\x97\x6e\x80\x48\xe5\xd8\xbf\x22\x75\x93\xde\xbf\x71\xe9\x06\
-\x88\x54\x8e\xfd\x2b\x52\x37\xe9\xfd\x1b\x97\x6e\x80\x48\xe5\xd8\
-\xbf\x22\x75\x93\xde\xbf\x71\xe9\x06\x88\x54\x8e\xfd\x2b\x52\x37\
-\xe9\xfd\x1b\x97\x6e\x80\x48\xe5\xd8\xbf\x22\x75\x93\xde\xbf\x71\
-\xe9\x06\x88\x54\x8e\xfd\x2b\x52\x37\xe9\xfd\x1b\x97\x6e\x80\x48\
-\xe5\xd8\xbf\x22\x75\x93\xde\xbf\x71\xe9\x06\x88\x54\x8e\xfd\x2b\
-\x52\x37\xe9\xfd\x1b\x97\x6e\x80\x48\xe5\xd8\xbf\x22\x75\x93\xde\
-\xbf\x71\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\
-\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\
-\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\
-\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\
-\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\
-\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\
-\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\
-\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\
-\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\
-\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\
-\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\
-\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\
-\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\
-\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\
-\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\
-\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\
-\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\
-\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\
-\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\
-\xc3\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\
-\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\
-\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\
-\x37\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\
-\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\
-\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\
-\x7e\xc3\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\
-\x95\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\
-\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\
-\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\
-\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\
-\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\
-\x66\x7e\xc3\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\
-\x00\x95\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\
-\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\
-\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\
-\x06\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\
-\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\
-\xd4\x66\x7e\xc3\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\
-\x69\x00\x95\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\
-\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\
-\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\
-\x98\x06\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\
-\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\
-\xfd\xd4\x66\x7e\xc3\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\
-\x86\x69\x00\x95\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\
-\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\
-\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\
-\x6f\x98\x06\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\
-\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\xab\xed\xf8\
-\x76\x6a\x76\x57\xdb\xe9\xe7\xea\x87\x9b\xe7\xfc\x09\xd3\x00\x2a\
-\x5b\x6f\xc7\x37\x62\x07\xe0\x30\xbd\xa6\x7e\xb8\x79\xce\x9f\x30\
-\x0d\xa0\xb2\x79\x86\x5e\x0c\xce\xef\xa1\xfa\xe1\xe6\x39\x7f\xc2\
-\x34\x80\xca\x56\xdb\xe9\x91\xd8\xfc\x0e\xe3\x37\xd5\x0f\x37\xcf\
-\xf9\x13\xa6\x01\x54\xb6\x1a\xc6\xfb\x53\xb3\x3b\x1f\xbe\x7f\xaa\
-\x7e\xb8\x79\xce\x9f\x30\x0d\xa0\xb2\xcd\xc1\xc1\x67\xe6\x47\xa2\
-\x6f\xdd\xf6\xd9\x9d\xff\x9b\xcb\x7f\x5b\xfd\x70\xf3\x9c\x3f\x61\
-\x1a\x40\x75\xab\xed\xf8\xe8\xed\x9e\xdb\xe5\xa9\xf7\x74\xdd\xc7\
-\xba\xd7\x4f\x5d\xce\x9f\x30\x0d\xa0\xba\x4b\xcf\x1c\xde\x3d\x3f\
-\x22\x7d\xe7\xf6\x1d\x7e\xe3\xdb\x97\x2e\x3f\xf7\x5b\xe9\xba\x8f\
-\x75\xaf\x9f\xba\x9c\x3f\x61\x1a\xc0\x3e\x58\x0d\xe3\x83\xb7\xef\
-\x00\x9c\xfe\x3a\x5d\xef\xf5\xba\xd7\x4f\x4d\xce\x9f\x30\x0d\x60\
-\x1f\x3c\x76\x70\x70\xe7\x3c\x4f\x87\xb7\xfc\xf0\x1b\xa6\x69\x18\
-\x86\x4f\xa5\xeb\xbd\x5e\xf7\xfa\xa9\xc9\xf9\x13\xa6\x01\xec\x8b\
-\xcd\xe5\x17\xee\x5a\x0f\xe3\x2b\xb7\x6c\x5e\x87\xe9\xa7\x9b\xa7\
-\xa6\x2f\xa5\xeb\xfc\x38\xdd\xeb\xa7\x1e\xe7\x4f\x98\x06\xb0\x4f\
-\x2e\x0c\x87\xf7\xac\xb6\xe3\xab\xe7\x7f\xf8\x8d\xaf\x6c\xae\x4c\
-\xbf\x9d\xae\xef\x46\xba\xd7\x4f\x2d\xce\x9f\x30\x0d\x60\xdf\x6c\
-\x86\x1f\x7c\x61\x9e\xad\x67\xcf\x6b\x46\x97\xa7\xbd\x97\x47\xd7\
-\xe9\xba\x4e\xaa\x7b\xfd\xd4\xe1\xfc\x09\xd3\x00\xf6\xd1\xf2\x3a\
-\xf5\xfc\x48\xf8\x81\xb3\x7c\x46\xfe\xe8\x17\xed\x0c\xe3\x5f\x55\
-\x7c\xcd\xbb\x7b\xfd\xd4\xe0\xfc\x09\xd3\x00\xf6\xd9\xf2\xc8\x75\
-\x3e\xc8\x1e\x3a\xd5\x41\x38\xff\xdd\xd5\x76\x7a\x78\x1f\x3e\xea\
-\xd6\xbd\x7e\x76\x9b\xf3\x27\x4c\x03\xe8\x60\xf9\xd6\xba\xcd\x95\
-\xc3\xfb\x96\xef\xaf\x5f\x6f\xc7\xe7\x97\xdf\x64\xb7\x3c\xc2\x3d\
-\xca\xfc\xf3\xb5\x3f\x1b\xff\x66\x9e\xc9\x3f\xdb\xc7\x6f\xb8\xeb\
-\x5e\xff\xad\xb0\xd9\xfc\xe8\xd7\x96\xa4\xff\x1d\x95\x39\x7f\xc2\
-\x34\x00\xe0\x93\x3d\xbe\x7d\xf6\x8b\xf3\x4d\xd2\x7f\x5b\x6d\xa7\
-\xff\x35\xdf\x30\xfd\xe8\xfd\xbf\x86\x79\xfe\xb3\xd7\xd7\xc3\xf4\
-\xf2\xfc\xf3\x66\xbe\x89\xfa\x73\xef\x97\x38\x39\xe7\x4f\x98\x06\
-\x00\x7c\xb4\xcd\xd3\xd3\xd7\x56\xdb\xf1\xef\xe6\x43\xfe\x5f\x4f\
-\x7a\x4d\x3b\xfa\xbb\xc3\xf8\xf8\x85\x2b\x57\x7f\x2f\xfd\xef\xdf\
-\x75\xce\x9f\x30\x0d\x00\xf8\xa0\x27\x9e\x38\xf8\xdc\xfc\x68\xfe\
-\xb1\x39\xbf\xba\xd9\x6b\xdb\xd1\xff\x77\x98\xbe\xb3\xf9\xc7\x97\
-\xfe\x7d\xba\x9e\x5d\xe5\xfc\x09\xd3\x00\x80\xf7\x5c\x18\xc6\xaf\
-\xce\x8f\xe0\x7f\x72\x5e\xd7\xb8\xf9\x46\xe0\xc7\x9b\xcb\x57\xbf\
-\x92\xae\x6b\x17\x39\x7f\xc2\x34\x00\xe0\x9a\xcd\x30\xfd\xd1\x7a\
-\x3b\xbe\x79\xfe\xd7\xba\xf1\xcd\x8b\xdb\xc3\x7b\xd3\xf5\xed\x1a\
-\xe7\x4f\x98\x06\x00\xbc\xfb\xc8\xff\x96\x1c\xfe\xd7\xb2\xda\x8e\
-\x3f\xdb\x5c\x19\xff\x38\x5d\xe7\x2e\x71\xfe\x84\x69\x00\xd0\xdd\
-\xbb\xaf\xf9\xff\xf8\x56\x5f\xef\x96\x9b\x80\x8b\xc3\xf8\x27\xe9\
-\x7a\x77\x85\xf3\x27\x4c\x03\x80\xee\x96\x37\xfc\xdd\xae\x6b\x9e\
-\x67\x02\xde\xe3\xfc\x09\xd3\x00\xa0\xb3\xa3\x8f\xfa\x9d\xe1\xdd\
-\xfe\x6e\x02\x6e\x9e\xf3\x27\x4c\x03\x80\xce\x96\xcf\xf9\x27\xae\
-\x7d\x6e\x02\x9c\x3f\x71\x1a\x00\x74\xb5\x7c\xc3\xdf\x69\xbe\xe4\
-\xe7\x56\xdc\x04\x74\x7e\x4f\x80\xf3\x27\x4c\x03\x80\xae\x96\xaf\
-\xf7\x4d\x5f\x03\x3b\x3f\x13\x90\x5e\xfb\x74\xfd\x71\x1a\x00\x74\
-\xb5\x7c\xb7\x7f\xfa\x1a\xd8\xf9\x26\x20\xbd\xee\xe9\xfa\xe3\x34\
-\x00\xe8\xea\xda\x2f\xf6\xc9\xdf\x00\x1c\xdf\x04\x74\x7b\x39\x20\
-\xbd\xe6\xe9\xfa\xe3\x34\x00\xe8\x6a\x35\x8c\xff\x27\x7d\x0d\xec\
-\x7c\x13\x90\x5e\xef\x74\xfd\x71\x1a\x00\x74\xb4\xd9\xfc\xe8\xd7\
-\x6e\xf7\xc7\xff\xdc\x04\x7c\x50\x7a\xad\xd3\xf5\xc7\x69\x00\xd0\
-\xd1\xae\xde\x00\x74\xba\x09\x48\xaf\x73\xba\xfe\x38\x0d\x00\xba\
-\x5a\x6f\xc7\x37\xd2\xd7\xc0\xce\x37\x01\xe9\x35\x4e\xd7\x1f\xa7\
-\x01\x40\x57\xeb\x61\x7a\x39\x7d\x0d\xec\x7c\x13\x90\x5e\xdf\x74\
-\xfd\x71\x1a\x00\x74\x35\x5f\x83\x36\xe9\x6b\xe0\x49\x6e\x02\xf6\
-\xf5\x23\x82\xe9\xb5\x4d\xd7\x1f\xa7\x01\x40\x57\xab\x61\xfc\xf3\
-\xf4\x35\xb0\xf3\x4d\x40\x7a\x5d\xd3\xf5\xc7\x69\x00\xd0\xd5\xe3\
-\xdf\x1f\x7f\x73\x35\x4c\xbf\x48\x5f\x07\x4f\x7a\x13\xb0\x6f\x2f\
-\x07\xa4\xd7\x34\x5d\x7f\x9c\x06\x00\x9d\xad\x87\xf1\xf1\xf4\x75\
-\xf0\x34\x37\x01\xfb\xf4\x4c\x40\x7a\x3d\xd3\xf5\xc7\x69\x00\xd0\
-\xd9\x85\x2b\x57\x7f\x6f\x57\x3f\x0e\xb8\xef\x37\x01\xe9\xb5\x4c\
-\xd7\x1f\xa7\x01\x40\x77\xeb\x61\xfa\x4e\xfa\x5a\xd8\xf1\x26\x20\
-\xbd\x8e\xe9\xfa\xe3\x34\x00\xe8\xee\x89\x27\x0e\x3e\xb7\x1a\xc6\
-\x1f\xa7\xaf\x87\xa7\xbd\x09\xa8\xfe\x9e\x80\xf4\x1a\xa6\xeb\x8f\
-\xd3\x00\x80\x3b\xee\xd8\x5c\xbe\xfa\x95\xf5\x76\x7c\x33\x7d\x4d\
-\x3c\xed\x4d\x40\xe5\x67\x02\xd2\xeb\x97\xae\x3f\x4e\x03\x00\xae\
-\xb9\xb8\x3d\xbc\x77\x3d\x8c\x6f\xa5\xaf\x8b\x5d\x6e\x02\xd2\x6b\
-\x97\xae\x3f\x4e\x03\x00\xde\xb3\xba\x32\xfd\x61\xc5\x67\x02\x2a\
-\xbe\x1c\x90\x5e\xb7\x74\xfd\x71\x1a\x00\xf0\x41\x9b\xef\x3f\xff\
-\xbb\xab\x61\xfc\xe7\xf4\xf5\x71\xdf\x6f\x02\xd2\x6b\x96\xae\x3f\
-\x4e\x03\x00\x3e\x6c\x79\x4f\xc0\x6a\x3b\xbd\x9e\xbe\x46\xee\xf3\
-\x4d\x40\x7a\xbd\xd2\xf5\xc7\x69\x00\xc0\x47\xbb\xf4\xf4\xf8\x9f\
-\xd7\xc3\xf4\xd3\xf4\x75\x72\x5f\x6f\x02\xd2\x6b\x95\xae\x3f\x4e\
-\x03\x6e\x8f\xef\x0e\xcf\x7f\x76\xbd\x1d\xbf\xbe\x1e\xc6\x6f\xcd\
-\x75\xbf\x78\xf4\xc8\x62\x18\xdf\x49\xaf\xbf\x88\xec\x5f\xaa\xbc\
-\x31\x30\xbd\x4e\xe9\xfa\xe3\x34\xe0\xd6\xba\x78\xe5\x85\x2f\xcf\
-\x87\xfd\xb7\x97\x0d\x99\x5e\x6b\x11\xe9\x93\x0a\x37\x01\xe9\x35\
-\x4a\xd7\x1f\xa7\x01\xb7\xc6\x66\x33\x7d\x7a\x3d\x4c\xdf\xa8\xf2\
-\x8b\x46\x44\x64\xff\xb2\xeb\x37\x01\xe9\xf5\x49\xd7\x1f\xa7\x01\
-\xe7\xef\xd2\x33\x87\x77\xcf\x87\xff\xcb\xe9\xb5\x15\x11\xd9\xe5\
-\x9b\x80\xf4\xda\xa4\xeb\x8f\xd3\x80\xf3\x75\x61\x18\xbf\x5a\xed\
-\x9d\xc3\x22\xb2\xdf\x39\x7a\x63\xe0\xf6\xf0\xde\xf4\xf5\xf1\x7a\
-\xe9\x75\x49\xd7\x1f\xa7\x01\xe7\x67\x79\xe4\xef\xf0\x17\x91\xdd\
-\xcc\xf8\xe6\x7c\x7d\xfa\x9d\xf4\x75\xf2\xfd\xd2\x6b\x92\xae\x3f\
-\x4e\x03\xce\xc7\x63\x07\x07\x77\xae\x87\xe9\x87\xe9\xf5\x14\x11\
-\xf9\xd8\x0c\xe3\x2b\x7f\xf7\x8f\x2f\xfc\x87\xf4\xf5\xf2\x58\x7a\
-\x3d\xd2\xf5\xc7\x69\xc0\xf9\x58\xde\xf0\x97\x5e\x4b\x11\x91\x1b\
-\x65\xb5\x1d\xff\x36\x7d\xbd\x3c\x96\x5e\x8b\x74\xfd\x71\x1a\x70\
-\x76\x47\x1f\xf5\xf3\x6e\x7f\x11\x29\x90\xd5\x30\xfe\x6a\xf3\xf4\
-\xf4\xb5\xf4\x75\x73\x91\x5e\x8b\x74\xfd\x71\x1a\x70\x76\xcb\xe7\
-\xfc\xd3\xeb\x28\x22\x72\xf2\x8c\xff\x90\xbe\x6e\x2e\xd2\xeb\x90\
-\xae\x3f\x4e\x03\xce\x66\xf9\x86\x3f\x5f\xf2\x23\x22\xb5\x32\xfe\
-\xf2\xf1\xe1\xf9\xff\x94\xbe\x7e\xa6\xd7\x21\x5d\x7f\x9c\x06\x9c\
-\xcd\xd1\xd7\xfb\xc6\x37\xb3\x88\xc8\x69\x33\xfe\x65\xfe\xfa\x99\
-\x5d\x83\x74\xfd\x71\x1a\x70\x36\xef\x7e\xb7\xff\x0e\x6c\x66\x11\
-\x91\x53\x64\x98\x9e\x8c\x5f\x3f\xc3\x6b\x90\xae\x3f\x4e\x03\xce\
-\x66\xae\xe1\xc5\xf4\x1a\x8a\x88\x9c\x3a\xc3\xf8\x93\x1d\xb8\x7e\
-\x46\xd7\x20\x5d\x7f\x9c\x06\x9c\xcd\x7a\x3b\xbe\x91\x5e\x43\x11\
-\x91\xd3\x67\xfc\xe5\xc1\xc1\xc1\xbf\xcd\x5e\x3f\xb3\x6b\x90\xac\
-\x7d\x27\x68\xc0\xd9\xac\xb6\xe3\xdb\xe9\x35\x14\x11\xb9\x99\x7c\
-\xef\xf2\x73\x9f\x4f\x5e\x3f\xd3\xf5\x27\x6b\xdf\x09\x1a\x70\x36\
-\x6e\x00\x44\xa4\x6a\xdc\x00\x34\xa7\x01\x67\xe3\x25\x00\x11\xa9\
-\x19\x2f\x01\x24\x6b\xdf\x09\x1a\x70\x36\x6b\x6f\x02\x14\x91\x8a\
-\xf1\x26\xc0\xf2\xe7\xcf\x99\x69\xc0\xd9\xac\xb6\xd3\x23\xe9\x35\
-\x14\x11\xb9\x89\x3c\x91\xbe\x7e\xa6\xd7\x20\x5d\x7f\x9c\x06\x9c\
-\xcd\x6a\x18\xef\x4f\xaf\xa1\x88\xc8\x69\xb3\x1a\xa6\xbf\x48\x5f\
-\x3f\xd3\x6b\x90\xae\x3f\x4e\x03\xce\x66\x73\x70\xf0\x99\xf5\x30\
-\xbe\x95\x5e\x47\x11\x91\x93\xc7\x57\x01\x2f\x49\xd7\x1f\xa7\x01\
-\x67\xb7\xda\x8e\x8f\xa6\xd7\x51\x44\xe4\xa4\x59\x0d\xe3\xdf\xa7\
-\xaf\x9b\x8b\xf4\x3a\xa4\xeb\x8f\xd3\x80\xb3\xbb\xf4\xcc\xe1\xdd\
-\xeb\x61\x7c\x27\xbd\x96\x22\x22\x37\xca\xf2\xeb\x80\xe7\xfc\x7e\
-\xfa\xba\xb9\x48\xaf\x45\xba\xfe\x38\x0d\x38\x1f\xf3\x86\x7a\x30\
-\xbd\x96\x22\x22\x37\xcc\x30\x7d\x27\x7d\xbd\x3c\x96\x5e\x8b\x74\
-\xfd\x71\x1a\x70\x3e\x1e\x3b\x38\xb8\x73\xae\xe7\x30\xbd\x9e\x22\
-\x22\x1f\x97\xd5\x30\xfd\xd3\xe6\xe9\xe9\x37\xd2\xd7\xcb\x63\xe9\
-\xf5\x48\xd7\x1f\xa7\x01\xe7\xe7\xf1\xed\xb3\x5f\x5c\x6d\xc7\x57\
-\xd3\x6b\x2a\x22\xf2\xe1\x8c\x6f\x6e\x2e\x5f\xfd\x4a\xfa\x3a\xf9\
-\x7e\xe9\x35\x49\xd7\x1f\xa7\x01\xe7\xeb\xc2\x70\x78\x8f\x9b\x00\
-\x11\xd9\xa5\xcc\xd7\xa4\x9f\x5d\xdc\x1e\xde\x9b\xbe\x3e\x5e\x2f\
-\xbd\x2e\xe9\xfa\xe3\x34\xe0\xfc\x6d\x86\x1f\x7c\x61\xae\xed\xd9\
-\xf4\xda\x8a\x88\x1c\x1d\xfe\xc3\xf8\x27\xe9\xeb\xe2\x47\x49\xaf\
-\x4d\xba\xfe\x38\x0d\xb8\x35\x86\x61\xf8\xd4\xbc\xf1\x1e\xf0\x1d\
-\x01\x22\x92\xca\x72\xf8\x6f\xae\x8c\x7f\x9c\xbe\x1e\x7e\x9c\xf4\
-\xfa\xa4\xeb\x8f\xd3\x80\x5b\x6b\x73\xf9\x85\xbb\xe6\x4d\xf8\x90\
-\x1b\x01\x11\xb9\x9d\xd9\xf5\xc3\x7f\x91\x5e\xa3\x74\xfd\x71\x1a\
-\x70\x7b\x2c\xdf\x18\xb8\xb9\x72\x78\xdf\x7c\x23\xf0\xcd\xf5\x76\
-\x7c\x7e\x35\x4c\xaf\xf9\x55\xc2\x22\x72\x2b\x52\xe1\xf0\x5f\xa4\
-\xd7\x29\x5d\x7f\x9c\x06\x00\x7c\xb4\x8b\x97\x0f\xff\xcb\x7a\x98\
-\x7e\x9a\xbe\x4e\x9e\xf6\xf0\xdf\xd5\xd7\xfc\xaf\x97\x5e\xab\x74\
-\xfd\x71\x1a\x00\xf0\x61\xcb\x47\xe6\x56\xdb\xe9\xf5\xf4\x35\x72\
-\x5f\x0f\xff\x45\x7a\xbd\xd2\xf5\xc7\x69\x00\xc0\x07\x6d\xbe\xff\
-\xfc\xef\xae\x86\xf1\x9f\xd3\xd7\xc7\x7d\x3e\xfc\x17\xe9\x35\x4b\
-\xd7\x1f\xa7\x01\x00\xef\x59\x5d\x99\xfe\x70\xf9\xd2\x9c\xf4\xb5\
-\x71\xdf\x0f\xff\x45\x7a\xdd\xd2\xf5\xc7\x69\x00\xc0\x35\xcb\x97\
-\xe5\x54\xfb\xc4\x4e\x95\x37\xfc\x7d\x94\xf4\xda\xa5\xeb\x8f\xd3\
-\x00\x80\x77\x9f\xf6\xdf\x4e\xff\x37\x7d\x4d\xec\x72\xf8\x2f\xd2\
-\xeb\x97\xae\x3f\x4e\x03\x80\xee\xbe\x77\xf9\xb9\xcf\xcf\x8f\xfc\
-\x7f\x92\xbe\x1e\x9e\xf6\xf0\xaf\xf8\xb4\xff\xfb\xa5\xd7\x30\x5d\
-\x7f\x9c\x06\x00\xdd\xad\x86\xe9\x7f\xa6\xaf\x85\xa7\x3d\xfc\x2b\
-\x3f\xf2\x3f\x96\x5e\xc7\x74\xfd\x71\x1a\x00\x74\xb6\x1a\x9e\xfb\
-\xaf\xab\x61\xfc\x55\xfa\x5a\xd8\xed\xf0\x5f\xa4\xd7\x32\x5d\x7f\
-\x9c\x06\x00\x9d\xad\x87\xe9\xa9\xf4\x75\xb0\xe3\xe1\xbf\x48\xaf\
-\x67\xba\xfe\x38\x0d\x00\xba\xda\x3c\x35\x7d\x69\xb5\x9d\xfe\x35\
-\x7d\x1d\x3c\xe9\xe1\x5f\xfd\x35\xff\xeb\xa5\xd7\x34\x5d\x7f\x9c\
-\x06\x00\x5d\xad\x86\xe9\x7f\xa4\xaf\x81\x27\x3d\xfc\xf7\xe9\x91\
-\xff\xb1\xf4\xba\xa6\xeb\x8f\xd3\x00\xa0\xab\xd5\x30\xfe\x7d\xfa\
-\x1a\xd8\xf5\xf0\x5f\xa4\xd7\x36\x5d\x7f\x9c\x06\x00\x5d\xad\x87\
-\xf1\x95\xf4\x35\xf0\x46\x87\xff\xbe\x3d\xed\xff\x7e\xe9\xf5\x4d\
-\xd7\x1f\xa7\x01\x40\x47\x0f\xbf\xf4\xd2\xbf\x5b\x6f\xc7\x5f\xa6\
-\xaf\x81\x9f\x74\xf8\xef\xeb\x23\xff\x63\xe9\x35\x4e\xd7\x1f\xa7\
-\x01\x40\x47\x9b\xa7\xa7\xdf\x48\x5f\xff\x3e\xe9\xf0\xdf\xe7\x47\
-\xfe\xc7\xd2\xeb\x9c\xae\x3f\x4e\x03\x80\x8e\x76\xf5\x06\xa0\xcb\
-\xe1\xbf\x48\xaf\x75\xba\xfe\x38\x0d\x00\x3a\xda\xc5\x97\x00\x3a\
-\x3c\xed\xff\x7e\xe9\xf5\x4e\xd7\x1f\xa7\x01\x40\x57\xab\x61\xfa\
-\xa7\xf4\x35\xf0\xfd\x87\x7f\x97\x47\xfe\xc7\xd2\x6b\x9e\xae\x3f\
-\x4e\x03\x80\xae\xd6\xc3\xf4\x64\xfa\x1a\x78\x7c\xf8\x77\x7a\xe4\
-\x7f\x2c\xbd\xee\xe9\xfa\xe3\x34\x00\xe8\x6a\xb3\x1d\xff\x7b\xfa\
-\x1a\xd8\xf5\xf0\x5f\xa4\xd7\x3e\x5d\x7f\x9c\x06\x00\x5d\x5d\x78\
-\xe6\xea\x7f\x4c\x7e\x15\x70\xc7\xa7\xfd\xdf\xcf\xf9\x13\xa6\x01\
-\x40\x67\xa9\x6f\x03\xec\xfc\xc8\xff\x98\xf3\x27\x4c\x03\x80\xce\
-\x2e\x5c\x3e\xfc\x83\xdb\xfd\xeb\x80\x1d\xfe\xd7\x38\x7f\xc2\x34\
-\x00\xe8\x6e\x3e\x90\xff\xd6\xe1\x7f\xfb\x39\x7f\xc2\x34\x00\xe8\
-\xee\x89\x27\x0e\x3e\xb7\x1a\xc6\x1f\xdf\x8e\xc3\xbf\xf3\x6b\xfe\
-\xd7\x73\xfe\x84\x69\x00\xc0\x1d\x77\x5c\x18\xc6\xaf\xae\xb7\xe3\
-\x9b\xb7\xf2\xf0\xf7\xc8\xff\x83\x9c\x3f\x61\x1a\x00\x70\xcd\x66\
-\x98\xfe\xe8\xd6\xdc\x04\x8c\x6f\x5e\xdc\x1e\xde\x9b\xae\x6f\xd7\
-\x38\x7f\xc2\x34\x00\xe0\x3d\xab\xed\xf4\x3b\x73\xfe\xf7\x79\x5d\
-\xe3\x96\x97\x16\x36\x97\xaf\x7e\x25\x5d\xd7\x2e\x72\xfe\x84\x69\
-\x00\xc0\x07\x7d\xef\xf2\x73\x9f\x5f\xde\x18\x78\x96\x4f\x07\x1c\
-\xfd\x7f\x87\xe9\x3b\xcb\xfb\x0b\xd2\xf5\xec\x2a\xe7\x4f\x98\x06\
-\x00\x7c\xb4\xcd\xd3\xd3\xd7\xd6\xdb\xf1\x1f\x4e\xf7\x4b\x83\xc6\
-\x5f\x2e\xdf\x2d\x30\xe7\xf7\xd3\xff\xfe\x5d\xe7\xfc\x09\xd3\x00\
-\x80\x4f\xb6\x79\x6a\xfa\xd2\x7c\xb0\xff\xe5\xd1\xef\x0e\x18\xc6\
-\x9f\x7c\xf0\x86\x60\xfe\x79\xf9\xb3\xf9\x7f\x5b\x0d\xd3\x5f\x2c\
-\x7f\x37\xfd\xef\xad\xc2\xf9\x13\xa6\x01\x74\xf0\xdd\xe1\xf9\xcf\
-\xce\x17\xea\xaf\xcf\x17\xea\x6f\xcd\x73\xf7\xe2\x6a\x3b\xbd\x3e\
-\xff\xfc\xce\x92\xa3\x9f\xaf\xfd\xd9\x23\xf3\xa3\xb6\xfb\x9f\x7c\
-\xf2\xea\xaf\xa7\xff\xbd\xe7\xad\x7b\xfd\xe7\x6d\xb3\xd9\xfc\x9b\
-\xe5\x65\x82\x25\xcb\xcf\xe9\x7f\x4f\x55\xce\x9f\x30\x0d\x60\x9f\
-\x5d\xbc\xf2\xc2\x97\xe7\x83\xed\xdb\xcb\x47\xb0\x4e\x3a\x93\xcb\
-\xdf\x9d\xf3\xe8\xa5\x67\x0e\xef\x4e\xff\xfb\xcf\xaa\x7b\xfd\xec\
-\x36\xe7\x4f\x98\x06\xb0\x8f\x36\x9b\xe9\xd3\xeb\x61\xfa\xc6\x6a\
-\x98\x7e\x71\xd3\xf3\xb9\x3c\x3a\x1e\xc6\x07\x1f\x3b\x38\xb8\x33\
-\x5d\xcf\x69\x75\xaf\x9f\x1a\x9c\x3f\x61\x1a\xc0\xbe\x59\x1e\xb9\
-\xce\x87\xdf\xcb\xe7\x38\xa7\x87\x8f\x6f\x9f\xfd\x62\xba\xae\x93\
-\xea\x5e\x3f\x75\x38\x7f\xc2\x34\x80\x7d\xb2\x7c\x9b\xdb\xbb\xaf\
-\x69\x9f\xeb\x9c\xae\xb6\xe3\xab\x17\x86\xc3\x7b\xd2\xf5\xdd\x48\
-\xf7\xfa\xa9\xc5\xf9\x13\xa6\x01\xec\x8b\xe5\x91\xef\xad\x38\xfc\
-\xde\x7f\x08\x6e\x2e\xbf\x70\x57\xba\xce\x8f\xd3\xbd\x7e\xea\x71\
-\xfe\x84\x69\x00\xfb\x60\x79\x9d\x7a\x3d\x4c\x3f\xbc\xd5\xf3\xba\
-\x1a\xc6\x97\x96\xd7\xd7\xd3\xf5\x5e\xaf\x7b\xfd\xd4\xe4\xfc\x09\
-\xd3\x00\xf6\xc1\xf2\x86\xb7\xdb\x35\xb3\xf3\x23\xe1\x07\xd2\xf5\
-\x5e\xaf\x7b\xfd\xd4\xe4\xfc\x09\xd3\x00\xaa\x3b\xfa\xa8\xdb\x59\
-\xde\xed\x7e\xda\x03\x70\x98\xfe\x65\x97\x9e\x0a\xef\x5e\x3f\x75\
-\x39\x7f\xc2\x34\x80\xea\x96\xcf\xb9\xdf\xee\xb9\x9d\x1f\x05\x3f\
-\x94\xae\xfb\x58\xf7\xfa\xa9\xcb\xf9\x13\xa6\x01\x54\xb6\x7c\xc3\
-\xdd\x69\xbe\xe4\xe6\xdc\x32\x8c\x6f\xed\xc2\x37\xe6\x75\xaf\x9f\
-\xda\x9c\x3f\x61\x1a\x40\x65\x47\x5f\x6f\x1b\x9a\xdd\xcd\x95\xc3\
-\xfb\xd4\x0f\x37\xcf\xf9\x13\xa6\x01\x54\xf6\xee\x77\xdb\x47\x66\
-\x77\xb5\x9d\x1e\x56\x3f\xdc\x3c\xe7\x4f\x98\x06\x50\xd9\x3c\x43\
-\x2f\x06\xe7\xf7\x50\xfd\x70\xf3\x9c\x3f\x61\x1a\x40\x65\xeb\xed\
-\xf8\x46\x6a\x76\x57\xc3\xf4\x9a\xfa\xe1\xe6\x39\x7f\xc2\x34\x80\
-\xca\x56\xdb\xf1\xed\xd8\x01\xb8\x9d\x7e\xae\x7e\xb8\x79\xce\x9f\
-\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\x65\
-\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\xca\xba\xcf\x6f\xf7\
-\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\xee\xf5\x53\x9b\xf9\
-\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\x54\
-\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\x76\
-\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\x99\
-\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\x40\
-\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\xca\xba\xcf\x6f\
-\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\xee\xf5\x53\x9b\
-\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\x01\
-\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\xfc\
-\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\xed\x5e\x3f\xb5\
-\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\x1a\
-\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\xca\xba\xcf\
-\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\xee\xf5\x53\
-\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\xa6\
-\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\xfb\
-\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\xed\x5e\x3f\
-\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\x61\
-\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\xca\xba\
-\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\xee\xf5\
-\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\x1b\
-\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\xac\
-\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\xed\x5e\
-\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\xbf\
-\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\xca\
-\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\xee\
-\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\xf3\
-\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\xa8\
-\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\xed\
-\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\x33\
-\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\x80\
-\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\xdf\
-\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\x36\
-\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\x03\
-\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\xf9\
-\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\x6a\
-\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\x34\
-\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\x9f\
-\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\xa7\
-\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\x4c\
-\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\xf7\
-\xf9\xed\x5e\x3f\xb5\x99\xdf\x30\x0d\xa0\xb2\xee\xf3\xdb\xbd\x7e\
-\x6a\x33\xbf\x61\x1a\x40\x65\xdd\xe7\xb7\x7b\xfd\xd4\x66\x7e\xc3\
-\x34\x80\xca\xba\xcf\x6f\xf7\xfa\xa9\xcd\xfc\x86\x69\x00\x95\x75\
-\x9f\xdf\xee\xf5\x53\x9b\xf9\x0d\xd3\x00\x2a\xeb\x3e\xbf\xdd\xeb\
-\xa7\x36\xf3\x1b\xa6\x01\x54\xd6\x7d\x7e\xbb\xd7\x4f\x6d\xe6\x37\
-\x4c\x03\xa8\xac\xfb\xfc\x76\xaf\x9f\xda\xcc\x6f\x98\x06\x50\x59\
-\xf7\xf9\xed\x5e\x3f\xb5\x99\xdf\xb0\x74\x03\x44\x2a\xc7\xfe\x15\
-\xa9\x9b\xf4\xfe\x8d\x4b\x37\x40\xa4\x72\xec\x5f\x91\xba\x49\xef\
-\xdf\xb8\x74\x03\x44\x2a\xc7\xfe\x15\xa9\x9b\xf4\xfe\x8d\x4b\x37\
-\x40\xa4\x72\xec\x5f\x91\xba\x49\xef\xdf\xb8\x74\x03\x44\x2a\xc7\
-\xfe\x15\xa9\x9b\xf4\xfe\x8d\x4b\x37\x40\xa4\x72\xec\x5f\x91\xba\
-\x49\xef\xdf\xb8\x74\x03\x44\x2a\xc7\xfe\x15\xa9\x9b\xf4\xfe\x8d\
-\x4b\x37\x40\xa4\x72\xec\x5f\x91\xba\x49\xef\xdf\xb8\x74\x03\x44\
-\x2a\xc7\xfe\x15\xa9\x9b\xf4\xfe\x8d\x4b\x37\x40\xa4\x72\xec\x5f\
-\x91\xba\x49\xef\xdf\xb8\x74\x03\x44\x2a\xc7\xfe\x15\xa9\x9b\xf4\
-\xfe\x8d\x4b\x37\x40\xa4\x72\xec\x5f\x91\xba\x49\xef\xdf\xb8\x74\
-\x03\x44\x2a\xc7\xfe\x15\xa9\x9b\xf4\xfe\x8d\x4b\x37\x40\xa4\x72\
-\xec\x5f\x91\xba\x49\xef\xdf\xb8\x74\x03\x44\x2a\xc7\xfe\x15\xa9\
-\x9b\xf4\xfe\x8d\x4b\x37\x40\xa4\x72\xec\x5f\x91\xba\x49\xef\xdf\
-\xb8\xd5\x76\x7c\x3b\xdd\x04\x91\x8a\x59\x6d\xa7\x9f\xdb\xbf\x22\
-\x35\xb3\x0b\xfb\x37\x6e\xbd\x1d\xdf\x48\x37\x42\xa4\x62\x56\xc3\
-\xf4\x9a\xfd\x2b\x52\x33\xbb\xb0\x7f\xe3\xe6\x85\x78\x31\xdd\x08\
-\x91\xa2\x39\xb4\x7f\x45\xca\x26\xbe\x7f\xe3\x56\xdb\xe9\x91\x1d\
-\x68\x84\x48\xbd\x0c\xe3\x37\xed\x5f\x91\xa2\xd9\x81\xfd\x1b\xb7\
-\x1a\xc6\xfb\xe3\x8d\x10\x29\x98\xf9\xf0\xfd\x53\xfb\x57\xa4\x66\
-\x76\x61\xff\xc6\x6d\x0e\x0e\x3e\x33\xdf\x09\xbd\x95\x6e\x86\x48\
-\xa9\xcc\x7b\x66\xd9\x3b\xf6\xaf\x48\xc1\xec\xc8\xfe\xdd\x09\xab\
-\xed\xf8\x68\xbc\x21\x22\x85\xb2\x3c\xf5\x9e\xde\xb7\xc7\xec\x5f\
-\x91\xd3\x65\x97\xf6\x6f\xdc\xa5\x67\x0e\xef\x9e\xef\x88\xde\x49\
-\x37\x45\xa4\x42\x96\x8f\xde\x5d\xba\xfc\xdc\x6f\xa5\xf7\xed\x31\
-\xfb\x57\xe4\xe4\xd9\xb5\xfd\xbb\x13\x56\xc3\xf8\x60\xba\x31\x22\
-\x15\x32\x3f\x7a\xf8\xeb\xf4\x7e\xbd\x9e\xfd\x2b\x72\xb2\xec\xe2\
-\xfe\x8d\x7b\xec\xe0\xe0\xce\x79\x71\x0e\xd3\xcd\x11\xd9\xe5\xac\
-\x86\x69\x1a\x86\xe1\x53\xe9\xfd\x7a\x3d\xfb\x57\xe4\xc6\xd9\xd5\
-\xfd\xbb\x13\x36\x97\x5f\xb8\x6b\x3d\x8c\xaf\xa4\x9b\x24\xb2\x93\
-\x19\xa6\x9f\x6e\x9e\x9a\xbe\x94\xde\xa7\x1f\xc7\xfe\x15\xf9\x84\
-\xec\xf8\xfe\xdd\x09\x17\x86\xc3\x7b\x56\xdb\xf1\xd5\x78\xb3\x44\
-\x76\x29\xf3\xc1\xba\xb9\x32\xfd\x76\x7a\x7f\xde\x88\xfd\x2b\xf2\
-\x11\x29\xb2\x7f\x77\xc2\x66\xf8\xc1\x17\xe6\x45\x7b\x36\xde\x34\
-\x91\x1d\xc8\xf2\xb4\xe1\xf2\xe8\x3a\xbd\x2f\x4f\xca\xfe\x15\x79\
-\x2f\xd5\xf6\xef\x4e\x58\x5e\x27\x99\x1f\x49\x3c\xe0\x33\xc6\xd2\
-\x35\x47\xbf\x68\x67\x18\xff\xaa\xe2\x6b\x86\xf6\xaf\x74\x4f\xe5\
-\xfd\xbb\x33\x96\x3b\xa7\x79\x21\x1f\x72\x21\x91\x36\x99\x67\x7d\
-\xb5\x9d\x1e\xde\x87\x8f\x0a\xd9\xbf\xd2\x2e\x7b\xb4\x7f\x77\xc6\
-\xf2\xad\x49\x9b\x2b\x87\xf7\x2d\xdf\x9f\xbc\xde\x8e\xcf\x2f\xbf\
-\x49\xc9\xaf\x22\x95\xea\x59\x66\x78\x99\xe5\x6b\x33\x3d\xfe\xcd\
-\xfc\x67\x7f\xb6\x8f\xdf\x10\x66\xff\xca\x3e\xa6\xcb\xfe\x05\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xf3\xf0\xff\
-\x01\x80\x86\x34\x9d\x7a\x54\xec\x42\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x08\
-\x0b\x6f\xb1\x33\
-\x00\x55\
-\x00\x69\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0f\
-\x00\xb2\x53\xc7\
-\x00\x63\
-\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x73\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x08\xb2\x29\x67\
-\x00\x65\
-\x00\x78\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x15\
-\x0f\x06\xfc\x87\
-\x00\x6d\
-\x00\x6f\x00\x76\x00\x65\x00\x20\x00\x74\x00\x6f\x00\x20\x00\x4c\x00\x65\x00\x66\x00\x74\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x06\x68\x79\x87\
-\x00\x72\
-\x00\x65\x00\x77\x00\x69\x00\x6e\x00\x64\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x00\xb3\xa0\xc7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0f\x4d\x1b\x47\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x07\x90\xa8\xa7\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\x00\x2d\x00\x70\x00\x61\x00\x75\x00\x73\x00\x65\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x11\
-\x06\xbc\x0d\x67\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x20\x00\x6f\x00\x75\x00\x74\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x10\
-\x09\x61\x03\xc7\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x20\x00\x69\x00\x6e\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x03\xc9\xe2\x27\
-\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x20\x00\x66\x00\x69\x00\x6c\x00\x65\x00\x73\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x11\
-\x0c\x64\xbb\x47\
-\x00\x73\
-\x00\x6e\x00\x61\x00\x70\x00\x73\x00\x68\x00\x6f\x00\x74\x00\x20\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x16\
-\x0c\x49\xfa\xa7\
-\x00\x6d\
-\x00\x6f\x00\x76\x00\x65\x00\x20\x00\x74\x00\x6f\x00\x20\x00\x52\x00\x69\x00\x67\x00\x68\x00\x74\x00\x20\x00\x69\x00\x63\x00\x6f\
-\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x03\
-\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\xb6\x25\
-\x00\x00\x01\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x4f\x6b\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x90\x34\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x69\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xc2\x1b\
-\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x58\xf6\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x01\x16\xf4\
-\x00\x00\x01\xc2\x00\x00\x00\x00\x00\x01\x00\x01\xa5\x3a\
-\x00\x00\x01\x9a\x00\x00\x00\x00\x00\x01\x00\x01\x70\x94\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x79\x21\
-\x00\x00\x00\xd4\x00\x01\x00\x00\x00\x01\x00\x00\xbe\x45\
-"
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources.rcc")
 
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8b\x2e\x84\xb9\x20\
-\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\xb6\x25\
-\x00\x00\x01\x8b\x2e\x2f\xf9\xd0\
-\x00\x00\x01\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x4f\x6b\
-\x00\x00\x01\x8b\x2e\xb3\x79\xe0\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x90\x34\
-\x00\x00\x01\x8b\x2e\x85\x5d\x30\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x69\
-\x00\x00\x01\x8b\x2e\x3d\x09\x90\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xc2\x1b\
-\x00\x00\x01\x8b\x2e\x95\x62\xc0\
-\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x58\xf6\
-\x00\x00\x01\x8b\x2e\x76\xce\xa0\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x01\x16\xf4\
-\x00\x00\x01\x8b\x2e\x75\xdc\x70\
-\x00\x00\x01\xc2\x00\x00\x00\x00\x00\x01\x00\x01\xa5\x3a\
-\x00\x00\x01\x8b\x2e\x81\x46\x50\
-\x00\x00\x01\x9a\x00\x00\x00\x00\x00\x01\x00\x01\x70\x94\
-\x00\x00\x01\x8b\x2e\x8e\x4e\x40\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x79\x21\
-\x00\x00\x01\x8b\x2e\x81\xa4\x10\
-\x00\x00\x00\xd4\x00\x01\x00\x00\x00\x01\x00\x00\xbe\x45\
-\x00\x00\x01\x8b\x2e\x8c\x71\xb0\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
 
 def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    QtCore.QResource.registerResource(RESOURCE_FILE)
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    QtCore.QResource.unregisterResource(RESOURCE_FILE)
+
 
 qInitResources()